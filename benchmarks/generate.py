@@ -0,0 +1,275 @@
+# benchmarks/generate.py
+#
+# Fills a new database with synthetic users, groups, tests, assignments and
+# attempts:  python -m benchmarks.generate FILE [--size NAME] [--students N]
+#     [--tests N] ... [--seed N] [--json FILE]
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import time
+
+import connection
+import database
+import grading
+
+# Per-test and per-student counts: "questions" per test, "answers" per
+# question, "assignments" tests per student, "attempts" per assignment.
+SIZES = {
+    "small": {
+        "teachers": 5, "students": 200, "groups": 10, "tests": 20,
+        "questions": 10, "answers": 4, "assignments": 5, "attempts": 1,
+        "images": 5,
+    },
+    "medium": {
+        "teachers": 20, "students": 2000, "groups": 50, "tests": 100,
+        "questions": 20, "answers": 4, "assignments": 5, "attempts": 2,
+        "images": 20,
+    },
+    "large": {
+        "teachers": 50, "students": 10000, "groups": 200, "tests": 400,
+        "questions": 20, "answers": 4, "assignments": 10, "attempts": 2,
+        "images": 50,
+    },
+}
+DEFAULT_SIZE = "small"
+
+WORDS = (
+    "алгебра", "геометрия", "функция", "уравнение", "интеграл", "матрица",
+    "вектор", "история", "реформа", "империя", "революция", "химия",
+    "молекула", "реакция", "кислота", "физика", "энергия", "скорость",
+    "давление", "биология", "клетка", "белок", "эволюция", "литература",
+    "роман", "поэма", "сюжет", "программа", "алгоритм", "массив",
+    "рекурсия", "база", "данных", "запрос", "индекс", "сеть", "протокол",
+)
+QUESTION_TYPES = ("Единственный правильный ответ", "Несколько правильных ответов")
+
+# Attempts are written in batches of this many students per transaction.
+STUDENTS_PER_COMMIT = 200
+
+
+def _text(rng, words):
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def make_image(rng, index):
+    # Random bytes stand in for the encoded image; the database layer only
+    # stores and returns them.
+    data = rng.randbytes(16 * 1024)
+    return {
+        "sha256": hashlib.sha256(data + str(index).encode()).hexdigest(),
+        "width": 800,
+        "height": 600,
+        "thumbnail": data[:2048],
+        "data": data,
+    }
+
+
+def make_questions(rng, counts, images=()):
+    questions = []
+    for _ in range(counts["questions"]):
+        question_type = rng.choice(QUESTION_TYPES)
+        correct = {rng.randrange(counts["answers"])}
+        if question_type == QUESTION_TYPES[1]:
+            correct.add(rng.randrange(counts["answers"]))
+        question = {
+            "text": _text(rng, 8) + "?",
+            "type": question_type,
+            "answers": [
+                {"text": _text(rng, 3), "is_correct": index in correct}
+                for index in range(counts["answers"])
+            ],
+        }
+        if images and rng.random() < 0.2:
+            question["image"] = rng.choice(images)
+        questions.append(question)
+    return questions
+
+
+def make_test(rng, name, counts, images=()):
+    # Every other test draws half of its questions per attempt.
+    test = {
+        "name": name,
+        "description": _text(rng, 12),
+        "attempts": counts["attempts"] + 1,
+    }
+    questions = make_questions(rng, counts, images)
+    if rng.random() < 0.5:
+        test["sections"] = [{
+            "name": "Основной пул",
+            "draw_count": max(1, len(questions) // 2),
+            "questions": questions,
+        }]
+    else:
+        test["questions"] = questions
+    return test
+
+
+def _insert_users(cursor, role, prefix, count):
+    cursor.execute("SELECT COALESCE(MAX(id), 0) FROM users")
+    last_id = cursor.fetchone()[0]
+    cursor.executemany(
+        "INSERT INTO users (name, username, password, role) VALUES (?, ?, ?, ?)",
+        [(f"{prefix.capitalize()} {index}", f"{prefix}{index}", "pass", role)
+         for index in range(count)],
+    )
+    cursor.execute("SELECT id FROM users WHERE id > ? ORDER BY id", (last_id,))
+    return [row[0] for row in cursor.fetchall()]
+
+
+def _load_questions(cursor):
+    questions = {}
+    by_id = {}
+    cursor.execute(
+        """
+        SELECT q.test_id, q.id, a.id, a.is_correct
+        FROM questions q
+        JOIN answers a ON q.id = a.question_id
+        ORDER BY q.test_id, q.id, a.id
+    """
+    )
+    for test_id, question_id, answer_id, is_correct in cursor.fetchall():
+        question = by_id.get(question_id)
+        if question is None:
+            question = by_id[question_id] = {"id": question_id, "answers": []}
+            questions.setdefault(test_id, []).append(question)
+        question["answers"].append({"id": answer_id, "is_correct": is_correct})
+    return questions
+
+
+def _write_attempts(cursor, rng, rows, questions, counts):
+    answer_rows = []
+    for student_id, test_id, assigner_id, attempts in rows:
+        cursor.execute(
+            "INSERT INTO student_tests (student_id, test_id, assigner_id, remaining_attempts) VALUES (?, ?, ?, ?)",
+            (student_id, test_id, assigner_id, attempts - counts["attempts"]),
+        )
+        test_questions = questions[test_id]
+        for _ in range(counts["attempts"]):
+            selected = {question["id"]: {rng.choice(question["answers"])["id"]}
+                        for question in test_questions}
+            score, max_score, results = grading.grade_attempt(test_questions, selected)
+            cursor.execute(
+                """
+                INSERT INTO test_results
+                    (student_id, test_id, score, max_score, question_results,
+                     question_order, submitted_at)
+                VALUES (?, ?, ?, ?, ?, ?, datetime('2024-09-01', ?))
+                """,
+                (student_id, test_id, score, max_score,
+                 grading.encode_results(results),
+                 grading.encode_question_order(list(selected)),
+                 f"+{rng.randrange(270 * 24 * 60)} minutes"),
+            )
+            test_results_id = cursor.lastrowid
+            answer_rows.extend(
+                (test_results_id, question_id, answer_id)
+                for question_id, answer_ids in selected.items()
+                for answer_id in answer_ids
+            )
+    cursor.executemany(
+        "INSERT INTO student_answers (test_results_id, question_id, selected_answer) VALUES (?, ?, ?)",
+        answer_rows,
+    )
+
+
+def table_counts():
+    conn = connection.get_connection()
+    return {
+        table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        for table in ("users", "groups", "tests", "questions", "answers",
+                      "images", "student_tests", "test_results", "student_answers")
+    }
+
+
+def generate(path, counts, seed=0):
+    # Leaves connection.DATABASE_PATH pointing at the generated file.
+    if os.path.exists(path):
+        raise FileExistsError(f"{path} already exists")
+    started = time.perf_counter()
+    rng = random.Random(seed)
+
+    connection.close_all()
+    connection.DATABASE_PATH = path
+    database.setup_database()
+
+    with connection.transaction() as conn:
+        cursor = conn.cursor()
+        teacher_ids = _insert_users(cursor, "TEACHER", "teacher", counts["teachers"])
+        student_ids = _insert_users(cursor, "STUDENT", "student", counts["students"])
+        cursor.executemany("INSERT INTO groups (name) VALUES (?)",
+                           [(f"Группа {index}",) for index in range(counts["groups"])])
+        cursor.execute("SELECT id FROM groups ORDER BY id")
+        group_ids = [row[0] for row in cursor.fetchall()]
+        if group_ids:
+            cursor.executemany(
+                "INSERT INTO user_groups (user_id, group_id) VALUES (?, ?)",
+                [(student_id, group_ids[index % len(group_ids)])
+                 for index, student_id in enumerate(student_ids)],
+            )
+
+    images = [make_image(rng, index) for index in range(counts["images"])]
+    test_creators = {}
+    for index, teacher_id in enumerate(teacher_ids):
+        tests = [make_test(rng, f"Тест {number}: {_text(rng, 2)}", counts, images)
+                 for number in range(index, counts["tests"], len(teacher_ids))]
+        if tests:
+            for test_id in database.save_tests_bulk(tests, teacher_id)["test_ids"]:
+                test_creators[test_id] = teacher_id
+
+    with connection.transaction() as conn:
+        questions = _load_questions(conn.cursor())
+    test_ids = sorted(test_creators)
+    assignments = min(counts["assignments"], len(test_ids))
+    for start in range(0, len(student_ids), STUDENTS_PER_COMMIT):
+        rows = []
+        for student_id in student_ids[start:start + STUDENTS_PER_COMMIT]:
+            for test_id in rng.sample(test_ids, assignments):
+                rows.append((student_id, test_id, test_creators[test_id],
+                             counts["attempts"] + 1))
+        with connection.transaction() as conn:
+            _write_attempts(conn.cursor(), rng, rows, questions, counts)
+
+    return {
+        "counts": dict(counts),
+        "seed": seed,
+        "rows": table_counts(),
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def parse_counts(options):
+    counts = dict(SIZES[options.size])
+    for name in counts:
+        value = getattr(options, name)
+        if value is not None:
+            counts[name] = value
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path", help="database file to create")
+    parser.add_argument("--size", choices=SIZES, default=DEFAULT_SIZE)
+    for name in SIZES[DEFAULT_SIZE]:
+        parser.add_argument(f"--{name}", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="write the summary to this file")
+    options = parser.parse_args()
+
+    summary = generate(options.path, parse_counts(options), options.seed)
+    connection.close_all()
+
+    for table, rows in summary["rows"].items():
+        print(f"{table:<16}{rows:>10}")
+    print(f"{'seconds':<16}{summary['seconds']:>10}")
+
+    if options.json:
+        with open(options.json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
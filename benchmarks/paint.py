@@ -0,0 +1,78 @@
+# benchmarks/paint.py
+#
+# Paints the icon part of a students-table group cell the way the delegate
+# used to (a QIcon per paint) and through interfaces.icons:
+#   python -m benchmarks.paint [--cells N] [--json FILE]
+
+import argparse
+import json
+import os
+import sys
+import time
+
+# Nothing is shown, so the benchmark also runs without a display.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QRect
+from PyQt5.QtGui import QIcon, QImage, QPainter
+from PyQt5.QtWidgets import QApplication
+
+from interfaces import icons
+
+ICON_SIZE = 16
+ASSIGN_RECT = QRect(160, 4, ICON_SIZE, ICON_SIZE)
+REMOVE_RECT = QRect(181, 4, ICON_SIZE, ICON_SIZE)
+
+
+def paint_from_files(painter):
+    assign_icon = QIcon("resources/icons/assign.png")
+    remove_icon = QIcon("resources/icons/close.png")
+    painter.drawPixmap(ASSIGN_RECT, assign_icon.pixmap(ICON_SIZE, ICON_SIZE))
+    painter.drawPixmap(REMOVE_RECT, remove_icon.pixmap(ICON_SIZE, ICON_SIZE))
+
+
+def paint_from_registry(painter):
+    painter.drawPixmap(ASSIGN_RECT, icons.pixmap("assign", ICON_SIZE))
+    painter.drawPixmap(REMOVE_RECT, icons.pixmap("close", ICON_SIZE))
+
+
+def bench(name, paint_cell, cells):
+    image = QImage(200, 24, QImage.Format_ARGB32_Premultiplied)
+    painter = QPainter(image)
+    start = time.perf_counter()
+    for _ in range(cells):
+        paint_cell(painter)
+    seconds = time.perf_counter() - start
+    painter.end()
+    return {
+        "mode": name,
+        "cells": cells,
+        "seconds": round(seconds, 4),
+        "cells_per_second": round(cells / seconds),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cells", type=int, default=500)
+    parser.add_argument("--json", help="write results to this file")
+    options = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    results = [
+        bench("files", paint_from_files, options.cells),
+        bench("registry", paint_from_registry, options.cells),
+    ]
+
+    print(f"{'mode':<10}{'cells':>8}{'seconds':>10}{'cells/s':>12}")
+    for r in results:
+        print(f"{r['mode']:<10}{r['cells']:>8}{r['seconds']:>10}{r['cells_per_second']:>12}")
+
+    if options.json:
+        with open(options.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
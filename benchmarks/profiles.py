@@ -0,0 +1,136 @@
+# benchmarks/profiles.py
+#
+# Compares the database profiles from connection.PROFILES on a scratch copy
+# of the schema:  python -m benchmarks.profiles [--students N] [--json FILE]
+
+import argparse
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+import connection
+import database
+
+QUESTION_COUNT = 30
+ANSWER_COUNT = 4
+
+
+def seed(students):
+    questions = [
+        {
+            "text": f"Вопрос {q}",
+            "type": "Единственный правильный ответ",
+            "answers": [
+                {"text": f"Ответ {a}", "is_correct": a == 0}
+                for a in range(ANSWER_COUNT)
+            ],
+        }
+        for q in range(QUESTION_COUNT)
+    ]
+    database.save_test_to_database("Benchmark", students, questions, 1)
+    test_id = database.get_all_tests_as_dict()[-1][0]
+
+    student_ids = []
+    for i in range(students):
+        database.add_user(f"Student {i}", f"bench{i}", "pass", "STUDENT")
+    for row in database.get_all_users():
+        if row[2].startswith("bench"):
+            student_ids.append(row[0])
+            database.assign_test_to_student(test_id, row[0], 1)
+    return test_id, student_ids
+
+
+def run_concurrent(target, args_list):
+    errors = []
+
+    def wrapper(*args):
+        try:
+            target(*args)
+        except sqlite3.OperationalError as e:
+            errors.append(str(e))
+
+    threads = [threading.Thread(target=wrapper, args=args)
+               for args in args_list]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, errors
+
+
+def submit_attempt(student_id, test_id, test_details):
+    answers = [
+        {"question_id": q["id"], "selected_answers": [q["answers"][0]["id"]]}
+        for q in test_details["questions"]
+    ]
+    database.record_test_results(student_id, test_id, answers)
+    connection.close_connection()
+
+
+def read_test(test_id, repeat):
+    for _ in range(repeat):
+        database.get_test_details(test_id)
+    connection.close_connection()
+
+
+def bench_profile(name, students, directory):
+    connection.DATABASE_PATH = os.path.join(directory, f"{name}.db")
+    connection.set_profile(name, persist=False)
+    database.setup_database()
+    test_id, student_ids = seed(students)
+    test_details = database.get_test_details(test_id)
+
+    submit_time, submit_errors = run_concurrent(
+        submit_attempt, [(sid, test_id, test_details) for sid in student_ids])
+
+    # Readers racing a second wave of submissions.
+    args = [(sid, test_id, test_details) for sid in student_ids]
+    mixed_start = time.perf_counter()
+    writers = threading.Thread(
+        target=run_concurrent, args=(submit_attempt, args))
+    writers.start()
+    read_time, read_errors = run_concurrent(
+        read_test, [(test_id, 20) for _ in range(students)])
+    writers.join()
+    mixed_time = time.perf_counter() - mixed_start
+
+    connection.close_all()
+    return {
+        "profile": name,
+        "students": students,
+        "submit_seconds": round(submit_time, 4),
+        "submit_errors": len(submit_errors),
+        "read_seconds": round(read_time, 4),
+        "read_errors": len(read_errors),
+        "mixed_seconds": round(mixed_time, 4),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--students", type=int, default=30)
+    parser.add_argument("--json", help="write results to this file")
+    options = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for name in connection.PROFILES:
+            results.append(bench_profile(name, options.students, directory))
+
+    print(f"{'profile':<12}{'submit s':>10}{'errors':>8}"
+          f"{'read s':>10}{'errors':>8}{'mixed s':>10}")
+    for r in results:
+        print(f"{r['profile']:<12}{r['submit_seconds']:>10}{r['submit_errors']:>8}"
+              f"{r['read_seconds']:>10}{r['read_errors']:>8}{r['mixed_seconds']:>10}")
+
+    if options.json:
+        with open(options.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,361 @@
+# benchmarks/queries.py
+#
+# Times every public function of database.py on generated databases of
+# several sizes (see benchmarks.generate):
+#   python -m benchmarks.queries [--sizes small,medium] [--repeat N]
+#       [--json FILE] [--baseline FILE] [--tolerance RATIO]
+#
+# With --baseline the medians are compared to an earlier --json run and the
+# exit status is 1 when any function got slower than the tolerance allows.
+
+import argparse
+import inspect
+import itertools
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+import connection
+import database
+import tests_cache
+from benchmarks import generate
+
+DEFAULT_SIZES = ("small", "medium")
+DEFAULT_REPEAT = 5
+DEFAULT_TOLERANCE = 1.5
+# Medians below this are dominated by noise and never count as regressions.
+NOISE_FLOOR_MS = 0.05
+IMPORT_ROWS = 100
+PAGE_SIZE = 10
+PATCH_ROWS = 50
+
+
+def build_context():
+    conn = connection.get_connection()
+    student_id, test_id, attempt_id = conn.execute(
+        """
+        SELECT student_id, test_id, MAX(id) FROM test_results
+        GROUP BY student_id, test_id
+        ORDER BY student_id, test_id
+        LIMIT 1
+    """
+    ).fetchone()
+    teacher_id = conn.execute(
+        "SELECT creator_id FROM tests WHERE id = ?", (test_id,)).fetchone()[0]
+    group_id, group_name = conn.execute(
+        """
+        SELECT g.id, g.name FROM user_groups ug JOIN groups g ON ug.group_id = g.id
+        WHERE ug.user_id = ?
+    """,
+        (student_id,),
+    ).fetchone()
+
+    # Writes that would distort the generated data go to a spare student
+    # in a group of its own.
+    database.add_user("Bench spare", "bench_spare", "pass", "STUDENT")
+    database.add_group("Bench spare group")
+    spare_id = conn.execute(
+        "SELECT id FROM users WHERE username = 'bench_spare'").fetchone()[0]
+    spare_group_id = database.get_group_id_by_name("Bench spare group")
+    database.set_student_group(spare_id, spare_group_id)
+
+    question_ids = database.start_test_attempt(test_id)["question_ids"]
+    return {
+        "student_id": student_id,
+        "username": conn.execute(
+            "SELECT username FROM users WHERE id = ?", (student_id,)).fetchone()[0],
+        "teacher_id": teacher_id,
+        "test_id": test_id,
+        "attempt_id": attempt_id,
+        "group_id": group_id,
+        "group_name": group_name,
+        "spare_id": spare_id,
+        "spare_group_id": spare_group_id,
+        "question_ids": question_ids,
+        "answers": [{"question_id": question_id, "selected_answers": []}
+                    for question_id in question_ids],
+        "image_ids": [row[0] for row in conn.execute("SELECT id FROM images")],
+        "questions": generate.make_questions(random.Random(0), generate.SIZES["small"]),
+    }
+
+
+# Each case is (function, variant, prepare). prepare(ctx, i) runs untimed
+# before call i, may set up state the call needs, and returns its args.
+def _assigned_spare(ctx, i):
+    database.assign_test_to_student(ctx["test_id"], ctx["spare_id"], ctx["teacher_id"])
+    return ctx["test_id"], ctx["spare_id"]
+
+
+def _cold_test_details(ctx, i):
+    tests_cache.invalidate(ctx["test_id"])
+    return (ctx["test_id"],)
+
+
+def _import_rows(ctx, i):
+    return ([{"line": line, "name": f"Imported {i} {line}",
+              "username": f"bench_import_{i}_{line}", "password": "pass",
+              "role": "STUDENT", "group": f"Bench import {line % 5}"}
+             for line in range(IMPORT_ROWS)],)
+
+
+def _recent_changes(ctx, i):
+    # What a page that synced PATCH_ROWS changes ago has to fetch.
+    return (max(0, database.get_change_cursor() - PATCH_ROWS),)
+
+
+def _draft_page(ctx, i):
+    # One debounced autosave: a page of changed questions.
+    answers = {question_id: [i] for question_id in ctx["question_ids"][:PAGE_SIZE]}
+    return ctx["spare_id"], ctx["test_id"], ctx["question_ids"], 0, answers
+
+
+def _saved_draft(ctx, i):
+    database.save_attempt_draft(*_draft_page(ctx, i))
+    return ctx["spare_id"], ctx["test_id"]
+
+
+def _new_user(ctx, i):
+    database.add_user(f"Bench {i}", f"bench_delete_{i}", "pass", "STUDENT")
+    return (f"bench_delete_{i}",)
+
+
+def _new_group(ctx, i):
+    database.add_group(f"Bench delete {i}")
+    return (f"Bench delete {i}",)
+
+
+def _new_test(ctx, i):
+    return (database.save_test_to_database(
+        f"Bench delete {i}", 1, ctx["questions"], ctx["teacher_id"]),)
+
+
+def _spare_in_group(ctx, i):
+    database.set_student_group(ctx["spare_id"], ctx["spare_group_id"])
+    return (ctx["spare_id"],)
+
+
+def _spare_group_assigned(ctx, i):
+    database.assign_test_to_group_students(
+        ctx["test_id"], ctx["spare_group_id"], ctx["teacher_id"])
+    return ctx["test_id"], ctx["spare_group_id"]
+
+
+def _spare_attempt(ctx, i):
+    _assigned_spare(ctx, i)
+    return ctx["spare_id"], ctx["test_id"], ctx["answers"], ctx["question_ids"]
+
+
+CASES = [
+    ("setup_database", "", lambda ctx, i: ()),
+    ("get_all_users", "", lambda ctx, i: ()),
+    ("execute_query", "", lambda ctx, i: ("SELECT COUNT(*) FROM test_results",)),
+    ("add_user", "", lambda ctx, i: (f"Bench {i}", f"bench_add_{i}", "pass", "STUDENT")),
+    ("delete_user", "", _new_user),
+    ("update_name", "", lambda ctx, i: (ctx["username"], f"Student {i}")),
+    ("update_role", "", lambda ctx, i: (ctx["username"], "STUDENT")),
+    ("add_group", "", lambda ctx, i: (f"Bench group {i}",)),
+    ("delete_group", "", _new_group),
+    ("get_all_groups", "", lambda ctx, i: ()),
+    ("get_tests_for_student", "", lambda ctx, i: (ctx["student_id"],)),
+    ("assign_test_to_student", "", lambda ctx, i: (
+        ctx["test_id"], ctx["spare_id"], ctx["teacher_id"])),
+    ("authenticate_user", "", lambda ctx, i: (ctx["username"], "pass")),
+    ("get_all_students", "", lambda ctx, i: ()),
+    ("get_all_users_as_dicts", "", lambda ctx, i: ()),
+    ("get_students_page", "", lambda ctx, i: ()),
+    ("get_users_page", "", lambda ctx, i: ()),
+    ("get_users_by_ids", "", lambda ctx, i: (range(1, PATCH_ROWS + 1),)),
+    ("get_students_by_ids", "", lambda ctx, i: (range(1, PATCH_ROWS + 1),)),
+    ("get_data_version", "", lambda ctx, i: ()),
+    ("get_change_cursor", "", lambda ctx, i: ()),
+    ("get_changes", "", _recent_changes),
+    ("prune_change_log", "", lambda ctx, i: ()),
+    ("check_existing_user", "", lambda ctx, i: (ctx["username"],)),
+    ("get_all_tests_as_dict", "", lambda ctx, i: ()),
+    ("set_student_group", "", lambda ctx, i: (ctx["spare_id"], ctx["spare_group_id"])),
+    ("reset_student_group", "", _spare_in_group),
+    ("remove_test_assignment_from_group", "", _spare_group_assigned),
+    ("assign_test_to_group_students", "", lambda ctx, i: (
+        ctx["test_id"], ctx["spare_group_id"], ctx["teacher_id"])),
+    ("get_teachers_tests", "", lambda ctx, i: ()),
+    ("get_tests_by_teacher_id", "", lambda ctx, i: (ctx["teacher_id"],)),
+    ("get_all_tests", "", lambda ctx, i: ()),
+    ("get_tests_by_ids", "", lambda ctx, i: (range(1, PATCH_ROWS + 1),)),
+    ("get_teachers_tests", "ids", lambda ctx, i: ([ctx["teacher_id"]],)),
+    ("updateTestDescription", "", lambda ctx, i: (ctx["test_id"], f"Описание {i}")),
+    ("get_user_info", "", lambda ctx, i: (ctx["student_id"],)),
+    ("update_user_info", "", lambda ctx, i: (
+        ctx["spare_id"], f"Bench spare {i}", "bench_spare", "pass")),
+    ("get_assigned_tests_for_student", "", lambda ctx, i: (ctx["student_id"],)),
+    ("get_assigned_tests_for_student", "ids", lambda ctx, i: (
+        ctx["student_id"], [ctx["test_id"]])),
+    ("remove_test_from_student", "", _assigned_spare),
+    ("import_users_batch", "", _import_rows),
+    ("get_image_thumbnails", "", lambda ctx, i: (ctx["image_ids"],)),
+    ("save_tests_bulk", "", lambda ctx, i: (
+        [{"name": f"Bench {i}", "attempts": 1, "questions": ctx["questions"]}],
+        ctx["teacher_id"])),
+    ("save_test_to_database", "", lambda ctx, i: (
+        f"Bench {i}", 1, ctx["questions"], ctx["teacher_id"])),
+    ("delete_test", "", _new_test),
+    ("search_tests", "", lambda ctx, i: (generate.WORDS[i % len(generate.WORDS)],)),
+    ("search_tests", "creator", lambda ctx, i: (
+        generate.WORDS[i % len(generate.WORDS)], ctx["teacher_id"])),
+    ("get_group_id_by_name", "", lambda ctx, i: (ctx["group_name"],)),
+    ("get_tests_by_teacher", "", lambda ctx, i: (ctx["teacher_id"],)),
+    ("get_test_details", "", lambda ctx, i: (ctx["test_id"],)),
+    ("get_test_details", "cold", _cold_test_details),
+    ("draw_question_ids", "", lambda ctx, i: (ctx["test_id"],)),
+    ("start_test_attempt", "", lambda ctx, i: (ctx["test_id"], PAGE_SIZE)),
+    ("get_attempt_questions", "", lambda ctx, i: (
+        ctx["test_id"], ctx["question_ids"][:PAGE_SIZE])),
+    ("record_test_results", "", _spare_attempt),
+    ("save_attempt_draft", "", _draft_page),
+    ("get_attempt_draft", "", _saved_draft),
+    ("delete_attempt_draft", "", _saved_draft),
+    ("get_remaining_attempts", "", lambda ctx, i: (ctx["student_id"], ctx["test_id"])),
+    ("get_tests_by_student", "", lambda ctx, i: (ctx["student_id"],)),
+    ("get_student_test_attempt_results", "", lambda ctx, i: (
+        ctx["student_id"], ctx["test_id"])),
+    ("get_attempt_details", "", lambda ctx, i: (
+        ctx["student_id"], ctx["test_id"], ctx["attempt_id"])),
+    ("get_gradebook_axes", "", lambda ctx, i: ()),
+    ("get_gradebook_axes", "group", lambda ctx, i: (ctx["group_id"],)),
+    ("iter_gradebook_cells", "", lambda ctx, i: ()),
+    ("iter_gradebook_cells", "group", lambda ctx, i: (ctx["group_id"],)),
+    ("count_export_rows", "answers", lambda ctx, i: ("answers",)),
+    ("iter_export_rows", "attempts", lambda ctx, i: ("attempts",)),
+    ("iter_export_rows", "answers group", lambda ctx, i: ("answers", ctx["group_id"])),
+]
+
+
+def public_functions():
+    return sorted(
+        name for name, value in vars(database).items()
+        if inspect.isfunction(value) and value.__module__ == database.__name__
+        and not name.startswith("_")
+    )
+
+
+def time_case(function, prepare, ctx, repeat, counter):
+    # One untimed warm-up call, so the statement cache and the page cache
+    # are the same for every timed call.
+    samples = []
+    for timed in itertools.chain([False], itertools.repeat(True, repeat)):
+        args = prepare(ctx, next(counter))
+        started = time.perf_counter()
+        result = function(*args)
+        if inspect.isgenerator(result):
+            for _ in result:
+                pass
+        if timed:
+            samples.append(time.perf_counter() - started)
+    return samples
+
+
+def bench_size(size, repeat, directory):
+    summary = generate.generate(
+        os.path.join(directory, f"{size}.db"), generate.SIZES[size])
+    ctx = build_context()
+    counter = itertools.count()
+    results = []
+    for name, variant, prepare in CASES:
+        samples = time_case(getattr(database, name), prepare, ctx, repeat, counter)
+        results.append({
+            "function": name,
+            "variant": variant,
+            "size": size,
+            "repeat": repeat,
+            "min_ms": round(min(samples) * 1000, 4),
+            "median_ms": round(statistics.median(samples) * 1000, 4),
+            "mean_ms": round(statistics.mean(samples) * 1000, 4),
+        })
+    connection.close_all()
+    tests_cache.invalidate()
+    return summary, results
+
+
+def _key(result):
+    return result["function"], result["variant"], result["size"]
+
+
+def compare(results, baseline, tolerance):
+    previous = {_key(result): result for result in baseline["results"]}
+    regressions = []
+    for result in results:
+        before = previous.get(_key(result))
+        if before is None or result["median_ms"] < NOISE_FLOOR_MS:
+            continue
+        ratio = result["median_ms"] / max(before["median_ms"], NOISE_FLOOR_MS)
+        result["baseline_median_ms"] = before["median_ms"]
+        result["ratio"] = round(ratio, 3)
+        if ratio > tolerance:
+            regressions.append(result)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default=",".join(DEFAULT_SIZES),
+                        help="comma-separated names from benchmarks.generate.SIZES")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="results of an earlier --json run")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="slowdown ratio of the median counted as a regression")
+    options = parser.parse_args()
+
+    sizes = [size.strip() for size in options.sizes.split(",") if size.strip()]
+    unknown = [size for size in sizes if size not in generate.SIZES]
+    if unknown:
+        parser.error("unknown sizes: " + ", ".join(unknown))
+
+    covered = {name for name, _, _ in CASES}
+    uncovered = [name for name in public_functions() if name not in covered]
+
+    datasets = {}
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            datasets[size], size_results = bench_size(size, options.repeat, directory)
+            results.extend(size_results)
+
+    regressions = []
+    if options.baseline:
+        with open(options.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), options.tolerance)
+
+    print(f"{'function':<40}{'size':<8}{'min ms':>10}{'median ms':>11}{'ratio':>8}")
+    for r in results:
+        name = f"{r['function']} ({r['variant']})" if r["variant"] else r["function"]
+        ratio = r.get("ratio", "")
+        print(f"{name:<40}{r['size']:<8}{r['min_ms']:>10}{r['median_ms']:>11}{ratio:>8}")
+    if uncovered:
+        print("not benchmarked: " + ", ".join(uncovered))
+    for r in regressions:
+        print(f"REGRESSION {r['function']} {r['variant']} {r['size']}: "
+              f"{r['baseline_median_ms']} -> {r['median_ms']} ms")
+
+    if options.json:
+        with open(options.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "sqlite": sqlite3.sqlite_version,
+                "profile": connection.get_profile_name(),
+                "datasets": datasets,
+                "results": results,
+                "uncovered": uncovered,
+            }, f, indent=2, ensure_ascii=False)
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
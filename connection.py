@@ -0,0 +1,175 @@
+# connection.py
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+import query_trace
+import settings
+
+DATABASE_PATH = "test_management.db"
+STATEMENT_CACHE_SIZE = 256
+
+# "legacy" reproduces the stock sqlite3 behaviour the app used to run with.
+PROFILES = {
+    "legacy": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "mmap_size": 0,
+        "cache_size": -2000,
+        "busy_timeout": 5000,
+    },
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 64 * 1024 * 1024,
+        "cache_size": -16000,
+        "busy_timeout": 5000,
+    },
+    "throughput": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64000,
+        "busy_timeout": 15000,
+        "temp_store": "MEMORY",
+    },
+}
+DEFAULT_PROFILE = "balanced"
+
+_local = threading.local()
+_connections = {}
+_lock = threading.Lock()
+_generation = 0
+_profile_name = None
+
+
+def get_profile_name():
+    global _profile_name
+    if _profile_name is None:
+        name = settings.get("db_profile")
+        _profile_name = name if name in PROFILES else DEFAULT_PROFILE
+    return _profile_name
+
+
+def set_profile(name, persist=True):
+    global _profile_name
+    if name not in PROFILES:
+        raise ValueError(f"Unknown database profile: {name}")
+    _profile_name = name
+    if persist:
+        settings.save("db_profile", name)
+    # Open connections keep the old pragmas; reopen them lazily.
+    reset_connections()
+
+
+def set_tracing(enabled, persist=True):
+    query_trace.set_enabled(enabled, persist)
+    # Tracing is chosen when a connection is opened; reopen them lazily.
+    reset_connections()
+
+
+def apply_profile(conn, profile):
+    for pragma, value in profile.items():
+        conn.execute(f"PRAGMA {pragma} = {value}").fetchall()
+
+
+def _open_connection():
+    # check_same_thread is off only so close_all() can close connections
+    # owned by worker threads at exit, once no worker is running; otherwise
+    # a connection is used, and closed, by its own thread alone.
+    factory = sqlite3.Connection
+    if query_trace.is_enabled():
+        query_trace.install()
+        factory = query_trace.TracingConnection
+    conn = sqlite3.connect(
+        DATABASE_PATH,
+        cached_statements=STATEMENT_CACHE_SIZE,
+        check_same_thread=False,
+        factory=factory,
+    )
+    apply_profile(conn, PROFILES[get_profile_name()])
+    return conn
+
+
+def get_connection():
+    conn = getattr(_local, "connection", None)
+    if conn is not None and _local.generation != _generation and _local.depth == 0:
+        # Reopened with the current settings; a transaction in progress
+        # finishes on the connection it started on.
+        close_connection()
+        conn = None
+    if conn is None:
+        conn = _open_connection()
+        _local.connection = conn
+        _local.generation = _generation
+        _local.depth = 0
+        _local.after_commit = []
+        with _lock:
+            _connections[threading.get_ident()] = conn
+    return conn
+
+
+@contextmanager
+def transaction():
+    conn = get_connection()
+    _local.depth += 1
+    try:
+        yield conn
+    except BaseException:
+        _local.depth -= 1
+        if _local.depth == 0:
+            _local.after_commit = []
+            conn.rollback()
+        raise
+    else:
+        _local.depth -= 1
+        if _local.depth == 0:
+            conn.commit()
+            callbacks, _local.after_commit = _local.after_commit, []
+            for callback in callbacks:
+                callback()
+
+
+def after_commit(callback):
+    # Runs callback once the current transaction commits, or right away
+    # outside one; a rollback drops it.
+    get_connection()
+    if _local.depth == 0:
+        callback()
+    else:
+        _local.after_commit.append(callback)
+
+
+def close_connection():
+    conn = getattr(_local, "connection", None)
+    if conn is None:
+        return
+    with _lock:
+        if _connections.get(threading.get_ident()) is conn:
+            del _connections[threading.get_ident()]
+    _local.connection = None
+    conn.close()
+
+
+def reset_connections():
+    # Every thread closes its connection and opens a new one the next time
+    # it asks for one, so no query running on another thread is cut off.
+    global _generation
+    with _lock:
+        _generation += 1
+
+
+def close_all():
+    # Closes every thread's connection from the calling thread: only safe
+    # when no worker is running, e.g. after db_worker.wait_for_done().
+    global _generation
+    with _lock:
+        connections = list(_connections.values())
+        _connections.clear()
+        _generation += 1
+    _local.connection = None
+    for conn in connections:
+        try:
+            conn.close()
+        except sqlite3.ProgrammingError:
+            pass
@@ -1,191 +1,64 @@
 # database.py
 
-import sqlite3
-
-
-def create_connection():
-    return sqlite3.connect("test_management.db")
+import random
+import re
+import time
+from connection import get_connection, transaction
+import events
+import grading
+import migrations
+import tests_cache
 
 
 def setup_database():
-    conn = create_connection()
-    with conn:
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                username TEXT NOT NULL UNIQUE,
-                password TEXT NOT NULL,
-                role TEXT NOT NULL
-            );
-        """
-        )
-
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS groups (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL UNIQUE
-            );
-        """
-        )
-
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS tests (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                description TEXT,
-                total_marks INTEGER,
-                attempts INTEGER NOT NULL,
-                creator_id INTEGER,  -- Foreign key referencing the users table
-                FOREIGN KEY(creator_id) REFERENCES users(id)
-            );
-        """
-        )
-
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS user_groups (
-                user_id INTEGER NOT NULL,
-                group_id INTEGER NOT NULL,
-                PRIMARY KEY(user_id, group_id),
-                FOREIGN KEY(user_id) REFERENCES users(id),
-                FOREIGN KEY(group_id) REFERENCES groups(id)
-            );
-        """
-        )
-
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS student_tests (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                student_id INTEGER NOT NULL,
-                test_id INTEGER NOT NULL,
-                assigner_id INTEGER NOT NULL,
-                remaining_attempts INTEGER,
-                FOREIGN KEY(student_id) REFERENCES users(id),
-                FOREIGN KEY(test_id) REFERENCES tests(id),
-                FOREIGN KEY(assigner_id) REFERENCES users(id),
-                UNIQUE(student_id, test_id)
-            );
-            """
-        )
-
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS questions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                test_id INTEGER NOT NULL,
-                text TEXT NOT NULL,
-                type TEXT NOT NULL,
-                FOREIGN KEY(test_id) REFERENCES tests(id)
-            );
-        """
-        )
-
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS answers (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                question_id INTEGER NOT NULL,
-                text TEXT NOT NULL,
-                is_correct BOOLEAN NOT NULL,
-                FOREIGN KEY(question_id) REFERENCES questions(id)
-            );
-        """
-        )
-
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS student_answers (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                test_results_id INTEGER NOT NULL,
-                question_id INTEGER NOT NULL,
-                selected_answer INTEGER NOT NULL,
-                FOREIGN KEY(test_results_id) REFERENCES test_results(id),
-                FOREIGN KEY(question_id) REFERENCES questions(id)
-            );
-        """
-        )
-
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS test_results (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                student_id INTEGER NOT NULL,
-                test_id INTEGER NOT NULL,
-                FOREIGN KEY(student_id) REFERENCES users(id),
-                FOREIGN KEY(test_id) REFERENCES tests(id)
-            );
-        """
-        )
-
-        conn.execute(
-            "INSERT OR IGNORE INTO users (name, username, password, role) VALUES ('Admin User', 'admin', 'admin', 'ADMIN')"
-        )
-        conn.execute(
-            "INSERT OR IGNORE INTO users (name, username, password, role) VALUES ('Teacher User', 'teacher', 'teacher', 'TEACHER')"
-        )
-        conn.execute(
-            "INSERT OR IGNORE INTO users (name, username, password, role) VALUES ('Student User', 'student', 'student', 'STUDENT')"
-        )
-
-
-def authenticate_user(username, password):
-    conn = create_connection()
-    with conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT role FROM users WHERE username=? AND password=?",
-            (username, password),
-        )
-        return cursor.fetchone()
+    migrations.migrate(get_connection())
+    prune_change_log()
 
 
 def get_all_users():
-    conn = create_connection()
-    with conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, name, username, password, role FROM users")
-        return cursor.fetchall()
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute("SELECT id, name, username, password, role FROM users")
+    return cursor.fetchall()
 
 
 def execute_query(query, args=None):
-    conn = create_connection()
-    with conn:
+    with transaction() as conn:
         cursor = conn.cursor()
         if args:
             cursor.execute(query, args)
         else:
             cursor.execute(query)
-        conn.commit()
         return cursor.fetchall()
 
 
+def _publish_users(rows):
+    if rows:
+        events.publish(events.UsersChanged(tuple(row[0] for row in rows)))
+
+
 def add_user(name, username, password, role):
-    query = "INSERT INTO users (name, username, password, role) VALUES (?, ?, ?, ?)"
+    query = "INSERT INTO users (name, username, password, role) VALUES (?, ?, ?, ?) RETURNING id"
     args = (name, username, password, role)
-    execute_query(query, args)
+    _publish_users(execute_query(query, args))
 
 
 def delete_user(username):
-    query = "DELETE FROM users WHERE username = ?"
+    query = "DELETE FROM users WHERE username = ? RETURNING id"
     args = (username,)
-    execute_query(query, args)
+    _publish_users(execute_query(query, args))
 
 
 def update_name(username, name):
-    query = "UPDATE users SET name = ? WHERE username = ?"
+    query = "UPDATE users SET name = ? WHERE username = ? RETURNING id"
     args = (name, username)
-    execute_query(query, args)
+    _publish_users(execute_query(query, args))
 
 
 def update_role(username, new_role):
-    query = "UPDATE users SET role = ? WHERE username = ?"
+    query = "UPDATE users SET role = ? WHERE username = ? RETURNING id"
     args = (new_role, username)
-    execute_query(query, args)
+    _publish_users(execute_query(query, args))
 
 
 def add_group(name):
@@ -202,11 +75,10 @@ def delete_group(name):
 
 def get_all_groups():
     query = "SELECT id, name FROM groups"
-    conn = create_connection()
-    with conn:
-        cursor = conn.cursor()
-        cursor.execute(query)
-        groups = [{"id": row[0], "name": row[1]} for row in cursor.fetchall()]
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(query)
+    groups = [{"id": row[0], "name": row[1]} for row in cursor.fetchall()]
     return groups
 
 
@@ -219,8 +91,7 @@ def get_tests_for_student(student_id):
 
 
 def assign_test_to_student(test_id, student_id, assigner_id):
-    conn = create_connection()
-    with conn:
+    with transaction() as conn:
         cursor = conn.cursor()
 
         cursor.execute("SELECT attempts FROM tests WHERE id = ?", (test_id,))
@@ -234,91 +105,237 @@ def assign_test_to_student(test_id, student_id, assigner_id):
         """
         args = (student_id, test_id, assigner_id, attempts, attempts)
         cursor.execute(query, args)
-        conn.commit()
+        events.publish(events.TestsAssigned((test_id,), (student_id,)))
 
 
 def authenticate_user(username, password):
-    conn = create_connection()
-    with conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT id, role FROM users WHERE username=? AND password=?",
-            (username, password),
-        )
-        return cursor.fetchone()
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT id, role FROM users WHERE username=? AND password=?",
+        (username, password),
+    )
+    return cursor.fetchone()
 
 
 def get_all_students():
-    conn = create_connection()
-    with conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT u.id, u.name, u.username, u.role, g.name as group_name, GROUP_CONCAT(t.name) as tests
-            FROM users u
-            LEFT JOIN user_groups ug ON u.id = ug.user_id
-            LEFT JOIN groups g ON ug.group_id = g.id
-            LEFT JOIN student_tests st ON u.id = st.student_id
-            LEFT JOIN tests t ON st.test_id = t.id
-            WHERE u.role = 'STUDENT'
-            GROUP BY u.id
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(
         """
-        )
-        students = [
-            {
-                "id": row[0],
-                "name": row[1],
-                "username": row[2],
-                "role": row[3],
-                "group": row[4],
-                "tests": row[5],
-            }
-            for row in cursor.fetchall()
-        ]
-        return students
+        SELECT u.id, u.name, u.username, u.role, g.name as group_name, GROUP_CONCAT(t.name) as tests
+        FROM users u
+        LEFT JOIN user_groups ug ON u.id = ug.user_id
+        LEFT JOIN groups g ON ug.group_id = g.id
+        LEFT JOIN student_tests st ON u.id = st.student_id
+        LEFT JOIN tests t ON st.test_id = t.id
+        WHERE u.role = 'STUDENT'
+        GROUP BY u.id
+    """
+    )
+    students = [
+        {
+            "id": row[0],
+            "name": row[1],
+            "username": row[2],
+            "role": row[3],
+            "group": row[4],
+            "tests": row[5],
+        }
+        for row in cursor.fetchall()
+    ]
+    return students
 
 
 def get_all_users_as_dicts():
-    conn = create_connection()
-    with conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, name, username, password, role FROM users")
-        users = [
-            {
-                "id": row[0],
-                "name": row[1],
-                "username": row[2],
-                "password": row[3],
-                "role": row[4],
-            }
-            for row in cursor.fetchall()
-        ]
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute("SELECT id, name, username, password, role FROM users")
+    users = [
+        {
+            "id": row[0],
+            "name": row[1],
+            "username": row[2],
+            "password": row[3],
+            "role": row[4],
+        }
+        for row in cursor.fetchall()
+    ]
     return users
 
 
-def get_all_tests_as_dict():
-    query = "SELECT id, name FROM tests"
-    return execute_query(query)
+def get_students_page(after_id=None, limit=200):
+    query = """
+    SELECT u.id, u.name, u.username, u.role, g.name as group_name, GROUP_CONCAT(t.name) as tests
+    FROM (
+        SELECT id, name, username, role FROM users
+        WHERE role = 'STUDENT' AND id > ?
+        ORDER BY id
+        LIMIT ?
+    ) u
+    LEFT JOIN user_groups ug ON u.id = ug.user_id
+    LEFT JOIN groups g ON ug.group_id = g.id
+    LEFT JOIN student_tests st ON u.id = st.student_id
+    LEFT JOIN tests t ON st.test_id = t.id
+    GROUP BY u.id
+    ORDER BY u.id
+    """
+    args = (after_id or 0, limit)
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(query, args)
+    return [_student_dict(row) for row in cursor.fetchall()]
+
+
+def _student_dict(row):
+    return {
+        "id": row[0],
+        "name": row[1],
+        "username": row[2],
+        "role": row[3],
+        "group": row[4],
+        "tests": row[5],
+    }
+
+
+def get_users_page(after_id=None, limit=200):
+    query = """
+    SELECT id, name, username, password, role FROM users
+    WHERE id > ?
+    ORDER BY id
+    LIMIT ?
+    """
+    args = (after_id or 0, limit)
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(query, args)
+    return [_user_dict(row) for row in cursor.fetchall()]
+
+
+def _user_dict(row):
+    return {
+        "id": row[0],
+        "name": row[1],
+        "username": row[2],
+        "password": row[3],
+        "role": row[4],
+    }
+
+
+def _select_by_ids(cursor, query, ids, args=()):
+    # query has an "{ids}" slot for the placeholders of one batch.
+    rows = []
+    ids = sorted(ids)
+    for start in range(0, len(ids), INSERT_BATCH_ROWS):
+        batch = ids[start:start + INSERT_BATCH_ROWS]
+        cursor.execute(query.format(ids=", ".join("?" * len(batch))),
+                       list(args) + batch)
+        rows.extend(cursor.fetchall())
+    return rows
+
+
+def get_users_by_ids(user_ids):
+    query = "SELECT id, name, username, password, role FROM users WHERE id IN ({ids}) ORDER BY id"
+    conn = get_connection()
+    return [_user_dict(row) for row in _select_by_ids(conn.cursor(), query, user_ids)]
+
+
+def get_students_by_ids(student_ids):
+    query = """
+    SELECT u.id, u.name, u.username, u.role, g.name as group_name, GROUP_CONCAT(t.name) as tests
+    FROM users u
+    LEFT JOIN user_groups ug ON u.id = ug.user_id
+    LEFT JOIN groups g ON ug.group_id = g.id
+    LEFT JOIN student_tests st ON u.id = st.student_id
+    LEFT JOIN tests t ON st.test_id = t.id
+    WHERE u.role = 'STUDENT' AND u.id IN ({ids})
+    GROUP BY u.id
+    ORDER BY u.id
+    """
+    conn = get_connection()
+    return [_student_dict(row) for row in _select_by_ids(conn.cursor(), query, student_ids)]
+
 
 # -----------------------
+# Change feed. Triggers append every insert, update and delete of the
+# tables in migrations.CHANGE_LOG_KEYS to change_log; a page remembers the
+# last change_log id it has applied and asks only for what came after it.
 
+CHANGE_LOG_KEEP = 100000
+# A page that is further behind than this reloads instead of patching.
+CHANGE_BATCH_ROWS = 1000
 
-def set_student_group(student_id, group_id):
-    conn = create_connection()
-    with conn:
+
+def get_data_version():
+    # Changes whenever another connection commits; reading it takes no lock.
+    return get_connection().execute("PRAGMA data_version").fetchone()[0]
+
+
+def get_change_cursor():
+    conn = get_connection()
+    return conn.execute("SELECT COALESCE(MAX(id), 0) FROM change_log").fetchone()[0]
+
+
+def get_changes(after_id, tables=None, limit=CHANGE_BATCH_ROWS):
+    # Returns the changes to `tables` after change_log id `after_id`, oldest
+    # first, and the cursor to pass next time. "reset" means the changes
+    # cannot be listed (pruned, or more than `limit`) and the caller should
+    # reload everything.
+    with transaction() as conn:
         cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO user_groups (user_id, group_id) VALUES (?, ?)
-        """,
-            (student_id, group_id),
+        cursor.execute("SELECT COALESCE(MIN(id), 0), COALESCE(MAX(id), 0) FROM change_log")
+        first_id, last_id = cursor.fetchone()
+        result = {"cursor": last_id, "reset": False, "changes": []}
+        if last_id <= after_id:
+            return result
+        if first_id > after_id + 1:
+            result["reset"] = True
+            return result
+
+        query = """
+        SELECT id, table_name, row_id, ref_id, op FROM change_log
+        WHERE id > ? AND id <= ?
+        """
+        args = [after_id, last_id]
+        if tables is not None:
+            query += f" AND table_name IN ({', '.join('?' * len(tables))})"
+            args.extend(tables)
+        cursor.execute(query + " ORDER BY id LIMIT ?", args + [limit + 1])
+        rows = cursor.fetchall()
+        if len(rows) > limit:
+            result["reset"] = True
+            return result
+        result["changes"] = [
+            {"id": row[0], "table": row[1], "row_id": row[2], "ref_id": row[3], "op": row[4]}
+            for row in rows
+        ]
+        return result
+
+
+def prune_change_log(keep=CHANGE_LOG_KEEP):
+    with transaction() as conn:
+        conn.execute(
+            "DELETE FROM change_log WHERE id <= (SELECT MAX(id) FROM change_log) - ?",
+            (keep,),
         )
-        conn.commit()
+
+
+def check_existing_user(username):
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute("SELECT 1 FROM users WHERE username = ?", (username,))
+    return cursor.fetchone() is not None
+
+
+def get_all_tests_as_dict():
+    query = "SELECT id, name FROM tests"
+    return execute_query(query)
+
+# -----------------------
 
 
 def set_student_group(student_id, group_id):
-    conn = create_connection()
-    with conn:
+    with transaction() as conn:
         cursor = conn.cursor()
         cursor.execute(
             "SELECT * FROM user_groups WHERE user_id = ?", (student_id,))
@@ -334,13 +351,18 @@ def set_student_group(student_id, group_id):
                 "UPDATE user_groups SET group_id = ? WHERE user_id = ?",
                 (group_id, student_id),
             )
+        events.publish(events.StudentGroupsChanged((student_id,)))
 
-        conn.commit()
+
+def reset_student_group(student_id):
+    query = "DELETE FROM user_groups WHERE user_id = ?"
+    args = (student_id,)
+    execute_query(query, args)
+    events.publish(events.StudentGroupsChanged((student_id,)))
 
 
 def remove_test_assignment_from_group(test_id, group_id):
-    conn = create_connection()
-    with conn:
+    with transaction() as conn:
         cursor = conn.cursor()
 
         cursor.execute(
@@ -349,15 +371,17 @@ def remove_test_assignment_from_group(test_id, group_id):
             WHERE test_id = ? AND student_id IN (
                 SELECT user_id FROM user_groups WHERE group_id = ?
             )
+            RETURNING student_id
         """,
             (test_id, group_id),
         )
-        conn.commit()
+        student_ids = tuple(row[0] for row in cursor.fetchall())
+        if student_ids:
+            events.publish(events.TestsAssigned((test_id,), student_ids))
 
 
 def assign_test_to_group_students(test_id, group_id, assigner_id):
-    conn = create_connection()
-    with conn:
+    with transaction() as conn:
         cursor = conn.cursor()
 
         cursor.execute("SELECT attempts FROM tests WHERE id = ?", (test_id,))
@@ -369,27 +393,32 @@ def assign_test_to_group_students(test_id, group_id, assigner_id):
         SELECT user_id, ?, ?, ?
         FROM user_groups WHERE group_id = ?
         ON CONFLICT(student_id, test_id) DO UPDATE SET remaining_attempts = ?
+        RETURNING student_id
         """
         args = (test_id, assigner_id, attempts, group_id, attempts)
         cursor.execute(query, args)
-        conn.commit()
+        student_ids = tuple(row[0] for row in cursor.fetchall())
+        if student_ids:
+            events.publish(events.TestsAssigned((test_id,), student_ids))
 
 
-def get_teachers_tests():
+def get_teachers_tests(teacher_ids=None):
     query = """
-        SELECT u.name AS teacher_name, GROUP_CONCAT(t.name) AS tests
+        SELECT u.id, u.name AS teacher_name, GROUP_CONCAT(t.name) AS tests
         FROM users u
         LEFT JOIN tests t ON u.id = t.creator_id
         WHERE u.role = 'TEACHER'
-        GROUP BY u.name
     """
-    conn = create_connection()
-    with conn:
-        cursor = conn.cursor()
-        cursor.execute(query)
-        teachers_tests = [
-            {"teacher_name": row[0], "tests": row[1]} for row in cursor.fetchall()
-        ]
+    conn = get_connection()
+    cursor = conn.cursor()
+    if teacher_ids is None:
+        cursor.execute(query + " GROUP BY u.id ORDER BY u.name")
+        rows = cursor.fetchall()
+    else:
+        rows = _select_by_ids(cursor, query + " AND u.id IN ({ids}) GROUP BY u.id", teacher_ids)
+    teachers_tests = [
+        {"teacher_id": row[0], "teacher_name": row[1], "tests": row[2]} for row in rows
+    ]
     return teachers_tests
 
 
@@ -401,14 +430,13 @@ def get_tests_by_teacher_id(teacher_id):
     WHERE t.creator_id = ?
     """
     args = (teacher_id,)
-    conn = create_connection()
-    with conn:
-        cursor = conn.cursor()
-        cursor.execute(query, args)
-        tests = [
-            dict(zip([column[0] for column in cursor.description], row))
-            for row in cursor.fetchall()
-        ]
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(query, args)
+    tests = [
+        dict(zip([column[0] for column in cursor.description], row))
+        for row in cursor.fetchall()
+    ]
     return tests
 
 
@@ -418,46 +446,64 @@ def get_all_tests():
     FROM tests t
     LEFT JOIN users u ON t.creator_id = u.id
     """
-    conn = create_connection()
-    with conn:
-        cursor = conn.cursor()
-        cursor.execute(query)
-        tests = [
-            dict(zip([column[0] for column in cursor.description], row))
-            for row in cursor.fetchall()
-        ]
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(query)
+    tests = [
+        dict(zip([column[0] for column in cursor.description], row))
+        for row in cursor.fetchall()
+    ]
     return tests
 
 
+def get_tests_by_ids(test_ids, creator_id=None):
+    # The rows of get_all_tests (or of get_tests_by_teacher_id with
+    # creator_id) among test_ids.
+    query = """
+    SELECT t.id, t.name, t.description, t.total_marks, t.attempts, u.name as created_by
+    FROM tests t
+    LEFT JOIN users u ON t.creator_id = u.id
+    WHERE {creator} t.id IN ({ids})
+    """
+    args = ()
+    if creator_id is not None:
+        args = (creator_id,)
+    query = query.replace("{creator}", "t.creator_id = ? AND" if args else "")
+    conn = get_connection()
+    cursor = conn.cursor()
+    rows = _select_by_ids(cursor, query, test_ids, args)
+    return [dict(zip([column[0] for column in cursor.description], row)) for row in rows]
+
+
 def updateTestDescription(test_id, new_description):
-    query = "UPDATE tests SET description = ? WHERE id = ?"
+    query = "UPDATE tests SET description = ? WHERE id = ? RETURNING creator_id"
     args = (new_description, test_id)
-    execute_query(query, args)
+    for (creator_id,) in execute_query(query, args):
+        events.publish(events.TestsSaved((test_id,), creator_id))
 
 
 def get_user_info(user_id):
     query = "SELECT name, username, password FROM users WHERE id = ?"
     args = (user_id,)
-    conn = create_connection()
-    with conn:
-        cursor = conn.cursor()
-        cursor.execute(query, args)
-        user_info = cursor.fetchone()
-        return (
-            {"name": user_info[0], "username": user_info[1],
-                "password": user_info[2]}
-            if user_info
-            else None
-        )
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(query, args)
+    user_info = cursor.fetchone()
+    return (
+        {"name": user_info[0], "username": user_info[1],
+            "password": user_info[2]}
+        if user_info
+        else None
+    )
 
 
 def update_user_info(user_id, name, username, password):
-    query = "UPDATE users SET name = ?, username = ?, password = ? WHERE id = ?"
+    query = "UPDATE users SET name = ?, username = ?, password = ? WHERE id = ? RETURNING id"
     args = (name, username, password, user_id)
-    execute_query(query, args)
+    _publish_users(execute_query(query, args))
 
 
-def get_assigned_tests_for_student(student_id):
+def get_assigned_tests_for_student(student_id, test_ids=None):
     query = """
     SELECT 
         t.id, t.name, t.description, t.total_marks, t.attempts, 
@@ -470,67 +516,341 @@ def get_assigned_tests_for_student(student_id):
     WHERE st.student_id = ?
     """
     args = (student_id,)
-    conn = create_connection()
+    conn = get_connection()
     tests = []
-    with conn:
-        cursor = conn.cursor()
+    cursor = conn.cursor()
+    if test_ids is None:
         cursor.execute(query, args)
-        tests = [
-            dict(zip([column[0] for column in cursor.description], row))
-            for row in cursor.fetchall()
-        ]
+        rows = cursor.fetchall()
+    else:
+        rows = _select_by_ids(cursor, query + " AND t.id IN ({ids})", test_ids, args)
+    tests = [
+        dict(zip([column[0] for column in cursor.description], row))
+        for row in rows
+    ]
     return tests
 
 
 def remove_test_from_student(test_id, student_id):
-    conn = create_connection()
-    with conn:
+    with transaction() as conn:
         cursor = conn.cursor()
         query = "DELETE FROM student_tests WHERE student_id = ? AND test_id = ?"
         args = (student_id, test_id)
         cursor.execute(query, args)
-        conn.commit()
+        events.publish(events.TestsAssigned((test_id,), (student_id,)))
 
 
-def save_test_to_database(test_name, attempts, questions, creator_id):
-    conn = create_connection()
-    with conn:
+# Rows per multi-row INSERT; keeps the bound parameters far below
+# SQLITE_MAX_VARIABLE_NUMBER for every table written here.
+INSERT_BATCH_ROWS = 500
+
+
+def _insert_returning_ids(cursor, table, columns, rows):
+    ids = []
+    row_placeholder = "(" + ", ".join("?" * len(columns)) + ")"
+    for start in range(0, len(rows), INSERT_BATCH_ROWS):
+        batch = rows[start:start + INSERT_BATCH_ROWS]
+        cursor.execute(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+            + ", ".join([row_placeholder] * len(batch))
+            + " RETURNING id",
+            [value for row in batch for value in row],
+        )
+        # RETURNING order is unspecified, but ids are allocated in VALUES
+        # order within one statement, so sorting lines them up with the batch.
+        ids.extend(sorted(row[0] for row in cursor.fetchall()))
+    return ids
+
+
+def import_users_batch(rows):
+    # rows are validated dicts (line, name, username, password, role, group).
+    # New usernames are inserted; existing ones with the same role get their
+    # name, password and group refreshed; a role mismatch or an existing
+    # administrator is a conflict, so a file cannot take over an admin.
+    result = {"inserted": 0, "updated": 0, "conflicts": []}
+    user_ids = []
+    with transaction() as conn:
         cursor = conn.cursor()
+        for start in range(0, len(rows), INSERT_BATCH_ROWS):
+            batch = rows[start:start + INSERT_BATCH_ROWS]
+            user_ids.extend(_import_users_batch(cursor, batch, result))
+        if user_ids:
+            events.publish(events.UsersChanged(tuple(user_ids)))
+    return result
+
+
+def _import_users_batch(cursor, batch, result):
+    group_names = sorted({row["group"] for row in batch if row["group"]})
+    group_ids = {}
+    if group_names:
+        cursor.executemany("INSERT OR IGNORE INTO groups (name) VALUES (?)",
+                           [(name,) for name in group_names])
         cursor.execute(
-            "INSERT INTO tests (name, attempts, creator_id) VALUES (?, ?, ?)",
-            (test_name, attempts, creator_id),
+            f"SELECT name, id FROM groups WHERE name IN ({', '.join('?' * len(group_names))})",
+            group_names,
         )
-        test_id = cursor.lastrowid
+        group_ids = dict(cursor.fetchall())
+
+    usernames = [row["username"] for row in batch]
+    cursor.execute(
+        f"SELECT username, id, role FROM users WHERE username IN ({', '.join('?' * len(usernames))})",
+        usernames,
+    )
+    existing = {username: (user_id, role)
+                for username, user_id, role in cursor.fetchall()}
+
+    new_rows = []
+    updates = []
+    # Updated users whose row names a group; a row without one keeps the
+    # memberships (and the group-assigned tests) the user already has.
+    regrouped = []
+    user_ids = {}
+    for row in batch:
+        found = existing.get(row["username"])
+        if found is None:
+            new_rows.append(row)
+        elif found[1] != row["role"]:
+            result["conflicts"].append({
+                "line": row["line"],
+                "username": row["username"],
+                "reason": f"логин уже занят пользователем с ролью {found[1]}",
+            })
+        elif found[1] == "ADMIN":
+            result["conflicts"].append({
+                "line": row["line"],
+                "username": row["username"],
+                "reason": "учетную запись администратора нельзя изменить импортом",
+            })
+        else:
+            updates.append((row["name"], row["password"], found[0]))
+            if row["group"]:
+                regrouped.append((found[0],))
+            user_ids[row["username"]] = found[0]
+
+    if updates:
+        cursor.executemany(
+            "UPDATE users SET name = ?, password = ? WHERE id = ?", updates)
+    if regrouped:
+        cursor.executemany("DELETE FROM user_groups WHERE user_id = ?", regrouped)
+    if new_rows:
+        cursor.execute(
+            "INSERT INTO users (name, username, password, role) VALUES "
+            + ", ".join(["(?, ?, ?, ?)"] * len(new_rows))
+            + " RETURNING id, username",
+            [value for row in new_rows
+             for value in (row["name"], row["username"], row["password"], row["role"])],
+        )
+        user_ids.update((username, user_id)
+                        for user_id, username in cursor.fetchall())
+
+    cursor.executemany(
+        "INSERT INTO user_groups (user_id, group_id) VALUES (?, ?)",
+        [(user_ids[row["username"]], group_ids[row["group"]])
+         for row in batch if row["group"] and row["username"] in user_ids],
+    )
+    result["inserted"] += len(new_rows)
+    result["updated"] += len(updates)
+    return user_ids.values()
+
+
+def _test_questions(test, section_ids):
+    # A test lists its questions directly, or in sections drawn from per
+    # attempt; yields (section_id, question) in insertion order.
+    for question in test.get("questions", []):
+        yield None, question
+    for section_id, section in zip(section_ids, test.get("sections", [])):
+        for question in section["questions"]:
+            yield section_id, question
+
+
+def _store_images(cursor, images):
+    # Content-addressed: an image already stored under the same sha256 is
+    # reused, so the same picture in many questions is kept once.
+    if not images:
+        return {}
+    unique = {image["sha256"]: image for image in images}
+    cursor.executemany(
+        "INSERT OR IGNORE INTO images (sha256, width, height, thumbnail, data) VALUES (?, ?, ?, ?, ?)",
+        [(image["sha256"], image["width"], image["height"], image["thumbnail"], image["data"])
+         for image in unique.values()],
+    )
+    image_ids = {}
+    hashes = list(unique)
+    for start in range(0, len(hashes), INSERT_BATCH_ROWS):
+        batch = hashes[start:start + INSERT_BATCH_ROWS]
+        cursor.execute(
+            f"SELECT sha256, id FROM images WHERE sha256 IN ({', '.join('?' * len(batch))})",
+            batch,
+        )
+        image_ids.update(cursor.fetchall())
+    return image_ids
 
-        for question in questions:
-            cursor.execute(
-                "INSERT INTO questions (test_id, text, type) VALUES (?, ?, ?)",
-                (test_id, question["text"], question["type"]),
-            )
-            question_id = cursor.lastrowid
 
+def get_image_thumbnails(image_ids):
+    thumbnails = {}
+    conn = get_connection()
+    cursor = conn.cursor()
+    for start in range(0, len(image_ids), INSERT_BATCH_ROWS):
+        batch = image_ids[start:start + INSERT_BATCH_ROWS]
+        cursor.execute(
+            f"SELECT id, thumbnail FROM images WHERE id IN ({', '.join('?' * len(batch))})",
+            batch,
+        )
+        thumbnails.update(cursor.fetchall())
+    return thumbnails
+
+
+def save_tests_bulk(tests, creator_id):
+    started = time.perf_counter()
+    with transaction() as conn:
+        cursor = conn.cursor()
+        test_ids = _insert_returning_ids(
+            cursor,
+            "tests",
+            ("name", "description", "attempts", "creator_id"),
+            [(test["name"], test.get("description"), test["attempts"], creator_id)
+             for test in tests],
+        )
+
+        section_rows = []
+        for test_id, test in zip(test_ids, tests):
+            for position, section in enumerate(test.get("sections", [])):
+                section_rows.append((test_id, section.get("name"), position,
+                                     section.get("draw_count")))
+        section_ids = iter(_insert_returning_ids(
+            cursor, "test_sections", ("test_id", "name", "position", "draw_count"),
+            section_rows))
+        test_section_ids = [
+            [next(section_ids) for _ in test.get("sections", [])] for test in tests]
+
+        image_ids = _store_images(cursor, [
+            question["image"]
+            for test, section_ids in zip(tests, test_section_ids)
+            for _, question in _test_questions(test, section_ids)
+            if question.get("image")
+        ])
+
+        question_rows = []
+        for test_id, test, section_ids in zip(test_ids, tests, test_section_ids):
+            for section_id, question in _test_questions(test, section_ids):
+                image = question.get("image")
+                question_rows.append(
+                    (test_id, section_id, question["text"], question["type"],
+                     image_ids[image["sha256"]] if image else None))
+        question_ids = _insert_returning_ids(
+            cursor, "questions", ("test_id", "section_id", "text", "type", "image_id"),
+            question_rows)
+
+        answer_rows = []
+        questions = (question
+                     for test, section_ids in zip(tests, test_section_ids)
+                     for _, question in _test_questions(test, section_ids))
+        for question_id, question in zip(question_ids, questions):
             for answer in question["answers"]:
-                cursor.execute(
-                    "INSERT INTO answers (question_id, text, is_correct) VALUES (?, ?, ?)",
-                    (question_id, answer["text"], answer["is_correct"]),
-                )
+                answer_rows.append(
+                    (question_id, answer["text"], answer["is_correct"]))
+        _insert_returning_ids(
+            cursor, "answers", ("question_id", "text", "is_correct"), answer_rows)
+        events.publish(events.TestsSaved(tuple(test_ids), creator_id))
+
+    return {
+        "test_ids": test_ids,
+        "questions": len(question_rows),
+        "answers": len(answer_rows),
+        "seconds": time.perf_counter() - started,
+    }
 
-        conn.commit()
+
+def save_test_to_database(test_name, attempts, questions, creator_id):
+    result = save_tests_bulk(
+        [{"name": test_name, "attempts": attempts, "questions": questions}],
+        creator_id,
+    )
+    return result["test_ids"][0]
 
 
 def delete_test(test_id):
-    query = "DELETE FROM tests WHERE id = ?"
+    query = "DELETE FROM tests WHERE id = ? RETURNING creator_id"
     args = (test_id,)
-    execute_query(query, args)
+    for (creator_id,) in execute_query(query, args):
+        events.publish(events.TestDeleted(test_id, creator_id))
+
+
+SEARCH_KINDS = {"test": "Тест", "question": "Вопрос", "answer": "Ответ"}
+
+# Only the newest SEARCH_CANDIDATES matches are ranked, which bounds the
+# cost of a very common term on a large question bank.
+SEARCH_CANDIDATES = 2000
+SNIPPET_WORDS = 16
+
+# Control characters mark the matched terms in snippets; they cannot occur
+# in the indexed text, so the UI can escape the rest and highlight safely.
+SEARCH_MARK_START = "\x02"
+SEARCH_MARK_END = "\x03"
+
+
+def _fts_query(words):
+    # Every word must match, as a prefix; quoting keeps user input from
+    # being parsed as FTS5 query syntax.
+    return " ".join('"' + word.replace('"', '""') + '"*' for word in words)
+
+
+def _snippet(content, words):
+    pattern = re.compile(
+        r"(?<!\w)(?:" + "|".join(re.escape(word) for word in words) + r")\w*",
+        re.IGNORECASE)
+    tokens = content.split()
+    first = next((number for number, token in enumerate(tokens)
+                  if pattern.search(token)), 0)
+    start = max(0, first - SNIPPET_WORDS // 4)
+    text = " ".join(tokens[start:start + SNIPPET_WORDS])
+    text = pattern.sub(
+        lambda match: SEARCH_MARK_START + match.group(0) + SEARCH_MARK_END, text)
+    if start > 0:
+        text = "…" + text
+    if start + SNIPPET_WORDS < len(tokens):
+        text += "…"
+    return text
+
+
+def search_tests(text, creator_id=None, limit=50):
+    words = text.split()
+    if not words:
+        return []
+    # Tests are looked up through correlated subqueries: joining the FTS
+    # table directly makes the planner scan tests for every match.
+    query = """
+    WITH hits AS (
+        SELECT s.rowid AS id, s.test_id, s.kind, s.rank
+        FROM search_index s
+        WHERE search_index MATCH ?
+          AND s.test_id IN (SELECT id FROM tests WHERE ? IS NULL OR creator_id = ?)
+        ORDER BY s.rowid DESC
+        LIMIT ?
+    )
+    SELECT h.test_id,
+           (SELECT name FROM tests WHERE id = h.test_id),
+           h.kind,
+           (SELECT content FROM search_index WHERE rowid = h.id)
+    FROM (SELECT * FROM hits ORDER BY rank LIMIT ?) h
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(query, (_fts_query(words), creator_id, creator_id,
+                           SEARCH_CANDIDATES, limit))
+    return [
+        {"test_id": row[0], "test_name": row[1], "kind": row[2],
+         "snippet": _snippet(row[3], words)}
+        for row in cursor.fetchall()
+    ]
 
 
 def get_group_id_by_name(group_name):
-    conn = create_connection()
-    with conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT id FROM groups WHERE name = ?", (group_name,))
-        result = cursor.fetchone()
-        return result[0] if result else None
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute("SELECT id FROM groups WHERE name = ?", (group_name,))
+    result = cursor.fetchone()
+    return result[0] if result else None
 
 
 def get_tests_by_teacher(teacher_id):
@@ -541,18 +861,34 @@ def get_tests_by_teacher(teacher_id):
     WHERE u.id = ?
     """
     args = (teacher_id,)
-    conn = create_connection()
-    with conn:
-        cursor = conn.cursor()
-        cursor.execute(query, args)
-        return [{"id": row[0], "name": row[1]} for row in cursor.fetchall()]
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(query, args)
+    return [{"id": row[0], "name": row[1]} for row in cursor.fetchall()]
 
 
+# The returned dict is shared through tests_cache and must not be mutated.
 def get_test_details(test_id):
+    conn = get_connection()
+    row = conn.execute(
+        "SELECT version FROM tests WHERE id = ?", (test_id,)).fetchone()
+    if row is None:
+        tests_cache.invalidate(test_id)
+        return None
+
+    version = row[0]
+    test_info = tests_cache.get(test_id, version)
+    if test_info is None:
+        test_info = _load_test_details(conn, test_id)
+        tests_cache.put(test_id, version, test_info)
+    return test_info
+
+
+def _load_test_details(conn, test_id):
     query = """
     SELECT t.id, t.name, t.attempts, t.creator_id,
            q.id, q.text, q.type,
-           a.id, a.text, a.is_correct
+           a.id, a.text, a.is_correct, q.image_id
     FROM tests t
     LEFT JOIN questions q ON t.id = q.test_id
     LEFT JOIN answers a ON q.id = a.question_id
@@ -560,45 +896,165 @@ def get_test_details(test_id):
     ORDER BY q.id, a.id
     """
     args = (test_id,)
-    conn = create_connection()
-    with conn:
-        cursor = conn.cursor()
-        cursor.execute(query, args)
-        rows = cursor.fetchall()
-        if not rows:
+    cursor = conn.cursor()
+    cursor.execute(query, args)
+    rows = cursor.fetchall()
+    if not rows:
+        return None
+
+    test_info = {
+        "id": None,
+        "name": None,
+        "attempts": None,
+        "creator_id": None,
+        "questions": [],
+    }
+    question = None
+
+    for row in rows:
+        if test_info["id"] is None:
+            test_info["id"] = row[0]
+            test_info["name"] = row[1]
+            test_info["attempts"] = row[2]
+            test_info["creator_id"] = row[3]
+
+        if question is None or question["id"] != row[4]:
+            question = {"id": row[4], "text": row[5], "type": row[6],
+                        "image_id": row[10], "answers": []}
+            test_info["questions"].append(question)
+
+        if row[7] is not None:
+            answer = {"id": row[7], "text": row[8], "is_correct": row[9]}
+            question["answers"].append(answer)
+
+    return test_info
+
+
+def _load_questions(conn, test_id, question_ids):
+    # Loads only the given questions of a test, in the given order.
+    questions = {}
+    cursor = conn.cursor()
+    for start in range(0, len(question_ids), INSERT_BATCH_ROWS):
+        batch = question_ids[start:start + INSERT_BATCH_ROWS]
+        cursor.execute(
+            f"""
+            SELECT q.id, q.text, q.type, q.image_id, a.id, a.text, a.is_correct
+            FROM questions q
+            LEFT JOIN answers a ON q.id = a.question_id
+            WHERE q.test_id = ? AND q.id IN ({', '.join('?' * len(batch))})
+            ORDER BY q.id, a.id
+            """,
+            [test_id, *batch],
+        )
+        for row in cursor.fetchall():
+            question = questions.get(row[0])
+            if question is None:
+                question = questions[row[0]] = {
+                    "id": row[0], "text": row[1], "type": row[2],
+                    "image_id": row[3], "answers": []}
+            if row[4] is not None:
+                question["answers"].append(
+                    {"id": row[4], "text": row[5], "is_correct": row[6]})
+    return [questions[question_id] for question_id in question_ids
+            if question_id in questions]
+
+
+def draw_question_ids(test_id):
+    # Returns None for a test without sections (every question, in order).
+    # Otherwise samples positions per section and fetches them through
+    # idx_questions_pool, so the cost depends on draw_count, not pool size.
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT id, draw_count, pool_size FROM test_sections WHERE test_id = ? ORDER BY position, id",
+        (test_id,),
+    )
+    sections = cursor.fetchall()
+    if not sections:
+        return None
+
+    question_ids = []
+    for section_id, draw_count, pool_size in sections:
+        if draw_count is None or draw_count >= pool_size:
+            positions = list(range(pool_size))
+            if draw_count is not None:
+                random.shuffle(positions)
+        else:
+            positions = random.sample(range(pool_size), draw_count)
+        by_position = {}
+        for start in range(0, len(positions), INSERT_BATCH_ROWS):
+            batch = positions[start:start + INSERT_BATCH_ROWS]
+            cursor.execute(
+                f"SELECT pool_position, id FROM questions "
+                f"WHERE section_id = ? AND pool_position IN ({', '.join('?' * len(batch))})",
+                [section_id, *batch],
+            )
+            by_position.update(cursor.fetchall())
+        question_ids.extend(by_position[position] for position in positions)
+    return question_ids
+
+
+def start_test_attempt(test_id, page_size=None, question_ids=None):
+    # The drawn questions travel with the attempt as "question_ids" and are
+    # passed back to record_test_results on submit. With page_size only the
+    # first page is loaded; the rest comes from get_attempt_questions.
+    # question_ids resumes a draft's draw if those questions still exist.
+    conn = get_connection()
+    row = conn.execute(
+        "SELECT id, name, attempts, creator_id FROM tests WHERE id = ?", (test_id,)
+    ).fetchone()
+    if row is None:
+        return None
+
+    if question_ids is not None:
+        existing = {question_id for question_id, in conn.execute(
+            "SELECT id FROM questions WHERE test_id = ?", (test_id,))}
+        if not existing.issuperset(question_ids):
+            question_ids = None
+    if question_ids is None:
+        question_ids = draw_question_ids(test_id)
+    if question_ids is None:
+        question_ids = [question_id for question_id, in conn.execute(
+            "SELECT id FROM questions WHERE test_id = ? ORDER BY id", (test_id,))]
+    first_page = question_ids if page_size is None else question_ids[:page_size]
+    return {
+        "id": row[0],
+        "name": row[1],
+        "attempts": row[2],
+        "creator_id": row[3],
+        "questions": _load_questions(conn, test_id, first_page),
+        "question_ids": question_ids,
+    }
+
+
+def get_attempt_questions(test_id, question_ids):
+    return _load_questions(get_connection(), test_id, question_ids)
+
+
+def record_test_results(student_id, test_id, answers, question_ids=None):
+    if question_ids is None:
+        test_details = get_test_details(test_id)
+        if test_details is None:
             return None
-
-        test_info = {
-            "id": None,
-            "name": None,
-            "attempts": None,
-            "creator_id": None,
-            "questions": [],
+        questions = test_details["questions"]
+    else:
+        questions = _load_questions(get_connection(), test_id, question_ids)
+    question_ids = [question["id"] for question in questions]
+    drawn = set(question_ids)
+
+    # Answers to questions that were not drawn for this attempt are neither
+    # graded nor stored.
+    selected = {
+        question["question_id"]: {
+            answer_id for answer_id in question["selected_answers"]
+            if answer_id is not None
         }
-        question = None
-
-        for row in rows:
-            if test_info["id"] is None:
-                test_info["id"] = row[0]
-                test_info["name"] = row[1]
-                test_info["attempts"] = row[2]
-                test_info["creator_id"] = row[3]
+        for question in answers
+        if question["question_id"] in drawn
+    }
+    score, max_score, results = grading.grade_attempt(questions, selected)
 
-            if question is None or question["id"] != row[4]:
-                question = {"id": row[4], "text": row[5],
-                            "type": row[6], "answers": []}
-                test_info["questions"].append(question)
-
-            if row[7] is not None:
-                answer = {"id": row[7], "text": row[8], "is_correct": row[9]}
-                question["answers"].append(answer)
-
-        return test_info
-
-
-def record_test_results(student_id, test_id, answers):
-    conn = create_connection()
-    with conn:
+    with transaction() as conn:
         cursor = conn.cursor()
 
         cursor.execute(
@@ -610,26 +1066,99 @@ def record_test_results(student_id, test_id, answers):
             student_test_id, remaining_attempts = result
             if remaining_attempts > 0:
                 cursor.execute(
-                    "INSERT INTO test_results (student_id, test_id) VALUES (?, ?)",
-                    (student_id, test_id)
+                    """
+                    INSERT INTO test_results
+                        (student_id, test_id, score, max_score, question_results,
+                         question_order, submitted_at)
+                    VALUES (?, ?, ?, ?, ?, ?, datetime('now', 'localtime'))
+                    """,
+                    (student_id, test_id, score, max_score,
+                     grading.encode_results(results),
+                     grading.encode_question_order(question_ids))
                 )
                 test_results_id = cursor.lastrowid
 
-                for question in answers:
-                    question_id = question["question_id"]
-                    selected_answers = question["selected_answers"]
-                    for answer_id in selected_answers:
-                        cursor.execute(
-                            "INSERT INTO student_answers (test_results_id, question_id, selected_answer) VALUES (?, ?, ?)",
-                            (test_results_id, question_id, answer_id),
-                        )
+                cursor.executemany(
+                    "INSERT INTO student_answers (test_results_id, question_id, selected_answer) VALUES (?, ?, ?)",
+                    [
+                        (test_results_id, question_id, answer_id)
+                        for question_id in question_ids
+                        for answer_id in selected.get(question_id, ())
+                    ],
+                )
 
                 cursor.execute(
                     "UPDATE student_tests SET remaining_attempts = remaining_attempts - 1 WHERE id = ?",
                     (student_test_id,),
                 )
+                _delete_attempt_draft(cursor, student_id, test_id)
+                events.publish(events.TestResultRecorded(
+                    student_id, test_id, test_results_id))
+                return {"id": test_results_id, "score": score, "max_score": max_score}
+    return None
 
-                conn.commit()
+
+def save_attempt_draft(student_id, test_id, question_ids, current_page, answers):
+    # answers maps question id -> answer ids for the questions changed since
+    # the last save; an empty list clears that question.
+    with transaction() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            INSERT INTO attempt_drafts
+                (student_id, test_id, question_order, current_page, updated_at)
+            VALUES (?, ?, ?, ?, datetime('now', 'localtime'))
+            ON CONFLICT(student_id, test_id) DO UPDATE SET
+                question_order = excluded.question_order,
+                current_page = excluded.current_page,
+                updated_at = excluded.updated_at
+            """,
+            (student_id, test_id, grading.encode_question_order(question_ids), current_page),
+        )
+        cursor.executemany(
+            "INSERT OR REPLACE INTO draft_answers (student_id, test_id, question_id, answer_ids) VALUES (?, ?, ?, ?)",
+            [(student_id, test_id, question_id, ",".join(map(str, sorted(answer_ids))))
+             for question_id, answer_ids in answers.items() if answer_ids],
+        )
+        cursor.executemany(
+            "DELETE FROM draft_answers WHERE student_id = ? AND test_id = ? AND question_id = ?",
+            [(student_id, test_id, question_id)
+             for question_id, answer_ids in answers.items() if not answer_ids],
+        )
+
+
+def get_attempt_draft(student_id, test_id):
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT question_order, current_page FROM attempt_drafts WHERE student_id = ? AND test_id = ?",
+        (student_id, test_id),
+    )
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    cursor.execute(
+        "SELECT question_id, answer_ids FROM draft_answers WHERE student_id = ? AND test_id = ?",
+        (student_id, test_id),
+    )
+    return {
+        "question_ids": grading.decode_question_order(row[0]) or [],
+        "current_page": row[1],
+        "selected": {question_id: {int(answer_id) for answer_id in answer_ids.split(",")}
+                     for question_id, answer_ids in cursor.fetchall()},
+    }
+
+
+def _delete_attempt_draft(cursor, student_id, test_id):
+    cursor.execute("DELETE FROM draft_answers WHERE student_id = ? AND test_id = ?",
+                   (student_id, test_id))
+    cursor.execute("DELETE FROM attempt_drafts WHERE student_id = ? AND test_id = ?",
+                   (student_id, test_id))
+
+
+def delete_attempt_draft(student_id, test_id):
+    with transaction() as conn:
+        _delete_attempt_draft(conn.cursor(), student_id, test_id)
 
 
 def get_remaining_attempts(student_id, test_id):
@@ -639,12 +1168,11 @@ def get_remaining_attempts(student_id, test_id):
     """
     args = (student_id, test_id)
 
-    conn = create_connection()
-    with conn:
-        cursor = conn.cursor()
-        cursor.execute(query, args)
-        result = cursor.fetchone()
-        return result[0] if result else None
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(query, args)
+    result = cursor.fetchone()
+    return result[0] if result else None
 
 
 def get_tests_by_student(student_id):
@@ -654,24 +1182,234 @@ def get_tests_by_student(student_id):
     JOIN test_results tr ON t.id = tr.test_id
     WHERE tr.student_id = ?
     """
-    conn = create_connection()
-    with conn:
-        cursor = conn.cursor()
-        cursor.execute(query, (student_id,))
-        return [{"id": row[0], "name": row[1]} for row in cursor.fetchall()]
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(query, (student_id,))
+    return [{"id": row[0], "name": row[1]} for row in cursor.fetchall()]
 
 
 def get_student_test_attempt_results(student_id, test_id):
     query = """
-    SELECT tr.id, a.is_correct, sa.selected_answer
-    FROM student_answers sa
-    JOIN answers a ON sa.question_id = a.question_id AND sa.selected_answer = a.id
-    JOIN test_results tr ON sa.test_results_id = tr.id
-    WHERE tr.student_id = ? AND tr.test_id = ?
+    SELECT id, score, max_score, submitted_at
+    FROM test_results
+    WHERE student_id = ? AND test_id = ?
+    ORDER BY id
     """
     args = (student_id, test_id)
-    conn = create_connection()
-    with conn:
-        cursor = conn.cursor()
-        cursor.execute(query, args)
-        return cursor.fetchall()
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(query, args)
+    return cursor.fetchall()
+
+
+def get_attempt_details(student_id, test_id, attempt_id):
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT question_order FROM test_results WHERE id = ? AND student_id = ? AND test_id = ?",
+        (attempt_id, student_id, test_id),
+    )
+    row = cursor.fetchone()
+    if row is None:
+        return []
+    cursor.execute(
+        "SELECT question_id, selected_answer FROM student_answers WHERE test_results_id = ?",
+        (attempt_id,),
+    )
+    selected = {}
+    for question_id, answer_id in cursor.fetchall():
+        selected.setdefault(question_id, set()).add(answer_id)
+
+    # Attempts recorded before question pools have no stored order and
+    # were taken on the whole test.
+    question_ids = grading.decode_question_order(row[0])
+    if question_ids is None:
+        questions = get_test_details(test_id)["questions"]
+    else:
+        questions = _load_questions(conn, test_id, question_ids)
+
+    details = []
+    for question in questions:
+        chosen = selected.get(question["id"], set())
+        student_answer = ", ".join(
+            answer["text"] for answer in question["answers"] if answer["id"] in chosen)
+        correct_answer = ", ".join(
+            answer["text"] for answer in question["answers"] if answer["is_correct"])
+        details.append((question["text"], student_answer, correct_answer))
+    return details
+
+
+def get_gradebook_axes(group_id=None, test_id=None, creator_id=None):
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        SELECT u.id, u.name
+        FROM users u
+        WHERE u.role = 'STUDENT'
+          AND (:group_id IS NULL OR u.id IN (
+              SELECT user_id FROM user_groups WHERE group_id = :group_id))
+        ORDER BY u.name, u.id
+        """,
+        {"group_id": group_id},
+    )
+    students = [{"id": row[0], "name": row[1]} for row in cursor.fetchall()]
+
+    cursor.execute(
+        """
+        SELECT t.id, t.name
+        FROM tests t
+        WHERE (:test_id IS NULL OR t.id = :test_id)
+          AND (:creator_id IS NULL OR t.creator_id = :creator_id)
+        ORDER BY t.name, t.id
+        """,
+        {"test_id": test_id, "creator_id": creator_id},
+    )
+    tests = [{"id": row[0], "name": row[1]} for row in cursor.fetchall()]
+    return students, tests
+
+
+GRADEBOOK_CHUNK_ROWS = 500
+
+
+def iter_gradebook_cells(group_id=None, test_id=None, creator_id=None):
+    query = """
+    WITH attempts AS (
+        SELECT tr.student_id, tr.test_id, tr.score, tr.max_score,
+               ROW_NUMBER() OVER (
+                   PARTITION BY tr.student_id, tr.test_id ORDER BY tr.id DESC
+               ) AS recency,
+               COUNT(*) OVER cell AS attempt_count,
+               MAX(tr.score) OVER cell AS best_score,
+               AVG(tr.score) OVER cell AS average_score
+        FROM test_results tr
+        JOIN tests t ON tr.test_id = t.id
+        WHERE (:test_id IS NULL OR tr.test_id = :test_id)
+          AND (:creator_id IS NULL OR t.creator_id = :creator_id)
+          AND (:group_id IS NULL OR tr.student_id IN (
+              SELECT user_id FROM user_groups WHERE group_id = :group_id))
+        WINDOW cell AS (PARTITION BY tr.student_id, tr.test_id)
+    )
+    SELECT student_id, test_id, attempt_count, best_score,
+           score AS last_score, average_score, max_score
+    FROM attempts
+    WHERE recency = 1
+    """
+    args = {"group_id": group_id, "test_id": test_id, "creator_id": creator_id}
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(query, args)
+    while True:
+        rows = cursor.fetchmany(GRADEBOOK_CHUNK_ROWS)
+        if not rows:
+            break
+        yield [
+            {
+                "student_id": row[0],
+                "test_id": row[1],
+                "attempts": row[2],
+                "best_score": row[3],
+                "last_score": row[4],
+                "average_score": row[5],
+                "max_score": row[6],
+            }
+            for row in rows
+        ]
+
+
+# Rows per fetchmany() of an export; the writers never hold more than one
+# chunk, so memory does not grow with the number of results.
+EXPORT_CHUNK_ROWS = 5000
+
+# CROSS JOINs keep test_results as the outer loop: SQLite then walks it in
+# id order and streams rows out without sorting the whole result first.
+_EXPORT_SOURCES = {
+    "attempts": "test_results tr CROSS JOIN tests t ON tr.test_id = t.id",
+    "answers": """test_results tr CROSS JOIN tests t ON tr.test_id = t.id
+                  CROSS JOIN student_answers sa ON sa.test_results_id = tr.id""",
+}
+
+_EXPORT_COLUMNS = {
+    "attempts": """
+        tr.id, tr.student_id, u.username, u.name,
+        (SELECT GROUP_CONCAT(g.name, ', ')
+         FROM user_groups ug JOIN groups g ON ug.group_id = g.id
+         WHERE ug.user_id = tr.student_id),
+        tr.test_id, t.name, tr.score, tr.max_score, tr.submitted_at
+    """,
+    "answers": """
+        tr.id, tr.student_id, u.username, tr.test_id, t.name,
+        sa.question_id, q.text, sa.selected_answer, a.text, a.is_correct
+    """,
+}
+
+_EXPORT_JOINS = {
+    "attempts": "CROSS JOIN users u ON tr.student_id = u.id",
+    "answers": """CROSS JOIN users u ON tr.student_id = u.id
+                  LEFT JOIN questions q ON sa.question_id = q.id
+                  LEFT JOIN answers a ON sa.selected_answer = a.id""",
+}
+
+_EXPORT_ORDER = {
+    "attempts": "tr.id",
+    "answers": "tr.id, sa.id",
+}
+
+# submitted_at is 'YYYY-MM-DD HH:MM:SS' local time, so a term is the
+# half-open range [since, until) of such strings or plain dates.
+_EXPORT_FILTERS = """
+    (:test_id IS NULL OR tr.test_id = :test_id)
+    AND (:creator_id IS NULL OR t.creator_id = :creator_id)
+    AND (:group_id IS NULL OR tr.student_id IN (
+        SELECT user_id FROM user_groups WHERE group_id = :group_id))
+    AND (:since IS NULL OR tr.submitted_at >= :since)
+    AND (:until IS NULL OR tr.submitted_at < :until)
+"""
+
+
+def _export_args(kind, group_id, test_id, creator_id, since, until):
+    if kind not in _EXPORT_SOURCES:
+        raise ValueError(f"Unknown export kind: {kind!r}")
+    return {"group_id": group_id, "test_id": test_id, "creator_id": creator_id,
+            "since": since, "until": until}
+
+
+def _export_from(kind):
+    # Shared by the count and the rows, so progress totals match the export.
+    return f"""
+    FROM {_EXPORT_SOURCES[kind]}
+    {_EXPORT_JOINS[kind]}
+    WHERE {_EXPORT_FILTERS}
+    """
+
+
+def count_export_rows(kind, group_id=None, test_id=None, creator_id=None,
+                      since=None, until=None):
+    args = _export_args(kind, group_id, test_id, creator_id, since, until)
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT COUNT(*) {_export_from(kind)}", args)
+    return cursor.fetchone()[0]
+
+
+def iter_export_rows(kind, group_id=None, test_id=None, creator_id=None,
+                     since=None, until=None, chunk_rows=EXPORT_CHUNK_ROWS):
+    # Yields lists of row tuples: one row per attempt for "attempts", one
+    # per chosen option for "answers".
+    args = _export_args(kind, group_id, test_id, creator_id, since, until)
+    query = f"""
+    SELECT {_EXPORT_COLUMNS[kind]}
+    {_export_from(kind)}
+    ORDER BY {_EXPORT_ORDER[kind]}
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(query, args)
+    try:
+        while True:
+            rows = cursor.fetchmany(chunk_rows)
+            if not rows:
+                break
+            yield rows
+    finally:
+        cursor.close()
@@ -0,0 +1,63 @@
+# events.py
+
+import threading
+from collections import namedtuple
+
+import connection
+
+# Domain events published by database.py once the change has committed.
+# Each carries the ids of the rows it touched, so a subscriber refetches
+# or patches only those rows.
+UsersChanged = namedtuple("UsersChanged", "user_ids")  # added, edited or deleted
+StudentGroupsChanged = namedtuple("StudentGroupsChanged", "student_ids")
+TestsSaved = namedtuple("TestsSaved", "test_ids creator_id")  # created or edited
+TestDeleted = namedtuple("TestDeleted", "test_id creator_id")
+TestsAssigned = namedtuple("TestsAssigned", "test_ids student_ids")  # assigned or withdrawn
+TestResultRecorded = namedtuple("TestResultRecorded", "student_id test_id attempt_id")
+
+EVENT_TYPES = (UsersChanged, StudentGroupsChanged, TestsSaved, TestDeleted,
+               TestsAssigned, TestResultRecorded)
+
+_lock = threading.Lock()
+# event type -> callbacks
+_subscribers = {}
+
+
+def _call(callback, event):
+    callback(event)
+
+
+# How a callback is invoked; the GUI replaces it to hop onto its thread.
+_deliver = _call
+
+
+def set_delivery(deliver):
+    global _deliver
+    _deliver = deliver or _call
+
+
+def subscribe(event_type, callback):
+    if event_type not in EVENT_TYPES:
+        raise ValueError(f"Unknown event type: {event_type!r}")
+    with _lock:
+        _subscribers.setdefault(event_type, []).append(callback)
+
+
+def unsubscribe(callback):
+    with _lock:
+        for callbacks in _subscribers.values():
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+
+def publish(event):
+    # Inside a transaction the event waits for the commit, so subscribers
+    # never read rows that are not there yet, or that get rolled back.
+    connection.after_commit(lambda: _dispatch(event))
+
+
+def _dispatch(event):
+    with _lock:
+        callbacks = list(_subscribers.get(type(event), ()))
+    for callback in callbacks:
+        _deliver(callback, event)
@@ -0,0 +1,222 @@
+# exporter.py
+#
+# Streams test results to CSV, XLSX or Parquet, one chunk at a time, so
+# memory use does not depend on how many results there are. Also runs
+# without the GUI:
+#   python exporter.py OUT.csv|OUT.xlsx|OUT.parquet [--kind attempts|answers]
+#       [--group NAME] [--test ID] [--since DATE] [--until DATE]
+#       [--database FILE]
+
+import argparse
+import csv
+import os
+import time
+
+import connection
+import database
+
+CHUNK_ROWS = database.EXPORT_CHUNK_ROWS
+# Excel allows 1 048 576 rows per sheet; the header takes one of them.
+XLSX_SHEET_ROWS = 1048575
+# Chunks are gathered into row groups of about this size; a row group per
+# chunk would make the file slow to read.
+PARQUET_GROUP_ROWS = 100000
+
+# (column, title, type) per export kind, in the order database.py yields them.
+COLUMNS = {
+    "attempts": (
+        ("attempt_id", "Попытка", "int"),
+        ("student_id", "Код ученика", "int"),
+        ("username", "Логин", "str"),
+        ("student", "ФИО", "str"),
+        ("groups", "Группа", "str"),
+        ("test_id", "Код теста", "int"),
+        ("test", "Тест", "str"),
+        ("score", "Баллы", "int"),
+        ("max_score", "Максимум", "int"),
+        ("submitted_at", "Дата сдачи", "str"),
+    ),
+    "answers": (
+        ("attempt_id", "Попытка", "int"),
+        ("student_id", "Код ученика", "int"),
+        ("username", "Логин", "str"),
+        ("test_id", "Код теста", "int"),
+        ("test", "Тест", "str"),
+        ("question_id", "Код вопроса", "int"),
+        ("question", "Вопрос", "str"),
+        ("answer_id", "Код ответа", "int"),
+        ("answer", "Ответ", "str"),
+        ("is_correct", "Верный", "int"),
+    ),
+}
+
+KINDS = {"attempts": "Попытки", "answers": "Ответы"}
+
+
+def _write_csv(path, columns, chunks):
+    # utf-8-sig and ";" are what Excel expects from a Russian-locale file.
+    with open(path, "w", newline="", encoding="utf-8-sig") as stream:
+        writer = csv.writer(stream, delimiter=";")
+        writer.writerow([title for _, title, _ in columns])
+        for rows in chunks:
+            writer.writerows(rows)
+            yield len(rows)
+
+
+def _write_xlsx(path, columns, chunks):
+    try:
+        import openpyxl
+    except ImportError as error:
+        raise ImportError("Для экспорта в XLSX требуется пакет openpyxl") from error
+
+    # A write-only workbook streams each sheet to a temporary file instead
+    # of keeping its cells in memory.
+    workbook = openpyxl.Workbook(write_only=True)
+    header = [title for _, title, _ in columns]
+    sheet = None
+    sheet_rows = 0
+
+    def add_sheet():
+        number = len(workbook.worksheets) + 1
+        added = workbook.create_sheet("Результаты" if number == 1 else f"Результаты {number}")
+        added.append(header)
+        return added
+
+    saved = False
+    try:
+        for rows in chunks:
+            for row in rows:
+                if sheet is None or sheet_rows == XLSX_SHEET_ROWS:
+                    sheet = add_sheet()
+                    sheet_rows = 0
+                sheet.append(row)
+                sheet_rows += 1
+            yield len(rows)
+        if sheet is None:
+            add_sheet()
+        saved = True
+        workbook.save(path)
+    finally:
+        # Saving is what removes a write-only workbook's temporary files, so
+        # a cancelled export saves what it has; iter_export then deletes it.
+        if not saved:
+            workbook.save(path)
+
+
+def _write_parquet(path, columns, chunks):
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as error:
+        raise ImportError("Для экспорта в Parquet требуется пакет pyarrow") from error
+
+    types = {"int": pyarrow.int64(), "str": pyarrow.string()}
+    schema = pyarrow.schema([(name, types[kind]) for name, _, kind in columns])
+
+    def row_group(rows):
+        values = list(zip(*rows))
+        return pyarrow.Table.from_arrays(
+            [pyarrow.array(column, type=field.type) for column, field in zip(values, schema)],
+            schema=schema)
+
+    writer = pyarrow.parquet.ParquetWriter(path, schema)
+    try:
+        group = []
+        for rows in chunks:
+            group.extend(rows)
+            if len(group) >= PARQUET_GROUP_ROWS:
+                writer.write_table(row_group(group))
+                group = []
+            yield len(rows)
+        if group:
+            writer.write_table(row_group(group))
+    finally:
+        writer.close()
+
+
+FILE_FILTERS = "CSV (*.csv);;Excel (*.xlsx);;Parquet (*.parquet)"
+
+WRITERS = {
+    ".csv": _write_csv,
+    ".xlsx": _write_xlsx,
+    ".parquet": _write_parquet,
+}
+
+
+def _writer(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in WRITERS:
+        raise ValueError(f"Неподдерживаемый формат файла: {extension}")
+    return WRITERS[extension]
+
+
+def iter_export(path, kind="attempts", chunk_rows=CHUNK_ROWS, **filters):
+    # Yields a progress report after every written chunk, like
+    # importer.iter_import. A failed or cancelled export leaves no file.
+    started = time.perf_counter()
+    write = _writer(path)
+    columns = COLUMNS[kind]
+    total = database.count_export_rows(kind, **filters)
+    report = {"rows": 0, "total": total, "progress": 0.0, "seconds": 0.0}
+    chunks = database.iter_export_rows(kind, chunk_rows=chunk_rows, **filters)
+    written = write(path, columns, chunks)
+    finished = False
+    try:
+        for count in written:
+            report["rows"] += count
+            # Results recorded after the count can push rows past total.
+            yield dict(report, progress=min(report["rows"] / total, 1.0) if total else 0.0,
+                       seconds=time.perf_counter() - started)
+        finished = True
+    finally:
+        written.close()
+        chunks.close()
+        if not finished and os.path.exists(path):
+            os.remove(path)
+    yield dict(report, progress=1.0, seconds=time.perf_counter() - started)
+
+
+def export_file(path, kind="attempts", chunk_rows=CHUNK_ROWS, **filters):
+    report = None
+    for report in iter_export(path, kind, chunk_rows, **filters):
+        pass
+    return report
+
+
+def _group_id(name):
+    for group in database.get_all_groups():
+        if group["name"] == name:
+            return group["id"]
+    raise SystemExit(f"Группа не найдена: {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path", help="file to write; the format follows the extension")
+    parser.add_argument("--kind", choices=COLUMNS, default="attempts")
+    parser.add_argument("--group", help="group name")
+    parser.add_argument("--test", type=int, help="test id")
+    parser.add_argument("--since", help="first day, YYYY-MM-DD")
+    parser.add_argument("--until", help="day after the last one, YYYY-MM-DD")
+    parser.add_argument("--database", default=connection.DATABASE_PATH)
+    options = parser.parse_args()
+
+    connection.DATABASE_PATH = options.database
+    database.setup_database()
+    try:
+        report = export_file(
+            options.path, options.kind,
+            group_id=_group_id(options.group) if options.group else None,
+            test_id=options.test, since=options.since, until=options.until)
+    except (ImportError, ValueError) as error:
+        raise SystemExit(str(error)) from error
+    finally:
+        connection.close_all()
+
+    seconds = max(report["seconds"], 0.001)
+    print(f"{report['rows']} rows in {seconds:.1f} s "
+          f"({report['rows'] / seconds:.0f} rows/s) -> {options.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+# grading.py
+
+import json
+import struct
+
+
+def grade_attempt(questions, selected):
+    # selected maps question id -> set of chosen answer ids. A question
+    # counts as correct only when exactly the correct options were chosen.
+    results = {}
+    for question in questions:
+        correct = {answer["id"]
+                   for answer in question["answers"] if answer["is_correct"]}
+        chosen = selected.get(question["id"], set())
+        results[question["id"]] = bool(correct) and chosen == correct
+    return sum(results.values()), len(results), results
+
+
+def encode_results(results):
+    return json.dumps({str(question_id): int(correct)
+                       for question_id, correct in results.items()})
+
+
+def decode_results(text):
+    if not text:
+        return {}
+    return {int(question_id): bool(correct)
+            for question_id, correct in json.loads(text).items()}
+
+
+def encode_question_order(question_ids):
+    # Four bytes per question: a 40-question draw is stored in 160 bytes.
+    return struct.pack(f"<{len(question_ids)}I", *question_ids)
+
+
+def decode_question_order(blob):
+    if not blob:
+        return None
+    return list(struct.unpack(f"<{len(blob) // 4}I", blob))
@@ -0,0 +1,185 @@
+# importer.py
+
+import codecs
+import csv
+import os
+import time
+
+import database
+
+# Rows validated and written per transaction. Each chunk is small enough to
+# keep the write lock short and large enough to amortise the commit.
+CHUNK_ROWS = 2000
+
+ROLES = ("ADMIN", "TEACHER", "STUDENT")
+REQUIRED_FIELDS = ("name", "username", "password")
+
+HEADERS = {
+    "name": "name",
+    "фио": "name",
+    "username": "username",
+    "логин": "username",
+    "password": "password",
+    "пароль": "password",
+    "role": "role",
+    "роль": "role",
+    "group": "group",
+    "группа": "group",
+}
+
+
+def _csv_rows(path):
+    size = os.path.getsize(path) or 1
+    position = 0
+
+    def lines(stream):
+        nonlocal position
+        for raw_line in stream:
+            position += len(raw_line)
+            yield raw_line.decode("utf-8")
+
+    def progress():
+        return position / size
+
+    def rows():
+        nonlocal position
+        with open(path, "rb") as stream:
+            if stream.read(len(codecs.BOM_UTF8)) != codecs.BOM_UTF8:
+                stream.seek(0)
+            position = stream.tell()
+            sample = stream.read(4096).decode("utf-8", errors="ignore")
+            stream.seek(position)
+            try:
+                dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+            except csv.Error:
+                dialect = csv.excel
+            yield from csv.reader(lines(stream), dialect)
+
+    return rows(), progress
+
+
+def _xlsx_rows(path):
+    try:
+        import openpyxl
+    except ImportError as error:
+        raise ImportError("Для импорта XLSX требуется пакет openpyxl") from error
+
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    sheet = workbook.active
+    total = sheet.max_row or 0
+    line = 0
+
+    def progress():
+        return line / total if total else 0.0
+
+    def rows():
+        nonlocal line
+        try:
+            for values in sheet.iter_rows(values_only=True):
+                line += 1
+                yield ["" if value is None else str(value) for value in values]
+        finally:
+            workbook.close()
+
+    return rows(), progress
+
+
+def open_rows(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return _csv_rows(path)
+    elif extension == ".xlsx":
+        return _xlsx_rows(path)
+    raise ValueError(f"Неподдерживаемый формат файла: {extension}")
+
+
+def _header_fields(header):
+    fields = [HEADERS.get(str(title).strip().lower()) for title in header]
+    missing = [field for field in REQUIRED_FIELDS if field not in fields]
+    if missing:
+        raise ValueError("В файле нет столбцов: " + ", ".join(missing))
+    return fields
+
+
+def validate_row(line, fields, values, seen):
+    record = {"line": line, "role": "STUDENT", "group": None}
+    for field, value in zip(fields, values):
+        if field is not None:
+            value = value.strip()
+            if value:
+                record[field] = value
+
+    for field in REQUIRED_FIELDS:
+        if field not in record:
+            return record, f"не заполнено поле {field}"
+    record["role"] = record["role"].upper()
+    if record["role"] not in ROLES:
+        return record, f"неизвестная роль {record['role']}"
+    if record["username"] in seen:
+        return record, f"логин повторяется в строке {seen[record['username']]}"
+    seen[record["username"]] = line
+    return record, None
+
+
+def iter_import(path, chunk_rows=CHUNK_ROWS):
+    # Yields a progress report after every written chunk so the caller can
+    # stream it to the UI; only one chunk is held in memory at a time.
+    started = time.perf_counter()
+    rows, progress = open_rows(path)
+    report = {"rows": 0, "inserted": 0, "updated": 0,
+              "conflicts": [], "progress": 0.0, "seconds": 0.0}
+    # Repeated logins are caught per chunk, so memory stays flat however long
+    # the file is; a repeat in a later chunk updates the account like a
+    # second import would.
+    seen = {}
+    chunk = []
+    fields = None
+    try:
+        for line, values in enumerate(rows, 1):
+            if fields is None:
+                fields = _header_fields(values)
+                continue
+            if not any(value.strip() for value in values):
+                continue
+            report["rows"] += 1
+            record, reason = validate_row(line, fields, values, seen)
+            if reason is not None:
+                report["conflicts"].append({
+                    "line": line,
+                    "username": record.get("username", ""),
+                    "reason": reason,
+                })
+            else:
+                chunk.append(record)
+            if len(chunk) >= chunk_rows:
+                yield _flush(chunk, report, progress(), started)
+                chunk = []
+                seen = {}
+        if fields is None:
+            raise ValueError("Файл пуст")
+        yield _flush(chunk, report, 1.0, started)
+    finally:
+        rows.close()
+
+
+def _flush(chunk, report, progress, started):
+    if chunk:
+        result = database.import_users_batch(chunk)
+        report["inserted"] += result["inserted"]
+        report["updated"] += result["updated"]
+        report["conflicts"].extend(result["conflicts"])
+    update = dict(report, progress=progress,
+                  seconds=time.perf_counter() - started)
+    # Conflicts are handed over once; the receiver accumulates them.
+    report["conflicts"] = []
+    return update
+
+
+def import_file(path, chunk_rows=CHUNK_ROWS):
+    total = None
+    conflicts = []
+    for update in iter_import(path, chunk_rows):
+        conflicts.extend(update["conflicts"])
+        total = update
+    total["conflicts"] = conflicts
+    return total
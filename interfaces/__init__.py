@@ -1,5 +1,21 @@
-from .admin import AdminWindow
-from .student import StudentWindow
-from .teacher import TeacherWindow
+import importlib
+
 from .login import LoginWindow
-from .test_page import CreateTestPage, TakeTestPage
+
+# Role windows and test pages are imported on first access, so starting the
+# application (and a student session) never loads the admin modules.
+_LAZY_ATTRIBUTES = {
+    "AdminWindow": ".admin",
+    "TeacherWindow": ".teacher",
+    "StudentWindow": ".student",
+    "CreateTestPage": ".test_page",
+    "TakeTestPage": ".test_page",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name, __name__)
+    return getattr(module, name)
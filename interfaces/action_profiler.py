@@ -0,0 +1,180 @@
+# interfaces\action_profiler.py
+
+import cProfile
+import functools
+import inspect
+import io
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+
+from PyQt5.QtCore import QTimer
+
+PROFILE_FLAG = "--profile-actions"
+PROFILE_ENV = "TMS_PROFILE_ACTIONS"
+PROFILES_DIR = "profiles"
+TOP_FUNCTIONS = 30
+# A session ends once its worker tasks are done and nothing has run for
+# SETTLE_MS, or after TIMEOUT_MS at the latest (a cancelled task never
+# reports back).
+SETTLE_MS = 200
+TIMEOUT_MS = 30000
+
+enabled = (PROFILE_FLAG in sys.argv
+           or os.environ.get(PROFILE_ENV, "") not in ("", "0"))
+
+# The session the GUI thread is currently running code for, if any.
+_current = None
+# Sessions waiting to settle; keeps them and their timers alive.
+_sessions = set()
+# Files written by the latest session, for the settings page.
+last_files = None
+
+
+def set_enabled(value):
+    global enabled
+    enabled = bool(value)
+
+
+def current():
+    return _current
+
+
+class Session:
+    # One user action: the slot itself, the db_worker tasks it starts and
+    # the result callbacks of those tasks, each profiled on its own thread
+    # and merged into one pstats.Stats when the action settles.
+    def __init__(self, name):
+        self.name = name
+        self.started = time.perf_counter()
+        self.profiles = []
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.tasks = 0
+        self.gui_seconds = 0.0
+        self.worker_seconds = 0.0
+        self.last_activity = self.started
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.check)
+        self.timer.start(SETTLE_MS // 2)
+        _sessions.add(self)
+
+    def run(self, fn, *args, **kwargs):
+        # Runs fn on the GUI thread inside the session. Code already running
+        # inside a session is profiled by that session's profiler.
+        global _current
+        if _current is not None:
+            return fn(*args, **kwargs)
+        _current = self
+        profile = cProfile.Profile()
+        started = time.perf_counter()
+        profile.enable()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            profile.disable()
+            _current = None
+            self.gui_seconds += time.perf_counter() - started
+            self.add(profile)
+
+    def task_started(self):
+        with self.lock:
+            self.pending += 1
+            self.tasks += 1
+
+    def run_task(self, fn):
+        # Runs a db_worker task body on its worker thread.
+        profile = cProfile.Profile()
+        started = time.perf_counter()
+        profile.enable()
+        try:
+            return fn()
+        finally:
+            profile.disable()
+            with self.lock:
+                self.pending -= 1
+                self.worker_seconds += time.perf_counter() - started
+            self.add(profile)
+
+    def add(self, profile):
+        with self.lock:
+            self.profiles.append(profile)
+            self.last_activity = time.perf_counter()
+
+    def check(self):
+        now = time.perf_counter()
+        with self.lock:
+            settled = (self.pending == 0
+                       and now - self.last_activity >= SETTLE_MS / 1000)
+        if settled or now - self.started >= TIMEOUT_MS / 1000:
+            self.timer.stop()
+            _sessions.discard(self)
+            self.write()
+
+    def write(self):
+        global last_files
+        with self.lock:
+            profiles = list(self.profiles)
+        stats = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            stats.add(profile)
+
+        os.makedirs(PROFILES_DIR, exist_ok=True)
+        slug = re.sub(r"[^\w.]+", "_", self.name)
+        base = os.path.join(
+            PROFILES_DIR, time.strftime("%Y%m%d-%H%M%S") + f"_{slug}")
+        stats.dump_stats(base + ".prof")
+
+        summary = io.StringIO()
+        summary.write(
+            f"action: {self.name}\n"
+            f"wall: {(self.last_activity - self.started) * 1000:.1f} ms\n"
+            f"gui thread: {self.gui_seconds * 1000:.1f} ms\n"
+            f"worker tasks: {self.tasks}, {self.worker_seconds * 1000:.1f} ms\n"
+            f"unfinished tasks: {self.pending}\n\n")
+        stats.stream = summary
+        stats.sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+        with open(base + ".txt", "w", encoding="utf-8") as f:
+            f.write(summary.getvalue())
+        last_files = (base + ".prof", base + ".txt")
+
+
+def _positional_limit(fn):
+    # Qt passes every signal argument (clicked sends `checked`); drop the
+    # ones the slot does not accept, as PyQt does for undecorated slots.
+    parameters = inspect.signature(fn).parameters.values()
+    if any(p.kind == p.VAR_POSITIONAL for p in parameters):
+        return None
+    return sum(p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)
+               for p in parameters)
+
+
+def profiled_action(fn):
+    # Slots decorated with this start a profiling session when profiling is
+    # on and no session is running on the GUI thread yet.
+    limit = _positional_limit(fn)
+
+    @functools.wraps(fn)
+    def wrapper(*args):
+        if limit is not None:
+            args = args[:limit]
+        if not enabled or _current is not None:
+            return fn(*args)
+        return Session(fn.__qualname__).run(fn, *args)
+    return wrapper
+
+
+def bind(callback):
+    # Wraps a db_worker callback so it runs inside the session that started
+    # the task; returns the callback unchanged outside a session.
+    session = _current
+    if session is None or callback is None:
+        return callback
+
+    @functools.wraps(callback)
+    def wrapper(*args):
+        return session.run(callback, *args)
+    return wrapper
@@ -1,12 +1,7 @@
 # interfaces\admin\admin_interface.py
 
-from PyQt5.QtWidgets import QWidget, QHBoxLayout, QStackedWidget
-from interfaces.sidebar import SidebarMenu
-from .users_page import UsersPage
-from ..students_page import StudentsPage
-from .teachers_page import TeachersPage
-from ..tests_page import TestsPage
-from ..reports_page import ReportsWindow
+from PyQt5.QtWidgets import QWidget, QHBoxLayout
+from interfaces.sidebar import SidebarMenu, LazyStack, lazy_page
 
 
 class AdminWindow(QWidget):
@@ -17,15 +12,20 @@ class AdminWindow(QWidget):
 
     def initUI(self):
         upper_buttons = ["Пользователи", "Ученики",
-                         "Учителя", "Тесты", "Отчеты"]
-        self.stack = QStackedWidget()
-
-        self.stack.addWidget(UsersPage())
-        self.stack.addWidget(StudentsPage(self.main_window))
-        self.stack.addWidget(TeachersPage())
-        self.test_page = TestsPage(self)
-        self.stack.addWidget(self.test_page)
-        self.stack.addWidget(ReportsWindow(self.main_window))
+                         "Учителя", "Тесты", "Отчеты", "Журнал оценок"]
+        self.stack = LazyStack()
+
+        self.stack.addLazyPage(lazy_page(
+            "interfaces.admin.users_page", "UsersPage"))
+        self.stack.addLazyPage(lazy_page(
+            "interfaces.students_page", "StudentsPage", self.main_window))
+        self.stack.addLazyPage(lazy_page(
+            "interfaces.admin.teachers_page", "TeachersPage"))
+        self.stack.addLazyPage(self.createTestsPage)
+        self.stack.addLazyPage(lazy_page(
+            "interfaces.reports_page", "ReportsWindow", self.main_window))
+        self.stack.addLazyPage(lazy_page(
+            "interfaces.gradebook_page", "GradebookPage", self.main_window))
 
         self.sidebar = SidebarMenu(upper_buttons, self.stack, self.main_window)
 
@@ -35,6 +35,12 @@ class AdminWindow(QWidget):
 
         self.setLayout(layout)
         self.connectButtons()
+        self.stack.setCurrentIndex(0)
+
+    def createTestsPage(self):
+        from ..tests_page import TestsPage
+        self.test_page = TestsPage(self)
+        return self.test_page
 
     def connectButtons(self):
         self.sidebar.connectStack()
@@ -2,8 +2,14 @@
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QTableView, QPushButton,
                              QHeaderView, QDialog, QMessageBox)
+from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QStandardItemModel, QStandardItem
 import database
+import events
+from ..db_worker import AsyncLoader, bind_loading
+from ..action_profiler import profiled_action
+from ..change_feed import ChangeSync, row_ids
+from .. import event_bus
 
 
 class TeachersPage(QWidget):
@@ -30,16 +36,67 @@ class TeachersPage(QWidget):
         self.refreshButton.clicked.connect(self.refresh_data)
         self.layout.addWidget(self.refreshButton)
 
+        self.loader = AsyncLoader(self)
+        bind_loading(self.loader, self.refreshButton)
+        self.changes = ChangeSync(self, ("users", "tests"), self.load_data,
+                                  self.fetchChanges, self.applyChanges,
+                                  busy=self.loader.isLoading)
+        event_bus.subscribe(self, (events.UsersChanged,), self.onUsersChanged)
+        event_bus.subscribe(self, (events.TestsSaved, events.TestDeleted), self.onTestsChanged)
         self.refresh_data()
 
+    @profiled_action
     def refresh_data(self):
-        teachers_tests_data = database.get_teachers_tests()
+        self.changes.reload()
+
+    def load_data(self):
+        self.loader.load(database.get_teachers_tests,
+                         on_result=self.showTeachersTests)
+
+    def showTeachersTests(self, teachers_tests_data):
         self.teachersTestsModel.clear()
         self.teachersTestsModel.setHorizontalHeaderLabels(
             ["Имя учителя", "Созданные тесты"])
         for data in teachers_tests_data:
-            teacher_name = data["teacher_name"]
-            tests = data["tests"]
-            teacher_item = QStandardItem(teacher_name)
-            tests_item = QStandardItem(tests)
-            self.teachersTestsModel.appendRow([teacher_item, tests_item])
+            self.teachersTestsModel.appendRow(self.teacherRow(data))
+
+    def teacherRow(self, data):
+        teacher_item = QStandardItem(data["teacher_name"])
+        teacher_item.setData(data["teacher_id"], Qt.UserRole)
+        tests_item = QStandardItem(data["tests"])
+        return [teacher_item, tests_item]
+
+    @staticmethod
+    def fetchChanges(changes):
+        # A test change touches the row of its creator.
+        return TeachersPage.fetchRows(row_ids(changes, "users") | {
+            change["ref_id"] for change in changes
+            if change["table"] == "tests" and change["ref_id"] is not None})
+
+    @staticmethod
+    def fetchRows(teacher_ids):
+        return teacher_ids, database.get_teachers_tests(teacher_ids)
+
+    def onUsersChanged(self, event):
+        self.changes.patch(self.fetchRows, event.user_ids)
+
+    def onTestsChanged(self, event):
+        if event.creator_id is not None:
+            self.changes.patch(self.fetchRows, (event.creator_id,))
+
+    def applyChanges(self, rows):
+        teacher_ids, teachers_tests_data = rows
+        found = {data["teacher_id"]: data for data in teachers_tests_data}
+        rows_by_id = {self.teachersTestsModel.item(row).data(Qt.UserRole): row
+                      for row in range(self.teachersTestsModel.rowCount())}
+        for teacher_id in sorted(teacher_ids, key=lambda id: rows_by_id.get(id, -1), reverse=True):
+            row = rows_by_id.get(teacher_id)
+            data = found.get(teacher_id)
+            if data is None:
+                if row is not None:
+                    self.teachersTestsModel.removeRow(row)
+            elif row is None:
+                self.teachersTestsModel.appendRow(self.teacherRow(data))
+            else:
+                self.teachersTestsModel.item(row, 0).setText(data["teacher_name"])
+                self.teachersTestsModel.item(row, 1).setText(data["tests"])
@@ -1,20 +1,49 @@
 # interfaces\admin\users_page.py
 
 from PyQt5.QtWidgets import (QWidget, QPushButton, QTableView, QVBoxLayout, QMessageBox, QDialog,
-                             QLineEdit, QHBoxLayout, QFormLayout, QComboBox, QStyledItemDelegate, QTextEdit, QHeaderView)
+                             QLineEdit, QHBoxLayout, QFormLayout, QComboBox, QStyledItemDelegate, QTextEdit, QHeaderView,
+                             QFileDialog, QProgressBar)
 from PyQt5.QtCore import Qt, QTimer, QEvent
-from PyQt5.QtGui import QIcon, QStandardItem, QStandardItemModel
 import database
+import events
+import importer
+from ..paged_table_model import PagedTableModel
+from ..db_worker import bind_loading, run_async, run_stream
+from ..action_profiler import profiled_action
+from ..change_feed import ChangeSync, row_ids
+from .. import event_bus
+from .. import icons
+
+
+class UsersTableModel(PagedTableModel):
+    columns = [
+        ("ID", "id"),
+        ("ФИО (Edit)", "name"),
+        ("Логин", "username"),
+        ("Пароль", "password"),
+        ("Роль (Edit)", "role"),
+    ]
 
+    def __init__(self):
+        super().__init__(database.get_users_page)
+
+    def data(self, index, role=Qt.DisplayRole):
+        value = super().data(index, role)
+        if role in (Qt.DisplayRole, Qt.EditRole) and value is not None:
+            return str(value)
+        return value
 
-class CustomStandardItemModel(QStandardItemModel):
-    def __init__(self, rows, columns):
-        super().__init__(rows, columns)
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        self.rows[index.row()][self.columns[index.column()][1]] = value
+        self.dataChanged.emit(index, index)
+        return True
 
     def flags(self, index):
         flags = super().flags(index)
-        if index.column() not in [1, 4]:
-            flags &= ~Qt.ItemIsEditable
+        if index.column() in [1, 4]:
+            flags |= Qt.ItemIsEditable
         return flags
 
 
@@ -58,7 +87,6 @@ class AddUserDialog(QDialog):
 class CustomDelegate(QStyledItemDelegate):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.button_icon = QIcon("resources/icons/eye-icon.png")
         self.show_password = {}
         self.timer = QTimer()
         self.timer.timeout.connect(self.hide_password)
@@ -79,7 +107,7 @@ class CustomDelegate(QStyledItemDelegate):
                         option.rect, Qt.AlignVCenter, masked_password)
             button_rect = option.rect.adjusted(
                 option.rect.width() - 20, 0, 0, 0)
-            painter.drawPixmap(button_rect, self.button_icon.pixmap(20, 20))
+            painter.drawPixmap(button_rect, icons.pixmap("eye", 20))
 
     def editorEvent(self, event, model, option, index):
         if index.column() == 3 and event.type() == QEvent.MouseButtonRelease:
@@ -128,7 +156,7 @@ class CustomDelegate(QStyledItemDelegate):
                 model.setData(index, new_name)
                 username_index = model.index(index.row(), 2)
                 username = model.data(username_index)
-                database.update_name(username, new_name)
+                run_async(database.update_name, username, new_name)
         elif index.column() == 4:
             new_role = editor.currentText()
             old_role = index.data()
@@ -136,7 +164,7 @@ class CustomDelegate(QStyledItemDelegate):
                 model.setData(index, new_role)
                 username_index = model.index(index.row(), 2)
                 username = model.data(username_index)
-                database.update_role(username, new_role)
+                run_async(database.update_role, username, new_role)
 
         model.dataChanged.emit(index, index)
 
@@ -153,34 +181,26 @@ class UsersPage(QWidget):
         self.tableView.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.layout.addWidget(self.tableView)
 
-        self.header_map = {
-            "ID": "id",
-            "ФИО (Edit)": "name",
-            "Логин": "username",
-            "Пароль": "password",
-            "Роль (Edit)": "role",
-        }
-        self.users = database.get_all_users_as_dicts()
-        self.tableModel = CustomStandardItemModel(
-            len(self.users), len(self.header_map))
-        self.tableModel.setHorizontalHeaderLabels(self.header_map.keys())
+        self.tableModel = UsersTableModel()
         self.tableView.setModel(self.tableModel)
         self.tableView.horizontalHeader().setStretchLastSection(True)
 
         self.custom_delegate = CustomDelegate()
         self.tableView.setItemDelegate(self.custom_delegate)
 
-        for row, user in enumerate(self.users):
-            for col, field in enumerate(self.header_map.values()):
-                item = QStandardItem(str(user.get(field, "")))
-                if field in ["name", "role"]:
-                    item.setFlags(item.flags() | Qt.ItemIsEditable)
-                self.tableModel.setItem(row, col, item)
-
         self.addButton = QPushButton("Добавить пользователя", self)
         self.addButton.clicked.connect(self.add_user)
         self.layout.addWidget(self.addButton)
 
+        self.importButton = QPushButton("Импорт из файла", self)
+        self.importButton.clicked.connect(self.import_users)
+        self.layout.addWidget(self.importButton)
+
+        self.importProgress = QProgressBar(self)
+        self.importProgress.setRange(0, 1000)
+        self.importProgress.hide()
+        self.layout.addWidget(self.importProgress)
+
         self.deleteButton = QPushButton("Удалить пользователя", self)
         self.deleteButton.clicked.connect(self.delete_user)
         self.layout.addWidget(self.deleteButton)
@@ -189,19 +209,89 @@ class UsersPage(QWidget):
         self.refreshButton.clicked.connect(self.refresh_table)
         self.layout.addWidget(self.refreshButton)
 
+        bind_loading(self.tableModel.loader, self.refreshButton)
+        self.changes = ChangeSync(self, ("users",), self.tableModel.reset,
+                                  self.fetchChanges, self.applyChanges,
+                                  busy=self.tableModel.loader.isLoading)
+        event_bus.subscribe(self, (events.UsersChanged,), self.onUsersChanged)
+        self.refresh_table()
+
+    @staticmethod
+    def fetchChanges(changes):
+        return UsersPage.fetchRows(row_ids(changes, "users"))
+
+    @staticmethod
+    def fetchRows(user_ids):
+        return user_ids, database.get_users_by_ids(user_ids)
+
+    def onUsersChanged(self, event):
+        self.changes.patch(self.fetchRows, event.user_ids)
+
+    def applyChanges(self, rows):
+        self.tableModel.patchRows(*rows)
+
     def add_user(self):
         dialog = AddUserDialog(self)
         if dialog.exec_() == QDialog.Accepted:
             user_data = dialog.get_inputs()
-            if user_data["username"] in [user["username"] for user in self.users]:
-                QMessageBox.warning(
-                    self,
-                    "Имя пользователя существует",
-                    "Пользователь с таким именем пользователя уже существует.",
-                )
-            else:
-                database.add_user(**user_data)
-                self.refresh_table()
+            run_async(database.check_existing_user, user_data["username"],
+                      on_result=lambda exists: self.saveNewUser(user_data, exists))
+
+    def saveNewUser(self, user_data, exists):
+        if exists:
+            QMessageBox.warning(
+                self,
+                "Имя пользователя существует",
+                "Пользователь с таким именем пользователя уже существует.",
+            )
+        else:
+            run_async(database.add_user, **user_data)
+
+    @profiled_action
+    def import_users(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Импорт пользователей", "", "Таблицы (*.csv *.xlsx)")
+        if not path:
+            return
+        self.importConflicts = []
+        self.importReport = None
+        self.importButton.setEnabled(False)
+        self.importProgress.setValue(0)
+        self.importProgress.show()
+        run_stream(importer.iter_import, path,
+                   on_chunk=self.onImportProgress,
+                   on_result=lambda _: self.onImportFinished(),
+                   on_error=self.onImportFailed)
+
+    def onImportProgress(self, report):
+        self.importReport = report
+        self.importConflicts.extend(report["conflicts"])
+        self.importProgress.setValue(int(report["progress"] * 1000))
+        self.importProgress.setFormat(f"Обработано строк: {report['rows']}")
+
+    def onImportFinished(self):
+        self.importButton.setEnabled(True)
+        self.importProgress.hide()
+        report = self.importReport
+        seconds = max(report["seconds"], 0.001)
+        message = QMessageBox(self)
+        message.setWindowTitle("Импорт завершен")
+        message.setText(
+            f"Строк: {report['rows']}, добавлено: {report['inserted']}, "
+            f"обновлено: {report['updated']}, конфликтов: {len(self.importConflicts)}\n"
+            f"Время: {seconds:.1f} с ({report['rows'] / seconds:.0f} строк/с)")
+        if self.importConflicts:
+            message.setDetailedText("\n".join(
+                f"Строка {conflict['line']} ({conflict['username']}): {conflict['reason']}"
+                for conflict in self.importConflicts))
+        message.exec_()
+        self.refresh_table()
+
+    def onImportFailed(self, error):
+        self.importButton.setEnabled(True)
+        self.importProgress.hide()
+        QMessageBox.warning(self, "Ошибка импорта", str(error))
+        self.refresh_table()
 
     def delete_user(self):
         selected_indexes = self.tableView.selectionModel().selectedRows()
@@ -217,8 +307,7 @@ class UsersPage(QWidget):
                 QMessageBox.Yes | QMessageBox.No,
             )
             if reply == QMessageBox.Yes:
-                database.delete_user(username)
-                self.refresh_table()
+                run_async(database.delete_user, username)
         else:
             QMessageBox.warning(
                 self,
@@ -226,10 +315,6 @@ class UsersPage(QWidget):
                 "Пожалуйста, выберите пользователя для удаления.",
             )
 
+    @profiled_action
     def refresh_table(self):
-        self.users = database.get_all_users_as_dicts()
-        self.tableModel.setRowCount(len(self.users))
-        for row, user in enumerate(self.users):
-            for col, field in enumerate(self.header_map.values()):
-                item = QStandardItem(str(user.get(field, "")))
-                self.tableModel.setItem(row, col, item)
+        self.changes.reload()
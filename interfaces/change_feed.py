@@ -0,0 +1,108 @@
+# interfaces\change_feed.py
+
+from PyQt5.QtCore import QEvent, QObject, QTimer, pyqtSignal
+
+import database
+from .db_worker import AsyncLoader, run_async
+
+POLL_MS = 1000
+
+_feed = None
+
+
+class ChangeFeed(QObject):
+    # Polls PRAGMA data_version on the GUI thread's connection, which costs
+    # no I/O, and emits changed when another connection (a worker thread or
+    # another machine) has committed since the last poll.
+    changed = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Taken before any page reads its cursor, so no commit falls between.
+        self.version = database.get_data_version()
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.poll)
+        self.timer.start(POLL_MS)
+
+    def poll(self):
+        version = database.get_data_version()
+        if version != self.version:
+            self.version = version
+            self.changed.emit()
+
+
+def feed():
+    global _feed
+    if _feed is None:
+        _feed = ChangeFeed()
+    return _feed
+
+
+class ChangeSync(QObject):
+    # Keeps one page in step with change_log. reload() takes the change
+    # cursor and then runs the page's full load; afterwards, whenever the
+    # feed ticks or the page is shown, the changes to `tables` since the
+    # cursor are read and fetch(changes) turns them into page rows on the
+    # worker thread, which apply() patches in on the GUI thread. busy() is
+    # true while the page's own load is running and patches would race it.
+    def __init__(self, page, tables, load, fetch, apply, busy=None):
+        super().__init__(page)
+        self.page = page
+        self.tables = tables
+        self.load = load
+        self.fetch = fetch
+        self.apply = apply
+        self.busy = busy or (lambda: False)
+        self.cursor = None
+        self.loader = AsyncLoader(self)
+        feed().changed.connect(self.sync)
+        page.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if obj is self.page and event.type() == QEvent.Show:
+            self.sync()
+        return False
+
+    def reload(self):
+        # The cursor is read before the data, so a change committed in
+        # between is applied again on top of the fresh rows, never lost.
+        self.cursor = None
+        self.loader.load(database.get_change_cursor, on_result=self.onCursor)
+
+    def onCursor(self, cursor):
+        self.cursor = cursor
+        self.load()
+
+    def sync(self):
+        if (self.cursor is None or not self.page.isVisible()
+                or self.loader.isLoading() or self.busy()):
+            return
+        self.loader.load(self.readChanges, self.cursor, self.tables, self.fetch,
+                         on_result=self.onChanges)
+
+    def patch(self, fetch, *args):
+        # Applies fetch(*args) for rows an in-process event named, without
+        # waiting for the next poll. Skipped during a reload: its cursor
+        # predates the event, so the next sync picks the change up anyway.
+        if self.cursor is None or self.busy():
+            return
+        run_async(fetch, *args, on_result=self.apply)
+
+    @staticmethod
+    def readChanges(cursor, tables, fetch):
+        result = database.get_changes(cursor, tables)
+        if not result["reset"] and result["changes"]:
+            result["rows"] = fetch(result["changes"])
+        return result
+
+    def onChanges(self, result):
+        if result["reset"]:
+            self.reload()
+            return
+        self.cursor = result["cursor"]
+        if result["changes"]:
+            self.apply(result["rows"])
+
+
+def row_ids(changes, *tables):
+    return {change["row_id"] for change in changes if change["table"] in tables}
@@ -0,0 +1,175 @@
+# interfaces\db_worker.py
+
+import sqlite3
+import threading
+import traceback
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+import connection
+from . import action_profiler
+
+# Tasks are kept alive here until they finish; Qt only holds the C++ side.
+_running = set()
+_running_lock = threading.Lock()
+
+
+class _TaskSignals(QObject):
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(object)
+    chunk = pyqtSignal(object)
+
+
+class DbTask(QRunnable):
+    def __init__(self, fn, args, kwargs, stream=False):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.stream = stream
+        self.signals = _TaskSignals()
+        self.cancelled = False
+        self._lock = threading.Lock()
+        self._connection = None
+        # Tasks started by a profiled action are profiled with it.
+        self.session = action_profiler.current()
+        if self.session is not None:
+            self.session.task_started()
+
+    def cancel(self):
+        with self._lock:
+            self.cancelled = True
+            # Abort a statement that is still running on the worker thread.
+            if self._connection is not None:
+                self._connection.interrupt()
+
+    def run(self):
+        if self.session is not None:
+            self.session.run_task(self._run)
+        else:
+            self._run()
+
+    def _run(self):
+        try:
+            if self.cancelled:
+                return
+            with self._lock:
+                self._connection = connection.get_connection()
+            try:
+                if self.stream:
+                    chunks = self.fn(*self.args, **self.kwargs)
+                    try:
+                        for chunk in chunks:
+                            if self.cancelled:
+                                return
+                            self.signals.chunk.emit(chunk)
+                    finally:
+                        chunks.close()
+                    result = None
+                else:
+                    result = self.fn(*self.args, **self.kwargs)
+            except sqlite3.OperationalError as error:
+                if not self.cancelled:
+                    self.signals.failed.emit(error)
+                return
+            except Exception as error:
+                self.signals.failed.emit(error)
+                return
+            finally:
+                with self._lock:
+                    self._connection = None
+            if not self.cancelled:
+                self.signals.finished.emit(result)
+        finally:
+            with _running_lock:
+                _running.discard(self)
+
+
+def report_error(error):
+    traceback.print_exception(type(error), error, error.__traceback__)
+
+
+def _start(task, on_result, on_error, on_chunk):
+    on_result = action_profiler.bind(on_result)
+    on_error = action_profiler.bind(on_error)
+    on_chunk = action_profiler.bind(on_chunk)
+    if on_result is not None:
+        task.signals.finished.connect(on_result)
+    task.signals.failed.connect(on_error or report_error)
+    if on_chunk is not None:
+        task.signals.chunk.connect(on_chunk)
+    with _running_lock:
+        _running.add(task)
+    QThreadPool.globalInstance().start(task)
+    return task
+
+
+def run_async(fn, *args, on_result=None, on_error=None, **kwargs):
+    return _start(DbTask(fn, args, kwargs), on_result, on_error, None)
+
+
+def run_stream(fn, *args, on_chunk=None, on_result=None, on_error=None, **kwargs):
+    return _start(DbTask(fn, args, kwargs, stream=True), on_result, on_error, on_chunk)
+
+
+def wait_for_done():
+    QThreadPool.globalInstance().waitForDone()
+
+
+class AsyncLoader(QObject):
+    # Runs one read at a time for a page; starting a new one cancels the
+    # previous request so a superseded refresh never overwrites newer data.
+    loadingChanged = pyqtSignal(bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.current = None
+
+    def load(self, fn, *args, on_result=None, on_error=None, on_chunk=None,
+             stream=False, **kwargs):
+        self.cancel()
+        on_result = action_profiler.bind(on_result)
+        on_error = action_profiler.bind(on_error)
+        on_chunk = action_profiler.bind(on_chunk)
+        task = DbTask(fn, args, kwargs, stream=stream)
+        self.current = task
+        task.signals.finished.connect(
+            lambda result, task=task: self._finish(task, on_result, result))
+        task.signals.failed.connect(
+            lambda error, task=task: self._finish(task, on_error or report_error, error))
+        if on_chunk is not None:
+            task.signals.chunk.connect(
+                lambda chunk, task=task: task is self.current and on_chunk(chunk))
+        self.loadingChanged.emit(True)
+        with _running_lock:
+            _running.add(task)
+        QThreadPool.globalInstance().start(task)
+        return task
+
+    def cancel(self):
+        if self.current is not None:
+            self.current.cancel()
+            self.current = None
+            self.loadingChanged.emit(False)
+
+    def isLoading(self):
+        return self.current is not None
+
+    def _finish(self, task, callback, value):
+        if task is not self.current:
+            return
+        self.current = None
+        self.loadingChanged.emit(False)
+        if callback is not None:
+            callback(value)
+
+
+def bind_loading(loader, button, loading_text="Загрузка..."):
+    idle_text = button.text()
+
+    def update(loading):
+        button.setEnabled(not loading)
+        button.setText(loading_text if loading else idle_text)
+
+    loader.loadingChanged.connect(update)
@@ -0,0 +1,34 @@
+# interfaces\event_bus.py
+
+from PyQt5 import sip
+from PyQt5.QtCore import QObject, pyqtSignal
+
+import events
+
+_relay = None
+
+
+class _Relay(QObject):
+    # Lives on the GUI thread; events published by db_worker tasks reach
+    # their callbacks through a queued signal.
+    delivered = pyqtSignal(object, object)
+
+    def __init__(self):
+        super().__init__()
+        self.delivered.connect(lambda callback, event: callback(event))
+
+
+def subscribe(owner, event_types, callback):
+    # callback runs on the GUI thread until owner is destroyed.
+    global _relay
+    if _relay is None:
+        _relay = _Relay()
+        events.set_delivery(_relay.delivered.emit)
+
+    def deliver(event):
+        if not sip.isdeleted(owner):
+            callback(event)
+
+    for event_type in event_types:
+        events.subscribe(event_type, deliver)
+    owner.destroyed.connect(lambda: events.unsubscribe(deliver))
@@ -0,0 +1,179 @@
+# interfaces\gradebook_page.py
+
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableView, QHeaderView,
+                             QAbstractItemView, QComboBox, QLabel, QPushButton)
+from PyQt5.QtCore import Qt, QModelIndex, QAbstractTableModel
+import database
+from .db_worker import AsyncLoader, bind_loading
+from .action_profiler import profiled_action
+
+
+class GradebookModel(QAbstractTableModel):
+    MODES = {
+        "Лучший": "best_score",
+        "Последний": "last_score",
+        "Средний": "average_score",
+    }
+
+    def __init__(self):
+        super().__init__()
+        self.students = []
+        self.tests = []
+        self.student_rows = {}
+        self.test_columns = {}
+        self.cells = {}
+        self.mode = "best_score"
+
+    def setAxes(self, students, tests):
+        self.beginResetModel()
+        self.students = students
+        self.tests = tests
+        self.student_rows = {student["id"]: row for row,
+                             student in enumerate(students)}
+        self.test_columns = {test["id"]: column for column,
+                             test in enumerate(tests)}
+        self.cells = {}
+        self.endResetModel()
+
+    def addCells(self, cells):
+        rows = []
+        columns = []
+        for cell in cells:
+            row = self.student_rows.get(cell["student_id"])
+            column = self.test_columns.get(cell["test_id"])
+            if row is None or column is None:
+                continue
+            self.cells[(row, column)] = cell
+            rows.append(row)
+            columns.append(column)
+        if rows:
+            self.dataChanged.emit(self.index(min(rows), min(columns)),
+                                  self.index(max(rows), max(columns)))
+
+    def setMode(self, mode):
+        self.mode = mode
+        if self.students and self.tests:
+            self.dataChanged.emit(self.index(0, 0),
+                                  self.index(len(self.students) - 1, len(self.tests) - 1))
+
+    def rowCount(self, parent=QModelIndex()):
+        return len(self.students)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.tests)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        cell = self.cells.get((index.row(), index.column()))
+        if role == Qt.DisplayRole:
+            if cell is None:
+                return ""
+            score = cell[self.mode]
+            if isinstance(score, float):
+                score = f"{score:.1f}"
+            return f"{score}/{cell['max_score']}"
+        elif role == Qt.ToolTipRole and cell is not None:
+            return (f"Попыток: {cell['attempts']}\n"
+                    f"Лучший: {cell['best_score']}/{cell['max_score']}\n"
+                    f"Последний: {cell['last_score']}/{cell['max_score']}\n"
+                    f"Средний: {cell['average_score']:.1f}/{cell['max_score']}")
+        elif role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            if orientation == Qt.Horizontal:
+                return self.tests[section]["name"]
+            elif orientation == Qt.Vertical:
+                return self.students[section]["name"]
+        return None
+
+
+class GradebookPage(QWidget):
+    def __init__(self, main_window):
+        super().__init__()
+        self.main_window = main_window
+        self.initUI()
+
+    def initUI(self):
+        self.layout = QVBoxLayout(self)
+
+        filters_layout = QHBoxLayout()
+        self.groupComboBox = QComboBox(self)
+        self.testComboBox = QComboBox(self)
+        self.modeComboBox = QComboBox(self)
+        self.modeComboBox.addItems(GradebookModel.MODES.keys())
+        self.modeComboBox.currentTextChanged.connect(self.onModeChanged)
+
+        filters_layout.addWidget(QLabel("Группа:"))
+        filters_layout.addWidget(self.groupComboBox)
+        filters_layout.addWidget(QLabel("Тест:"))
+        filters_layout.addWidget(self.testComboBox)
+        filters_layout.addWidget(QLabel("Результат:"))
+        filters_layout.addWidget(self.modeComboBox)
+        self.layout.addLayout(filters_layout)
+
+        self.gradebookModel = GradebookModel()
+        self.gradebookView = QTableView(self)
+        self.gradebookView.setModel(self.gradebookModel)
+        self.gradebookView.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.gradebookView.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.layout.addWidget(self.gradebookView)
+
+        self.refreshButton = QPushButton("Обновить данные", self)
+        self.refreshButton.clicked.connect(self.refresh_data)
+        self.layout.addWidget(self.refreshButton)
+
+        self.filtersLoader = AsyncLoader(self)
+        self.loader = AsyncLoader(self)
+        bind_loading(self.loader, self.refreshButton)
+        self.filtersLoader.load(self.fetchFilters, on_result=self.loadFilters)
+
+    def creatorFilter(self):
+        if self.main_window.user_role == "TEACHER":
+            return self.main_window.user_id
+        return None
+
+    def fetchFilters(self):
+        _, tests = database.get_gradebook_axes(creator_id=self.creatorFilter())
+        return database.get_all_groups(), tests
+
+    def loadFilters(self, filters):
+        groups, tests = filters
+        self.groupComboBox.addItem("Все", None)
+        for group in groups:
+            self.groupComboBox.addItem(group["name"], group["id"])
+
+        self.testComboBox.addItem("Все", None)
+        for test in tests:
+            self.testComboBox.addItem(test["name"], test["id"])
+
+        self.groupComboBox.currentIndexChanged.connect(self.refresh_data)
+        self.testComboBox.currentIndexChanged.connect(self.refresh_data)
+        self.refresh_data()
+
+    @profiled_action
+    def refresh_data(self):
+        filters = {
+            "group_id": self.groupComboBox.currentData(),
+            "test_id": self.testComboBox.currentData(),
+            "creator_id": self.creatorFilter(),
+        }
+        self.loader.load(self.streamGradebook, filters, stream=True,
+                         on_chunk=self.onGradebookChunk)
+
+    @staticmethod
+    def streamGradebook(filters):
+        yield database.get_gradebook_axes(**filters)
+        yield from database.iter_gradebook_cells(**filters)
+
+    def onGradebookChunk(self, chunk):
+        if isinstance(chunk, tuple):
+            self.gradebookModel.setAxes(*chunk)
+        else:
+            self.gradebookModel.addCells(chunk)
+
+    def onModeChanged(self, mode_name):
+        self.gradebookModel.setMode(GradebookModel.MODES[mode_name])
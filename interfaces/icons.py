@@ -0,0 +1,44 @@
+# interfaces\icons.py
+
+from PyQt5.QtCore import QFile, QIODevice
+from PyQt5.QtGui import QIcon, QPixmap, QPixmapCache
+
+# Registers the compiled resources under ":/". Rebuild it after changing
+# resources/: pyrcc5 resources/resources.qrc -o resources_rc.py
+import resources_rc  # noqa: F401
+
+ICONS = {
+    "assign": ":/icons/assign.png",
+    "close": ":/icons/close.png",
+    "eye": ":/icons/eye-icon.png",
+}
+
+_icons = {}
+
+
+def icon(name):
+    cached = _icons.get(name)
+    if cached is None:
+        cached = _icons[name] = QIcon(ICONS[name])
+    return cached
+
+
+def pixmap(name, size):
+    # Delegates paint these for every visible cell; the PNG is decoded and
+    # scaled once per size and then served from QPixmapCache.
+    key = f"icon:{name}:{size}"
+    cached = QPixmapCache.find(key)
+    if cached is None or cached.isNull():
+        cached = icon(name).pixmap(size, size)
+        QPixmapCache.insert(key, cached)
+    return cached
+
+
+def stylesheet(name):
+    style_file = QFile(f":/styles/{name}")
+    if not style_file.open(QIODevice.ReadOnly | QIODevice.Text):
+        return ""
+    try:
+        return bytes(style_file.readAll()).decode("utf-8")
+    finally:
+        style_file.close()
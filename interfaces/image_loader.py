@@ -0,0 +1,68 @@
+# interfaces\image_loader.py
+
+import hashlib
+
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice, QSize, Qt
+from PyQt5.QtGui import QImageReader
+
+import database
+
+# Thumbnails are stored at the size of the question image labels.
+THUMBNAIL_SIZE = 200
+
+# QImage can be built on any thread; only the QPixmap conversion has to
+# happen on the GUI thread, so these run on the db_worker pool.
+
+
+def _bounded(size, bound):
+    if size.width() <= bound and size.height() <= bound:
+        return size
+    return size.scaled(QSize(bound, bound), Qt.KeepAspectRatio)
+
+
+def _read(reader, bound):
+    size = reader.size()
+    if size.isValid():
+        # Scaled reads let decoders such as JPEG skip most of the work.
+        reader.setScaledSize(_bounded(size, bound))
+    image = reader.read()
+    if image.isNull():
+        raise ValueError(f"Не удалось прочитать изображение: {reader.errorString()}")
+    return image
+
+
+def read_image_file(path):
+    with open(path, "rb") as image_file:
+        data = image_file.read()
+    reader = QImageReader(path)
+    size = reader.size()
+    thumbnail = _read(reader, THUMBNAIL_SIZE)
+
+    buffer = QBuffer()
+    buffer.open(QIODevice.WriteOnly)
+    thumbnail.save(buffer, "PNG" if thumbnail.hasAlphaChannel() else "JPG")
+    return {
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "width": size.width() if size.isValid() else thumbnail.width(),
+        "height": size.height() if size.isValid() else thumbnail.height(),
+        "data": data,
+        "thumbnail": bytes(buffer.data()),
+        "preview": thumbnail,
+    }
+
+
+def decode_image(data, bound=THUMBNAIL_SIZE):
+    buffer = QBuffer()
+    buffer.setData(QByteArray(data))
+    buffer.open(QIODevice.ReadOnly)
+    return _read(QImageReader(buffer), bound)
+
+
+def load_thumbnails(image_ids):
+    thumbnails = database.get_image_thumbnails(image_ids)
+    return {image_id: decode_image(data) for image_id, data in thumbnails.items()}
+
+
+def question_image_ids(questions):
+    return sorted({question["image_id"] for question in questions
+                   if question.get("image_id") is not None})
@@ -4,6 +4,8 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdi
                              QFormLayout, QFrame, QMessageBox, QStackedWidget, QSpacerItem, QSizePolicy)
 from PyQt5.QtCore import Qt
 import database
+from .db_worker import run_async
+from . import timing
 
 
 class LoginWindow(QWidget):
@@ -57,12 +59,12 @@ class LoginWindow(QWidget):
         form_layout.addRow("Логин", self.username_input)
         form_layout.addRow("Пароль", self.password_input)
 
-        login_button = QPushButton("Войти")
-        login_button.clicked.connect(self.login)
+        self.login_button = QPushButton("Войти")
+        self.login_button.clicked.connect(self.login)
 
         layout = QVBoxLayout()
         layout.addLayout(form_layout)
-        layout.addWidget(login_button)
+        layout.addWidget(self.login_button)
 
         frame = QFrame()
         frame.setLayout(layout)
@@ -103,7 +105,17 @@ class LoginWindow(QWidget):
     def login(self):
         username = self.username_input.text()
         password = self.password_input.text()
-        user_info = database.authenticate_user(username, password)
+        self.login_button.setEnabled(False)
+        timing.start(timing.LOGIN_TO_FIRST_PAINT)
+        run_async(database.authenticate_user, username, password,
+                  on_result=self.onAuthenticated, on_error=self.onLoginFailed)
+
+    def onLoginFailed(self, error):
+        self.login_button.setEnabled(True)
+        QMessageBox.warning(self, "Ошибка", f"Не удалось выполнить вход: {error}")
+
+    def onAuthenticated(self, user_info):
+        self.login_button.setEnabled(True)
         if user_info:
             user_id, role = user_info
             self.main_window.logged_in_user_id = user_id
@@ -112,16 +124,18 @@ class LoginWindow(QWidget):
 
             if role == "ADMIN":
                 self.main_window.initAdminWindow()
-                self.main_window.central_widget.setCurrentWidget(
-                    self.main_window.admin_window)
+                role_window = self.main_window.admin_window
             elif role == "TEACHER":
                 self.main_window.initTeacherWindow()
-                self.main_window.central_widget.setCurrentWidget(
-                    self.main_window.teacher_window)
+                role_window = self.main_window.teacher_window
             elif role == "STUDENT":
                 self.main_window.initStudentWindow()
-                self.main_window.central_widget.setCurrentWidget(
-                    self.main_window.student_window)
+                role_window = self.main_window.student_window
+            else:
+                return
+            timing.stop_on_first_paint(
+                role_window.stack.currentWidget(), timing.LOGIN_TO_FIRST_PAINT)
+            self.main_window.central_widget.setCurrentWidget(role_window)
         else:
             QMessageBox.warning(self, "Ошибка", "Неверный логин или пароль")
 
@@ -140,11 +154,23 @@ class LoginWindow(QWidget):
             QMessageBox.warning(self, "Ошибка", "Пароли не совпадают")
             return
 
+        run_async(self.registerStudent, name, username, password,
+                  on_result=self.onRegistered,
+                  on_error=lambda error: QMessageBox.warning(
+                      self, "Ошибка", f"Не удалось зарегистрироваться: {error}"))
+
+    @staticmethod
+    def registerStudent(name, username, password):
         if database.check_existing_user(username):
+            return False
+        database.add_user(name, username, password, "STUDENT")
+        return True
+
+    def onRegistered(self, registered):
+        if not registered:
             QMessageBox.warning(
                 self, "Ошибка", "Пользователь с таким логином уже существует")
             return
 
-        database.add_user(name, username, password, "STUDENT")
         QMessageBox.information(self, "Успех", "Регистрация прошла успешно")
         self.switchToLogin()
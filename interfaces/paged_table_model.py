@@ -0,0 +1,102 @@
+# interfaces\paged_table_model.py
+
+from bisect import bisect_left
+
+from PyQt5.QtCore import Qt, QModelIndex, QAbstractTableModel
+from .db_worker import AsyncLoader
+
+
+class PagedTableModel(QAbstractTableModel):
+    # Rows are fetched lazily with keyset pagination: fetch_page(after_key,
+    # limit) must return dicts ordered by key_field, starting after after_key.
+    PAGE_SIZE = 200
+
+    columns = []
+
+    def __init__(self, fetch_page, key_field="id"):
+        super().__init__()
+        self.fetch_page = fetch_page
+        self.key_field = key_field
+        self.rows = []
+        self.exhausted = False
+        self.loader = AsyncLoader(self)
+
+    def reset(self):
+        self.loader.cancel()
+        self.beginResetModel()
+        self.rows = []
+        self.exhausted = False
+        self.endResetModel()
+        self.fetchMore()
+
+    def rowData(self, row):
+        return self.rows[row]
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self.exhausted and not self.loader.isLoading()
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        after_key = self.rows[-1][self.key_field] if self.rows else None
+        self.loader.load(self.fetch_page, after_key, self.PAGE_SIZE,
+                         on_result=self.appendPage)
+
+    def appendPage(self, page):
+        if len(page) < self.PAGE_SIZE:
+            self.exhausted = True
+        if page:
+            first = len(self.rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+            self.rows.extend(page)
+            self.endInsertRows()
+
+    def patchRows(self, keys, rows):
+        # Applies a change feed batch: rows holds the current version of the
+        # keys that still exist, the other keys are removed. Keys past the
+        # loaded range are left to fetchMore.
+        found = {row[self.key_field]: row for row in rows}
+        loaded = [row[self.key_field] for row in self.rows]
+        last = loaded[-1] if loaded else None
+        for key in sorted(keys):
+            position = bisect_left(loaded, key)
+            present = position < len(loaded) and loaded[position] == key
+            row = found.get(key)
+            if row is None:
+                if present:
+                    self.beginRemoveRows(QModelIndex(), position, position)
+                    del self.rows[position]
+                    del loaded[position]
+                    self.endRemoveRows()
+            elif present:
+                self.rows[position] = row
+                self.dataChanged.emit(self.index(position, 0),
+                                      self.index(position, len(self.columns) - 1))
+            elif self.exhausted or (last is not None and key < last):
+                self.beginInsertRows(QModelIndex(), position, position)
+                self.rows.insert(position, row)
+                loaded.insert(position, key)
+                self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole or role == Qt.EditRole:
+            return self.rows[index.row()].get(self.columns[index.column()][1])
+        elif role == Qt.UserRole:
+            return self.rows[index.row()][self.key_field]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            if orientation == Qt.Horizontal:
+                return self.columns[section][0]
+            elif orientation == Qt.Vertical:
+                return str(section + 1)
+        return None
@@ -1,9 +1,21 @@
 # interfaces\reports_page.py
 
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTableView, QHeaderView, QAbstractItemView, QPushButton, QTableWidget, QTableWidgetItem
+import os
+import re
+
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableView, QHeaderView,
+                             QAbstractItemView, QPushButton, QTableWidget, QTableWidgetItem,
+                             QComboBox, QFileDialog, QProgressBar, QMessageBox)
 from PyQt5.QtCore import Qt, QModelIndex
 from PyQt5.QtGui import QStandardItemModel, QStandardItem, QColor
 import database
+import events
+import exporter
+from .paged_table_model import PagedTableModel
+from .db_worker import AsyncLoader, bind_loading, run_stream
+from .action_profiler import profiled_action
+from .change_feed import ChangeSync, row_ids
+from . import event_bus
 
 
 class TestAttemptDetailsWindow(QWidget):
@@ -24,12 +36,14 @@ class TestAttemptDetailsWindow(QWidget):
         self.questionsTable.horizontalHeader().setStretchLastSection(True)
         self.layout.addWidget(self.questionsTable)
 
+        self.loader = AsyncLoader(self)
         self.loadAttemptDetails()
 
     def loadAttemptDetails(self):
-        attempt_details = database.get_attempt_details(
-            self.student_id, self.test_id, self.attempt_id)
+        self.loader.load(database.get_attempt_details, self.student_id,
+                         self.test_id, self.attempt_id, on_result=self.showAttemptDetails)
 
+    def showAttemptDetails(self, attempt_details):
         self.questionsTable.setRowCount(len(attempt_details))
         for row, (question, student_answer, correct_answer) in enumerate(attempt_details):
             question_item = QTableWidgetItem(question)
@@ -91,57 +105,165 @@ class ReportsWindow(QWidget):
         self.updateButton.clicked.connect(self.populateStudentsList)
         self.layout.addWidget(self.updateButton)
 
+        if self.main_window.user_role != "STUDENT":
+            self.initExport()
+
+        self.testsLoader = AsyncLoader(self)
+        self.attemptsLoader = AsyncLoader(self)
+        bind_loading(self.studentsModel.loader, self.updateButton)
+        self.changes = ChangeSync(self, ("users", "test_results"), self.studentsModel.reset,
+                                  self.fetchChanges, self.applyChanges,
+                                  busy=self.studentsModel.loader.isLoading)
+        event_bus.subscribe(self, (events.UsersChanged,), self.onUsersChanged)
+        event_bus.subscribe(self, (events.TestResultRecorded,), self.onTestResultRecorded)
+
         self.populateStudentsList()
 
+    def initExport(self):
+        exportLayout = QHBoxLayout()
+        self.exportKindComboBox = QComboBox()
+        for kind, title in exporter.KINDS.items():
+            self.exportKindComboBox.addItem(title, kind)
+        exportLayout.addWidget(self.exportKindComboBox)
+
+        self.exportButton = QPushButton("Экспорт результатов")
+        self.exportButton.clicked.connect(self.exportResults)
+        exportLayout.addWidget(self.exportButton, 1)
+        self.layout.addLayout(exportLayout)
+
+        self.exportProgress = QProgressBar(self)
+        self.exportProgress.setRange(0, 1000)
+        self.exportProgress.hide()
+        self.layout.addWidget(self.exportProgress)
+
+    def creatorFilter(self):
+        if self.main_window.user_role == "TEACHER":
+            return self.main_window.user_id
+        return None
+
+    @profiled_action
+    def exportResults(self):
+        path, selected = QFileDialog.getSaveFileName(
+            self, "Экспорт результатов", "", exporter.FILE_FILTERS)
+        if not path:
+            return
+        if os.path.splitext(path)[1].lower() not in exporter.WRITERS:
+            path += re.search(r"\*(\.\w+)", selected).group(1)
+        self.exportPath = path
+        self.exportReport = None
+        self.exportButton.setEnabled(False)
+        self.exportProgress.setValue(0)
+        self.exportProgress.show()
+        run_stream(exporter.iter_export, path, self.exportKindComboBox.currentData(),
+                   creator_id=self.creatorFilter(),
+                   on_chunk=self.onExportProgress,
+                   on_result=lambda _: self.onExportFinished(),
+                   on_error=self.onExportFailed)
+
+    def onExportProgress(self, report):
+        self.exportReport = report
+        self.exportProgress.setValue(int(report["progress"] * 1000))
+        self.exportProgress.setFormat(f"Выгружено строк: {report['rows']} из {report['total']}")
+
+    def onExportFinished(self):
+        self.exportButton.setEnabled(True)
+        self.exportProgress.hide()
+        report = self.exportReport
+        seconds = max(report["seconds"], 0.001)
+        QMessageBox.information(
+            self, "Экспорт завершен",
+            f"Строк: {report['rows']}, файл: {self.exportPath}\n"
+            f"Время: {seconds:.1f} с ({report['rows'] / seconds:.0f} строк/с)")
+
+    def onExportFailed(self, error):
+        self.exportButton.setEnabled(True)
+        self.exportProgress.hide()
+        QMessageBox.warning(self, "Ошибка экспорта", str(error))
+
+    @staticmethod
+    def fetchChanges(changes):
+        return ReportsWindow.fetchRows(row_ids(changes, "users"), row_ids(changes, "test_results"))
+
+    @staticmethod
+    def fetchRows(student_ids, tested_ids=()):
+        return student_ids, database.get_students_by_ids(student_ids), tested_ids
+
+    def applyChanges(self, rows):
+        student_ids, students, tested_ids = rows
+        self.studentsModel.patchRows(student_ids, students)
+        for student_id in tested_ids:
+            self.showNewAttempt(student_id)
+
+    def onUsersChanged(self, event):
+        self.changes.patch(self.fetchRows, event.user_ids)
+
+    def onTestResultRecorded(self, event):
+        self.showNewAttempt(event.student_id, event.test_id)
+
+    def showNewAttempt(self, student_id, test_id=None):
+        # Only the student whose tests are on screen needs updating: a first
+        # attempt at a test adds it to the list, a later one to the attempts.
+        if self.studentsListView.currentIndex().data(Qt.UserRole) != student_id:
+            return
+        known = {test["id"] for test in self.testsTableModel.testData}
+        if test_id is None or test_id not in known:
+            self.loadStudentTests(student_id)
+        elif getattr(self, "selected_test_id", None) == test_id:
+            self.updateTestAttempts(student_id, test_id)
+
+    @profiled_action
     def onViewDetails(self):
         selected_attempt_index = self.studentAttemptsTableView.currentIndex()
         if not selected_attempt_index.isValid():
             return
 
         attempt_id = self.studentAttemptsTableModel.data(
-            selected_attempt_index, Qt.UserRole)
+            selected_attempt_index.sibling(selected_attempt_index.row(), 0), Qt.UserRole)
 
         self.detailsWindow = TestAttemptDetailsWindow(
             self.selected_student_id, self.selected_test_id, attempt_id)
         self.detailsWindow.show()
 
+    @profiled_action
     def populateStudentsList(self):
-        students = database.get_all_students()
-        self.studentsModel.setStudents(students)
+        self.testsLoader.cancel()
+        self.attemptsLoader.cancel()
+        self.changes.reload()
 
+    @profiled_action
     def onStudentSelected(self, index: QModelIndex):
         student_id = self.studentsModel.data(index, Qt.UserRole)
         self.studentAttemptsTableModel.clear()
         self.loadStudentTests(student_id)
 
     def loadStudentTests(self, student_id):
-        tests = database.get_tests_by_student(student_id)
-        self.testsTableModel.setTests(tests)
+        self.attemptsLoader.cancel()
+        self.testsLoader.load(database.get_tests_by_student, student_id,
+                              on_result=self.testsTableModel.setTests)
 
+    @profiled_action
     def onTestSelected(self, index: QModelIndex):
         test_id = self.testsTableModel.testId(index)
         student_id = self.studentsListView.currentIndex().data(Qt.UserRole)
+        self.selected_student_id = student_id
+        self.selected_test_id = test_id
         self.updateTestAttempts(student_id, test_id)
 
     def updateTestAttempts(self, student_id, test_id):
-        attempts_data = database.get_student_test_attempt_results(
-            student_id, test_id)
+        self.attemptsLoader.load(database.get_student_test_attempt_results,
+                                 student_id, test_id, on_result=self.showTestAttempts)
+
+    def showTestAttempts(self, attempts_data):
         self.studentAttemptsTableModel.clear()
         self.studentAttemptsTableModel.setHorizontalHeaderLabels(
-            ['Номер попытки', 'Результат'])
-
-        attempt_results = {}
-        for test_result_id, is_correct, _ in attempts_data:
-            if test_result_id not in attempt_results:
-                attempt_results[test_result_id] = {'total': 0, 'correct': 0}
-            attempt_results[test_result_id]['total'] += 1
-            if is_correct:
-                attempt_results[test_result_id]['correct'] += 1
-
-        for attempt_number, result in enumerate(attempt_results.values(), start=1):
-            result_str = f"{result['correct']}/{result['total']}"
-            row = [QStandardItem(str(attempt_number)),
-                   QStandardItem(result_str)]
+            ['Номер попытки', 'Результат', 'Дата сдачи'])
+
+        for attempt_number, (attempt_id, score, max_score, submitted_at) in enumerate(attempts_data, start=1):
+            number_item = QStandardItem(str(attempt_number))
+            number_item.setData(attempt_id, Qt.UserRole)
+            row = [number_item,
+                   QStandardItem(f"{score}/{max_score}"),
+                   QStandardItem(submitted_at or "")]
             self.studentAttemptsTableModel.appendRow(row)
 
 
@@ -165,24 +287,8 @@ class TestsTableModel(QStandardItemModel):
         return None
 
 
-class StudentsTableModel(QStandardItemModel):
-    def __init__(self, students=None):
-        super().__init__()
-        self.students = students or []
-
-    def setStudents(self, students):
-        self.students = students
-        self.clear()
-        self.setHorizontalHeaderLabels(['Ученики'])
-        self.setColumnCount(1)
-        self.setRowCount(len(self.students))
+class StudentsTableModel(PagedTableModel):
+    columns = [("Ученики", "name")]
 
-        for row, student in enumerate(self.students):
-            item = QStandardItem(student["name"])
-            self.setItem(row, 0, item)
-
-    def data(self, index, role=Qt.DisplayRole):
-        if role == Qt.UserRole:
-            return self.students[index.row()]["id"]
-
-        return super().data(index, role)
+    def __init__(self):
+        super().__init__(database.get_students_page)
@@ -1,3 +1,13 @@
 from .sidebar import SidebarMenu
-from .settings_page import SettingsPage
-from .profile_page import ProfilePage
+from .lazy_stack import LazyStack, lazy_page
+
+
+def __getattr__(name):
+    # The pages themselves are imported on first use; see lazy_page.
+    if name == "SettingsPage":
+        from .settings_page import SettingsPage
+        return SettingsPage
+    if name == "ProfilePage":
+        from .profile_page import ProfilePage
+        return ProfilePage
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,41 @@
+# interfaces\sidebar\lazy_stack.py
+
+import importlib
+
+from PyQt5.QtWidgets import QStackedWidget, QWidget
+
+
+def lazy_page(module_name, class_name, *args):
+    # A page factory that also defers importing the page's module, so a
+    # role only loads the modules of the pages it actually opens.
+    def factory():
+        module = importlib.import_module(module_name)
+        return getattr(module, class_name)(*args)
+    return factory
+
+
+class LazyStack(QStackedWidget):
+    # Pages are added as factories and built the first time they are shown.
+    # Until then an empty placeholder holds the slot, so the sidebar's
+    # button-to-index mapping and later addWidget calls are unaffected.
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.factories = {}
+
+    def addLazyPage(self, factory):
+        index = self.addWidget(QWidget())
+        self.factories[index] = factory
+        return index
+
+    def page(self, index):
+        factory = self.factories.pop(index, None)
+        if factory is not None:
+            placeholder = self.widget(index)
+            self.insertWidget(index, factory())
+            self.removeWidget(placeholder)
+            placeholder.deleteLater()
+        return self.widget(index)
+
+    def setCurrentIndex(self, index):
+        self.page(index)
+        super().setCurrentIndex(index)
@@ -1,10 +1,13 @@
 # interfaces\sidebar\profile_page.py
 
+import sqlite3
+
 from PyQt5.QtWidgets import (QWidget, QLabel, QLineEdit, QPushButton,
                              QHBoxLayout, QVBoxLayout, QMessageBox, QSpacerItem, QSizePolicy)
-from PyQt5.QtGui import QIcon
 from PyQt5.QtCore import QTimer
 import database
+from ..db_worker import AsyncLoader, run_async
+from .. import icons
 
 
 class ProfilePage(QWidget):
@@ -34,7 +37,7 @@ class ProfilePage(QWidget):
         self.password_edit.setEchoMode(QLineEdit.Password)
 
         self.show_password_button = QPushButton(
-            QIcon("resources/icons/eye-icon.png"), "", self)
+            icons.icon("eye"), "", self)
         self.show_password_button.clicked.connect(
             self.toggle_password_visibility)
 
@@ -55,11 +58,14 @@ class ProfilePage(QWidget):
                              QSizePolicy.Expanding)
         main_layout.addItem(spacer)
 
+        self.loader = AsyncLoader(self)
         self.load_user_info()
 
     def load_user_info(self):
+        self.loader.load(database.get_user_info, self.main_window.user_id,
+                         on_result=self.show_user_info)
 
-        user_info = database.get_user_info(self.main_window.user_id)
+    def show_user_info(self, user_info):
         if user_info:
             self.name_edit.setText(user_info["name"])
             self.username_edit.setText(user_info["username"])
@@ -76,10 +82,18 @@ class ProfilePage(QWidget):
                 self, "Предупреждение", "Все поля обязательны для заполнения.")
             return
 
-        database.update_user_info(
-            self.main_window.user_id, name, username, password)
-        QMessageBox.information(
-            self, "Успех", "Информация о пользователе успешно обновленаy.")
+        run_async(database.update_user_info,
+                  self.main_window.user_id, name, username, password,
+                  on_result=lambda _: QMessageBox.information(
+                      self, "Успех", "Информация о пользователе успешно обновленаy."),
+                  on_error=self.onSaveFailed)
+
+    def onSaveFailed(self, error):
+        if isinstance(error, sqlite3.IntegrityError):
+            QMessageBox.warning(self, "Ошибка", "Логин уже занят")
+        else:
+            QMessageBox.warning(
+                self, "Ошибка", f"Не удалось сохранить изменения: {error}")
 
     def toggle_password_visibility(self):
         if self.password_edit.echoMode() == QLineEdit.Password:
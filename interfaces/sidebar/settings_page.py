@@ -1,11 +1,182 @@
 # interfaces/sidebar/settings_page.py
-from PyQt5.QtWidgets import QWidget, QLabel
+from PyQt5.QtWidgets import (QWidget, QLabel, QComboBox, QPushButton, QFormLayout,
+                             QVBoxLayout, QHBoxLayout, QMessageBox, QCheckBox, QSpinBox,
+                             QPlainTextEdit, QFileDialog)
+from PyQt5.QtGui import QFontDatabase
+import connection
+import query_trace
+import tests_cache
+from .. import action_profiler, timing, watchdog
 
 
 class SettingsPage(QWidget):
-    def __init__(self):
+    def __init__(self, main_window):
         super().__init__()
+        self.main_window = main_window
+        # The database profile, tracing and profiling settings apply to the
+        # whole installation, so only an administrator gets them.
+        self.is_admin = main_window.user_role == "ADMIN"
         self.initUI()
 
     def initUI(self):
-        label = QLabel("This is the Settings Page.", self)
+        if not self.is_admin:
+            QLabel("This is the Settings Page.", self)
+            return
+
+        main_layout = QVBoxLayout(self)
+
+        form_layout = QFormLayout()
+
+        self.profile_combo = QComboBox(self)
+        self.profile_combo.addItems(connection.PROFILES.keys())
+        self.profile_combo.setCurrentText(connection.get_profile_name())
+        self.profile_combo.currentTextChanged.connect(self.show_profile)
+        form_layout.addRow("Профиль базы данных:", self.profile_combo)
+
+        self.profile_details = QLabel(self)
+        form_layout.addRow("", self.profile_details)
+
+        self.apply_button = QPushButton("Применить", self)
+        self.apply_button.clicked.connect(self.apply_profile)
+        form_layout.addRow(self.apply_button)
+
+        self.cache_stats_label = QLabel(self)
+        form_layout.addRow("Кэш тестов:", self.cache_stats_label)
+
+        self.first_paint_label = QLabel(self)
+        form_layout.addRow("Вход до первой отрисовки:", self.first_paint_label)
+
+        self.trace_checkbox = QCheckBox("Включена", self)
+        self.trace_checkbox.setChecked(query_trace.is_enabled())
+        self.trace_checkbox.toggled.connect(self.set_tracing)
+        form_layout.addRow("Трассировка SQL:", self.trace_checkbox)
+
+        self.slow_query_spinbox = QSpinBox(self)
+        self.slow_query_spinbox.setRange(1, 60000)
+        self.slow_query_spinbox.setSuffix(" мс")
+        self.slow_query_spinbox.setValue(query_trace.threshold_ms())
+        self.slow_query_spinbox.valueChanged.connect(query_trace.set_threshold_ms)
+        form_layout.addRow("Медленный запрос от:", self.slow_query_spinbox)
+
+        self.stall_spinbox = QSpinBox(self)
+        self.stall_spinbox.setRange(0, 10000)
+        self.stall_spinbox.setSingleStep(50)
+        self.stall_spinbox.setSuffix(" мс")
+        self.stall_spinbox.setSpecialValueText("выключен")
+        self.stall_spinbox.setValue(watchdog.threshold_ms())
+        self.stall_spinbox.valueChanged.connect(self.set_stall_threshold)
+        form_layout.addRow("Журнал зависаний интерфейса от:", self.stall_spinbox)
+
+        self.stalls_label = QLabel(self)
+        form_layout.addRow("Зависания:", self.stalls_label)
+
+        self.action_profile_checkbox = QCheckBox(
+            f"Включено (файлы в {action_profiler.PROFILES_DIR})", self)
+        self.action_profile_checkbox.setChecked(action_profiler.enabled)
+        self.action_profile_checkbox.toggled.connect(action_profiler.set_enabled)
+        form_layout.addRow("Профилирование действий:", self.action_profile_checkbox)
+
+        self.action_profile_label = QLabel(self)
+        form_layout.addRow("Последний профиль:", self.action_profile_label)
+
+        main_layout.addLayout(form_layout)
+
+        self.trace_report = QPlainTextEdit(self)
+        self.trace_report.setReadOnly(True)
+        self.trace_report.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.trace_report.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        main_layout.addWidget(self.trace_report)
+
+        trace_buttons = QHBoxLayout()
+        self.refresh_trace_button = QPushButton("Обновить", self)
+        self.refresh_trace_button.clicked.connect(self.show_trace_report)
+        self.reset_trace_button = QPushButton("Сбросить", self)
+        self.reset_trace_button.clicked.connect(self.reset_trace)
+        self.save_trace_button = QPushButton("Сохранить отчет...", self)
+        self.save_trace_button.clicked.connect(self.save_trace_report)
+        trace_buttons.addWidget(self.refresh_trace_button)
+        trace_buttons.addWidget(self.reset_trace_button)
+        trace_buttons.addWidget(self.save_trace_button)
+        main_layout.addLayout(trace_buttons)
+
+        self.show_profile(self.profile_combo.currentText())
+
+    def showEvent(self, event):
+        if not self.is_admin:
+            super().showEvent(event)
+            return
+        self.show_cache_stats()
+        self.show_timings()
+        self.show_trace_report()
+        self.show_stalls()
+        self.show_action_profile()
+        super().showEvent(event)
+
+    def show_action_profile(self):
+        files = action_profiler.last_files
+        self.action_profile_label.setText("нет" if files is None else files[1])
+
+    def set_stall_threshold(self, value):
+        watchdog.set_threshold_ms(value)
+        self.show_stalls()
+
+    def show_stalls(self):
+        current = watchdog.current()
+        if current is None:
+            self.stalls_label.setText("не отслеживаются")
+        elif not current.recent:
+            self.stalls_label.setText(f"не было (журнал: {watchdog.LOG_PATH})")
+        else:
+            last = current.recent[-1]
+            self.stalls_label.setText(
+                f"{current.stall_count}, последнее {last['ms']} мс в {last['slot']} "
+                f"(журнал: {watchdog.LOG_PATH})")
+
+    def set_tracing(self, enabled):
+        connection.set_tracing(enabled)
+        self.show_trace_report()
+
+    def show_trace_report(self):
+        if not query_trace.is_enabled() and not query_trace.snapshot()["functions"]:
+            self.trace_report.setPlainText(
+                "Трассировка выключена. Медленные запросы также пишутся в "
+                f"{query_trace.SLOW_LOG_PATH}.")
+            return
+        self.trace_report.setPlainText(query_trace.report_text())
+
+    def reset_trace(self):
+        query_trace.reset()
+        self.show_trace_report()
+
+    def save_trace_report(self):
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Сохранить отчет", "sql_trace.txt",
+            "Текст (*.txt);;JSON (*.json)")
+        if not path:
+            return
+        try:
+            query_trace.dump(path)
+        except OSError as error:
+            QMessageBox.warning(self, "Ошибка", f"Не удалось сохранить отчет: {error}")
+
+    def show_timings(self):
+        seconds = timing.results.get(timing.LOGIN_TO_FIRST_PAINT)
+        self.first_paint_label.setText(
+            "нет данных" if seconds is None else f"{seconds * 1000:.0f} мс")
+
+    def show_cache_stats(self):
+        stats = tests_cache.stats()
+        self.cache_stats_label.setText(
+            f"попаданий {stats['hits']}, промахов {stats['misses']}, "
+            f"вытеснений {stats['evictions']}, "
+            f"записей {stats['size']}/{stats['max_size']}")
+
+    def show_profile(self, name):
+        profile = connection.PROFILES[name]
+        self.profile_details.setText(
+            "\n".join(f"{pragma} = {value}" for pragma, value in profile.items()))
+
+    def apply_profile(self):
+        connection.set_profile(self.profile_combo.currentText())
+        QMessageBox.information(
+            self, "Успех", "Профиль базы данных применен.")
@@ -2,8 +2,8 @@
 
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QPushButton, QSpacerItem, QSizePolicy)
-from .profile_page import ProfilePage
-from .settings_page import SettingsPage
+from .lazy_stack import lazy_page
+import connection
 
 
 class SidebarMenu(QWidget):
@@ -38,10 +38,10 @@ class SidebarMenu(QWidget):
 
         self.setLayout(layout)
 
-        self.profile_page = ProfilePage(self.main_window)
-        self.settings_page = SettingsPage()
-        self.stack.addWidget(self.profile_page)
-        self.stack.addWidget(self.settings_page)
+        self.stack.addLazyPage(lazy_page(
+            "interfaces.sidebar.profile_page", "ProfilePage", self.main_window))
+        self.stack.addLazyPage(lazy_page(
+            "interfaces.sidebar.settings_page", "SettingsPage", self.main_window))
 
     def connectStack(self):
         for i, button in enumerate(self.buttons):
@@ -64,3 +64,5 @@ class SidebarMenu(QWidget):
 
         self.main_window.central_widget.setCurrentWidget(
             self.main_window.login_window)
+
+        connection.reset_connections()
@@ -4,7 +4,12 @@ from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QTableView, QPushButton, QHeaderView, QMessageBox)
 from PyQt5.QtGui import QStandardItem, QStandardItemModel
 import database
+import events
 from ..test_page import TakeTestPage
+from ..db_worker import AsyncLoader, bind_loading, run_async
+from ..action_profiler import profiled_action
+from ..change_feed import ChangeSync
+from .. import event_bus
 
 
 class MyTestsPage(QWidget):
@@ -37,67 +42,130 @@ class MyTestsPage(QWidget):
         refresh_button.clicked.connect(self.loadTestData)
         layout.addWidget(refresh_button)
 
+        self.loader = AsyncLoader(self)
+        bind_loading(self.loader, refresh_button)
+        self.changes = ChangeSync(self, ("tests", "student_tests"), self.load_data,
+                                  self.fetchChanges, self.applyChanges,
+                                  busy=self.loader.isLoading)
+        event_bus.subscribe(self, (events.TestsSaved,), self.onTestsChanged)
+        event_bus.subscribe(self, (events.TestDeleted,), self.onTestDeleted)
+        event_bus.subscribe(self, (events.TestsAssigned,), self.onTestsAssigned)
+        event_bus.subscribe(self, (events.TestResultRecorded,), self.onTestResultRecorded)
         self.loadTestData()
 
+    @profiled_action
     def loadTestData(self):
+        self.changes.reload()
+
+    def load_data(self):
+        self.loader.load(database.get_assigned_tests_for_student,
+                         self.main_window.user_id, on_result=self.showTestData)
+
+    def fetchChanges(self, changes):
+        student_id = self.main_window.user_id
+        test_ids = {change["row_id"] for change in changes if change["table"] == "tests"} | {
+            change["ref_id"] for change in changes
+            if change["table"] == "student_tests" and change["row_id"] == student_id}
+        return self.fetchRows(test_ids)
+
+    def fetchRows(self, test_ids):
+        return test_ids, database.get_assigned_tests_for_student(
+            self.main_window.user_id, test_ids)
+
+    def onTestsChanged(self, event):
+        if any(test_id in self.test_ids.values() for test_id in event.test_ids):
+            self.changes.patch(self.fetchRows, event.test_ids)
+
+    def onTestDeleted(self, event):
+        self.applyChanges(({event.test_id}, []))
+
+    def onTestsAssigned(self, event):
+        if self.main_window.user_id in event.student_ids:
+            self.changes.patch(self.fetchRows, event.test_ids)
+
+    def onTestResultRecorded(self, event):
+        if event.student_id == self.main_window.user_id:
+            self.changes.patch(self.fetchRows, (event.test_id,))
+
+    def applyChanges(self, rows):
+        test_ids, tests = rows
+        found = {test["id"]: test for test in tests}
+        rows_by_id = {test_id: row for row, test_id in self.test_ids.items()}
+        for test_id in sorted(test_ids, key=lambda id: rows_by_id.get(id, -1), reverse=True):
+            row = rows_by_id.get(test_id)
+            test = found.get(test_id)
+            if test is None:
+                if row is not None:
+                    self.model.removeRow(row)
+                    del rows_by_id[test_id]
+                    for other_id, other_row in rows_by_id.items():
+                        if other_row > row:
+                            rows_by_id[other_id] = other_row - 1
+            else:
+                if row is None:
+                    row = rows_by_id[test_id] = self.model.rowCount()
+                    self.model.setRowCount(row + 1)
+                self.setTestRow(row, test)
+        self.test_ids = {row: test_id for test_id, row in rows_by_id.items()}
+
+    def showTestData(self, tests):
         self.model.clear()
         self.model.setColumnCount(5)
         self.model.setHorizontalHeaderLabels(
             ["Название", "Описание", "Количество ост. попыток",
                 "Кто создал", "Кто назначил"]
         )
-
-        tests = database.get_assigned_tests_for_student(
-            self.main_window.user_id)
         self.model.setRowCount(len(tests))
 
+        self.test_ids = {}
         for row, test in enumerate(tests):
-            self.model.setItem(row, 0, QStandardItem(test["name"]))
-            self.model.setItem(row, 1, QStandardItem(test["description"]))
-            self.model.setItem(
-                row, 2, QStandardItem(str(test["remaining_attempts"]))
-            )
-            self.model.setItem(row, 3, QStandardItem(test["creator_name"]))
-            self.model.setItem(row, 4, QStandardItem(test["assigner_name"]))
-            self.test_ids[row] = test["id"]
+            self.setTestRow(row, test)
 
         self.adjustColumnWidths()
 
+    def setTestRow(self, row, test):
+        self.model.setItem(row, 0, QStandardItem(test["name"]))
+        self.model.setItem(row, 1, QStandardItem(test["description"]))
+        self.model.setItem(
+            row, 2, QStandardItem(str(test["remaining_attempts"]))
+        )
+        self.model.setItem(row, 3, QStandardItem(test["creator_name"]))
+        self.model.setItem(row, 4, QStandardItem(test["assigner_name"]))
+        self.test_ids[row] = test["id"]
+
+    @profiled_action
     def takeSelectedTest(self):
         selected_rows = self.tableView.selectionModel().selectedRows()
         if selected_rows:
             selected_row = selected_rows[0].row()
             if selected_row in self.test_ids:
                 test_id = self.test_ids[selected_row]
-
-                test_details_list = database.get_assigned_tests_for_student(
-                    self.main_window.user_id)
-
-                test_details = next(
-                    (item for item in test_details_list if item["id"] == test_id), None)
-
-                if test_details is None:
-                    QMessageBox.warning(
-                        self, "Ошибка", "Ошибка при получении информации о тесте.")
-                    return
-
-                if test_details["remaining_attempts"] <= 0:
-                    QMessageBox.warning(
-                        self, "Ошибка", "У вас не осталось попыток для этого теста.")
-                    return
-
-                response = QMessageBox.warning(
-                    self,
-                    "Предупреждение",
-                    "Вы собираетесь начать тест. Вы не сможете вернуться к другим разделам, пока не завершите тест. Вы уверены, что хотите продолжить?",
-                    QMessageBox.Yes | QMessageBox.No,
-                    QMessageBox.No,)
-                if response == QMessageBox.Yes:
-                    self.startTest(test_id)
+                run_async(database.get_remaining_attempts, self.main_window.user_id, test_id,
+                          on_result=lambda remaining: self.confirmStartTest(test_id, remaining))
         else:
             QMessageBox.warning(
                 self, "Ошибка", "Пожалуйста, выберите тест для прохождения.")
 
+    def confirmStartTest(self, test_id, remaining_attempts):
+        if remaining_attempts is None:
+            QMessageBox.warning(
+                self, "Ошибка", "Ошибка при получении информации о тесте.")
+            return
+
+        if remaining_attempts <= 0:
+            QMessageBox.warning(
+                self, "Ошибка", "У вас не осталось попыток для этого теста.")
+            return
+
+        response = QMessageBox.warning(
+            self,
+            "Предупреждение",
+            "Вы собираетесь начать тест. Вы не сможете вернуться к другим разделам, пока не завершите тест. Вы уверены, что хотите продолжить?",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No,)
+        if response == QMessageBox.Yes:
+            self.startTest(test_id)
+
     def adjustColumnWidths(self):
         column_count = self.model.columnCount()
         total_width = self.tableView.viewport().width()
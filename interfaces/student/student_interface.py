@@ -1,9 +1,7 @@
 # interfaces\student\student_interface.py
 
-from PyQt5.QtWidgets import QWidget, QHBoxLayout, QStackedWidget
-from interfaces.sidebar import SidebarMenu
-from .my_tests_page import MyTestsPage
-from ..reports_page import ReportsWindow
+from PyQt5.QtWidgets import QWidget, QHBoxLayout
+from interfaces.sidebar import SidebarMenu, LazyStack, lazy_page
 
 
 class StudentWindow(QWidget):
@@ -14,11 +12,11 @@ class StudentWindow(QWidget):
 
     def initUI(self):
         upper_buttons = ["Мои тесты", "Мои результаты"]
-        self.stack = QStackedWidget()
+        self.stack = LazyStack()
 
-        self.tests_page = MyTestsPage(self, self.main_window)
-        self.stack.addWidget(self.tests_page)
-        self.stack.addWidget(ReportsWindow(self.main_window))
+        self.stack.addLazyPage(self.createTestsPage)
+        self.stack.addLazyPage(lazy_page(
+            "interfaces.reports_page", "ReportsWindow", self.main_window))
 
         self.sidebar = SidebarMenu(upper_buttons, self.stack, self.main_window)
 
@@ -28,6 +26,12 @@ class StudentWindow(QWidget):
 
         self.setLayout(layout)
         self.connectButtons()
+        self.stack.setCurrentIndex(0)
+
+    def createTestsPage(self):
+        from .my_tests_page import MyTestsPage
+        self.tests_page = MyTestsPage(self, self.main_window)
+        return self.tests_page
 
     def connectButtons(self):
         self.sidebar.connectStack()
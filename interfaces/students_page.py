@@ -2,9 +2,17 @@
 
 from PyQt5.QtWidgets import (QWidget, QPushButton, QVBoxLayout, QTableView, QDialog,
                              QStyledItemDelegate, QPushButton, QInputDialog, QMessageBox, QHeaderView, QCheckBox, QComboBox)
-from PyQt5.QtCore import Qt, QModelIndex, QRect, pyqtSignal, QAbstractTableModel
-from PyQt5.QtGui import QStandardItemModel, QStandardItem, QIcon, QStandardItem, QStandardItemModel
+from PyQt5.QtCore import Qt, QModelIndex, QRect, pyqtSignal
+from PyQt5.QtGui import QStandardItemModel, QStandardItem, QStandardItem, QStandardItemModel
 import database
+import events
+from connection import transaction
+from .paged_table_model import PagedTableModel
+from .db_worker import AsyncLoader, bind_loading, run_async
+from .action_profiler import profiled_action
+from .change_feed import ChangeSync, row_ids
+from . import event_bus
+from . import icons
 
 
 class GroupManagementDialog(QDialog):
@@ -47,6 +55,8 @@ class GroupManagementDialog(QDialog):
         self.setWindowTitle("Управление группами")
         self.setGeometry(300, 300, 400, 300)
 
+        self.loader = AsyncLoader(self)
+        bind_loading(self.loader, self.refreshButton)
         self.load_groups()
 
     def add_group(self):
@@ -59,8 +69,9 @@ class GroupManagementDialog(QDialog):
                 QMessageBox.warning(
                     self, "Группа уже существует", "Группа уже существует.")
             else:
-                database.add_group(text)
-                self.load_groups()
+                run_async(database.add_group, text,
+                          on_result=lambda _: self.load_groups(),
+                          on_error=self.onSaveFailed)
 
     def delete_group(self):
         selected = self.groupsTable.selectionModel().selectedRows()
@@ -69,8 +80,9 @@ class GroupManagementDialog(QDialog):
             group_item = self.groupsModel.item(row)
             group_name = group_item.text()
 
-            database.delete_group(group_name)
-            self.load_groups()
+            run_async(database.delete_group, group_name,
+                      on_result=lambda _: self.load_groups(),
+                      on_error=self.onSaveFailed)
 
     def assign_test_to_group(self):
         selected = self.groupsTable.selectionModel().selectedRows()
@@ -84,8 +96,7 @@ class GroupManagementDialog(QDialog):
 
         row = selected[0].row()
         group_item = self.groupsModel.item(row)
-        group_name = group_item.text()
-        group_id = database.get_group_id_by_name(group_name)
+        group_id = group_item.data(Qt.UserRole)
         if group_id is not None:
             dialog = AssignTestToGroupDialog(
                 group_id, self.main_window.user_id, self)
@@ -95,58 +106,33 @@ class GroupManagementDialog(QDialog):
                 self, "Ошибка", "Невозможно найти выбранную группу в базе данных."
             )
 
-        self.win.refresh_students()
-
     def load_groups(self):
-        groups = database.get_all_groups()
+        self.loader.load(database.get_all_groups, on_result=self.showGroups,
+                         on_error=self.onSaveFailed)
+
+    def onSaveFailed(self, error):
+        QMessageBox.warning(self, "Ошибка", f"Не удалось выполнить операцию: {error}")
 
+    def showGroups(self, groups):
         self.groupsModel.clear()
         self.groupsModel.setHorizontalHeaderLabels(["Имя группы"])
 
         for group in groups:
             group_name = group["name"]
             item = QStandardItem(group_name)
+            item.setData(group["id"], Qt.UserRole)
             self.groupsModel.appendRow(item)
 
 
-class StudentsTableModel(QAbstractTableModel):
-    def __init__(self, students_data):
-        super().__init__()
-        self.students_data = students_data
-        self.header = ["ФИО", "Группа", "Назначенные тесты"]
-
-    def rowCount(self, parent=QModelIndex()):
-        return len(self.students_data)
-
-    def columnCount(self, parent=QModelIndex()):
-        return len(self.header)
+class StudentsTableModel(PagedTableModel):
+    columns = [
+        ("ФИО", "name"),
+        ("Группа", "group"),
+        ("Назначенные тесты", "tests"),
+    ]
 
-    def data(self, index, role):
-        if not index.isValid():
-            return None
-        if role == Qt.DisplayRole or role == Qt.EditRole:
-            row = index.row()
-            col = index.column()
-            student = self.students_data[row]
-            if col == 0:
-                return student["name"]
-            elif col == 1:
-                return student["group"]
-            elif col == 2:
-                return student["tests"]
-        return None
-
-    def headerData(self, section, orientation, role=Qt.DisplayRole):
-        if role == Qt.DisplayRole:
-            if orientation == Qt.Horizontal:
-                return self.header[section]
-            elif orientation == Qt.Vertical:
-                return str(section + 1)
-        return None
-
-    def get_group_dropdown_data(self):
-        groups = database.get_all_groups()
-        return {group["id"]: group["name"] for group in groups}
+    def __init__(self):
+        super().__init__(database.get_students_page)
 
     def flags(self, index):
         if index.column() == 1:
@@ -164,13 +150,24 @@ class GroupSelectionDialog(QDialog):
         self.setWindowTitle("Выбор группы")
         self.layout = QVBoxLayout(self)
         self.groupComboBox = QComboBox(self)
-        for group in database.get_all_groups():
-            self.groupComboBox.addItem(group["name"], group["id"])
         self.layout.addWidget(self.groupComboBox)
         self.assignButton = QPushButton("Сохранить", self)
         self.assignButton.clicked.connect(self.accept)
         self.layout.addWidget(self.assignButton)
 
+        self.loader = AsyncLoader(self)
+        bind_loading(self.loader, self.assignButton)
+        self.loader.load(database.get_all_groups, on_result=self.showGroups,
+                         on_error=self.onLoadFailed)
+
+    def showGroups(self, groups):
+        for group in groups:
+            self.groupComboBox.addItem(group["name"], group["id"])
+
+    def onLoadFailed(self, error):
+        QMessageBox.warning(self, "Ошибка", f"Не удалось загрузить группы: {error}")
+        self.reject()
+
     def selected_group_id(self):
         return self.groupComboBox.currentData()
 
@@ -184,9 +181,7 @@ class StudentsPage(QWidget):
     def initUI(self):
         self.layout = QVBoxLayout(self)
 
-        students_data = database.get_all_students()
-
-        self.studentsModel = StudentsTableModel(students_data)
+        self.studentsModel = StudentsTableModel()
 
         self.studentsTable = QTableView()
         self.studentsTable.setModel(self.studentsModel)
@@ -217,8 +212,34 @@ class StudentsPage(QWidget):
         self.refreshButton.clicked.connect(self.refresh_students)
         self.layout.addWidget(self.refreshButton)
 
+        bind_loading(self.studentsModel.loader, self.refreshButton)
+        self.changes = ChangeSync(self, ("users", "user_groups", "student_tests"),
+                                  self.studentsModel.reset,
+                                  self.fetchChanges, self.applyChanges,
+                                  busy=self.studentsModel.loader.isLoading)
+        event_bus.subscribe(self, (events.UsersChanged,), self.onUsersChanged)
+        event_bus.subscribe(self, (events.StudentGroupsChanged, events.TestsAssigned),
+                            self.onStudentsChanged)
         self.refresh_students()
 
+    @staticmethod
+    def fetchChanges(changes):
+        return StudentsPage.fetchRows(
+            row_ids(changes, "users", "user_groups", "student_tests"))
+
+    @staticmethod
+    def fetchRows(student_ids):
+        return student_ids, database.get_students_by_ids(student_ids)
+
+    def onUsersChanged(self, event):
+        self.changes.patch(self.fetchRows, event.user_ids)
+
+    def onStudentsChanged(self, event):
+        self.changes.patch(self.fetchRows, event.student_ids)
+
+    def applyChanges(self, rows):
+        self.studentsModel.patchRows(*rows)
+
     def open_group_management(self):
         dialog = GroupManagementDialog(self, self.main_window)
         dialog.exec_()
@@ -227,30 +248,25 @@ class StudentsPage(QWidget):
         selected = self.studentsTable.selectionModel().selectedRows()
         if selected:
             row = selected[0].row()
-            student_id = self.studentsModel.students_data[row]["id"]
+            student_id = self.studentsModel.rowData(row)["id"]
 
             AssignTestDialog(
                 student_id, self.main_window.user_id, self).exec_()
-            self.refresh_students()
 
+    @profiled_action
     def refresh_students(self):
-        students_data = database.get_all_students()
-        self.studentsModel.students_data = students_data
-        self.studentsModel.layoutChanged.emit()
-        self.studentsTable.viewport().update()
+        self.changes.reload()
 
     def assign_group(self, row):
         dialog = GroupSelectionDialog(self)
         if dialog.exec_():
             group_id = dialog.selected_group_id()
-            student_id = self.studentsModel.students_data[row]["id"]
-            database.set_student_group(student_id, group_id)
-            self.refresh_students()
+            student_id = self.studentsModel.rowData(row)["id"]
+            run_async(database.set_student_group, student_id, group_id)
 
     def remove_group(self, row):
-        student_id = self.studentsModel.students_data[row]["id"]
-        database.reset_student_group(student_id)
-        self.refresh_students()
+        student_id = self.studentsModel.rowData(row)["id"]
+        run_async(database.reset_student_group, student_id)
 
 
 class GroupColumnDelegate(QStyledItemDelegate):
@@ -265,9 +281,6 @@ class GroupColumnDelegate(QStyledItemDelegate):
         painter.drawText(option.rect.adjusted(5, 0, -30, 0),
                          Qt.AlignVCenter, group_name)
 
-        assign_icon = QIcon("resources/icons/assign.png")
-        remove_icon = QIcon("resources/icons/close.png")
-
         icon_size = 16
         right_edge = option.rect.right()
         remove_icon_rect = QRect(
@@ -276,9 +289,9 @@ class GroupColumnDelegate(QStyledItemDelegate):
             right_edge - icon_size * 2 - 5, option.rect.top(), icon_size, icon_size)
 
         painter.drawPixmap(
-            assign_icon_rect, assign_icon.pixmap(icon_size, icon_size))
+            assign_icon_rect, icons.pixmap("assign", icon_size))
         painter.drawPixmap(
-            remove_icon_rect, remove_icon.pixmap(icon_size, icon_size))
+            remove_icon_rect, icons.pixmap("close", icon_size))
 
     def editorEvent(self, event, model, option, index):
         if not index.isValid():
@@ -311,34 +324,105 @@ class AssignTestDialog(QDialog):
         super().__init__(parent)
         self.student_id = student_id
         self.user_id = user_id
-        self.assigned_tests = set(database.get_tests_for_student(student_id))
+        self.assigned_tests = set()
+        # Deleted on close, which also ends its event subscriptions.
+        self.setAttribute(Qt.WA_DeleteOnClose)
         self.initUI()
+        event_bus.subscribe(self, (events.TestsSaved,), self.onTestsSaved)
+        event_bus.subscribe(self, (events.TestDeleted,), self.onTestDeleted)
+        event_bus.subscribe(self, (events.TestsAssigned,), self.onTestsAssigned)
 
     def initUI(self):
         self.layout = QVBoxLayout(self)
-        self.tests = database.get_all_tests_as_dict()
-
-        for test_id, test_name in self.tests:
-            checkBox = QCheckBox(test_name, self)
-            checkBox.test_id = test_id
-            checkBox.setChecked(test_id in self.assigned_tests)
-            self.layout.addWidget(checkBox)
+        self.checkBoxes = {}
 
         self.assignButton = QPushButton("Сохранить", self)
         self.assignButton.clicked.connect(self.assign_selected_tests)
         self.layout.addWidget(self.assignButton)
 
+        self.loader = AsyncLoader(self)
+        bind_loading(self.loader, self.assignButton)
+        self.loader.load(self.fetchTests, self.student_id, on_result=self.showTests,
+                         on_error=self.onLoadFailed)
+
+    @staticmethod
+    def fetchTests(student_id):
+        return database.get_all_tests_as_dict(), database.get_tests_for_student(student_id)
+
+    def showTests(self, result):
+        tests, assigned = result
+        self.assigned_tests = set(assigned)
+        for test_id, test_name in tests:
+            # An event may have added the box while the tests were loading.
+            if test_id not in self.checkBoxes:
+                self.addCheckBox(test_id, test_name)
+
+    def onLoadFailed(self, error):
+        QMessageBox.warning(self, "Ошибка", f"Не удалось загрузить тесты: {error}")
+        self.reject()
+
+    def addCheckBox(self, test_id, test_name):
+        checkBox = QCheckBox(test_name, self)
+        checkBox.test_id = test_id
+        checkBox.setChecked(test_id in self.assigned_tests)
+        self.checkBoxes[test_id] = checkBox
+        # Before the save button once it exists.
+        self.layout.insertWidget(len(self.checkBoxes) - 1, checkBox)
+
+    def onTestsSaved(self, event):
+        run_async(database.get_tests_by_ids, event.test_ids, on_result=self.showSavedTests)
+
+    def showSavedTests(self, tests):
+        for test in tests:
+            checkBox = self.checkBoxes.get(test["id"])
+            if checkBox is None:
+                self.addCheckBox(test["id"], test["name"])
+            else:
+                checkBox.setText(test["name"])
+
+    def onTestDeleted(self, event):
+        checkBox = self.checkBoxes.pop(event.test_id, None)
+        if checkBox is not None:
+            checkBox.deleteLater()
+        self.assigned_tests.discard(event.test_id)
+
+    def onTestsAssigned(self, event):
+        if self.student_id in event.student_ids:
+            run_async(database.get_tests_for_student, self.student_id,
+                      on_result=self.showAssignedTests)
+
+    def showAssignedTests(self, test_ids):
+        # Someone else changed this student's tests; boxes the user has not
+        # touched follow, the others keep the user's choice.
+        assigned = set(test_ids)
+        for test_id, checkBox in self.checkBoxes.items():
+            if checkBox.isChecked() == (test_id in self.assigned_tests):
+                checkBox.setChecked(test_id in assigned)
+        self.assigned_tests = assigned
+
     def assign_selected_tests(self):
-        for i in range(self.layout.count()):
-            widget = self.layout.itemAt(i).widget()
-            if isinstance(widget, QCheckBox):
-                if widget.isChecked() and widget.test_id not in self.assigned_tests:
-                    database.assign_test_to_student(
-                        widget.test_id, self.student_id, self.user_id)
-                elif not widget.isChecked() and widget.test_id in self.assigned_tests:
-                    database.remove_test_from_student(
-                        widget.test_id, self.student_id)
-        self.accept()
+        assign = []
+        remove = []
+        for widget in self.checkBoxes.values():
+            if widget.isChecked() and widget.test_id not in self.assigned_tests:
+                assign.append(widget.test_id)
+            elif not widget.isChecked() and widget.test_id in self.assigned_tests:
+                remove.append(widget.test_id)
+        self.assignButton.setEnabled(False)
+        run_async(self.saveAssignments, self.student_id, self.user_id, assign, remove,
+                  on_result=lambda _: self.accept(), on_error=self.onSaveFailed)
+
+    def onSaveFailed(self, error):
+        self.assignButton.setEnabled(True)
+        QMessageBox.warning(self, "Ошибка", f"Не удалось сохранить назначения: {error}")
+
+    @staticmethod
+    def saveAssignments(student_id, user_id, assign, remove):
+        with transaction():
+            for test_id in assign:
+                database.assign_test_to_student(test_id, student_id, user_id)
+            for test_id in remove:
+                database.remove_test_from_student(test_id, student_id)
 
 
 class AssignTestToGroupDialog(QDialog):
@@ -350,14 +434,7 @@ class AssignTestToGroupDialog(QDialog):
 
     def initUI(self):
         self.layout = QVBoxLayout(self)
-        self.tests = database.get_all_tests_as_dict()
-
         self.testCheckBoxes = []
-        for test_id, test_name in self.tests:
-            checkBox = QCheckBox(test_name, self)
-            checkBox.test_id = test_id
-            self.testCheckBoxes.append(checkBox)
-            self.layout.addWidget(checkBox)
 
         self.assignButton = QPushButton(
             "Назначить выбранные тесты на группу", self)
@@ -369,21 +446,60 @@ class AssignTestToGroupDialog(QDialog):
         self.removeButton.clicked.connect(self.remove_tests)
         self.layout.addWidget(self.removeButton)
 
+        self.setButtonsEnabled(False)
+        self.loader = AsyncLoader(self)
+        self.loader.load(database.get_all_tests_as_dict, on_result=self.showTests,
+                         on_error=self.onLoadFailed)
+
+    def showTests(self, tests):
+        for position, (test_id, test_name) in enumerate(tests):
+            checkBox = QCheckBox(test_name, self)
+            checkBox.test_id = test_id
+            self.testCheckBoxes.append(checkBox)
+            self.layout.insertWidget(position, checkBox)
+        self.setButtonsEnabled(True)
+
+    def onLoadFailed(self, error):
+        QMessageBox.warning(self, "Ошибка", f"Не удалось загрузить тесты: {error}")
+        self.reject()
+
+    def checkedTestIds(self):
+        return [checkBox.test_id for checkBox in self.testCheckBoxes if checkBox.isChecked()]
+
     def assign_tests(self):
-        for checkBox in self.testCheckBoxes:
-            if checkBox.isChecked():
-                database.assign_test_to_group_students(
-                    checkBox.test_id, self.group_id, self.user_id)
-        QMessageBox.information(
-            self, "Тесты назначены", "Выбранные тесты были назначены группе.")
-        self.accept()
+        self.setButtonsEnabled(False)
+        run_async(self.assignToGroup, self.checkedTestIds(), self.group_id, self.user_id,
+                  on_result=lambda _: self.onTestsSaved(
+                      "Тесты назначены", "Выбранные тесты были назначены группе."),
+                  on_error=self.onSaveFailed)
 
     def remove_tests(self):
-        for checkBox in self.testCheckBoxes:
-            if checkBox.isChecked():
-                database.remove_test_assignment_from_group(
-                    checkBox.test_id, self.group_id
-                )
-        QMessageBox.information(
-            self, "Тесты удалены", "Выбранные тесты были удалены из группы.")
+        self.setButtonsEnabled(False)
+        run_async(self.removeFromGroup, self.checkedTestIds(), self.group_id,
+                  on_result=lambda _: self.onTestsSaved(
+                      "Тесты удалены", "Выбранные тесты были удалены из группы."),
+                  on_error=self.onSaveFailed)
+
+    @staticmethod
+    def assignToGroup(test_ids, group_id, user_id):
+        with transaction():
+            for test_id in test_ids:
+                database.assign_test_to_group_students(test_id, group_id, user_id)
+
+    @staticmethod
+    def removeFromGroup(test_ids, group_id):
+        with transaction():
+            for test_id in test_ids:
+                database.remove_test_assignment_from_group(test_id, group_id)
+
+    def setButtonsEnabled(self, enabled):
+        self.assignButton.setEnabled(enabled)
+        self.removeButton.setEnabled(enabled)
+
+    def onTestsSaved(self, title, message):
+        QMessageBox.information(self, title, message)
         self.accept()
+
+    def onSaveFailed(self, error):
+        self.setButtonsEnabled(True)
+        QMessageBox.warning(self, "Ошибка", f"Не удалось сохранить назначения: {error}")
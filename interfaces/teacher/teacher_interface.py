@@ -1,10 +1,7 @@
 # interfaces\teacher\teacher_interface.py
 
-from PyQt5.QtWidgets import QWidget, QHBoxLayout, QStackedWidget
-from interfaces.sidebar import SidebarMenu
-from ..students_page import StudentsPage
-from ..tests_page import TestsPage
-from ..reports_page import ReportsWindow
+from PyQt5.QtWidgets import QWidget, QHBoxLayout
+from interfaces.sidebar import SidebarMenu, LazyStack, lazy_page
 
 
 class TeacherWindow(QWidget):
@@ -14,13 +11,16 @@ class TeacherWindow(QWidget):
         self.initUI()
 
     def initUI(self):
-        upper_buttons = ['Ученики', 'Тесты', 'Отчеты']
-        self.stack = QStackedWidget()
+        upper_buttons = ['Ученики', 'Тесты', 'Отчеты', 'Журнал оценок']
+        self.stack = LazyStack()
 
-        self.stack.addWidget(StudentsPage(self.main_window))
-        self.test_page = TestsPage(self)
-        self.stack.addWidget(self.test_page)
-        self.stack.addWidget(ReportsWindow(self.main_window))
+        self.stack.addLazyPage(lazy_page(
+            "interfaces.students_page", "StudentsPage", self.main_window))
+        self.stack.addLazyPage(self.createTestsPage)
+        self.stack.addLazyPage(lazy_page(
+            "interfaces.reports_page", "ReportsWindow", self.main_window))
+        self.stack.addLazyPage(lazy_page(
+            "interfaces.gradebook_page", "GradebookPage", self.main_window))
 
         self.sidebar = SidebarMenu(upper_buttons, self.stack, self.main_window)
 
@@ -30,6 +30,12 @@ class TeacherWindow(QWidget):
 
         self.setLayout(layout)
         self.connectButtons()
+        self.stack.setCurrentIndex(0)
+
+    def createTestsPage(self):
+        from ..tests_page import TestsPage
+        self.test_page = TestsPage(self)
+        return self.test_page
 
     def connectButtons(self):
         self.sidebar.connectStack()
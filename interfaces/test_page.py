@@ -1,10 +1,14 @@
 # interfaces\test_page.py
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QTabWidget, QFormLayout, QLabel, QLineEdit, QSpinBox, QTextEdit,
-                             QComboBox, QPushButton, QScrollArea, QGroupBox, QHBoxLayout, QRadioButton, QCheckBox, QMessageBox, QFileDialog)
-from PyQt5.QtCore import Qt
+                             QComboBox, QPushButton, QScrollArea, QGroupBox, QHBoxLayout, QRadioButton, QCheckBox, QMessageBox, QFileDialog,
+                             QButtonGroup, QApplication)
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QPixmap
 import database
+from .db_worker import AsyncLoader, report_error, run_async
+from .action_profiler import profiled_action
+from . import image_loader
 
 
 class ViewTestPage(QWidget):
@@ -12,16 +16,16 @@ class ViewTestPage(QWidget):
         super().__init__()
         self.test_id = test_id
         self.tests_page = tests_page
-        self.test_details = database.get_test_details(self.test_id)
-        self.test_name = self.test_details["name"]
+        self.test_details = None
         self.admin_window = admin_window
+        self.image_labels = {}
         self.initUI()
 
     def initUI(self):
         layout = QVBoxLayout(self)
 
-        label = QLabel(f"Тест: {self.test_name}", self)
-        layout.addWidget(label)
+        self.title_label = QLabel("Загрузка теста...", self)
+        layout.addWidget(self.title_label)
 
         self.scrollArea = QScrollArea(self)
         self.questionsWidget = QWidget()
@@ -34,27 +38,46 @@ class ViewTestPage(QWidget):
         close_button.clicked.connect(self.close_view)
         layout.addWidget(close_button)
 
-        self.loadTest()
+        self.loader = AsyncLoader(self)
+        self.loader.load(database.get_test_details, self.test_id,
+                         on_result=self.loadTest)
 
     def close_view(self):
+        self.loader.cancel()
         self.close()
         self.admin_window.stack.setCurrentWidget(self.admin_window.test_page)
 
-    def loadTest(self):
-        test_details = database.get_test_details(self.test_id)
+    def loadTest(self, test_details):
+        if test_details is None:
+            self.title_label.setText("Тест не найден.")
+            return
+        self.test_details = test_details
+        self.test_name = test_details["name"]
+        self.title_label.setText(f"Тест: {self.test_name}")
         for question in test_details["questions"]:
             self.addQuestion(question)
 
+        image_ids = image_loader.question_image_ids(test_details["questions"])
+        if image_ids:
+            run_async(image_loader.load_thumbnails, image_ids,
+                      on_result=self.showImages)
+
+    def showImages(self, images):
+        for image_id, image in images.items():
+            for image_label in self.image_labels.get(image_id, []):
+                image_label.setPixmap(QPixmap.fromImage(image))
+
     def addQuestion(self, question):
         group_box = QGroupBox()
         group_box_layout = QVBoxLayout(group_box)
 
-        if question.get("image_path"):
+        if question.get("image_id") is not None:
             image_label = QLabel()
             image_label.setAlignment(Qt.AlignCenter)
-            pixmap = QPixmap(question["image_path"])
-            image_label.setPixmap(pixmap)
-            image_label.setFixedSize(200, 200)
+            image_label.setFixedSize(image_loader.THUMBNAIL_SIZE,
+                                     image_loader.THUMBNAIL_SIZE)
+            self.image_labels.setdefault(
+                question["image_id"], []).append(image_label)
             group_box_layout.addWidget(image_label)
 
         question_text_edit = QTextEdit(question["text"])
@@ -80,19 +103,20 @@ class ViewTestPage(QWidget):
 
 
 class CreateTestPage(QWidget):
-    def __init__(self, tests_page, creator_id, refresh_tests):
+    def __init__(self, tests_page, creator_id):
         super().__init__()
         self.answer_widgets = {}
         self.tests_page = tests_page
         self.creator_id = creator_id
-        self.refresh_tests = refresh_tests
         self.initUI()
 
+    @profiled_action
     def save_test(self):
         if not self.validate_test():
             return
         test_name = self.test_name.text()
         attempts = self.attempts_spinbox.value()
+        draw_count = self.draw_spinbox.value()
         questions = []
 
         for group_box, answer_widgets in self.answer_widgets.items():
@@ -105,14 +129,29 @@ class CreateTestPage(QWidget):
                 answers.append({"text": answer_text, "is_correct": is_correct})
 
             questions.append(
-                {"text": question_text, "type": question_type, "answers": answers}
+                {"text": question_text, "type": question_type, "answers": answers,
+                 "image": answer_widgets["image"]}
             )
 
-        database.save_test_to_database(
-            test_name, attempts, questions, self.creator_id)
+        test = {"name": test_name, "attempts": attempts}
+        if 0 < draw_count < len(questions):
+            # The questions become a pool; each attempt draws draw_count of them.
+            test["sections"] = [{"draw_count": draw_count, "questions": questions}]
+        else:
+            test["questions"] = questions
+
+        self.save_button.setEnabled(False)
+        run_async(database.save_tests_bulk, [test], self.creator_id,
+                  on_result=self.onTestSaved, on_error=self.onSaveFailed)
+
+    def onTestSaved(self, result):
+        self.save_button.setEnabled(True)
         QMessageBox.information(self, "Успех", "Тест успешно сохранен..")
         self.tests_page.return_to_previous_tab()
-        self.refresh_tests()
+
+    def onSaveFailed(self, error):
+        self.save_button.setEnabled(True)
+        QMessageBox.warning(self, "Ошибка", f"Не удалось сохранить тест: {error}")
 
     def closeEvent(self, event):
         self.tests_page.return_to_previous_tab()
@@ -178,10 +217,10 @@ class CreateTestPage(QWidget):
         buttons_layout = QHBoxLayout()
         close_button = QPushButton("Закрыть редактор")
         close_button.clicked.connect(self.close)
-        save_button = QPushButton("Сохранить тест")
-        save_button.clicked.connect(self.save_test)
+        self.save_button = QPushButton("Сохранить тест")
+        self.save_button.clicked.connect(self.save_test)
 
-        buttons_layout.addWidget(save_button)
+        buttons_layout.addWidget(self.save_button)
         buttons_layout.addWidget(close_button)
 
         layout.addLayout(buttons_layout)
@@ -195,6 +234,9 @@ class CreateTestPage(QWidget):
 
         self.test_name = QLineEdit(self)
         self.attempts_spinbox = QSpinBox(self)
+        self.draw_spinbox = QSpinBox(self)
+        self.draw_spinbox.setRange(0, 10000)
+        self.draw_spinbox.setSpecialValueText("Все")
 
         self.question_counter_label = QLabel("Вопросы: 0")
         add_question_button = QPushButton("Добавить вопрос")
@@ -203,6 +245,7 @@ class CreateTestPage(QWidget):
         test_info_layout = QFormLayout()
         test_info_layout.addRow("Название теста:", self.test_name)
         test_info_layout.addRow("Попытки:", self.attempts_spinbox)
+        test_info_layout.addRow("Вопросов в попытке:", self.draw_spinbox)
         test_info_layout.addRow(
             self.question_counter_label, add_question_button)
 
@@ -233,12 +276,12 @@ class CreateTestPage(QWidget):
 
         add_image_button = QPushButton("Добавить изображениеe")
         add_image_button.clicked.connect(
-            lambda: self.addImageToQuestion(image_label))
+            lambda _, gb=group_box: self.addImageToQuestion(gb, image_label))
         header_layout.addWidget(add_image_button)
 
         remove_image_button = QPushButton("Удалить изображение")
         remove_image_button.clicked.connect(
-            lambda: self.removeImageFromQuestion(image_label))
+            lambda _, gb=group_box: self.removeImageFromQuestion(gb, image_label))
         header_layout.addWidget(remove_image_button)
 
         delete_question_button = QPushButton("Удалить вопрос")
@@ -276,9 +319,10 @@ class CreateTestPage(QWidget):
             "layout": answers_layout,
             "type": "Единственный правильный ответ",
             "answers": [],
+            "image": None,
         }
 
-    def addImageToQuestion(self, image_label):
+    def addImageToQuestion(self, group_box, image_label):
         options = QFileDialog.Options()
         options |= QFileDialog.ReadOnly
 
@@ -291,12 +335,25 @@ class CreateTestPage(QWidget):
         )
 
         if file_name:
-            pixmap = QPixmap(file_name)
-            image_label.setPixmap(pixmap)
-            image_label.setFixedSize(200, 200)
-            image_label.setVisible(True)
-
-    def removeImageFromQuestion(self, image_label):
+            # Hashing and thumbnailing happen on the worker pool; the
+            # result is what gets stored when the test is saved.
+            run_async(image_loader.read_image_file, file_name,
+                      on_result=lambda image: self.showQuestionImage(
+                          group_box, image_label, image),
+                      on_error=lambda error: QMessageBox.warning(
+                          self, "Ошибка", str(error)))
+
+    def showQuestionImage(self, group_box, image_label, image):
+        if group_box not in self.answer_widgets:
+            return
+        self.answer_widgets[group_box]["image"] = image
+        image_label.setPixmap(QPixmap.fromImage(image["preview"]))
+        image_label.setFixedSize(image_loader.THUMBNAIL_SIZE,
+                                 image_loader.THUMBNAIL_SIZE)
+        image_label.setVisible(True)
+
+    def removeImageFromQuestion(self, group_box, image_label):
+        self.answer_widgets[group_box]["image"] = None
         image_label.clear()
         image_label.setVisible(False)
 
@@ -388,114 +445,361 @@ class CreateTestPage(QWidget):
         self.tabWidget.addTab(templateTab, "Шаблон")
 
 
+class QuestionSlot(QGroupBox):
+    # One reusable question box of a page. Answer buttons are kept between
+    # pages and only re-labelled; extra ones are hidden, not destroyed.
+    def __init__(self, on_toggled):
+        super().__init__()
+        self.on_toggled = on_toggled
+        self.question = None
+        self.layout = QVBoxLayout(self)
+
+        self.image_label = QLabel()
+        self.image_label.setAlignment(Qt.AlignCenter)
+        self.image_label.setFixedSize(image_loader.THUMBNAIL_SIZE,
+                                      image_loader.THUMBNAIL_SIZE)
+        self.layout.addWidget(self.image_label)
+
+        self.question_label = QLabel()
+        self.question_label.setWordWrap(True)
+        self.layout.addWidget(self.question_label)
+
+        self.button_group = QButtonGroup(self)
+        self.button_group.buttonToggled.connect(self.onButtonToggled)
+        self.buttons = []
+        self.single = None
+
+    def setQuestion(self, number, question, selected, image=None):
+        self.question = None
+        self.setTitle(f"Вопрос {number}")
+        if question.get("image_id") is not None:
+            if image is None:
+                self.image_label.clear()
+            else:
+                self.image_label.setPixmap(QPixmap.fromImage(image))
+            self.image_label.show()
+        else:
+            self.image_label.hide()
+        self.question_label.setText(question["text"])
+
+        single = question["type"] == "Единственный правильный ответ"
+        if single != self.single:
+            for button in self.buttons:
+                self.button_group.removeButton(button)
+                button.deleteLater()
+            self.buttons = []
+            self.single = single
+        while len(self.buttons) < len(question["answers"]):
+            button = QRadioButton() if single else QCheckBox()
+            self.button_group.addButton(button)
+            self.layout.addWidget(button)
+            self.buttons.append(button)
+
+        # Unchecking every button of an exclusive group needs it off for a moment.
+        self.button_group.setExclusive(False)
+        for button, answer in zip(self.buttons, question["answers"]):
+            button.setText(answer["text"])
+            button.setProperty("answer_id", answer["id"])
+            button.setChecked(answer["id"] in selected)
+            button.show()
+        for button in self.buttons[len(question["answers"]):]:
+            button.setChecked(False)
+            button.hide()
+        self.button_group.setExclusive(single)
+        self.question = question
+
+    def onButtonToggled(self, button, checked):
+        if self.question is not None:
+            self.on_toggled(self.question["id"],
+                            button.property("answer_id"), checked)
+
+
 class TakeTestPage(QWidget):
+    QUESTIONS_PER_PAGE = 10
+    # Answers are saved to the attempt draft at most this often; changes in
+    # between are coalesced into one small transaction.
+    DRAFT_SAVE_MS = 3000
+
     def __init__(self, test_id, main_window, student_window):
         super().__init__()
         self.test_id = test_id
         self.main_window = main_window
         self.student_window = student_window
         self.test_submitted = False
-        self.test_details = database.get_test_details(self.test_id)
-        self.test_name = self.test_details["name"]
+        self.test_details = None
+        # question id -> set of chosen answer ids; the only answer state.
+        self.selected = {}
+        # page -> (questions, thumbnails); only pages next to the current
+        # one are kept, the rest are fetched again when revisited.
+        self.pages = {}
+        self.pending_pages = set()
+        self.current_page = 0
+        self.slots = []
+        # Questions changed since the last draft save.
+        self.draft_dirty = set()
+        self.draft_saving = False
+        self.pending_answers = None
         self.initUI()
 
     def initUI(self):
         layout = QVBoxLayout(self)
 
-        label = QLabel(f"Тест: {self.test_name}", self)
-        layout.addWidget(label)
+        self.title_label = QLabel("Загрузка теста...", self)
+        layout.addWidget(self.title_label)
 
         self.scrollArea = QScrollArea(self)
         self.questionsWidget = QWidget()
         self.questionsLayout = QVBoxLayout(self.questionsWidget)
+        self.questionsLayout.addStretch()
         self.scrollArea.setWidget(self.questionsWidget)
         self.scrollArea.setWidgetResizable(True)
         layout.addWidget(self.scrollArea)
 
-        submit_button = QPushButton("Отправить тест")
-        submit_button.clicked.connect(self.submitTest)
-        layout.addWidget(submit_button)
-
-        self.loadTest()
-
-    def loadTest(self):
-        self.test_details = database.get_test_details(self.test_id)
-
-        for question in self.test_details["questions"]:
-            self.addQuestion(question)
-
-    def addQuestion(self, question):
-        group_box = QGroupBox()
-        group_box_layout = QVBoxLayout(group_box)
-
-        if question.get("image_path"):
-            image_label = QLabel()
-            image_label.setAlignment(Qt.AlignCenter)
-            pixmap = QPixmap(question["image_path"])
-            image_label.setPixmap(pixmap)
-            image_label.setFixedSize(200, 200)
-            group_box_layout.addWidget(image_label)
-
-        question_label = QLabel(question["text"])
-        group_box_layout.addWidget(question_label)
-
-        answer_widgets = []
-        for answer in question["answers"]:
-            if question["type"] == "Единственный правильный ответ":
-                answer_widget = QRadioButton(answer["text"])
-            else:
-                answer_widget = QCheckBox(answer["text"])
-
-            answer_widget.setProperty("answer_id", answer["id"])
-            group_box_layout.addWidget(answer_widget)
-            answer_widgets.append(answer_widget)
+        navigation_layout = QHBoxLayout()
+        self.previous_button = QPushButton("Назад")
+        self.previous_button.clicked.connect(
+            lambda: self.showPage(self.current_page - 1))
+        self.page_label = QLabel()
+        self.page_label.setAlignment(Qt.AlignCenter)
+        self.next_button = QPushButton("Далее")
+        self.next_button.clicked.connect(
+            lambda: self.showPage(self.current_page + 1))
+        navigation_layout.addWidget(self.previous_button)
+        navigation_layout.addWidget(self.page_label)
+        navigation_layout.addWidget(self.next_button)
+        layout.addLayout(navigation_layout)
+
+        self.submit_button = QPushButton("Отправить тест")
+        self.submit_button.clicked.connect(self.submitTest)
+        self.submit_button.setEnabled(False)
+        layout.addWidget(self.submit_button)
+
+        self.previous_button.setEnabled(False)
+        self.next_button.setEnabled(False)
+
+        self.draftTimer = QTimer(self)
+        self.draftTimer.setSingleShot(True)
+        self.draftTimer.setInterval(self.DRAFT_SAVE_MS)
+        self.draftTimer.timeout.connect(self.saveDraft)
+        QApplication.instance().aboutToQuit.connect(self.saveDraftNow)
+
+        self.loader = AsyncLoader(self)
+        self.loader.load(self.startAttempt, self.main_window.user_id, self.test_id,
+                         self.QUESTIONS_PER_PAGE, on_result=self.loadTest)
+
+    @staticmethod
+    def startAttempt(student_id, test_id, page_size):
+        # A saved draft resumes with its own draw of questions; a draft the
+        # test has outgrown is dropped.
+        draft = database.get_attempt_draft(student_id, test_id)
+        test_details = database.start_test_attempt(
+            test_id, page_size, draft["question_ids"] if draft else None)
+        if test_details is None:
+            return None, {}, None
+        if draft is not None and draft["question_ids"] != test_details["question_ids"]:
+            database.delete_attempt_draft(student_id, test_id)
+            draft = None
+        images = image_loader.load_thumbnails(
+            image_loader.question_image_ids(test_details["questions"]))
+        return test_details, images, draft
+
+    @staticmethod
+    def loadPage(test_id, question_ids):
+        # Questions and their decoded thumbnails arrive together, so a
+        # prefetched page is shown without further decoding on the GUI thread.
+        questions = database.get_attempt_questions(test_id, question_ids)
+        images = image_loader.load_thumbnails(
+            image_loader.question_image_ids(questions))
+        return questions, images
+
+    def loadTest(self, attempt):
+        test_details, images, draft = attempt
+        if test_details is None:
+            self.title_label.setText("Тест не найден.")
+            return
+        self.test_details = test_details
+        self.test_name = test_details["name"]
+        self.title_label.setText(f"Тест: {self.test_name}")
+        self.pages[0] = (test_details["questions"], images)
+        self.submit_button.setEnabled(True)
+        page = 0
+        if draft is not None:
+            self.selected = draft["selected"]
+            page = min(draft["current_page"], self.pageCount() - 1)
+        self.showPage(page)
+
+    def pageCount(self):
+        question_count = len(self.test_details["question_ids"])
+        return max(1, -(-question_count // self.QUESTIONS_PER_PAGE))
+
+    def pageQuestionIds(self, page):
+        start = page * self.QUESTIONS_PER_PAGE
+        return self.test_details["question_ids"][start:start + self.QUESTIONS_PER_PAGE]
+
+    def requestPage(self, page):
+        if not 0 <= page < self.pageCount() or page in self.pages or page in self.pending_pages:
+            return
+        self.pending_pages.add(page)
+        run_async(self.loadPage, self.test_details["id"],
+                  self.pageQuestionIds(page),
+                  on_result=lambda loaded, page=page: self.onPageLoaded(page, *loaded),
+                  on_error=lambda error, page=page: self.onPageFailed(page, error))
+
+    def onPageLoaded(self, page, questions, images):
+        self.pending_pages.discard(page)
+        if abs(page - self.current_page) > 1:
+            return
+        self.pages[page] = (questions, images)
+        if page == self.current_page:
+            self.showPage(page)
+
+    def onPageFailed(self, page, error):
+        self.pending_pages.discard(page)
+        report_error(error)
+
+    def showPage(self, page):
+        self.current_page = page
+        page_count = self.pageCount()
+        self.page_label.setText(f"Страница {page + 1} из {page_count}")
+        self.previous_button.setEnabled(page > 0)
+        self.next_button.setEnabled(page + 1 < page_count)
+
+        for loaded_page in list(self.pages):
+            if abs(loaded_page - page) > 1:
+                del self.pages[loaded_page]
+
+        if page not in self.pages:
+            for slot in self.slots:
+                slot.hide()
+            self.requestPage(page)
+            return
 
-        question["answer_widgets"] = answer_widgets
-        self.questionsLayout.addWidget(group_box)
+        questions, images = self.pages[page]
+        while len(self.slots) < len(questions):
+            slot = QuestionSlot(self.onAnswerToggled)
+            self.questionsLayout.insertWidget(len(self.slots), slot)
+            self.slots.append(slot)
+        first_number = page * self.QUESTIONS_PER_PAGE + 1
+        for number, (slot, question) in enumerate(zip(self.slots, questions), first_number):
+            slot.setQuestion(number, question,
+                             self.selected.get(question["id"], set()),
+                             images.get(question.get("image_id")))
+            slot.show()
+        for slot in self.slots[len(questions):]:
+            slot.hide()
+        self.scrollArea.verticalScrollBar().setValue(0)
+
+        # Fetch the pages the student is most likely to open next.
+        self.requestPage(page + 1)
+        self.requestPage(page - 1)
+
+    def onAnswerToggled(self, question_id, answer_id, checked):
+        chosen = self.selected.setdefault(question_id, set())
+        if checked:
+            chosen.add(answer_id)
+        else:
+            chosen.discard(answer_id)
+        self.draft_dirty.add(question_id)
+        if not self.draftTimer.isActive() and not self.draft_saving:
+            self.draftTimer.start()
+
+    def draftArgs(self):
+        answers = {question_id: sorted(self.selected.get(question_id, ()))
+                   for question_id in self.draft_dirty}
+        self.draft_dirty = set()
+        return (self.main_window.user_id, self.test_details["id"],
+                self.test_details["question_ids"], self.current_page, answers)
+
+    def saveDraft(self):
+        if self.draft_saving or self.test_submitted or not self.draft_dirty:
+            return
+        args = self.draftArgs()
+        self.draft_saving = True
+        run_async(database.save_attempt_draft, *args,
+                  on_result=lambda _: self.onDraftSaved(),
+                  on_error=lambda error, answers=args[4]: self.onDraftFailed(answers, error))
+
+    def onDraftSaved(self):
+        self.draft_saving = False
+        if self.pending_answers is not None:
+            # Submitted while the save ran; the submit clears the draft, so
+            # it has to commit after the save.
+            answers, self.pending_answers = self.pending_answers, None
+            self.sendTestResults(answers)
+        elif self.draft_dirty and not self.test_submitted:
+            self.draftTimer.start()
+
+    def onDraftFailed(self, answers, error):
+        self.draft_dirty.update(answers)
+        self.onDraftSaved()
+        report_error(error)
+
+    def saveDraftNow(self):
+        # Closing or quitting: the event loop may not run again, so the
+        # last changes are written on this thread.
+        self.draftTimer.stop()
+        if self.test_submitted or self.test_details is None or not self.draft_dirty:
+            return
+        try:
+            database.save_attempt_draft(*self.draftArgs())
+        except Exception as error:
+            report_error(error)
 
+    @profiled_action
     def submitTest(self):
-        answers = []
-        for question in self.test_details["questions"]:
-            selected_answers = []
-            for widget in question["answer_widgets"]:
-                if widget.isChecked():
-                    selected_answers.append(widget.property("answer_id"))
+        if self.test_submitted or self.test_details is None:
+            return
 
+        answers = []
+        for question_id in self.test_details["question_ids"]:
+            selected_answers = sorted(self.selected.get(question_id, ()))
             if not selected_answers:
                 selected_answers.append(None)
 
             answers.append(
-                {"question_id": question["id"], "selected_answers": selected_answers})
+                {"question_id": question_id, "selected_answers": selected_answers})
 
-        self.sendTestResults(answers)
-        self.updateTestAttempts()
         self.test_submitted = True
-        self.student_window.sidebar.setEnabled(True)
-        self.switchToMainMenu()
+        self.submit_button.setEnabled(False)
+        self.draftTimer.stop()
+        if self.draft_saving:
+            self.pending_answers = answers
+        else:
+            self.sendTestResults(answers)
 
     def switchToMainMenu(self):
         self.student_window.stack.setCurrentWidget(
             self.student_window.tests_page)
 
-    def updateTestAttempts(self):
-        student_id = self.main_window.user_id
-        test_id = self.test_id
+    def sendTestResults(self, answers):
+        run_async(self.recordTestResults, self.main_window.user_id,
+                  self.test_details["id"], answers, self.test_details["question_ids"],
+                  on_result=self.updateTestAttempts, on_error=self.onSubmitFailed)
 
-        attempts_left = database.get_remaining_attempts(student_id, test_id)
-        if attempts_left <= 0:
-            QMessageBox.information(
-                self, "Тест завершен", "Вы исчерпали все попытки для этого теста.")
+    @staticmethod
+    def recordTestResults(student_id, test_id, answers, question_ids):
+        database.record_test_results(student_id, test_id, answers, question_ids)
+        return database.get_remaining_attempts(student_id, test_id)
 
-    def sendTestResults(self, answers):
-        student_id = self.main_window.user_id
-        test_id = self.test_details["id"]
-        database.record_test_results(student_id, test_id, answers)
+    def updateTestAttempts(self, attempts_left):
         QMessageBox.information(self, "Тест отправлен",
                                 "Ваши ответы были успешно сохранены.")
+        if attempts_left is not None and attempts_left <= 0:
+            QMessageBox.information(
+                self, "Тест завершен", "Вы исчерпали все попытки для этого теста.")
+        self.student_window.sidebar.setEnabled(True)
+        self.switchToMainMenu()
+
+    def onSubmitFailed(self, error):
+        self.test_submitted = False
+        self.submit_button.setEnabled(True)
+        QMessageBox.warning(self, "Ошибка",
+                            f"Не удалось сохранить ответы: {error}")
 
     def closeEvent(self, event):
-        if not self.test_submitted:
-            self.submitTest()
+        # The attempt stays open; its draft is restored when the test is
+        # taken again.
+        self.saveDraftNow()
 
         self.student_window.sidebar.setEnabled(True)
         event.accept()
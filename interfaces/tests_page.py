@@ -1,10 +1,17 @@
 # interfaces\tests_page.py
 
-from PyQt5.QtWidgets import (QWidget, QPushButton, QVBoxLayout,
+import html
+
+from PyQt5.QtWidgets import (QWidget, QPushButton, QVBoxLayout, QLabel, QLineEdit,
                              QHBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox)
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 import database
+import events
 from .test_page import CreateTestPage, ViewTestPage
+from .db_worker import AsyncLoader, bind_loading, run_async
+from .action_profiler import profiled_action
+from .change_feed import ChangeSync, row_ids
+from . import event_bus
 
 
 class TestsPage(QWidget):
@@ -17,6 +24,30 @@ class TestsPage(QWidget):
     def initUI(self):
         layout = QVBoxLayout(self)
 
+        self.searchInput = QLineEdit(self)
+        self.searchInput.setPlaceholderText("Поиск по тестам, вопросам и ответам")
+        self.searchInput.setClearButtonEnabled(True)
+        self.searchInput.textChanged.connect(self.onSearchTextChanged)
+        layout.addWidget(self.searchInput)
+
+        self.searchTimer = QTimer(self)
+        self.searchTimer.setSingleShot(True)
+        self.searchTimer.setInterval(250)
+        self.searchTimer.timeout.connect(self.search)
+
+        self.searchTable = QTableWidget(self)
+        self.searchTable.setColumnCount(3)
+        self.searchTable.setHorizontalHeaderLabels(
+            ["Тест", "Где найдено", "Фрагмент"])
+        self.searchTable.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeToContents)
+        self.searchTable.horizontalHeader().setStretchLastSection(True)
+        self.searchTable.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.searchTable.setSelectionBehavior(QTableWidget.SelectRows)
+        self.searchTable.cellDoubleClicked.connect(self.openSearchResult)
+        self.searchTable.hide()
+        layout.addWidget(self.searchTable)
+
         self.tableWidget = QTableWidget(self)
         self.tableWidget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.tableWidget.setColumnCount(3)
@@ -24,7 +55,6 @@ class TestsPage(QWidget):
             ["Название Теста", "Описание", "Сделан"])
         self.tableWidget.horizontalHeader().setStretchLastSection(True)
         self.tableWidget.cellChanged.connect(self.onDescriptionEdited)
-        self.load_tests()
         layout.addWidget(self.tableWidget)
 
         button_layout = QHBoxLayout()
@@ -46,6 +76,62 @@ class TestsPage(QWidget):
 
         layout.addLayout(button_layout)
 
+        self.loader = AsyncLoader(self)
+        self.searchLoader = AsyncLoader(self)
+        bind_loading(self.loader, refresh_button)
+        self.changes = ChangeSync(self, ("tests",), self.load_tests,
+                                  self.fetchChanges, self.applyChanges,
+                                  busy=self.loader.isLoading)
+        event_bus.subscribe(self, (events.TestsSaved,), self.onTestsSaved)
+        event_bus.subscribe(self, (events.TestDeleted,), self.onTestDeleted)
+        self.changes.reload()
+
+    def creatorFilter(self):
+        if self.admin_window.main_window.user_role == "TEACHER":
+            return self.admin_window.main_window.user_id
+        return None
+
+    def onSearchTextChanged(self, text):
+        if text.strip():
+            self.searchTimer.start()
+        else:
+            self.searchTimer.stop()
+            self.searchLoader.cancel()
+            self.searchTable.hide()
+            self.tableWidget.show()
+
+    @profiled_action
+    def search(self):
+        self.searchLoader.load(database.search_tests, self.searchInput.text(),
+                               creator_id=self.creatorFilter(),
+                               on_result=self.showSearchResults)
+
+    def showSearchResults(self, results):
+        self.tableWidget.hide()
+        self.searchTable.show()
+        self.searchTable.clearContents()
+        self.searchTable.setRowCount(len(results))
+        for row, result in enumerate(results):
+            name_item = QTableWidgetItem(result["test_name"])
+            name_item.setData(Qt.UserRole, result["test_id"])
+            self.searchTable.setItem(row, 0, name_item)
+            self.searchTable.setItem(
+                row, 1, QTableWidgetItem(database.SEARCH_KINDS[result["kind"]]))
+            snippet = (html.escape(result["snippet"])
+                       .replace(database.SEARCH_MARK_START, "<b>")
+                       .replace(database.SEARCH_MARK_END, "</b>"))
+            snippet_label = QLabel(snippet)
+            snippet_label.setTextFormat(Qt.RichText)
+            self.searchTable.setCellWidget(row, 2, snippet_label)
+
+    @profiled_action
+    def openSearchResult(self, row, column):
+        test_id = self.searchTable.item(row, 0).data(Qt.UserRole)
+        view_test_page = ViewTestPage(self, test_id, self.admin_window)
+        self.admin_window.stack.addWidget(view_test_page)
+        self.admin_window.stack.setCurrentWidget(view_test_page)
+
+    @profiled_action
     def view_test(self):
         selected_rows = self.tableWidget.selectedItems()
         if not selected_rows:
@@ -59,10 +145,14 @@ class TestsPage(QWidget):
         self.admin_window.stack.setCurrentWidget(view_test_page)
 
     def load_tests(self):
-        tests = self.loadTest()
+        self.loader.load(self.loadTest, on_result=self.showTests)
+
+    def showTests(self, tests):
+        self.tableWidget.blockSignals(True)
         self.tableWidget.setRowCount(len(tests))
         for row, test in enumerate(tests):
             self.setupTestRow(row, test)
+        self.tableWidget.blockSignals(False)
 
     def setupTestRow(self, row, test):
         name_item = QTableWidgetItem(test["name"])
@@ -77,11 +167,44 @@ class TestsPage(QWidget):
         created_by_item.setFlags(created_by_item.flags() & ~Qt.ItemIsEditable)
         self.tableWidget.setItem(row, 2, created_by_item)
 
+    def fetchChanges(self, changes):
+        return self.fetchRows(row_ids(changes, "tests"))
+
+    def fetchRows(self, test_ids):
+        return test_ids, database.get_tests_by_ids(test_ids, self.creatorFilter())
+
+    def onTestsSaved(self, event):
+        self.changes.patch(self.fetchRows, event.test_ids)
+
+    def onTestDeleted(self, event):
+        self.applyChanges(({event.test_id}, []))
+
+    def applyChanges(self, rows):
+        test_ids, tests = rows
+        found = {test["id"]: test for test in tests}
+        rows_by_id = {self.tableWidget.item(row, 0).data(Qt.UserRole): row
+                      for row in range(self.tableWidget.rowCount())
+                      if self.tableWidget.item(row, 0) is not None}
+        self.tableWidget.blockSignals(True)
+        for test_id in sorted(test_ids, key=lambda id: rows_by_id.get(id, -1), reverse=True):
+            row = rows_by_id.get(test_id)
+            test = found.get(test_id)
+            if test is None:
+                if row is not None:
+                    self.tableWidget.removeRow(row)
+            elif row is None:
+                row = self.tableWidget.rowCount()
+                self.tableWidget.insertRow(row)
+                self.setupTestRow(row, test)
+            else:
+                self.setupTestRow(row, test)
+        self.tableWidget.blockSignals(False)
+
     def onDescriptionEdited(self, row, column):
         if column == 1:
             test_id = self.tableWidget.item(row, 0).data(Qt.UserRole)
             new_description = self.tableWidget.item(row, column).text()
-            database.updateTestDescription(test_id, new_description)
+            run_async(database.updateTestDescription, test_id, new_description)
 
     def loadTest(self):
         test_details = None
@@ -96,8 +219,7 @@ class TestsPage(QWidget):
     def create_test(self):
         self.current_tab_index = self.admin_window.stack.currentIndex()
         logged_in_user_id = self.admin_window.main_window.logged_in_user_id
-        create_test_dialog = CreateTestPage(
-            self, logged_in_user_id, self.refresh_tests)
+        create_test_dialog = CreateTestPage(self, logged_in_user_id)
         self.create_test_dialog = create_test_dialog
         self.admin_window.stack.addWidget(create_test_dialog)
         self.admin_window.stack.setCurrentWidget(create_test_dialog)
@@ -105,14 +227,16 @@ class TestsPage(QWidget):
     def return_to_previous_tab(self):
         self.admin_window.stack.setCurrentIndex(self.current_tab_index)
 
+    @profiled_action
     def delete_test(self):
         selected_rows = self.tableWidget.selectedItems()
         if not selected_rows:
             return
         row = selected_rows[0].row()
         test_id = self.tableWidget.item(row, 0).data(Qt.UserRole)
-        database.delete_test(test_id)
+        run_async(database.delete_test, test_id)
         self.tableWidget.removeRow(row)
 
+    @profiled_action
     def refresh_tests(self):
-        self.load_tests()
+        self.changes.reload()
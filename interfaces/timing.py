@@ -0,0 +1,62 @@
+# interfaces\timing.py
+
+import os
+import sys
+import time
+
+from PyQt5.QtCore import QEvent, QObject, QTimer
+
+LOGIN_TO_FIRST_PAINT = "login_to_first_paint"
+STARTUP_IMPORTS = "startup_imports"
+STARTUP_SETUP_DATABASE = "startup_setup_database"
+STARTUP_FIRST_PAINT = "startup_first_paint"
+
+PROFILE_FLAG = "--profile-startup"
+PROFILE_ENV = "TMS_PROFILE_STARTUP"
+
+# Measurements are always kept for the settings page; they are only printed
+# when the application runs with --profile-startup or TMS_PROFILE_STARTUP=1.
+enabled = (PROFILE_FLAG in sys.argv
+           or os.environ.get(PROFILE_ENV, "") not in ("", "0"))
+
+# name -> seconds of the last finished measurement
+results = {}
+
+_started = {}
+
+
+def start(name, started=None):
+    _started[name] = time.perf_counter() if started is None else started
+
+
+def record(name, seconds):
+    results[name] = seconds
+    if enabled:
+        print(f"{name}: {seconds * 1000:.1f} ms (modules loaded: {len(sys.modules)})")
+    return seconds
+
+
+def stop(name):
+    started = _started.pop(name, None)
+    if started is None:
+        return None
+    return record(name, time.perf_counter() - started)
+
+
+class _FirstPaintWatcher(QObject):
+    def __init__(self, widget, name):
+        super().__init__(widget)
+        self.name = name
+        widget.installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Paint:
+            watched.removeEventFilter(self)
+            # The filter sees the event before the widget paints; stopping
+            # from the next loop iteration includes the whole paint pass.
+            QTimer.singleShot(0, lambda: stop(self.name))
+        return False
+
+
+def stop_on_first_paint(widget, name):
+    _FirstPaintWatcher(widget, name)
@@ -0,0 +1,159 @@
+# interfaces\watchdog.py
+
+import logging
+import logging.handlers
+import sys
+import threading
+import time
+from collections import Counter, deque
+
+from PyQt5.QtCore import QObject, QTimer, Qt
+
+import settings
+
+HEARTBEAT_MS = 50
+SAMPLE_MS = 20
+MAX_SAMPLES = 500
+STACK_LINES = 15
+
+LOG_PATH = "ui_stalls.log"
+LOG_MAX_BYTES = 512 * 1024
+LOG_BACKUPS = 3
+
+_logger = None
+_watchdog = None
+
+
+def _get_logger():
+    global _logger
+    if _logger is None:
+        _logger = logging.getLogger("ui_stalls")
+        _logger.setLevel(logging.INFO)
+        _logger.propagate = False
+        handler = logging.handlers.RotatingFileHandler(
+            LOG_PATH, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        _logger.addHandler(handler)
+    return _logger
+
+
+def _stack(frame):
+    frames = []
+    while frame is not None:
+        code = frame.f_code
+        frames.append((code.co_filename, frame.f_lineno, code.co_qualname))
+        frame = frame.f_back
+    frames.reverse()
+    return tuple(frames)
+
+
+def _slot_name(stack):
+    # The outermost frame is the script blocked in app.exec_(); the next one
+    # is the Python callable Qt invoked: a slot, event handler or paint().
+    if len(stack) < 2:
+        return "(Qt)"
+    return stack[1][2]
+
+
+class StallWatchdog(QObject):
+    # A heartbeat timer on the GUI thread notes when the event loop last ran.
+    # A side thread samples the GUI thread's stack while a beat is overdue,
+    # and the next beat logs the stall with the most frequent stack.
+    def __init__(self, threshold_ms, parent=None):
+        super().__init__(parent)
+        self.threshold = threshold_ms / 1000
+        self.main_ident = threading.get_ident()
+        self.last_beat = time.perf_counter()
+        self.samples = []
+        self.lock = threading.Lock()
+        self.recent = deque(maxlen=20)
+        self.stall_count = 0
+
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.beat)
+        self.timer.start(HEARTBEAT_MS)
+
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(
+            target=self.sample, name="stall-watchdog", daemon=True)
+        self.thread.start()
+
+    def overdue(self, now):
+        return now - self.last_beat - HEARTBEAT_MS / 1000
+
+    def beat(self):
+        now = time.perf_counter()
+        late = self.overdue(now)
+        self.last_beat = now
+        with self.lock:
+            samples, self.samples = self.samples, []
+        if late >= self.threshold:
+            self.record(late, samples)
+
+    def sample(self):
+        while not self.stopped.wait(SAMPLE_MS / 1000):
+            if self.overdue(time.perf_counter()) < self.threshold:
+                continue
+            frame = sys._current_frames().get(self.main_ident)
+            if frame is None:
+                continue
+            stack = _stack(frame)
+            del frame
+            with self.lock:
+                if len(self.samples) < MAX_SAMPLES:
+                    self.samples.append(stack)
+
+    def record(self, seconds, samples):
+        self.stall_count += 1
+        if samples:
+            stack, hits = Counter(samples).most_common(1)[0]
+            slot = _slot_name(stack)
+        else:
+            # Too short to be sampled, or spent in Qt without Python frames.
+            stack, hits, slot = (), 0, "(не определен)"
+        stall = {
+            "at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "ms": round(seconds * 1000),
+            "slot": slot,
+        }
+        self.recent.append(stall)
+
+        lines = [f"stall {stall['ms']} ms in {slot} ({hits}/{len(samples)} samples)"]
+        lines.extend(f"  {filename}:{line} {name}"
+                     for filename, line, name in stack[-STACK_LINES:])
+        _get_logger().warning("\n".join(lines))
+
+    def stop(self):
+        self.timer.stop()
+        self.stopped.set()
+
+
+def threshold_ms():
+    return settings.get("stall_threshold_ms")
+
+
+def set_threshold_ms(value):
+    # 0 turns the watchdog off.
+    settings.save("stall_threshold_ms", value)
+    stop()
+    start()
+
+
+def start():
+    global _watchdog
+    if _watchdog is None and threshold_ms() > 0:
+        _watchdog = StallWatchdog(threshold_ms())
+    return _watchdog
+
+
+def stop():
+    global _watchdog
+    if _watchdog is not None:
+        _watchdog.stop()
+        _watchdog.deleteLater()
+        _watchdog = None
+
+
+def current():
+    return _watchdog
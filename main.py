@@ -1,14 +1,18 @@
 # main.py
 
+import time
+
+# Taken before the heavy imports so --profile-startup can report their cost.
+STARTED = time.perf_counter()
+
 from PyQt5.QtWidgets import QApplication, QMainWindow, QStackedWidget
 import sys
-from interfaces import LoginWindow, AdminWindow, TeacherWindow, StudentWindow
+from interfaces import LoginWindow
+from interfaces import db_worker, icons, timing, watchdog
 import database
+import connection
 
-
-def load_stylesheet(path):
-    with open(path, "r") as f:
-        return f.read()
+IMPORTED = time.perf_counter()
 
 
 class MainWindow(QMainWindow):
@@ -20,8 +24,7 @@ class MainWindow(QMainWindow):
         self.central_widget = QStackedWidget()
         self.setCentralWidget(self.central_widget)
 
-        style = load_stylesheet("resources/styles/main_style.css")
-        self.setStyleSheet(style)
+        self.setStyleSheet(icons.stylesheet("main_style.css"))
 
         self.login_window = LoginWindow(self)
         self.central_widget.addWidget(self.login_window)
@@ -30,22 +33,42 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Система управления тестами и результатами")
         self.central_widget.setCurrentWidget(self.login_window)
 
+    # Each role package is imported on its first login, so a session only
+    # loads the modules of its own role.
     def initAdminWindow(self):
+        timing.start("import_admin")
+        from interfaces.admin import AdminWindow
+        timing.stop("import_admin")
         self.admin_window = AdminWindow(self)
         self.central_widget.addWidget(self.admin_window)
 
     def initTeacherWindow(self):
+        timing.start("import_teacher")
+        from interfaces.teacher import TeacherWindow
+        timing.stop("import_teacher")
         self.teacher_window = TeacherWindow(self)
         self.central_widget.addWidget(self.teacher_window)
 
     def initStudentWindow(self):
+        timing.start("import_student")
+        from interfaces.student import StudentWindow
+        timing.stop("import_student")
         self.student_window = StudentWindow(self)
         self.central_widget.addWidget(self.student_window)
 
 
 if __name__ == "__main__":
+    timing.record(timing.STARTUP_IMPORTS, IMPORTED - STARTED)
+    timing.start(timing.STARTUP_SETUP_DATABASE)
     database.setup_database()
+    timing.stop(timing.STARTUP_SETUP_DATABASE)
     app = QApplication(sys.argv)
+    app.aboutToQuit.connect(db_worker.wait_for_done)
+    app.aboutToQuit.connect(connection.close_all)
+    app.aboutToQuit.connect(watchdog.stop)
+    watchdog.start()
+    timing.start(timing.STARTUP_FIRST_PAINT, STARTED)
     main_window = MainWindow()
+    timing.stop_on_first_paint(main_window.login_window, timing.STARTUP_FIRST_PAINT)
     main_window.show()
     sys.exit(app.exec_())
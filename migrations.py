@@ -0,0 +1,482 @@
+# migrations.py
+
+import grading
+
+# Each migration moves the schema from PRAGMA user_version N-1 to N. Append
+# new steps to MIGRATIONS; never edit one that has already shipped.
+
+
+def _initial_schema(conn):
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            username TEXT NOT NULL UNIQUE,
+            password TEXT NOT NULL,
+            role TEXT NOT NULL
+        );
+    """
+    )
+
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS groups (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE
+        );
+    """
+    )
+
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS tests (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            description TEXT,
+            total_marks INTEGER,
+            attempts INTEGER NOT NULL,
+            creator_id INTEGER,  -- Foreign key referencing the users table
+            FOREIGN KEY(creator_id) REFERENCES users(id)
+        );
+    """
+    )
+
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS user_groups (
+            user_id INTEGER NOT NULL,
+            group_id INTEGER NOT NULL,
+            PRIMARY KEY(user_id, group_id),
+            FOREIGN KEY(user_id) REFERENCES users(id),
+            FOREIGN KEY(group_id) REFERENCES groups(id)
+        );
+    """
+    )
+
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS student_tests (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            student_id INTEGER NOT NULL,
+            test_id INTEGER NOT NULL,
+            assigner_id INTEGER NOT NULL,
+            remaining_attempts INTEGER,
+            FOREIGN KEY(student_id) REFERENCES users(id),
+            FOREIGN KEY(test_id) REFERENCES tests(id),
+            FOREIGN KEY(assigner_id) REFERENCES users(id),
+            UNIQUE(student_id, test_id)
+        );
+        """
+    )
+
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS questions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            test_id INTEGER NOT NULL,
+            text TEXT NOT NULL,
+            type TEXT NOT NULL,
+            FOREIGN KEY(test_id) REFERENCES tests(id)
+        );
+    """
+    )
+
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS answers (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            question_id INTEGER NOT NULL,
+            text TEXT NOT NULL,
+            is_correct BOOLEAN NOT NULL,
+            FOREIGN KEY(question_id) REFERENCES questions(id)
+        );
+    """
+    )
+
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS student_answers (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            test_results_id INTEGER NOT NULL,
+            question_id INTEGER NOT NULL,
+            selected_answer INTEGER NOT NULL,
+            FOREIGN KEY(test_results_id) REFERENCES test_results(id),
+            FOREIGN KEY(question_id) REFERENCES questions(id)
+        );
+    """
+    )
+
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS test_results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            student_id INTEGER NOT NULL,
+            test_id INTEGER NOT NULL,
+            FOREIGN KEY(student_id) REFERENCES users(id),
+            FOREIGN KEY(test_id) REFERENCES tests(id)
+        );
+    """
+    )
+
+    conn.execute(
+        "INSERT OR IGNORE INTO users (name, username, password, role) VALUES ('Admin User', 'admin', 'admin', 'ADMIN')"
+    )
+    conn.execute(
+        "INSERT OR IGNORE INTO users (name, username, password, role) VALUES ('Teacher User', 'teacher', 'teacher', 'TEACHER')"
+    )
+    conn.execute(
+        "INSERT OR IGNORE INTO users (name, username, password, role) VALUES ('Student User', 'student', 'student', 'STUDENT')"
+    )
+
+
+def _add_indexes(conn):
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_student_tests_test ON student_tests(test_id)")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_questions_test ON questions(test_id)")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_answers_question ON answers(question_id)")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_student_answers_result ON student_answers(test_results_id)")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_test_results_student_test ON test_results(student_id, test_id)")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_user_groups_group ON user_groups(group_id)")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_users_role ON users(role)")
+    conn.execute("ANALYZE")
+
+
+def _add_test_versions(conn):
+    conn.execute(
+        "ALTER TABLE tests ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+    conn.execute(
+        """
+        CREATE TRIGGER tests_version_on_update
+        AFTER UPDATE OF name, description, total_marks, attempts ON tests
+        BEGIN
+            UPDATE tests SET version = version + 1 WHERE id = NEW.id;
+        END;
+    """
+    )
+    for event, row in (("INSERT", "NEW"), ("UPDATE", "NEW"), ("DELETE", "OLD")):
+        conn.execute(
+            f"""
+            CREATE TRIGGER questions_version_on_{event.lower()}
+            AFTER {event} ON questions
+            BEGIN
+                UPDATE tests SET version = version + 1 WHERE id = {row}.test_id;
+            END;
+        """
+        )
+        conn.execute(
+            f"""
+            CREATE TRIGGER answers_version_on_{event.lower()}
+            AFTER {event} ON answers
+            BEGIN
+                UPDATE tests SET version = version + 1
+                WHERE id = (SELECT test_id FROM questions WHERE id = {row}.question_id);
+            END;
+        """
+        )
+
+
+def _add_attempt_scores(conn):
+    conn.execute("ALTER TABLE test_results ADD COLUMN score INTEGER")
+    conn.execute("ALTER TABLE test_results ADD COLUMN max_score INTEGER")
+    conn.execute("ALTER TABLE test_results ADD COLUMN question_results TEXT")
+    conn.execute("ALTER TABLE test_results ADD COLUMN submitted_at TEXT")
+
+    # Grade the attempts recorded before scores were stored.
+    questions_by_test = {}
+    for test_id, question_id, answer_id, is_correct in conn.execute(
+        """
+        SELECT q.test_id, q.id, a.id, a.is_correct
+        FROM questions q
+        LEFT JOIN answers a ON q.id = a.question_id
+        WHERE q.test_id IN (SELECT test_id FROM test_results)
+        ORDER BY q.test_id, q.id, a.id
+    """
+    ):
+        questions = questions_by_test.setdefault(test_id, {})
+        question = questions.setdefault(
+            question_id, {"id": question_id, "answers": []})
+        if answer_id is not None:
+            question["answers"].append(
+                {"id": answer_id, "is_correct": is_correct})
+
+    selected_by_attempt = {}
+    for test_results_id, question_id, answer_id in conn.execute(
+        "SELECT test_results_id, question_id, selected_answer FROM student_answers"
+    ):
+        selected_by_attempt.setdefault(test_results_id, {}).setdefault(
+            question_id, set()).add(answer_id)
+
+    updates = []
+    for test_results_id, test_id in conn.execute(
+            "SELECT id, test_id FROM test_results").fetchall():
+        score, max_score, results = grading.grade_attempt(
+            questions_by_test.get(test_id, {}).values(),
+            selected_by_attempt.get(test_results_id, {}))
+        updates.append((score, max_score, grading.encode_results(results),
+                        test_results_id))
+    conn.executemany(
+        "UPDATE test_results SET score = ?, max_score = ?, question_results = ? WHERE id = ?",
+        updates,
+    )
+
+
+def _add_search_index(conn):
+    # One FTS5 row per test, question and answer. The rowid encodes the
+    # source row (id * 4 + kind) so triggers can replace it by rowid.
+    conn.execute(
+        """
+        CREATE VIRTUAL TABLE search_index USING fts5(
+            content,
+            kind UNINDEXED,
+            test_id UNINDEXED,
+            tokenize = 'unicode61 remove_diacritics 2'
+        );
+    """
+    )
+    sources = {
+        "tests": ("test", 1, "NEW.id",
+                  "NEW.name || coalesce(' ' || NEW.description, '')", "name, description"),
+        "questions": ("question", 2, "NEW.test_id", "NEW.text", "test_id, text"),
+        "answers": ("answer", 3, "(SELECT test_id FROM questions WHERE id = NEW.question_id)",
+                    "NEW.text", "question_id, text"),
+    }
+    for table, (kind, code, test_id, content, columns) in sources.items():
+        insert = (
+            f"INSERT INTO search_index (rowid, kind, test_id, content) "
+            f"VALUES (NEW.id * 4 + {code}, '{kind}', {test_id}, {content});"
+        )
+        conn.execute(
+            f"""
+            CREATE TRIGGER {table}_search_on_insert AFTER INSERT ON {table}
+            BEGIN
+                {insert}
+            END;
+        """
+        )
+        conn.execute(
+            f"""
+            CREATE TRIGGER {table}_search_on_update AFTER UPDATE OF {columns} ON {table}
+            BEGIN
+                DELETE FROM search_index WHERE rowid = OLD.id * 4 + {code};
+                {insert}
+            END;
+        """
+        )
+        conn.execute(
+            f"""
+            CREATE TRIGGER {table}_search_on_delete AFTER DELETE ON {table}
+            BEGIN
+                DELETE FROM search_index WHERE rowid = OLD.id * 4 + {code};
+            END;
+        """
+        )
+
+    conn.execute(
+        """
+        INSERT INTO search_index (rowid, kind, test_id, content)
+        SELECT id * 4 + 1, 'test', id, name || coalesce(' ' || description, '') FROM tests
+    """
+    )
+    conn.execute(
+        """
+        INSERT INTO search_index (rowid, kind, test_id, content)
+        SELECT id * 4 + 2, 'question', test_id, text FROM questions
+    """
+    )
+    conn.execute(
+        """
+        INSERT INTO search_index (rowid, kind, test_id, content)
+        SELECT a.id * 4 + 3, 'answer', q.test_id, a.text
+        FROM answers a
+        JOIN questions q ON q.id = a.question_id
+    """
+    )
+
+
+def _add_question_pools(conn):
+    # A section is a pool of questions of which draw_count are drawn per
+    # attempt. pool_position numbers a pool densely from 0 to pool_size - 1
+    # so a draw picks random positions and fetches them by index.
+    conn.execute(
+        """
+        CREATE TABLE test_sections (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            test_id INTEGER NOT NULL,
+            name TEXT,
+            position INTEGER NOT NULL DEFAULT 0,
+            draw_count INTEGER,  -- NULL draws the whole pool
+            pool_size INTEGER NOT NULL DEFAULT 0,
+            FOREIGN KEY(test_id) REFERENCES tests(id)
+        );
+    """
+    )
+    conn.execute(
+        "CREATE INDEX idx_test_sections_test ON test_sections (test_id, position)")
+    conn.execute(
+        "ALTER TABLE questions ADD COLUMN section_id INTEGER REFERENCES test_sections(id)")
+    conn.execute("ALTER TABLE questions ADD COLUMN pool_position INTEGER")
+    conn.execute(
+        "CREATE UNIQUE INDEX idx_questions_pool ON questions (section_id, pool_position)")
+    conn.execute("ALTER TABLE test_results ADD COLUMN question_order BLOB")
+
+    conn.execute(
+        """
+        CREATE TRIGGER questions_pool_on_insert
+        AFTER INSERT ON questions WHEN NEW.section_id IS NOT NULL
+        BEGIN
+            UPDATE questions
+            SET pool_position = (SELECT pool_size FROM test_sections WHERE id = NEW.section_id)
+            WHERE id = NEW.id;
+            UPDATE test_sections SET pool_size = pool_size + 1 WHERE id = NEW.section_id;
+        END;
+    """
+    )
+    # Deleting from the middle of a pool moves the last question into the
+    # hole, keeping positions dense without renumbering the pool.
+    conn.execute(
+        """
+        CREATE TRIGGER questions_pool_on_delete
+        AFTER DELETE ON questions WHEN OLD.section_id IS NOT NULL
+        BEGIN
+            UPDATE test_sections SET pool_size = pool_size - 1 WHERE id = OLD.section_id;
+            UPDATE questions SET pool_position = OLD.pool_position
+            WHERE section_id = OLD.section_id
+              AND pool_position = (SELECT pool_size FROM test_sections WHERE id = OLD.section_id);
+        END;
+    """
+    )
+
+
+def _add_images(conn):
+    # Images are stored once per distinct content (sha256) together with a
+    # pre-generated thumbnail; questions point at them through image_id.
+    conn.execute(
+        """
+        CREATE TABLE images (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            sha256 TEXT NOT NULL UNIQUE,
+            width INTEGER NOT NULL,
+            height INTEGER NOT NULL,
+            thumbnail BLOB NOT NULL,
+            data BLOB NOT NULL
+        );
+    """
+    )
+    conn.execute(
+        "ALTER TABLE questions ADD COLUMN image_id INTEGER REFERENCES images(id)")
+
+
+# table -> (row_id, ref_id) expressions logged for each changed row. Link
+# tables log the student or user as row_id and the other side as ref_id.
+CHANGE_LOG_KEYS = {
+    "users": ("id", "NULL"),
+    "groups": ("id", "NULL"),
+    "tests": ("id", "creator_id"),
+    "user_groups": ("user_id", "group_id"),
+    "student_tests": ("student_id", "test_id"),
+    "test_results": ("student_id", "test_id"),
+}
+
+
+def _add_change_log(conn):
+    conn.execute(
+        """
+        CREATE TABLE change_log (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            table_name TEXT NOT NULL,
+            row_id INTEGER NOT NULL,
+            ref_id INTEGER,
+            op TEXT NOT NULL  -- 'I', 'U' or 'D'
+        );
+    """
+    )
+    for table, (row_id, ref_id) in CHANGE_LOG_KEYS.items():
+        for event, row in (("INSERT", "NEW"), ("UPDATE", "NEW"), ("DELETE", "OLD")):
+            # tests_version_on_update bumps the version after every edit;
+            # that second update is not a change of its own.
+            columns = " OF name, description, total_marks, attempts, creator_id" \
+                if table == "tests" and event == "UPDATE" else ""
+            ref = "NULL" if ref_id == "NULL" else f"{row}.{ref_id}"
+            conn.execute(
+                f"""
+                CREATE TRIGGER {table}_change_log_on_{event.lower()}
+                AFTER {event}{columns} ON {table}
+                BEGIN
+                    INSERT INTO change_log (table_name, row_id, ref_id, op)
+                    VALUES ('{table}', {row}.{row_id}, {ref}, '{event[0]}');
+                END;
+            """
+            )
+
+
+def _add_attempt_drafts(conn):
+    # In-progress answers, saved a few seconds after each change and
+    # cleared when the attempt is submitted. draft_answers holds one row per
+    # answered question, so a save rewrites only the questions it touched.
+    conn.execute(
+        """
+        CREATE TABLE attempt_drafts (
+            student_id INTEGER NOT NULL,
+            test_id INTEGER NOT NULL,
+            question_order BLOB NOT NULL,  -- grading.encode_question_order
+            current_page INTEGER NOT NULL DEFAULT 0,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (student_id, test_id),
+            FOREIGN KEY(student_id) REFERENCES users(id),
+            FOREIGN KEY(test_id) REFERENCES tests(id)
+        );
+    """
+    )
+    conn.execute(
+        """
+        CREATE TABLE draft_answers (
+            student_id INTEGER NOT NULL,
+            test_id INTEGER NOT NULL,
+            question_id INTEGER NOT NULL,
+            answer_ids TEXT NOT NULL,  -- comma-separated answer ids
+            PRIMARY KEY (student_id, test_id, question_id)
+        ) WITHOUT ROWID;
+    """
+    )
+
+
+MIGRATIONS = [
+    _initial_schema,
+    _add_indexes,
+    _add_test_versions,
+    _add_attempt_scores,
+    _add_search_index,
+    _add_question_pools,
+    _add_images,
+    _add_change_log,
+    _add_attempt_drafts,
+]
+
+
+def schema_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn):
+    if schema_version(conn) >= len(MIGRATIONS):
+        return
+
+    # IMMEDIATE takes the write lock up front, so two machines starting at
+    # once cannot both apply the same step; the version is re-read under it.
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        version = schema_version(conn)
+        for number in range(version + 1, len(MIGRATIONS) + 1):
+            MIGRATIONS[number - 1](conn)
+            conn.execute(f"PRAGMA user_version = {number}")
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
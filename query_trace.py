@@ -0,0 +1,340 @@
+# query_trace.py
+
+import functools
+import inspect
+import json
+import sqlite3
+import threading
+import time
+from collections import deque
+
+import settings
+
+SLOW_LOG_PATH = "slow_queries.log"
+SLOW_LOG_ENTRIES = 200
+PARAMS_REPR_CHARS = 200
+EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE", "REPLACE")
+
+_lock = threading.Lock()
+_local = threading.local()
+# database.py function -> call and statement totals
+_functions = {}
+_slow = deque(maxlen=SLOW_LOG_ENTRIES)
+# sql -> EXPLAIN QUERY PLAN text, captured once per statement
+_plans = {}
+_enabled = None
+_installed = False
+
+
+def is_enabled():
+    global _enabled
+    if _enabled is None:
+        _enabled = bool(settings.get("sql_trace"))
+    return _enabled
+
+
+def set_enabled(enabled, persist=True):
+    global _enabled
+    _enabled = bool(enabled)
+    if _enabled:
+        # Before any caller takes a reference to a database function.
+        install()
+    if persist:
+        settings.save("sql_trace", _enabled)
+
+
+def threshold_ms():
+    return settings.get("slow_query_ms")
+
+
+def set_threshold_ms(value):
+    settings.save("slow_query_ms", value)
+
+
+def _current_function():
+    stack = _stack()
+    return stack[-1] if stack else None
+
+
+def _function_stats(name):
+    stats = _functions.get(name)
+    if stats is None:
+        stats = _functions[name] = {
+            "calls": 0, "seconds": 0.0, "max_seconds": 0.0,
+            "statements": 0, "statement_seconds": 0.0,
+        }
+    return stats
+
+
+def _add_call(name, seconds):
+    with _lock:
+        stats = _function_stats(name)
+        stats["calls"] += 1
+        stats["seconds"] += seconds
+        stats["max_seconds"] = max(stats["max_seconds"], seconds)
+
+
+def _stack():
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def _traced(name, fn):
+    if inspect.isgeneratorfunction(fn):
+        # Generators are timed while they are consumed, not when created.
+        @functools.wraps(fn)
+        def generator_wrapper(*args, **kwargs):
+            if not _enabled:
+                return (yield from fn(*args, **kwargs))
+            chunks = fn(*args, **kwargs)
+            seconds = 0.0
+            try:
+                while True:
+                    stack = _stack()
+                    stack.append(name)
+                    started = time.perf_counter()
+                    try:
+                        chunk = next(chunks)
+                    except StopIteration:
+                        return
+                    finally:
+                        seconds += time.perf_counter() - started
+                        stack.pop()
+                    yield chunk
+            finally:
+                chunks.close()
+                _add_call(name, seconds)
+        return generator_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return fn(*args, **kwargs)
+        stack = _stack()
+        stack.append(name)
+        started = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            stack.pop()
+            _add_call(name, time.perf_counter() - started)
+    return wrapper
+
+
+def install():
+    # Wraps the public functions of database.py once; the wrappers pass
+    # straight through while tracing is off. Callers and database.py itself
+    # look the functions up on the module, so they all see the wrappers.
+    # A reference taken with `from database import ...` before install()
+    # is never wrapped: its statements are still traced by TracingCursor,
+    # but count under "(вне database.py)" instead of the function.
+    global _installed
+    if _installed:
+        return
+    import database
+    for name, value in list(vars(database).items()):
+        if (inspect.isfunction(value) and value.__module__ == database.__name__
+                and not name.startswith("_")):
+            setattr(database, name, _traced(name, value))
+    _installed = True
+
+
+def _plan(conn, sql, parameters):
+    plan = _plans.get(sql)
+    if plan is not None:
+        return plan
+    if not sql.lstrip().upper().startswith(EXPLAINABLE):
+        return ""
+    try:
+        # A plain cursor, so the EXPLAIN itself is not traced.
+        rows = sqlite3.Cursor(conn).execute(
+            "EXPLAIN QUERY PLAN " + sql, parameters).fetchall()
+    except (sqlite3.Error, ValueError) as error:
+        return f"(план недоступен: {error})"
+    # Rows are (id, parent, notused, detail); indent children under parents.
+    levels = {0: -1}
+    lines = []
+    for node_id, parent, _, detail in rows:
+        levels[node_id] = levels.get(parent, -1) + 1
+        lines.append("  " * levels[node_id] + detail)
+    plan = "\n".join(lines)
+    _plans[sql] = plan
+    return plan
+
+
+def _describe(value):
+    if isinstance(value, (str, bytes)):
+        return f"{type(value).__name__}[{len(value)}]"
+    return type(value).__name__
+
+
+def _describe_parameters(parameters):
+    # Only types and lengths reach the log: bound values include passwords
+    # and other personal data.
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{name}: {_describe(value)}"
+                               for name, value in parameters.items()) + "}"
+    return "(" + ", ".join(_describe(value) for value in parameters) + ")"
+
+
+def _record(conn, sql, parameters, seconds, function):
+    with _lock:
+        stats = _function_stats(function)
+        stats["statements"] += 1
+        stats["statement_seconds"] += seconds
+    if seconds * 1000 < threshold_ms():
+        return
+    entry = {
+        "at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "ms": round(seconds * 1000, 2),
+        "function": function,
+        "sql": " ".join(sql.split()),
+        "parameters": _describe_parameters(parameters)[:PARAMS_REPR_CHARS],
+        "plan": _plan(conn, sql, parameters),
+    }
+    with _lock:
+        _slow.append(entry)
+        try:
+            with open(SLOW_LOG_PATH, "a", encoding="utf-8") as f:
+                f.write(_format_entry(entry) + "\n\n")
+        except OSError:
+            pass
+
+
+class TracingCursor(sqlite3.Cursor):
+    # A statement's time covers execute() and every fetch up to the last
+    # row, since SQLite does most of a SELECT's work while stepping rows.
+    _pending = None
+
+    def _finish(self):
+        pending = self._pending
+        if pending is not None:
+            self._pending = None
+            _record(self.connection, *pending)
+
+    def _step(self, fetch, *args):
+        started = time.perf_counter()
+        try:
+            return fetch(*args)
+        finally:
+            if self._pending is not None:
+                self._pending[2] += time.perf_counter() - started
+
+    def execute(self, sql, parameters=()):
+        self._finish()
+        started = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            self._pending = [sql, parameters, time.perf_counter() - started,
+                             _current_function()]
+
+    def executemany(self, sql, seq_of_parameters):
+        self._finish()
+        if not isinstance(seq_of_parameters, (list, tuple)):
+            seq_of_parameters = list(seq_of_parameters)
+        started = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            self._pending = [sql, seq_of_parameters[0] if seq_of_parameters else (),
+                             time.perf_counter() - started, _current_function()]
+            self._finish()
+
+    def fetchone(self):
+        row = self._step(super().fetchone)
+        if row is None:
+            self._finish()
+        return row
+
+    def fetchmany(self, size=None):
+        rows = self._step(super().fetchmany, self.arraysize if size is None else size)
+        if not rows:
+            self._finish()
+        return rows
+
+    def fetchall(self):
+        rows = self._step(super().fetchall)
+        self._finish()
+        return rows
+
+    def __next__(self):
+        try:
+            return self._step(super().__next__)
+        except StopIteration:
+            self._finish()
+            raise
+
+    def close(self):
+        self._finish()
+        super().close()
+
+    def __del__(self):
+        try:
+            self._finish()
+        except Exception:
+            pass
+
+
+class TracingConnection(sqlite3.Connection):
+    def cursor(self, factory=TracingCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+def reset():
+    with _lock:
+        _functions.clear()
+        _slow.clear()
+        _plans.clear()
+
+
+def snapshot():
+    with _lock:
+        functions = {name: dict(stats) for name, stats in _functions.items()}
+        slow = list(_slow)
+    return {"threshold_ms": threshold_ms(), "functions": functions, "slow": slow}
+
+
+def _format_entry(entry):
+    lines = [f"[{entry['at']}] {entry['ms']} ms {entry['function'] or '-'}",
+             entry["sql"], f"parameters: {entry['parameters']}"]
+    if entry["plan"]:
+        lines.append("plan:")
+        lines.extend("  " + line for line in entry["plan"].splitlines())
+    return "\n".join(lines)
+
+
+def report_text():
+    data = snapshot()
+    lines = [f"{'функция':<36}{'вызовов':>9}{'всего мс':>11}"
+             f"{'макс мс':>10}{'запросов':>10}{'в SQL мс':>11}"]
+    functions = sorted(data["functions"].items(),
+                       key=lambda item: item[1]["seconds"] or item[1]["statement_seconds"],
+                       reverse=True)
+    for name, stats in functions:
+        lines.append(
+            f"{name or '(вне database.py)':<36}{stats['calls']:>9}"
+            f"{stats['seconds'] * 1000:>11.1f}{stats['max_seconds'] * 1000:>10.1f}"
+            f"{stats['statements']:>10}{stats['statement_seconds'] * 1000:>11.1f}")
+    lines.append("")
+    lines.append(f"Медленные запросы (от {data['threshold_ms']} мс): {len(data['slow'])}")
+    for entry in reversed(data["slow"]):
+        lines.append("")
+        lines.append(_format_entry(entry))
+    return "\n".join(lines)
+
+
+def dump(path):
+    with open(path, "w", encoding="utf-8") as f:
+        if path.lower().endswith(".json"):
+            json.dump(snapshot(), f, indent=2, ensure_ascii=False)
+        else:
+            f.write(report_text() + "\n")
@@ -0,0 +1,6310 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x05\x91\
+\x51\
+\x4c\x61\x62\x65\x6c\x20\x7b\x0a\x20\x20\x66\x6f\x6e\x74\x2d\x73\
+\x69\x7a\x65\x3a\x20\x31\x36\x70\x78\x3b\x0a\x20\x20\x63\x6f\x6c\
+\x6f\x72\x3a\x20\x23\x33\x33\x33\x3b\x0a\x7d\x0a\x0a\x51\x47\x72\
+\x6f\x75\x70\x42\x6f\x78\x20\x7b\x0a\x20\x20\x62\x6f\x72\x64\x65\
+\x72\x3a\x20\x32\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\x67\x72\x61\
+\x79\x3b\x0a\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x72\x61\x64\x69\
+\x75\x73\x3a\x20\x31\x30\x70\x78\x3b\x0a\x20\x20\x6d\x61\x72\x67\
+\x69\x6e\x2d\x74\x6f\x70\x3a\x20\x31\x30\x70\x78\x3b\x0a\x20\x20\
+\x70\x61\x64\x64\x69\x6e\x67\x2d\x74\x6f\x70\x3a\x20\x31\x30\x70\
+\x78\x3b\x0a\x7d\x0a\x0a\x2a\x20\x7b\x0a\x20\x20\x66\x6f\x6e\x74\
+\x2d\x66\x61\x6d\x69\x6c\x79\x3a\x20\x41\x72\x69\x61\x6c\x3b\x0a\
+\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\x3a\x20\x31\x34\x70\
+\x78\x3b\x0a\x7d\x0a\x0a\x51\x4d\x61\x69\x6e\x57\x69\x6e\x64\x6f\
+\x77\x20\x7b\x0a\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\
+\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x66\x30\x66\x30\x66\x30\x3b\
+\x0a\x7d\x0a\x0a\x51\x50\x75\x73\x68\x42\x75\x74\x74\x6f\x6e\x20\
+\x7b\x0a\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\
+\x6f\x6c\x6f\x72\x3a\x20\x23\x34\x63\x61\x66\x35\x30\x3b\x0a\x20\
+\x20\x62\x6f\x72\x64\x65\x72\x3a\x20\x6e\x6f\x6e\x65\x3b\x0a\x20\
+\x20\x63\x6f\x6c\x6f\x72\x3a\x20\x77\x68\x69\x74\x65\x3b\x0a\x20\
+\x20\x70\x61\x64\x64\x69\x6e\x67\x3a\x20\x31\x30\x70\x78\x20\x32\
+\x30\x70\x78\x3b\x0a\x20\x20\x74\x65\x78\x74\x2d\x61\x6c\x69\x67\
+\x6e\x3a\x20\x63\x65\x6e\x74\x65\x72\x3b\x0a\x20\x20\x74\x65\x78\
+\x74\x2d\x64\x65\x63\x6f\x72\x61\x74\x69\x6f\x6e\x3a\x20\x6e\x6f\
+\x6e\x65\x3b\x0a\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\x3a\
+\x20\x31\x34\x70\x78\x3b\x0a\x20\x20\x6d\x61\x72\x67\x69\x6e\x3a\
+\x20\x34\x70\x78\x20\x32\x70\x78\x3b\x0a\x7d\x0a\x0a\x51\x50\x75\
+\x73\x68\x42\x75\x74\x74\x6f\x6e\x3a\x68\x6f\x76\x65\x72\x20\x7b\
+\x0a\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\
+\x6c\x6f\x72\x3a\x20\x23\x34\x35\x61\x30\x34\x39\x3b\x0a\x7d\x0a\
+\x0a\x51\x54\x61\x62\x6c\x65\x57\x69\x64\x67\x65\x74\x49\x74\x65\
+\x6d\x20\x7b\x0a\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x3a\x20\x31\
+\x30\x70\x78\x3b\x0a\x7d\x0a\x0a\x51\x4c\x69\x6e\x65\x45\x64\x69\
+\x74\x20\x7b\x0a\x20\x20\x62\x6f\x72\x64\x65\x72\x3a\x20\x32\x70\
+\x78\x20\x73\x6f\x6c\x69\x64\x20\x67\x72\x61\x79\x3b\x0a\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x2d\x72\x61\x64\x69\x75\x73\x3a\x20\x31\
+\x30\x70\x78\x3b\x0a\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x3a\x20\
+\x30\x20\x38\x70\x78\x3b\x0a\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x20\x77\x68\x69\x74\x65\x3b\x0a\x7d\x0a\x0a\x51\
+\x54\x65\x78\x74\x45\x64\x69\x74\x20\x7b\x0a\x20\x20\x62\x6f\x72\
+\x64\x65\x72\x3a\x20\x32\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\x67\
+\x72\x61\x79\x3b\x0a\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x72\x61\
+\x64\x69\x75\x73\x3a\x20\x31\x30\x70\x78\x3b\x0a\x20\x20\x70\x61\
+\x64\x64\x69\x6e\x67\x3a\x20\x30\x20\x38\x70\x78\x3b\x0a\x20\x20\
+\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\x3a\x20\x77\x68\x69\x74\
+\x65\x3b\x0a\x7d\x0a\x0a\x51\x52\x61\x64\x69\x6f\x42\x75\x74\x74\
+\x6f\x6e\x3a\x3a\x69\x6e\x64\x69\x63\x61\x74\x6f\x72\x20\x7b\x0a\
+\x20\x20\x77\x69\x64\x74\x68\x3a\x20\x31\x36\x70\x78\x3b\x0a\x20\
+\x20\x68\x65\x69\x67\x68\x74\x3a\x20\x31\x36\x70\x78\x3b\x0a\x7d\
+\x0a\x0a\x51\x43\x6f\x6d\x62\x6f\x42\x6f\x78\x20\x7b\x0a\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x3a\x20\x31\x70\x78\x20\x73\x6f\x6c\x69\
+\x64\x20\x67\x72\x61\x79\x3b\x0a\x20\x20\x62\x6f\x72\x64\x65\x72\
+\x2d\x72\x61\x64\x69\x75\x73\x3a\x20\x33\x70\x78\x3b\x0a\x20\x20\
+\x70\x61\x64\x64\x69\x6e\x67\x3a\x20\x31\x70\x78\x20\x31\x38\x70\
+\x78\x20\x31\x70\x78\x20\x33\x70\x78\x3b\x0a\x20\x20\x6d\x69\x6e\
+\x2d\x77\x69\x64\x74\x68\x3a\x20\x36\x65\x6d\x3b\x0a\x7d\x0a\x0a\
+\x51\x43\x6f\x6d\x62\x6f\x42\x6f\x78\x3a\x3a\x64\x72\x6f\x70\x2d\
+\x64\x6f\x77\x6e\x20\x7b\x0a\x20\x20\x77\x69\x64\x74\x68\x3a\x20\
+\x31\x35\x70\x78\x3b\x0a\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x6c\
+\x65\x66\x74\x2d\x77\x69\x64\x74\x68\x3a\x20\x31\x70\x78\x3b\x0a\
+\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x6c\x65\x66\x74\x2d\x63\x6f\
+\x6c\x6f\x72\x3a\x20\x64\x61\x72\x6b\x67\x72\x61\x79\x3b\x0a\x20\
+\x20\x62\x6f\x72\x64\x65\x72\x2d\x6c\x65\x66\x74\x2d\x73\x74\x79\
+\x6c\x65\x3a\x20\x73\x6f\x6c\x69\x64\x3b\x0a\x20\x20\x62\x6f\x72\
+\x64\x65\x72\x2d\x74\x6f\x70\x2d\x72\x69\x67\x68\x74\x2d\x72\x61\
+\x64\x69\x75\x73\x3a\x20\x33\x70\x78\x3b\x0a\x20\x20\x62\x6f\x72\
+\x64\x65\x72\x2d\x62\x6f\x74\x74\x6f\x6d\x2d\x72\x69\x67\x68\x74\
+\x2d\x72\x61\x64\x69\x75\x73\x3a\x20\x33\x70\x78\x3b\x0a\x7d\x0a\
+\x0a\x51\x54\x65\x78\x74\x45\x64\x69\x74\x20\x7b\x0a\x20\x20\x62\
+\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\
+\x20\x23\x66\x30\x66\x30\x66\x30\x3b\x0a\x20\x20\x63\x6f\x6c\x6f\
+\x72\x3a\x20\x23\x33\x33\x33\x3b\x0a\x20\x20\x62\x6f\x72\x64\x65\
+\x72\x3a\x20\x31\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\x23\x39\x39\
+\x39\x3b\x0a\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x72\x61\x64\x69\
+\x75\x73\x3a\x20\x35\x70\x78\x3b\x0a\x20\x20\x70\x61\x64\x64\x69\
+\x6e\x67\x3a\x20\x35\x70\x78\x3b\x0a\x7d\x0a\x0a\x51\x54\x61\x62\
+\x6c\x65\x56\x69\x65\x77\x20\x7b\x0a\x20\x20\x62\x6f\x72\x64\x65\
+\x72\x3a\x20\x31\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\x23\x64\x31\
+\x64\x31\x64\x31\x3b\x0a\x7d\x0a\x0a\x51\x48\x65\x61\x64\x65\x72\
+\x56\x69\x65\x77\x3a\x3a\x73\x65\x63\x74\x69\x6f\x6e\x20\x7b\x0a\
+\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\
+\x6f\x72\x3a\x20\x23\x64\x31\x64\x31\x64\x31\x3b\x0a\x20\x20\x70\
+\x61\x64\x64\x69\x6e\x67\x3a\x20\x35\x70\x78\x3b\x0a\x20\x20\x62\
+\x6f\x72\x64\x65\x72\x3a\x20\x31\x70\x78\x20\x73\x6f\x6c\x69\x64\
+\x20\x23\x64\x31\x64\x31\x64\x31\x3b\x0a\x7d\x0a\x0a\x51\x54\x61\
+\x62\x6c\x65\x57\x69\x64\x67\x65\x74\x49\x74\x65\x6d\x20\x7b\x0a\
+\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x3a\x20\x31\x30\x70\x78\x3b\
+\x0a\x20\x20\x62\x6f\x72\x64\x65\x72\x3a\x20\x31\x70\x78\x20\x73\
+\x6f\x6c\x69\x64\x20\x23\x64\x31\x64\x31\x64\x31\x3b\x0a\x7d\x0a\
+\
+\x00\x00\x74\x04\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x04\x00\x00\x00\x04\x00\x08\x06\x00\x00\x00\x7f\x1d\x2b\x83\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x20\x00\x49\x44\x41\x54\x78\x9c\xec\
+\xdd\x7d\xb0\x64\xf9\x59\xd8\xf7\x5e\x09\x64\xc9\x08\x09\x69\x35\
+\x3b\x7b\xbb\x4f\x9f\xee\x99\x9e\xd6\x2e\xbb\x62\x07\xf4\x62\x25\
+\x4a\x62\x08\x51\xa5\x88\xf3\x87\x43\x15\xae\x4a\x52\x89\x5d\x2e\
+\x62\xc5\xf1\x4b\x11\x84\x13\x17\x89\x43\x51\x72\xfc\x82\xf3\x47\
+\xf0\x0b\x06\xaa\x88\x6d\x0a\x97\x4d\x5c\x06\x93\x72\xc5\xe6\x25\
+\x36\xc8\x12\x50\x09\x56\x8a\x22\x59\x33\x49\x20\x24\x65\x82\x21\
+\x8a\x1d\xb0\x21\x32\x7a\x59\xe7\x9c\x99\xed\xd1\x9d\x99\xee\xbe\
+\x7d\xbb\xfb\x9c\xf3\x3c\xbf\xf3\x39\x55\xdf\xc2\xc4\xd6\x27\x8f\
+\x76\x6e\x9f\xd3\xcf\x6f\x6f\x4f\x4f\xde\xff\xfe\x2f\x7b\x5d\xd3\
+\xe7\x36\x4d\x8e\xb9\xda\xff\xdc\xab\xff\xf9\xd7\x5d\x8a\xc7\xe3\
+\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x5e\x24\x2f\xd5\xb0\x3c\
+\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x8e\xf3\x52\x0d\
+\xcb\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\xaf\x53\x2f\
+\xd5\xb0\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x4e\
+\xbc\xa2\x0f\xcb\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\
+\xef\xc4\x2b\xfa\xb0\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\
+\xe3\xf1\x4e\xbc\xa2\x0f\xcb\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\
+\x78\x3c\x1e\xef\xc4\x2b\xfa\xb0\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\
+\x1e\x8f\xc7\xe3\xf1\x4e\xbc\xa2\x0f\xcb\xe3\xf1\x78\x3c\x1e\x8f\
+\xc7\xe3\xf1\x78\x3c\x1e\xef\xc4\x2b\xfa\xb0\x3c\x1e\x8f\xc7\xe3\
+\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x4e\xbc\xa2\x0f\xcb\xe3\xf1\x78\
+\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\xef\xc4\x2b\xfa\xb0\x3c\x1e\
+\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x4e\xbc\xa2\x0f\xcb\
+\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\xef\xc4\x2b\xfa\
+\xb0\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x8e\xf3\
+\x52\x0d\xcb\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\xef\
+\x38\x2f\xd5\xb0\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\
+\xf1\x8e\xf3\x52\x0d\xcb\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\
+\x3c\x1e\xef\x38\x2f\xd5\xb0\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\
+\x8f\xc7\xe3\xf1\x8e\xf3\x26\x99\x86\xe5\xf1\x78\x3c\x1e\x8f\xc7\
+\xe3\xf1\x78\x3c\x1e\x8f\x77\x9c\x37\xc9\x34\x2c\x8f\xc7\xe3\xf1\
+\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\xbc\x23\xbd\x54\xc3\xf2\x78\x3c\
+\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\x3b\xce\x4b\x35\x2c\x8f\
+\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\xbc\xe3\xbc\x54\xc3\
+\xf2\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xeb\xd4\x4b\
+\x35\x2c\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\xbc\x13\
+\xaf\xe8\xc3\xf2\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\
+\x3b\xf1\x8a\x3e\x2c\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\
+\x78\xbc\x13\xaf\xe8\xc3\xf2\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\
+\x1e\x8f\xc7\x3b\xf1\x8a\x3e\x2c\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\
+\xc7\xe3\xf1\x78\xbc\x13\xaf\xe8\xc3\xf2\x78\x3c\x1e\x8f\xc7\xe3\
+\xf1\x78\x3c\x1e\x8f\xc7\x3b\xf1\x8a\x3e\x2c\x8f\xc7\xe3\xf1\x78\
+\x3c\x1e\x8f\xc7\xe3\xf1\x78\xbc\x13\xaf\xe8\xc3\xf2\x78\x3c\x1e\
+\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\x3b\xf1\x8a\x3e\x2c\x8f\xc7\
+\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\xbc\x13\xaf\xe8\xc3\xf2\
+\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\x3b\xf1\x8a\x3e\
+\x2c\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\xbc\xe3\xbc\
+\x54\xc3\xf2\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\x3b\
+\xce\x4b\x35\x2c\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\
+\xbc\xe3\xbc\x54\xc3\xf2\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\
+\x8f\xc7\x3b\xce\x4b\x35\x2c\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\
+\xe3\xf1\x78\xbc\xe3\xbc\x49\xa6\x61\x79\x3c\x1e\x8f\xc7\xe3\xf1\
+\x78\x3c\x1e\x8f\xc7\xe3\x1d\xe7\x4d\x32\x0d\xcb\xe3\xf1\x78\x3c\
+\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\xef\x48\x2f\xd5\xb0\x3c\x1e\x8f\
+\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x8e\xf3\x52\x0d\xcb\xe3\
+\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\xef\x38\x2f\xd5\xb0\
+\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x3a\xf5\x52\
+\x0d\xcb\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\xef\xc4\
+\x2b\xfa\xb0\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\
+\x4e\xbc\xa2\x0f\xcb\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\
+\x1e\xef\xc4\x2b\xfa\xb0\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\
+\xc7\xe3\xf1\x4e\xbc\xa2\x0f\xcb\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\
+\xf1\x78\x3c\x1e\xef\xc4\x2b\xfa\xb0\x3c\x1e\x8f\xc7\xe3\xf1\x78\
+\x3c\x1e\x8f\xc7\xe3\xf1\x4e\xbc\xa2\x0f\xcb\xe3\xf1\x78\x3c\x1e\
+\x8f\xc7\xe3\xf1\x78\x3c\x1e\xef\xc4\x2b\xfa\xb0\x3c\x1e\x8f\xc7\
+\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x4e\xbc\xa2\x0f\xcb\xe3\xf1\
+\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\xef\xc4\x2b\xfa\xb0\x3c\
+\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x4e\xbc\xa2\x0f\
+\xcb\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\xef\x38\x2f\
+\xd5\xb0\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x8e\
+\xf3\x52\x0d\xcb\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\
+\xef\x38\x2f\xd5\xb0\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\
+\xe3\xf1\x8e\xf3\x52\x0d\xcb\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\
+\x78\x3c\x1e\xef\x38\x6f\x92\x69\x58\x1e\x8f\xc7\xe3\xf1\x78\x3c\
+\x1e\x8f\xc7\xe3\xf1\x78\xc7\x79\x93\x4c\xc3\xf2\x78\x3c\x1e\x8f\
+\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\x3b\xd2\x4b\x35\x2c\x8f\xc7\xe3\
+\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\xbc\xe3\xbc\x54\xc3\xf2\x78\
+\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\x3b\xce\x4b\x35\x2c\
+\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\xbc\x4e\xbd\x54\
+\xc3\xf2\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\x3b\xf1\
+\x8a\x3e\x2c\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\xbc\
+\x13\xaf\xe8\xc3\xf2\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\
+\xc7\x3b\xf1\x8a\x3e\x2c\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\
+\xf1\x78\xbc\x13\xaf\xe8\xc3\xf2\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\
+\x3c\x1e\x8f\xc7\x3b\xf1\x8a\x3e\x2c\x8f\xc7\xe3\xf1\x78\x3c\x1e\
+\x8f\xc7\xe3\xf1\x78\xbc\x13\xaf\xe8\xc3\xf2\x78\x3c\x1e\x8f\xc7\
+\xe3\xf1\x78\x3c\x1e\x8f\xc7\x3b\xf1\x8a\x3e\x2c\x8f\xc7\xe3\xf1\
+\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\xbc\x13\xaf\xe8\xc3\xf2\x78\x3c\
+\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\x3b\xf1\x8a\x3e\x2c\x8f\
+\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\xbc\x13\xaf\xe8\xc3\
+\xf2\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\x3b\xce\x4b\
+\x35\x2c\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\xbc\xe3\
+\xbc\x54\xc3\xf2\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\
+\x3b\xce\x4b\x35\x2c\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\
+\x78\xbc\xe3\xbc\x54\xc3\xf2\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\
+\x1e\x8f\xc7\x3b\xce\x9b\x64\x1a\x96\xc7\xe3\xf1\x78\x3c\x1e\x8f\
+\xc7\xe3\xf1\x78\x3c\xde\x71\xde\x24\xd3\xb0\x3c\x1e\x8f\xc7\xe3\
+\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x8e\xf4\x52\x0d\xcb\xe3\xf1\x78\
+\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\xef\x38\x2f\xd5\xb0\x3c\x1e\
+\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x8e\xf3\x52\x0d\xcb\
+\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\xaf\x53\x2f\xd5\
+\xb0\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x4e\xbc\
+\xa2\x0f\xcb\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\xef\
+\xc4\x2b\xfa\xb0\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\
+\xf1\x4e\xbc\xa2\x0f\xcb\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\
+\x3c\x1e\xef\xc4\x2b\xfa\xb0\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\
+\x8f\xc7\xe3\xf1\x4e\xbc\xa2\x0f\xcb\xe3\xf1\x78\x3c\x1e\x8f\xc7\
+\xe3\xf1\x78\x3c\x1e\xef\xc4\x2b\xfa\xb0\x3c\x1e\x8f\xc7\xe3\xf1\
+\x78\x3c\x1e\x8f\xc7\xe3\xf1\x4e\xbc\xa2\x0f\xcb\xe3\xf1\x78\x3c\
+\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\xef\xc4\x2b\xfa\xb0\x3c\x1e\x8f\
+\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x4e\xbc\xa2\x0f\xcb\xe3\
+\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\xef\xc4\x2b\xfa\xb0\
+\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x8e\xf3\x52\
+\x0d\xcb\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\xef\x38\
+\x2f\xd5\xb0\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\
+\x8e\xf3\x52\x0d\xcb\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\
+\x1e\xef\x38\x2f\xd5\xb0\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\
+\xc7\xe3\xf1\x8e\xf3\x26\x99\x86\xe5\xf1\x78\x3c\x1e\x8f\xc7\xe3\
+\xf1\x78\x3c\x1e\x8f\x77\x9c\x37\xc9\x34\x2c\x8f\xc7\xe3\xf1\x78\
+\x3c\x1e\x8f\xc7\xe3\xf1\x78\xbc\x23\xbd\x54\xc3\xf2\x78\x3c\x1e\
+\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\x3b\xce\x4b\x35\x2c\x8f\xc7\
+\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\xbc\xe3\xbc\x54\xc3\xf2\
+\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xeb\xd4\x4b\x35\
+\x2c\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\xbc\x13\xaf\
+\xe8\xc3\xf2\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\x3b\
+\xf1\x8a\x3e\x2c\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\
+\xbc\x13\xaf\xe8\xc3\xf2\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\
+\x8f\xc7\x3b\xf1\x8a\x3e\x2c\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\
+\xe3\xf1\x78\xbc\x13\xaf\xe8\xc3\xf2\x78\x3c\x1e\x8f\xc7\xe3\xf1\
+\x78\x3c\x1e\x8f\xc7\x3b\xf1\x8a\x3e\x2c\x8f\xc7\xe3\xf1\x78\x3c\
+\x1e\x8f\xc7\xe3\xf1\x78\xbc\x13\xaf\xe8\xc3\xf2\x78\x3c\x1e\x8f\
+\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\x3b\xf1\x8a\x3e\x2c\x8f\xc7\xe3\
+\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\xbc\x13\xaf\xe8\xc3\xf2\x78\
+\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\x3b\xf1\x8a\x3e\x2c\
+\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\xbc\xe3\xbc\x54\
+\xc3\xf2\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\x3b\xce\
+\x4b\x35\x2c\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\xbc\
+\xe3\xbc\x54\xc3\xf2\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\
+\xc7\x3b\xce\x4b\x35\x2c\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\
+\xf1\x78\xbc\xe3\xbc\x49\xa6\x61\x79\x3c\xde\x76\xef\xee\xdd\x2f\
+\x7a\xd3\x73\xcf\xbd\xfd\x99\xe5\x72\xf9\x05\x11\xe7\xe3\xf1\x78\
+\x3c\x1e\x8f\xb7\xdb\x5b\xaf\xef\xbc\xf5\xf9\xe7\x9f\x7b\xa6\xfd\
+\x9f\x11\xe7\xe3\xf1\x78\xe5\x78\x93\x4c\xc3\xf2\x78\x63\xf3\xa6\
+\xd3\xe9\xd3\xb3\xd9\xec\x9f\x6b\xfa\x77\xe6\xf3\xd9\x87\x9a\xfe\
+\xd2\x7c\x3e\xfd\xf1\xba\x9e\xfe\xaf\x75\x3d\xfb\xfb\xcd\xff\xfe\
+\x8f\x9a\x5e\x69\xfa\x67\x8f\xf5\x6b\x4d\x1f\xaf\xaa\xe9\xcf\x36\
+\xff\xef\x7f\xb2\xf9\x9f\x7f\xb3\xe9\x4f\x35\xce\xef\xaf\xaa\xea\
+\x2b\x9a\xee\x34\xfc\xe7\x44\xfb\xef\xcb\xe3\xf1\x78\x3c\x5e\x49\
+\x5e\xf3\xdc\xad\x9a\xbe\xac\xe9\x77\x35\xcf\xe5\x6f\x6a\x9e\xc9\
+\xdf\xdb\x3c\x8f\x7f\xa2\x7d\x3e\x37\xfd\x83\xaa\x9a\xfd\xca\x96\
+\x67\xf8\x3f\x6b\xff\xbf\x3f\xf8\xbf\xbf\xff\xff\xee\x27\x9a\xff\
+\xdc\xf7\xb4\xff\xf9\xe6\xf9\xfd\xef\xbd\xea\x55\x11\xff\xfb\xf2\
+\x78\xbc\x04\x5e\xaa\x61\x79\xbc\xb2\xbd\xcf\x69\x1e\xec\xef\x69\
+\x1e\xf2\x1f\x6c\x1e\xec\xff\x4d\xbb\xc0\x6f\x7b\x53\x70\xae\x9a\
+\x37\x14\x9f\x6c\xde\x60\x7c\xac\xf9\x3f\xff\xc9\xba\xae\x7f\xdb\
+\x6a\x75\xfb\x22\xf9\x3f\x3f\x1e\x8f\xc7\xe3\xf1\x06\xf3\x2e\x2e\
+\x2e\x7e\x63\x5d\x4f\xff\x95\xe6\xb9\xfa\x8d\xcd\xb3\xfc\x87\x9b\
+\xff\xf9\xab\x5d\x3e\xc7\x1f\xf8\xd3\xbf\xdd\xfe\xff\xaf\xae\x67\
+\x5f\xfe\xfc\xf3\xcf\xbd\x39\xf3\x3f\x3f\x1e\x8f\xd7\x93\x97\x6a\
+\x58\x1e\xaf\x30\x6f\x3e\x7f\xf6\x85\xe6\xc1\xfd\xf5\xcd\xc2\xff\
+\x03\xcd\x43\xfc\x9f\x74\xfc\x46\xe1\xaa\xda\xdf\x24\x78\xb9\xaa\
+\x66\xdf\x3a\x9f\x5f\xfc\xd6\xaa\xaa\xde\x10\xfd\x9f\x1f\x8f\xc7\
+\xe3\xf1\x78\x43\x79\x37\x6e\x3c\xfd\x9a\xe6\x79\xf9\x2f\x56\xd5\
+\xf4\x8f\x37\xcf\xce\x1f\x6b\x0f\xd6\x87\x7d\x8e\x4f\x3f\x59\xd7\
+\xd5\x8f\x37\xff\xe7\x3f\x71\xeb\x56\xf5\xa5\xed\x7c\x91\xff\xf9\
+\xf1\x78\xbc\x81\xbc\x54\xc3\xf2\x78\x05\x78\xd3\xe9\xf4\xb9\xe6\
+\x8d\xc2\x7f\xde\x3c\xa0\xef\x0d\xbc\xf0\x5f\xf9\x6f\x16\x9a\x39\
+\xff\x4a\x55\x5d\xfc\x1b\x2f\xbc\xf0\xc2\xeb\xa2\xfc\xf3\xe3\xf1\
+\x78\x3c\x1e\x6f\x48\xaf\x5d\xae\xdb\xc3\xf2\xf6\x57\xf4\x03\x3c\
+\xab\x77\xf6\xea\x47\x0c\xfe\x6c\x5d\x4f\xdf\x17\xe9\x9f\x1f\x8f\
+\xc7\xcb\xe1\xa5\x1a\x96\xc7\x8b\xe6\xbd\xf8\xe2\x0b\x6f\x6a\x16\
+\xe9\xaf\x6e\x1e\xc4\x3f\x3a\xf4\x1b\x82\x23\xfb\xbf\x9b\x37\x12\
+\xdf\xbc\x58\x5c\x3c\x5f\xc2\x9f\x07\x8f\xc7\xe3\xf1\x78\xd7\xf1\
+\x6e\xdf\xbe\x35\xad\xeb\xea\x0f\xd5\xf5\xec\x7f\x09\xf0\x4c\x3e\
+\xa6\x76\xee\xaf\x7f\xf6\xd9\x67\x6f\x94\xf0\xe7\xc1\xe3\xf1\xba\
+\xf5\x52\x0d\xcb\xe3\x45\xf2\x6e\xdd\x5a\xde\x6e\x1e\xb8\x7f\xa2\
+\xe9\xff\x09\xf0\xf0\x3f\x47\xaf\xb4\x1f\x57\x68\xfa\x2d\xcd\x7f\
+\xdd\xa7\xb2\xfd\x79\xf0\x78\x3c\x1e\x8f\x77\x1d\x6f\xb5\xaa\x7f\
+\xd3\x7c\x5e\x7d\xe7\x7c\x3e\xfd\xa7\x01\x9e\xc1\x27\x57\x55\xd3\
+\x4f\x34\xff\x5d\xfe\xdc\x74\x3a\xfd\xe2\x8c\x7f\x1e\x3c\x1e\xaf\
+\x7b\x2f\xd5\xb0\x3c\x5e\x14\xef\xed\x6f\xaf\xef\x34\x0f\xda\x3f\
+\xfd\xe0\x41\x3b\xfc\x03\xbf\x9b\xa6\x3f\xb5\x58\xcc\x7f\xe7\x4b\
+\x2f\xbd\xf8\x86\xe8\x7f\x1e\x3c\x1e\x8f\xc7\xe3\x5d\xc7\xab\xeb\
+\xfa\xdd\xcd\xe2\xff\x57\xe7\xdb\xbf\x69\xa7\x88\xaa\x6a\xf6\x43\
+\xb3\xd9\xec\xbd\x19\xfe\x3c\x78\x3c\x5e\x3f\x5e\xaa\x61\x79\xbc\
+\x08\xde\xad\x5b\xcb\x59\xf3\x86\xe1\xdb\xda\xbf\x88\x67\xe8\x07\
+\x7b\x5f\xd5\xf5\xec\xa7\x96\xcb\xea\xb7\x44\xfc\xf3\xe0\xf1\x78\
+\x3c\x1e\xef\x3a\x57\x5d\xdf\xff\xcb\x79\xff\xdb\xa1\x9f\xad\xfd\
+\x56\xfd\xf5\x3b\x77\xe6\x2f\x45\xfc\xf3\xe0\xf1\x78\xfd\x79\xa9\
+\x86\xe5\xf1\x86\xf6\xde\xf9\xce\x2f\x7e\x63\x5d\x57\xff\x59\xb3\
+\x0c\xff\xe3\xe1\x1f\xe4\x43\x35\xfd\xfe\xf6\x5b\x0d\x22\xfc\x79\
+\xf0\x78\x3c\x1e\x8f\x77\x9d\xab\xfd\x6c\x7c\x55\x4d\xbf\xad\x79\
+\x9e\x7d\x6a\xf8\xe7\xe9\x20\x35\xff\xbd\xab\x6f\xbf\x7d\xfb\xd6\
+\x45\x84\x3f\x0f\x1e\x8f\xd7\xaf\x97\x6a\x58\x1e\x6f\x68\x6f\xb1\
+\x58\x7c\x79\xf3\xd0\xfc\xe9\x00\x0f\xef\xc1\x6b\xbf\x02\xa9\xe9\
+\x4f\xde\xb8\x71\xe3\x8d\x43\xfd\x79\xf0\x78\x3c\x1e\x8f\x77\x8d\
+\xeb\xa9\xe6\xf9\xf5\xdb\x9b\x3e\x3e\xf4\x33\x34\x42\xcd\x33\xfc\
+\x1f\x35\xff\xf3\x6b\x9a\x7f\x2e\xd7\xfa\x0a\xc1\xc0\x7f\xbe\x3c\
+\x1e\xaf\xa4\x61\x79\xbc\x21\xbd\xd5\x6a\xf5\xe6\x07\x7f\x31\x50\
+\xb9\x9f\x0f\x3c\xe1\x0d\xc4\xcf\x56\x55\xf5\xa5\x7d\xfe\x79\xf0\
+\x78\x3c\x1e\x8f\x77\x9d\xab\xae\xeb\xdb\xf3\xf9\xf4\xc3\x43\x3f\
+\x33\x63\x36\xfd\x91\xf6\x9f\x4f\x9f\x7f\x1e\x3c\x1e\xaf\x7f\x2f\
+\xd5\xb0\x3c\xde\x90\x5e\x5d\x5f\xfc\x0b\xcd\xc3\xf1\x67\x86\x7f\
+\x40\x87\xee\x95\xf6\xb7\x01\xee\xdc\xb9\xf3\x1b\xb2\xfd\xf9\xf2\
+\x78\x3c\x1e\xaf\x6c\x6f\xfe\xe0\xdf\xfa\x8f\xf8\x63\x7b\x07\xf5\
+\x6b\xf3\x07\xbf\x0d\xf0\x54\xb6\x3f\x5f\x1e\x8f\x57\xd8\xb0\x3c\
+\xde\x80\xde\x6b\x9b\xa5\xf6\x8f\x35\x0f\xc4\xcf\x04\x78\x30\x27\
+\x69\xfa\x93\x55\x55\xdd\x49\xf2\xe7\xcb\xe3\xf1\x78\xbc\x82\xbd\
+\xdb\xb7\x6f\xbf\xb9\x79\x2e\x7d\xef\xf0\xcf\xc6\x4c\x4d\xbf\xb7\
+\xfd\xe7\x96\xe1\xcf\x97\xc7\xe3\x05\xc0\x79\xbc\x52\xbc\x07\x7f\
+\x41\xd0\xec\x07\x87\x7f\x10\xa7\xac\xfd\xb7\x2c\x5f\x15\xf9\xcf\
+\x97\xc7\xe3\xf1\x78\x65\x7b\x75\xfd\xec\x17\x36\xcf\xf1\xbf\x17\
+\xe0\x99\x98\xb0\xe9\xff\x36\x9b\xcd\xee\x46\xfe\xf3\xe5\xf1\x78\
+\x01\x70\x1e\xaf\x14\x6f\xb1\x98\x7e\x49\xf3\xf0\xfb\xf9\xe1\x1f\
+\xc0\xa9\x7b\xa5\xae\xab\x3f\xfc\xbe\xf7\xbd\xf7\x37\x44\xfb\xf3\
+\xe5\xf1\x78\x3c\x5e\xd9\x5e\xf3\x0c\xfa\xaa\xe6\x39\xfe\xff\x05\
+\x78\x16\x26\xee\xfe\x3f\x3f\x87\xf9\x3c\x5e\x72\x2f\xd5\xb0\x3c\
+\xde\x10\x5e\x55\x55\x5f\x51\x55\xb3\x5f\x19\xfe\xc1\x5b\x4a\xd5\
+\x5f\x7d\xc7\x3b\x5e\x7c\x73\x94\x3f\x5f\x1e\x8f\xc7\xe3\x95\xed\
+\x35\xcf\x9e\xaf\x99\xfb\xe8\xde\xb9\x6a\x0f\xf3\x3f\x14\xe9\xcf\
+\x97\xc7\xe3\x5d\xcf\x4b\x35\x2c\x8f\xd7\xb7\x37\x9f\x4f\xff\xfd\
+\xe6\x61\xf7\xe9\x00\x0f\xdc\xc2\xaa\x3e\xd2\x7e\x8b\xc2\xd0\x7f\
+\xbe\x3c\x1e\x8f\xc7\x2b\xda\x7b\x4d\x55\xcd\xbe\x75\xf8\x67\x5e\
+\x89\x55\xdf\xfe\xee\x77\x7f\xc9\xeb\x0b\xfb\x79\xe1\xf1\x46\xe1\
+\xa5\x1a\x96\xc7\xeb\xd3\xab\xaa\x8b\xdf\x37\xf7\x15\x7f\x9d\xd5\
+\xbc\x29\xfb\xd8\xc5\xc5\xc5\xdb\x86\xfa\xf3\xe5\xf1\x78\x3c\x5e\
+\xd1\xde\x6b\x9b\xe7\xcc\x9f\x1f\xfa\x59\x57\x72\x75\x5d\x7d\xf7\
+\x7b\xde\xf3\xee\xcf\x1d\xe8\xcf\x97\xc7\xe3\x1d\xe9\xa5\x1a\x96\
+\xc7\xeb\xcb\xab\xaa\xe9\x37\x0c\xfd\x60\x1d\x47\xd3\xff\xe9\xd6\
+\xad\x67\x6e\xf6\xfd\xe7\xcb\xe3\xf1\x78\xbc\x72\xbd\x77\xbd\xeb\
+\x5d\x9f\xdb\x3c\x5f\xbe\x67\xf8\x67\xdc\x28\xfa\x6b\x2f\xbc\xf0\
+\xc2\xeb\xfa\xfc\xf3\xe5\xf1\x78\xa7\x79\x93\x4c\xc3\xf2\x78\x7d\
+\x78\xcd\xc3\xec\x1b\x03\x3c\x50\xc7\xd4\xbd\xba\xae\x2f\xb2\xfe\
+\xbc\xf0\x78\x3c\x1e\x2f\x8e\xf7\x60\xf9\x9f\xfd\xb5\x00\xcf\xb6\
+\x11\x35\xfd\x1b\x8b\xc5\xe2\xf5\x19\x7f\x5e\x78\xbc\x31\x7a\x93\
+\x4c\xc3\xf2\x78\x5d\x7b\x73\xcb\xff\x50\xed\x3c\x04\x88\xfc\xf3\
+\xc2\xe3\xf1\x78\xbc\x38\x9e\xe5\x7f\xc8\xae\x3e\x04\x88\xf6\xf3\
+\xc2\xe3\x8d\xd6\x4b\x35\x2c\x8f\xd7\xa1\x37\xb7\xfc\x0f\xdd\x13\
+\x87\x00\x91\x7f\x5e\x78\x3c\x1e\x8f\x17\xc7\xb3\xfc\x47\x68\xf7\
+\x21\x40\xb4\x9f\x17\x1e\x6f\xd4\x5e\xaa\x61\x79\xbc\x8e\xbc\xba\
+\x9e\xfd\xc1\xe1\x1f\x9c\x9a\x5f\x3a\x04\x88\xfc\xf3\xc2\xe3\xf1\
+\x78\xbc\x38\x9e\xe5\x3f\x52\x4f\x1e\x02\x44\xfb\x79\xe1\xf1\x46\
+\xef\xa5\x1a\x96\xc7\xeb\xc0\xb3\xfc\x87\xeb\x5e\xf3\xe6\xe1\x22\
+\xea\xcf\x0b\x8f\xc7\xe3\xf1\xe2\x78\x96\xff\x78\x55\xd5\xf4\x6f\
+\x6e\x0e\x01\xa2\xfd\xbc\xf0\x78\xbc\x23\xaf\xe8\xc3\xf2\x78\x87\
+\x5e\x96\xff\x98\x35\x7f\x2e\xf7\xd6\xeb\x75\x1d\xed\xe7\x85\xc7\
+\xe3\xf1\x78\x71\x3c\xcb\x7f\xdc\xda\x43\x80\xdb\xb7\x6f\xbf\x3e\
+\xd2\xcf\x0b\x8f\xc7\x3b\xf2\x8a\x3e\x2c\x8f\x77\xe8\x65\xf9\x8f\
+\x5d\x5d\x57\x9b\x43\x80\x10\x3f\x2f\x3c\x1e\x8f\xc7\x8b\xe3\x59\
+\xfe\xe3\xd7\xbc\xcf\xfa\xfe\xbb\x77\xbf\xe8\x4d\x11\x7e\x5e\x78\
+\x3c\xde\x91\x57\xf4\x61\x79\xbc\x43\x2f\xcb\x7f\x8e\xda\xdf\x04\
+\x68\x3f\x0e\x30\xf4\xcf\x0b\x8f\xc7\xe3\xf1\xe2\x78\x96\xff\x3c\
+\x5d\x3a\x04\x28\xe6\xe7\x8f\xc7\x2b\xd9\x4b\x35\x2c\x8f\x77\xe8\
+\x65\xf9\x4f\xd7\xce\xaf\x08\xec\xe3\xe7\x85\xc7\xe3\xf1\x78\x71\
+\x3c\xcb\x7f\xbe\xda\x43\x80\xf6\xe3\x00\x43\xfc\xbc\xf0\x78\xbc\
+\x23\xaf\xe8\xc3\xf2\x78\x87\x5e\x96\xff\xb4\x1d\x7c\x08\x10\xf9\
+\xe7\x8f\xc7\xe3\xf1\x78\x96\xff\x31\x76\xf9\x2f\x06\xec\xeb\xe7\
+\x85\xc7\xe3\x1d\x79\x45\x1f\x96\xc7\x3b\xf4\xb2\xfc\xa7\xef\xca\
+\x43\x80\xc8\x3f\x7f\x3c\x1e\x8f\xc7\xb3\xfc\x8f\xb9\xeb\x1c\x02\
+\x44\xfb\xf9\xe3\xf1\x4a\xf6\x52\x0d\xcb\xe3\x1d\x7a\x59\xfe\x8b\
+\x69\xe7\x21\x40\xe4\x9f\x3f\x1e\x8f\xc7\xe3\x59\xfe\x75\xd8\x21\
+\x40\xb4\x9f\x3f\x1e\xaf\x64\x2f\xd5\xb0\x3c\xde\xa1\x97\xe5\xbf\
+\xb8\x9e\x38\x04\x88\xfc\xf3\xc7\xe3\xf1\x78\x3c\xcb\xbf\x3e\xdb\
+\xbe\x43\x80\x68\x3f\x7f\x3c\x5e\xc9\x5e\xaa\x61\x79\xbc\x43\xaf\
+\xaa\xba\xf8\x8f\x87\x7e\xd0\xa9\x93\x1e\x1e\x02\x44\xfe\xf9\xe3\
+\xf1\x78\x3c\x9e\xe5\x5f\xdb\x9a\x7e\xff\xe3\x87\x00\xd1\x7e\xfe\
+\x78\xbc\x92\xbd\x54\xc3\xf2\x78\x87\x5e\x96\xff\xe2\xbb\xff\x15\
+\x81\x51\x7f\xfe\x78\x3c\x1e\x8f\x67\xf9\xd7\xbe\x3e\x7b\x08\x10\
+\xed\xe7\x8f\xc7\x2b\xd9\x4b\x35\x2c\x8f\x77\xe8\x65\xf9\x1f\x47\
+\x75\x3d\xbb\xb7\x5e\xaf\xeb\x68\x3f\x7f\x3c\x1e\x8f\xc7\xb3\xfc\
+\xeb\x90\xa6\xf7\xbf\x22\x30\xd2\xcf\x1f\x8f\x57\xba\x97\x6a\x58\
+\x1e\xef\x90\xcb\xf2\x3f\xae\xea\xba\xda\x1c\x02\x84\xf8\xf9\xe3\
+\xf1\x78\x3c\x9e\xe5\x5f\xd7\x79\x8e\xcf\x7e\xe0\xee\xdd\x2f\x7a\
+\x53\x84\x9f\x3f\x1e\x6f\x0c\x5e\xaa\x61\x79\xbc\xab\x2e\xcb\xff\
+\x38\x6b\x7f\x13\xa0\xfd\x38\xc0\xd0\x3f\x7f\x3c\x1e\x8f\xc7\xb3\
+\xfc\xeb\xa8\xe7\xf8\xe6\x10\xa0\x98\x9f\x67\x1e\x2f\xaa\x97\x6a\
+\x58\x1e\x6f\xdf\x65\xf9\x1f\x7d\x3b\xbf\x22\xb0\x8f\x9f\x3f\x1e\
+\x8f\xc7\xe3\x59\xfe\x75\x4a\xd5\x0f\xb6\x1f\x07\x18\xe2\xe7\x8f\
+\xc7\x1b\x93\x97\x6a\x58\x1e\x6f\xd7\x65\xf9\xd7\xab\x1d\x7c\x08\
+\x10\xf9\xe7\x99\xc7\xe3\xf1\xc6\xe4\x59\xfe\xb5\x69\x36\x9b\xfd\
+\xc0\xae\xaf\x08\xec\xea\xe7\x8f\xc7\x1b\x9b\x37\xc9\x34\x2c\x8f\
+\xb7\xed\xb2\xfc\xeb\xb1\xae\x3c\x04\x88\xfc\xf3\xcc\xe3\xf1\x78\
+\x63\xf2\x2c\xff\x7a\xbc\xf6\x10\xa0\xaa\xaa\x37\x64\xfc\x79\xe6\
+\xf1\x32\x78\x93\x4c\xc3\xf2\x78\x8f\x5f\x96\x7f\xed\x68\xe7\x21\
+\x40\xe4\x9f\x67\x1e\x8f\xc7\x1b\x93\x67\xf9\xd7\xae\x0e\x39\x04\
+\x88\xf6\xf3\xcc\xe3\xa5\xf1\x52\x0d\xcb\xe3\x5d\xba\x2c\xff\xba\
+\xa2\x27\x0e\x01\x22\xff\x3c\xf3\x78\x3c\xde\x98\x3c\xcb\xbf\xae\
+\x6a\xdf\x21\x40\xb4\x9f\x67\x1e\x2f\x95\x97\x6a\x58\x1e\xef\xd5\
+\xcb\xf2\xaf\x03\x7b\x78\x08\x10\xf9\xe7\x99\xc7\xe3\xf1\xc6\xe4\
+\x59\xfe\x75\x68\xdb\x0e\x01\xa2\xfd\x3c\xf3\x78\xe9\xbc\x54\xc3\
+\xf2\x78\x93\x76\xf9\x9f\xfe\x47\x43\x3f\x90\x94\xaa\xfb\x5f\x11\
+\x18\xf5\xe7\x99\xc7\xe3\xf1\xc6\xe4\x59\xfe\x75\xdd\x2e\x1f\x02\
+\x44\xfb\x79\xe6\xf1\x4a\xf6\x52\x0d\xcb\x2b\xd7\xb3\xfc\xeb\x98\
+\xea\x7a\x76\x6f\xbd\x5e\xd7\xd1\x7e\x9e\x79\x3c\x1e\x6f\x4c\x9e\
+\xe5\x5f\xc7\xf6\xea\xb7\x03\xbc\x21\xd2\xcf\x33\x8f\x57\xb2\x97\
+\x6a\x58\x5e\xb9\x9e\xe5\x5f\xa7\x54\xd7\xd5\xe6\x10\x20\xc4\xcf\
+\x33\x8f\xc7\xe3\x8d\xc9\xb3\xfc\xeb\xf4\xaa\x1f\x7c\xc7\x3b\x5e\
+\x7c\x73\x84\x9f\x67\x1e\xaf\x64\x2f\xd5\xb0\xbc\x72\x3d\xcb\xbf\
+\xce\x51\xfb\x9b\x00\xed\xc7\x01\x86\xfe\x79\xe6\xf1\x78\xbc\x31\
+\x79\x96\x7f\x9d\xaf\xea\x87\x5e\x3d\x04\x28\xe6\xf5\xc1\xe3\x45\
+\xf2\x52\x0d\xcb\x2b\xd7\xb3\xfc\xeb\xcc\xed\xfc\x8a\xc0\x3e\x7e\
+\x9e\x79\x3c\x1e\x6f\x4c\x9e\xe5\x5f\xe7\xaf\xfa\xa1\xf6\xe3\x00\
+\x43\xfc\x3c\xf3\x78\x25\x7b\xa9\x86\xe5\x95\xeb\x59\xfe\xd5\x51\
+\x07\x1f\x02\x44\x7e\x7d\xf0\x78\x3c\x5e\x64\xcf\xf2\xaf\xae\xaa\
+\xaa\xd9\x0f\xee\xfa\x8a\xc0\xae\x7e\x9e\x79\xbc\x92\xbd\x54\xc3\
+\xf2\xca\xf5\x2c\xff\xea\xb8\x2b\x0f\x01\x22\xbf\x3e\x78\x3c\x1e\
+\x2f\xb2\x67\xf9\x57\xd7\x5d\xe7\x10\x20\xda\xeb\x83\xc7\x8b\xe4\
+\xa5\x1a\x96\x57\xae\x67\xf9\x57\x4f\xed\x3c\x04\x88\xfc\xfa\xe0\
+\xf1\x78\xbc\xc8\x9e\xe5\x5f\x7d\x75\xc8\x21\x40\xb4\xd7\x07\x8f\
+\x17\xc9\x4b\x35\x2c\xaf\x5c\xcf\xf2\xaf\x9e\x7b\xe2\x10\x20\xf2\
+\xeb\x83\xc7\xe3\xf1\x22\x7b\x96\x7f\xf5\xdd\xbe\x43\x80\x68\xaf\
+\x0f\x1e\x2f\x92\x97\x6a\x58\x5e\xb9\x9e\xe5\x5f\x03\xf5\xf0\x10\
+\x20\xf2\xeb\x83\xc7\xe3\xf1\x22\x7b\x96\x7f\x0d\xd7\xf4\xc3\x37\
+\x6f\xde\xfc\xbc\xc8\xaf\x0f\x1e\x2f\x92\x97\x6a\x58\x5e\xb9\x9e\
+\xe5\x5f\x03\x77\xff\x2b\x02\xa3\xbe\x3e\x78\x3c\x1e\x2f\xb2\x67\
+\xf9\xd7\xf0\x7d\xf6\x10\x20\xda\xeb\x83\xc7\x8b\xe4\xa5\x1a\x96\
+\x57\xae\x67\xf9\x57\x84\xea\x7a\x76\x6f\xbd\x5e\xd7\xd1\x5e\x1f\
+\x3c\x1e\x8f\x17\xd9\xb3\xfc\x2b\x4e\xd3\x0f\x4f\xa7\xd3\xcf\x8b\
+\xf4\xfa\xe0\xf1\xa2\x79\xa9\x86\xe5\x95\xe9\x35\xcb\xff\x1f\x18\
+\xfe\x81\x21\x3d\xa8\xae\xab\xcd\x21\x40\x88\xd7\x07\x8f\xc7\xe3\
+\x45\xf6\x2c\xff\x8a\x56\x5d\xcf\xfe\xce\x73\xcf\xbd\xfd\x2d\x11\
+\x5e\x1f\x3c\x5e\x44\x2f\xd5\xb0\xbc\xf2\x3c\xcb\xbf\x22\xd6\xfe\
+\x26\x40\xfb\x71\x80\xa1\x5f\x1f\x3c\x1e\x8f\x17\xd9\xb3\xfc\x2b\
+\x6a\xed\x21\xc0\x7a\x7d\xe7\xad\x25\xbd\xde\x78\xbc\x73\x79\xa9\
+\x86\xe5\x95\xe5\x59\xfe\x15\xbc\x9d\x5f\x11\xd8\xc7\xeb\x83\xc7\
+\xe3\xf1\x22\x7b\x96\x7f\x45\xaf\x3d\x04\x78\xf6\xd9\x67\xdf\x38\
+\xc4\xeb\x83\xc7\x8b\xec\xa5\x1a\x96\x57\x8e\x67\xf9\x57\x92\x0e\
+\x3e\x04\x88\xfc\x7a\xe3\xf1\x78\xbc\x73\x7a\x96\x7f\xe5\x69\xfa\
+\xe1\x1b\x37\x6e\x5c\xeb\x10\x20\xda\xeb\x8d\xc7\x3b\xb7\x37\xc9\
+\x34\x2c\xaf\x0c\xcf\xf2\xaf\x64\x5d\x79\x08\x10\xf9\xf5\xc6\xe3\
+\xf1\x78\xe7\xf4\x2c\xff\xca\xd7\xe1\x87\x00\xd1\x5e\x6f\x3c\x5e\
+\x17\xde\x24\xd3\xb0\xbc\xfc\x9e\xe5\x5f\x49\xdb\x79\x08\x10\xf9\
+\xf5\xc6\xe3\xf1\x78\xe7\xf4\x2c\xff\xca\x5a\x55\xcd\xfe\xce\x55\
+\x87\x00\xd1\x5e\x6f\x3c\x5e\x67\x5e\xaa\x61\x79\xa9\x3d\xcb\xbf\
+\x92\xf7\xc4\x21\x40\xe4\xd7\x1b\x8f\xc7\xe3\x9d\xd3\xb3\xfc\x2b\
+\x7b\xfb\x0e\x01\xa2\xbd\xde\x78\xbc\x4e\xbd\x54\xc3\xf2\xd2\x7a\
+\x96\x7f\x15\xd2\xc3\x43\x80\xc8\xaf\x37\x1e\x8f\xc7\x3b\xa7\x67\
+\xf9\x57\x29\x6d\x3b\x04\x88\xf6\x7a\xe3\xf1\x3a\xf7\x52\x0d\xcb\
+\x4b\xe9\x59\xfe\x55\x58\xf7\xbf\x22\x30\xea\xeb\x8d\xc7\xe3\xf1\
+\xce\xe9\x59\xfe\x55\x5a\x97\x0f\x01\xa2\xbd\xde\x78\xbc\x48\x5e\
+\xaa\x61\x79\x71\x3c\xcb\xbf\x4a\xac\xae\x67\xf7\xd6\xeb\x75\x1d\
+\xed\xf5\xc6\xe3\xf1\x78\xe7\xf4\x2c\xff\x2a\xb5\xf6\x10\xa0\xfd\
+\x8a\xc0\x48\xaf\x37\x1e\x2f\x92\x97\x6a\x58\x5e\x1c\xcf\xf2\xaf\
+\x92\xab\xeb\x6a\x73\x08\x10\xe2\xf5\xc6\xe3\xf1\x78\xe7\xf4\x2c\
+\xff\x2a\xbf\xea\x23\xeb\xf5\x9d\xb7\x46\x78\xbd\xf1\x78\x91\xbc\
+\x54\xc3\xf2\xe2\x78\xcd\xf2\xff\x75\xc3\xdf\xd8\xa5\x6e\x6b\x7f\
+\x13\xa0\xfd\x38\xc0\xd0\xaf\x37\x1e\x8f\xc7\x3b\xa7\x67\xf9\xd7\
+\x78\x7a\x78\x08\x50\xcc\xeb\x97\xc7\x3b\xc5\x4b\x35\x2c\x2f\x8e\
+\x67\xf9\xd7\xc8\xda\xf9\x15\x81\x7d\xbc\xde\x78\x3c\x1e\xef\x9c\
+\x9e\xe5\x5f\xe3\xab\xfa\x48\xfb\x71\x80\x21\x5e\x6f\x3c\x5e\x24\
+\x2f\xd5\xb0\xbc\x38\x9e\xe5\x5f\x23\xed\xe0\x43\x80\xc8\xaf\x5f\
+\x1e\x8f\x37\x6e\xcf\xf2\xaf\xb1\xb6\xef\x2b\x02\xbb\x7a\xbd\xf1\
+\x78\x91\xbc\x54\xc3\xf2\xe2\x78\x96\x7f\x8d\xbc\x2b\x0f\x01\x22\
+\xbf\x7e\x79\x3c\xde\xb8\x3d\xcb\xbf\xc6\x5e\xf3\x3e\xf6\x23\x87\
+\x1e\x02\x44\x7b\xfd\xf2\x78\xa7\x78\xa9\x86\xe5\xc5\xf1\x2c\xff\
+\xd2\xfd\x76\x1e\x02\x44\x7e\xfd\xf2\x78\xbc\x71\x7b\x96\x7f\xe9\
+\x41\x87\x1c\x02\x44\x7b\xfd\xf2\x78\xa7\x78\xa9\x86\xe5\xc5\xf1\
+\x2c\xff\xd2\x23\x3d\x71\x08\x10\xf9\xf5\xcb\xe3\xf1\xc6\xed\x59\
+\xfe\xa5\x47\xdb\x77\x08\x10\xed\xf5\xcb\xe3\x9d\xe2\xa5\x1a\x96\
+\x17\xc7\xb3\xfc\x4b\x5b\x7b\x78\x08\x10\xf9\xf5\xcb\xe3\xf1\xc6\
+\xed\x59\xfe\xa5\xed\x6d\x3b\x04\x88\xf6\xfa\xe5\xf1\x4e\xf1\x52\
+\x0d\xcb\x8b\xe3\x59\xfe\xa5\xbd\xdd\xff\x8a\xc0\xa8\xaf\x5f\x1e\
+\x8f\x37\x6e\xcf\xf2\x2f\xed\xaf\x3d\x04\x78\xfa\xe9\xa7\x3f\x3f\
+\xe2\xeb\x97\xc7\x3b\xc5\x4b\x35\x2c\x2f\x8e\x67\xf9\x97\xae\xae\
+\xae\x67\xf7\xd6\xeb\x75\x1d\xed\xf5\xcb\xe3\xf1\xc6\xed\x59\xfe\
+\xa5\xc3\x6a\x0f\x01\x9e\x79\xe6\xc6\xe7\x47\x7a\xfd\xf2\x78\xa7\
+\x7a\xa9\x86\xe5\xc5\xf0\x2c\xff\xd2\xe1\xd5\x75\xb5\x39\x04\x08\
+\xf1\xfa\xe5\xf1\x78\xe3\xf6\x2c\xff\xd2\x75\xab\x3e\xba\x5a\xdd\
+\x7e\x3a\xc2\xeb\x97\xc7\x3b\x87\x97\x6a\x58\xde\xf0\x9e\xe5\x5f\
+\xba\x7e\xed\x6f\x02\xb4\x1f\x07\x18\xfa\xf5\xcb\xe3\xf1\xc6\xed\
+\x59\xfe\xa5\x63\x7b\x78\x08\x50\xcc\xfd\x80\x37\x5e\x2f\xd5\xb0\
+\xbc\x61\xbd\xf9\x7c\xfa\xc1\xe1\x6f\xc0\x52\xda\x76\x7e\x45\x60\
+\x1f\xaf\x5f\x1e\x8f\x37\x6e\xcf\xf2\x2f\x9d\x5a\xf5\xa3\xed\xc7\
+\x01\x86\x78\xfd\xf2\x78\xe7\xf4\x52\x0d\xcb\x1b\xce\xb3\xfc\x4b\
+\x67\xe9\xe0\x43\x80\xc8\xf7\x03\x1e\x8f\x97\xcb\xb3\xfc\x4b\xe7\
+\x69\x36\x9b\x7d\x74\xf3\x17\x03\xf6\xf5\xfa\xe5\xf1\xce\xed\x4d\
+\x32\x0d\xcb\x1b\xc6\xb3\xfc\x4b\x67\xed\xca\x43\x80\xc8\xf7\x03\
+\x1e\x8f\x97\xcb\xb3\xfc\x4b\xe7\xed\x3a\x87\x00\xd1\xee\x07\x3c\
+\x5e\xfb\xbf\x4f\x32\x0d\xcb\xeb\xdf\xb3\xfc\x4b\x9d\xb4\xf3\x10\
+\x20\xf2\xfd\x80\xc7\xe3\xe5\xf2\x2c\xff\x52\x37\x1d\x72\x08\x10\
+\xed\x7e\xc0\xe3\x3d\xf4\x52\x0d\xcb\xeb\xd5\xb3\xfc\x4b\x9d\xf6\
+\xc4\x21\x40\xe4\xfb\x01\x8f\xc7\xcb\xe5\x59\xfe\xa5\x6e\xdb\x77\
+\x08\x10\xed\x7e\xc0\xe3\x3d\xe2\xa5\x1a\x96\xd7\x9b\x67\xf9\x97\
+\x7a\xe9\xe1\x21\x40\xe4\xfb\x01\x8f\xc7\xcb\xe5\x59\xfe\xa5\x7e\
+\xda\x76\x08\x10\xed\x7e\xc0\xe3\x3d\xe1\xa5\x1a\x96\xd7\x8b\x67\
+\xf9\x97\x7a\xed\xfe\x57\x04\x46\xbd\x1f\xf0\x78\xbc\x5c\x9e\xe5\
+\x5f\xea\xb7\xcb\x87\x00\xd1\xee\x07\x3c\xde\x29\x5e\xaa\x61\x79\
+\x96\x7f\x29\x53\x75\x3d\xbb\xb7\x5e\xaf\xeb\x68\xf7\x03\x1e\x8f\
+\x97\xcb\xb3\xfc\x4b\xc3\xd4\x1e\x02\xb4\x5f\x11\x18\xe9\x7e\xc0\
+\xe3\x9d\xe2\xa5\x1a\x96\x67\xf9\x97\x32\x56\xd7\xd5\xe6\x10\x20\
+\xc4\xfd\x80\xc7\xe3\xe5\xf2\x2c\xff\xd2\xd0\x55\x3f\xb6\x5a\xdd\
+\x7e\x3a\xc2\xfd\x80\xc7\x3b\xc5\x4b\x35\x2c\xcf\xf2\x2f\x65\xae\
+\xfd\x4d\x80\xf6\xe3\x00\x43\xdf\x0f\x78\x3c\x5e\x2e\xcf\xf2\x2f\
+\x45\xe9\xe1\x21\x40\x31\xf7\x17\xde\xb8\xbc\x54\xc3\xf2\x2c\xff\
+\x52\x21\xed\xfc\x8a\xc0\x3e\xee\x07\x3c\x1e\x2f\x97\x67\xf9\x97\
+\xa2\x55\xfd\x58\xfb\x71\x80\x21\xee\x07\x3c\xde\x29\x5e\xaa\x61\
+\x79\x96\x7f\xa9\xb0\x0e\x3e\x04\x88\x7c\x7f\xe1\xf1\x78\xdd\x7a\
+\x96\x7f\x29\x66\x55\x35\xfb\xd1\x5d\x5f\x11\xd8\xd5\xfd\x80\xc7\
+\x3b\xc5\x4b\x35\x2c\xef\x94\xe5\x7f\xf6\xb5\x43\xdf\x20\x25\xed\
+\xec\xca\x43\x80\xc8\xf7\x17\x1e\x8f\xd7\xad\x67\xf9\x97\x62\x77\
+\x9d\x43\x80\x68\xf7\x17\xde\xb8\xbc\x54\xc3\xf2\x2c\xff\x52\xe1\
+\xed\x3c\x04\x88\x7c\x7f\xe1\xf1\x78\xdd\x7a\x96\x7f\x29\x47\xed\
+\x21\xc0\x9d\x3b\x6f\x7d\x53\xa6\xfb\x0b\x6f\x5c\x5e\xaa\x61\x79\
+\x96\x7f\x69\x24\x3d\x71\x08\x10\xf9\xfe\xc2\xe3\xf1\xba\xf5\x2c\
+\xff\x52\xae\xf6\x1d\x02\x44\xbb\xbf\xf0\xc6\xe5\xa5\x1a\x96\x67\
+\xf9\x97\x46\xd6\xc3\x43\x80\xc8\xf7\x17\x1e\x8f\xd7\xad\x67\xf9\
+\x97\x72\xb6\xed\x10\x20\xda\xfd\x85\x37\x2e\x2f\xd5\xb0\x3c\xcb\
+\xbf\x34\xd2\xee\x7f\x45\x60\xd4\xfb\x0b\x8f\xc7\xeb\xd6\xb3\xfc\
+\x4b\xb9\xbb\x7c\x08\x10\xed\xfe\xc2\x1b\x97\x97\x6a\x58\x9e\xe5\
+\x5f\x1a\x73\x75\x3d\xbb\xb7\x5e\xaf\xeb\x68\xf7\x17\x1e\x8f\xd7\
+\xad\x67\xf9\x97\xca\xa8\xaa\x66\x3f\xb6\x5e\xbf\xed\x4d\x91\xee\
+\x2f\xbc\xf1\x79\xa9\x86\xe5\x59\xfe\xa5\xb1\x57\xd7\xd5\xe6\x10\
+\x20\xc4\xfd\x85\xc7\xe3\x75\xeb\x59\xfe\xa5\xb2\x6a\x9e\xe3\x3f\
+\xfe\xd2\x4b\xcb\xb7\x45\xb8\xbf\xf0\xc6\xe9\xa5\x1a\x96\x77\x7d\
+\x6f\x6e\xf9\x97\x8a\xab\xfd\x4d\x80\xf6\xe3\x00\x43\xdf\x5f\x78\
+\x3c\x5e\xb7\x9e\xe5\x5f\x2a\xb3\x4b\x87\x00\xc5\xdc\xaf\x78\x79\
+\xbc\x54\xc3\xf2\xae\x77\xcd\x2d\xff\x52\xc9\xed\xfc\x8a\xc0\x3e\
+\xee\x2f\x3c\x1e\xaf\x5b\xcf\xf2\x2f\x95\x5d\x7b\x08\xd0\x7e\x1c\
+\x60\x88\xfb\x0b\x6f\xdc\x5e\xaa\x61\x79\x87\x5f\x73\xcb\xbf\x34\
+\x86\x0e\x3e\x04\x88\x7c\xbf\xe2\xf1\x78\x8f\x5e\x96\x7f\x69\x1c\
+\xb5\x7f\x27\xc0\xae\xaf\x08\xec\xea\xfe\xc2\xe3\x4d\x32\x0d\xcb\
+\x3b\xec\x9a\x5b\xfe\xa5\x31\x75\xe5\x21\x40\xe4\xfb\x15\x8f\xc7\
+\x7b\xf4\xb2\xfc\x4b\xe3\xea\x3a\x87\x00\xd1\xee\x57\xbc\x9c\xde\
+\x24\xd3\xb0\xbc\xab\xaf\xe6\x46\xf2\x1f\x0e\x7d\x23\x93\xd4\x7b\
+\x3b\x0f\x01\x22\xdf\xaf\x78\x3c\xde\xa3\x97\xe5\x5f\x1a\x67\x55\
+\x35\xfb\xbb\xcd\x73\xfc\x2d\x99\xee\x57\xbc\xc4\x5e\xaa\x61\x79\
+\x7b\xaf\xb9\xe5\x5f\x1a\x73\x4f\x1c\x02\x44\xbe\x5f\xf1\x78\xbc\
+\x47\x2f\xcb\xbf\x34\xee\xf6\x1d\x02\x44\xbb\x5f\xf1\x92\x7b\xa9\
+\x86\xe5\xed\xbc\xe6\x96\x7f\x49\x97\x0e\x01\x22\xdf\xaf\x78\x3c\
+\xde\xa3\x97\xe5\x5f\x52\xdb\xb6\x43\x80\x68\xf7\x2b\x5e\x01\x5e\
+\xaa\x61\x79\x5b\xaf\xb9\xe5\x5f\xd2\x67\xbb\xff\x15\x81\x51\xef\
+\x57\x3c\x1e\xef\xd1\xcb\xf2\x2f\xe9\x72\x97\x0f\x01\xa2\xdd\xaf\
+\x78\xe3\xf2\x52\x0d\x3b\x26\x6f\x6e\xf9\x97\xf4\x58\x75\x3d\xbb\
+\xb7\x5e\xaf\xeb\x68\xf7\x2b\x1e\x8f\xf7\xe8\x65\xf9\x97\xb4\xad\
+\xf6\x10\x60\xb1\x58\xbc\x25\xd2\xfd\x8a\x37\x2e\x2f\xd5\xb0\x63\
+\xf2\xe6\x96\x7f\x49\x3b\xaa\xeb\x6a\x73\x08\x10\xe2\x7e\xc5\xe3\
+\xf1\x1e\xbd\x2c\xff\x92\xf6\x57\x7d\xec\xf9\xe7\x9f\x7b\x26\xc2\
+\xfd\x8a\x37\x2e\x2f\xd5\xb0\x63\xf2\xe6\x96\x7f\x49\x57\xd4\xfe\
+\x26\x40\xfb\x71\x80\xa1\xef\x57\x3c\x1e\xef\xd1\xcb\xf2\x2f\xe9\
+\xb0\x1e\x1e\x02\x14\x73\xff\xe3\xc5\xf6\x52\x0d\x3b\x26\x6f\x6e\
+\xf9\x97\x74\x78\x3b\xbf\x22\xb0\x8f\xfb\x15\x8f\xc7\x7b\xf4\xb2\
+\xfc\x4b\xba\x5e\xd5\xc7\xe6\xf3\xf9\x5b\x87\xb8\x5f\xf1\xc6\xe5\
+\xa5\x1a\x76\x4c\xde\xdc\xf2\x2f\xe9\xfa\x1d\x7c\x08\x10\xf9\xfe\
+\xc7\xe3\x65\xf7\x2c\xff\x92\x8e\xa9\xaa\x66\x1f\xab\xaa\xea\x5a\
+\x87\x00\xd1\xee\x7f\xbc\xd8\x5e\xaa\x61\xc7\xe4\x55\xd5\xf4\xf7\
+\x0c\x7d\x03\x92\x94\xb6\x2b\x0f\x01\x22\xdf\xff\x78\xbc\xec\x9e\
+\xe5\x5f\xd2\x69\x4d\x7f\xfc\xc6\x8d\x1b\x6f\xcc\x78\xff\xe3\xc5\
+\xf6\x52\x0d\x3b\x26\xaf\x79\xe1\xff\xf6\xa6\xcf\x0c\x7f\xf3\x91\
+\x94\xb8\x9d\x87\x00\x91\xef\x7f\x3c\x5e\x76\xcf\xf2\x2f\xe9\x1c\
+\x55\xd5\xc5\xdf\x5a\x2c\x16\xaf\xcf\x74\xff\xe3\xc5\xf6\x52\x0d\
+\x3b\x26\xaf\xaa\xaa\xaf\x6c\x5e\xf4\x9f\x1e\xfa\xa6\x23\x29\x7f\
+\x55\x35\x7b\xf9\xd6\xad\x67\x6e\x66\xb9\xff\xf1\x78\xd9\x3d\xcb\
+\xbf\xa4\x73\xd6\x3c\xc7\xbf\xaf\xb9\xb5\xbc\x36\xc3\xfd\x8f\x17\
+\xdb\x4b\x35\xec\x98\xbc\xba\xbe\x78\x57\xf3\x62\xff\xd5\xa1\x6f\
+\x36\x92\x8a\xea\xe1\x6f\x02\x44\xbe\xff\xf1\x78\xd9\x3d\xcb\xbf\
+\xa4\x2e\xaa\xaa\xe9\x37\x47\xbf\xff\xf1\x62\x7b\xa9\x86\x1d\x93\
+\xb7\x58\xdc\x5c\x56\xd5\xec\x17\x87\xbe\xc9\x48\x2a\xaf\xf6\x37\
+\x01\x6e\xdf\xbe\x79\x33\xea\xfd\x8f\xc7\xcb\xee\x59\xfe\x25\x75\
+\xd9\x6c\x36\xfb\xfd\x51\xef\x7f\xbc\xd8\x5e\xaa\x61\xc7\xe4\xb5\
+\x9f\xef\x69\xde\xa0\xff\xdd\xa1\x6f\x2e\x92\xca\xad\xae\x67\xf7\
+\xd6\xeb\x75\x1d\xed\xfe\xc7\xe3\x65\xf7\x2c\xff\x92\x7a\xe8\xd3\
+\x75\x3d\x7d\x7f\xb4\xfb\x1f\x2f\xbe\x97\x6a\xd8\x31\x79\xcd\x8b\
+\xfa\x3b\x02\xdc\x58\x24\x15\x5e\x5d\x57\x9b\x43\x80\x30\xf7\x3f\
+\x1e\x2f\xb3\x67\xf9\x97\xd4\x57\xed\x6f\x0a\xdf\xb9\xb3\x5a\x44\
+\xb9\xff\xf1\x72\x78\xa9\x86\x1d\x8b\x37\x7f\xf0\x37\xfe\x0f\x7e\
+\x53\x91\x34\x9a\xee\x7f\x1c\x20\xc2\xfd\x8f\xc7\xcb\xec\x59\xfe\
+\x25\xf5\x5d\x5d\xcf\x3e\xfc\xee\x77\x7f\xc9\xeb\x87\xbe\xff\xf1\
+\xf2\x78\xa9\x86\x1d\x83\xb7\x5c\x3e\xdb\x7e\xee\xff\x57\x86\xbe\
+\x99\x48\x1a\x5d\x3b\xbf\x22\xb0\xaf\xfb\x1f\x8f\x97\xd9\xb3\xfc\
+\x4b\x1a\xaa\xc5\xa2\xfa\x4f\x4a\xba\x9f\xf2\xba\xf5\x52\x0d\x5b\
+\xba\x77\xe3\xc6\xd3\xaf\xa9\xeb\xd9\x8f\x0c\x7d\x13\x91\x34\xda\
+\x0e\x3e\x04\x88\x7e\x3f\xe5\xf1\xfa\xf4\x2c\xff\x92\x86\xac\xaa\
+\xa6\x9f\x9c\xcf\xe7\xef\x1e\xe2\xfe\xc7\xcb\xe7\x4d\x32\x0d\x5b\
+\xba\xb7\x58\x54\x5f\x3b\xf4\x0d\x44\xd2\xb8\x6b\xbf\x1d\xe0\xd6\
+\xad\x67\xf6\x7e\x1c\x20\xc3\xfd\x94\xc7\xeb\xcb\xb3\xfc\x4b\x8a\
+\x50\x55\x4d\xff\xc7\xe6\x96\xf4\x39\x7d\xde\xff\x78\x39\xbd\x49\
+\xa6\x61\x4b\xf6\xd6\xeb\x3b\x75\xf3\xe2\xfd\xe5\xa1\x6f\x1e\x92\
+\x34\xdf\xf3\x9b\x00\x19\xee\xa7\x3c\x5e\x5f\x9e\xe5\x5f\x52\xac\
+\xa6\x1f\xcc\x7a\x3f\xe5\xf5\xe8\xa5\x1a\xb6\x60\xaf\xae\xbd\x81\
+\x90\x14\xa7\x6d\xbf\x09\x90\xe5\x7e\xca\xe3\xf5\xe1\x59\xfe\x25\
+\xc5\x6b\xfa\x4f\x2e\x2e\x2e\xea\x6c\xf7\x53\x5e\xcf\x5e\xaa\x61\
+\x0b\xf5\xea\xba\x7e\xff\xf0\x37\x0c\x49\x7a\xa2\x87\xbf\x09\x90\
+\xe5\x7e\xca\xe3\xf5\xe1\x59\xfe\x25\xc5\x6d\xfa\x17\x33\xdd\x4f\
+\x79\x03\x78\xa9\x86\x2d\xd0\x6b\xbf\xb6\x63\x3e\xaf\x3e\x36\xfc\
+\xcd\x42\x92\xb6\x76\x6f\xb1\x58\x5c\x64\xb8\x9f\xf2\x78\x7d\x78\
+\x96\x7f\x49\xc1\x7b\xa5\xaa\xaa\xf7\x64\xb8\x9f\xf2\x62\x7b\xa9\
+\x86\xcd\xe4\xd5\x75\xfd\x3b\x02\xdc\x28\x24\x69\x5f\x2f\x3f\xff\
+\xfc\xa2\x8a\x7e\x3f\xe5\xf1\xba\xf6\x2c\xff\x92\x72\x34\xfd\xe1\
+\xe8\xf7\x53\x5e\x6c\x2f\xd5\xb0\x99\xbc\x97\x5e\x7a\xf1\x0d\xf3\
+\x79\x75\x6f\xf8\x9b\x84\x24\xed\xaf\xae\xab\x7b\xeb\xf5\xba\x8e\
+\x7a\x3f\xe5\xf1\xba\xf6\x2c\xff\x92\x32\x55\x55\xd5\x97\x46\xbd\
+\x9f\xf2\x62\x7b\xa9\x86\xcd\xe6\xd5\xf5\xec\xdf\x1d\xfa\xe6\x20\
+\x49\x87\xd6\xdc\xb3\xee\x7f\x1c\x20\xe2\xfd\x94\xc7\xeb\xd2\xb3\
+\xfc\x4b\xca\xd6\x6c\x36\xfb\xef\x22\xde\x4f\x79\xb1\xbd\x54\xc3\
+\x66\xf4\x9a\x37\xd3\x3f\x35\xf4\xcd\x41\x92\xae\xd3\xb6\x6f\x07\
+\x88\x70\x3f\xe5\xf1\xba\xf2\x2c\xff\x92\xb2\x36\x9b\xcd\xde\x1b\
+\xe9\x7e\xca\x8b\xed\xa5\x1a\x36\xa3\x77\xeb\x56\xfd\xaf\x0e\x7d\
+\x53\x90\xa4\x23\x7b\xf8\xed\x00\x11\xee\xa7\x3c\x5e\x57\x9e\xe5\
+\x5f\x52\xe6\xea\xba\xfa\xcb\x51\xee\xa7\xbc\xd8\x5e\xaa\x61\xb3\
+\x7a\x55\x35\xfb\xbe\xa1\x6f\x0a\x92\x74\x42\x57\x1e\x02\x64\xbd\
+\x3f\xf3\x78\xed\x65\xf9\x97\x94\xbf\xe9\x27\x6f\xdf\xbe\x7d\x6b\
+\xe8\xfb\x29\x2f\xb6\x97\x6a\xd8\xac\x5e\xf3\xa6\x79\xda\xbc\x28\
+\x3f\x3d\xfc\x4d\x41\x92\x8e\x6f\xdf\xc7\x01\xb2\xde\x9f\x79\xbc\
+\xf6\xb2\xfc\x4b\x2a\xa8\x0f\x95\x74\x7f\xe6\x59\xfe\x53\x7a\xcd\
+\x0b\xf1\x6b\x03\xdc\x0c\x24\xe9\x1c\x3d\xf1\x9b\x00\x99\xef\xcf\
+\x3c\x9e\xe5\x5f\x52\x61\xfd\xdc\x72\x59\x3f\x35\xc4\xfd\x94\x17\
+\xdb\x4b\x35\x6c\x76\x6f\x3e\x9f\xfe\x0f\x01\x6e\x06\x92\x74\xae\
+\x1e\x1e\x02\x64\xbf\x3f\xf3\xc6\xed\x59\xfe\x25\x95\xd8\xe5\xaf\
+\x04\xec\xeb\x7e\xca\x8b\xed\xa5\x1a\x36\xbb\xd7\xbc\x00\xef\x0c\
+\x7d\x13\x90\xa4\x73\xd7\x7e\x1c\xe0\xf6\xed\x9b\x37\x33\xdf\x9f\
+\x79\xe3\xf6\x2c\xff\x92\x4a\xad\xaa\xa6\xdf\xde\xe7\xfd\x94\x17\
+\xdb\x4b\x35\x6c\x09\x5e\xf3\x02\xfc\x86\xa1\x6f\x02\xce\x45\x5e\
+\x5c\x00\x00\x20\x00\x49\x44\x41\x54\x92\xd4\x45\x75\x3d\xbb\xb7\
+\x5e\xaf\xeb\xac\xf7\x67\xde\x78\x3d\xcb\xbf\xa4\x92\xab\xaa\xd9\
+\x2f\x35\xb7\xba\xd7\x66\xbc\x3f\xf3\xce\xef\xa5\x1a\xb6\x04\xaf\
+\xfd\xb7\x64\x43\xdf\x04\x24\xa9\xab\xea\xba\xda\x1c\x02\xa4\xbb\
+\x3f\xf3\xc6\xe9\x59\xfe\x25\x8d\xa1\xaa\xaa\x7e\x73\xb6\xfb\x33\
+\xaf\x1b\x2f\xd5\xb0\xd9\x3d\xbf\xfe\x2f\x69\x0c\xb5\xbf\x09\xb0\
+\x58\x2c\xf6\x7e\x45\x60\xb4\xfb\x33\x6f\x9c\x9e\xe5\x5f\xd2\x58\
+\xaa\xaa\xe9\x1f\xcd\x74\x7f\xe6\x75\xe7\xa5\x1a\x36\xbb\xd7\xbc\
+\xf0\x7e\xe7\xd0\x2f\x7e\x49\xea\xa9\x27\xbe\x1d\x20\xf2\xfd\x99\
+\x37\x3e\xcf\xf2\x2f\x69\x4c\xcd\x66\xb3\x8f\x66\xb9\x3f\xf3\xba\
+\xf5\x52\x0d\x9b\xdd\x9b\xcf\xa7\x7f\x6e\xe8\x17\xbf\x24\xf5\xd8\
+\xc1\x87\x00\x43\xdf\x9f\x79\xe3\xf2\x2c\xff\x92\xc6\x56\x55\x4d\
+\x7f\xfd\xe2\xe2\xe2\x37\x46\xbf\x3f\xf3\xba\xf7\x26\x99\x86\xcd\
+\xee\x35\x2f\xbc\x9f\x19\xfa\xc5\x2f\x49\x3d\x77\xe5\x21\x40\x84\
+\xfb\x33\x6f\x3c\x9e\xe5\x5f\xd2\x58\x9b\xcd\x66\xff\x72\xe4\xfb\
+\x33\xaf\x1f\x6f\x92\x69\xd8\xcc\x5e\x55\x55\xb3\xa1\x5f\xf4\x92\
+\x34\x50\x3b\x0f\x01\x22\xdc\x9f\x79\xe3\xf1\x2c\xff\x92\x46\xde\
+\x37\x46\xbd\x3f\xf3\x7a\xf4\x52\x0d\x9b\xd8\xab\xaa\x8b\x7f\x2b\
+\xc0\x8b\x5e\x92\x86\xea\x89\x43\x80\x28\xf7\x67\xde\x38\x3c\xcb\
+\xbf\xa4\xb1\xd7\xec\x23\x7f\x2b\xe2\xfd\x99\xd7\xb3\x97\x6a\xd8\
+\xc4\x5e\xf3\xa2\xfb\x2f\x86\x7e\xd1\x4b\xd2\x90\xb5\x5f\x83\x7a\
+\xeb\xd6\x33\x37\xa3\xdd\x9f\x79\xe5\x7b\x96\x7f\x49\xba\xff\xf7\
+\x00\xfc\x72\xb4\xfb\x33\x6f\x00\x2f\xd5\xb0\x89\xbd\xe6\x8d\xef\
+\xf7\x0d\xfd\xa2\x97\xa4\x00\xdd\xff\x8a\xc0\x48\xf7\x67\x5e\xd9\
+\x9e\xe5\x5f\x92\x3e\xdb\xad\x5b\xcb\x69\x94\xfb\x33\x2f\xb6\x97\
+\x6a\xd8\x88\x5e\xfb\x6f\xbe\x86\x7e\xc1\x4b\x52\x84\xea\x7a\x76\
+\x6f\xbd\x5e\xd7\x51\xee\xcf\xbc\x72\x3d\xcb\xbf\x24\x3d\xda\xad\
+\x5b\xf3\xdf\x1c\xe1\xfe\xcc\x8b\xed\xa5\x1a\x36\xa8\xf7\x9a\xaa\
+\x9a\x7e\x62\xe8\x17\xbc\x24\x45\xa9\xae\xab\xcd\x21\xc0\xd0\xf7\
+\x67\x5e\xa1\x9e\xe5\x5f\x92\x9e\x6c\xb1\xa8\xbe\x7a\xe8\xfb\x33\
+\x2f\xb6\x97\x6a\xd8\xa8\xde\x72\xf9\xec\x62\xe8\x17\xbb\x24\x45\
+\xab\xfd\x4d\x80\xf6\xe3\x00\x43\xde\x9f\x79\x65\x7a\x96\x7f\x49\
+\xda\x55\xf5\xc7\x4a\xba\xdf\xf3\x2c\xff\x21\xbd\xba\x9e\xbe\x7f\
+\xf8\x17\xbb\x24\x85\x6c\xe7\x57\x04\xf6\x71\x7f\xe6\x95\xe7\x59\
+\xfe\x25\x69\x5f\xd5\x5f\x29\xe5\x7e\xcf\xb3\xfc\x87\xf5\xe6\xf3\
+\xe9\xef\x18\xfe\xc5\x2e\x49\x31\xbb\xfc\xed\x00\x7d\xdf\x9f\x79\
+\x65\x79\x96\x7f\x49\xda\x5f\xf3\xcc\xfd\xe8\x10\xf7\x67\x5e\x6c\
+\x2f\xd5\xb0\x19\xbc\xba\x9e\x7e\xcd\xd0\x2f\x76\x49\x0a\xde\x95\
+\xbf\x09\x90\xe1\x7e\xcf\xb3\xfc\x4b\x52\xec\xa6\x3f\xd9\xf7\xfd\
+\x99\x17\xdb\x4b\x35\x6c\x16\x6f\xb1\xa8\xfe\xd3\xe1\x5f\xec\x92\
+\x14\xbe\x9d\x87\x00\x59\xee\xf7\xbc\x61\x3c\xcb\xbf\x24\x1d\x56\
+\x55\x4d\x7f\xa6\xcf\xfb\x33\x2f\xb6\x97\x6a\xd8\x4c\x5e\x5d\x57\
+\x7f\x74\xe8\x17\xbb\x24\x25\xe9\x89\x43\x80\x4c\xf7\x7b\x5e\xff\
+\x9e\xe5\x5f\x92\x0e\xaf\xaa\x66\xbf\x94\xf5\x7e\xcf\xb3\xfc\xa7\
+\xf1\x9a\x17\xdb\x37\x0f\xfd\x62\x97\xa4\x44\x3d\x3c\x04\xc8\x76\
+\xbf\xe7\xf5\xeb\x59\xfe\x25\xe9\xda\xfd\x5a\xc6\xfb\x3d\xcf\xf2\
+\x9f\xca\xab\xeb\xd9\x77\x04\x78\xb1\x4b\x52\xa6\xee\x7f\x45\x60\
+\xb6\xfb\x3d\xaf\x3f\xcf\xf2\x2f\x49\x47\xf5\x4a\x73\x0b\x7d\x6d\
+\xa6\xfb\x3d\xcf\xf2\x9f\xce\xab\xaa\xd9\x5f\x08\xf0\x62\x97\xa4\
+\x6c\xbd\xfc\xfc\xf3\x8b\x2a\xd3\xfd\x9e\xd7\x8f\x67\xf9\x97\xa4\
+\xe3\x5b\x2c\x16\xaf\xcf\x72\xbf\xe7\x9d\xdf\x4b\x35\x6c\x56\xaf\
+\x79\xa1\x7d\xcb\xd0\x2f\x74\x49\xca\x58\x5d\x57\xf7\xd6\xeb\x75\
+\x9d\xe5\x7e\xcf\xeb\xde\xb3\xfc\x4b\xd2\x49\x7d\x2a\xcb\xfd\x9e\
+\xd7\x8d\x97\x6a\xd8\xac\x5e\xf3\x42\xfb\xa6\x00\x2f\x76\x49\x4a\
+\x59\x5d\x3f\xf8\x38\x40\x86\xfb\x3d\xaf\x5b\xcf\xf2\x2f\x49\xa7\
+\x55\x55\xd3\xff\x37\xc3\xfd\x9e\xd7\x9d\x97\x6a\xd8\xac\x5e\xf3\
+\x42\xfb\x86\xa1\x5f\xec\x92\x94\xbc\x9d\x5f\x11\x18\xe9\x7e\xcf\
+\xeb\xce\xb3\xfc\x4b\xd2\x39\xba\xf8\xfb\xd1\xef\xf7\xbc\x6e\xbd\
+\x54\xc3\x66\xf5\xe6\xf3\xe9\x07\x87\x7f\xb1\x4b\x52\xfa\x0e\x3e\
+\x04\x28\xe5\xf9\xc1\x7b\x70\x59\xfe\x25\xe9\x3c\x55\xd5\xec\xa7\
+\x23\xdf\xef\x79\xdd\x7b\x93\x4c\xc3\x66\xf5\xea\x7a\xf6\x81\xa1\
+\x5f\xec\x92\x54\x48\x57\x1e\x02\x94\xf4\xfc\xe0\x59\xfe\x25\xe9\
+\x9c\x55\xd5\xf4\x27\xa2\xde\xef\x79\xfd\x78\x93\x4c\xc3\x66\xf5\
+\xea\x7a\xf6\xdb\x86\x7e\xb1\x4b\x52\x29\x55\xd5\xec\xe5\x5b\xb7\
+\x9e\xb9\x19\xf1\x7e\xcf\x3b\xaf\x67\xf9\x97\xa4\xf3\xd6\x3c\x43\
+\x7f\x28\xe2\xfd\x9e\xd7\xa3\x97\x6a\xd8\xa4\x5e\x5d\x5f\xbc\x6b\
+\xe8\x17\xbb\x24\x15\xd6\x13\xbf\x09\x10\xe1\x7e\xcf\x3b\x9f\x67\
+\xf9\x97\xa4\xf3\x57\x55\xd3\x6f\x8b\x76\xbf\xe7\xf5\xec\xa5\x1a\
+\x36\xa9\x77\xe7\xce\x5b\xdf\x34\xf4\x8b\x5d\x92\x0a\xec\xe1\x21\
+\x40\x94\xfb\x3d\xef\x3c\x9e\xe5\x5f\x92\xba\xa9\xaa\xa6\x5f\x17\
+\xe9\x7e\xcf\x1b\xc0\x4b\x35\x6c\x62\xaf\xaa\x66\xbf\x34\xf4\x0b\
+\x5e\x92\x0a\xec\xfe\x57\x04\x46\xba\xdf\xf3\x2c\xff\x92\x14\xb5\
+\xc5\xa2\xfa\xca\x28\xf7\x7b\x5e\x6c\x2f\xd5\xb0\x11\xbd\xd9\x6c\
+\xf6\xd1\xa1\x5f\xf0\x92\x54\x62\x75\x3d\xbb\xb7\x5e\xaf\xeb\x28\
+\xf7\x7b\x9e\xe5\x5f\x92\xa2\x76\xe7\xce\xfc\xa5\x08\xf7\x7b\x5e\
+\x6c\x2f\xd5\xb0\x51\xbd\xaa\x9a\xfd\xf9\xa1\x5f\xf0\x92\x54\x6a\
+\x75\x5d\x6d\x0e\x01\x06\xbf\xdf\xf3\x2c\xff\x92\x14\xb4\xcf\xdc\
+\xbd\xfb\x45\x6f\x1a\xfa\x7e\xcf\x8b\xed\xa5\x1a\x36\xb2\x57\xd7\
+\xb3\x3f\x18\xe0\x45\x2f\x49\x25\xf7\xf2\xed\xdb\x37\xb7\x7e\x3b\
+\x40\x9f\xf7\x7b\x9e\xe5\x5f\x92\x82\xf6\xb3\x43\xdf\xef\x79\xb1\
+\xbd\x54\xc3\x46\xf7\xe6\xf3\x8b\x7f\x29\xc0\x8b\x5e\x92\x4a\xef\
+\x89\x6f\x07\xe8\xfb\x7e\xcf\xb3\xfc\x4b\x52\xd0\xbe\xab\xa4\xe7\
+\x07\xcf\xf2\x1f\xda\x7b\xe7\x3b\xbf\xf8\x8d\xf3\xf9\xf4\x13\x01\
+\x5e\xf8\x92\x54\x7a\x07\x1f\x02\x64\x78\x7e\x94\xec\x59\xfe\x25\
+\xa9\xbf\xea\x7a\xf6\x81\x52\x9e\x1f\x3c\xcb\x7f\x0a\xaf\x79\xd1\
+\x7d\x78\xe8\x17\xbe\x24\x8d\xa4\x2b\x0f\x01\x32\x3d\x3f\x4a\xf4\
+\x2c\xff\x92\xd4\x6f\xb3\xd9\x6c\x3d\xc4\xfd\x9e\x17\xdb\x4b\x35\
+\x6c\x36\xaf\xae\xab\x3f\x32\xf4\x0b\x5f\x92\x46\xd4\xce\x43\x80\
+\x6c\xcf\x8f\xd2\x3c\xcb\xbf\x24\xf5\x5b\x55\x4d\xff\xc1\x10\xf7\
+\x7b\x5e\x6c\x2f\xd5\xb0\x19\xbd\xe5\xb2\xfa\xd7\x86\x7e\xf1\x4b\
+\xd2\xc8\x7a\xe2\x10\x20\xe3\xf3\xa3\x24\xcf\xf2\x2f\x49\xfd\x57\
+\x55\xb3\xef\xee\xfb\x7e\xcf\x8b\xed\xa5\x1a\x36\xab\x37\x9d\x4e\
+\x3f\xaf\xaa\xfc\x3d\x00\x92\xd4\x67\xcd\x9b\x9e\x97\x6f\xdd\x7a\
+\xe6\x66\xe6\xe7\x47\x29\x9e\xe5\x5f\x92\x86\x6a\xfa\xbb\xfb\xbc\
+\xdf\xf3\x62\x7b\xa9\x86\xcd\xee\x35\x2f\xbe\xef\x19\xfe\x06\x20\
+\x49\xa3\xeb\xde\x62\xb1\xb8\xc8\xfc\xfc\xc8\xee\x59\xfe\x25\x69\
+\xb0\x3e\x33\x6f\x96\x90\xac\xcf\x0f\x9e\xe5\x3f\xb5\xd7\xbc\x00\
+\xbf\x2a\xc0\x4d\x40\x92\x46\x57\x5d\xcf\xee\xad\xd7\xeb\x3a\xeb\
+\xf3\x23\xb3\x67\xf9\x97\xa4\xe1\xaa\xaa\xd9\x8f\x66\x7d\x7e\xf0\
+\xce\xef\xa5\x1a\xb6\x04\xaf\xaa\xaa\x37\x34\x2f\xc4\x7f\x3c\xf4\
+\x8d\x40\x92\xc6\x59\xf5\xf7\x9e\x7f\x7e\x51\x65\x7c\x7e\x64\xf5\
+\x2c\xff\x92\x34\x74\xd3\x0f\x66\x7c\x7e\xf0\xba\xf1\x52\x0d\x5b\
+\x8a\x57\x55\xd3\xef\x1c\xfe\x46\x20\x49\xe3\xac\xfd\x4d\x80\xf6\
+\xe3\x00\x19\x9f\x1f\xd9\x3c\xcb\xbf\x24\x0d\xde\xa7\x9a\x67\xde\
+\xb3\xd9\x9e\x1f\xbc\xee\xbc\x54\xc3\x96\xe2\x55\x55\xf5\x15\x01\
+\x6e\x06\x92\x34\xe6\x76\x7e\x45\x60\xe4\xe7\x47\x26\xcf\xf2\x2f\
+\x49\xc3\x57\x55\xb3\xbf\x9e\xed\xf9\xc1\xeb\xd6\x4b\x35\x6c\x41\
+\xde\xe7\x54\xd5\xf4\x17\x86\xbe\x21\x48\xd2\x98\xbb\xfc\xed\x00\
+\x89\x9e\x1f\x29\x3c\xcb\xbf\x24\xc5\xa8\xaa\xaa\xaf\xcc\xf4\xfc\
+\xe0\x75\xef\x4d\x32\x0d\x5b\x92\x57\x55\xd3\x6f\x18\xfa\x86\x20\
+\x49\xba\xfa\x37\x01\xa2\x3d\x3f\xa2\x7b\x96\x7f\x49\x8a\x51\x55\
+\xcd\xfe\x8f\xe6\xb6\xfc\xda\x2c\xcf\x0f\x5e\x3f\xde\x24\xd3\xb0\
+\x25\x79\xcf\x3e\xfb\xec\x8d\xaa\x9a\x7e\x62\xe8\x1b\x83\x24\x69\
+\xf7\x21\x40\xc4\xe7\x47\x64\xcf\xf2\x2f\x49\x71\x6a\x76\x8d\xaf\
+\xcb\xf2\xfc\xe0\xf5\xe8\xa5\x1a\xb6\x30\x6f\x3e\x9f\x7e\xc7\xd0\
+\x37\x06\x49\xd2\xf6\x8f\x03\x44\x7e\x7e\x44\xf4\x2c\xff\x92\x14\
+\xa7\x66\xf9\xff\xe5\xc5\x62\xf1\x05\x19\x9e\x1f\xbc\x9e\xbd\x54\
+\xc3\x16\xe6\xd5\x75\x7d\xbb\x79\x81\x7e\x6a\xe8\x1b\x84\x24\xe9\
+\x7e\x0f\x7f\x13\x20\xfa\xf3\x23\x9a\x67\xf9\x97\xa4\x70\xfd\xe1\
+\x0c\xcf\x0f\xde\x00\x5e\xaa\x61\x0b\xf4\x9a\x17\xe7\x77\x05\xb8\
+\x41\x48\x92\x1e\x74\xff\x2b\x02\x33\x3c\x3f\xa2\x78\x96\x7f\x49\
+\x0a\xd7\xaf\xb6\x1f\x37\x8e\xfe\xfc\xe0\xc5\xf6\x52\x0d\x9b\xc9\
+\xbb\x73\x67\xf5\xdc\x7c\x3e\xfd\xf5\x00\x37\x0a\x49\xd2\x83\x5e\
+\x7e\xfe\xf9\x45\x15\xfd\xf9\x11\xc1\xb3\xfc\x4b\x52\xc8\xbe\x31\
+\xfa\xf3\x83\x17\xdb\x4b\x35\x6c\x46\x6f\x3e\xaf\xfe\xcb\x00\x37\
+\x0a\x49\xd2\xab\xd5\x75\x75\x6f\xbd\x5e\xd7\xd1\x9f\x1f\x96\x7f\
+\x49\xd2\xe5\xaa\x6a\xf6\x8b\x4f\x3f\xfd\xf4\xe7\x47\x7e\x7e\xf0\
+\x62\x7b\xa9\x86\xcd\xea\x2d\x16\x8b\xb7\xcc\xe7\xd3\x7f\x38\xf4\
+\x0d\x43\x92\xf4\x48\x2f\xdf\xbe\x7d\xf3\xe6\xd5\x77\xf7\xe1\x9e\
+\x1f\x96\x7f\x49\xd2\xe5\xaa\xea\xe2\xab\x23\x3f\x3f\x78\xb1\xbd\
+\x54\xc3\x66\xf7\xea\x7a\xf6\x81\xa1\x6f\x18\x92\xa4\x27\xda\xf9\
+\x15\x81\x51\x9e\x1f\x7d\x7b\x96\x7f\x49\x8a\xda\xf4\xbf\x6f\x6e\
+\xd3\xaf\x89\xfa\xfc\xe0\xc5\xf6\x52\x0d\x5b\x88\xf7\xd4\x6c\x36\
+\xfb\xe8\xf0\x37\x0e\x49\xd2\x63\x1d\x7c\x08\x50\xc8\xf3\x68\xe7\
+\x65\xf9\x97\xa4\xb0\x7d\x6a\x3a\x9d\x7e\x71\xd4\xe7\x07\x2f\xb6\
+\x97\x6a\xd8\x92\xbc\xaa\xaa\x5e\xac\xaa\xe9\x3f\x0d\x70\x03\x91\
+\x24\x5d\xaa\xaa\x66\x2f\xdf\xba\xf5\xcc\xde\x8f\x03\x94\xf4\x3c\
+\xda\x76\x59\xfe\x25\x29\x6e\xcd\x0e\xf1\xc7\xa3\x3e\x3f\x78\xb1\
+\xbd\x54\xc3\x96\xe8\x35\x2f\xde\x3f\x30\xf4\x0d\x44\x92\xb4\xb5\
+\x9d\xbf\x09\x10\xe1\xf9\xd1\xa5\x67\xf9\x97\xa4\xb8\x35\xfb\xc3\
+\xff\xbc\x58\x2c\x5e\x1f\xf1\xf9\xc1\x8b\xed\xa5\x1a\xb6\x60\xef\
+\x35\xf3\xf9\xf4\x6f\x0f\x7d\x23\x91\x24\x6d\xed\x89\x43\x80\x40\
+\xcf\x8f\x4e\x3c\xcb\xbf\x24\xc5\xad\xfd\xed\xe1\xd9\x6c\xf6\x52\
+\xc4\xe7\x07\x2f\xb6\x97\x6a\xd8\xd2\xbd\xe9\x74\x3a\x6f\x5e\xd0\
+\x1f\x1f\xfa\x86\x22\x49\x7a\xb2\xcb\x1f\x07\x88\xf6\xfc\x38\xb7\
+\x67\xf9\x97\xa4\xd8\x55\xd5\xc5\xef\x8b\xf8\xfc\xe0\xc5\xf6\x52\
+\x0d\x3b\x16\xaf\xae\x67\x5f\xde\xbc\xa8\x3f\x3d\xf4\x4d\x45\x92\
+\xb4\xb5\x7b\x8b\xc5\xe2\x22\xe2\xf3\xe3\x5c\x9e\xe5\x5f\x92\x62\
+\x57\x55\xb3\xef\x8e\xf8\xfc\xe0\xc5\xf6\x52\x0d\x3b\x36\xaf\xaa\
+\xa6\x7f\x68\xe8\x1b\x8b\x24\x69\x67\x2f\x3f\xff\xfc\xa2\x8a\xf8\
+\xfc\xb0\xfc\x4b\x52\xd9\xb5\x9f\xfb\xbf\x71\xe3\xc6\x1b\xa3\x3d\
+\x3f\x78\xf1\xbd\x54\xc3\x8e\xcd\x7b\xdf\xfb\x7e\xd3\xeb\x9a\x17\
+\xf8\x5f\x1c\xfa\x06\x23\x49\xda\x5e\x5d\x57\xf7\xd6\xeb\x75\x1d\
+\xed\xf9\x61\xf9\x97\xa4\xa2\xfb\x78\x55\x55\x77\xa2\x3d\x3f\x78\
+\x39\xbc\x54\xc3\x8e\xd1\x7b\xef\x7b\xdf\xf3\xc6\xba\x9e\xfd\x70\
+\x80\x1b\x8d\x24\x69\x4b\xcd\x3d\xfa\xfe\xc7\x01\xa2\x3d\x3f\x2c\
+\xff\x92\x54\x5e\x55\x35\xfd\xc4\x74\x3a\xfd\xe7\xa3\x3d\x3f\x78\
+\x79\xbc\x54\xc3\x8e\xd5\x5b\xaf\xef\xdc\x9c\xcf\xa7\x3f\x35\xf4\
+\x0d\x47\x92\xb4\xbd\xcb\x7f\x31\x60\xa4\xe7\x87\xe5\x5f\x92\x8a\
+\xea\x53\xf3\xf9\xc5\x6f\x8d\xf6\xfc\xe0\xe5\xf2\x52\x0d\x3b\x66\
+\xef\xe6\xcd\x9b\xcf\x34\x6f\x30\x7f\x3a\xc0\x8d\x47\x92\xb4\xbd\
+\x27\xbe\x22\x30\xc2\xf3\xe3\x90\xcb\xf2\x2f\x49\xe1\xfb\x4c\x55\
+\x55\xff\x76\xb4\xe7\x07\x2f\x9f\x37\xc9\x34\xec\xd8\xbd\x8b\x8b\
+\x8b\xba\xaa\x66\x3f\x17\xe0\x06\x24\x49\xda\xd2\x21\xbf\x09\x10\
+\xed\x79\x64\xf9\x97\xa4\xf0\xbd\x52\xd7\xb3\x0f\x44\x7b\x7e\xf0\
+\x72\x7a\x93\x4c\xc3\xf2\x36\x87\x00\xd3\x9f\x0d\x70\x23\x92\x24\
+\x6d\x6f\xe7\x6f\x02\x44\x7b\x1e\x59\xfe\x25\x29\x7c\xaf\x34\xef\
+\xfd\x7f\x6f\xb4\xe7\x07\x2f\xb1\x97\x6a\x58\xde\xfd\xcb\x21\x80\
+\x24\x85\xef\x89\x43\x80\x08\xcf\x8f\xcb\x97\xe5\x5f\x92\xc2\x67\
+\xf9\xe7\x9d\xdf\x4b\x35\x2c\xef\xe1\xe5\x10\x40\x92\xc2\xf7\xf0\
+\x10\x20\xd2\xf3\xa3\xbd\x2c\xff\x92\x14\x3e\xcb\x3f\xaf\x1b\x2f\
+\xd5\xb0\xbc\x47\x2e\x87\x00\x92\x14\xbe\xfb\x5f\x11\x18\xe9\xf9\
+\x61\xf9\x97\xa4\xf0\x59\xfe\x79\x83\x7b\xa9\x86\x1d\x93\xe7\x10\
+\x40\x92\x62\x57\xd7\xb3\x7b\xeb\xf5\xba\x8e\xf0\xfc\xb0\xfc\x4b\
+\x52\xf8\x2c\xff\xbc\xc1\xbd\x54\xc3\x8e\xd1\x5b\x2c\x16\xab\xe6\
+\x66\xe1\x10\x40\x92\x82\x56\xd7\xd5\xe6\x10\xc0\xf2\x2f\x49\xda\
+\x95\xe5\x9f\x37\xb8\x97\x6a\xd8\x31\x7b\xcb\xa5\x43\x00\x49\x8a\
+\x5c\xfb\x9b\x00\xed\xc7\x01\x86\x78\x7e\x58\xfe\x25\x29\x7c\x96\
+\x7f\xde\xe0\x5e\xaa\x61\x79\x5f\xf6\xba\xf6\x37\x01\x7c\x1c\x40\
+\x92\x42\xb7\xf3\x2b\x02\xbb\x7a\x7e\x58\xfe\x25\x29\x7c\x96\x7f\
+\xde\xe0\x5e\xaa\x61\x79\x9f\xf5\xfc\x9d\x00\x92\x14\xbe\x83\x0f\
+\x01\x2c\xff\x92\x54\x7c\x96\x7f\xde\xe0\x5e\xaa\x61\x79\x4f\x7a\
+\x0e\x01\x24\x29\x7c\x57\x1e\x02\x58\xfe\x25\xa9\xf8\x2c\xff\xbc\
+\xc1\xbd\x54\xc3\xf2\x76\x7b\x0e\x01\x24\x29\x7c\x3b\x0f\x01\x2c\
+\xff\x92\x54\x7c\x96\x7f\xde\xe0\x5e\xaa\x61\x79\x57\x7b\x0e\x01\
+\x24\x29\x7c\x4f\x1c\x02\x58\xfe\x25\xa9\xf8\x2c\xff\xbc\xc1\xbd\
+\x54\xc3\xf2\x0e\xf7\x1c\x02\x48\x52\xf8\x1e\x1e\x02\x58\xfe\x25\
+\xa9\xf8\x2c\xff\xbc\xc1\xbd\x54\xc3\xf2\xae\xef\x39\x04\x90\xa4\
+\xf0\xdd\xff\x8a\x40\xcb\xbf\x24\x15\x9d\xe5\x9f\x37\xb8\x97\x6a\
+\x58\xde\xf1\x9e\x43\x00\x49\x8a\x5d\x5d\xcf\xee\xad\xd7\xeb\xda\
+\xf2\x2f\x49\x45\x66\xf9\xe7\x85\xf0\x52\x0d\xcb\x3b\xcd\x5b\x2c\
+\x16\xab\xe6\xe6\xe3\x10\x40\x92\x82\x56\xd7\xd5\xe6\x10\xc0\xf2\
+\x2f\x49\xe5\x64\xf9\xe7\x85\xf1\x52\x0d\xcb\x3b\xdd\x5b\x2e\x1d\
+\x02\x48\x52\xe4\xda\xdf\x04\x68\x3f\x0e\x70\xc8\xfd\xdd\xf2\x2f\
+\x49\xe1\xb3\xfc\xf3\x42\x79\xa9\x86\xe5\x9d\xc7\x6b\x7f\x13\xc0\
+\xc7\x01\x24\x29\x74\x3b\xbf\x22\x70\x73\x59\xfe\x25\x29\x7c\x96\
+\x7f\x5e\x38\x2f\xd5\xb0\xbc\xf3\x79\xfe\x4e\x00\x49\x0a\xdf\xce\
+\x43\x00\xcb\xbf\x24\x85\xcf\xf2\xcf\x0b\xe9\x4d\x32\x0d\xcb\x3b\
+\xaf\xe7\x10\x40\x92\xc2\xf7\xc4\x21\x80\xe5\x5f\x92\xc2\x67\xf9\
+\xe7\x85\xf5\x26\x99\x86\xe5\x9d\xdf\x73\x08\x20\x49\xe1\x7b\x78\
+\x08\x60\xf9\x97\xa4\xf0\x59\xfe\x79\xb1\xbd\x54\xc3\xf2\x3a\xf1\
+\x1c\x02\x48\x52\xf8\xee\x2d\x97\xcf\x2e\xe6\x96\x7f\x49\x8a\x9c\
+\xe5\x9f\x17\xdf\x4b\x35\x2c\xaf\x33\xaf\x7d\x63\x59\x55\xb3\x9f\
+\x0b\x70\xe3\x94\x24\x6d\xa9\x79\x53\xf9\x89\xa1\x67\x90\x24\xed\
+\xec\x95\xf9\x7c\xfa\xbb\x23\xbd\xbf\xe7\xf1\xb6\x7a\xa9\x86\xe5\
+\x75\xea\xf9\x4d\x00\x49\x92\x24\xe9\xda\xf9\x37\xff\xbc\xe2\xbc\
+\x54\xc3\xf2\x8e\xf7\x1c\x02\x48\x92\x24\x49\x07\x67\xf9\xe7\x15\
+\xe7\xa5\x1a\x96\x77\xba\xb7\x58\x2c\x56\xcd\xcd\xcc\x21\x80\x24\
+\x49\x92\xb4\x3b\xcb\x3f\xaf\x38\x2f\xd5\xb0\xbc\xf3\x79\xcb\xa5\
+\x43\x00\x49\x92\x24\x69\x47\x96\x7f\x5e\x71\x5e\xaa\x61\x79\xe7\
+\xf7\xda\xdf\x04\xf0\x71\x00\x49\x92\x24\xe9\x91\x2c\xff\xbc\xe2\
+\xbc\x54\xc3\xf2\xba\xf3\xfc\x9d\x00\x92\x24\x49\xd2\xc3\x2c\xff\
+\xbc\xe2\xbc\x54\xc3\xf2\xba\xf7\x1c\x02\x48\x92\x24\x49\x96\x7f\
+\x5e\x79\x5e\xaa\x61\x79\xfd\x79\x0e\x01\x24\x49\x92\x34\xe2\x2c\
+\xff\xbc\xe2\xbc\x54\xc3\xf2\xfa\xf7\x1c\x02\x48\x92\x24\x69\x84\
+\x59\xfe\x79\xc5\x79\xa9\x86\xe5\x0d\xe7\x39\x04\x90\x24\x49\xd2\
+\x88\xb2\xfc\xf3\x8a\xf3\x52\x0d\xcb\x1b\xde\x73\x08\x20\x49\x92\
+\xa4\x11\x64\xf9\xe7\x15\xe7\xa5\x1a\x96\x17\xc7\x73\x08\x20\x49\
+\x92\xa4\x82\xb3\xfc\xf3\x8a\xf4\x52\x0d\xcb\x8b\xe5\x2d\x16\x8b\
+\x55\x73\x73\x74\x08\x20\x49\x92\xa4\x92\xb2\xfc\xf3\x8a\xf5\x52\
+\x0d\xcb\x8b\xe7\x2d\x97\x0e\x01\x24\x49\x92\x54\x4c\x96\x7f\x5e\
+\xd1\x5e\xaa\x61\x79\x31\xbd\xf6\x37\x01\x7c\x1c\x40\x92\x24\x49\
+\xc9\xb3\xfc\xf3\x8a\xf7\x52\x0d\xcb\x8b\xeb\xf9\x3b\x01\x24\x49\
+\x92\x94\x38\xcb\x3f\x6f\x14\xde\x24\xd3\xb0\xbc\xd8\x9e\x43\x00\
+\x49\x92\x24\x25\xcc\xf2\xcf\x1b\x8d\x37\xc9\x34\x2c\x2f\xbe\xe7\
+\x10\x40\x92\x24\x49\x89\xb2\xfc\xf3\xc6\xe5\xa5\x1a\x96\x97\xc2\
+\x73\x08\x20\x49\x92\xa4\x04\x59\xfe\x79\xe3\xf3\x52\x0d\xcb\x4b\
+\xe3\x39\x04\x90\x24\x49\x52\xe0\x2c\xff\xbc\x71\x7a\xa9\x86\xe5\
+\xa5\xf2\x1c\x02\x48\x92\x24\x29\x60\x96\x7f\x1e\xaf\xa4\x61\x79\
+\x71\x3c\x87\x00\x92\x24\x49\x0a\x94\xe5\x9f\xc7\x2b\x69\x58\x5e\
+\x3c\x6f\xb1\x58\xac\x9a\x9b\xad\x43\x00\x49\x92\x24\x0d\x99\xe5\
+\x9f\xc7\x2b\x69\x58\x5e\x5c\x6f\xb9\x74\x08\x20\x49\x92\xa4\xc1\
+\xb2\xfc\xf3\x78\x25\x0d\xcb\x8b\xef\xb5\xbf\x09\xe0\xe3\x00\x92\
+\x24\x49\xea\x39\xcb\x3f\x8f\x57\xd2\xb0\xbc\x3c\x9e\xbf\x13\x40\
+\x92\x24\x49\x3d\x66\xf9\xe7\xf1\x4a\x1a\x96\x97\xcf\x73\x08\x20\
+\x49\x92\xa4\x1e\xb2\xfc\xf3\x78\x25\x0d\xcb\xcb\xeb\x39\x04\x90\
+\x24\x49\x52\x87\x59\xfe\x79\xbc\x92\x86\xe5\xe5\xf7\x1c\x02\x48\
+\x92\x24\xa9\x83\x2c\xff\x3c\x5e\x49\xc3\xf2\xca\xf1\x1c\x02\x48\
+\x92\x24\xe9\x8c\x59\xfe\x79\xbc\x92\x86\xe5\x95\xe7\x39\x04\x90\
+\x24\x49\xd2\x19\xb2\xfc\xf3\x78\x25\x0d\xcb\x2b\xd7\x73\x08\x20\
+\x49\x92\xa4\x13\xb2\xfc\xf3\x78\x07\x78\xa9\x86\xe5\x95\xed\x2d\
+\x16\x8b\x55\x73\xf3\x76\x08\x20\x49\x92\xa4\xeb\x64\xf9\xe7\xf1\
+\x0e\xf4\x52\x0d\xcb\x2b\xdf\x5b\x2e\x1d\x02\x48\x92\x24\xe9\xe0\
+\x2c\xff\x3c\xde\x35\xbc\x54\xc3\xf2\xc6\xe1\xb5\xbf\x09\xe0\xe3\
+\x00\x92\x24\x49\xba\x22\xcb\x3f\x8f\x77\x4d\x2f\xd5\xb0\xbc\xf1\
+\x78\xfe\x4e\x00\x49\x92\x24\xed\xc9\xf2\xcf\xe3\x1d\xe1\x4d\x32\
+\x0d\xcb\x1b\x97\xe7\x10\x40\x92\x24\x49\x5b\xb2\xfc\xf3\x78\x47\
+\x7a\x93\x4c\xc3\xf2\xc6\xe7\x39\x04\x90\x24\x49\xd2\xa5\x2c\xff\
+\x3c\xde\x29\x5e\xaa\x61\x79\xa3\xf4\x1c\x02\x48\x92\x24\x69\x6e\
+\xf9\xe7\xf1\x4e\xf7\x52\x0d\xcb\x1b\xad\xe7\x10\x40\x92\x24\x69\
+\xd4\x59\xfe\x79\xbc\x73\x78\xa9\x86\xe5\x8d\xda\x73\x08\x20\x49\
+\x92\x34\xca\x2c\xff\x3c\x5e\xcf\x5e\xaa\x61\x79\xe5\x7a\x0e\x01\
+\x24\x49\x92\x46\x95\xe5\x9f\xc7\xeb\xd9\x4b\x35\x2c\xaf\x7c\x6f\
+\xb1\x58\xac\x9a\x87\x81\x43\x00\x49\x92\xa4\xb2\xb3\xfc\xf3\x78\
+\x3d\x7b\xa9\x86\xe5\x8d\xc7\x5b\x2e\x1d\x02\x48\x92\x24\x15\x9c\
+\xe5\x9f\xc7\xeb\xd9\x4b\x35\x2c\x6f\x7c\x5e\xfb\x9b\x00\x3e\x0e\
+\x20\x49\x92\x54\x5c\x96\x7f\x1e\xaf\x67\x2f\xd5\xb0\xbc\xf1\x7a\
+\xfe\x4e\x00\x49\x92\xa4\xa2\xb2\xfc\xf3\x78\x3d\x7b\xa9\x86\xe5\
+\xf1\x1c\x02\x48\x92\x24\x15\x91\xe5\x9f\xc7\xeb\xd9\x4b\x35\x2c\
+\x8f\xb7\xb9\x1c\x02\x48\x92\x24\xa5\xce\xf2\xcf\xe3\xf5\xec\xa5\
+\x1a\x96\xc7\x7b\xfc\x72\x08\x20\x49\x92\x94\x32\xcb\x3f\x8f\xd7\
+\xb3\x97\x6a\x58\x1e\x6f\xd7\xe5\x10\x40\x92\x24\x29\x55\x96\x7f\
+\x1e\xaf\x67\x2f\xd5\xb0\x3c\xde\x55\x97\x43\x00\x49\x92\xa4\x14\
+\x59\xfe\x79\xbc\x9e\xbd\x54\xc3\xf2\x78\x87\x5e\x0e\x01\x24\x49\
+\x92\x42\x67\xf9\xe7\xf1\x06\xf0\x52\x0d\xcb\xe3\x5d\xc7\x5b\x2c\
+\x16\xab\xe6\xe1\xe2\x10\x40\x92\x24\x29\x56\x96\x7f\x1e\x6f\x20\
+\x2f\xd5\xb0\x3c\xde\x75\xbd\xe5\xd2\x21\x80\x24\x49\x52\xa0\x2c\
+\xff\x3c\xde\x80\x5e\xaa\x61\x79\xbc\x63\xbc\xf6\x37\x01\x7c\x1c\
+\x40\x92\x24\x69\xf0\x2c\xff\x3c\xde\xc0\x5e\xaa\x61\x79\xbc\x63\
+\x3d\x7f\x27\x80\x24\x49\xd2\xa0\x59\xfe\x79\xbc\x00\xde\x24\xd3\
+\xb0\x3c\xde\x29\x9e\x43\x00\x49\x92\xa4\x41\xb2\xfc\xf3\x78\x41\
+\xbc\x49\xa6\x61\x79\xbc\x53\x3d\x87\x00\x92\x24\x49\xbd\x66\xf9\
+\xe7\xf1\x22\x79\xa9\x86\xe5\xf1\xce\xe0\x39\x04\x90\x24\x49\xea\
+\x25\xcb\x3f\x8f\x17\xcd\x4b\x35\x2c\x8f\x77\x26\xcf\x21\x80\x24\
+\x49\x52\xa7\x59\xfe\x79\xbc\x88\x5e\xaa\x61\x79\xbc\x33\x7a\x0e\
+\x01\x24\x49\x92\x3a\xc9\xf2\xcf\xe3\x25\xf7\x52\x0d\xcb\xe3\x1d\
+\x7a\x39\x04\x90\x24\x49\x3a\x6b\x96\x7f\x1e\x2f\xb9\x97\x6a\x58\
+\x1e\xef\xba\xde\x62\xb1\x58\x35\x0f\x2b\x87\x00\x92\x24\x49\xa7\
+\x65\xf9\xe7\xf1\x92\x7b\xa9\x86\xe5\xf1\x8e\xf5\x96\x4b\x87\x00\
+\x92\x24\x49\x27\x64\xf9\xe7\xf1\x92\x7b\xa9\x86\xe5\xf1\x4e\xf5\
+\xda\xdf\x04\xf0\x71\x00\x49\x92\xa4\x6b\x67\xf9\xe7\xf1\x92\x7b\
+\xa9\x86\xe5\xf1\xce\xe5\xf9\x3b\x01\x24\x49\x92\xae\x95\xe5\x9f\
+\xc7\x4b\xee\xa5\x1a\x96\xc7\x3b\xb7\xe7\x10\x40\x92\x24\xe9\xa0\
+\x2c\xff\x3c\x5e\x72\x2f\xd5\xb0\x3c\x5e\x57\x9e\x43\x00\x49\x92\
+\xa4\xbd\x59\xfe\x79\xbc\xe4\x5e\xaa\x61\x79\xbc\xae\x3d\x87\x00\
+\x92\x24\x49\x5b\xb3\xfc\xf3\x78\xc9\xbd\x54\xc3\xf2\x78\x7d\x79\
+\x0e\x01\x24\x49\x92\x1e\xc9\xf2\xcf\xe3\x25\xf7\x52\x0d\xcb\xe3\
+\xf5\xed\x39\x04\x90\x24\x49\xba\x9f\xe5\x9f\xc7\x4b\xee\xa5\x1a\
+\x96\xc7\x1b\xca\x73\x08\x20\x49\x92\x46\x9e\xe5\x9f\xc7\x2b\xc0\
+\x4b\x35\x2c\x8f\x37\xa4\xb7\x58\x2c\x56\xcd\xc3\xcf\x21\x80\x24\
+\x49\x1a\x5b\x96\x7f\x1e\xaf\x10\x2f\xd5\xb0\x3c\xde\xd0\xde\x72\
+\xe9\x10\x40\x92\x24\x8d\x2a\xcb\x3f\x8f\x57\x90\x97\x6a\x58\x1e\
+\x2f\x82\xd7\xfe\x26\x80\x8f\x03\x48\x92\xa4\x11\x64\xf9\xe7\xf1\
+\x0a\xf3\x52\x0d\xcb\xe3\x45\xf1\xfc\x9d\x00\x92\x24\xa9\xf0\x2c\
+\xff\x3c\x5e\x81\xde\x24\xd3\xb0\x3c\x5e\x24\xcf\x21\x80\x24\x49\
+\x2a\x34\xcb\x3f\x8f\x57\xa8\x37\xc9\x34\x2c\x8f\x17\xcd\x73\x08\
+\x20\x49\x92\x0a\xcb\xf2\xcf\xe3\x95\xec\xa5\x1a\x96\xc7\x0b\xe8\
+\x39\x04\x90\x24\x49\x85\x64\xf9\xe7\xf1\x4a\xf7\x52\x0d\xcb\xe3\
+\x05\xf5\x1c\x02\x48\x92\xa4\xe4\x59\xfe\x79\xbc\x31\x78\xa9\x86\
+\xe5\xf1\x02\x7b\x0e\x01\x24\x49\x52\xd2\x2c\xff\x3c\x1e\x2f\xef\
+\xb0\x3c\xde\x50\x9e\x43\x00\x49\x92\x94\x2c\xcb\x3f\x8f\xc7\xcb\
+\x3b\x2c\x8f\x37\xb4\xb7\x58\x2c\x56\xcd\xc3\xd4\x21\x80\x24\x49\
+\x8a\x9e\xe5\x9f\xc7\xe3\xe5\x1d\x96\xc7\x8b\xe2\x2d\x97\x0e\x01\
+\x24\x49\x52\xe8\x2c\xff\x3c\x1e\x2f\xef\xb0\x3c\x5e\x34\xaf\xfd\
+\x4d\x00\x1f\x07\x90\x24\x49\x01\xb3\xfc\xf3\x78\xbc\xbc\xc3\xf2\
+\x78\x51\x3d\x7f\x27\x80\x24\x49\x0a\x96\xe5\x9f\xc7\xe3\xe5\x1d\
+\x96\xc7\x8b\xee\x39\x04\x90\x24\x49\x41\xb2\xfc\xf3\x78\xbc\xbc\
+\xc3\xf2\x78\x59\x3c\x87\x00\x92\x24\x69\xe0\x2c\xff\x3c\x1e\x2f\
+\xef\xb0\x3c\x5e\x36\xcf\x21\x80\x24\x49\x1a\x28\xcb\x3f\x8f\xc7\
+\xcb\x3b\x2c\x8f\x97\xd5\x73\x08\x20\x49\x92\x7a\xce\xf2\xcf\xe3\
+\xf1\xf2\x0e\xcb\xe3\x65\xf7\x1c\x02\x48\x92\xa4\x9e\xb2\xfc\xf3\
+\x78\xbc\xbc\xc3\xf2\x78\xa5\x78\x0e\x01\x24\x49\x52\xc7\x59\xfe\
+\x79\x3c\xde\x13\x5e\xaa\x61\x79\xbc\x92\xbc\xc5\x62\xb1\x6a\x1e\
+\xce\x0e\x01\x24\x49\xd2\xb9\xb3\xfc\xf3\x78\xbc\xad\x5e\xaa\x61\
+\x79\xbc\xd2\xbc\xe5\xd2\x21\x80\x24\x49\x3a\x6b\x96\x7f\x1e\x8f\
+\xb7\xd3\x4b\x35\x2c\x8f\x57\xa2\xd7\xfe\x26\x80\x8f\x03\x48\x92\
+\xa4\x33\x64\xf9\xe7\xf1\x78\x7b\xbd\x54\xc3\xf2\x78\xa5\x7a\xfe\
+\x4e\x00\x49\x92\x74\x62\x96\x7f\x1e\x8f\x77\xa5\x37\xc9\x34\x2c\
+\x8f\x57\xb2\xe7\x10\x40\x92\x24\x1d\x99\xe5\x9f\xc7\xe3\x1d\xe4\
+\x4d\x32\x0d\xcb\xe3\x95\xee\x39\x04\x90\x24\x49\xd7\xcc\xf2\xcf\
+\xe3\xf1\x0e\xf7\x52\x0d\xcb\xe3\x8d\xc0\x73\x08\x20\x49\x92\x0e\
+\xcc\xf2\xcf\xe3\xf1\xae\xe7\xa5\x1a\x96\xc7\x1b\x89\xe7\x10\x40\
+\x92\x24\x5d\x91\xe5\x9f\xc7\xe3\x5d\xdf\x4b\x35\x2c\x8f\x37\x22\
+\xcf\x21\x80\x24\x49\xda\x91\xe5\x9f\xc7\xe3\x75\xea\xa5\x1a\x96\
+\xc7\x2b\xc5\x73\x08\x20\x49\x92\x1e\xcb\xf2\xcf\xe3\xf1\x3a\xf5\
+\x52\x0d\xcb\xe3\x95\xe6\x2d\x16\x8b\x55\xf3\xb0\x77\x08\x20\x49\
+\x92\x2c\xff\x3c\x1e\xaf\x53\x2f\xd5\xb0\x3c\x5e\xa9\xde\x72\xe9\
+\x10\x40\x92\xa4\x91\x67\xf9\xe7\xf1\x78\x9d\x7a\xa9\x86\xe5\xf1\
+\x4a\xf7\xda\xdf\x04\xf0\x71\x00\x49\x92\x46\x99\xe5\x9f\xc7\xe3\
+\x75\xea\xa5\x1a\x96\xc7\x1b\x8b\xe7\xef\x04\x90\x24\x69\x74\x59\
+\xfe\x79\x3c\x5e\xa7\x5e\xaa\x61\x79\xbc\xb1\x79\x0e\x01\x24\x49\
+\x1a\x4d\x96\x7f\x1e\x8f\xd7\xa9\x97\x6a\x58\x1e\x6f\xac\x9e\x43\
+\x00\x49\x92\x8a\xcf\xf2\xcf\xe3\xf1\x3a\xf5\x52\x0d\xcb\xe3\x8d\
+\xdd\x73\x08\x20\x49\x52\xb1\x59\xfe\x79\x3c\x5e\xa7\x5e\xaa\x61\
+\x79\x3c\xde\x83\xcb\x21\x80\x24\x49\xc5\x65\xf9\xe7\xf1\x78\x9d\
+\x7a\xa9\x86\xe5\xf1\x78\x8f\x5e\x0e\x01\x24\x49\x2a\x26\xcb\x3f\
+\x8f\xc7\xeb\xd4\x4b\x35\x2c\x8f\xc7\xdb\x7e\x39\x04\x90\x24\x29\
+\x7d\x96\x7f\x1e\x8f\xd7\xb9\x97\x6a\x58\x1e\x8f\xb7\xdb\x5b\x2c\
+\x16\xab\xe6\xcd\x83\x43\x00\x49\x92\xf2\x65\xf9\xe7\xf1\x78\xbd\
+\x78\xa9\x86\xe5\xf1\x78\xfb\xbd\xe5\xd2\x21\x80\x24\x49\xc9\xb2\
+\xfc\xf3\x78\xbc\xde\xbc\x54\xc3\xf2\x78\xbc\xab\xbd\xf6\x37\x01\
+\x7c\x1c\x40\x92\xa4\x14\x59\xfe\x79\x3c\x5e\xaf\x5e\xaa\x61\x79\
+\x3c\xde\x61\x9e\xbf\x13\x40\x92\xa4\xf0\x59\xfe\x79\x3c\x5e\xef\
+\xde\x24\xd3\xb0\x3c\x1e\xef\x70\xcf\x21\x80\x24\x49\x61\xb3\xfc\
+\xf3\x78\xbc\x41\xbc\x49\xa6\x61\x79\x3c\xde\xf5\x3c\x87\x00\x92\
+\x24\x85\xcb\xf2\xcf\xe3\xf1\x86\xf3\x52\x0d\xcb\xe3\xf1\xae\xed\
+\x39\x04\x90\x24\x29\x4c\x96\x7f\x1e\x8f\x37\xac\x97\x6a\x58\x1e\
+\x8f\x77\x94\xe7\x10\x40\x92\xa4\xc1\xb3\xfc\xf3\x78\xbc\xe1\xbd\
+\x54\xc3\xf2\x78\xbc\xa3\x3d\x87\x00\x92\x24\x0d\x96\xe5\x9f\xc7\
+\xe3\xa5\xf2\x52\x0d\xcb\xe3\xf1\xb6\x5f\x0e\x01\x24\x49\xea\x3d\
+\xcb\x3f\x8f\xc7\x4b\xe5\xa5\x1a\x96\xc7\xe3\xed\xf7\x16\x8b\xc5\
+\xaa\x79\x33\xe2\x10\x40\x92\xa4\xee\xb3\xfc\xf3\x78\xbc\x54\x5e\
+\xaa\x61\x79\x3c\xde\x61\xde\x72\xe9\x10\x40\x92\xa4\x8e\xb3\xfc\
+\xf3\x78\xbc\x54\x5e\xaa\x61\x79\x3c\xde\xf5\xbc\xf6\x37\x01\x7c\
+\x1c\x40\x92\xa4\x4e\xb2\xfc\xf3\x78\xbc\x54\x5e\xaa\x61\x79\x3c\
+\xde\x71\x9e\xbf\x13\x40\x92\xa4\xb3\x67\xf9\xe7\xf1\x78\xa9\xbc\
+\x54\xc3\xf2\x78\xbc\xd3\x3c\x87\x00\x92\x24\x9d\x2d\xcb\x3f\x8f\
+\xc7\x4b\xe5\xa5\x1a\x96\xc7\xe3\x9d\xc7\x73\x08\x20\x49\xd2\xc9\
+\x59\xfe\x79\x3c\x5e\x2a\x2f\xd5\xb0\x3c\x1e\xef\xbc\x9e\x43\x00\
+\x49\x92\x8e\xce\xf2\xcf\xe3\xf1\x52\x79\xa9\x86\xe5\xf1\x78\xdd\
+\x78\x0e\x01\x24\x49\xba\x76\x96\x7f\x1e\x8f\x97\xca\x4b\x35\x2c\
+\x8f\xc7\xeb\xd6\x73\x08\x20\x49\xd2\xc1\x59\xfe\x79\x3c\x5e\x2a\
+\x2f\xd5\xb0\x3c\x1e\xaf\x1f\xcf\x21\x80\x24\x49\x57\x66\xf9\xe7\
+\xf1\x78\xe9\xbc\x54\xc3\xf2\x78\xbc\xfe\xbc\xc5\x62\xb1\x6a\xde\
+\xdc\x38\x04\x90\x24\xe9\xc9\x2c\xff\x3c\x1e\x2f\xa5\x97\x6a\x58\
+\x1e\x8f\xd7\xaf\xb7\x5c\x3a\x04\x90\x24\xe9\xb1\x2c\xff\x3c\x1e\
+\x2f\xad\x97\x6a\x58\x1e\x8f\xd7\xbf\xd7\xfe\x26\x80\x8f\x03\x48\
+\x92\x74\x3f\xcb\x3f\x8f\xc7\x4b\xed\xa5\x1a\x96\xc7\xe3\x0d\xe3\
+\xf9\x3b\x01\x24\x49\xb2\xfc\xf3\x78\xbc\xfc\xde\x24\xd3\xb0\x3c\
+\x1e\x6f\x38\xcf\x21\x80\x24\x69\xc4\x59\xfe\x79\x3c\x5e\x11\xde\
+\x24\xd3\xb0\x3c\x1e\x6f\x58\xcf\x21\x80\x24\x69\x84\x59\xfe\x79\
+\x3c\x5e\x39\x5e\xaa\x61\x79\x3c\xde\xe0\x9e\x43\x00\x49\xd2\x88\
+\xb2\xfc\xf3\x78\xbc\xb2\xbc\x54\xc3\xf2\x78\xbc\x10\x9e\x43\x00\
+\x49\xd2\x08\xb2\xfc\xf3\x78\xbc\xf2\xbc\x54\xc3\xf2\x78\xbc\x30\
+\x9e\x43\x00\x49\x52\xc1\x59\xfe\x79\x3c\xde\xa8\xbd\x54\xc3\xf2\
+\x78\xbc\x7e\x3c\x87\x00\x92\xa4\x02\xb3\xfc\xf3\x78\xbc\x51\x7b\
+\xa9\x86\xe5\xf1\x78\xfd\x7a\x8b\xc5\x62\xd5\xbc\x59\x72\x08\x20\
+\x49\x2a\x21\xcb\x3f\x8f\xc7\x1b\xb5\x97\x6a\x58\x1e\x8f\x37\x8c\
+\xb7\x5c\x3a\x04\x90\x24\xa5\xcf\xf2\xcf\xe3\xf1\x46\xed\xa5\x1a\
+\x96\xc7\xe3\x0d\xeb\xb5\xbf\x09\xe0\xe3\x00\x92\xa4\xa4\x59\xfe\
+\x79\x3c\xde\xa8\xbd\x54\xc3\xf2\x78\xbc\x18\x9e\xbf\x13\x40\x92\
+\x94\x30\xcb\x3f\x8f\xc7\x1b\xb5\x97\x6a\x58\x1e\x8f\x17\xcb\x73\
+\x08\x20\x49\x4a\x94\xe5\x9f\xc7\xe3\x8d\xda\x4b\x35\x2c\x8f\xc7\
+\x8b\xe9\x39\x04\x90\x24\x25\xc8\xf2\xcf\xe3\xf1\x46\xed\xa5\x1a\
+\x96\xc7\xe3\xc5\xf6\x1c\x02\x48\x92\x02\x67\xf9\xe7\xf1\x78\xa3\
+\xf6\x52\x0d\xcb\xe3\xf1\x72\x78\x0e\x01\x24\x49\x01\xb3\xfc\xf3\
+\x78\xbc\x51\x7b\xa9\x86\xe5\xf1\x78\xb9\x3c\x87\x00\x92\xa4\x40\
+\x59\xfe\x79\x3c\xde\xa8\xbd\x54\xc3\xf2\x78\xbc\x9c\x9e\x43\x00\
+\x49\x52\x80\x2c\xff\x3c\x1e\x6f\xf4\x5e\xaa\x61\x79\x3c\x5e\x5e\
+\x6f\xb1\x58\xac\x9a\x37\x5f\x0e\x01\x24\x49\x43\x64\xf9\xe7\xf1\
+\x78\xbc\xe6\x3f\x9f\x6a\x58\x1e\x8f\x97\xdb\x5b\x2e\x1d\x02\x48\
+\x92\x7a\xcf\xf2\xcf\xe3\xf1\x78\xaf\x7a\xa9\x86\xe5\xf1\x78\xf9\
+\xbd\xf6\x37\x01\x7c\x1c\x40\x92\xd4\x53\x96\x7f\x1e\x8f\xc7\xbb\
+\xe4\xa5\x1a\x96\xc7\xe3\x95\xe1\xf9\x3b\x01\x24\x49\x3d\x64\xf9\
+\xe7\xf1\x78\xbc\xc7\xbc\x49\xa6\x61\x79\x3c\x5e\x39\x9e\x43\x00\
+\x49\x52\x87\x59\xfe\x79\x3c\x1e\x6f\x8b\x37\xc9\x34\x2c\x8f\xc7\
+\x2b\xcb\x73\x08\x20\x49\xea\x20\xcb\x3f\x8f\xc7\xe3\xed\xf2\x52\
+\x0d\xcb\xe3\xf1\x8a\xf3\x1c\x02\x48\x92\xce\x98\xe5\x9f\xc7\xe3\
+\xf1\xf6\x79\xa9\x86\xe5\xf1\x78\x45\x7a\x0e\x01\x24\x49\x67\xc8\
+\xf2\xcf\xe3\xf1\x78\x57\x79\xa9\x86\xe5\xf1\x78\xc5\x7a\x0e\x01\
+\x24\x49\x27\x64\xf9\xe7\xf1\x78\xbc\x33\x7a\xa9\x86\xe5\xf1\x78\
+\x39\x3d\x87\x00\x92\xa4\x23\xb2\xfc\xf3\x78\x3c\x9e\xe5\x9f\xc7\
+\xe3\x65\xf4\x16\x8b\xc5\xaa\x79\x33\xe7\x10\x40\x92\x74\x48\x96\
+\x7f\x1e\x8f\xc7\xb3\xfc\xf3\x78\xbc\xcc\xde\x72\xe9\x10\x40\x92\
+\x74\x65\x96\x7f\x1e\x8f\xc7\xb3\xfc\xf3\x78\xbc\x12\xbc\xf6\x37\
+\x01\x7c\x1c\x40\x92\xb4\x23\xcb\x3f\x8f\xc7\xe3\x59\xfe\x79\x3c\
+\x5e\x49\x9e\xbf\x13\x40\x92\xb4\x25\xcb\x3f\x8f\xc7\xe3\x59\xfe\
+\x79\x3c\x5e\x89\x9e\x43\x00\x49\xd2\xa5\x2c\xff\x3c\x1e\x8f\x67\
+\xf9\xe7\xf1\x78\x25\x7b\x0e\x01\x24\x49\x73\xcb\x3f\x8f\xc7\xe3\
+\x59\xfe\x79\x3c\xde\x38\x3c\x87\x00\x92\x34\xea\x2c\xff\x3c\x1e\
+\x8f\x67\xf9\xe7\xf1\x78\x63\xf2\x1c\x02\x48\xd2\x28\xb3\xfc\xf3\
+\x78\x3c\x9e\xe5\x9f\xc7\xe3\x8d\xd1\x73\x08\x20\x49\xa3\xca\xf2\
+\xcf\xe3\xf1\x78\x96\x7f\x1e\x8f\x37\x66\xcf\x21\x80\x24\x8d\x22\
+\xcb\x3f\x8f\xc7\xe3\x9d\xd9\x4b\x35\x2c\x8f\xc7\xe3\x6d\xbc\xc5\
+\x62\xb1\x6a\xde\x1c\x3a\x04\x90\xa4\x32\xb3\xfc\xf3\x78\x3c\x5e\
+\x07\x5e\xaa\x61\x79\x3c\x1e\xef\xb2\xb7\x5c\x3a\x04\x90\xa4\x02\
+\xb3\xfc\xf3\x78\x3c\x5e\x47\x5e\xaa\x61\x79\x3c\x1e\xef\x71\xaf\
+\xfd\x4d\x00\x1f\x07\x90\xa4\x62\xb2\xfc\xf3\x78\x3c\x5e\x87\x5e\
+\xaa\x61\x79\x3c\x1e\x6f\x9b\xe7\xef\x04\x90\xa4\x22\xb2\xfc\xf3\
+\x78\x3c\x5e\xc7\xde\x24\xd3\xb0\x3c\x1e\x8f\xb7\xcb\x73\x08\x20\
+\x49\xa9\xb3\xfc\xf3\x78\x3c\x5e\x0f\xde\x24\xd3\xb0\x3c\x1e\x8f\
+\xb7\xcf\x73\x08\x20\x49\x29\xb3\xfc\xf3\x78\x3c\x5e\x5f\x5e\xaa\
+\x61\x79\x3c\x1e\xef\x0a\xcf\x21\x80\x24\xa5\xca\xf2\xcf\xe3\xf1\
+\x78\x7d\x7a\xa9\x86\xe5\xf1\x78\xbc\x03\x3c\x87\x00\x92\x94\x22\
+\xcb\x3f\x8f\xc7\xe3\xf5\xed\xa5\x1a\x96\xc7\xe3\xf1\x0e\xbb\x5e\
+\xdb\xbc\xa9\xfc\xaf\x03\xbc\xb9\x95\x24\xed\x6c\xfa\x0f\xa7\xd3\
+\xe9\x73\xc1\x9e\x1f\x3c\x1e\x8f\xc7\xcb\x36\x2c\x8f\xc7\x1b\xb5\
+\xd7\x2e\xff\xdf\x39\xfc\x1b\x5b\x49\xd2\x55\x55\xd5\xec\x17\x57\
+\xab\xf9\xdd\x20\xcf\x0f\x1e\x8f\xc7\xe3\x65\x1b\x96\xc7\xe3\x8d\
+\xda\xb3\xfc\x4b\x52\xba\xaa\xcd\x21\x40\x49\xcf\x23\x1e\x8f\xc7\
+\x4b\xe9\xa5\x1a\x96\xc7\xe3\x8d\xda\xb3\xfc\x4b\x52\xd2\xda\xdf\
+\x04\xa8\xeb\x67\x5f\x18\xe8\xf9\xc1\xe3\xf1\x78\xbc\x6c\xc3\xf2\
+\x78\xbc\x51\x7b\x96\x7f\x49\x4a\x5e\x7b\x08\x30\x9f\x5f\xef\x10\
+\x20\xe0\xf3\x88\xc7\xe3\xf1\x52\x7a\xa9\x86\xe5\xf1\x78\xa3\xf6\
+\x2c\xff\x92\x54\x48\xd7\x39\x04\x08\xf8\x3c\xe2\xf1\x78\xbc\x94\
+\x5e\xaa\x61\x79\x3c\xde\xa8\xbd\xd7\x58\xfe\x25\xa9\xac\x0e\x39\
+\x04\x08\xf8\x3c\xe2\xf1\x78\xbc\x94\x5e\xaa\x61\x79\x3c\xde\xa8\
+\xbd\x66\xf9\x9f\xfd\x85\xa1\xdf\xa8\x4a\x92\xce\xdf\xbe\x43\x80\
+\x80\xcf\x23\x1e\x8f\xc7\x4b\xe9\xa5\x1a\x96\xc7\xe3\x8d\xda\xb3\
+\xfc\x4b\x52\xe1\x6d\x3b\x04\x08\xf8\x3c\xe2\xf1\x78\xbc\x94\x5e\
+\xaa\x61\x79\x3c\xde\xa8\x3d\xcb\xbf\x24\x8d\xa4\xcb\x87\x00\x01\
+\x9f\x47\x3c\x1e\x8f\x97\xd2\x4b\x35\x2c\x8f\xc7\x1b\xb5\x67\xf9\
+\x97\xa4\x91\xb5\xf9\x8a\xc0\x60\xcf\x23\x1e\x8f\xc7\x4b\xe9\xa5\
+\x1a\x96\xc7\xe3\x8d\xda\xb3\xfc\x4b\xd2\x48\x6b\x0f\x01\x56\xab\
+\xf9\xdd\x20\xcf\x23\x1e\x8f\xc7\x4b\xeb\xa5\x1a\x96\xc7\xe3\x8d\
+\xd6\xb3\xfc\x4b\xd2\xe8\xab\x36\x87\x00\x25\x3d\xdf\x78\x3c\x1e\
+\xaf\x57\x2f\xd5\xb0\x3c\x1e\x6f\x94\x9e\xe5\x5f\x92\x74\xbf\xcd\
+\xc7\x01\x06\x7a\x1e\xf1\x78\x3c\x5e\x7a\x2f\xd5\xb0\x3c\x1e\x6f\
+\x74\x9e\xe5\x5f\x92\xf4\x48\xfb\xbe\x22\xb0\xc3\xe7\x11\x8f\xc7\
+\xe3\x15\xe1\xa5\x1a\x96\xc7\xe3\x8d\xca\xb3\xfc\x4b\x92\xb6\x76\
+\x9d\x43\x80\x80\xcf\x37\x1e\x8f\xc7\x1b\xcc\x9b\x64\x1a\x96\xc7\
+\xe3\x8d\xc6\xb3\xfc\x4b\x92\xf6\x76\xc8\x21\x40\xc0\xe7\x1b\x8f\
+\xc7\xe3\x0d\xea\x4d\x32\x0d\xcb\xe3\xf1\x46\xe1\x59\xfe\x25\x49\
+\x07\xb5\xef\x10\x20\xe0\xf3\x8d\xc7\xe3\xf1\x86\xf7\x52\x0d\xcb\
+\xe3\xf1\x4a\xf7\x2c\xff\x92\xa4\x6b\xb5\xed\x10\x20\xe0\xf3\x8d\
+\xc7\xe3\xf1\x62\x78\xa9\x86\xe5\xf1\x78\x25\x7b\x96\x7f\x49\xd2\
+\x51\x5d\x3e\x04\x08\xf8\x7c\xe3\xf1\x78\xbc\x38\x5e\xaa\x61\x79\
+\x3c\x5e\xa9\x9e\xe5\x5f\x92\x74\x52\x9b\xaf\x08\x0c\xf6\x7c\xe3\
+\xf1\x78\xbc\x94\x5e\xaa\x61\x79\x3c\x5e\x2a\xcf\xf2\x2f\x49\x3a\
+\x4b\xed\x21\xc0\x6a\x35\xbf\x1b\xe4\xf9\xc6\xe3\xf1\x78\x29\xbd\
+\x54\xc3\xf2\x78\xbc\x54\x9e\xe5\x5f\x92\x74\xe6\xaa\xcd\x21\x40\
+\x49\xcf\x4b\x1e\x8f\xc7\xeb\xc5\x4b\x35\x2c\x8f\xc7\x4b\xe5\x59\
+\xfe\x25\x49\x9d\xb4\xf9\x38\xc0\x40\xcf\x37\x1e\x8f\xc7\x4b\xe9\
+\xa5\x1a\x96\xc7\xe3\xa5\xf2\x2c\xff\x92\xa4\x4e\xdb\xf7\x15\x81\
+\x1d\x3e\xdf\x78\x3c\x1e\x2f\xa5\x97\x6a\x58\x1e\x8f\x97\xca\xb3\
+\xfc\x4b\x92\x7a\xe9\x3a\x87\x00\x01\x9f\x97\x3c\x1e\x8f\xd7\x8b\
+\x97\x6a\x58\x1e\x8f\x97\xca\xb3\xfc\x4b\x92\x7a\xed\x90\x43\x80\
+\x80\xcf\x4b\x1e\x8f\xc7\xeb\xc5\x4b\x35\x2c\x8f\xc7\x4b\xe5\x59\
+\xfe\x25\x49\x83\xb4\xef\x10\x20\xe0\xf3\x92\xc7\xe3\xf1\x7a\xf1\
+\x52\x0d\xcb\xe3\xf1\x52\x79\x96\x7f\x49\xd2\xa0\x6d\x3b\x04\x08\
+\xf8\xbc\xe4\xf1\x78\xbc\x5e\xbc\x54\xc3\xf2\x78\xbc\x54\x9e\xe5\
+\x5f\x92\x14\xa2\xcb\x87\x00\x01\x9f\x97\x3c\x1e\x8f\xd7\x8b\x97\
+\x6a\x58\x1e\x8f\x97\xca\xb3\xfc\x4b\x92\x42\xb5\xf9\x8a\xc0\x60\
+\xcf\x4b\x1e\x8f\xc7\xeb\xc5\x4b\x35\x2c\x8f\xc7\x4b\xe5\x59\xfe\
+\x25\x49\x21\x6b\x0f\x01\x56\xab\xf9\xdd\x20\xcf\x4b\x1e\x8f\xc7\
+\xeb\xcd\x4b\x35\x2c\x8f\xc7\x4b\xe3\x59\xfe\x25\x49\xc1\xab\x36\
+\x87\x00\x25\x3d\x7f\x79\x3c\x1e\x6f\xaf\x97\x6a\x58\x1e\x8f\x97\
+\xc2\xb3\xfc\x4b\x92\x52\xb4\xf9\x38\xc0\x40\xcf\x4b\x1e\x8f\xc7\
+\xeb\xdd\x4b\x35\x2c\x8f\xc7\x0b\xef\x59\xfe\x25\x49\xa9\xda\xf7\
+\x15\x81\x1d\x3e\x2f\x79\x3c\x1e\x6f\x10\x2f\xd5\xb0\x3c\x1e\x2f\
+\xb4\x67\xf9\x97\x24\xa5\xec\x3a\x87\x00\x01\x9f\xbf\x3c\x1e\x8f\
+\x77\xb0\x37\xc9\x34\x2c\x8f\xc7\x0b\xeb\x59\xfe\x25\x49\xa9\x3b\
+\xe4\x10\x20\xe0\xf3\x97\xc7\xe3\xf1\xae\xe5\x4d\x32\x0d\xcb\xe3\
+\xf1\x42\x7a\x96\x7f\x49\x52\x11\xed\x3b\x04\x08\xf8\xfc\xe5\xf1\
+\x78\xbc\xeb\x7b\xa9\x86\xe5\xf1\x78\xd1\x3c\xcb\xbf\x24\xa9\xa8\
+\xb6\x1d\x02\x04\x7c\xfe\xf2\x78\x3c\xde\x71\x5e\xaa\x61\x79\x3c\
+\x5e\x24\xcf\xf2\x2f\x49\x2a\xb2\xcb\x87\x00\x01\x9f\xbf\x3c\x1e\
+\x8f\x77\xbc\x97\x6a\x58\x1e\x8f\x17\xc5\xb3\xfc\x4b\x92\x8a\x6e\
+\xf3\x15\x81\xc1\x9e\xbf\x3c\x1e\x8f\xd7\x8b\x97\x6a\x58\x1e\x8f\
+\xd7\xa9\x67\xf9\x97\x24\x8d\xa2\xf6\x10\x60\xb5\x9a\xdf\x0d\xf2\
+\xfc\xe5\xf1\x78\xbc\x5e\xbc\x54\xc3\xf2\x78\xbc\x4e\x3d\xcb\xbf\
+\x24\x69\x64\x55\x9b\x43\x80\x92\x9e\xe7\x3c\x1e\x8f\x97\x7f\x58\
+\x1e\x8f\xd7\xa9\xf7\x54\x55\x4d\xbf\x6d\xf8\x37\x62\x92\x24\xf5\
+\xdb\xe6\xe3\x00\x03\x3d\x7f\x79\x3c\x1e\xaf\x17\x2f\xd5\xb0\x3c\
+\x1e\xaf\x53\xcf\xf2\x2f\x49\x1a\x75\xfb\xbe\x22\xb0\xc3\xe7\x2f\
+\x8f\xc7\xe3\xf5\xe2\xa5\x1a\x96\xc7\xe3\x75\xea\x59\xfe\x25\x49\
+\x9a\x5f\xef\x10\x20\xe0\xf3\x9c\xc7\xe3\xf1\xf2\x0f\xcb\xe3\xf1\
+\x3a\xf5\x2c\xff\x92\x24\x5d\xea\x90\x43\x80\x80\xcf\x73\x1e\x8f\
+\xc7\xcb\x3f\x2c\x8f\xc7\xeb\xd4\xb3\xfc\x4b\x92\xb4\xa5\x7d\x87\
+\x00\x01\x9f\xe7\x3c\x1e\x8f\x97\x7f\x58\x1e\x8f\xd7\xa9\x67\xf9\
+\x97\x24\x69\x4f\xdb\x0e\x01\x02\x3e\xcf\x79\x3c\x1e\x2f\xff\xb0\
+\x3c\x1e\xaf\x53\xcf\xf2\x2f\x49\xd2\x01\x5d\x3e\x04\x08\xf8\x3c\
+\xe7\xf1\x78\xbc\xfc\xc3\xf2\x78\xbc\x4e\x3d\xcb\xbf\x24\x49\xd7\
+\x68\xf3\x15\x81\xc1\x9e\xe7\x3c\x1e\x8f\x97\x7f\x58\x1e\x8f\xd7\
+\xa9\x67\xf9\x97\x24\xe9\x88\xda\x43\x80\xd5\x6a\x7e\x37\xc8\xf3\
+\x9c\xc7\xe3\xf1\x76\x7a\xa9\x86\xe5\xf1\x78\x9d\x79\x96\x7f\x49\
+\x92\x4e\xaa\xda\x1c\x02\x94\xf4\xfe\x80\xc7\xe3\x15\xe6\xa5\x1a\
+\x96\xc7\xe3\x75\xe2\x59\xfe\x25\x49\x3a\x43\x9b\x8f\x03\x0c\xf4\
+\x3c\xe7\xf1\x78\xbc\x2b\xbd\x54\xc3\xf2\x78\xbc\xb3\x7b\x96\x7f\
+\x49\x92\xce\xd8\xbe\xaf\x08\xec\xf0\x79\xce\xe3\xf1\x78\x07\x79\
+\xa9\x86\xe5\xf1\x78\x67\xf5\x2c\xff\x92\x24\x75\xd0\x75\x0e\x01\
+\x02\xbe\x3f\xe0\xf1\x78\x05\x7b\x93\x4c\xc3\xf2\x78\xbc\xb3\x79\
+\x96\x7f\x49\x92\x3a\xec\x90\x43\x80\xad\x17\x74\x6b\x00\x00\x20\
+\x00\x49\x44\x41\x54\x80\xef\x0f\x78\x3c\x5e\xe1\xde\x24\xd3\xb0\
+\x3c\x1e\xcf\xf2\x2f\x49\x52\x96\xf6\x1d\x02\x04\x7c\x7f\xc0\xe3\
+\xf1\xc6\xe0\xa5\x1a\x96\xc7\xe3\x9d\x61\xf9\x9f\x7d\xeb\xd0\x6f\
+\x88\x24\x49\x1a\x4b\xdb\x0e\x01\x02\xbe\x3f\xe0\xf1\x78\x63\xf1\
+\x52\x0d\xcb\xe3\xf1\x2c\xff\x92\x24\x25\xeb\xf2\x21\x40\xc0\xf7\
+\x07\x3c\x1e\x6f\x4c\x5e\xaa\x61\x79\x3c\x9e\xe5\x5f\x92\xa4\x84\
+\x6d\xbe\x22\x30\xd8\xfb\x03\x1e\x8f\xc7\xcb\x3f\x2c\x8f\xc7\x7b\
+\xe4\xb2\xfc\x4b\x92\x14\xa0\xf6\x10\x60\xb5\x9a\xdf\x0d\xf2\xfe\
+\x80\xc7\xe3\xf1\xf2\x0f\xcb\xe3\xf1\x1e\xb9\x2c\xff\x92\x24\x85\
+\xaa\xda\x1c\x02\x94\xf4\x7e\x83\xc7\xe3\x15\xe2\xa5\x1a\x96\xc7\
+\xe3\x3d\x72\x59\xfe\x25\x49\x0a\xd8\xe6\xe3\x00\x03\xbd\x3f\xe0\
+\xf1\x78\xbc\xfc\xc3\xf2\x78\xbc\x47\x2e\xcb\xbf\x24\x49\x81\xdb\
+\xf7\x15\x81\x1d\xbe\x3f\xe0\xf1\x78\xbc\xfc\xc3\xf2\x78\xbc\x47\
+\x2e\xcb\xbf\x24\x49\x09\xba\xce\x21\x40\xc0\xf7\x1b\x3c\x1e\xaf\
+\x10\x2f\xd5\xb0\x3c\x1e\xef\x91\xcb\xf2\x2f\x49\x52\xa2\x0e\x39\
+\x04\x08\xf8\x7e\x83\xc7\xe3\x15\xe2\xa5\x1a\x96\xc7\xe3\x3d\x72\
+\x59\xfe\x25\x49\x4a\xd8\xbe\x43\x80\x80\xef\x37\x78\x3c\x5e\x21\
+\x5e\xaa\x61\x79\x3c\xde\x23\x97\xe5\x5f\x92\xa4\xc4\x6d\x3b\x04\
+\x08\xf8\x7e\x83\xc7\xe3\x15\xe2\xa5\x1a\x96\xc7\xe3\x3d\x72\x59\
+\xfe\x25\x49\x2a\xa0\xcb\x87\x00\x01\xdf\x6f\xf0\x78\xbc\x42\xbc\
+\x54\xc3\xf2\x78\xbc\x47\x2e\xcb\xbf\x24\x49\x05\xb5\xf9\x8a\xc0\
+\x60\xef\x37\x78\x3c\x5e\x21\x5e\xaa\x61\x79\x3c\xde\x23\x97\xe5\
+\x5f\x92\xa4\x02\x6b\x0f\x01\x56\xab\xf9\xdd\x20\xef\x37\x78\x3c\
+\x5e\x41\x5e\xaa\x61\x79\x3c\xde\xc3\xcb\xf2\x2f\x49\x52\xd1\x55\
+\x9b\x43\x80\x92\xde\xbf\xf0\x78\xbc\x81\xbd\x54\xc3\xf2\x78\xbc\
+\xfb\x97\xe5\x5f\x92\xa4\x11\xb4\xf9\x38\xc0\x40\xef\x37\x78\x3c\
+\x5e\x81\x5e\xaa\x61\x79\x3c\x9e\xe5\x5f\x92\xa4\x31\xb5\xef\x2b\
+\x02\x3b\x7c\xbf\xc1\xe3\xf1\x0a\xf5\x52\x0d\xcb\xe3\x8d\xdc\xb3\
+\xfc\x4b\x92\x34\xc2\xae\x73\x08\x10\xf0\xfd\x0b\x8f\xc7\x0b\xe4\
+\x4d\x32\x0d\xcb\xe3\x8d\xd8\xb3\xfc\x4b\x92\x34\xe2\x0e\x39\x04\
+\x08\xf8\xfe\x85\xc7\xe3\x05\xf3\x26\x99\x86\xe5\xf1\x46\xea\x59\
+\xfe\x25\x49\xd2\xde\x43\x80\x80\xef\x5f\x78\x3c\x5e\x44\x2f\xd5\
+\xb0\x3c\xde\xf8\x3c\xcb\xbf\x24\x49\x7a\xd8\xb6\x43\x80\x80\xef\
+\x5f\x78\x3c\x5e\x54\x2f\xd5\xb0\x3c\xde\xb8\x3c\xcb\xbf\x24\x49\
+\x7a\xa2\xcb\x87\x00\x01\xdf\xbf\xf0\x78\xbc\xc8\x5e\xaa\x61\x79\
+\xbc\xf1\x78\x96\x7f\x49\x92\xb4\xb3\xcd\x57\x04\x06\x7b\xff\xc2\
+\xe3\xf1\x0a\xf1\x52\x0d\xcb\xe3\x25\xf7\x2c\xff\x92\x24\xe9\xca\
+\xda\x43\x80\xd5\x6a\x7e\x37\xc8\xfb\x17\x1e\x8f\x57\x88\x97\x6a\
+\x58\x1e\x2f\xb9\x67\xf9\x97\x24\x49\xd7\xa8\xda\x1c\x02\x94\xf4\
+\x7e\x88\xc7\xe3\x0d\xe4\xa5\x1a\x96\xc7\x4b\xee\xb5\xcb\xff\x9f\
+\x1d\xfe\x8d\x84\x24\x49\xca\xd4\xe6\xe3\x00\x03\xbd\x7f\xe1\xf1\
+\x78\x85\x78\xa9\x86\xe5\xf1\x92\x7b\x96\x7f\x49\x92\x74\x74\xfb\
+\xbe\x22\xb0\xc3\xf7\x2f\x3c\x1e\xaf\x10\x2f\xd5\xb0\x3c\x5e\x72\
+\xcf\xf2\x2f\x49\x92\x4e\xee\x3a\x87\x00\x01\xdf\x0f\xf1\x78\xbc\
+\x81\xbc\x54\xc3\xf2\x78\xc9\x3d\xcb\xbf\x24\x49\x3a\x5b\x87\x1c\
+\x02\x04\x7c\x3f\xc4\xe3\xf1\x06\xf2\x52\x0d\xcb\xe3\x25\xf7\x2c\
+\xff\x92\x24\xe9\xec\xed\x3b\x04\x08\xf8\x7e\x88\xc7\xe3\x0d\xe4\
+\xa5\x1a\x96\xc7\x4b\xee\x59\xfe\x25\x49\x52\x67\x6d\x3b\x04\x08\
+\xf8\x7e\x88\xc7\xe3\x0d\xe4\xa5\x1a\x96\xc7\x4b\xee\x59\xfe\x25\
+\x49\x52\xe7\x5d\x3e\x04\x08\xf8\x7e\x88\xc7\xe3\x0d\xe4\xa5\x1a\
+\x96\xc7\x4b\xee\x59\xfe\x25\x49\x52\x6f\x6d\xbe\x22\x30\xd8\xfb\
+\x21\x1e\x8f\x37\x90\x97\x6a\x58\x1e\x2f\xb9\x67\xf9\x97\x24\x49\
+\xbd\xd7\x1e\x02\xac\x56\xf3\xbb\x41\xde\x0f\xf1\x78\xbc\x01\xbd\
+\x54\xc3\xf2\x78\x89\x3d\xcb\xbf\x24\x49\x1a\xb0\x6a\x73\x08\x50\
+\xd2\xfb\x2b\x1e\x8f\x77\x4d\x2f\xd5\xb0\x3c\x5e\x52\xcf\xf2\x2f\
+\x49\x92\x06\x6f\xf3\x71\x80\x81\xde\x0f\xf1\x78\xbc\x00\x5e\xaa\
+\x61\x79\xbc\x84\x9e\xe5\x5f\x92\x24\x85\x69\xdf\x57\x04\x76\xf8\
+\x7e\x88\xc7\xe3\x05\xf1\x52\x0d\xcb\xe3\x25\xf3\x2c\xff\x92\x24\
+\x29\x5c\xd7\x39\x04\x08\xf8\xfe\x8a\xc7\xe3\x9d\xe0\x4d\x32\x0d\
+\xcb\xe3\x25\xf2\x2c\xff\x92\x24\x29\x6c\x87\x1c\x02\x04\x7c\x7f\
+\xc5\xe3\xf1\x4e\xf4\x26\x99\x86\xe5\xf1\x92\x78\x96\x7f\x49\x92\
+\x14\xbe\x7d\x87\x00\x01\xdf\x5f\xf1\x78\xbc\x73\x78\xa9\x86\xe5\
+\xf1\xe2\x7b\x96\x7f\x49\x92\x94\xa6\x6d\x87\x00\x01\xdf\x5f\xf1\
+\x78\xbc\x73\x79\xa9\x86\xe5\xf1\x62\x7b\x96\x7f\x49\x92\x94\xae\
+\xcb\x87\x00\x01\xdf\x5f\xf1\x78\xbc\x73\x7a\xa9\x86\xe5\xf1\xe2\
+\x7a\x96\x7f\x49\x92\x94\xb6\xcd\x57\x04\x06\x7b\x7f\xc5\xe3\xf1\
+\x06\xf2\x52\x0d\xcb\xe3\xf5\xec\x59\xfe\x25\x49\x52\xfa\xda\x43\
+\x80\xd5\x6a\x7e\x37\xc8\xfb\x2b\x1e\x8f\x37\x90\x97\x6a\x58\x1e\
+\xaf\x67\xcf\xf2\x2f\x49\x92\x0a\xaa\xda\x1c\x02\x94\xf4\x7e\x8d\
+\xc7\xe3\x45\xc0\x79\xbc\xe4\x9e\xe5\x5f\x92\x24\x15\xd7\xe6\xe3\
+\x00\x03\xbd\xbf\xe2\xf1\x78\x03\x79\xa9\x86\xe5\xf1\x7a\xf6\x2c\
+\xff\x92\x24\xa9\xd8\xf6\x7d\x45\x60\x87\xef\xaf\x78\x3c\xde\x40\
+\x5e\xaa\x61\x79\xbc\x9e\x3d\xcb\xbf\x24\x49\x2a\xbe\xeb\x1c\x02\
+\x04\x7c\xbf\xc6\xe3\xf1\x22\xe0\x3c\x5e\x72\xcf\xf2\x2f\x49\x92\
+\x46\xd3\x21\x87\x00\x01\xdf\xaf\xf1\x78\xbc\x08\x38\x8f\x97\xdc\
+\xb3\xfc\x4b\x92\xa4\xd1\xb5\xef\x10\x20\xe0\xfb\x35\x1e\x8f\x17\
+\x01\xe7\xf1\x92\x7b\x96\x7f\x49\x92\x34\xda\xb6\x1d\x02\x04\x7c\
+\xbf\xc6\xe3\xf1\x22\xe0\x3c\x5e\x72\xef\xa9\xe6\xc1\xf7\x2d\x43\
+\x3f\x78\x25\x49\x92\x86\xec\xf2\x21\x40\xc0\xf7\x6b\x3c\x1e\x2f\
+\x02\xce\xe3\x25\xf7\x2c\xff\x92\x24\x49\xaf\xb6\xf9\x8a\xc0\x60\
+\xef\xd7\x78\x3c\x5e\x04\x9c\xc7\x4b\xee\x59\xfe\x25\x49\x92\x1e\
+\xab\x3d\x04\x58\xad\xe6\x77\x83\xbc\x5f\xe3\xf1\x78\xd7\xf0\x52\
+\x0d\xcb\xe3\xf5\xe8\x59\xfe\x25\x49\x92\x76\x56\x6d\x0e\x01\x4a\
+\x7a\xff\xc7\xe3\x15\xef\xa5\x1a\x96\xc7\xeb\xc9\xb3\xfc\x4b\x92\
+\x24\x5d\xd1\xe6\xe3\x00\x03\xbd\x5f\xe3\xf1\x78\x47\x78\xa9\x86\
+\xe5\xf1\x7a\xf0\x2c\xff\x92\x24\x49\x07\xb6\xef\x2b\x02\x3b\x7c\
+\xbf\xc6\xe3\xf1\x8e\xf4\x52\x0d\xcb\xe3\x75\xec\x59\xfe\x25\x49\
+\x92\xae\xd9\x75\x0e\x01\x02\xbe\xff\xe3\xf1\x46\xe5\x4d\x32\x0d\
+\xcb\xe3\x75\xe8\x59\xfe\x25\x49\x92\x8e\xec\x90\x43\x80\x80\xef\
+\xff\x78\xbc\xd1\x79\x93\x4c\xc3\xf2\x78\x1d\x79\x96\x7f\x49\x92\
+\xa4\x13\xdb\x77\x08\x10\xf0\xfd\x1f\x8f\x37\x4e\x2f\xd5\xb0\x3c\
+\xde\xf9\x3d\xcb\xbf\x24\x49\xd2\x99\xda\x76\x08\x10\xf0\xfd\x1f\
+\x8f\x37\x5e\x2f\xd5\xb0\x3c\xde\x79\x3d\xcb\xbf\x24\x49\xd2\x99\
+\xbb\x7c\x08\x10\xf0\xfd\x1f\x8f\x37\x6e\x2f\xd5\xb0\x3c\xde\xf9\
+\x3c\xcb\xbf\x24\x49\x52\x47\x6d\xbe\x22\x30\xd8\xfb\x3f\x1e\x8f\
+\x17\x01\xe7\xf1\x7a\xf6\x2c\xff\x92\x24\x49\x1d\xd7\x1e\x02\xac\
+\x56\xf3\xbb\x41\xde\xff\xf1\x78\xbc\x08\x38\x8f\xd7\xb3\x67\xf9\
+\x97\x24\x49\xea\xad\x6a\x73\x08\x50\xd2\xfb\x49\x1e\xaf\x58\x2f\
+\xd5\xb0\x3c\xde\x15\x97\xe5\x5f\x92\x24\xa9\xe7\x36\x1f\x07\x18\
+\xe8\xfd\x1f\x8f\xc7\x8b\x80\xf3\x78\x3d\x7b\x96\x7f\x49\x92\xa4\
+\x81\xda\xf7\x15\x81\x1d\xbe\xff\xe3\xf1\x78\x11\x70\x1e\xaf\x67\
+\xcf\xf2\x2f\x49\x92\x34\x70\xd7\x39\x04\x08\xf8\x7e\x92\xc7\x2b\
+\xd6\x4b\x35\x2c\x8f\x77\xc5\x65\xf9\x97\x24\x49\x0a\xd2\x21\x87\
+\x00\x01\xdf\x4f\xf2\x78\xc5\x7a\xa9\x86\xe5\xf1\xae\xb8\x2c\xff\
+\x92\x24\x49\xc1\xda\x77\x08\x10\xf0\xfd\x24\x8f\x57\xac\x97\x6a\
+\x58\x1e\xef\x8a\xcb\xf2\x2f\x49\x92\x14\xb4\x6d\x87\x00\x01\xdf\
+\x4f\xf2\x78\xc5\x7a\xa9\x86\xe5\xf1\xae\xb8\x2c\xff\x92\x24\x49\
+\xc1\xbb\x7c\x08\x10\xf0\xfd\x24\x8f\x57\xac\x97\x6a\x58\x1e\xef\
+\x8a\xcb\xf2\x2f\x49\x92\x94\xa4\xcd\x57\x04\x06\x7b\x3f\xc9\xe3\
+\x15\xeb\xa5\x1a\x96\xc7\xbb\xe2\xb2\xfc\x4b\x92\x24\x25\xab\x3d\
+\x04\x58\xad\xe6\x77\x83\xbc\x9f\xe4\xf1\x8a\xf6\x52\x0d\xcb\xe3\
+\xed\xb9\x2c\xff\x92\x24\x49\x69\xab\x36\x87\x00\x25\xbd\x3f\xe5\
+\xf1\xc2\x79\xa9\x86\xe5\xf1\x76\x5c\x96\x7f\x49\x92\xa4\xe4\x6d\
+\x3e\x0e\x30\xd0\xfb\x49\x1e\x6f\x14\x5e\xaa\x61\x79\xbc\x2d\x97\
+\xe5\x5f\x92\x24\xa9\x90\xf6\x7d\x45\x60\x87\xef\x27\x79\xbc\xd1\
+\x78\xa9\x86\xe5\xf1\x1e\xbb\x2c\xff\x92\x24\x49\x85\x75\x9d\x43\
+\x80\x80\xef\x4f\x79\xbc\xd0\xde\x24\xd3\xb0\x3c\xde\xa5\xcb\xf2\
+\x2f\x49\x92\x54\x68\x87\x1c\x02\x04\x7c\x7f\xca\xe3\x85\xf7\x26\
+\x99\x86\xe5\xf1\x5e\xbd\x2c\xff\x92\x24\x49\x85\xb7\xef\x10\x20\
+\xe0\xfb\x53\x1e\x2f\x87\x97\x6a\x58\x1e\xcf\xf2\x2f\x49\x92\x34\
+\x9a\xb6\x1d\x02\x04\x7c\x7f\xca\xe3\xe5\xf1\x52\x0d\xcb\x1b\xbb\
+\x67\xf9\x97\x24\x49\x1a\x59\x97\x0f\x01\x02\xbe\x3f\xe5\xf1\x72\
+\x79\xa9\x86\xe5\x8d\xd9\xb3\xfc\x4b\x92\x24\x8d\xb4\xcd\x57\x04\
+\x06\x7b\x7f\xca\xe3\x15\xeb\xa5\x1a\x96\x57\x9c\x67\xf9\x97\x24\
+\x49\x1a\x79\xed\x21\xc0\x6a\x35\xbf\x1b\xe4\xfd\x29\x8f\x57\xac\
+\x97\x6a\x58\x5e\x71\x9e\xe5\x5f\x92\x24\x49\xaf\x56\x6d\x0e\x01\
+\x4a\x7a\xbf\xcb\xe3\x85\xf1\x52\x0d\xcb\x2b\xce\xb3\xfc\x4b\x92\
+\x24\xe9\x91\x36\x1f\x07\x18\xe8\xfd\x29\x8f\x57\xac\x97\x6a\x58\
+\x5e\x71\x9e\xe5\x5f\x92\x24\x49\x5b\xdb\xf7\x15\x81\x1d\xbe\x3f\
+\xe5\xf1\x8a\xf5\x52\x0d\xcb\x2b\xce\xb3\xfc\x4b\x92\x24\x69\x6f\
+\xd7\x39\x04\x08\xf8\x7e\x97\xc7\x0b\xe3\xa5\x1a\x96\x57\x9c\x67\
+\xf9\x97\x24\x49\xd2\x41\x1d\x72\x08\x10\xf0\xfd\x2e\x8f\x17\xc6\
+\x4b\x35\x2c\xaf\x38\xaf\x5d\xfe\xff\xcc\xd0\x0f\x12\x49\x92\x24\
+\xe5\x69\xdf\x21\x40\xc0\xf7\xbb\x3c\x5e\x18\x2f\xd5\xb0\xbc\xe2\
+\x3c\xcb\xbf\x24\x49\x92\x8e\x6a\xdb\x21\x40\xc0\xf7\xbb\x3c\x5e\
+\x18\x2f\xd5\xb0\xbc\xe2\x3c\xcb\xbf\x24\x49\x92\x4e\xea\xf2\x21\
+\x40\xc0\xf7\xbb\x3c\x5e\x18\x2f\xd5\xb0\xbc\xe2\x3c\xcb\xbf\x24\
+\x49\x92\xce\xd2\xe6\x2b\x02\x83\xbd\xdf\xe5\xf1\xc2\x78\xa9\x86\
+\xe5\x15\xe7\x59\xfe\x25\x49\x92\x74\xd6\xda\x43\x80\xd5\x6a\x7e\
+\x37\xc8\xfb\x5d\x1e\x2f\x94\x97\x6a\x58\x5e\x51\x9e\xe5\x5f\x92\
+\x24\x49\x1d\x55\x6d\x0e\x01\x4a\x7a\xff\xcc\xe3\x9d\xec\xa5\x1a\
+\x96\x57\x8c\x67\xf9\x97\x24\x49\x52\xa7\x6d\x3e\x0e\x30\xd0\xfb\
+\x5d\x1e\x2f\xa4\x97\x6a\x58\x5e\x11\x9e\xe5\x5f\x92\x24\x49\xbd\
+\xb4\xef\x2b\x02\x3b\x7c\xbf\xcb\xe3\x85\xf5\x52\x0d\xcb\x4b\xef\
+\x59\xfe\x25\x49\x92\xd4\x6b\xd7\x39\x04\x08\xf8\xfe\x99\xc7\x3b\
+\xab\x37\xc9\x34\x2c\x2f\xb5\x67\xf9\x97\x24\x49\xd2\x20\x1d\x72\
+\x08\x10\xf0\xfd\x33\x8f\x77\x76\x6f\x92\x69\x58\x5e\x5a\xcf\xf2\
+\x2f\x49\x92\xa4\x41\xdb\x77\x08\x10\xf0\xfd\x33\x8f\xd7\x8d\x97\
+\x6a\x58\x5e\x46\xcf\xf2\x2f\x49\x92\xa4\x10\x6d\x3b\x04\x08\xf8\
+\xfe\x99\xc7\xeb\xce\x4b\x35\x2c\x2f\x9b\x67\xf9\x97\x24\x49\x52\
+\xa8\x2e\x1f\x02\x04\x7c\xff\xcc\xe3\x75\xeb\xa5\x1a\x96\x97\xc9\
+\xb3\xfc\x4b\x92\x24\x29\x64\x9b\xaf\x08\x0c\xf6\xfe\x99\xc7\x0b\
+\xe3\xa5\x1a\x96\x37\xb8\x67\xf9\x97\x24\x49\x52\xe8\xda\x43\x80\
+\xd5\x6a\x7e\x37\xc8\xfb\x67\x1e\x2f\x8c\x97\x6a\x58\xde\xe0\x9e\
+\xe5\x5f\x92\x24\x49\x49\xaa\x36\x87\x00\x25\xbd\x1f\xe7\xf1\x2c\
+\xff\xbc\x5e\x3c\xcb\xbf\x24\x49\x92\x52\xb5\xf9\x38\xc0\x40\xef\
+\x9f\x79\xbc\x30\x5e\xaa\x61\x79\x83\x7b\x96\x7f\x49\x92\x24\xa5\
+\x6c\xdf\x57\x04\x76\xf8\xfe\x99\xc7\x0b\xe3\xa5\x1a\x96\x37\xb8\
+\x67\xf9\x97\x24\x49\x52\xea\xae\x73\x08\x10\xf0\xfd\x38\x8f\x67\
+\xf9\xe7\xf5\xe2\x59\xfe\x25\x49\x92\x54\x44\x87\x1c\x02\x04\x7c\
+\x3f\xce\xe3\x59\xfe\x79\xbd\x78\x96\x7f\x49\x92\x24\x15\xd5\xbe\
+\x43\x80\x80\xef\xc7\x79\x3c\xcb\x3f\xaf\x17\xcf\xf2\x2f\x49\x92\
+\xa4\x22\xdb\x76\x08\x10\xf0\xfd\x38\x8f\x67\xf9\xe7\xf5\xe2\x59\
+\xfe\x25\x49\x92\x54\x74\x97\x0f\x01\x02\xbe\x1f\xe7\xf1\x2c\xff\
+\xbc\x5e\x3c\xcb\xbf\x24\x49\x92\x46\xd1\xe6\x2b\x02\x83\xbd\x1f\
+\xe7\xf1\x2c\xff\xbc\x5e\x3c\xcb\xbf\x24\x49\x92\x46\x55\x7b\x08\
+\xb0\x5a\xcd\xef\x06\x79\x3f\xce\xe3\x9d\xe4\xa5\x1a\x96\x67\xf9\
+\x97\x24\x49\x92\xfa\xaf\xda\x1c\x02\x94\xf4\xfe\x9e\x37\x42\x2f\
+\xd5\xb0\xbc\xc1\xbc\x76\xf9\xff\xd3\xc3\xdf\x78\x25\x49\x92\xa4\
+\x61\xda\x7c\x1c\x60\xa0\xf7\xe3\x3c\xde\x59\xbc\x54\xc3\xf2\x06\
+\xf1\x2c\xff\x92\x24\x49\xd2\x7c\xff\x57\x04\x76\xf8\x7e\x9c\xc7\
+\x3b\x9b\x97\x6a\x58\x5e\xef\x9e\xe5\x5f\x92\x24\x49\xba\xd4\x75\
+\x0e\x01\x02\xbe\xbf\xe7\x8d\xdc\x9b\x64\x1a\x96\xd7\xab\x67\xf9\
+\x97\x24\x49\x92\xb6\x74\xc8\x21\x40\xc0\xf7\xf7\x3c\xde\xe7\x4e\
+\x32\x0d\xcb\xeb\xcd\xb3\xfc\x4b\x92\x24\x49\x7b\xda\x77\x08\x10\
+\xf0\xfd\x3d\x8f\xf7\xc0\x4b\x35\x2c\xaf\x0f\xcf\xf2\x2f\x49\x92\
+\x24\x1d\xd0\xb6\x43\x80\x80\xef\xef\x79\xbc\xcf\x7a\xa9\x86\xe5\
+\x75\xed\x59\xfe\x25\x49\x92\xa4\x6b\x74\xf9\x10\x20\xe0\xfb\x7b\
+\x1e\xef\x51\x2f\xd5\xb0\xbc\x2e\x3d\xcb\xbf\x24\x49\x92\x74\x44\
+\x9b\xaf\x08\x0c\xf6\xfe\x9e\xc7\x3b\xda\x4b\x35\x2c\xef\xa8\xe5\
+\xff\x5b\x86\xbe\x71\x4a\x92\x76\xf6\x4a\xd3\x87\xaa\x6a\xfa\x0b\
+\x01\x66\x91\x24\x6d\xa9\xbd\x47\x2f\x97\x8b\x77\x04\x79\x7f\xcf\
+\xe3\x59\xfe\x79\x5b\x2f\xff\xe6\x5f\x92\x62\xf7\x4a\xf3\xa6\xf2\
+\xf7\xb6\xf7\xf5\xc5\x62\xf1\x42\xf3\xbf\xff\x5f\x01\x66\x92\x24\
+\x6d\xad\xfa\xc5\xd5\x6a\x7e\xb7\xb0\x7d\x81\x37\x22\x2f\xd5\xb0\
+\x3c\xcb\xbf\x24\x15\xd6\xc3\xe5\x7f\x73\xbf\x5f\x2e\x17\x2f\xce\
+\x1d\x02\x48\x52\xd8\x36\x1f\x07\x18\xe8\xfd\x3d\x8f\x67\xf9\xe7\
+\x6d\xbd\x2c\xff\x92\x14\xbb\x27\x96\xff\x4d\xed\x6f\x02\x34\xff\
+\x77\x0e\x01\x24\x29\x68\xfb\xbe\x22\xb0\xc3\xf7\xf7\x3c\x9e\xe5\
+\x9f\xb7\xf5\xb2\xfc\x4b\x52\xec\x76\x2e\xff\x9b\xfb\xfd\x74\x3a\
+\x7d\xfb\x6c\xe6\x10\x40\x92\xa2\x76\x9d\x43\x80\x80\xfb\x02\x6f\
+\x44\x5e\xaa\x61\x79\x96\x7f\x49\x2a\xac\x2b\x97\xff\xcd\xe5\x10\
+\x40\x92\x62\x77\xc8\x21\x40\xc0\x7d\x81\x37\x22\x2f\xd5\xb0\x3c\
+\xcb\xbf\x24\x15\xd6\xc1\xcb\xff\xe6\x72\x08\x20\x49\xb1\xdb\x77\
+\x08\x10\x70\x5f\xe0\x8d\xc8\x4b\x35\x2c\xcf\xf2\x2f\x49\x85\xd5\
+\x2e\xff\xbf\xe7\x98\xfb\xbd\x43\x00\x49\x8a\xdd\xb6\x43\x80\x80\
+\xfb\x02\x6f\x44\x5e\xaa\x61\x79\x96\x7f\x49\x2a\xac\xa3\x97\xff\
+\xcd\xe5\x10\x40\x92\x62\x77\xf9\x10\x20\xe0\xbe\xc0\x1b\x91\x97\
+\x6a\x58\x9e\xe5\x5f\x92\x0a\xeb\xe4\xe5\x7f\x73\x39\x04\x90\xa4\
+\xd8\x6d\xbe\x22\x30\xd8\xbe\xc0\x1b\x91\x97\x6a\x58\x9e\xe5\x5f\
+\x92\x0a\xeb\x6c\xcb\xff\xe6\x6a\x0f\x01\x7c\x45\xa0\x24\xc5\xad\
+\x3d\x04\x58\xad\xe6\x77\x83\xec\x0b\xbc\x91\x79\xa9\x86\xe5\x59\
+\xfe\x25\xa9\xa0\xce\xbe\xfc\x6f\x9e\x1f\x8b\xc5\xe2\x85\xc6\x77\
+\x08\x20\x49\x61\xab\x36\x87\x00\x25\xed\x1f\xbc\x04\x5e\xaa\x61\
+\x79\x07\x7b\x96\x7f\x49\x8a\x5d\x67\xcb\xff\xc6\x5b\x2e\x17\x2f\
+\xce\x1d\x02\x48\x52\xd8\x36\x1f\x07\x38\xf5\x7e\x1f\x64\xff\xe0\
+\x25\xf1\x52\x0d\xcb\x3b\xe8\xb2\xfc\x4b\x52\xec\x3a\x5f\xfe\x37\
+\xb5\xbf\x09\xe0\xe3\x00\x92\x14\xb7\x7d\x5f\x11\x78\x9d\xfb\x7d\
+\x61\xfb\x0c\xaf\x43\x2f\xd5\xb0\xbc\x2b\x2f\xcb\xbf\x24\xc5\xae\
+\xb7\xe5\x7f\xe3\xf9\x8b\x01\x25\x29\x76\xd7\x39\x04\x08\xb8\x7f\
+\xf0\x92\x79\x93\x4c\xc3\xf2\xf6\x5e\x96\x7f\x49\x8a\x5d\xef\xcb\
+\xff\xe6\x72\x08\x20\x49\xb1\x3b\xe4\x10\x20\xe0\xfe\xc1\x4b\xe8\
+\x4d\x32\x0d\xcb\xdb\x79\x59\xfe\x25\x29\x76\x83\x2d\xff\x9b\xcb\
+\x21\x80\x24\xc5\x6e\xdf\x21\x40\xc0\xfd\x83\x97\xd5\x4b\x35\x2c\
+\x6f\xdb\xf5\x54\xf3\xa6\xf2\x4f\x0d\x7d\xc3\x92\x24\xed\x6c\xf0\
+\xe5\x7f\x73\x39\x04\x90\xa4\xd8\x6d\x3b\x04\x88\xf0\xfc\xe0\x15\
+\xe4\xa5\x1a\x96\xf7\xf8\x65\xf9\x97\xa4\xd8\x85\x59\xfe\x37\x97\
+\x43\x00\x49\x8a\xdd\xe5\x43\x80\x48\xcf\x0f\x5e\x21\x5e\xaa\x61\
+\x79\x97\x2f\xcb\xbf\x24\xc5\x2e\xdc\xf2\xbf\xb9\xda\x43\x80\xf9\
+\x7c\xfa\xf3\x01\xfe\x19\x49\x92\xb6\xb4\xf9\x8a\xc0\x68\xcf\x0f\
+\xde\x78\xbc\x54\xc3\x8e\xc0\xb3\xfc\x4b\x52\xec\xc2\x2e\xff\x9b\
+\x6b\x36\x9b\xad\x1d\x02\x48\x52\xdc\xda\x43\x80\xd5\x6a\x7e\x37\
+\xda\xf3\x83\x57\xbe\x97\x6a\xd8\x11\x78\x96\x7f\x49\x8a\x5d\xf8\
+\xe5\x7f\xe3\x2d\x97\xcb\x2f\xac\xeb\x99\x43\x00\x49\x0a\x5b\xb5\
+\x39\x04\x08\xf5\xfc\xe0\x95\xeb\xa5\x1a\x76\x04\x5e\xfb\xb7\xfd\
+\xff\x99\xe1\x6f\x44\x92\xa4\x1d\xbd\xd2\x2c\xd4\x1f\x08\xf8\xfc\
+\xd8\xe9\x2d\x97\x8b\x77\x34\x73\xfb\x3b\x01\x24\x29\x68\x55\x35\
+\xfd\x85\xe9\x74\xfa\x5c\xb4\xe7\x07\xaf\x3c\x2f\xd5\xb0\x63\xf0\
+\x9a\x1b\xc0\x37\x0d\x7d\x03\x92\x24\xed\x2c\xcd\xbf\xf9\x7f\xdc\
+\x6b\x7f\x13\xc0\xc7\x01\x24\x29\x72\xd3\x9f\xaf\xeb\xfa\x76\xb4\
+\xe7\x07\xaf\x1c\x2f\xd5\xb0\x63\xf0\x9a\x17\xfe\x87\x86\xbf\xf1\
+\x48\x92\x76\x94\x76\xf9\xdf\x78\xfe\x4e\x00\x49\x0a\xdf\xff\x79\
+\x71\x71\x51\x47\x7b\x7e\xf0\xf2\x7b\xa9\x86\x1d\x83\xd7\xbc\xd8\
+\xbf\x26\xc0\x0d\x47\x92\xb4\xbd\x74\xbf\xf6\xbf\xcb\x6b\x7f\xc5\
+\xd4\x57\x04\x4a\x52\xdc\xaa\x6a\xf6\xf2\x62\xb1\xf8\x82\x68\xcf\
+\x0f\x5e\x5e\x2f\xd5\xb0\x63\xf0\x9a\x37\x95\xff\x7a\xf3\x62\xff\
+\xf4\xd0\x37\x1b\x49\xd2\xd6\xd2\xff\x9b\xff\xc7\x2f\xbf\x09\x20\
+\x49\xd1\x9b\xfe\xc8\x0b\x2f\xbc\xf0\xba\x68\xcf\x0f\x5e\x3e\x2f\
+\xd5\xb0\x63\xf0\xea\xfa\xe2\x9d\xcd\x8b\xfc\x57\x87\xbf\xc9\x48\
+\x92\xb6\x54\xcc\xbf\xf9\x7f\xfc\xf2\x9b\x00\x92\x14\xbb\xaa\x9a\
+\xfd\x57\x11\x9f\x1f\xbc\x3c\x5e\xaa\x61\xc7\xe0\xd5\x75\xfd\x96\
+\xe6\x85\xfd\xbf\x0f\x7d\x73\x91\x24\x6d\xad\xb8\x7f\xf3\xff\xf8\
+\xe5\x37\x01\x24\x29\x7a\xd3\xff\x20\xe2\xf3\x83\x17\xdf\x4b\x35\
+\xec\x48\xbc\xd7\x34\x2f\xe8\xbf\x31\xfc\x4d\x45\x92\xb4\xa5\xe2\
+\x97\xff\xcd\xe5\x10\x40\x92\xe2\xd6\x3c\x8b\x3e\x59\xd7\xd3\xf7\
+\x45\x7c\x7e\xf0\xe2\x7a\xa9\x86\x1d\x8b\xd7\xbc\xa0\xbf\x7e\xe8\
+\x1b\x8a\x24\x69\x6b\xc5\xfe\xda\xff\xae\xab\xfd\x38\x40\xf3\x26\
+\xd3\xc7\x01\x24\x29\x60\x55\x35\xfb\xb9\x17\x5f\x7c\xe1\x6d\x11\
+\x9f\x1f\xbc\x98\x5e\xaa\x61\xc7\xe0\x2d\x16\xd3\x2f\x69\xde\x68\
+\xfd\xfa\xd0\x37\x13\x49\xd2\x13\x8d\xe6\xdf\xfc\x3f\xee\x2d\x97\
+\xcb\x2f\xac\xeb\x99\xdf\x04\x90\xa4\x98\x7d\x57\xd4\xe7\x07\x2f\
+\x9e\x97\x6a\xd8\xd2\xbd\xc5\x62\xf1\xfa\xf6\xab\x3d\x02\xdc\x44\
+\x24\x49\x8f\xf6\xca\x6c\x36\xfb\x5d\x51\x9f\x1f\x7d\x78\xcb\xe5\
+\xe2\xc5\xe6\x9f\x83\xdf\x04\x90\xa4\x80\x2d\x97\xf3\x7f\x33\xea\
+\xf3\x83\x17\xcb\x4b\x35\x6c\xe9\x5e\x55\x4d\xff\xc8\xd0\x37\x0f\
+\x49\xd2\x13\x8d\xf6\xdf\xfc\x3f\xee\xb5\xbf\x09\xe0\xef\x04\x90\
+\xa4\x90\x7d\x7c\x3a\x9d\xbe\x2d\xea\xf3\x83\x17\xc7\x4b\x35\x6c\
+\xc9\x5e\x55\x55\x2f\xfa\xd5\x7f\x49\x0a\x97\xe5\xff\x31\xcf\x5f\
+\x0c\x28\x49\x31\x6b\x9e\x57\xdf\x1e\xf9\xf9\xc1\x8b\xe1\x4d\x32\
+\x0d\x5b\xb0\xf7\x54\x55\xcd\x3e\x32\xf4\x4d\x43\x92\xf4\x48\xa3\
+\xff\xb5\xff\x5d\xde\x74\x3a\x7d\xfb\x6c\xe6\x2f\x06\xd4\xff\xdf\
+\xde\xdd\xc7\xda\x96\xde\x05\x1d\x3f\x43\x87\xbe\x97\x99\xe9\xb4\
+\x73\xba\xd7\x7a\xd6\xda\xfb\x9c\x7b\xce\xb9\xb7\x77\xee\xcc\xd8\
+\x99\x42\xa5\xf2\x07\xc4\x17\xa4\x82\x95\xa6\x36\x30\x6a\x6d\x2b\
+\x88\xc6\x50\x8a\x84\x10\x10\xb5\x24\xa2\xa4\xc4\xf8\x92\x54\xa0\
+\x24\x20\x92\x40\x82\xb1\x21\xb1\x13\xfc\x43\x28\x25\x51\x18\xd1\
+\x18\x14\x6d\x04\xda\x29\x85\x26\x4a\xa4\xa5\x96\x1a\xdb\xce\x34\
+\xae\x3d\xf7\x76\x3a\x2f\x9d\xb9\xf7\xac\xfd\xf2\xfc\x7e\x6b\x7d\
+\x56\xf2\xcd\xd0\xb4\xf9\xf0\x9b\x7b\xee\x7a\xd6\x79\x9e\xb3\xf7\
+\x3e\x92\x82\xf5\xc8\xfa\xb7\x02\x44\x7e\x7e\xf0\xea\x7b\x07\x99\
+\x86\x9d\xaa\xd7\x75\xcd\x1b\x02\x2c\x18\x92\xa4\xcf\xe7\x27\xff\
+\xd7\xf1\xbc\x12\x40\x92\x22\xd6\x3c\x38\x2c\xd1\x37\x45\x7e\x7e\
+\xf0\x2a\x7b\xa9\x86\x9d\xa0\x77\xd7\x5d\x57\x9e\xdd\xf7\xcd\x6f\
+\xd6\x5f\x2c\x24\x49\xd7\xb2\xf9\xbf\x41\xcf\x21\x80\x24\xc5\x6b\
+\x78\x86\x7d\x43\xf4\xe7\x07\xaf\xa2\x97\x6a\xd8\x09\x7a\xcb\x65\
+\xf9\xf6\xda\x8b\x84\x24\xe9\xb1\xbc\xec\xff\x9c\x9e\xb7\x03\x48\
+\x52\xac\x4a\x69\x3e\x70\xdf\x7d\xf7\x7d\x71\xf4\xe7\x07\xaf\x92\
+\x97\x6a\xd8\x89\x79\xf7\xde\xfb\x47\x5e\xe8\xf7\x2a\x4b\x52\x98\
+\xfc\xe4\x7f\xa4\xe7\x95\x00\x92\x14\xab\xe1\x79\xf6\xe6\x0c\xcf\
+\x0f\x5e\x5c\x2f\xd5\xb0\x59\xbc\xbe\x2f\x6f\xad\xbd\x38\x48\x92\
+\x1e\xcd\xe6\x7f\x43\xcf\x21\x80\x24\xc5\x69\x78\xa6\xfd\xd6\xb0\
+\x34\xdf\x9c\xe1\xf9\xc1\x8b\xe7\xa5\x1a\x36\x8b\x77\xf7\xdd\x77\
+\x3e\xaf\xeb\xca\x43\xb5\x17\x07\x49\x52\xfb\x88\x97\xfd\x6f\xc7\
+\x5b\x2e\x97\x97\x87\x3f\x4f\x6f\x07\x90\xa4\x00\x7d\xee\xb3\x00\
+\x32\x3c\x3f\x78\x71\xbc\x54\xc3\x66\xf2\xfa\xbe\xf3\xc9\xff\x92\
+\x54\x3f\x3f\xf9\xdf\xb2\x77\x74\xb4\xba\xec\xed\x6d\x92\x54\xbf\
+\x52\xda\x7f\x9f\xe9\xf9\xc1\xab\xef\xa5\x1a\x36\x9b\x37\x7c\x73\
+\xf4\xbe\xda\x8b\x82\x24\xcd\x3c\x9b\xff\x1d\x79\xab\xd5\xea\xe5\
+\xde\x0e\x20\x49\xf5\x5b\x2e\x97\xaf\xce\xf4\xfc\xe0\xd5\xf3\x52\
+\x0d\x9b\xcd\xbb\x70\xe1\xf8\x52\xed\xc5\x40\x92\x66\x9e\xcd\xff\
+\x8e\x3d\x9f\x09\x20\x49\xf5\xeb\xfb\xf2\x63\xd9\x9e\x1f\xbc\xfd\
+\x7b\xa9\x86\xcd\xe8\x0d\x37\xe3\xdb\x6b\x2f\x06\x92\x34\xe3\x3e\
+\x3b\x6c\x4c\xff\x7a\xc6\xe7\x47\x36\xcf\x21\x80\x24\xd5\xad\xef\
+\xdb\x4f\x9c\x9e\x9e\xbc\x38\xdb\xf3\x83\xb7\x3f\x2f\xd5\xb0\x59\
+\xbd\x52\xda\xff\x5e\x7b\x31\x90\xa4\x99\xe6\x03\xff\xf6\xec\x35\
+\x4d\x73\xd6\xb6\x8d\x0f\x06\x94\xa4\x4a\xad\x56\xdd\x9b\x32\x3e\
+\x3f\x78\xbb\xf7\x52\x0d\x9b\xd5\x5b\x2e\x9b\x57\xd4\x5e\x04\x24\
+\x69\xa6\xf9\xc9\x7f\x25\xcf\x2b\x01\x24\xa9\x66\xcd\x03\x59\x9f\
+\x1f\xbc\xdd\x79\xa9\x86\xcd\xec\x0d\x37\xe1\x3b\xea\x2f\x02\x92\
+\x34\xbb\x6c\xfe\x2b\x7b\x0e\x01\x24\xa9\x4e\xa5\x34\x9f\x5e\x2e\
+\x97\xb7\x66\x7d\x7e\xf0\x6c\xfe\x33\x7b\x37\x0d\x37\xe1\x6f\xd7\
+\x5e\x04\x24\x69\x66\x3d\x52\x4a\xf9\xa6\xe4\xcf\x8f\x49\x78\xde\
+\x0e\x20\x49\x75\x1a\x9e\x83\xf7\xef\x73\xbd\xe7\xc5\xf5\x52\x0d\
+\x9b\xdd\x1b\x6e\xbc\x2b\xb5\x6f\x7e\x49\x9a\x59\x7e\xf2\x1f\xcc\
+\xf3\x4a\x00\x49\xda\x7f\xa5\xb4\x3f\xbe\xef\xf5\x9e\x17\xd3\x4b\
+\x35\x6c\x76\x6f\xfd\x2b\xa7\x6a\xdf\xfc\x92\x34\xa3\x6c\xfe\x83\
+\x7a\xab\xd5\xea\xe5\x7d\xdf\x3a\x04\x90\xa4\x3d\x35\xec\x43\x3e\
+\x50\x63\xbd\xe7\xc5\xf3\x52\x0d\x9b\xdd\x1b\x6e\xbe\x9f\xae\x7d\
+\xf3\x4b\xd2\x4c\xb2\xf9\x0f\xee\x1d\x1d\xad\x2e\x3b\x04\x90\xa4\
+\xfd\xd5\x34\x4d\x37\x85\xe7\x07\x6f\x33\x2f\xd5\xb0\xd9\x3d\xef\
+\x7b\x94\xa4\xbd\x64\xf3\x9f\xc4\x5b\xbf\x12\xc0\xdb\x01\x24\x69\
+\x3f\x3d\xdd\xe7\x00\x64\x7c\x7e\xf0\xc6\x7b\xa9\x86\xcd\xec\x0d\
+\x37\xdc\x49\xed\x9b\x5e\x92\x66\x90\xcd\x7f\x32\xcf\x67\x02\x48\
+\xd2\x7e\x2a\xa5\xf9\xe1\x29\x3d\x3f\x78\xe3\xbc\x83\x4c\xc3\x66\
+\xf6\x86\x1b\xee\xcd\xb5\x6f\x7a\x49\x9a\x78\x3e\xed\x3f\xa9\xe7\
+\x10\x40\x92\x76\x5f\x29\xed\xfb\x6b\xaf\xf7\xbc\xfa\xde\x41\xa6\
+\x61\x33\x7b\xa5\x34\xff\xb8\xf6\x4d\x2f\x49\x13\xce\x4f\xfe\x93\
+\x7b\x0e\x01\x24\x69\xe7\xad\x0f\xca\x9f\x57\x7b\xbd\xe7\x55\xf6\
+\x52\x0d\x9b\xd8\x1b\xbe\xa9\x79\x20\xc0\x4d\x2f\x49\x53\xcc\xe6\
+\x7f\x22\x9e\x43\x00\x49\xda\x75\x2f\xbb\x1c\x61\xbd\xe7\x55\xf4\
+\x52\x0d\x9b\xd8\xeb\xba\xc5\x6f\xd4\xbf\xe1\x25\x69\x72\xd9\xfc\
+\x4f\xcc\x73\x08\x20\x49\xbb\x6c\xf1\xda\x28\xeb\x3d\xaf\x92\x97\
+\x6a\xd8\xbc\xde\xcd\xa5\x34\x9f\xae\x7f\xc3\x4b\xd2\xa4\xb2\xf9\
+\x9f\xa8\xe7\x10\x40\x92\x76\xd6\x77\x45\x5a\xef\x79\x71\xbd\x54\
+\xc3\x46\xf3\xfc\x06\x00\x49\xda\x7a\x36\xff\x13\xf7\x1c\x02\x48\
+\xd2\x4e\xfa\xd1\x68\xeb\x3d\x2f\x9e\x97\x6a\xd8\x88\xde\xf0\x4d\
+\xcc\xd7\x04\xb8\xd9\x25\x69\x2a\xd9\xfc\xcf\xc4\x5b\xad\x56\x2f\
+\xef\xfb\xd6\x21\x80\x24\x6d\xa9\x61\x4d\x7d\x6f\xc4\xf5\x9e\x17\
+\xc7\x4b\x35\x6c\x54\xaf\x6d\x9b\xb7\xd4\xbe\xd9\x25\x69\x22\xd9\
+\xfc\xcf\xcc\x3b\x3a\x5a\x5d\x76\x08\x20\x49\xdb\xaa\xbc\x3f\xea\
+\x7a\xcf\xab\xef\xa5\x1a\x36\xb2\xd7\xb6\xed\xb7\xd6\xbf\xd9\x25\
+\x29\x7d\x36\xff\x33\xf5\xd6\xaf\x04\xf0\x76\x00\x49\xda\x4a\x1f\
+\x8e\xbc\xde\xf3\xea\x79\xa9\x86\x8d\xee\x0d\x37\xda\x77\x07\xb8\
+\xd9\x25\x29\x73\x36\xff\x33\xf7\x7c\x26\x80\x24\x6d\x5e\x29\xcd\
+\x47\xa3\xaf\xf7\xbc\xfd\x7b\xa9\x86\xcd\xe0\x75\x5d\xf9\xfb\xb5\
+\x6f\x76\x49\x4a\x9c\xcd\x3f\xef\xd1\xcb\x21\x80\x24\x6d\xdc\x67\
+\x32\xac\xf7\xbc\xfd\x79\xa9\x86\xcd\xe2\x0d\x37\xda\x3f\x0d\x70\
+\xb3\x4b\x52\xc6\x6c\xfe\x79\x4f\xb8\x1c\x02\x48\xd2\x66\x9d\x9c\
+\x9c\x3c\x27\xc3\x7a\xcf\xdb\xbd\x97\x6a\xd8\x4c\x5e\xdf\x97\x1f\
+\xab\x7d\xa3\x4b\x52\xc2\x6c\xfe\x79\x5f\xf0\x72\x08\x20\x49\xe3\
+\x5b\x2c\x16\x2f\xc9\xb2\xde\xf3\x76\xe7\xa5\x1a\x36\x9b\xd7\x75\
+\xe5\x27\x6a\xdf\xe8\x92\x94\xac\x47\x4a\x59\xfc\x95\x6c\xeb\x3d\
+\x6f\x7f\x9e\x43\x00\x49\x1a\xd7\xd1\xd1\x1d\x87\x99\xd6\x7b\x9e\
+\xcd\x7f\x3a\xaf\xef\xcb\x3b\x6b\xdf\xe8\x92\x94\x28\x3f\xf9\xe7\
+\xdd\xd0\xe5\x10\x40\x92\xce\xdf\xe1\xe1\xe1\x0b\xb2\xad\xf7\x3c\
+\x9b\xff\x54\x5e\x29\xcd\x3f\xa8\x7d\xa3\x4b\x52\x92\x6c\xfe\x79\
+\xe7\xba\xae\x1d\x02\xfc\x4e\x80\xbf\xbb\x92\x94\xa1\x47\x86\xa5\
+\xf3\xa6\x8c\xeb\x3d\x6f\x3b\x5e\xaa\x61\xb3\x7a\xa5\x34\xdf\x1b\
+\xe0\x66\x97\xa4\xe8\xad\x37\xff\x7f\x2d\xf3\x7a\xcf\xab\xe3\x1d\
+\x1d\x1d\x5d\xea\xfb\xd6\x21\x80\x24\x5d\xa7\x52\xda\x8f\x67\x5e\
+\xef\x79\x9b\x7b\xa9\x86\xcd\xea\x0d\x37\xdb\xdb\x6a\xdf\xec\x92\
+\x14\x3c\x9b\x7f\xde\x46\xde\xf1\xf1\xd1\xcb\x1d\x02\x48\xd2\x33\
+\xd7\xb6\xcd\x47\xb2\xaf\xf7\xbc\xcd\xbc\x54\xc3\x66\xf5\xda\xb6\
+\xfd\xe6\xda\x37\xbb\x24\x05\xce\xe6\x9f\xb7\x15\x6f\xfd\x4a\x00\
+\x6f\x07\x90\xa4\x67\xec\x7f\x4c\x61\xbd\xe7\x8d\xf7\x52\x0d\x9b\
+\xd5\x2b\xa5\x7c\x7d\x80\x9b\x5d\x92\x22\xe6\xd3\xfe\x79\x5b\xf5\
+\x7c\x30\xa0\x24\x3d\x53\xcd\x2f\x4f\x65\xbd\xe7\x8d\xf3\x0e\x32\
+\x0d\x9b\xd5\x1b\xbe\x19\xb9\xbb\xfe\xcd\x2e\x49\xe1\xf2\x93\x7f\
+\xde\x4e\xbc\x52\xca\x49\xd7\x2d\xbc\x12\x40\x92\x9e\x52\xf3\x93\
+\x53\x5a\xef\x79\xe7\xf7\x0e\x32\x0d\x9b\xd5\x5b\x2c\x16\xcf\xef\
+\x1e\xfd\x46\xb7\xf6\x0d\x2f\x49\x61\xb2\xf9\xe7\xed\xd4\x5b\x2e\
+\x0f\x57\xa5\xb4\x0f\x05\xf8\xbb\x2e\x49\x61\x2a\xa5\xf9\x3b\xb5\
+\xd7\x67\x5e\x65\x2f\xd5\xb0\x89\x3d\x2f\x47\x94\xa4\xc7\xb2\xf9\
+\xe7\xed\xc5\x73\x08\x20\x49\x4f\xac\x94\xc5\x37\x46\x58\x9f\x79\
+\x15\xbd\x54\xc3\x26\xf6\x86\x6f\x76\xdf\x5b\xfb\x86\x97\xa4\x00\
+\xd9\xfc\xf3\xf6\xea\x39\x04\x90\xa4\xc7\xd7\xbd\x32\xca\xfa\xcc\
+\xab\xe4\xa5\x1a\x36\xb1\x37\x7c\xc3\xfb\xae\xfa\x37\xbc\x24\x55\
+\xcd\xe6\x9f\x57\xc5\x73\x08\x20\x49\x57\xbb\x78\xf1\xec\x8e\x48\
+\xeb\x33\x2f\xae\x97\x6a\xd8\x88\xde\x70\xc3\xbd\xad\xf6\x0d\x2f\
+\x49\x15\x7b\xa4\x6d\x9b\xb7\x44\x5c\x9f\x79\xf3\xf0\xae\x7e\x30\
+\xa0\x5f\x11\x28\x69\xbe\x95\xd2\x7c\x24\xe2\xfa\xcc\x8b\xe7\xa5\
+\x1a\x36\xaa\xb7\x7e\xb9\x4d\xed\x9b\x5e\x92\x2a\xe5\x27\xff\xbc\
+\x10\xde\xc9\x49\x77\xd2\x75\xe5\xa1\x00\xf7\x84\x24\x55\xa8\xfc\
+\x4c\xd4\xf5\x99\x17\xc7\x4b\x35\x6c\x70\xef\x59\xa5\xb4\x1f\xaf\
+\x7f\xe3\x4b\xd2\x5e\xb3\xf9\xe7\x85\xf2\x4e\x4f\xbb\x53\x87\x00\
+\x92\xe6\x58\xdf\x97\x6f\x8d\xbc\x3e\xf3\xea\x7b\xa9\x86\xcd\xe0\
+\xf5\x7d\xfb\x6f\x6a\xdf\xf8\x92\xb4\xc7\x6c\xfe\x79\x21\xbd\xf5\
+\x2b\x01\x7c\x26\x80\xa4\xb9\x75\x74\xb4\x7a\x45\xf4\xf5\x99\x57\
+\xcf\x4b\x35\x6c\x16\xaf\xef\xcb\xdf\xae\x7d\xe3\x4b\xd2\x9e\xb2\
+\xf9\xe7\x85\xf6\x7c\x30\xa0\xa4\x39\xd5\xf7\xed\xef\xdf\x7b\xef\
+\x3d\xcf\xc9\xb0\x3e\xf3\xf6\xef\xa5\x1a\x36\x93\xb7\x5a\x95\xaf\
+\xac\x7d\xf3\x4b\xd2\x1e\xb2\xf9\xe7\xa5\xf0\x1c\x02\x48\x9a\x4b\
+\x7d\x5f\x7e\x36\xd3\xfa\xcc\xdb\x9f\x97\x6a\xd8\x6c\xde\x7d\xf7\
+\xbd\xe2\x45\x3e\x07\x40\xd2\xc4\xf3\x69\xff\xbc\x54\xde\xd5\xdf\
+\x0e\xb0\xf0\xdb\x01\x24\x4d\xba\xbe\x6f\xdf\x9a\x6d\x7d\xe6\xed\
+\xde\x4b\x35\x6c\x56\xaf\x94\xe6\x27\x6a\x2f\x00\x92\xb4\xa3\xfc\
+\xe4\x9f\x97\xd2\xf3\x4a\x00\x49\x13\xef\xb3\x8b\xc5\xa2\xcf\xb8\
+\x3e\xf3\x76\xe7\xa5\x1a\x36\xb3\x57\x4a\xf9\xd3\x01\x16\x01\x49\
+\xda\x76\x36\xff\xbc\xd4\x9e\x43\x00\x49\xd3\xad\x79\x70\x9f\xeb\
+\x29\x2f\xbe\x97\x6a\xd8\x09\x78\x37\x0f\x37\xe2\xef\xd5\x5f\x08\
+\x24\x69\x6b\x79\xd9\x3f\x6f\x12\x9e\xb7\x03\x48\x9a\x62\xa5\x34\
+\xdf\xb9\xef\xf5\x94\x17\xd7\x4b\x35\xec\x54\xbc\xe1\x46\x7c\x67\
+\xed\x85\x40\x92\xb6\x94\x9f\xfc\xf3\x26\xe5\x79\x25\x80\xa4\x89\
+\xf5\x70\x37\x3c\xa8\x6b\xac\xa7\xbc\x98\x5e\xaa\x61\xa7\xe2\x75\
+\xdd\xe2\x2b\x02\x2c\x06\x92\xb4\x69\x36\xff\xbc\x49\x7a\x27\x27\
+\xdd\x49\xd7\x95\x87\x02\xdc\x63\x92\xb4\x61\xcd\x03\x35\xd7\x53\
+\x5e\x3c\x2f\xd5\xb0\x13\xf2\x6e\xea\xba\xc5\x6f\xd4\x5f\x10\x24\
+\x69\x74\x8f\x94\xd2\xbc\x39\xc0\x7a\xca\xe3\xed\xc4\x3b\x3e\x3e\
+\x7a\x79\xdf\xb7\xde\x0e\x20\x29\x75\x6d\xdb\xbe\xae\xf6\x7a\xca\
+\x8b\xe5\xa5\x1a\x76\x4a\xde\xfa\x57\x71\xd4\x5e\x10\x24\x69\x64\
+\x7e\xf2\xcf\x9b\x85\xb7\x7e\x25\x80\xb7\x03\x48\xca\xda\xb0\x7e\
+\x7d\x68\x58\xde\x9e\x15\x61\x3d\xe5\xc5\xf1\x52\x0d\x3b\x25\xef\
+\xf6\xdb\x6f\x7f\x51\x29\xcd\x1f\xd4\x5e\x18\x24\xe9\x9c\xd9\xfc\
+\xf3\x66\xe5\xf9\x4c\x00\x49\x59\x1b\xf6\x1a\xdf\x11\x69\x3d\xe5\
+\xc5\xf0\x0e\x32\x0d\x3b\x35\x6f\xb8\x31\xdf\x51\x7b\x61\x90\xa4\
+\x73\xe4\x65\xff\xbc\x59\x7a\x7e\x3b\x80\xa4\x6c\x0d\xcf\xeb\x8f\
+\x1d\x1f\x1f\xdf\x12\x6d\x3d\xe5\xd5\xf7\x0e\x32\x0d\x3b\x35\xef\
+\xe8\xe8\x8e\xc3\xe1\x06\xfd\x64\xed\x05\x42\x92\x6e\xa0\xf5\x4f\
+\xfe\xbf\x25\xea\x7a\xca\xe3\xed\xda\x5b\xad\x5e\xb6\xf4\x4a\x00\
+\x49\x89\x7a\x7b\xd4\xf5\x94\x57\xd9\x4b\x35\xec\x04\xbd\x52\x9a\
+\x7f\x14\x60\x81\x90\xa4\x67\xca\x4f\xfe\x79\xbc\x03\xaf\x04\x90\
+\x94\xa3\x52\xda\x8f\x0f\xeb\xd5\x8b\x23\xaf\xa7\xbc\x8a\x5e\xaa\
+\x61\x27\xe8\x1d\x1d\xad\x9a\xe1\x46\xf5\x59\x00\x92\xa2\xe6\x27\
+\xff\x3c\xde\xe3\x2e\xaf\x04\x90\x14\xbf\xe6\x6f\x65\x58\x4f\x79\
+\x95\xbc\x54\xc3\x4e\xd4\xeb\xfb\xf2\xbd\xf5\x17\x0a\x49\x7a\x4a\
+\x36\xff\x3c\xde\x17\xb8\x1c\x02\x48\x8a\x5b\xf3\xbb\x8b\xc5\xe2\
+\xf9\x59\xd6\x53\x5e\x5c\x2f\xd5\xb0\xd9\xbc\x2b\x57\xee\xbc\x65\
+\xb8\x61\x3f\x54\x7f\xc1\x90\xa4\xc7\xf2\xb2\x7f\x1e\xef\x19\xae\
+\xae\xeb\x2e\x0c\xdf\x68\x7b\x3b\x80\xa4\x68\xbd\x31\xdb\x7a\xca\
+\x8b\xe7\xa5\x1a\x36\xab\xd7\xb6\xed\x6b\x02\x2c\x18\x92\xb4\xce\
+\x4f\xfe\x79\xbc\x1b\xf0\x4e\x4f\xfb\x93\xae\x2b\x0f\x05\xb8\x67\
+\x25\x69\xfd\xde\xff\x5f\x1a\x96\xa7\x9b\x32\xae\xa7\xbc\x38\x5e\
+\xaa\x61\xb3\x7b\xc3\x37\xdc\xef\xae\xbd\x70\x48\x9a\x7d\x36\xff\
+\x3c\xde\x39\xbc\xb3\x33\x87\x00\x92\xea\x57\x4a\xf3\xa9\xae\x7b\
+\xd9\xe5\xcc\xeb\x29\xaf\xbe\x97\x6a\xd8\x29\x78\x6d\xdb\x96\xf5\
+\xef\xec\xac\xbd\x80\x48\x9a\x6d\x5e\xf6\xcf\xe3\x8d\xf0\x8e\x8f\
+\x8f\x2e\x7a\x3b\x80\xa4\xca\x7d\xdf\x14\xd6\x53\x5e\x3d\x2f\xd5\
+\xb0\x53\xf2\x4a\x29\xf7\x07\x58\x40\x24\xcd\x2f\x3f\xf9\xe7\xf1\
+\x36\xf0\x7c\x30\xa0\xa4\x5a\x0d\x6b\xcf\x7f\xba\xef\xbe\xfb\xbe\
+\x78\x2a\xeb\x29\x6f\xff\x5e\xaa\x61\xa7\xe8\x0d\x37\xf2\x4f\xd7\
+\x5e\x48\x24\xcd\x2a\x9b\x7f\x1e\x6f\x0b\x9e\x43\x00\x49\x15\xfa\
+\x64\xd3\x34\x17\x6b\xaf\x7f\xbc\xbc\x5e\xaa\x61\xa7\xea\xdd\x7e\
+\xfb\xed\x2f\x1a\xbe\x81\x78\x7f\x80\x05\x45\xd2\xf4\xb3\xf9\xe7\
+\xf1\xb6\xe8\x39\x04\x90\xb4\xcf\xd6\x6f\xdd\x8b\xb2\xfe\xf1\xf2\
+\x79\xa9\x86\x9d\xba\x57\x4a\xb9\x6b\xb8\xa9\x3f\x59\x7b\x51\x91\
+\x34\xe9\x6c\xfe\x79\xbc\x1d\x78\x0e\x01\x24\xed\xa7\xe6\x47\xa3\
+\xad\x7f\xbc\x3c\x5e\xaa\x61\xe7\xe2\x0d\x37\xf6\x1b\xeb\x2f\x2c\
+\x92\x26\xda\x23\xc3\x37\x0e\x6f\x8a\xba\xfe\xf1\x78\xd9\xbd\xae\
+\xeb\x2e\x0c\xf7\xd9\x87\x03\xdc\xeb\x92\x26\x58\x29\xcd\xaf\x2e\
+\x97\xcb\xe7\x46\x5c\xff\x78\xf1\xbd\x54\xc3\xce\xcd\x1b\x6e\xee\
+\xef\xaf\xbd\xc0\x48\x9a\x5c\x7e\xf2\xcf\xe3\xed\xc1\xf3\x4a\x00\
+\x49\xbb\xa9\xf9\xdd\xf5\x6f\x0f\x8b\xbc\xfe\xf1\xe2\x7a\xa9\x86\
+\x9d\xa3\xf7\xea\x57\x7f\xd9\xb3\xfb\xbe\xfd\xa9\xfa\x0b\x8d\xa4\
+\x89\xb4\xfe\xc9\xff\x5f\xce\xb0\xfe\xf1\x78\x53\xf0\x1c\x02\x48\
+\xda\x72\xff\x67\xd8\xfc\xdf\x93\x61\xfd\xe3\xc5\xf4\x52\x0d\x3b\
+\x57\xef\x55\xaf\xfa\xd2\x17\xf6\x7d\xfb\x73\x01\x16\x1c\x49\xb9\
+\xb3\xf9\xe7\xf1\x2a\x78\xa7\xa7\xfd\x49\xd7\x95\x87\x02\xac\x01\
+\x92\x12\x57\x4a\xf3\xa9\x52\xca\x57\x67\x5a\xff\x78\xf1\xbc\x54\
+\xc3\xce\xd9\xbb\x74\xe9\xe2\x2d\xc3\x37\xee\xef\xab\xbd\xf0\x48\
+\x4a\x9b\xcd\x3f\x8f\x57\xd1\x3b\x3b\x73\x08\x20\x69\x7c\xc3\xe6\
+\xff\xd3\x7d\xdf\x7c\x6d\xc6\xf5\x8f\x17\xcb\x4b\x35\xec\xdc\xbd\
+\xe3\xe3\xe3\xf5\x21\xc0\x83\xb5\x17\x20\x49\xe9\xf2\x81\x7f\x3c\
+\x5e\x00\xef\xf8\xf8\xe8\x62\xe7\x83\x01\x25\x9d\xbf\xcf\x94\xd2\
+\xbc\x21\xf3\xfa\xc7\x8b\xe3\xa5\x1a\x96\x77\xf0\xb9\x43\x80\x5f\
+\x09\xb0\x10\x49\xca\x91\x9f\xfc\xf3\x78\x81\x3c\x9f\x09\x20\xe9\
+\x9c\x3d\x5c\x4a\xf9\x0b\x53\x58\xff\x78\x31\xbc\x83\x4c\xc3\xf2\
+\xae\x5e\x0e\x01\x24\xdd\x60\x36\xff\x3c\x5e\x40\xcf\x21\x80\xa4\
+\x1b\xcc\xe6\x9f\xb7\x75\xef\x20\xd3\xb0\xbc\xcf\x5f\x0e\x01\x24\
+\x5d\x27\x9b\x7f\x1e\x2f\xb0\xe7\x10\x40\xd2\x75\xb2\xf9\xe7\xed\
+\xc6\x4b\x35\x2c\xef\x09\x97\x43\x00\x49\x4f\x93\xcd\x3f\x8f\x97\
+\xc0\x73\x08\x20\xe9\x69\x5a\x6f\xfe\xef\x8f\xb4\x5e\xf1\x26\xe4\
+\xa5\x1a\x96\xf7\x94\xcb\x21\x80\xa4\x27\x65\xf3\xcf\xe3\x25\xf2\
+\x1c\x02\x48\x7a\x52\x36\xff\xbc\xdd\x7a\xa9\x86\xe5\x7d\xc1\xcb\
+\x21\x80\xa4\x6b\xd9\xfc\xf3\x78\x09\x3d\x87\x00\x92\xae\x65\xf3\
+\xcf\x0b\xe3\xa5\x1a\x76\x8e\xde\x9d\x77\x5e\x7e\x49\xdf\xb7\x7e\
+\x45\xa0\x34\xdf\x6c\xfe\x79\xbc\xc4\x9e\x43\x00\x69\xf6\xd9\xfc\
+\xf3\xc2\x78\xa9\x86\x9d\xb3\x77\xe5\xca\x9d\x2f\xed\xfb\xd6\x2b\
+\x01\xa4\xf9\x65\xf3\xcf\xe3\x4d\xc0\x3b\x3d\xed\x4f\xba\xae\x7c\
+\x30\xc0\x9a\x22\x69\xbf\xd9\xfc\xf3\xc2\x78\xa9\x86\xe5\x7d\xe5\
+\xb3\xd7\xaf\x04\x18\x36\x02\xbf\x1c\x60\x21\x93\xb4\x9f\x6c\xfe\
+\x79\xbc\x09\x79\x67\x67\x0e\x01\xa4\x99\x65\xf3\xcf\x0b\xe3\xa5\
+\x1a\x96\xf7\x79\xef\xda\x67\x02\x38\x04\x90\xa6\x9f\xcd\x3f\x8f\
+\x37\x41\x6f\xfd\x4a\x80\x52\x5a\x87\x00\xd2\xf4\xb3\xf9\xe7\x85\
+\xf1\x52\x0d\xcb\x7b\xaa\xe7\x10\x40\x9a\x7c\x36\xff\x3c\xde\x84\
+\xbd\x6b\x9f\x09\xe0\x10\x40\x9a\x6e\x36\xff\xbc\x30\x5e\xaa\x61\
+\x79\x4f\xef\x39\x04\x90\x26\x9b\xcd\x3f\x8f\x37\x03\xcf\x21\x80\
+\x34\xd9\x6c\xfe\x79\x61\xbc\x54\xc3\xf2\xae\xef\x39\x04\x90\x26\
+\x97\xcd\x3f\x8f\x37\x23\xcf\x21\x80\x34\xb9\x6c\xfe\x79\x61\xbc\
+\x54\xc3\xf2\x6e\xdc\x73\x08\x20\x4d\x26\x9b\x7f\x1e\x6f\x86\x9e\
+\x43\x00\x69\x32\xd9\xfc\xf3\xc2\x78\xa9\x86\xe5\x9d\xdf\x3b\x39\
+\x79\xf1\x97\x38\x04\x90\x52\x67\xf3\xcf\xe3\xcd\xd8\x73\x08\x20\
+\xa5\x6f\xd8\xfc\x2f\xbe\x31\xe2\xfa\xc2\x9b\x9f\x97\x6a\x58\xde\
+\x78\xcf\x21\x80\x94\x36\x9b\x7f\x1e\x8f\xe7\x10\x40\xca\x9b\xcd\
+\x3f\x2f\x8c\x97\x6a\x58\xde\xe6\xde\x5d\x77\x2d\x6f\xef\xfb\xf6\
+\x57\x02\x2c\x84\x92\x6e\x2c\x9b\x7f\x1e\x8f\xf7\xd8\xe5\x10\x40\
+\x4a\x97\xcd\x3f\x2f\x94\x97\x6a\x58\xde\x76\xbc\xbb\xef\x5e\xbd\
+\xc4\x21\x80\x94\x22\x9b\x7f\x1e\x8f\xf7\x14\xef\xf4\xb4\x3f\xe9\
+\xba\xe2\x10\x40\x8a\x9f\xcd\x3f\x2f\x9c\x97\x6a\x58\xde\xf6\xbc\
+\xf5\x2b\x01\xbc\x1d\x40\x0a\x9d\xcd\x3f\x8f\xc7\x7b\x5a\xef\xec\
+\xcc\x21\x80\x14\x3c\x9b\x7f\x5e\x48\x2f\xd5\xb0\xbc\xed\x7a\x3e\
+\x13\x40\x0a\x9b\xcd\x3f\x8f\xc7\xbb\xae\xb7\x7e\x25\x80\xb7\x03\
+\x48\x21\xb3\xf9\xe7\x85\xf5\x52\x0d\xcb\xdb\xbe\xe7\x10\x40\x0a\
+\x97\xcd\x3f\x8f\xc7\xbb\x61\xcf\x67\x02\x48\xe1\xb2\xf9\xe7\x85\
+\xf6\x0e\x32\x0d\xcb\xdb\x8d\xe7\x10\x40\x0a\x93\xcd\x3f\x8f\xc7\
+\x3b\xb7\xe7\x10\x40\x0a\x93\xcd\x3f\x2f\xbc\x77\x90\x69\x58\xde\
+\xee\x3c\x87\x00\x52\xf5\x6c\xfe\x79\x3c\xde\x68\xcf\x21\x80\x54\
+\x3d\x9b\x7f\x5e\x0e\x2f\xd5\xb0\xbc\x9d\x7a\x87\x87\x87\x2f\x18\
+\x36\x20\xef\x0b\xb0\x80\x4a\x73\xcb\xe6\x9f\xc7\xe3\x6d\xec\x39\
+\x04\x90\xaa\x65\xf3\xcf\xcb\xe3\xa5\x1a\x96\xb7\x73\xcf\x21\x80\
+\xb4\xf7\x6c\xfe\x79\x3c\xde\xd6\x3c\x87\x00\xd2\xde\xb3\xf9\xe7\
+\xe5\xf2\x52\x0d\xcb\xdb\x8b\xe7\x10\x40\xda\x5b\x36\xff\x3c\x1e\
+\x6f\xeb\x9e\x43\x00\x69\x6f\x0d\x9b\xff\xe6\x1b\x22\xaf\x07\x3c\
+\xde\x58\x2f\xd5\xb0\xbc\xcd\xbd\xb3\xb3\xd3\x5b\xfb\xbe\xfd\xa5\
+\x00\x0b\xab\x34\xd5\x6c\xfe\x79\x3c\xde\xce\x3c\x87\x00\xd2\xce\
+\xb3\xf9\xe7\x4d\xd6\x4b\x35\x2c\x6f\x7b\xde\xc5\x8b\x67\xb7\x39\
+\x04\x90\x76\x92\xcd\x3f\x8f\xc7\xdb\xb9\x77\x7a\xda\x9f\x74\x5d\
+\x71\x08\x20\x6d\x3f\x9b\x7f\xde\x64\xbd\x54\xc3\xf2\xb6\xef\xad\
+\x5f\x09\xe0\xed\x00\xd2\x56\xb3\xf9\xe7\xf1\x78\x7b\xf3\xce\xce\
+\x1c\x02\x48\x5b\xce\xe6\x9f\x37\x59\x2f\xd5\xb0\xbc\xdd\x79\x3e\
+\x13\x40\xda\x5a\x36\xff\x3c\x1e\x6f\xef\xde\xfa\x95\x00\xde\x0e\
+\x20\x6d\x25\x9b\x7f\xde\x64\xbd\x54\xc3\xf2\x76\xef\x5d\x3b\x04\
+\xf8\xc5\x00\x0b\xaf\x94\x35\x9b\x7f\x1e\x8f\x57\xcd\xf3\x99\x00\
+\xd2\xc6\xd9\xfc\xf3\x66\x73\x78\xf0\x00\x00\x13\x92\x49\x44\x41\
+\x54\x26\xeb\xa5\x1a\x96\xb7\x3f\xcf\x21\x80\x34\x3a\x9b\x7f\x1e\
+\x8f\x57\xdd\x73\x08\x20\x8d\x6b\xd8\xf8\x7f\xba\x94\xf2\xf5\x53\
+\x5a\x0f\x78\xbc\x94\xc3\xf2\xf6\xef\x39\x04\x90\xce\xdd\xc3\x36\
+\xff\x3c\x1e\x2f\x8a\xe7\x10\x40\x3a\x5f\x36\xff\xbc\x29\x7b\xa9\
+\x86\xe5\xd5\xf3\x1c\x02\x48\x37\xdc\xb0\xf9\x6f\xdf\x18\xe9\xfe\
+\xe5\xf1\x78\xbc\xc5\x62\xd1\x3b\x04\x90\xae\x9f\xcd\x3f\x6f\xca\
+\x5e\xaa\x61\x79\xf5\x3d\x87\x00\xd2\x75\xb3\xf9\xe7\xf1\x78\x61\
+\x3d\x87\x00\xd2\x33\x67\xf3\xcf\x9b\xb2\x97\x6a\x58\x5e\x1c\xcf\
+\x21\x80\xf4\xb4\xd9\xfc\xf3\x78\xbc\xf0\x9e\x43\x00\xe9\x0b\x67\
+\xf3\xcf\x9b\xb2\x97\x6a\x58\x5e\x3c\xef\xec\xec\xf4\xd6\xbe\x6f\
+\xfd\x8a\x40\xe9\xf3\xd9\xfc\xf3\x78\xbc\x34\x9e\x43\x00\xe9\x89\
+\xd9\xfc\xf3\xa6\xee\xa5\x1a\x96\x17\xd3\xbb\x78\xf1\xec\x36\x87\
+\x00\xd2\xa3\xd9\xfc\xf3\x78\xbc\x74\xde\x72\xb9\xbc\xd0\x75\xc5\
+\x21\x80\x66\x9f\xcd\x3f\x6f\x0e\x5e\xaa\x61\x79\x71\xbd\xf5\x2b\
+\x01\xbc\x1d\x40\x33\xcf\xe6\x9f\xc7\xe3\xa5\xf5\x56\x2b\x87\x00\
+\x9a\x77\x36\xff\xbc\xb9\x78\xa9\x86\xe5\xc5\xf6\x7c\x26\x80\x66\
+\x9c\xcd\x3f\x8f\xc7\x4b\xef\xad\x5f\x09\xe0\xed\x00\x9a\x63\x36\
+\xff\xbc\x39\x79\xa9\x86\xe5\xc5\xf7\x1c\x02\x68\x86\xd9\xfc\xf3\
+\x78\xbc\xc9\x78\x3e\x13\x40\x73\xcb\xe6\x9f\x37\x37\xef\x20\xd3\
+\xb0\xbc\x1c\xde\xb5\x43\x80\xf7\xd6\x5e\xd0\xa5\x3d\x64\xf3\xcf\
+\xe3\xf1\x26\xe7\x39\x04\xd0\x5c\xb2\xf9\xe7\xcd\xd1\x3b\xc8\x34\
+\x2c\x2f\x8f\xe7\x10\x40\x33\xc8\xe6\x9f\xc7\xe3\x4d\xd6\x73\x08\
+\xa0\xa9\x77\x75\xf3\xbf\xf8\x73\x11\xee\x37\x1e\x6f\xaf\x5e\xaa\
+\x61\x79\xa9\x3c\x87\x00\x9a\x70\x36\xff\x3c\x1e\x6f\xf2\x9e\x43\
+\x00\x4d\x35\x9b\x7f\xde\xac\xbd\x54\xc3\xf2\xd2\x79\x0e\x01\x34\
+\xc1\x6c\xfe\x79\x3c\xde\x6c\x3c\x87\x00\x9a\x5a\x36\xff\xbc\xd9\
+\x7b\xa9\x86\xe5\xa5\xf4\x1c\x02\x68\x42\xd9\xfc\xf3\x78\xbc\xd9\
+\x79\x0e\x01\x34\x95\x6c\xfe\x79\xbc\x91\x57\xf4\x61\x79\xf1\xbc\
+\xb3\xb3\xd3\x5b\xfb\xbe\xf5\xdb\x01\x94\x39\x9b\x7f\x1e\x8f\x37\
+\x5b\xcf\x21\x80\xb2\x67\xf3\xcf\xe3\x8d\xbc\xa2\x0f\xcb\x8b\xeb\
+\x5d\xbc\x78\x76\x9b\x43\x00\x25\xcd\xe6\x9f\xc7\xe3\xcd\xde\x5b\
+\x2e\x97\x17\xba\xae\x38\x04\x50\xba\x6c\xfe\x79\xbc\x91\x57\xf4\
+\x61\x79\xf1\xbd\xf5\x2b\x01\xbc\x1d\x40\xc9\xb2\xf9\xe7\xf1\x78\
+\xbc\x6b\xde\x6a\xe5\x10\x40\xb9\xb2\xf9\xe7\xf1\x46\x5e\xd1\x87\
+\xe5\xe5\xf1\x7c\x26\x80\x12\x65\xf3\xcf\xe3\xf1\x78\x4f\xf2\xd6\
+\xaf\x04\xf0\x76\x00\x65\xc8\xe6\x9f\xc7\x1b\x79\x45\x1f\x96\x97\
+\xcf\x73\x08\xa0\x04\xd9\xfc\xf3\x78\x3c\xde\xd3\x78\x3e\x13\x40\
+\xd1\xb3\xf9\xe7\xf1\x46\x5e\xd1\x87\xe5\xe5\xf5\x1c\x02\x28\x70\
+\x36\xff\x3c\x1e\x8f\x77\x1d\xcf\x21\x80\xa2\x66\xf3\xcf\xe3\x8d\
+\xbc\xa2\x0f\xcb\xcb\xef\x39\x04\x50\xc0\x6c\xfe\x79\x3c\x1e\xef\
+\x06\x3d\x87\x00\x8a\x96\xcd\x3f\x8f\x37\xf2\x8a\x3e\x2c\x6f\x3a\
+\x9e\x43\x00\x05\xca\xe6\x9f\xc7\xe3\xf1\xce\xe9\x39\x04\x50\x94\
+\x86\xcd\xff\xa7\x6c\xfe\x79\xbc\x00\x38\x8f\x77\xbd\xcb\x21\x80\
+\x02\x64\xf3\xcf\xe3\xf1\x78\x23\x3d\x87\x00\xaa\x9d\xcd\x3f\x8f\
+\x37\xf2\x8a\x3e\x2c\x6f\xba\x9e\x43\x00\x55\xcc\xe6\x9f\xc7\xe3\
+\xf1\x36\xf4\x1c\x02\xa8\x56\x36\xff\x3c\xde\xc8\x2b\xfa\xb0\xbc\
+\xe9\x7b\x67\x67\xa7\xb7\xf6\x7d\xfb\x8b\xb5\x1f\x24\x9a\x55\x36\
+\xff\x3c\x1e\x8f\xb7\x25\xcf\x21\x80\xf6\x9d\xcd\x3f\x8f\x77\x3e\
+\x2f\xd5\xb0\xbc\x79\x78\x17\x2f\x9e\xdd\xe6\x10\x40\x7b\xca\xe6\
+\x9f\xc7\xe3\xf1\xb6\xec\x2d\x97\xcb\x0b\x5d\x57\x1c\x02\x68\xe7\
+\xd9\xfc\xf3\x78\xe7\xf7\x52\x0d\xcb\x9b\x8f\xb7\x7e\x25\x40\xd7\
+\x35\xbf\x50\xfb\xc1\xa2\x49\x67\xf3\xcf\xe3\xf1\x78\x3b\xf2\x56\
+\xab\xf5\x21\x40\xfb\x81\x00\x6b\xbd\x26\x9a\xcd\x3f\x8f\x37\xce\
+\x4b\x35\x2c\x6f\x5e\xde\x62\xb1\x78\xbe\x43\x00\xed\xa8\x87\xfb\
+\xbe\xfd\x4b\x99\xef\x0f\x1e\x8f\xc7\x8b\xee\xad\x5f\x09\x30\x6c\
+\xd2\x1c\x02\x68\xeb\xad\x37\xff\x5d\xb7\x78\x6d\xe6\xfb\x83\xc7\
+\xab\xe5\xa5\x1a\x96\x37\x3f\xcf\x21\x80\x76\x90\xcd\x3f\x8f\xc7\
+\xe3\xed\xef\x30\xbf\x77\x08\xa0\x6d\x66\xf3\xcf\xe3\x6d\xe6\x1d\
+\x64\x1a\x96\x37\x4f\xcf\x21\x80\xb6\x98\xcd\x3f\x8f\xc7\xe3\xed\
+\xff\x30\xdf\x21\x80\xb6\x92\xcd\x3f\x8f\xb7\xb9\x77\x90\x69\x58\
+\xde\x7c\x3d\x87\x00\xda\x42\x36\xff\x3c\x1e\x8f\x57\xef\x30\xdf\
+\x21\x80\x36\xca\xe6\x9f\xc7\xdb\x92\x97\x6a\x58\xde\xac\x3d\x87\
+\x00\xda\x20\x9b\x7f\x1e\x8f\xc7\xab\x7f\x98\xef\x10\x40\xa3\xb2\
+\xf9\xe7\xf1\xb6\xe8\xa5\x1a\x96\x37\x7b\xcf\x21\x80\x46\x64\xf3\
+\xcf\xe3\xf1\x78\x41\x3c\x87\x00\x3a\x6f\x36\xff\x3c\xde\x96\xbd\
+\x54\xc3\xf2\x78\x07\x0e\x01\x74\xae\x6c\xfe\x79\x3c\x1e\x2f\x98\
+\xe7\x10\x40\x37\x9a\xcd\x3f\x8f\x57\xcf\x4b\x35\x2c\x6f\xfa\xde\
+\xa5\x4b\x17\x6f\x19\x36\x76\xef\xad\xfd\x60\x52\xe8\x6c\xfe\x79\
+\x3c\x1e\x2f\xa8\xe7\x10\x40\xd7\xcb\xe6\x9f\xc7\xab\xe7\xa5\x1a\
+\x96\x37\x1f\xef\xf2\xe5\x4b\xb7\x3a\x04\xd0\xd3\x64\xf3\xcf\xe3\
+\xf1\x78\xc1\xbd\xe5\x72\x79\x61\x58\xaf\x1d\x02\xe8\x29\xd9\xfc\
+\xf3\x78\xf5\xbc\x54\xc3\xf2\xe6\xe7\xad\x5f\x09\xe0\xed\x00\x7a\
+\x52\x36\xff\x3c\x1e\x8f\x97\xc4\x5b\xad\x1c\x02\xe8\x89\xd9\xfc\
+\xf3\x78\xf5\xbc\x54\xc3\xf2\xe6\xeb\xf9\x4c\x00\x3d\x2e\x9b\x7f\
+\x1e\x8f\xc7\x4b\xe6\xad\x5f\x09\xe0\xed\x00\x5a\x67\xf3\xcf\xe3\
+\xd5\xf3\x52\x0d\xcb\xe3\x39\x04\x50\x67\xf3\xcf\xe3\xf1\x78\x69\
+\x3d\x9f\x09\x20\x9b\x7f\x1e\xaf\x9e\x97\x6a\x58\x1e\xef\x73\x97\
+\x43\x80\x59\x67\xf3\xcf\xe3\xf1\x78\xc9\x3d\x87\x00\xf3\xed\xea\
+\xe6\xbf\xf9\xb3\x53\xfa\xfb\xcc\xe3\x65\xf1\x52\x0d\xcb\xe3\x3d\
+\xf9\x72\x08\x30\xcb\x6c\xfe\x79\x3c\x1e\x6f\x22\x9e\x43\x80\xf9\
+\x65\xf3\xcf\xe3\xd5\xf3\x52\x0d\xcb\xe3\x3d\xdd\xe5\x10\x60\x56\
+\xd9\xfc\xf3\x78\x3c\xde\xc4\x3c\x87\x00\xf3\xc9\xe6\x9f\xc7\xab\
+\xe7\xa5\x1a\x96\xc7\xbb\xde\xe5\x10\x60\x16\xd9\xfc\xf3\x78\x3c\
+\xde\x44\x3d\x87\x00\xd3\xcf\xe6\x9f\xc7\xab\xe7\xa5\x1a\x96\xc7\
+\xbb\xd1\x6b\x7d\x08\x30\x3c\x5c\x7e\xbe\xf6\x03\x4e\x3b\xc9\xe6\
+\x9f\xc7\xe3\xf1\x26\xee\x39\x04\x98\x6e\x36\xff\x3c\x5e\x3d\x2f\
+\xd5\xb0\x3c\xde\x79\xbd\x4b\x97\x2e\xde\x32\x3c\x68\xbc\x12\x60\
+\x5a\xd9\xfc\xf3\x78\x3c\xde\x4c\x3c\x87\x00\xd3\xcb\xe6\x9f\xc7\
+\xab\xeb\xa5\x1a\x96\xc7\x1b\xe3\x5d\xbe\x7c\xe9\xd6\xce\x21\xc0\
+\x54\xb2\xf9\xe7\xf1\x78\xbc\x99\x79\xcb\xe5\xf2\xc2\xb0\xfe\x3b\
+\x04\x98\x40\x36\xff\x3c\x5e\x7d\x2f\xd5\xb0\x3c\xde\x58\x6f\xfd\
+\x4a\x00\x6f\x07\x48\x9f\xcd\x3f\x8f\xc7\xe3\xcd\xd4\x5b\xad\x1c\
+\x02\x64\xcf\xe6\x9f\xc7\x8b\xe1\xa5\x1a\x96\xc7\xdb\xc4\xbb\xfa\
+\x99\x00\x0b\x87\x00\x39\xb3\xf9\xe7\xf1\x78\xbc\x99\x7b\xeb\x57\
+\x02\x78\x3b\x40\xce\x6c\xfe\x79\xbc\x38\x5e\xaa\x61\x79\xbc\x4d\
+\x3d\x87\x00\x29\xb3\xf9\xe7\xf1\x78\x3c\xde\xe7\x0e\xf3\x7d\x26\
+\x40\xb2\x6c\xfe\x79\xbc\x58\xde\x41\xa6\x61\x79\xbc\x6d\x78\x0e\
+\x01\x52\x65\xf3\xcf\xe3\xf1\x78\xbc\x27\x1f\xe6\x3b\x04\x48\x92\
+\xcd\x3f\x8f\x17\xcf\x3b\xc8\x34\x2c\x8f\xb7\x2d\xcf\x21\x40\x8a\
+\x6c\xfe\x79\x3c\x1e\x8f\xf7\x74\x87\xf9\x0e\x01\x82\x67\xf3\xcf\
+\xe3\x05\xf5\x52\x0d\xcb\xe3\x6d\xd1\x73\x08\x10\x3a\x9b\x7f\x1e\
+\x8f\xc7\xe3\x5d\xef\x30\xdf\x21\x40\xd0\x6c\xfe\x79\xbc\xc0\x5e\
+\xaa\x61\x79\xbc\x2d\x7b\x0e\x01\x42\xf6\x70\xdb\xb6\x7f\x31\xe2\
+\xdf\x17\x1e\x8f\xc7\xe3\xc5\xf2\x1c\x02\xc4\xcb\xe6\x9f\xc7\x0b\
+\xee\xa5\x1a\x96\xc7\xdb\x81\x77\xf5\x10\xa0\x71\x08\x10\x23\x9b\
+\x7f\x1e\x8f\xc7\xe3\x9d\xf7\x30\xdf\x21\x40\x90\x6c\xfe\x79\xbc\
+\xe9\x78\xa9\x86\xe5\xf1\xce\xeb\x5d\xba\x74\xf1\x96\xe1\xc1\xf5\
+\x0b\xb5\x1f\x9c\x33\xcf\xe6\x9f\xc7\xe3\xf1\x78\x63\x0f\xf3\x1d\
+\x02\x54\xce\xe6\x9f\xc7\x9b\x8e\x97\x6a\x58\x1e\x6f\xac\x77\xf9\
+\xf2\xa5\x5b\x3b\x87\x00\xb5\xb2\xf9\xe7\xf1\x78\x3c\xde\x46\xde\
+\x72\xb9\xbc\x30\x3c\x4f\x1c\x02\x54\xe8\xda\xe6\xff\xeb\x32\xfd\
+\x7d\xe1\xf1\x78\x13\x18\x96\xc7\xdb\xd4\x5b\xbf\x12\xc0\xdb\x01\
+\xf6\x9e\xcd\x3f\x8f\xc7\xe3\xf1\xb6\xe2\xad\x56\x0e\x01\xf6\x9d\
+\xcd\x3f\x8f\x37\x1d\x2f\xd5\xb0\x3c\xde\xb6\xbc\xc3\xc3\xc3\x17\
+\x0c\x0f\x32\xaf\x04\xd8\x4f\x0f\x97\x52\xee\xcf\xfc\xf7\x85\xc7\
+\xe3\xf1\x78\xb1\xbc\xd3\xd3\xfe\xa4\x94\xf6\x83\x01\x9e\x71\x93\
+\x6f\xd8\xfc\xff\xbf\xb6\x6d\x5f\x93\xf9\xef\x0b\x8f\xc7\x4b\x38\
+\x2c\x8f\xb7\x6d\xef\xe4\xe4\xe4\x39\xc3\x37\x0f\x3f\x5b\xfb\xc1\
+\x3a\xe5\xae\xfe\xc4\xa0\x7d\xfd\x14\xfe\xbe\xf0\x78\x3c\x1e\x2f\
+\x96\xd7\xf7\xfd\x62\x78\xce\xfc\x7a\xed\x67\xdd\xc4\xfb\xc3\xae\
+\x5b\xfc\xa9\x29\xfc\x7d\xe1\xf1\xe6\xee\xa5\x1a\x96\xc7\xdb\x95\
+\x77\xf9\xf2\xe5\x67\x97\xb2\xf8\x97\x01\x1e\xb0\x93\x6b\xfd\x13\
+\x83\xe1\x9b\x86\xd7\x4e\xe9\xef\x0b\x8f\xc7\xe3\xf1\x62\x79\x87\
+\x87\x87\x77\x0c\xcf\x9c\xff\x5c\xfb\x99\x37\xc5\x86\xe7\xf8\xc7\
+\xfa\xbe\x79\xf5\x94\xfe\xbe\xf0\x78\x73\xf5\x52\x0d\xcb\xe3\xed\
+\xc1\x7b\xd6\xf0\xa0\x7b\x67\xed\x07\xed\xc4\xfa\xbd\xf5\x37\x0d\
+\x41\xbe\xbe\x3c\x1e\x8f\xc7\x9b\xb0\xb7\x5c\x2e\x6f\x2d\x65\xe1\
+\xb3\x7d\xb6\x58\x29\xed\x87\x4a\x29\x77\x46\xf8\xfa\xf2\x78\xbc\
+\xcd\xbc\x54\xc3\xf2\x78\xfb\xf4\x86\x07\xde\xb7\x0d\x3d\x5c\xfb\
+\xa1\x9b\xbf\xe6\x37\x9b\xa6\x39\x8b\xf6\xf5\xe5\xf1\x78\x3c\xde\
+\xa4\xbd\x9b\x87\x4d\xeb\x0f\xd5\x7f\x06\x4e\xa1\xe6\xc1\xe5\x72\
+\xf9\xb2\x60\x5f\x5f\x1e\x8f\xb7\xe9\x15\x7d\x58\x1e\xaf\x86\xd7\
+\xf7\xed\x9f\x29\xa5\xf9\x68\xfd\x87\x6f\xd6\x9a\x07\xfa\xbe\xbf\
+\x2d\xea\xd7\x97\xc7\xe3\xf1\x78\xd3\xf6\x86\xe7\xd0\xdf\x1c\x9e\
+\x47\x9f\xa9\xff\x3c\xcc\x59\x29\xed\x3f\x2f\xa5\x3c\x2f\xea\xd7\
+\x97\xc7\xe3\x8d\xbc\xa2\x0f\xcb\xe3\xd5\xf4\x9a\xa6\x19\xf6\xb0\
+\xed\x83\xb5\x1f\xc2\xc9\xfa\x6c\x29\xcd\x0f\x0c\x7f\x7c\x5f\x14\
+\xfd\xeb\xcb\xe3\xf1\x78\xbc\x69\x7b\x5d\xb7\xf8\x8a\xb6\x6d\x3e\
+\x12\xe0\xd9\x98\xa6\xab\x9f\xdb\xd3\x7e\x5b\x86\xaf\x2f\x8f\xc7\
+\x9b\xd8\xb0\x3c\x5e\x04\xef\x9e\x7b\xee\xfa\x92\xe1\x41\xf8\x4f\
+\xd6\x1b\xdb\xda\x0f\xe5\x04\x7d\xb8\x6d\xdb\xaf\xca\xf4\xf5\xe5\
+\xf1\x78\x3c\xde\xb4\xbd\xe3\xe3\xc3\xc3\xae\x2b\xef\x09\xf0\x8c\
+\x4c\x50\xf3\x5f\x87\xe7\xf8\x3d\x99\xbe\xbe\x3c\x1e\xef\x99\xbd\
+\x54\xc3\xf2\x78\x91\xbc\xa3\xa3\xee\xab\xd7\x1b\xdc\xfa\x0f\xe7\
+\x98\x95\xd2\xfe\x4c\x29\xe5\xc5\x59\xbf\xbe\x3c\x1e\x8f\xc7\x9b\
+\xb6\xb7\x5c\x76\x6f\xe9\xfb\xf6\x13\xb5\x9f\x97\x41\x5b\xbf\x7a\
+\xef\x47\x16\x8b\xc5\xf3\xb3\x7e\x7d\x79\x3c\xde\x17\xf6\x52\x0d\
+\xcb\xe3\x45\xf3\x0e\x0f\x0f\x5f\xb0\x7e\x79\x7b\xe7\x03\x02\x1f\
+\xeb\xda\x4b\x2b\x5f\x3f\x85\xaf\x2f\x8f\xc7\xe3\xf1\xa6\xed\x5d\
+\xb8\x70\xbc\xea\xba\xe6\x5f\xd5\x7e\x76\x46\x6a\xf8\xbe\xe6\xd7\
+\x1e\xff\x2b\xfe\x32\x7f\x7d\x79\x3c\xde\x53\xbd\x54\xc3\xf2\x78\
+\x51\xbd\x52\xca\x97\x0e\x0f\xcc\x5f\xad\xfd\xd0\xae\xfc\x0d\xc3\
+\xa7\x86\x7f\xfe\xe0\xfa\x50\xa4\xf6\xd7\x83\xc7\xe3\xf1\x78\xbc\
+\xf3\x78\xc3\xf3\xeb\xf5\xdd\xcc\x5f\xd5\x57\x4a\xfb\xf1\xe1\x59\
+\xfe\x1d\xc3\x1f\xc7\xcd\xb5\xbf\x1e\x3c\x1e\x6f\x77\x5e\xaa\x61\
+\x79\xbc\xe0\xde\x4d\x7d\xdf\xfe\xf9\xe1\x01\xfa\xc1\xda\x0f\xf1\
+\x0a\xdf\x34\xfc\xeb\x52\xca\x49\xb0\xaf\x07\x8f\xc7\xe3\xf1\x78\
+\x37\xec\xad\x3f\xe1\x7e\x78\x8e\x7f\xd7\xb0\x09\xfe\x83\xda\xcf\
+\xd5\x3d\xf7\x99\xf5\xcb\xfd\x8f\x8e\xee\x38\x8c\xf4\xf5\xe0\xf1\
+\x78\xbb\xf1\x0e\x32\x0d\xcb\xe3\x65\xf0\xd6\xdf\x40\x0c\x0f\xd3\
+\xb7\xcd\xe1\x53\x86\x87\x6f\x18\x7e\xae\x69\x9a\x2f\x8f\xfc\xf5\
+\xe0\xf1\x78\x3c\x1e\xef\x3c\xde\xe1\xe1\xe1\x1d\xc3\x33\xee\x07\
+\x87\xfe\xb0\xf6\x73\x76\xf7\x1b\xff\xc5\xbf\x18\x9e\xe3\x17\x23\
+\x7f\x3d\x78\x3c\xde\x76\xbd\x83\x4c\xc3\xf2\x78\x99\xbc\xe5\x72\
+\xf9\xdc\x61\x83\xfc\x37\x86\x7e\x2b\xc0\x43\x7e\x9b\x3d\xdc\x75\
+\xcd\xbb\x4b\x29\x5f\x96\xe9\xeb\xc1\xe3\xf1\x78\x3c\xde\x79\xbc\
+\xc5\x62\xf1\x92\xe1\x19\xfe\xfd\xc3\x73\xef\x7f\x07\x78\xf6\x6e\
+\xb1\xe6\xff\x0e\xbd\xab\xeb\xba\x0b\x99\xbe\x1e\x3c\x1e\x6f\x4b\
+\x5e\xaa\x61\x79\xbc\x84\xde\xbd\xf7\xde\xf3\x9c\xd5\xaa\xbc\xae\
+\xeb\xca\xbf\xed\x12\xff\xea\xc0\xe1\x9b\xa0\x8f\x96\xd2\xfe\xc3\
+\xbe\x3f\x3c\xca\xfc\xf5\xe0\xf1\x78\x3c\x1e\xef\x3c\xd7\xfa\x95\
+\x7d\x6d\xdb\x7e\x73\xdf\xb7\xff\xa5\xf6\xb3\x78\xc3\xd6\x9f\x71\
+\xf0\xdd\xeb\x83\x8d\x7d\xfe\xf9\xf1\x78\xbc\x60\x5e\xaa\x61\x79\
+\xbc\xe4\xde\xc9\x49\x77\x32\x6c\xa4\xff\xee\xd0\x07\x02\x7c\x23\
+\x70\x23\x7d\xa6\xeb\x9a\x07\x86\x79\xdf\xb0\x7e\x45\x43\xed\x3f\
+\x3f\x1e\x8f\xc7\xe3\xf1\x6a\x7a\x47\x47\xab\x2f\xef\xfb\xf2\xce\
+\x2e\xcf\xab\x02\x3e\x39\x3c\xc7\x7f\xb2\xeb\x16\x7f\x72\xf8\x57\
+\xf9\xa2\xda\x7f\x7e\x3c\x1e\x2f\x80\x97\x6a\x58\x1e\x6f\x42\x5e\
+\xdf\x2f\xee\x2d\xa5\xfd\x7b\xc3\xe6\xfa\xd7\x03\x7c\x83\xf0\x84\
+\x6f\x16\x4a\x59\xbc\xa7\x6d\x9b\xb7\x34\x4d\x73\x7b\xd4\x3f\x3f\
+\x1e\x8f\xc7\xe3\xf1\x6a\x79\x2f\x7c\xe1\x0b\x6e\xee\xfb\xe6\x4f\
+\x0c\xcf\xf1\x7f\x36\x6c\xae\x7f\x27\xc0\xb3\xfb\x71\x35\xbf\xbf\
+\xde\xf4\xb7\x6d\xfb\xba\xc5\x62\xf1\xfc\x88\x7f\x7e\x3c\x1e\x2f\
+\xbe\x97\x6a\x58\x1e\x2f\x9b\x77\xf5\x03\x87\x9a\xaf\x2b\xa5\xf9\
+\x81\xe1\x9b\x89\xff\x38\x3c\xc0\x1f\xd9\xd7\x37\x0a\x7d\xdf\x7e\
+\xe2\xda\xdb\x13\xde\xbe\xfe\x66\xe6\xe4\xe4\xe4\x39\xd9\xfe\xfc\
+\x78\x3c\x1e\x8f\xc7\xab\xe9\x75\xc3\x43\xfc\xea\x6f\x02\x6a\x7e\
+\x64\x78\x8e\xff\xb7\xfd\x6e\xf8\xcb\xff\x1c\x7a\xcf\x72\x59\xbe\
+\xe7\xe8\xa8\x7b\xd5\x4b\x5f\x7a\xfb\x0d\xfd\xa4\x3f\xd2\x9f\x1f\
+\x8f\xc7\x8b\xe5\xa5\x1a\x96\xc7\x9b\x82\xd7\xf7\xfd\x6d\x6d\xdb\
+\xbe\x66\xfd\xfb\x78\x87\x87\xfb\xbb\x86\x07\xfb\xcf\xf7\x7d\xf9\
+\xed\x6e\xa3\xcf\x10\x78\xf4\x43\x7f\x7e\x6d\xf8\x06\xe5\xdd\xc3\
+\x7f\x7e\xc7\xf0\xff\xe3\x5b\x8e\x8f\xbb\x3f\x7a\xe5\xca\xe5\xe7\
+\xd6\xfe\xf7\xe5\xf1\x78\x3c\x1e\x6f\x4a\xde\xf0\x0c\x2f\xeb\x03\
+\x81\xe1\x79\xfb\x3d\xa5\xb4\x3f\x3e\xf4\xef\x86\xfe\xd7\x26\x1b\
+\xfd\xe1\x7b\x82\x8f\x0d\xcf\xf1\xff\x30\xfc\xdf\x3f\x35\xf4\x7d\
+\xc3\x73\xfc\x8d\xab\xd5\xf2\x4a\x84\x7f\x5f\x1e\x8f\x37\x1d\x2f\
+\xd5\xb0\x3c\xde\xd4\xbd\xbb\xef\xbe\xf2\xa2\xae\xeb\xee\xec\xfb\
+\xc5\x1f\x5b\xbf\x9f\xef\xea\x37\x17\xcd\x9b\xd6\xbf\x6d\xe0\xda\
+\xef\x2e\xfe\xce\xe1\x9f\x7f\xb5\x94\x72\xff\xf0\xdf\xbf\x76\xfd\
+\x13\xfd\xe1\x7f\xff\xca\xa6\x69\xba\xd5\xaa\xbf\x29\xdb\xbf\x2f\
+\x8f\xc7\xe3\xf1\x78\x53\xf2\xae\x5c\xb9\xf3\xa5\xc3\xa6\xfd\x95\
+\xcb\xe5\xf2\x8f\xb7\x6d\xfb\x35\x57\x5f\x35\x50\xbe\x69\xf8\xe7\
+\x5b\xd7\xcf\xf1\x61\x63\xff\xed\x57\x9f\xe3\xcd\x1b\x86\x67\xf8\
+\xd7\x0e\xff\x9b\xaf\x5a\x2e\x9b\x57\x3c\xfe\x83\xfb\x32\xfd\xfb\
+\xf2\x78\xbc\x5c\x5e\xaa\x61\x79\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\
+\x1e\x8f\xc7\xe3\x6d\x78\x45\x1f\x96\xc7\xe3\xf1\x78\x3c\x1e\x8f\
+\xc7\xe3\xf1\x78\x3c\xde\x86\x57\xf4\x61\x79\x3c\x1e\x8f\xc7\xe3\
+\xf1\x78\x3c\x1e\x8f\xc7\xe3\x6d\x78\x45\x1f\x96\xc7\xe3\xf1\x78\
+\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\xde\x86\x57\xf4\x61\x79\x3c\x1e\
+\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\x6d\x78\x45\x1f\x96\xc7\
+\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\xde\x86\x57\xf4\x61\
+\x79\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\x6d\x78\x45\
+\x1f\x96\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\xde\x38\
+\x2f\xd5\xb0\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\
+\xc6\x79\xa9\x86\xe5\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\
+\x8f\x37\xce\x4b\x35\x2c\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\
+\xf1\x78\xbc\x71\x5e\xaa\x61\x79\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\
+\x1e\x8f\xc7\xe3\x8d\xf3\x0e\x32\x0d\xcb\xe3\xf1\x78\x3c\x1e\x8f\
+\xc7\xe3\xf1\x78\x3c\x1e\x6f\x9c\x77\x90\x69\x58\x1e\x8f\xc7\xe3\
+\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x23\xbd\x54\xc3\xf2\x78\x3c\
+\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\x1b\xe7\xa5\x1a\x96\xc7\
+\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\xde\x38\x2f\xd5\xb0\
+\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x76\xea\xa5\
+\x1a\x96\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\xde\x86\
+\x57\xf4\x61\x79\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\
+\x6d\x78\x45\x1f\x96\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\
+\x3c\xde\x86\x57\xf4\x61\x79\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\
+\x8f\xc7\xe3\x6d\x78\x45\x1f\x96\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\
+\xe3\xf1\x78\x3c\xde\x86\x57\xf4\x61\x79\x3c\x1e\x8f\xc7\xe3\xf1\
+\x78\x3c\x1e\x8f\xc7\xe3\x6d\x78\x45\x1f\x96\xc7\xe3\xf1\x78\x3c\
+\x1e\x8f\xc7\xe3\xf1\x78\x3c\xde\x86\x57\xf4\x61\x79\x3c\x1e\x8f\
+\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\x6d\x78\x45\x1f\x96\xc7\xe3\
+\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\xde\x86\x57\xf4\x61\x79\
+\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\x6d\x78\x45\x1f\
+\x96\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\xde\x38\x2f\
+\xd5\xb0\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\xc6\
+\x79\xa9\x86\xe5\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\
+\x37\xce\x4b\x35\x2c\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\
+\x78\xbc\x71\x5e\xaa\x61\x79\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\
+\x8f\xc7\xe3\x8d\xf3\x0e\x32\x0d\xcb\xe3\xf1\x78\x3c\x1e\x8f\xc7\
+\xe3\xf1\x78\x3c\x1e\x6f\x9c\x77\x90\x69\x58\x1e\x8f\xc7\xe3\xf1\
+\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x23\xbd\x54\xc3\xf2\x78\x3c\x1e\
+\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\x1b\xe7\xa5\x1a\x96\xc7\xe3\
+\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\xde\x38\x2f\xd5\xb0\x3c\
+\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x76\xea\xa5\x1a\
+\x96\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\xde\x86\x57\
+\xf4\x61\x79\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\x6d\
+\x78\x45\x1f\x96\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\
+\xde\x86\x57\xf4\x61\x79\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\
+\xc7\xe3\x6d\x78\x45\x1f\x96\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\
+\xf1\x78\x3c\xde\x86\x57\xf4\x61\x79\x3c\x1e\x8f\xc7\xe3\xf1\x78\
+\x3c\x1e\x8f\xc7\xe3\x6d\x78\x45\x1f\x96\xc7\xe3\xf1\x78\x3c\x1e\
+\x8f\xc7\xe3\xf1\x78\x3c\xde\x86\x57\xf4\x61\x79\x3c\x1e\x8f\xc7\
+\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\x6d\x78\x45\x1f\x96\xc7\xe3\xf1\
+\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\xde\x86\x57\xf4\x61\x79\x3c\
+\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\x6d\x78\x45\x1f\x96\
+\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\xde\x38\x2f\xd5\
+\xb0\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\xc6\x79\
+\xa9\x86\xe5\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\x37\
+\xce\x4b\x35\x2c\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\
+\xbc\x71\x5e\xaa\x61\x79\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\
+\xc7\xe3\x8d\xf3\x0e\x32\x0d\xcb\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\
+\xf1\x78\x3c\x1e\x6f\x9c\x77\x90\x69\x58\x1e\x8f\xc7\xe3\xf1\x78\
+\x3c\x1e\x8f\xc7\xe3\xf1\x78\x23\xbd\x54\xc3\xf2\x78\x3c\x1e\x8f\
+\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\x1b\xe7\xa5\x1a\x96\xc7\xe3\xf1\
+\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\xde\x38\x2f\xd5\xb0\x3c\x1e\
+\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x76\xea\xa5\x1a\x96\
+\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\xde\x86\x57\xf4\
+\x61\x79\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\x6d\x78\
+\x45\x1f\x96\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\xde\
+\x86\x57\xf4\x61\x79\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\
+\xe3\x6d\x78\x45\x1f\x96\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\
+\x78\x3c\xde\x86\x57\xf4\x61\x79\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\
+\x1e\x8f\xc7\xe3\x6d\x78\x45\x1f\x96\xc7\xe3\xf1\x78\x3c\x1e\x8f\
+\xc7\xe3\xf1\x78\x3c\xde\x86\x57\xf4\x61\x79\x3c\x1e\x8f\xc7\xe3\
+\xf1\x78\x3c\x1e\x8f\xc7\xe3\x6d\x78\x45\x1f\x96\xc7\xe3\xf1\x78\
+\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\xde\x86\x57\xf4\x61\x79\x3c\x1e\
+\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\x6d\x78\x45\x1f\x96\xc7\
+\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\xde\x38\x2f\xd5\xb0\
+\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\xc6\x79\xa9\
+\x86\xe5\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\x37\xce\
+\x4b\x35\x2c\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\xbc\
+\x71\x5e\xaa\x61\x79\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\
+\xe3\x8d\xf3\x0e\x32\x0d\xcb\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\
+\x78\x3c\x1e\x6f\x9c\x77\x90\x69\x58\x1e\x8f\xc7\xe3\xf1\x78\x3c\
+\x1e\x8f\xc7\xe3\xf1\x78\x23\xbd\x54\xc3\xf2\x78\x3c\x1e\x8f\xc7\
+\xe3\xf1\x78\x3c\x1e\x8f\xc7\x1b\xe7\xa5\x1a\x96\xc7\xe3\xf1\x78\
+\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\xde\x38\x2f\xd5\xb0\x3c\x1e\x8f\
+\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x76\xea\xa5\x1a\x96\xc7\
+\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\xde\x86\x57\xf4\x61\
+\x79\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\x6d\x78\x45\
+\x1f\x96\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\xde\x86\
+\x57\xf4\x61\x79\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\
+\x6d\x78\x45\x1f\x96\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\
+\x3c\xde\x86\x57\xf4\x61\x79\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\
+\x8f\xc7\xe3\x6d\x78\x45\x1f\x96\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\
+\xe3\xf1\x78\x3c\xde\x86\x57\xf4\x61\x79\x3c\x1e\x8f\xc7\xe3\xf1\
+\x78\x3c\x1e\x8f\xc7\xe3\x6d\x78\x45\x1f\x96\xc7\xe3\xf1\x78\x3c\
+\x1e\x8f\xc7\xe3\xf1\x78\x3c\xde\x86\x57\xf4\x61\x79\x3c\x1e\x8f\
+\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\x6d\x78\x45\x1f\x96\xc7\xe3\
+\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\xde\x38\x2f\xd5\xb0\x3c\
+\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\xc6\x79\xa9\x86\
+\xe5\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\x37\xce\x4b\
+\x35\x2c\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\xbc\x71\
+\x5e\xaa\x61\x79\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\
+\x8d\xf3\x0e\x32\x0d\xcb\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\
+\x3c\x1e\x6f\x9c\x77\x90\x69\x58\x1e\x8f\xc7\xe3\xf1\x78\x3c\x1e\
+\x8f\xc7\xe3\xf1\x78\x23\xbd\x54\xc3\xf2\x78\x3c\x1e\x8f\xc7\xe3\
+\xf1\x78\x3c\x1e\x8f\xc7\x1b\xe7\xa5\x1a\x96\xc7\xe3\xf1\x78\x3c\
+\x1e\x8f\xc7\xe3\xf1\x78\x3c\xde\x38\x2f\xd5\xb0\x3c\x1e\x8f\xc7\
+\xe3\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x76\xea\xa5\x1a\x96\xc7\xe3\
+\xf1\x78\x3c\x1e\x8f\xc7\xe3\xf1\x78\x3c\xde\x13\xaf\xff\x0f\xe1\
+\x4a\x02\x8a\x71\xd6\xc8\xd1\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
+\x42\x60\x82\
+\x00\x00\xd1\xf0\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x07\x80\x00\x00\x07\x80\x04\x03\x00\x00\x00\xdd\x8c\x57\xf5\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\
+\x9c\x18\x00\x00\x00\x2a\x50\x4c\x54\x45\x4c\x69\x71\xb0\xa4\x9f\
+\x51\x51\x51\xff\xff\xff\xff\xff\xff\x42\x42\x42\x21\x21\x21\xd9\
+\xd9\xd9\x9a\x6e\x55\xaa\x77\x5c\x6f\x4d\x3f\x87\x60\x4c\x5b\x3f\
+\x36\xee\xee\xee\x25\xa7\x2c\x63\x00\x00\x00\x04\x74\x52\x4e\x53\
+\x00\xfe\x86\x78\x3f\xce\xfe\x83\x00\x00\x20\x00\x49\x44\x41\x54\
+\x78\xda\xec\xdd\xbf\x6a\xdb\x50\x14\xc0\xe1\x50\xf0\x03\xa8\x53\
+\x46\xd5\x90\xc5\x79\x8d\xae\x85\x12\xb8\x1d\x94\x39\x7d\x85\x4c\
+\x1d\xd4\x49\xd0\x97\x08\x05\x2d\xf6\x12\x3c\x05\xdf\xd7\x28\xf4\
+\x75\x92\xd8\x43\xa9\x0b\xc5\x7f\x22\x4b\x47\xfe\xbe\xa5\x43\x3b\
+\x35\xfa\x71\x8e\xee\xb5\xc9\xc5\x05\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\xc0\xb1\xca\xe9\xda\xfb\x62\xdb\x87\xcd\x5f\xf8\x1f\x82\x61\x79\
+\xc9\xf2\x3a\xaf\x56\x6d\xda\x59\xb5\xc8\xb9\x51\x33\xf4\xe8\xdd\
+\x74\x9a\xe7\xe9\x58\x2f\x2d\x7f\x57\x32\x9c\xb2\xdc\xeb\xe3\xc3\
+\xfd\x37\xe4\xe5\xb4\xf4\x7f\x0b\x9d\xa6\x3b\x6b\x53\xa7\xe6\x59\
+\xc6\xd0\xc5\x8b\xee\x3c\x9d\x4a\x95\x2d\xd5\xf0\x86\x73\x37\x9d\
+\x5e\xb5\x30\x8b\xe1\xe8\x78\xdb\xd4\xa3\x6a\x69\x14\xc3\x81\x5b\
+\xf3\x2c\x0d\x81\x88\x61\xef\xc9\x3b\x8c\x78\xff\x44\x6c\x9d\x86\
+\x5d\x47\x6f\x9b\x06\xa8\xf2\x4e\x0c\xc1\x46\xef\x16\x83\x18\xa2\
+\xd6\xbb\xb1\xf0\x46\x0c\xc3\x3d\xb3\xda\xc1\xad\x86\xe1\xef\x7a\
+\xaf\x52\x28\xe6\x30\x0c\xfb\xd0\xca\x1c\x86\x1d\xde\x7b\xaf\x52\
+\x58\xe6\x30\x4e\xad\x62\x5b\x96\x7e\x8a\x9c\xeb\xea\x9c\x46\xc1\
+\x18\xc6\xea\x1c\xda\xc2\x18\xc6\xf0\x8d\xac\x5a\xfa\x99\x72\x36\
+\x66\x69\x84\x7e\x1a\xc3\xd8\x9d\x23\xbb\x95\x30\x76\xe7\xd0\x9b\
+\xb4\x03\x2d\xec\xce\xb1\xef\x95\xfc\x94\xb1\x3b\x47\x76\x63\x93\
+\x46\xbe\x5e\x86\x41\xbe\x12\x06\xf9\x1e\x70\x9e\x25\x61\xe4\x6b\
+\x0a\x43\xbf\xf9\xa6\xf3\x65\x0a\x63\xfa\x4a\x18\xe4\x6b\x91\x86\
+\xfd\xc8\xd7\xbd\x30\xf2\x1d\xc1\xf7\x1c\x3c\x0d\x04\x33\x95\xad\
+\x84\x09\xfb\xf2\x2b\xd9\x6d\xf6\x68\x9c\x5d\x39\x90\x06\x2f\xbf\
+\xf6\x68\xf0\xf2\xeb\xbb\x86\x78\xf9\xb5\x47\x83\xed\xd9\xad\x30\
+\xd8\x9e\xed\xd1\xd8\x9e\xb1\x47\x63\x7b\x76\x1e\x0d\xc6\xaf\x21\
+\x0c\xc6\xaf\x21\x8c\xf1\x8b\x0f\x57\x62\xfc\x8e\x84\xaf\x0a\x63\
+\xfc\x1a\xc2\x60\xfc\xf6\x35\x84\x3d\x41\x18\xbf\x86\x30\x18\xbf\
+\x8e\xa3\x31\x7e\x71\x27\x8c\xf1\x6b\x08\x43\x97\xe3\x57\xbf\x2e\
+\x94\xb0\x3e\xb3\xf1\xe8\x99\xc2\xfa\x1c\xd8\x8d\xa7\x0a\xe3\xd7\
+\x59\x16\xe8\xb7\x1f\xbe\xe9\x8f\xf5\xd9\x1a\x0d\xc6\xaf\x35\x1a\
+\xfd\xe2\x34\x1a\xeb\xb3\x35\x1a\xde\x62\xfc\xb6\xfa\xb2\x46\x63\
+\x7d\xe6\xbf\x14\x8c\x7e\x23\xf3\xd9\x68\xbc\xfe\x7a\x11\x06\xfd\
+\xf6\xc3\xb7\x1b\xb0\x3e\x3b\xca\x02\xfd\xba\x11\xc6\xfa\x8c\xa3\
+\x2c\xf4\xeb\x28\x0b\xf6\x23\x24\x2f\xc2\x78\xfd\xc5\x67\x3a\xd0\
+\xaf\xa3\x2c\xd0\xaf\xa3\x2c\x1c\x5f\xa1\x60\xf4\x8b\xc3\x68\xf4\
+\x3b\x5e\x7e\x03\x1a\x5e\x7f\x5d\x27\xa1\x5f\x5c\x27\xa1\x5f\x14\
+\x8c\x7e\x5d\x08\x83\x7e\x15\xcc\xb8\x4c\xd4\xe2\x42\x18\xd7\x47\
+\xb8\x10\x46\xbf\x28\x18\xfd\x2a\x18\xfd\xa2\x60\xf4\xcb\xa1\x7c\
+\xac\x12\xfd\x2a\x18\xfd\xa2\x60\xf4\x8b\x82\xd1\xaf\x82\xd1\x2f\
+\x31\x54\x9e\x56\xf4\xab\x60\xc6\x43\x14\xb1\x0a\x2e\x3d\xb2\xe8\
+\xd7\x0c\x46\xbf\x28\x18\xef\xbf\x28\x18\xfd\xba\x4d\x42\xbf\x28\
+\x18\xfd\xd2\x2d\xdf\x4d\x42\xbf\x0a\x46\xbf\x28\x18\xfd\xa2\x60\
+\xf4\xab\x60\xf4\x8b\x82\x19\xb4\x89\xa7\x5f\xc1\x84\xe5\xf7\x2f\
+\x8c\xc4\x83\x67\x59\xbf\x04\xf6\xe8\x69\xd6\x2f\x81\x95\x9e\x67\
+\xfd\xa2\x60\xc2\xf0\xcc\x2b\x98\xb8\x5a\x8f\xfc\xb8\xf8\x72\xa1\
+\x0b\x60\x22\xf3\xd5\x24\xfd\xe2\x3a\x18\xfd\xa2\x60\x3a\x34\xf1\
+\xac\x8f\xd3\x67\xcf\xb6\x0b\x24\x02\x7b\xf0\x74\xeb\x17\x97\x49\
+\xe8\x17\x05\xd3\x01\xcf\xb8\xeb\x60\x1c\x40\xe3\x3a\x18\xfd\xe2\
+\x32\x09\x17\x48\x28\xd8\x01\x16\x2e\x93\xd0\x2f\x8e\xa2\xd1\x2f\
+\x0a\xc6\x01\x96\xcb\x24\xf4\x1b\xc2\xd7\xb5\xbb\x54\xcd\x73\xce\
+\x4f\x4d\x53\xd7\x75\x71\x79\xf9\xfa\x67\x51\xd7\x4d\xd3\xfc\xc8\
+\x79\x35\x6f\xd3\x97\xf5\x3f\x73\x90\x85\x03\xe8\x21\x78\xed\x31\
+\x2d\x9e\x8a\xa2\xb8\xbf\xff\xf6\xeb\xe3\x4e\x3e\xfd\x7e\x66\xef\
+\xea\x59\xe4\xbc\xae\x70\x9f\x6e\xc0\x66\xd7\x5a\x0b\xf2\x57\x04\
+\x03\x5b\x2d\xc8\xc5\xbe\x18\xeb\xb4\xef\x14\xf2\x6d\x06\x16\xe4\
+\x44\xb8\x70\x11\x1b\xe4\x34\x82\x40\x70\x2a\xbb\x58\xe3\x20\x17\
+\x71\x21\xc5\x51\xdc\xb8\x38\x17\x47\xba\x8d\x40\xa0\xbf\x93\x7b\
+\x9e\xe7\xdc\x77\x9c\x2f\xa3\xd8\x77\x76\xde\x99\x3d\xd7\x46\xab\
+\xf9\x7a\xd7\x92\xf7\x99\xe7\xe3\x7c\xcc\xbd\xf5\x62\x71\xfc\xe9\
+\xe5\x39\x10\x7f\x90\xe7\x76\xfc\xc4\x87\x01\x9e\x39\xe1\x8e\xef\
+\x55\xdc\xbe\x36\x6a\xff\x07\x96\x0d\xca\x7f\xbf\x1c\x0e\x8f\x93\
+\xff\x12\x3f\xf3\x81\xdf\xb9\x72\xee\xf8\xe8\xa3\xc5\xbd\x5f\x04\
+\xdc\xff\x04\xf2\x62\xf1\xf4\xfc\xa0\xf8\x38\x82\xac\x43\x3a\x87\
+\x82\xdd\xf1\xd1\xe2\xe8\xc3\xe5\xd6\xce\xab\xf5\xf1\xe3\xe1\x40\
+\x50\x1c\x41\x56\x04\x58\xb3\xc3\xee\xc5\xf2\x0a\xce\xd9\x7a\xf1\
+\xe0\x10\x50\x1c\x41\x56\xe0\x77\x2e\x76\xf7\xce\xe2\xe8\xe5\xf2\
+\x4a\xcf\xd9\xfa\xf8\x72\xdf\x41\x1c\x08\x8e\x00\x7a\xf7\xe0\x1d\
+\xef\x2c\xee\x2d\x77\x74\xaa\xa0\xde\x6b\x10\x7f\x1e\x3f\xfb\x11\
+\x60\xed\x52\x36\x8f\x5f\x2d\x3e\x5c\xee\xf8\xdc\x5b\x3c\x1e\xf6\
+\x16\xc4\x11\x64\x45\x80\xb5\x33\xea\x7d\xef\xa3\xa3\xe5\x4c\xce\
+\xab\x2a\xa7\xf7\xf3\x6f\x31\x7e\xfa\xc3\x00\xef\x44\x37\x7f\xb5\
+\xb8\x58\xce\xea\x9c\xad\x1f\xec\x23\x11\x87\x0d\x0e\x03\xbc\x03\
+\xea\xfd\x70\x39\xcb\xb3\x3e\x19\x56\x81\xe0\x38\x61\x80\x7f\x12\
+\xbd\x17\xcb\x19\x9f\xd3\xc5\xbe\x89\xe9\x08\xb2\x02\xbf\x81\xde\
+\x7d\xc6\x70\x04\x59\xfb\x7c\x2e\x03\xbd\xd7\x1d\xc3\xd1\x91\x15\
+\x01\xd6\x15\x14\x8c\xf6\x07\xbd\x1e\x4c\x9f\xec\x4d\xa6\x15\x36\
+\x38\x02\xac\x2d\x77\x49\xbe\x7b\xb4\xdc\xc3\xb3\x7e\xb0\x27\x34\
+\x7c\x3b\x90\x10\x06\x78\x8b\xd2\x79\xf1\x72\xb9\xa7\xe7\x6c\xf1\
+\x78\x2f\x30\x1c\x36\x38\x3a\x38\x42\x3a\xef\xb3\x94\x0e\x2c\x84\
+\x01\xde\x06\x7c\xef\x1c\x2d\x0f\xe0\xac\xe7\x4f\xc3\x61\x83\xc3\
+\x00\x77\x3f\xe3\x17\x37\x97\x07\x72\x4e\x6f\xcc\x1d\xc2\x61\x83\
+\xc3\x00\xf7\xd6\xce\x2f\x97\x07\x74\xce\x16\x33\x57\xd2\x61\x83\
+\xc3\x00\x77\x0c\xae\xde\x3d\x5a\x1e\xdc\x59\xff\x6e\xd6\x10\x0e\
+\x44\x84\x01\xee\xa6\x9d\xb7\x1b\x5c\xbd\x5a\x2f\x16\x9f\x7d\xfa\
+\xf4\xeb\x52\x8f\xad\x90\xb5\xaf\xcf\x1e\x7d\xfb\xd9\x62\xab\xdb\
+\x78\x4c\x49\xbf\x39\x63\x25\x1d\x36\x38\x0c\x70\x1f\xf8\x7e\xb3\
+\x35\xf8\x9e\xad\xdf\xfa\xf4\xeb\x8c\xbd\xcf\xc3\xf9\xb9\x9e\xeb\
+\x8f\x4e\xfd\xc6\x78\x20\x3d\xfb\xf6\xe1\xf6\xb6\x7b\x9c\x9e\x0c\
+\x61\x83\xe3\x1c\xb0\x01\xde\x96\xf5\x3d\x5d\x10\xba\x22\x52\x44\
+\x8d\x73\x4b\xd2\x92\x52\xca\x25\xe5\x9c\x55\x8b\xd8\x7d\x52\x2a\
+\x96\x09\xe3\x2d\xcd\x2b\x9e\x1d\xcf\x16\xc2\x61\x83\xc3\x00\xff\
+\xd2\xe4\x6a\xb1\x95\x9d\x19\x6f\x3d\xad\xd8\x3d\x07\x70\x55\xb3\
+\x56\xcc\x0e\x15\xb3\x15\xbe\xf5\x36\xe1\x9c\x0d\xc4\x69\xa8\x0f\
+\x56\x44\x57\x1c\xab\xa6\x8a\xe2\x47\x0f\xb7\xb2\xac\x67\xb6\x79\
+\x56\xe0\x22\x0c\xf0\x2f\x81\xef\xfb\x47\xdb\x48\x7f\x1f\xe4\xd5\
+\x08\xde\xad\xb8\x95\x31\xe7\x92\x8d\x7b\xeb\x4d\x2d\x15\xcb\x7e\
+\x84\x8c\x5c\x1f\xaa\xe0\x05\xc4\x0d\xda\x32\xac\x56\xcf\x1f\x6e\
+\x81\x89\xd7\xf3\x84\x70\xd8\xe0\x30\xc0\x3f\x1f\xbe\x77\xfb\xc3\
+\xf7\xc5\xc9\xd7\x55\x34\x6b\xc5\x62\x32\x50\x4a\x85\x65\x29\x83\
+\xdd\x4c\x83\xdd\x55\x72\xf1\x63\x84\x6c\x8c\x0c\x55\x6d\x4f\xd5\
+\x24\xc9\x5e\x51\x21\xbe\x7a\xf6\x4d\xff\x82\xf4\xfa\xcb\xb0\xc1\
+\x71\x0e\xc7\x00\x6f\x01\xbe\xaf\x4e\x2a\xf5\xaa\xe1\x32\x97\xd1\
+\xf8\xb7\xa4\xd1\xa4\x72\xc5\xa4\x21\x17\x0f\x88\x6e\x18\xb8\x3e\
+\xaa\xc0\xb1\x66\x60\xb9\x72\x71\xbd\x3f\x55\xfc\x57\x22\x4e\x7f\
+\xeb\xfe\xdf\xf7\xc1\x1c\xbd\x70\xd8\xe0\x7d\x38\x97\xf3\xf3\xbe\
+\x47\xdd\xd3\xde\x8a\xde\x4a\xa0\x52\x7d\xad\xe5\x53\x15\x90\x83\
+\x41\xb6\x02\x75\xa8\x22\x5a\x89\xe4\xfa\xab\xe5\x56\x26\xaf\xc1\
+\xc0\x92\x70\x7f\xc2\x0d\x35\x8b\x6c\xb2\xdb\x98\x58\xd2\x2a\x75\
+\x4f\xc7\xd7\xf3\x83\x70\xcc\x06\x87\x80\xfe\x39\xc9\x73\x6f\x64\
+\x7c\xe7\xe8\x15\x62\xd0\xb4\x31\x68\xd5\x4c\x2f\xee\x31\xca\x55\
+\x23\x5e\x18\xde\x31\x43\x3b\x57\xd2\x05\x15\x1b\xe0\x47\x73\xc1\
+\x99\xb2\x5b\xe0\x9a\x2b\x0f\x3f\xeb\x1d\x91\x2f\x66\x07\xe1\xb0\
+\xc1\x21\xa0\x77\x0c\xdf\x17\x7f\x1a\x56\x20\x55\xa3\x51\x83\x65\
+\x85\xac\x65\xcb\xd9\xbc\xb0\xc1\xd7\x3d\x31\x08\xd6\xb0\x6c\x05\
+\x24\xa3\x59\x8b\xae\xc4\x0a\x4a\x60\x60\x01\x21\xd7\xf7\x00\xbb\
+\x84\xd8\xd3\xea\x97\xd5\xf8\xe7\x37\xfa\x66\x6c\xb3\xab\x0b\x87\
+\x88\x8e\x0a\xd2\xff\xd5\x34\xd9\xb9\xeb\xaa\x92\xaf\xa8\x73\x6c\
+\x4a\xb0\xc0\xd5\xe8\x16\x53\xc1\x00\xab\x66\x62\xd1\xce\x98\x5b\
+\xf4\x9c\xf8\x08\x00\x5e\x41\x5c\x28\xa3\x0d\xfb\xe6\x9f\x71\xc3\
+\xae\x5a\xa1\xaf\xab\xe7\x7d\xe5\xfe\xe9\x8d\x99\x05\xd2\x81\x90\
+\xa8\x20\xbd\xbe\xf9\x7d\xb7\x2b\x7c\xcf\x8e\xf3\xca\x90\x66\xc9\
+\x53\x82\x06\x26\x7c\x0d\x92\xf8\x95\x62\xd8\xfe\x1d\x8c\x6a\x2b\
+\xc1\x02\xd4\x56\xf9\xcd\xa4\x61\xe0\xd6\xc1\xee\x58\xb6\xbb\x48\
+\xd5\x26\xb7\xab\xae\x4e\x7d\x95\xf4\xe9\xbc\x7a\xa4\x43\x44\x87\
+\x01\x7e\x5d\xf8\xde\xb9\xd9\x57\x8e\xe6\x51\x0d\x89\x23\xea\xb9\
+\xa8\x1c\x31\xa7\x32\x40\x43\x2b\x4f\xf8\x55\xca\xe7\xe4\x09\x17\
+\x82\xaa\x84\xb4\x0a\xaf\xcc\x4e\xb8\x78\xa1\xe0\xe9\xb8\x32\xdf\
+\x08\xaa\x1b\xee\xab\x1b\x5e\x3c\x99\x13\x84\xa3\x96\x14\x06\xf8\
+\xf5\xcc\xef\x51\xdf\xdc\x79\xb0\xa4\x09\x75\x1f\xd4\x7e\xc8\xbb\
+\x5a\x08\x44\xf3\xb2\x00\xb4\xc1\xd7\x83\xe6\x0c\x71\xcc\xc8\xd9\
+\xc8\xd8\xc2\x68\xc3\xaf\x32\xe7\xa2\x9e\xae\xf2\x5a\x60\x99\x09\
+\xea\xc2\x66\x8f\xde\x10\x9e\x55\x20\x1d\x36\x38\x04\xf4\x55\x67\
+\x57\xa7\x37\x56\x09\x1c\x99\x00\x30\x62\xd4\xc8\xb3\x00\x7f\xb8\
+\xab\x38\x17\x27\x65\xe9\x28\x89\x43\xd2\x5f\x04\x28\x8b\xa2\x41\
+\xab\xa0\xfd\x43\x12\xdd\x72\x42\xa3\x74\x82\x20\xc7\x8b\x0d\xec\
+\x7d\x21\x7c\x76\x32\x9f\x41\xa5\xa8\x25\x85\x80\xbe\x5a\xf3\x7b\
+\x76\x32\xc0\xfa\x12\x8c\xa8\x08\x19\x07\x1b\x9f\x0a\x8a\xbf\x8c\
+\x92\x25\xf3\x39\x1c\x60\xa8\x5f\x07\xf0\x2c\x6c\x2f\x5e\x84\x1e\
+\x4a\xb6\x79\xa0\x00\x5c\x58\x1c\x4e\xe8\x9e\x2e\xfe\x2d\x52\x2b\
+\x19\x77\x66\xe1\x19\x59\xe1\x10\xd1\x21\xa0\xaf\x52\x3d\x1f\x67\
+\x00\x96\x0a\x5a\xff\x95\x81\x51\x0a\x66\x5d\x08\xa2\x98\x7a\x19\
+\xb9\x95\x91\x2b\x2c\xae\xb5\x3f\x17\x54\x8c\x33\xee\x81\x59\x76\
+\x5e\x4e\x7c\x40\x9d\x81\x69\x9f\xed\x5e\xcb\xc0\x72\xfa\xe6\x30\
+\x75\x74\x88\xe8\xa8\x20\xfd\x14\x7c\xbb\xfe\xd8\xff\x26\xc3\xc1\
+\x22\x86\xca\xc5\xa7\x10\x36\xb0\x4c\x04\x21\x80\x8c\x92\x91\x30\
+\x53\x36\x79\x9c\xe0\x6d\x75\x82\xba\x32\xd9\x2a\x8d\xa1\xa1\xa3\
+\xd9\x79\x99\xc0\xe3\xfe\xde\xc0\x3e\x4c\x44\xd2\xe9\x8f\x3d\x95\
+\xc4\x6c\x56\x67\x05\x56\xc2\x00\x5f\x8d\x7a\xbe\xf5\x1d\x12\xab\
+\xd4\xa8\x35\x01\xc6\x16\x2b\x73\x18\x41\x48\xb2\xe8\xb2\x02\x7a\
+\x7d\x16\x89\x14\xaa\xce\xb8\xd9\xa1\x0e\x24\x63\xec\x01\xd9\x17\
+\xda\xa8\x91\x5b\xa1\x71\x0b\x3a\x3c\xa9\xff\xce\xee\x35\xe3\xfc\
+\xfe\x1b\x07\xa8\xa3\xa3\x96\x14\x02\xfa\x2a\xd4\x73\xa5\x2c\x26\
+\x57\xee\x4c\x61\x67\x79\x8f\xf0\x2b\x28\xd6\x19\x96\xbf\x68\xd3\
+\xc2\x70\xbc\x5e\x6c\x2a\x1e\x6c\x91\x9a\xfd\x57\xa6\x60\x85\x13\
+\x88\x83\x5d\x59\xe9\xa0\x81\x72\xb0\xb3\x5d\x74\xf5\xfd\xc5\xe1\
+\xe9\xe8\xcf\x03\x2f\x21\xa0\xff\x1b\xfd\x7e\xd1\x75\xa0\x87\xe6\
+\x17\x3d\x57\x70\xa6\x00\x2a\xb3\xac\xdc\xb4\x6e\xf1\x4c\x8a\x05\
+\x20\x70\x6d\x11\x1f\x24\x04\x3e\x8b\x87\x57\x6c\xb8\x62\x5a\x5d\
+\xbc\x89\x0b\x6c\x5e\x7c\x5d\x07\xde\x09\xf8\x9d\x88\xf2\x0c\x74\
+\xd7\xdb\x9f\xf4\x7c\x53\x7a\x73\x0c\x11\x1d\x67\x9e\x02\xfa\x6e\
+\x57\xb9\xf9\x24\x6d\x3a\x23\xcd\xe2\xb2\x25\xb2\x90\x28\xa1\x8d\
+\xa7\x54\x99\x29\xb3\x7a\x55\x88\x2d\x57\x9c\x09\xce\x7c\x76\x71\
+\xca\xa6\x8b\xa6\xd4\x86\x20\x67\x55\xc9\xb2\xe8\xea\xac\x0b\xfa\
+\xb5\xa4\x78\xda\x0d\xa8\x5b\x4b\xd7\xaa\xab\x8e\xbe\xf5\x65\x88\
+\xe8\x38\x33\x14\xd0\x7d\xe9\xf7\xfe\x4a\x0b\xb1\x04\x78\x36\x60\
+\x71\x67\x0e\x9c\xf0\x58\x36\x2e\x18\xf5\x24\x92\x2d\x3a\xab\xd4\
+\x5f\x97\x49\xc1\x32\x66\x12\x74\xf1\x32\x2f\x88\x55\x9c\x66\x3d\
+\xb2\x46\x87\x96\x71\xaf\xba\x1b\x6e\xb3\xc5\xf5\xc1\x55\xd7\x60\
+\x6e\x0e\xfd\xd1\x51\x4b\x0a\x01\xfd\x6f\x8d\x93\x5d\x59\xea\x49\
+\xf2\xe8\x98\xff\x80\x2f\xad\x0f\x0b\x80\x53\x3c\xc8\xb0\xd8\x34\
+\x75\x1b\x42\xca\x4a\xae\xcd\xee\x80\xd9\x2f\xad\xc9\x85\x76\xf1\
+\x52\xb0\xcd\x0c\xab\x97\x8c\xb0\xad\xc3\x89\x57\x68\x82\x81\x6e\
+\xf1\x17\x03\xdf\x95\x9c\x87\xbb\x7d\xff\x78\x21\xa2\xe3\xcc\x4a\
+\x40\xf7\xad\x1d\xdd\x58\xb1\x6d\x12\xdc\x48\xef\x8b\x82\x2f\x93\
+\xa6\x8c\x49\x23\x61\x58\xe5\x3b\x73\x0a\x02\x64\x0c\x04\x37\x73\
+\xec\xb3\xbe\x9b\x9a\x10\x29\x59\x1a\xf6\x39\xcf\x3f\x36\x6c\xb3\
+\x99\x9a\xfe\x19\xa3\x86\x1c\x60\xe2\xbb\x46\x7d\xfe\xaa\xab\xc0\
+\x38\x19\x43\x44\xc7\x99\x4d\x0b\x56\xdf\xda\xd1\xe9\x13\x77\xbd\
+\x6d\x72\x77\xf2\xc1\xde\xb9\x91\x1d\xb2\x90\xcc\xf8\xa7\xb4\x2e\
+\x67\xd6\x8e\x92\xc5\xca\x00\x35\xab\x46\xe2\x9e\x79\xea\x83\xc6\
+\xd5\x11\x59\x57\x51\x5e\xd4\x2f\xc6\x11\x08\xbb\x87\x22\xdd\x29\
+\x38\xd1\x09\x0f\x7d\x9d\xf0\xe3\x10\xd1\x71\xe6\x22\xa0\xff\xda\
+\x37\x7c\x2e\xf0\xa2\xe2\x70\x13\x36\x4a\x21\x19\x6e\x15\x5c\xf1\
+\x49\x85\xd2\x92\x26\xa0\x14\x0d\x19\x49\x1d\x73\xb8\x88\xf7\x56\
+\x1a\x30\xc7\x52\x36\x7d\x1a\x70\xc0\x00\xae\x8f\x16\xe2\x06\x9e\
+\x22\xae\xbf\xab\x75\x76\xd7\xac\xec\xdc\x2a\xab\xae\x7f\xce\xfb\
+\x63\x88\xe8\x38\x73\x10\xd0\x7d\x7b\x1d\x7e\x9f\x80\x3c\xf2\x5e\
+\xa2\xea\x4d\x98\x03\x74\x84\xfa\x34\x02\xd0\x8d\x40\x19\x04\x3c\
+\xe5\x51\x9e\x55\xf1\x0a\x42\x59\x9c\xa7\xd4\x1a\xab\x3c\x5a\xcd\
+\x98\xc9\x16\xa2\x31\x5c\x0c\x1a\x5c\xcb\x94\x71\x95\xa9\x3f\x44\
+\x11\x6b\x95\xe1\x87\x8b\x03\x72\xc2\x21\xa2\x43\x40\x9b\x7c\xee\
+\xea\x7e\x5f\x00\x47\x09\xdb\x6f\x72\x53\xb2\xd4\xbb\xd9\x7b\xa8\
+\xc6\x56\x07\x56\xa2\xb2\xc5\xcd\x4c\xa3\x13\x9b\x2d\x81\x37\xf7\
+\xc3\x6c\x95\x06\x5c\x39\x5d\x48\x5e\x47\x8d\x57\xb8\x36\x2b\xf9\
+\x26\x1e\x96\xa1\x46\xea\x6b\xae\x8f\x2e\xfe\x4c\xaf\x1d\xdf\x3c\
+\xa0\x38\x3a\x44\x74\x08\xe8\xf3\xb1\xeb\x16\xa9\x1b\x4e\xbf\xdc\
+\xf1\x4c\x25\xcb\x75\x93\xc9\x17\xe2\x34\xe4\x95\xd2\x7a\x2d\x94\
+\xc6\x95\xfd\x55\x28\x17\xbb\xa7\x15\xd4\x7e\xd5\x43\xa9\x54\x36\
+\xf3\xbe\x4d\x4b\xa3\x5e\xcc\xa4\x99\x5c\xac\xbc\x86\xbf\xa4\xfa\
+\x5e\x8c\x19\x7b\x5f\x25\x60\xde\x37\xcb\xba\xb5\xdb\xc6\xac\x5f\
+\x07\x78\xae\xb9\x80\x1e\xde\x79\xd9\x5b\x3e\xe7\x66\x7c\xc9\xb8\
+\x22\x89\xbb\x24\x19\x68\x39\xf2\x98\x5c\x89\x37\x75\x34\x9b\x6a\
+\x37\x45\xa6\x80\xd9\xc7\xf9\xcb\x94\x63\x2b\xcd\x32\xde\x06\x6c\
+\x01\x16\xab\x44\xf8\x9d\xdd\x9f\xdd\x3d\x8f\xbe\xba\x43\xb9\xc1\
+\xb2\xd1\xb6\x70\xce\x29\x3f\xef\x3a\x2a\xb9\xd3\xc6\xac\x10\xd1\
+\xd7\x5c\x40\x8f\x5d\x05\xe5\x2d\xee\xa6\x9b\x4a\xba\xd9\x47\x00\
+\xbd\xd1\xd9\xab\xbb\x66\x7f\xfd\x11\xdc\x54\x7e\x88\x8a\x7d\xf5\
+\xa0\xcb\x9e\x2f\xad\xc0\x94\x86\xfa\xd2\x81\x4d\x21\x60\x71\x6c\
+\xcb\xe2\x70\x03\x87\x91\xb2\xeb\x6b\xdf\x07\x2f\x6c\x8a\xc6\x8c\
+\xb1\x87\x65\x3e\x74\x8c\x8b\x59\x87\x74\x57\xd1\xf1\x62\x08\x11\
+\x1d\x02\x7a\x37\xe7\x9d\xae\x7b\x67\xee\x33\xa6\x52\x87\x6d\x9e\
+\x7e\xc3\x36\x48\x1f\xf3\x95\xec\x74\xac\x9e\x3f\xb3\xd9\xaa\xf8\
+\x2a\x4a\xce\xfb\x36\xb5\xed\x45\x27\x69\x36\x9a\x3d\x5a\xc9\x53\
+\xac\xa6\xd4\xf3\x64\xa2\xd5\x53\x6a\x0f\xbc\x13\x12\x30\x32\x7f\
+\x6a\x15\x2c\xd3\xf0\x5d\xd3\xe8\x9d\x8e\x28\x05\x7e\xae\xaf\x80\
+\xee\x9b\x5e\x2d\xdf\x4e\x9e\x16\xa3\x7f\x82\xce\x55\x94\xa5\x58\
+\x71\x16\x44\x83\x85\xef\xd2\xe1\x93\xa8\xa2\x29\xb6\x5b\xbf\x46\
+\x9e\xa6\x19\xf0\x49\x84\xa5\x55\x91\x39\x92\xe8\xeb\x77\xbc\x1f\
+\x93\xc2\xba\x24\xff\xb6\xc9\xc7\x8c\x85\x08\xf6\xf6\x8f\xcc\x1a\
+\x74\xf1\x8f\x3a\xac\xd6\xf8\x1f\x5d\xff\xe8\x3b\xec\xea\x08\x11\
+\xbd\xe3\xb3\xbb\x1e\xe8\xbe\xe9\xd5\xe9\xc7\xd8\xcd\x2c\xe2\x3b\
+\x32\xa4\x35\x4b\x8a\x77\x4d\x39\x8d\xfa\xe4\x82\x08\x31\xe5\x9d\
+\x1d\x52\x5c\xff\xb6\x29\x04\x75\x9b\x9c\xbd\x61\x32\xb7\x92\x32\
+\xb6\xca\x82\x6b\x55\xdb\xfb\x04\x87\x94\xc4\xf3\x2d\x36\x5e\x2a\
+\x9b\x37\xd8\xd2\x51\x58\x7e\xc2\xc5\x7c\xce\xf8\xfd\x8b\x03\xc9\
+\xb2\x3e\x0f\x0c\x5d\x4b\x01\xdd\x37\xbd\x32\xfb\xeb\xf1\x15\x11\
+\x86\x0c\x4a\x53\x9e\x4a\x39\x49\xb2\x0f\x2d\xe8\x46\xe1\x4e\xad\
+\xca\xc9\xe7\x77\x19\x74\x31\x8b\x4a\xad\x2a\x4c\xd0\xa1\xac\xcb\
+\xae\x67\xb0\x6e\x5b\x19\xad\x5e\x2f\x66\x09\x09\xf4\xce\x1c\x3c\
+\x91\xaf\x37\xef\x0f\xbc\x18\x57\xc4\xd7\x07\xba\xbe\x7f\xed\x30\
+\xcb\x0a\x0c\x5d\x4b\x01\xdd\xd5\x05\x5a\xf3\x95\xc5\x57\x8c\xa8\
+\xd8\x41\xe9\xc3\xbe\xd3\xfc\x51\x73\xc5\x0e\xe9\xec\x1b\x71\x00\
+\x6d\x62\xb0\x15\x8c\x08\x39\x61\x17\xb3\xa7\x5f\xa8\x28\x79\x81\
+\xca\x37\x55\x32\xd1\x56\xaf\xf8\xe2\xf1\x24\xcd\x06\x13\xc8\x8d\
+\xf3\x93\xc8\x34\xef\xe0\x65\xe4\xfa\x9d\x3f\xe9\xfa\x57\xb0\xb3\
+\xbe\xac\x10\xd1\xd7\x50\x40\x77\x1d\xcd\x59\x2e\x7f\xeb\xe5\x9a\
+\xd2\xba\x92\xf9\xc1\x65\xc9\x35\x30\x5b\xa5\x08\x4f\xfa\xda\x34\
+\x0d\xf2\x4b\xd9\x64\xc7\x13\xe6\xb9\xfc\x2e\x97\xa9\x65\xba\xd9\
+\x68\xf8\x64\xef\x7d\xe6\x67\x37\xb0\x82\xec\x75\x5e\x1f\x6b\x40\
+\x81\x49\xdd\xf9\xfa\x9c\x70\xeb\xfc\xd2\x56\xcc\xaa\x8f\x77\xad\
+\x08\xef\x4e\x46\x47\x31\xf8\xba\x09\xe8\xce\xf2\x19\xf1\x95\x7b\
+\x5d\xe2\xb1\x15\x77\x53\x9b\x35\x72\x27\xeb\x7b\x74\x98\x0f\x6b\
+\x99\x76\xed\x50\x7d\xdb\x5d\x00\xbc\xe4\x36\xd4\xe0\x8b\xaf\x92\
+\x87\x5a\xa9\xe9\xe0\xe2\x8b\x29\x7d\x93\x9d\x33\xbe\xcf\x44\x28\
+\xdf\x33\x52\x03\x3f\x5a\x2c\xdb\x16\x2d\x5e\x0e\x65\xe2\x92\xbf\
+\x5f\x1e\x84\x8c\x0e\x1c\x5d\xaf\x12\xf0\xd0\x57\x3e\x9f\xbd\xed\
+\x93\x7f\x89\x4c\x08\x68\x29\xa9\x58\xc0\x98\x4e\xa5\x2d\xb8\x82\
+\x01\xd6\xd2\x76\xc6\x32\x77\xd6\x09\xf1\xa9\xbd\x05\xb4\xc5\x1d\
+\x5e\x23\x52\xee\x75\x57\x5e\xb7\x38\xf1\xfa\x8a\x4b\x65\x75\x78\
+\xba\x8a\x41\x14\x2f\x54\xd7\x00\xea\x53\x10\x32\xd1\xba\xbd\x2b\
+\xfc\xf0\xf2\x10\x64\x74\x88\xe8\x6b\x25\xa0\xfb\xa6\xcf\xcb\xd3\
+\x27\xc4\x50\xf6\x99\x82\xd4\xda\x1a\xc5\x97\xc8\x16\xdf\x6b\xd3\
+\x8a\xc2\xf8\xf0\x84\xec\x54\x9c\xa4\x3d\x29\x39\xa7\x4a\x5b\x0a\
+\x0d\xc3\x2b\x4c\xb0\x5a\x7f\xf5\xa6\x06\xcc\x8f\x69\xf0\xe0\xd9\
+\x29\x17\x1d\xd4\xd3\x9c\x83\x64\x2f\x1a\xb7\x01\x43\x6f\x10\x53\
+\xf5\x65\x3b\xf6\xf5\x6e\xd7\x30\x7a\x57\x4d\x1d\x21\xa2\x77\x73\
+\x2e\x77\xf1\x3f\xbb\xef\x07\x0e\x22\x7e\x06\x34\xa5\x15\x68\x44\
+\x3c\x3d\xc2\x47\x96\x81\x1b\x51\xc0\xcd\xad\xf4\xe3\x8d\x1b\x32\
+\x05\x5b\xe2\x00\x53\x5f\xc8\x01\x96\xf5\x5e\x68\x5f\xe5\xe1\x9b\
+\x3a\x38\x9a\x30\x35\x7e\xb0\x75\xda\x3f\xb1\x30\x79\x0a\x9d\xca\
+\x34\x70\x4c\xdb\xcc\xf5\x1c\x7c\x23\xd8\xac\xf9\x50\xd4\x94\x3a\
+\x87\xd1\xcb\xd3\x8f\x43\x44\x87\x80\xde\xaa\xfd\x5d\xf6\xc6\xaf\
+\x72\xf1\x85\xaf\xa3\xe3\x07\x87\x8a\x4c\x99\x55\x1b\x0b\x6c\x19\
+\x15\x72\x2d\x65\xcc\x04\xa8\x2a\x1b\x31\xdc\xfd\x32\x7a\xf2\x8f\
+\x5c\x49\xe2\x57\xe0\xef\xd4\x5d\x2f\xdf\x25\xf0\x7b\x4a\x65\xf1\
+\xa0\x8b\x2c\xce\x74\xab\xa5\x69\x64\x79\x12\xbd\x6a\x99\x9a\x48\
+\xda\xbb\x48\x67\x04\x2f\x77\x62\x84\x6f\x07\x9a\xae\x49\x82\xf5\
+\x49\x67\xfc\x36\x93\x5a\xda\x28\xd1\x66\x41\x0e\x0d\x29\x63\x26\
+\x4c\x22\xe8\x34\xf2\xab\x8e\x21\x8f\xad\x37\x2f\xfc\xd1\x15\x1a\
+\xc1\xd2\x39\x4f\xe3\x46\x2e\x99\xcb\xb4\x76\xd6\xbb\xab\xa6\x8b\
+\xe0\xa6\xba\xe1\xe5\x1e\x4b\x9a\xe2\x96\x86\xb3\x11\x24\x4f\x3e\
+\xbd\x37\x82\x3f\x18\x43\x44\x47\x09\x78\x2f\xaa\x47\x15\xbf\xe2\
+\x13\xbd\x6c\xb3\x60\xb8\x9c\xdc\x09\xb7\xee\x89\x49\x34\x13\x60\
+\x59\xbd\x4b\x23\xe5\x69\x39\xac\xf8\x4b\x6d\xa8\x28\xb7\x6d\x96\
+\xd2\x02\x29\x5e\x99\xf0\x83\xf0\xc6\x27\x2c\x11\x9d\xbe\x8d\xa3\
+\x50\xba\xe7\x36\x0c\x55\xf8\x81\xc1\x7c\x77\xe1\x56\x00\xe6\xd9\
+\xde\x2c\xdd\xe2\x2c\x84\x6a\x7f\xe8\xfc\xb7\xb2\x03\x23\x1c\x39\
+\xd6\x95\x9f\x5f\xfd\x93\xbd\xab\xe7\x8d\xdb\x68\xc2\x7f\xc2\x4a\
+\x95\xf7\xc7\x08\x20\x20\xc7\x81\x8a\x34\x0a\x20\x6c\xe3\x42\x80\
+\x91\xb0\x54\x1a\x23\xa5\x91\x2a\xee\x5c\xa6\x48\x61\xbd\x6f\xb3\
+\xee\x0c\x57\x71\xe1\x62\x68\x87\xde\xd2\x45\x20\xff\x99\xf7\xc8\
+\xf9\xd8\x59\x1e\xef\x74\x0a\x38\x3c\x2e\xb5\x0c\x4e\xf2\x9d\x2f\
+\xc9\x91\xb7\x0f\x9f\x99\x67\x9e\x99\x3d\x42\xef\xc2\xb4\x9a\x6b\
+\xf5\x4f\x4d\x4d\x0a\x58\xa1\x85\xa0\x88\xb1\xb7\x24\xd3\xd0\x66\
+\xdc\x8f\xa1\xa6\x62\x6c\xd2\x3e\x18\x78\xb6\x3b\x33\x77\xf2\x72\
+\x88\x4d\x0e\x24\x2f\x37\xf1\x5f\x0c\xfa\x9d\x10\xdf\x0f\x4c\xc1\
+\xd1\x15\x16\xc8\xdc\xa9\xda\x90\x31\x1c\xe8\xfd\x22\x10\x5e\x56\
+\xd9\x27\xc2\x25\x88\x5e\x7d\x00\x3d\x75\xfa\xdb\xe1\x97\x2b\xb6\
+\x32\x92\x1d\xe9\x13\x9d\x4f\xf1\x70\x9c\x04\xd7\x54\xe8\xa5\xdd\
+\x52\x9c\xc3\x74\x15\x70\x97\x6f\xd0\x21\x34\x75\x05\xcb\x8c\x1d\
+\x1d\x68\xbb\x5e\x18\xab\xfb\x5f\xa4\x45\x51\xbd\xb8\xdf\x29\x1c\
+\x27\xec\x40\x50\x2e\x11\x87\x26\x0e\x00\x90\x42\x12\xdf\x1f\xba\
+\xf7\xbe\xaf\xb2\x4f\x84\x0b\xa2\x56\xae\x60\x4d\x5c\xfd\x45\xfc\
+\x06\x92\xa3\x88\x72\x43\x88\xb5\xd6\x0e\x2c\x0d\x70\x60\xdb\x3f\
+\x24\x9d\x45\x48\xe2\x8c\x58\xf2\x37\x46\xe0\xd6\x8d\x86\x6f\x93\
+\x82\x5a\x3d\xe7\xff\x11\x5b\xbf\xe2\xdd\x82\xf3\xdd\x80\xfc\x4b\
+\x59\x3a\x30\x5e\xfb\x5e\x63\xfc\x64\x38\x37\x6b\xf3\xe9\xa6\x46\
+\xf0\xfc\x15\xe1\x12\x44\xaf\xbc\x04\xfc\xc8\x02\xbf\xc0\xa6\x67\
+\x87\x9d\x84\xce\xb1\xeb\x19\x22\xb6\x20\x0a\x4e\x81\x72\x55\xac\
+\x28\xd5\xc2\xb4\x2e\x0d\x96\x87\x87\x70\x71\x93\x20\xb9\x2f\x00\
+\x3b\x52\xac\xb1\x30\x84\xd4\xdf\xe0\x07\x72\xf4\x1e\x36\x5d\x36\
+\xec\x14\x53\x2e\xb1\xbe\x44\x05\x13\x77\x08\x77\x15\xe1\xa2\x63\
+\x15\x05\x6b\xc1\xf2\x55\x9f\xff\xd2\xdc\x39\xaa\xb7\x12\xc9\x51\
+\x71\x88\x1a\x06\x68\x23\x6f\x1a\x0e\x5b\x53\x5b\x2e\x0b\xc9\x10\
+\x73\xdd\x01\xbd\x86\x01\xf1\xa6\x68\x1e\xbc\x58\x53\x24\x4c\xcc\
+\xdc\xc4\xdb\x85\xcc\xad\xad\x41\x55\xb2\xf0\x19\xee\x6f\xca\x9f\
+\x62\x72\x04\xcf\x2f\x65\x15\x54\xad\x37\x80\x9e\x5a\xbe\xea\xa6\
+\x6f\xa0\x9f\x31\x90\xdf\x02\xa5\x5e\x61\x5e\x74\x27\x37\x30\xa0\
+\x61\x26\xc2\x20\xfb\x73\x27\x29\x6f\x22\x67\x71\xdb\xbe\x22\xe7\
+\x5d\x14\x0d\x34\x6f\x9a\xc8\x16\x68\x7f\x61\x56\xae\x65\xa7\xa5\
+\x5e\xed\x06\x1d\xb2\xf7\x5a\x75\x2f\x57\x4f\x1e\x45\x9f\xcf\x2d\
+\x65\x15\x1d\x6b\xad\x01\xf4\xe4\xf2\x55\x1f\x3f\xa3\xc5\x82\x98\
+\x94\xa9\x15\xfb\x82\xa8\x7a\xc3\x33\x30\x78\x87\xdf\x08\x1d\x17\
+\x43\xea\x66\xc8\xb1\xcd\x38\x1b\x37\x5b\xfc\x5b\xc7\xa6\xe1\x68\
+\x7e\xd6\xfa\x35\x4e\xb2\xa3\x50\x9b\x07\xc2\xf3\x76\xa6\x40\xb3\
+\xb9\x04\xc9\x93\x23\x78\x76\x29\xab\x04\xd1\xeb\x0c\xa0\x27\x97\
+\xaf\x48\xbf\xaa\x69\xea\x3a\x2b\xce\x3d\x44\x85\xec\x10\xa4\x8e\
+\xec\x93\x8e\xf7\x3b\x6a\xe8\x5d\x2e\xca\xcb\xbb\x62\xe5\x21\xc0\
+\x9b\xe4\x7d\xb5\x60\xb4\xd6\x65\x67\x47\x53\xa3\x49\xd5\x76\x71\
+\x14\x08\xdd\x19\xe4\x33\xd2\xd6\x68\x3d\x53\xf7\x42\x5c\xf3\x72\
+\xea\xeb\xf4\x7c\x5e\x04\x17\x1d\x6b\x9d\x04\xfc\x9f\xa9\xd7\xe5\
+\x69\x18\x64\x99\xc0\x7b\x74\xd3\x90\x2a\x2e\xc2\x46\xf5\x29\xf0\
+\xac\x2b\xf5\xaf\x36\x23\x60\x6d\xc2\xde\x58\xb9\x09\x3b\x0f\xf6\
+\x67\x48\x96\x4d\xea\x1a\xb5\x05\x83\xbc\x8c\x13\x7f\x80\xba\x87\
+\x13\xad\xed\x45\x95\xb7\x94\x55\x28\x78\x8d\x25\xe0\x47\x93\xe3\
+\xb7\x2f\x09\xf5\x42\x32\x77\x0a\x29\xa5\x99\xb5\x22\xa0\xdd\x18\
+\xa8\x3c\x0c\x2c\xfa\xb2\xf8\xdc\x0c\x6a\xbe\xf5\x88\xf0\xdc\x44\
+\xf2\x6d\xf6\x88\x58\xfa\xbf\x46\x61\x7b\x4d\xf3\xb2\x94\x03\x0c\
+\x41\x5c\xcb\xb0\x2e\x7c\x0f\x96\xa0\x79\x12\xc1\xf4\xd7\x6a\x5e\
+\x29\xab\x60\x6b\x75\x0a\xd6\x4f\x8f\x4c\xf8\x17\xfb\x01\x83\xe4\
+\xb7\x3d\xa9\xd1\xe6\x9e\x18\x30\x4b\x3e\xea\x9c\x04\xd8\xa0\xcb\
+\x49\x61\x9c\x6c\x9b\x21\xcd\x36\xdb\xef\x95\x88\xb8\xd9\x2e\x36\
+\x71\xf4\x5e\x63\x9f\x04\x76\x1d\x3a\x71\x56\x73\xf9\x99\x1b\x9b\
+\xf0\xd6\xe3\x6a\xaa\x2b\x67\x8e\xe0\xa2\x63\xad\x8d\x80\x9f\x5d\
+\x5b\xf0\x2f\xb0\x2a\x8c\x04\xdb\x04\x65\x91\x24\x57\x96\x60\xb8\
+\x96\x91\x18\x42\xd4\xcd\x1e\x65\x6a\x6f\x8c\x7c\xe0\x51\xeb\xd2\
+\x33\xcd\xf7\xc0\x6a\x71\xcd\x71\x73\x2d\x1f\x87\x85\x38\xd2\xd5\
+\x26\x47\xf0\xd9\xbb\x12\x44\x17\x05\xeb\x5f\x97\x8f\xaa\xc9\xd7\
+\xa3\xa7\xc5\xce\x0a\x2e\xa9\x51\xdc\xda\x43\x92\x30\x5a\xb1\x70\
+\x3b\x6e\xdc\xd1\x04\x9a\x7b\x40\x70\x77\x1e\x5c\x1f\x02\x6b\xa7\
+\x07\xce\x86\x68\x37\xa1\x4e\x24\x9e\x79\x4b\xf3\x3c\x1c\x2a\xe6\
+\xfd\x34\x00\x68\x27\xbf\xe3\x9d\x9f\x14\x1d\xab\x28\x58\x0b\x29\
+\x1f\x55\xe7\xef\xa8\xd7\x9e\x7b\x83\x1c\x3b\x13\xb9\x2d\xd7\xd1\
+\xf0\xf4\xa4\xa2\xd3\x1c\x04\xcf\xe6\x50\xd4\xde\xf9\xb7\x3c\xa2\
+\x87\x07\x52\x4b\x2c\x4d\xe0\xa5\x7e\x65\xf2\x45\x83\x34\x2d\x77\
+\x03\xa3\xbf\x4c\x7e\xd1\xe6\x2c\x27\x15\x0a\x5e\x4f\x00\x3d\x7d\
+\xf9\xa8\xaa\xbe\xa5\xde\x5f\xf4\x1e\x03\xf5\xfb\x51\x0e\x4c\xc3\
+\xaa\x9c\x0c\xb0\x41\x99\xab\x1b\x96\x01\x70\x1f\x58\x36\x7b\x19\
+\x76\xa4\x4c\x5c\x0f\x2c\x97\xaa\x92\x45\x06\x6c\xac\x31\xf1\x5c\
+\x69\x4a\x86\xd1\xef\x11\x03\xe8\x3e\xf6\xfe\x34\xfd\x55\x9b\xb3\
+\x9c\x54\x10\xb6\x16\x05\xeb\xe2\xbd\x01\x7e\x1d\x08\x03\xcb\x7c\
+\x0b\x17\x85\x68\x47\xc9\x2f\xb6\x19\x49\x72\x99\x50\x71\xfd\x6f\
+\xc2\xe8\xbb\xa3\xef\x66\x2c\x92\xe6\xa1\x3c\x10\x3b\x80\x69\x48\
+\x2d\x44\x45\xcd\x51\x97\x3f\x5b\xb4\x3f\x4c\x7f\xdd\x66\xec\x6d\
+\x28\x3a\xd6\x5a\x08\xf8\xa5\x05\xff\xd2\x6a\x8f\xbb\x0c\xf5\xad\
+\x3f\x32\x18\x87\xb7\x06\xa4\xc9\x56\x0e\x80\xda\xf5\xf7\xe1\xae\
+\x3e\x34\xc4\xbe\x0f\x9e\x85\x57\x9d\x72\x83\xa1\xb7\x03\x20\x36\
+\x0e\x3b\xb6\x8d\xf1\x84\xcc\xee\xe3\x7f\x9c\xfe\xca\xfd\x73\x55\
+\x82\xe8\xa2\x60\x1d\xb7\xfc\x5b\x55\x5f\x99\x4e\x71\xea\x86\x53\
+\x55\x21\x48\x50\x03\x6a\xec\xcd\x71\x0f\x1e\x8d\x07\xe9\x04\x1e\
+\x88\x83\xaa\x79\xff\x34\xa7\xca\x4a\x6f\xa6\xbf\x76\xa7\x45\xc7\
+\x2a\x0a\xd6\x3d\x8e\x2b\x03\xfc\x9e\x92\x1b\x22\x28\x51\xb7\x77\
+\x73\x90\x90\x0b\x51\xe3\xc5\x74\x72\xab\x75\xe0\x38\x08\x46\x9f\
+\x74\xef\x3d\x01\xbe\xbd\xf0\x90\x0e\x07\x81\xe3\x83\x9a\xc2\x86\
+\xee\xaf\x5f\xe5\x8c\xe0\x42\xc1\xf9\x07\xd0\x66\xf8\xa5\x71\x8e\
+\x64\xb4\x72\xda\xa7\x2c\xad\xc1\x81\x91\xbc\x08\x12\x06\x1e\x25\
+\x4f\x1f\x0e\xe7\x67\x11\x6e\x63\x53\x30\xf0\x00\x3e\x44\xbd\xc1\
+\xf5\x3b\x9b\xcd\xd2\x51\x70\x96\xbb\x82\x35\xf1\xb8\x72\x2e\x00\
+\xa3\xce\x03\xec\xd7\x10\xe3\x22\x45\xcc\xfc\x3b\x46\xd5\xc7\xa6\
+\xdf\xe1\xf0\x4a\x10\xc5\x8d\xb3\xde\x38\x64\x87\xd4\x68\x7c\xea\
+\x5a\x8b\x2b\xf8\xdf\xa2\x63\x15\x02\x3e\xe4\x30\x28\x65\x56\xd5\
+\x1f\x58\x96\x01\x69\xc7\x67\xb2\x0d\x71\x1a\x3b\xbd\xd8\xcf\xba\
+\x82\xd1\xd2\xd1\xd1\x20\xec\x12\x29\x9a\x75\x67\x69\x66\xa0\x36\
+\x62\x27\xda\xb5\x41\x31\x69\x3e\x53\x56\x41\x5a\xd6\x0a\xd6\x53\
+\x83\xb5\xd7\x09\xd0\xdc\x8b\xe7\x08\xae\xdc\xad\xc7\xc2\x74\x92\
+\x03\x2f\xea\x70\x5c\x51\xc2\xe9\x3f\xaa\xe8\x05\xcc\xb9\xbc\x2d\
+\x84\x23\xe1\x0b\x0c\x8a\x49\xd5\xf9\x4c\x08\x2e\x3a\x56\xce\x0a\
+\xd6\x0f\x16\xf8\xbd\x0d\x00\xdc\x96\x40\xe1\x31\x93\x6d\xec\xf5\
+\x91\x49\x73\xac\x68\x2d\x0a\xc3\xb1\x04\x46\x4a\xba\x53\x31\x82\
+\xe3\x09\xd2\x20\xc3\x06\xde\x58\x20\x78\xa6\x29\x1d\x45\xc7\xca\
+\x97\x80\x4d\xf0\x7b\xaa\x42\x4d\x07\x21\xb6\xe4\x71\x1f\xbf\x6e\
+\xe8\x87\xb0\xc4\x03\xe2\x34\x2e\x07\x3a\x4b\xe7\xe7\x12\x4f\x73\
+\xf2\xfe\xca\xe2\x4a\x9e\x14\x0a\x2e\x04\x3c\x3b\x7e\xcf\x48\xb8\
+\x1d\x24\x95\xb1\xde\x0b\x4a\xaf\x02\x05\x91\x05\x86\xd2\x2c\x56\
+\xa5\x9f\x11\x44\xe9\x52\xce\xee\xeb\x7c\x11\x5c\x74\xac\x4c\x15\
+\x2c\x13\xfc\x56\xbf\x47\xc7\x43\x1c\x6d\xe5\xa4\x0b\x8f\x53\x4a\
+\x18\xa0\x7c\x71\xf0\x8d\x28\x0d\x0a\xc6\xf4\x3c\x06\xfd\x6c\x34\
+\xfb\xb9\xca\x17\xc1\x05\x6f\x59\x96\x90\x6c\xf0\xfb\x2d\x35\x19\
+\xc5\xb0\xd9\xb1\x9f\xc9\xc5\x31\x1c\x91\x81\x17\xca\xbf\x34\x46\
+\xd3\xc9\x87\xd4\xf7\x1a\x4e\xe1\x55\x82\xe0\x2c\x5c\xd1\x73\x21\
+\xb8\x50\x70\x8e\x04\x6c\x83\xdf\x5b\xbd\x05\x82\x26\x2c\xc5\x56\
+\xf4\x58\x34\x03\xb3\xd4\xac\x18\x98\x29\x18\x82\x2e\x5a\x3b\xb1\
+\x89\xbe\xc9\x17\xc1\x05\x71\xf9\x29\x58\x36\xf8\x3d\x55\x43\x61\
+\x01\x12\xc2\xe2\xde\xa4\x84\x81\x17\x0e\x61\xc9\x06\x46\x18\x98\
+\x8b\x4a\x32\xe9\xda\xc2\x91\x35\x13\x82\x8b\x8e\x95\x9d\x82\x65\
+\x83\xdf\x73\x1f\xf4\xf0\x46\x00\x08\x2a\x7e\x06\x05\x63\xf4\x6f\
+\x40\x58\xfa\xe1\x5c\xdc\xa6\x81\x3e\xb2\x0b\x03\xdb\x18\xb5\x2c\
+\x41\x7b\x9d\x2d\x82\x4b\x29\x29\x33\x02\xb6\xc1\x6f\xdf\x42\x28\
+\xf2\xac\x4b\xed\x89\xe9\x1e\x07\x79\x1c\xa0\xa7\x54\x0e\x88\x19\
+\x67\x12\x28\x78\x07\xa3\x34\x78\x0e\x04\x17\x0a\xce\x8b\x80\x8d\
+\xf0\x7b\x9b\x6c\xa3\x10\x97\xb9\x14\x65\x74\xe5\x05\x72\xc1\xb0\
+\x8b\x0e\x50\x3d\x44\x3a\x1a\xa7\xa5\x4e\x16\x3e\x66\x8b\xe0\xa2\
+\x63\xe5\xa4\x60\x19\xe1\xf7\x54\xf0\x2b\x40\x1d\x94\x62\x22\xaf\
+\x39\xc8\x87\x83\x59\x8f\xe6\x33\x8a\x1b\x49\x84\xe8\x98\x46\x7c\
+\x3f\xca\x16\xc1\x05\x77\xf9\x94\x90\x8c\xf0\x7b\x96\x14\x50\x65\
+\xd8\x33\x68\xc7\x86\x63\x01\x28\xab\x03\xf4\x20\x7a\x48\xc3\x0c\
+\x5d\x0c\xdb\xfc\xb8\xce\x15\xc1\x85\x82\xb3\x21\x60\x23\xfc\x62\
+\x02\xec\xb8\x7f\x10\x82\x9a\x62\x11\x87\x6e\xb8\xd8\xac\x97\x13\
+\x7c\xa5\xfa\x45\x67\x82\x3e\x68\x07\xda\x1b\xda\xff\x36\x4a\x83\
+\x67\x40\x70\x41\x5e\x26\x04\x6c\x85\xdf\xdb\xd8\x7f\xa7\x48\x4b\
+\xe9\x59\x6e\x6c\x07\xef\x9c\xa4\xac\x91\x0c\x18\x62\x9a\x4c\xf7\
+\xac\x37\xb9\x22\xb8\x50\x70\x1e\x04\x6c\x85\xdf\xd3\x54\xa2\x8d\
+\xa4\x35\xb0\x0f\x2f\xa6\x73\xff\x5e\xc5\x24\x08\x2a\xfc\x8f\x3f\
+\x39\x21\x8e\x1b\x82\x5b\x55\x83\x67\x40\x70\x29\x25\xe5\x50\x42\
+\xb2\xc2\x6f\xf5\x97\x12\x74\x52\xe7\xbf\x8a\xa3\x73\xe3\xde\x5d\
+\x13\x3b\x60\xc7\xeb\xdd\xf1\xd9\xea\x0a\x5b\x77\x17\x96\x52\x52\
+\x06\x25\xa4\x67\x95\x5d\x02\x9c\xc6\xc7\xda\x6f\x35\xe8\xe5\xc9\
+\xf1\x80\x18\x32\x33\x01\xcb\x50\x20\xe5\xed\x70\x86\x69\xb0\x79\
+\x7f\x70\xa1\xe0\xc5\x13\xb0\xc9\xfc\x9c\xee\x78\x1c\xcb\xa4\xa0\
+\x5a\x07\xe3\xc8\x58\x27\x7b\x76\x66\x8a\x60\xf9\xe4\x5a\x82\x86\
+\x24\xe5\xe7\x3a\xd3\x0b\x2b\x04\xbf\x2b\x14\xfc\xb0\x09\xd8\x62\
+\x7e\x5d\xac\x20\x6d\x49\x54\x4e\xd9\x1f\x72\x85\xed\xb8\xa0\xe5\
+\xa4\x3c\x96\xd4\xcc\xf8\x30\xbb\xcc\xc6\x93\xee\xfe\x2c\x08\x5c\
+\xb4\x82\x75\x75\x6d\x17\x40\x2b\x73\x15\x84\x94\x97\x24\x84\xce\
+\x3c\x07\x76\x6a\xba\x66\xd8\x6a\x72\xd6\x7f\x6f\x15\x44\x57\x67\
+\xa5\x94\xf4\x90\x4b\x48\x56\xfa\x68\xf5\x7d\x24\xa3\x41\x3e\x98\
+\xcc\x95\xca\xc7\x7f\xb5\x9f\x82\x21\x24\x04\x9c\x46\x1d\xfd\xb3\
+\xb7\x56\x57\xda\x78\xe2\x7b\x29\x25\x2d\x99\x80\xcd\xf0\x7b\x26\
+\x0b\x3a\x8d\x96\x21\x6c\x71\x71\xee\xe0\x4d\x3d\xd0\xf1\xb4\x18\
+\xd6\xac\xb7\x5f\x67\x8a\xe0\x82\xc1\xe5\x12\xb0\x19\x7e\x37\x01\
+\xb4\x32\x6a\x24\xa6\x7f\xd0\x6b\x1d\xb2\x2f\x21\x85\x08\x53\xd0\
+\xb6\x32\xa7\xb7\x1d\xed\xff\xfc\x77\x95\x27\x82\x0b\x05\x2f\x96\
+\x80\xed\xf0\x7b\xab\xcd\x49\xea\x37\x0c\xe4\x9e\x95\x1c\x4e\x27\
+\xf3\x5b\x7b\xa2\xf2\x49\xbf\x31\xbb\xdc\x8f\xaf\x0a\x05\x3f\x3c\
+\x02\xbe\x78\x61\x47\x09\x03\xf2\x71\x5b\x8d\xc0\x5a\x8c\x5e\x83\
+\x8d\x23\x8c\x9c\xa9\x9a\x11\x8d\x27\x6a\x77\xc3\x34\xdd\x7d\xb4\
+\x50\xf0\x22\x09\xf8\xe2\x7f\x66\xcb\xa9\xfa\x43\xe7\xba\x49\xd6\
+\xab\x28\xd8\xad\x88\x80\x9d\xae\x05\xeb\x2d\x0c\xa3\xb8\xe5\x6c\
+\xb6\x5b\xa1\xe3\xb9\x25\x82\x8b\x9b\x63\x89\x1e\x8e\x1f\x2b\xdb\
+\x00\x5a\x08\x98\xdb\xdf\x39\x84\x86\xb1\x4d\x81\x57\xc2\xc3\x6e\
+\x97\x3b\xd4\x72\xc6\x5d\x7f\xfc\x52\xdc\x1c\x0f\xcb\xc3\xf1\x83\
+\xdd\x5a\x3a\x4b\xf8\xd6\xa5\x85\x60\x58\x1f\x76\xe3\xed\xca\x69\
+\x38\xcb\xa4\x11\x55\x2b\xbe\xb6\xbb\xea\x27\x85\x82\x1f\x12\x01\
+\x1b\xe2\x97\x3c\xd0\x87\x27\x8f\x6b\x39\x60\xab\xd9\x7f\xab\xcf\
+\xff\x6f\xc3\xcb\xfe\x4d\xa1\xe0\x87\x43\xc0\xcf\x0c\x17\xd2\xf7\
+\x43\x74\xea\x3e\xfe\x18\x66\xae\x0d\xbe\x21\x8d\xa1\x77\xa4\xc9\
+\xaf\xed\xae\xbb\x65\x63\x43\xa1\xe0\x65\x11\xf0\x4f\xd7\xa6\x01\
+\x74\x1a\x41\x27\x36\x43\x08\x6b\x3d\xdc\xce\x86\xff\x59\x3c\xd1\
+\xdd\x95\xbf\x29\x14\xfc\x40\x08\xf8\x7a\x96\x00\xda\x6d\x0f\x6b\
+\x77\x69\x4e\xbc\xb2\x08\x1a\x52\xc9\xdd\x81\xf4\x43\xc7\x1e\x8e\
+\x0f\x86\x97\xfe\xb4\x50\xf0\xc3\x28\x21\x3d\x32\x5c\x44\x8f\x13\
+\xad\x2a\x8c\x39\x27\x87\x36\x0e\x1f\xda\x6c\xff\xd9\x7c\xf8\xed\
+\x08\xda\xed\x63\xe8\x17\x79\x22\xb8\xe0\x71\x31\x1e\x8e\x0b\xcb\
+\x25\x74\xee\xe3\x5c\x19\x99\xf3\x36\x74\x09\xc7\xa3\xc7\x40\xde\
+\x47\x7b\x47\x40\x0d\x49\x97\xb0\x0b\x97\x5f\x2c\x6f\x9f\x66\xe5\
+\xe0\xe2\xe6\xb8\xef\x61\x95\xd0\x5c\xbc\x37\x5c\x40\xd5\xaf\x3b\
+\x55\x59\x22\xa8\x84\x7e\xfd\x2a\x62\xe7\x96\xcf\x03\xd2\xaa\xaf\
+\xdb\xde\xc7\xad\x3b\x3e\x5a\x5e\xff\xe7\x85\x82\xd7\x4e\xc0\x96\
+\x05\x24\x19\x63\xb7\xb3\xc2\xa2\x9e\xf9\x56\x48\xd8\xe7\xfa\x4f\
+\x3b\xa4\xe1\x9d\x11\xb4\x3a\x2c\x33\x18\x3b\x43\x47\xa1\xe0\x65\
+\x64\xc0\xa6\xf8\xad\x7e\xdf\xa3\x50\xc1\x48\xe4\xd9\xe6\x4e\xc2\
+\xad\x80\xd8\xdf\x69\xd2\xe2\x1f\x9f\x4c\xbf\x82\x93\x42\xc1\x6b\
+\x26\xe0\x67\xa6\x8b\xe7\x49\xec\xc8\x89\x49\xdf\x1e\x42\xf2\x0c\
+\xe5\x5c\x29\x38\x70\x2c\xd1\xee\xbd\x5b\x0d\xd0\xfc\xda\xf2\x3b\
+\x30\x9b\x92\x55\x28\x78\x01\x04\x7c\x69\x59\x40\xa2\x8d\x54\x46\
+\x47\x42\x0d\x5f\x6d\x25\x84\xf6\x21\x63\x21\x4b\xd3\xae\x1f\x07\
+\xf1\x90\x7f\x8d\x8b\xc1\x86\x33\x76\x0a\x2a\x8f\x4f\xc0\xa6\xe9\
+\xd7\xc0\x43\xe9\x46\x86\x56\xb8\xc1\x5a\x6f\x35\x12\x72\x7c\x50\
+\x08\xdd\x6e\xd7\x83\x21\x0c\x8c\xdf\xea\x7e\xf6\xc1\xf4\x6b\x38\
+\x2d\x14\xbc\x56\x02\xb6\xc5\xef\xe9\x80\x75\xc6\x84\x68\x08\x03\
+\xc8\x7a\x0e\x40\x73\x7c\xf8\xed\xdb\x0f\xec\x10\xe0\xd3\x82\xb8\
+\xed\x17\x61\x55\x4c\x2a\xb8\x3c\x2e\x01\xdb\x16\x90\x58\xc1\x0a\
+\x3b\x20\x1c\xff\xd4\x8e\x15\x50\x73\xa4\x5f\x3a\x07\x82\x73\x7b\
+\xb7\x86\x25\x57\xc1\x56\xc7\xaa\x6e\x0b\x05\xaf\x91\x80\x6d\x05\
+\x68\x9e\x43\x79\x88\xf3\x61\x13\x78\x7a\xcc\x82\xb5\x1e\x94\xd9\
+\xa3\xff\xf4\x9b\x9f\x2d\x1b\x52\x5a\x7a\xe9\x90\xe3\xb5\xed\x77\
+\x71\x52\x28\x78\x7d\x04\xfc\xd4\x76\xcd\x9c\x1f\xae\xfb\x78\xa5\
+\x00\x31\x7e\x3b\x1c\x64\xf5\x50\x22\x96\xf7\xe1\xde\x4a\xdc\x17\
+\xdb\x6f\xe3\x9b\x42\xc1\x6b\x23\xe0\x9f\x8d\x97\xcc\xaf\x77\x56\
+\x50\x22\x7e\x3d\xba\x37\x54\x19\x38\xbf\x0c\x18\xe5\x2b\x8c\x21\
+\xe4\x6c\x5a\xad\x45\xef\xbd\x10\x1f\x6d\xbf\x0d\xa3\xce\xa4\x82\
+\xcd\xe3\x11\xb0\xad\x6e\xb2\xed\xc1\x72\x4a\x83\xd5\xd2\x55\x4c\
+\x1e\xbd\xc8\xb8\x9e\x94\xe9\x9c\x1e\x92\x02\x7b\xfa\x95\x2a\xeb\
+\x6e\xd8\x0c\xac\x46\x09\xd9\xfb\xb1\xac\x8a\x49\x85\x82\x8f\x45\
+\xc0\x17\xc6\xeb\x85\x4a\x48\x6e\xb0\xd3\xc8\x50\xc2\x22\xc8\x7a\
+\x8e\x41\x23\x12\xb2\x4b\x82\x23\x03\xb7\x12\x4a\xa4\x0c\x1c\x76\
+\xd9\x58\xc0\xbe\x94\xb4\xb9\xa3\x5e\x15\x0a\x5e\x0f\x01\x5b\x0b\
+\xd0\x7d\x17\xe1\x21\x23\x67\xda\x98\x00\xb7\x21\x7f\x06\xa6\x88\
+\x1a\x3f\x7f\x1b\xf6\xd8\x43\x63\x38\x32\x47\x5f\xa1\x99\x14\x5d\
+\x28\xf8\x38\x04\x6c\x2c\x40\x77\x7b\x79\x87\x5d\x2e\x0e\x95\xff\
+\x92\xe9\xc1\x13\x6f\xd1\x0b\x41\x72\xc8\x7c\x1e\x42\xb6\x3d\x9e\
+\xb9\x40\xcf\x7c\x00\x00\x20\x00\x49\x44\x41\x54\x19\xb4\x2d\x9f\
+\xd1\xcd\xd6\xa5\xd8\xd6\xb8\x3e\x5b\x7f\x27\xbf\x14\x0a\x5e\x0b\
+\x01\x3f\xb5\x5e\x2b\x4f\x76\x7a\x0c\x07\x0b\xb7\x15\xde\x0d\x5c\
+\x85\x69\xf1\x35\x9f\x95\x12\xed\x49\x8d\x63\x19\xbd\x87\x2e\x75\
+\xf8\x7b\xef\x77\xd9\x2d\xe7\x2c\x25\x55\xd5\x6f\x85\x82\xd7\x41\
+\xc0\xa6\x3d\xe4\x87\x97\x90\x3c\x45\x99\x2d\x45\x9e\x49\x41\x09\
+\x19\x38\x17\x08\x7b\xd4\xe0\x3c\xfd\x50\xde\x14\xcf\xd5\xb1\xe3\
+\x97\x92\x6c\x84\xac\x82\xd0\xf9\x09\xd8\x5a\xc0\x4a\xda\xf8\xf7\
+\x4d\xae\xf0\x81\xe8\x16\x31\xdc\xad\x7e\xcf\xf4\x9b\x97\xa3\xd2\
+\xfb\x90\x32\x30\x46\xcf\x88\xe0\xee\xec\x6e\xc6\x21\xdc\x5e\xce\
+\x57\x4a\xb2\x71\x45\x17\x0a\x9e\x9b\x80\x2f\xde\x5a\xaf\x93\x33\
+\x5e\x91\x9b\x55\xdb\xad\x50\x5c\xbc\xf4\xa4\x7f\x76\x43\x94\x45\
+\xad\x83\x2d\xdb\x1f\x08\x06\x9e\x5a\xf2\xba\x95\x9f\xc3\x03\xef\
+\x39\x31\x8c\x6e\x5b\x9e\xec\x95\x34\x57\x6d\xce\x5a\x2e\x45\x44\
+\xaf\xc2\xf0\xb5\xf5\x37\xf3\xf5\xaa\x50\x70\xf6\x04\xfc\xa3\xf5\
+\x2a\x39\x68\x92\x7b\xdb\x8a\xf4\xdc\x73\x14\x85\xcd\x0c\x83\x96\
+\xe7\x63\x65\xc6\xc0\x14\x46\x07\x85\xe0\x3e\xcc\xd8\x96\xa2\xc7\
+\x28\xf9\x43\x95\xa1\x90\x55\x28\x78\x5e\x02\x36\x17\xb0\xc8\xc3\
+\x91\x04\x87\x5b\xcb\xb5\x45\xac\xb6\xb1\x11\xbe\xa5\xa5\x9f\xe0\
+\x37\x17\x09\x4b\x72\xe0\x21\x03\x7b\x2f\xf6\x8e\x3d\xc8\x95\x6b\
+\x65\x9e\xdc\x58\x78\x2a\x0b\x4a\x67\x25\xe0\x2f\xc7\x25\x60\x5e\
+\xbe\x2a\x6a\xee\x75\x5a\x56\xa1\xe9\xd1\x62\x04\x9d\x07\x84\x03\
+\xde\x8d\x24\x07\x8e\x0c\x1c\x58\x4d\xa7\x9b\x53\x84\xec\xf8\x5c\
+\x12\x7b\x0a\x3e\x2b\x14\x9c\x37\x01\xdb\xdf\xe3\xbf\x1b\x50\x8b\
+\x30\x0e\xf3\xcc\xe6\x37\xe6\x8e\x2d\x4b\xb7\xe2\x81\xe0\x94\x12\
+\xd3\x63\x05\xe8\x05\x3f\xb0\xf0\xa5\x55\xe8\xb6\xe5\x2a\x92\x3e\
+\xc7\x36\xe9\xf2\xf7\xe9\x0d\xed\x92\xae\xcd\xab\x2a\x43\x21\xab\
+\xe0\x74\x36\x02\x36\x9d\x01\xad\xdb\x80\x51\xae\x62\xff\xc2\x4d\
+\x2f\x60\x39\x21\x1e\x1e\x80\xee\x69\x86\x3b\xa3\xd6\x47\x4f\x74\
+\x0f\x00\x84\xc7\xe2\xf5\xab\xc0\xb7\x1c\x89\x1b\x82\xd7\xe7\x48\
+\x59\x7e\x60\x0d\x8b\xc5\xab\x4b\xbc\x1e\x37\x2a\xa8\xfe\x64\xff\
+\xfd\x7c\x2d\x14\x9c\x2f\x01\xdb\x0b\x58\xd2\x06\x0c\x02\x5f\xe8\
+\xfe\xd0\xc1\x77\xf3\x83\x47\x36\x52\xd8\x2c\x79\x22\xf1\x53\xff\
+\x3a\x03\x9a\xc5\xa1\x85\x3b\xb0\x98\x81\xf1\x7e\xc3\xbc\xec\x63\
+\x6a\xd0\xb2\x49\xab\x33\x64\x5d\xe2\x9d\x6c\xfb\x20\x0e\x7e\x6b\
+\xff\x0d\x9d\x14\x0a\xce\x95\x80\x9f\xd9\xaf\x8e\xde\x44\xd9\xad\
+\x51\x5a\xe2\x1b\x7a\x69\xf5\x84\x8d\x6e\x01\x4b\x0b\xad\xc7\xb2\
+\xaf\x66\x60\x66\x30\xce\x1b\x31\x1c\xf5\x7e\xb1\xbf\x63\x16\x2f\
+\x0c\xdc\xd2\x69\x78\xe1\x63\x3c\xd5\x3e\xcb\x47\xf8\x8a\x14\x70\
+\x79\xd9\x47\x26\x97\xac\x72\x7d\x9e\xe1\x2b\xfa\xad\x50\x70\xa6\
+\x04\x7c\x6d\xbf\x38\x9e\x24\x8d\x75\x70\xf3\x7f\xf6\xae\x5e\x47\
+\x8e\xe3\x08\x03\x7e\x06\x4a\x91\x02\x25\x7e\x10\x02\x0b\x48\x10\
+\x45\x80\x64\x40\x01\xa3\x53\xa0\xc0\x80\x01\xa7\x74\xa6\x50\xf0\
+\x13\xf8\x11\x34\x49\xa3\x9c\x49\x99\x12\x03\x3a\x58\x28\x8f\x32\
+\x3a\x31\xf8\x30\xbe\xee\xfa\xef\x99\xe1\xad\xe4\xb9\xba\x5d\xa8\
+\x87\xc7\xbb\x9d\xe9\xf9\xdd\xe9\xea\xef\xab\x9f\xae\xb2\xd9\xbd\
+\x13\x89\x70\xed\xaf\x2c\xaa\x3c\x0d\x18\x44\x43\x04\x43\x60\x66\
+\x9d\x22\x05\xcb\x05\xff\xa5\x90\x49\x54\xa7\x11\x78\xda\x4c\x54\
+\x43\x22\x45\x79\xd2\x55\x95\xde\xdb\xea\x14\x66\x31\x06\x8f\xc1\
+\xdf\x9d\xae\xd0\x90\x35\x64\x35\x03\x80\x5f\x3f\x49\x18\xdd\x81\
+\x94\x3b\x0e\xdb\x67\xc6\x7c\x2b\xb4\xf1\x86\xa3\xae\x90\x63\xad\
+\x04\x81\x39\x08\x4b\x5d\x47\x92\x5c\x87\xc5\x58\x24\xe5\xe2\xfe\
+\x4a\xb4\x15\xdd\xaf\x0c\x39\x46\x9b\xc1\x52\xeb\x00\xea\xe4\x0d\
+\xd3\x2c\xc8\x96\x75\x33\xbb\x14\x1e\x98\xf0\x92\x0e\x9f\x5a\x38\
+\x20\x38\x03\x80\xbf\x3a\xa5\x01\x70\x85\x93\xa9\xd1\xc2\x06\xbc\
+\x96\x2d\xf6\x06\xd5\xd1\x0b\x68\xbe\x52\x54\xd7\x29\x48\x3c\x25\
+\x4f\x05\x10\xf1\x90\x23\x2e\xe8\x2f\x2e\x0a\xb4\x28\x56\x2a\xa1\
+\xcd\x14\x0a\xca\xf8\x0c\xa1\x7e\xe1\x6d\xc3\x5a\xcd\xc2\x33\x43\
+\x17\xe3\x91\x00\xc1\xc7\xc7\x73\x0c\x69\x5d\x2f\x47\xd7\x03\x7e\
+\x79\xca\x01\xe0\x19\xd4\x63\x74\x23\xd6\xd6\xda\xe9\x27\xea\xab\
+\x68\x68\x04\x12\x31\x6c\x08\x0c\xd6\xfd\x65\x83\xf0\x55\x65\xa2\
+\x97\xf4\x57\x74\x75\x41\x60\x7b\x20\x64\xd5\x80\x27\x1a\xfa\x67\
+\xd6\xfc\x59\xa0\x11\x1c\x73\xfd\x48\xdf\x54\x06\x04\x1f\x1e\xcf\
+\x31\x20\x78\xbd\xfc\xf1\xca\xa6\x20\xd5\xe5\x5d\x48\x4f\x67\x31\
+\xfc\x16\x95\x35\x2d\xda\xcd\x79\x0a\xad\xfb\x23\xdd\x5e\x04\xd7\
+\x64\x9c\x11\x0f\xbd\x3c\x3c\xf6\xba\x58\xda\x14\x81\xf5\x7e\x59\
+\x6e\x57\xcf\x59\xff\xcf\x7d\x38\xd6\x0c\x31\x68\x6d\xf9\x25\xe1\
+\x45\x3d\x9f\x07\x04\x5f\x19\x00\x67\x28\xc0\xcf\xd9\x48\xc3\xc1\
+\x90\x62\x6f\x05\x25\x8b\x92\xfa\x0d\x23\x32\x39\x40\x36\x04\x06\
+\x60\x20\x16\xe9\x01\x2f\x41\x97\xb1\xbe\x44\x04\xb6\xe9\xfc\xb0\
+\x7a\x3e\xfb\xac\x73\x18\xda\x17\x72\xa3\x41\x2e\xd5\x14\xdd\xda\
+\x32\x86\xda\xa3\xe3\x39\x3e\x1e\x12\xfb\xa0\x00\xfc\xf0\x53\x90\
+\x14\x80\x67\x9d\x0e\x6b\x31\xbe\xdc\x5b\x67\x95\x4c\xed\xdf\x01\
+\xd6\x02\x02\x8b\xfb\x85\x6d\x5e\x7e\x97\x8b\x59\xdf\x41\x60\x74\
+\x8f\xe7\xb2\x65\xc9\x29\x16\xc7\x9c\xd5\x42\xef\x60\x38\x03\x82\
+\x8f\x8e\xe7\x78\x35\x24\xf6\x41\x01\xf8\x8b\x53\x0e\x00\x87\x28\
+\xca\x3b\x74\x69\x9a\x5d\xac\xf8\x65\x3a\x62\xd7\xc7\xd7\x08\xdc\
+\x41\x9e\x5f\xbd\x98\xf5\x1e\x81\x41\x8c\x6f\x6b\x04\x76\x79\x66\
+\xdd\x97\x82\x21\xe1\x4e\xca\xcc\xfe\x87\x88\xe7\x18\x10\xfc\x90\
+\x00\xfc\x97\x53\x16\x00\x73\xf4\x33\x75\x50\xd0\xc0\x5f\xd9\x1c\
+\xe1\xac\x47\x60\x5d\x73\xca\xaf\x9a\x8b\xc2\x31\xf0\xf8\xeb\x0c\
+\xb5\x2c\xc4\x0e\x78\x03\x02\x7b\x73\x9d\x6c\x9b\x02\x29\xb9\x6d\
+\xac\x7b\xe2\x2d\x0d\xa1\x53\x20\xf8\xf4\xc3\x80\xe0\xab\x01\xe0\
+\x37\x59\x00\x0c\x16\xaa\xc0\xfa\xab\x9f\xd6\x0e\xd6\xd9\x39\x9a\
+\x29\x2c\x3c\x2f\x40\x04\x44\x76\x83\xf5\x31\x8b\x36\x3f\xda\xba\
+\xde\x21\x4a\xd2\x0d\x90\x84\x5e\x76\xe7\xa2\x0f\x88\xd7\x9b\x8f\
+\x42\x5f\x8c\x02\x60\x5d\x53\x35\x05\x82\x9f\x0e\x08\xbe\x16\x00\
+\xfe\x3e\x0b\x80\x35\xa9\x06\xf7\xc7\x1a\xa8\x30\x49\xe1\x3e\xe1\
+\x90\x86\x66\x11\x88\x95\x34\x07\x44\x63\x8e\x6a\xc7\x74\xc0\xfd\
+\x78\xeb\xec\x31\x42\x2f\xb6\x1e\x9f\x51\x4d\x71\xab\xa7\x16\x06\
+\x7e\x0b\x16\x58\x3d\x09\x3c\x63\x16\x04\x3f\x1b\x10\x7c\x1d\x00\
+\x9c\xe2\x01\x26\x0d\xb8\x46\x3f\xc3\xcc\x86\x1a\xc9\x74\xae\x04\
+\xba\xa3\xa2\x2b\xf9\xc5\x40\x36\x95\x7d\xaa\x7c\xe0\x62\x41\xc8\
+\x60\xa8\xf7\x28\xeb\xe8\xfc\xbe\x91\xfa\x07\xa3\x1b\x28\x82\xbb\
+\xa7\x44\x31\x3e\x83\x18\xb0\xf0\x06\x43\xde\xce\x14\x08\x3e\x58\
+\x0d\x1e\x10\xfc\x40\x51\x94\x5f\xa6\x74\x86\x1a\x84\x05\xb8\xb0\
+\xee\x2b\x1e\x12\xe1\xd3\x13\x65\x9f\x54\xcb\x8f\x23\xa2\xb6\x28\
+\x4b\x5d\x8c\xb7\xfa\x28\x08\x3b\xcc\x94\xcd\xd4\x75\xbe\x67\x54\
+\x9e\x00\xfe\x29\x6c\x9e\x83\x7f\x48\x89\x87\x76\x0a\x43\x3b\x19\
+\xb9\x7f\x35\x41\x18\x4a\xac\x0b\x85\x68\x7d\x97\x33\xe6\xfe\x30\
+\x20\xf8\x0a\xa2\x28\x9f\xe4\x08\x30\x27\xc6\x11\xfd\x8e\x9c\xbe\
+\x77\x1c\xf1\x86\x33\xd4\xcd\xd6\xc7\x7b\xe3\x55\x34\xf8\x44\xab\
+\x90\xf4\x7d\x89\xd7\xea\xe5\x29\x73\x3d\x9a\xd8\xb0\x33\x58\xe9\
+\x7f\xa7\xcb\xcb\xc0\x13\x19\xb6\x77\xb3\x49\x15\x0a\xb3\x45\xb7\
+\xc1\x2f\xe7\x9d\x1d\xab\x06\x0f\xb9\x7d\x10\x00\xfe\x3e\x0b\x80\
+\x25\xee\xea\xb6\x42\x09\x4c\x75\xd6\xe0\xad\x2f\x39\x08\x1b\x90\
+\x15\x8d\x58\x61\xb6\x5e\xec\xf1\x1e\xa3\x75\x77\x8f\x93\x19\xeb\
+\xde\xb4\x66\xaa\xae\xe1\x71\x20\xd8\xe8\xf0\x3a\xd2\x6f\x9a\x3e\
+\x39\xf3\x24\xe1\xa5\x8d\x71\xcd\x45\x5e\xbf\x37\x0a\x77\x49\x82\
+\xe0\x63\xeb\xad\x8c\x78\xca\x87\x00\xe0\x1c\x05\x98\x01\xb8\xc5\
+\x05\x4a\xa8\xef\x6d\x23\xc3\x8d\x3c\x4f\xb5\x6b\x82\x29\xb9\xf7\
+\xe8\xc0\x0e\x82\x23\xe4\x79\x23\x6f\xb4\x1e\x65\xac\x07\x05\x5d\
+\x54\xdd\xad\x9b\x5c\xfc\xa3\x46\xac\xb6\x2f\x40\x75\xe0\x9b\x25\
+\x06\x53\x42\xd6\xa4\xa4\xc3\xd5\xe0\x21\xb9\xc7\x03\xf0\xf4\x36\
+\x4d\x03\x46\xc9\xf4\x3c\x69\x18\xa4\xcd\x04\x5e\x9c\xa3\x65\x67\
+\x89\x6a\x2e\xac\x14\x64\xb7\xc7\xda\xad\x94\xb4\x8e\x18\xc5\x7b\
+\xf7\x56\x77\xb9\x85\xfa\x97\x1a\xd8\x36\x12\x0d\x53\xfb\xf2\xe6\
+\xba\xcf\x54\xd5\x0e\xc8\x83\xe0\x43\x83\xa2\x07\x04\x1f\x0f\xc0\
+\x49\x0a\xf0\xe9\xc7\x1a\x8d\x70\xc3\x19\xdd\x24\x0a\x7a\x96\x99\
+\xb1\x7d\x6f\x3e\x73\x59\x49\x4b\x38\x41\xf6\xfa\xce\x1d\x6e\xdd\
+\xe4\x72\xdf\x63\xa1\xcc\xf1\xd7\x8a\x68\x6c\x87\x26\x47\x5c\xfd\
+\xe2\x4e\x57\xa8\x06\x0f\xd9\x3d\x1a\x80\xff\x91\xd4\x0d\x9e\x49\
+\xc8\x14\x4d\xff\x85\x59\x33\x5e\x59\x25\xa4\x0e\x9f\x16\xd8\xc1\
+\xe1\xf3\x05\xbd\xdf\xe5\x41\xd6\x7b\xb1\xec\xd5\x5d\x0f\xcb\x51\
+\x7f\xdf\x7e\x4c\x3d\xd8\xdb\x08\xda\xea\xd4\xac\x7e\xc0\x44\x26\
+\xc9\x76\x71\xfa\xcf\x80\xe0\xcb\x05\xe0\xaf\x93\x3a\x41\x4d\x45\
+\xc9\xc6\x67\x26\xcc\x9c\x73\xf2\xa6\x89\xf2\x1d\x39\x5c\xb9\x51\
+\x36\xa3\x15\xc1\x6f\x5e\xa1\xda\x26\x09\x5f\xe3\xfb\xb1\xeb\x6b\
+\xf1\xed\x25\x31\x8c\x35\x61\x2d\x3c\x95\x33\xc6\xa1\x44\x7d\x23\
+\x19\xad\x60\x9e\x39\x91\x7d\x35\x20\xcc\x34\xa3\xe9\xe7\xac\x77\
+\xf7\xe1\x80\xe0\x8b\x0d\xe2\x78\x93\xc5\xc3\xc8\xf7\x3b\x83\x54\
+\x08\xd5\xc9\x83\x8b\x84\x1d\x79\xbb\xd4\x36\xbe\xee\xc0\x95\x8f\
+\xe7\xd0\x23\x53\xb0\x77\x8b\xf7\x6e\xb4\x6f\x33\xef\x80\xce\x9b\
+\xa6\x77\x32\x5c\xe1\xad\x25\xb2\xe7\xd2\x51\x6c\x4a\xf8\x7b\xd2\
+\xcb\xfb\x64\x40\xf0\x85\x46\x51\xbe\xce\x52\x80\x4f\x1f\x59\xd4\
+\xf3\xdc\xb2\x3d\xa1\x38\x95\x28\x5e\x01\xcf\x5a\x96\x5f\xa1\x1b\
+\xab\xb1\xfa\xa1\xd7\xb1\xe7\x07\x6b\xd9\x3d\xc3\x8e\xb5\xf9\x68\
+\x77\x78\x4b\x91\x93\x4d\x84\x6f\x38\x2f\x8f\x24\xe6\x49\x28\xd3\
+\xc0\xcb\xa7\xc7\xa5\xc8\x1a\xc1\x1c\x47\x02\xf0\x17\xa7\x3c\x00\
+\x5e\xb4\xec\x1e\x39\x4c\x9a\x61\x75\xd6\x9a\x5f\x67\xa8\xb0\x3d\
+\x87\x5d\x60\x5b\x41\x3e\xdf\x06\xf6\xff\x2f\x67\x90\xeb\x6d\x0f\
+\xb5\x7f\xbc\x5d\x16\x6e\x16\xab\x45\x13\xed\x54\x61\x9e\xb9\x2e\
+\x5a\xda\xf8\x7b\x60\x8a\xac\x11\x4f\x79\x1c\x00\xff\xf9\x94\x09\
+\xc0\x9a\xd7\x99\x2b\x97\x49\x8a\x49\x5c\x16\xc0\xb1\x6c\x4a\x3d\
+\xa7\xa0\x25\xcd\x83\x71\x9f\x82\xd9\x9a\x0c\xa7\x41\xf0\x81\x33\
+\x0b\x5f\x0d\x00\xbe\x3a\x0f\x52\xad\x07\x4c\xc5\x09\x4c\x64\x29\
+\xeb\xa2\x14\x3c\x82\xb1\xc4\xa5\x88\x1a\x8c\x9a\x79\x93\xf3\x86\
+\xc9\x64\xc3\xf6\xd5\xbd\x49\xa3\x50\x03\x82\x2f\xce\x87\x94\x93\
+\x44\xa7\x2d\xdf\x70\x79\xb2\x50\x68\x93\xd3\xc2\x92\x85\x66\x2c\
+\xdb\x2a\xb1\xcc\x62\x90\xba\x6e\xac\x13\x4b\x7d\x96\x7f\xa5\xbd\
+\xc2\xff\x0e\x33\xd6\xa5\xf9\x90\x5e\xa6\xbd\xfc\xe7\xec\xe5\x55\
+\x15\x98\x83\xb2\x1a\x35\xac\x20\x33\x10\x77\x0f\x81\x49\x25\x9e\
+\x16\x94\x1a\xe1\xcb\xa2\x05\x1a\xab\x24\xbf\x4d\x7b\x89\x1f\x0e\
+\x4f\xd2\x85\x05\x71\xe4\xbd\xfb\xcf\xac\x3c\x19\x41\x08\x85\x40\
+\x83\x10\xc1\x21\xaf\xfb\x0b\xfb\x8d\x68\x16\xa1\x5a\xb6\xb8\xa8\
+\x30\x66\xc5\x53\x1e\xea\x4b\x7a\x31\x00\xf8\x08\x02\xfd\x6d\xda\
+\xab\x3f\x51\x8f\x83\x79\xb6\x2a\xd7\x77\xdd\x70\x92\x12\x48\x63\
+\xb9\x87\x4e\x2f\x24\xc6\x52\x01\xbc\x7d\x22\xbb\x56\x5a\x3c\xe5\
+\xa1\xbe\xa4\x01\xc0\xd7\xe4\x41\x6a\x51\x94\xa2\xcc\x69\x89\x32\
+\x99\x1c\x27\xd6\xe9\xb1\xec\x43\xb0\x4c\x2f\x5c\x34\x3a\xcd\xd5\
+\x49\xcb\x33\x64\x1c\xe7\x4b\xfa\x3d\x43\xf0\x51\x3e\xa4\x2f\xf3\
+\xde\x3b\x15\xf4\x26\xa7\x48\x43\xe1\x16\xb8\x21\xa6\xd4\x89\x75\
+\xbd\xb2\x02\x9e\xba\xc9\x6f\xb6\xf5\xf6\xbb\x6f\x8e\x3b\xe9\x2e\
+\xfe\xf4\x87\xad\x87\x1b\xe8\xff\xf7\x77\xb5\x6a\xef\x6f\x73\xeb\
+\xc9\xec\x58\x8e\xba\x5a\x24\x34\x8b\xe6\x5d\xa2\x94\x78\xfb\x39\
+\xf1\x45\xce\x03\x82\x2f\xc6\x87\xf4\x24\xef\xb5\x3f\x15\x17\x12\
+\xa7\xb2\x93\xf2\x3f\xec\x22\x59\x5a\x27\xad\x66\x9b\xee\x87\x4c\
+\x38\xba\x41\xad\x3b\x66\xe3\x59\x1f\x25\x4d\xb2\xa3\x3f\x97\xfc\
+\xd6\x96\xdf\xde\xce\xd6\x25\xfd\xe0\x2d\x4f\xfd\xb3\xac\xac\x53\
+\xb6\xd1\x9f\xd7\x5d\x31\x3e\x74\x91\x3a\xe0\x5c\x2c\x9c\x32\x11\
+\xcd\x20\x95\x4a\x33\xdf\xe4\x9f\x86\x27\xe9\x42\x00\xf8\xab\xc4\
+\x71\xfb\xa3\x45\x1c\x45\x34\x0b\x98\xaa\xed\xf1\x8c\xf5\xf3\x43\
+\x38\xcc\x34\x1b\xcc\xb4\x17\xb1\xdc\x77\x3f\x7b\xc2\x7e\xae\x4b\
+\xc9\x28\x8c\x78\xcd\x91\x93\xcd\x66\x06\x73\x1c\x47\xa2\x5f\x0d\
+\x00\xbe\x96\x10\xac\x1a\xc4\x81\x44\x9d\x25\xc3\x13\xd7\x28\x68\
+\x31\xf9\xf5\x7f\xc1\x1d\x3f\x52\x59\x77\x79\xdf\xf9\xb7\x0f\x51\
+\x28\xdb\x70\xcb\x6c\xed\xfc\xdb\xda\x8b\x0e\x23\xf1\xde\xea\x7a\
+\x77\xf9\x82\xa1\x3d\x48\x75\x7f\xde\x82\xfb\xf1\x9a\x13\x3b\x90\
+\xb8\xf0\x28\x25\xd7\xa9\x52\xfc\x26\xf1\x65\xfe\x6d\x40\xf0\x45\
+\x98\xb0\x32\xdf\xf9\x3b\xe4\xf9\x46\x56\x27\x68\x42\x4e\x63\x57\
+\x3f\xb1\x38\xac\x19\xb4\xf4\xfb\x8e\x41\x7b\x00\xde\xe4\xdd\x41\
+\xcb\x74\x0d\x9e\x11\x7b\x62\x7c\x46\xbb\x0a\x5f\xc7\xa9\x3b\xa9\
+\x8b\xba\xeb\xea\x96\x6c\x77\x25\xfb\xd0\x3d\x7d\x7f\xef\xb4\x8d\
+\xf5\x0f\x9e\xcb\x25\x35\x5a\x26\xfe\x5e\x7f\x49\x7c\x99\x4f\x07\
+\x04\x5f\x80\x0f\x29\x31\x04\xab\xf9\x90\x28\xf2\x80\xcb\x30\x90\
+\xfb\x17\x66\xe9\x8f\x65\x97\x75\x06\x9c\xd5\x6e\xef\xad\x3e\xbb\
+\x18\xbc\x81\xea\x25\x00\x1d\xae\x30\xfc\x7d\xed\x6a\x59\xda\x62\
+\xc0\x2a\x82\xb8\x47\x26\xfc\xbd\xbb\xa1\x02\x36\x2c\x5e\x51\xc7\
+\x47\x3f\x3e\x50\x65\xf0\xa9\x8d\x82\x0b\x52\x52\x6d\x8a\x2e\xcf\
+\x7c\x9b\x9f\x0d\x33\xd6\xe3\x03\xf0\xcb\xcc\x37\xfe\x6c\x91\x50\
+\xa2\xa9\xfd\x23\xbf\xd1\xdc\xe6\xc5\x51\x10\x96\x87\x24\xeb\xef\
+\x08\x8a\x8c\xa5\xd7\x24\x03\xd2\xe1\xca\x96\xeb\xa0\xd1\x99\x76\
+\xa3\xc0\xf8\x95\x7b\xdb\xed\x84\x6e\xf7\x62\x77\x18\xe9\xf3\xda\
+\xea\x65\x27\x0b\xb2\xdf\x9b\xdc\xe2\x67\x70\x56\xeb\x5a\xd9\x5b\
+\x72\xe6\xd6\xef\xb0\x99\xb0\x38\xc5\x67\xaa\x27\xe9\xb0\x80\xac\
+\x17\x03\x80\xaf\x83\x40\x57\x1f\x12\xcf\x9e\xd1\xca\xa0\x1a\x19\
+\x58\xb7\xb4\x9e\x5a\x7b\x2d\x75\x74\x45\x2a\x4f\x64\x8b\x27\xb6\
+\xdc\xe2\xdb\xda\x6f\x2f\x3c\x77\xbf\xf8\x44\xd2\x4c\x2d\x85\x37\
+\x99\x70\x9c\xd1\xee\xaf\x0c\xbc\x87\x77\x03\x15\xe7\x05\x92\x86\
+\xe2\x4e\x0e\xc1\x4b\x44\x67\xe2\x5f\x25\x98\xbd\xfb\xcf\xfc\x3c\
+\xf5\x13\x19\x0d\x10\x39\x1b\x60\x9c\x73\x98\xe9\x49\x3a\x2c\x20\
+\x6b\x00\xf0\xa5\xa7\x81\x16\x1f\x12\x00\xb9\x7e\x09\x3e\x24\x7f\
+\xec\x82\x33\x65\xd1\xa0\xee\x4a\xc2\xa7\xbf\x0b\x44\x25\xd8\x7b\
+\x4a\xb9\x51\x25\x81\x7f\xb7\xa5\xc8\x0e\x72\x56\xd4\x66\x06\x38\
+\x53\x33\xed\xb4\xf7\xb4\xf3\x00\x13\xf7\x50\x81\x73\xa3\x0d\x5f\
+\xb2\xa0\xbf\x6c\x71\xa3\x8a\xe3\xc6\x82\xe9\xf2\x98\x75\x1f\xf7\
+\x39\xfa\x95\xef\x7e\x6b\xee\xbf\xc6\x65\xac\x72\x61\x33\xe9\x3f\
+\x49\xa5\x54\x03\x82\x1f\xd7\x87\x94\x4a\xa0\x4f\xdf\x2c\x96\x1b\
+\x8a\xec\xa6\x0b\x4d\x60\xa0\x42\xa2\x85\x31\x37\xba\x41\x15\x79\
+\x40\xc5\x40\x05\x9c\xc5\xbd\x04\xed\x93\x37\x91\x70\xab\x0c\xf8\
+\xe6\xc0\xaf\xe5\x22\xe7\xb4\x33\xca\x2a\x1c\x02\x83\xae\x08\x74\
+\x3b\xae\x98\xfe\x5b\x82\xae\xae\xe3\x90\x13\x6f\x1b\x81\xaa\x8f\
+\x57\x4e\x5e\xbf\x21\xfd\xac\x34\x43\x9e\x08\x5a\xee\x83\x36\xf6\
+\x85\x2c\x00\x94\xbf\xe0\x9f\xa7\xeb\x23\xd1\xbf\x43\x33\xd6\x1f\
+\xae\x90\x40\x7f\x42\x33\x16\x26\xf6\xf8\x4e\x6c\x41\xd5\x1a\x9a\
+\x10\x24\xd2\x84\x11\xd6\xa1\x0e\x45\xd1\xc9\xf3\x4d\xaf\x7d\x0a\
+\x40\x7a\xcb\x93\x1b\x1a\x4a\x80\xcd\x82\x25\x9a\x89\xba\x76\x1f\
+\x51\x01\x06\xfb\x22\xc5\x20\xb2\xdb\x4e\xa1\x2b\x9e\xc0\x17\xe5\
+\xe4\x4e\xcb\x8e\xda\xad\x32\x73\xb9\x21\x65\x0e\xe1\xc9\xe8\x1a\
+\x0b\x95\x5c\x01\x4e\x8d\xc5\x79\x39\xda\x2c\x87\x37\x57\x48\xa2\
+\x3f\x1e\x00\x7c\xe9\x73\x18\xee\x96\xcf\x17\x4d\xcd\x38\x2d\x9c\
+\x7b\x6e\x42\xce\xa6\x33\xf7\xf6\x59\x91\x17\xea\xcd\xac\x22\x9a\
+\xc5\xd9\xd0\x2c\xd8\x9a\x9c\xd7\x49\x44\xb7\x60\x2f\x81\x05\xdd\
+\xd0\x50\x82\x75\x78\xb3\xbd\x78\xdd\xd5\xb8\xbb\x9d\xd4\xef\x51\
+\x9c\xd1\xcd\x71\x83\x8a\x90\xaa\x1a\xd3\x6d\x61\x67\xff\x5a\xf9\
+\xb7\xcd\xb3\x6c\x5f\x46\x3d\x78\x06\x0e\x82\x01\x76\xbd\xf9\xda\
+\x32\xf0\xd3\xe9\xfa\x48\xf4\xef\x0f\x82\xaf\x90\x40\x9f\x5a\xf7\
+\x9a\xc9\x00\x43\x99\x28\x43\xcd\x20\xee\xd4\xbd\xed\xd6\x00\xb8\
+\x04\x1e\x6a\x42\x22\x92\x83\x4e\xe8\x91\x0d\x4a\x2e\x08\x52\xcf\
+\x6b\xb2\x15\xd7\xcb\x6e\xbb\x09\x77\x61\x71\x52\xa6\x60\xaa\x79\
+\xf1\x3c\xde\xab\xb7\x7a\x9b\xcc\xc3\x8b\x8f\xb1\x44\x2f\xcb\xce\
+\x14\xe6\x14\x86\x12\x5d\x4d\x55\x09\x56\xbd\xa3\xe1\xf0\xcc\xdf\
+\x2a\x97\x68\xcd\x7d\xab\x1f\x0c\x33\xd6\xa3\x99\xb0\xde\xa6\xbe\
+\xe9\x4f\x17\xca\xac\xe8\x52\x3d\xb3\x03\x93\x36\x09\xd3\x6c\xfc\
+\xb5\xb0\xc9\xb7\x29\x98\xc2\x71\x8b\x90\x4b\x35\xde\x3a\xad\xd5\
+\x70\xaa\x88\x69\x58\x04\x13\xc1\x8b\xa7\xc5\x68\x40\x88\xd4\x30\
+\xe3\x73\xdf\x5e\xf8\x96\xda\x18\x52\x4a\x6f\x60\x2e\x7e\x37\xb4\
+\xd1\x40\xc5\xd3\x11\x85\xbb\x5d\xea\x50\x44\x4f\x25\x77\x55\x77\
+\x2d\x2e\xdc\x43\xc7\x27\xdb\x28\x5f\x8b\xd1\x84\x99\x1d\x49\x4b\
+\x9f\xf2\x72\xc9\xe5\x55\xcf\x87\x19\xeb\x91\x00\x38\x99\x40\x9f\
+\x3e\x72\xa5\x7b\x5d\x85\x3e\xa2\xd1\x80\xce\x93\xe2\xe4\x4a\x91\
+\xd3\xd1\xe7\x12\xc4\xae\x58\xaf\x76\x0c\xda\x49\xae\x3a\x90\x54\
+\x38\x8c\x91\x82\x1b\x0a\x1c\x67\xef\xda\xbb\x60\xa8\xba\x47\xb1\
+\xbb\x90\x46\xba\x6e\x09\xde\x1f\x8f\xc0\x42\x16\xb0\xa0\x87\x74\
+\x6f\x9c\x43\xe5\x00\xe8\xef\xd9\x5f\xbc\x7d\x9a\xcd\x7a\x35\xfb\
+\xaa\x87\x8d\xd4\x24\x9b\xb1\x0e\x9a\x1a\x3c\x00\xf8\x92\x27\x01\
+\x5b\x18\x34\x72\x61\x6a\x60\xc7\x91\xcc\x20\x9c\x20\x82\xa8\x39\
+\x77\x9d\x5b\xa5\xa8\xa0\x78\x70\xda\x8e\xbc\x74\x52\xe3\x84\x28\
+\x1e\x12\x8f\x7d\x4f\x7b\x90\xb7\x82\xde\x84\xe5\x01\xdc\x69\xda\
+\x81\xda\x07\xe1\x87\x40\x1f\x00\x4c\xbb\x97\xcd\x05\x3a\x07\x77\
+\x07\xce\xe4\x0b\x26\x77\xba\xe8\xc1\xca\x6a\x6a\x70\xcc\x9b\xdc\
+\x37\xfb\xd7\x01\xc1\x8f\x62\xc2\xca\x25\xd0\xa7\x77\x68\xe2\x8a\
+\xa4\x0d\x53\x0c\x16\x49\x72\x89\x52\x69\x88\xa9\x30\xd5\xc7\x26\
+\x6f\x08\x9e\xe3\xd0\x1d\x64\x76\x62\x50\x30\x9e\x13\xa2\x90\xf7\
+\xed\x7a\x67\xa5\xdf\xbd\x17\xb2\xee\x01\x36\x2e\x8c\xd1\x4a\xb7\
+\xf9\x68\x4e\x11\xef\x87\x1e\xa5\xf9\xe4\x8c\x6b\x42\x4b\xdf\xe4\
+\x24\x35\x96\x52\x03\xa2\x0f\x23\xd1\xc3\x87\x74\xd9\x04\xfa\x04\
+\x0c\x1a\xc6\xa3\xdb\x1c\x60\xd5\xdf\xfa\xee\xdf\x21\xf0\xca\xad\
+\xb3\x29\x33\xfd\xa6\x3d\x09\x46\x87\xe5\xfb\x3f\xef\x41\x60\x53\
+\xd4\xb1\x93\xd8\x4e\x5a\x57\xd0\xef\x86\x03\x8f\xc0\x72\x36\xe7\
+\x4b\xda\xfa\x51\x03\x5f\xa3\x31\x88\x1c\x50\x4e\x83\xa2\xc2\x71\
+\xf2\xab\x7d\x36\x3c\x49\xf9\x00\x9c\x6c\x81\x3e\x7d\xea\xaa\x12\
+\x4c\x28\xbd\xae\x49\x74\xfd\x5c\xb6\x78\x70\xc0\x57\x10\xb5\x73\
+\x25\xac\xeb\x43\x5d\xe3\x0e\x46\x77\x87\xde\xd7\x8e\x7b\x83\x44\
+\x38\x7b\x74\x20\x6d\x0f\x09\x71\x1f\x73\x12\x07\xc6\x7e\x1f\x02\
+\x37\x4b\x9a\x15\x77\xa0\xb9\x84\xc0\xfe\xa5\xbb\xf5\xec\xc1\xf9\
+\x83\xe1\x49\x4a\x37\x61\x25\x13\xe8\x3a\x93\x9f\x8c\xce\x13\xf7\
+\xb7\x19\xac\x7a\xd9\xb4\xcf\x73\xd1\x83\xe9\xaf\x86\xd1\xe2\xdc\
+\x52\x5b\x72\xbe\xc1\xab\x77\xdb\x3b\x39\xde\x64\x00\xbd\x85\x7c\
+\x53\xea\xfb\x2d\xab\xcb\xdc\x8b\xc0\x62\xb8\x9a\x54\x03\xa1\x78\
+\x4a\x1e\x14\x97\x64\x33\xd6\x31\x24\x7a\x98\xb0\x2e\x36\x06\x5a\
+\x4d\x58\xef\x49\x7d\xec\x61\xb2\x38\x83\x8e\x63\xd4\x0d\xb0\x36\
+\x7a\x74\x69\x9b\x4b\x6c\x14\xa7\x0b\x1d\x04\xd6\xee\x4e\x1c\xdc\
+\x37\x2a\xf3\xeb\xf6\x12\x9c\x39\xbc\xcd\x61\xa8\x5e\xda\xdf\x7a\
+\x77\x4d\x76\x81\x15\x35\x57\x49\x93\xcc\xbd\xb0\x6b\xcb\xc3\xc6\
+\x1b\x12\xe7\x93\xb4\xad\xf3\x7c\x28\x08\x97\x6c\x33\xd6\x21\x24\
+\xfa\xc5\x00\xe0\xf3\x97\xaf\x93\x5f\xf0\xe9\x73\xab\x0e\x42\x96\
+\x2c\xfe\x45\x16\x54\x64\x51\xa3\x1f\x10\x97\x0b\x87\x0c\xf3\x36\
+\x76\x18\xd5\x75\x5d\xd8\xaf\xaa\x3f\x2a\x2a\x2a\xd7\x1c\x44\x2c\
+\xed\xec\xe9\xe1\x13\x39\xf9\xe7\xeb\xb1\x3b\x97\x68\x2a\xb7\xcb\
+\x45\x5d\x58\x75\xbb\x19\x11\x3e\x39\xb5\xdc\x1f\xe8\x79\x84\x0c\
+\xeb\x31\xfc\x18\x7e\x5f\xa2\xe1\x6e\xc4\x40\xf1\x75\xa3\xdc\x90\
+\xb5\x5a\x6c\x65\x11\xb5\x77\x66\x23\x56\xa8\x55\xfa\x53\xf6\xfb\
+\xfd\x70\x40\x70\x2a\x00\x67\x8f\xd0\xa7\x1f\x17\x51\xd1\xac\x12\
+\xdf\xec\xa3\x9c\xed\x47\x5d\x46\xdc\x9f\x79\x9b\x09\x46\x48\xf2\
+\xa8\x12\xd7\x7e\x9c\x18\xa3\x46\x63\x35\x09\x40\x95\x0d\xf7\x59\
+\x56\xf5\x7a\xea\xc3\xa1\x13\xe8\xee\x3c\x0a\x14\x3f\x9c\x70\xc4\
+\x94\x17\x7c\x3d\x95\xee\x03\xfe\x18\x12\x49\x94\xb8\x50\x1e\x5d\
+\xfc\xcd\x80\xca\x6a\xb1\x91\x03\xed\x56\xdd\x08\x37\xc3\x0c\x36\
+\x28\x52\x6c\xb9\x5a\xf6\xff\x9d\xfd\x7e\x3f\x19\x10\x9c\x68\xc2\
+\x7a\x9d\x4d\xa0\x65\x22\xa1\x73\xfc\x0a\xa3\x6e\x51\xd0\x0c\x66\
+\xdc\x69\x05\xfc\x8a\xce\xc9\xd5\xb8\x46\xda\xc7\x2d\x32\x09\x8f\
+\x3d\xb3\xca\x2e\xff\xc7\xde\xb5\xb4\xca\x71\x5c\x61\xc8\x3f\xb8\
+\xa0\x48\xc4\x96\xc1\x9b\xfc\x10\x41\x87\x1b\xc9\x1e\x90\x83\xb1\
+\x43\x0b\x2d\xbc\xc8\x0f\x30\x5c\x2f\xe2\x24\x8b\x40\x08\x84\x28\
+\x8b\x40\x76\xd1\xc6\xa0\x26\x70\x7c\x36\x02\x89\x40\x50\x16\x82\
+\x80\xa4\xa3\xf6\xc2\x30\x26\x04\xbb\xff\x4b\x6e\x57\xd5\x79\x55\
+\xf7\xe8\x71\x7b\x66\xea\xde\x3b\xd5\x18\x3c\x57\xf4\x6b\xa6\xea\
+\xd4\xf7\x9d\xef\x3c\x8a\xc1\x38\xde\x3b\xe5\x4f\x89\xa5\xa1\x2c\
+\x0a\xfc\x21\x3d\x8f\x84\x09\xc4\xc7\x50\x12\x8c\xe2\xc9\x82\x8d\
+\xe9\x4c\xad\x83\xd0\x47\x45\xa4\x26\x34\x46\xcc\xd7\xc8\x6a\x43\
+\x69\x3d\x62\xc2\x80\x4a\x9b\xed\x95\x52\x53\xa8\x6b\x84\xb9\x95\
+\x5d\xc7\xfa\x2e\xdf\x83\xf8\x4a\x73\xf1\x48\xf4\x81\xc8\x58\x3f\
+\xba\x80\x04\x7a\xdc\xd0\x4c\x8f\x04\x13\xc2\xa6\x53\x69\x8e\x52\
+\x51\x06\x3f\x62\x5b\x0e\x76\xc1\x29\x19\xde\xfd\x13\x23\x49\x93\
+\x5a\xb9\x2f\xf3\x5f\x44\x46\x60\xb4\xcf\x10\x42\x8b\xe6\x79\xc6\
+\xa8\xb9\x8a\x20\xb1\x5f\xd2\x65\x05\x15\xf5\x49\x1c\x5b\xb6\x70\
+\xee\x1c\x20\xc6\xcf\xf2\x39\xaa\xad\xda\xe2\x28\x79\x86\x24\x89\
+\xc5\xcb\xcc\xe2\x82\x8e\xa5\xbb\xbe\x78\x9d\x61\x35\xa9\xc2\x3f\
+\xae\x94\xcf\x9a\x0b\x48\xa2\xdf\xaf\x0c\xfa\x9c\x12\xe8\x95\xc8\
+\xcd\xc6\x01\x16\x55\x0b\x8c\x69\x24\xce\x0a\x62\x1b\x42\x94\x09\
+\xd8\x4a\x1c\x04\x93\x80\x67\x6a\xe5\x01\x6c\x78\x7a\x2b\xf6\x81\
+\x2d\x94\x31\x48\xa3\x7f\x1e\x0a\xe4\x03\x38\x27\x18\xc0\x2c\x33\
+\x62\x73\x9c\x88\xe1\xde\x50\x12\xaa\x81\x79\xb1\x2c\x4b\x68\xde\
+\x9f\x11\x9b\xbd\x5d\xf6\xde\x81\xeb\x8c\x25\x25\x4b\xde\xdc\x2e\
+\x56\xe3\x29\xad\xe3\xd0\xe6\xe3\x3e\x37\x3a\xdb\x1e\x89\x3e\x0c\
+\x08\x5e\xfe\x3b\x3d\xd8\xfb\xea\x7c\x2b\xf9\xbc\xc6\x6e\x4f\x61\
+\x02\x38\x05\x41\x10\x90\x18\xa9\xd0\x88\x56\x00\x8a\x6f\x1c\x02\
+\xf5\x5d\x96\x19\x46\xd9\xaa\xd4\x4a\xd3\xc9\xa2\x21\x19\xb1\x0c\
+\xc4\xa2\x72\xc4\x67\x32\xeb\x9c\x60\x94\xfb\x4a\x51\x11\x07\xb9\
+\x12\xb7\xe6\x85\x42\x57\x19\x34\xa7\xb3\xe1\x9a\xf7\x37\xce\xad\
+\x45\xe0\xf4\x9d\x41\x51\x1e\xd5\x31\x47\x71\xc9\x81\x6c\xf0\x57\
+\x3d\xe2\x94\x1e\x53\x60\x90\xab\x8c\xb5\x1f\x00\xde\x3f\x81\x6e\
+\xee\x4f\x3b\x3f\x42\x2c\x40\x1a\xab\x64\x41\x10\x10\x64\xde\x83\
+\xe8\x43\x88\x68\x9c\x59\xf6\x1d\x9d\x1f\xcc\xae\x31\x09\x33\x06\
+\x15\x97\x05\xa6\x0d\x02\xb3\x5d\x03\x88\x4b\x6a\x11\x1f\x54\xeb\
+\x26\x26\xb4\xc0\x55\x4a\xc6\x3f\x96\x3b\x27\x83\x4f\x9f\x79\xb9\
+\x21\xb1\x3f\x63\xb8\x46\x44\xa7\x09\x02\xb3\xa7\x8e\x28\x84\xd9\
+\xfc\x1f\xc1\x7e\x1b\x78\x65\x37\xf8\xfe\xc5\xfe\x47\xf9\x8f\x55\
+\xc6\xda\x0b\x00\xef\x5d\xdf\x68\x6e\xe4\x3b\x55\xb3\xda\xd2\xa3\
+\xf4\x80\x92\x18\xaf\x44\x3e\xad\x64\xc5\x49\x58\xe2\x09\xbb\x1e\
+\x1d\x69\x72\x4b\x34\x48\x00\x59\x33\x1e\x39\x90\x23\xa2\x52\x8a\
+\x42\x69\x91\x90\x5d\x41\x40\x7a\x51\x25\x2b\x53\x85\x0c\xa4\xb8\
+\x50\x05\xb6\xf4\xf6\x49\xac\xe6\x10\x30\x18\xb7\x95\x14\xf5\xb5\
+\xe7\x16\x7b\xbb\x82\xc0\x4a\x00\x18\x81\x31\xb7\x5f\x75\xfb\x89\
+\x33\xa2\xe7\xe3\xea\x7d\x81\x61\xae\x10\xbc\x0f\x09\xeb\xee\xfe\
+\x97\xe6\x1f\x5e\x95\xc3\x21\x60\x29\x81\x4f\x9d\xaf\x9a\x65\xa8\
+\x01\x15\x03\x8f\x82\x6d\x3c\xff\x41\x92\x36\x14\x90\xe5\x5f\x4d\
+\x80\x08\xa4\x60\x3f\x59\x0b\xeb\x51\xe4\x92\x46\x98\x4a\xb3\x2e\
+\x4d\x7a\x8d\x79\x14\xbf\x3d\x03\x3f\x98\x64\x10\x83\xc0\xc4\xf9\
+\x21\xbc\x08\xb0\xc0\xed\x11\x98\xfb\x6f\x78\x04\x56\xd7\xdb\x22\
+\xf0\x2b\x7e\xd5\xbd\x57\x34\x6c\xa7\x2c\xe9\xf2\xcb\x58\x8b\x63\
+\x48\x77\xf6\x3f\xae\xcd\x6b\xf6\x9f\x37\x21\x59\x14\x7b\x44\x27\
+\xf3\x28\x6e\xa2\x2b\x06\x90\xa4\x0d\x64\x93\x30\x5d\x1d\xf9\x64\
+\xf1\x81\x0d\x83\x56\x43\x12\xbe\xca\x31\x20\xc9\xdf\xe2\x18\xae\
+\xda\xaf\xb8\xa6\x72\x53\xf5\x6f\x59\x13\xe3\xec\x30\x9f\x2d\xe2\
+\x84\x65\x56\xa9\x01\x1c\x02\x83\x09\x7f\x81\x46\x83\x3d\x02\xeb\
+\xd7\x9b\x49\xc7\xb2\x72\x16\x15\x18\xe8\xc7\x55\xc6\xda\x35\x83\
+\xfe\x64\xff\xcc\xaa\xb9\xf9\x4a\x00\x56\xc6\x98\x66\x33\xa9\x70\
+\x25\xe6\xcd\xd8\x23\xf0\x28\x41\x63\x14\x07\x57\xf0\x8d\xef\xe1\
+\x11\x18\x5d\xa0\x99\xe5\x27\x83\xc0\xc4\x71\x20\xf0\x08\x2c\x09\
+\x20\x22\x7a\x99\x9b\x0a\x2a\x92\xfc\x41\xf2\xe2\x60\x34\x64\x02\
+\xcd\x2a\xd3\xe0\x15\x83\xb7\x3a\xb8\x4c\xf8\x85\x93\x6b\x04\x5b\
+\xd8\x03\x7b\xed\x2e\x7f\x52\xd4\x2c\xde\x4a\xb8\xc0\x48\x2f\xdf\
+\xb1\xb0\x4a\x58\xe7\xab\x8a\x3f\x06\x81\xc9\x84\x90\xe2\x96\x0c\
+\x06\x2a\xb8\xe0\x1e\xc4\x4e\x54\xcb\x11\xad\x48\x0a\x01\x32\x4c\
+\x62\xb3\x56\xe5\x96\x50\xae\x10\x44\x17\x13\x91\x13\xc9\x09\xbd\
+\x64\xc2\x57\xa8\x81\x67\x54\xbf\x15\x20\x47\x60\x36\xa3\xb4\x24\
+\xe8\xcb\x90\x52\x07\x93\xab\x01\xaa\x42\x1b\x26\xac\x7e\x03\xf2\
+\xb7\xb4\xc4\x03\xf5\x55\x14\xd6\xd9\xdf\xe6\x25\xa5\xa5\x79\x1c\
+\x2e\x10\x0a\xde\x02\x89\xbe\x5d\x01\xf8\x7c\x15\x21\x8d\xc7\x3c\
+\x00\x77\x39\x02\x4b\x68\x87\x8c\x25\x11\xe7\x40\x68\xe2\x95\xf3\
+\x0a\x89\x45\x69\xce\xe0\x12\xf3\xb7\x46\x48\x26\x81\x0b\x45\x07\
+\x4b\x81\x5f\xf0\xb9\x22\x92\x4d\x21\xe8\x97\xfc\x5b\x90\x1e\x99\
+\xfe\xa6\xc4\x8b\x48\x4a\xf6\x50\x96\x2b\x6a\x1c\xb8\xcb\x81\x6b\
+\x8a\xec\xfa\x83\x46\xf8\x62\xbc\x66\xca\x2f\x5f\x51\x52\xa3\xa5\
+\xfa\x83\x68\xb3\x17\x5c\x60\xa8\x57\x55\xc6\xda\xad\x84\xf5\x87\
+\x02\x83\xfa\x81\xf1\xce\xda\xc9\xf6\x7c\x46\x3b\xd6\x39\x6d\x94\
+\x1a\x43\xb0\x09\x2d\x02\xda\x30\x92\x84\x96\x48\x3e\x1b\x5b\x44\
+\x10\xc5\x69\x12\x83\x62\x30\x43\x13\x17\x12\x62\xed\xd2\x36\xf5\
+\xd2\xfc\xa6\xf6\xb5\xf5\xcd\xd0\xfc\xa1\x1e\xb4\x81\x72\x10\x65\
+\x3d\xfb\x93\x72\xf7\xdf\xa1\x39\x28\xeb\x0f\x97\xcc\xfd\xb4\x51\
+\xf2\x7f\x54\x62\xb0\x2b\x04\xef\x52\xc2\xfa\xa8\xc0\x90\x36\xd7\
+\x4d\x08\x18\x72\xaa\x67\x6d\x55\x0d\x46\x2c\x4f\xad\x80\x26\x06\
+\xc5\x7e\xaa\xcd\xb0\xb0\xea\xb4\xb9\x29\x1a\xc1\x5a\x50\x31\xa1\
+\xa1\xd2\x69\x20\x0b\xd5\x72\x63\xe2\x13\x95\xbf\x9a\xc8\xb2\xd5\
+\xb0\x6d\xb7\x49\xeb\x99\x93\xae\x41\xf2\x34\x74\x4b\x93\x5d\x94\
+\xf8\x3b\x99\x35\x85\xfc\xd7\x51\x12\x0f\xfc\xa3\xb6\xf1\xa7\x6d\
+\x6d\xc1\xd7\xd3\x12\xa3\x7d\xb5\xca\x58\x3b\x04\xe0\x93\x02\x23\
+\x7a\xec\xea\x90\x22\x7b\x86\x38\xc9\x50\x6b\x75\x04\x46\x15\x43\
+\x0d\x3a\x12\xda\x8f\x1a\x90\x51\x7c\x92\xd0\x0c\xb2\x7a\x4b\x0a\
+\xea\x5a\x7c\x6b\xc1\x55\x0b\x85\x35\xf2\x24\x7a\x92\x92\x02\x75\
+\x48\x45\xba\xb6\xbe\x38\xa1\x41\x6e\xb4\x18\x2c\x6b\x0a\xa9\xfe\
+\xe4\x2e\xd1\xba\x60\x49\x90\x44\x13\xa2\x06\x1b\xa9\x32\x55\xc9\
+\x56\x7d\x4b\x09\x63\x2d\x71\x59\x48\x68\x90\xdf\x45\x6b\xee\x8b\
+\x0c\x77\x8d\x24\xed\x4e\xc2\xfa\xb8\xc4\x92\x7c\x2b\xba\x9b\x2d\
+\xb5\xa3\xdd\x86\xff\x9d\xe2\x71\x87\xe2\x32\x5a\x80\x15\x2a\x6c\
+\xd2\x2a\x66\xd8\xac\xfd\x07\x72\x54\xd5\x7d\x30\x31\x19\x9b\x3d\
+\x85\x80\xe6\x04\xa3\x95\x19\x8e\x0e\xd6\xbb\x35\x90\x8e\x13\x42\
+\xad\x66\x6f\xec\xce\x70\x63\xca\xdf\xc1\xaf\x1f\x39\x53\x30\x1e\
+\x81\xd2\x69\xcc\x59\xbf\x79\x56\xd8\x96\xb5\x4b\x2e\x7d\x1f\x33\
+\xa4\x53\x91\xc3\x83\x12\xe3\xfd\x5d\xe5\xd0\xbb\x92\xb0\x7e\x59\
+\x62\x3c\x9b\x7b\xbd\xd9\x1d\x84\x5b\xaf\x86\xf0\x6b\xa7\x30\xa9\
+\x9a\xab\x90\x4b\x09\xbe\x4a\x07\x8b\x09\xfb\x95\x76\xe7\x0a\xdc\
+\x24\x22\x2d\x2a\xfa\xb1\x64\xcb\x28\xa7\xf5\x83\x7c\x23\xb4\x60\
+\x0b\xb6\xca\x48\x17\x02\x71\x7c\x8d\xd0\x8d\x66\x35\x70\xf2\xb2\
+\xf1\x69\xc9\x64\x75\xa2\xa1\xe4\xa4\x41\x27\x3d\x13\x7d\x7a\xa8\
+\xc9\x01\xd5\xec\x34\x43\x53\x78\x9b\x26\x82\xa4\xee\x77\x76\x23\
+\xa8\xe7\x45\x06\xfc\x71\x95\xb1\x76\x03\xc0\x25\x42\xc0\xb1\x12\
+\x98\x5b\x46\xa4\x6e\x58\x5c\xf8\x96\x7b\xb7\x68\x94\x63\x9c\x02\
+\x8e\xc1\x2b\xca\x31\x90\x9c\x3c\x44\xc6\xe7\xcd\x28\x33\x99\xa0\
+\xb3\x4d\xa7\x50\x29\x5a\x39\x31\x99\x80\x30\x99\x78\x90\x35\x56\
+\x14\x73\x53\x5e\x0d\xd6\xac\x8d\xdf\x8c\x36\x8d\x9a\x32\x4d\xca\
+\x65\x82\x38\x15\xdd\x30\x7f\xb4\xdf\x52\xd4\xfb\xe0\xf1\xc6\xde\
+\xbb\x1d\xb8\xac\xd5\x32\x23\xfe\xab\x0a\xc1\x3b\x91\xb0\x3e\x2d\
+\xb2\x1e\xff\x40\xba\x8f\x6e\x67\x76\x25\xe9\x4c\x8b\x0b\x6b\xa4\
+\x46\xec\xf5\xa2\x34\xc2\x44\xa1\xd6\x7d\xcf\x6c\x4a\x86\x0d\xa5\
+\xa2\xa2\x27\x78\x71\x0a\x7c\x1c\xc8\xc9\x5a\x9e\x71\x4f\x69\xb9\
+\x7b\x27\xf4\xe5\x09\xa4\x44\xdb\xa9\xe5\xd9\x3a\x44\x4e\xa7\x9e\
+\xe1\xd8\x66\x55\x81\xcc\xc2\xf5\x26\x52\xd7\x28\x41\xb9\x80\xc1\
+\x52\x25\xfc\x4d\x91\x21\xff\xa2\xca\x58\x3b\x91\xb0\xd6\x45\x46\
+\xf3\x49\x40\x94\x24\x92\x46\x80\x68\xc7\x39\x06\x1a\xdd\xb5\xed\
+\xda\xdc\xd1\xf3\x21\x6a\xf5\xb4\x14\xe9\x0d\x0e\xb2\x26\x40\xf9\
+\x82\x80\x30\x7d\x30\x41\x5e\x32\x94\x83\xb9\xbb\x64\xe6\xa5\x70\
+\xde\xa8\x69\xe2\xaf\xa3\x37\x68\x80\x69\xe4\x0a\xfd\x85\xd9\xa2\
+\x11\xbc\x5e\x34\x05\x1e\x49\xe5\x6b\x4f\x3f\xbf\x2c\x32\xe4\xab\
+\x2a\x63\xed\x82\x41\x3f\x6a\xca\x30\x68\x16\x49\xa1\x8d\x00\xc1\
+\x0d\x1d\x3b\x8f\xaa\x6e\x92\x8e\x72\x4c\xdf\x7f\xfd\xa7\xa3\xa3\
+\x6b\xd7\xae\x1d\x1d\xfd\xe4\xcf\x78\xfa\x67\x0e\xc0\x98\x03\x24\
+\x5a\x9f\x35\x13\xc1\xd0\xc1\x30\xce\x5a\x1e\x65\xc5\x89\x06\x73\
+\x29\xbf\x92\xbc\xa8\x65\x83\x4d\x1a\x1f\xca\xbf\x21\xe6\xb7\x70\
+\x66\x4b\x19\xa9\x30\x5e\xc5\xe4\x1c\xf7\x25\x12\xf0\x42\x94\x07\
+\xa3\xa0\xd5\x86\xff\xfa\x22\x1c\x7a\x69\x30\xf8\xb2\x72\xe8\x0b\
+\x57\x05\x1c\x19\xb4\xee\xc0\xdb\x26\x92\xd7\x62\x12\xa1\x27\xe9\
+\x8a\xfc\xa9\xef\x5f\xfe\xf5\xda\xc8\x18\xd6\xc3\x30\x04\xe6\xf0\
+\xdf\xa3\xbf\xf7\xbd\x2f\x70\xb0\x9a\x90\x23\xb6\x64\x91\xdd\x1b\
+\x32\x5a\xff\x57\x35\x24\x25\xde\x34\xf1\xb7\xad\x30\x8e\x96\xe3\
+\xd3\x04\xad\x35\xe8\x4b\x00\xf3\x29\x29\xe8\xdd\x04\xf4\xf7\xa0\
+\xcd\x34\xc2\x47\x95\xd4\xb9\x8e\x7d\x05\x92\x13\xdc\x05\xae\x93\
+\x7e\xec\xd1\x9a\xcb\x70\xe8\xa5\xc1\xe0\x0a\xc0\xe7\x24\x04\x3c\
+\x32\xe8\x71\x2e\xd9\x6d\xe8\x51\x3a\xd4\xe1\x26\x96\xdb\xf7\x0f\
+\x7f\xd7\x34\x83\x3f\xd6\xcd\xf1\xd1\x93\x1e\x37\xa1\xe7\xbc\xc3\
+\x3a\x73\xca\xeb\x38\x38\xce\xfc\x39\x69\xa5\xe7\x5d\x65\xcc\x9f\
+\x96\x65\x8c\xe1\xdc\x39\x5e\x3c\xb3\x09\x22\x19\x5c\x53\x8e\xdc\
+\xb9\x6a\x00\x5d\x64\x37\x6d\x8a\x00\x77\x4c\x76\x0a\x95\x24\x2d\
+\x0f\x06\x5f\x4e\x08\x5e\x26\x61\xdd\x6d\x0a\x31\xe8\xa4\x5b\xb5\
+\x5d\xc4\x05\xb3\x69\xb7\x76\x9e\x74\x79\x0f\x3d\xfd\xfe\x24\xb7\
+\x5e\xb6\xe1\xcf\xef\xf5\x1b\x08\x30\x3a\xf0\xa5\x5c\xfc\x31\x04\
+\x57\xbc\x4b\xad\x5d\xf2\x68\x3b\xdf\xfe\xd2\xba\xd0\xe4\x38\xb3\
+\x2d\x80\x9a\xe6\x8c\xd1\x4c\xe7\x10\xf3\x30\x57\xdc\xac\xf1\x2f\
+\x07\xd4\xe4\xbc\xe1\x7c\x91\x89\x32\x56\x1b\x7f\x5c\x6e\x17\xd0\
+\xb2\x47\x5c\x86\x43\x2f\x0c\x06\x5f\x4a\x19\x6b\x99\x84\x75\xa7\
+\xcc\x38\x8e\xdd\x28\x59\x79\x86\x88\x11\x31\xa4\x04\xdc\xd1\x66\
+\x22\x29\xf5\x0f\x37\x98\x6f\x32\xe1\x27\xe4\xa7\x32\xda\x54\x68\
+\x67\x49\xe8\x3d\x53\x65\xde\x33\x01\xa8\x89\x18\xae\x16\x67\x1b\
+\x50\xce\x80\x3b\x66\xe7\x4f\x84\x73\x9c\x64\x98\x98\x84\x2d\xda\
+\xe8\x93\xd3\x3c\x91\x20\xe5\xfa\x12\x16\xd6\xc6\x9e\xd1\x88\x93\
+\x64\xd8\x8d\x2c\xe7\x59\xa1\x81\xef\xaa\x8c\xb5\x4d\x06\xfd\x49\
+\xa1\x85\xb8\x49\x19\xba\x5d\x4a\x18\x0a\x81\xca\x71\xf6\x8d\x1a\
+\xcb\x1c\x7f\xc5\xe7\xef\x6d\x36\xdf\x60\xc2\xab\x77\xb5\x89\x56\
+\xe6\x6a\xd2\x46\x22\x4c\x9b\xd8\x3a\x6e\x60\xb5\x9b\xfd\x51\x9c\
+\xa3\xef\x38\xb5\xfb\xc9\xd9\xb4\xe1\xc6\xb4\x49\xc8\x9e\xc8\x66\
+\xb4\xf9\x94\x60\xaf\x7d\x64\xd1\x29\x53\xa6\x85\x10\x1f\x2e\x34\
+\xf0\x3f\xaf\x1c\x7a\x9b\x12\xd6\x47\x85\x86\xf1\x06\x6f\x3b\xd4\
+\x71\x93\x29\x88\x4e\xda\xbc\xfd\x42\xff\x70\x3d\xbc\xee\x68\xbe\
+\x7d\x42\x50\x0f\x77\x9c\xae\x90\x5d\xf8\x4d\x23\xee\x86\x28\x52\
+\x6a\x49\x52\x6a\xe9\xbe\x5a\x65\xac\x2d\x32\xe8\x93\x52\x0c\x3a\
+\x20\x43\x0b\x09\x7c\x43\x15\x43\xa7\xb5\xf9\x39\x3d\xa4\xf7\x56\
+\xc3\xeb\x8f\xf5\xf1\x3b\xd5\x82\xf3\x9f\xae\xb3\x3b\x37\xb5\x5d\
+\xec\xc3\x37\xba\x2a\xa5\x38\xf4\x71\x85\xe0\xed\x49\x58\x85\x14\
+\xac\x91\x41\xa7\xdc\xe7\x48\x00\x5b\x29\xc6\xe9\x66\xf8\x20\x3e\
+\x3f\x79\x13\xfb\x1d\x41\xf8\xdd\xbe\xda\x6c\xb6\xc1\x4c\x48\xc1\
+\x8a\xb8\xdb\x06\xc6\x33\x12\x1d\x28\xc7\xa1\x97\xe9\x58\xbf\xa8\
+\x0c\xfa\x1c\x28\x58\x23\x83\x4e\x79\xfa\xed\x18\xdb\xa0\x98\xbe\
+\xd1\xf9\x24\x49\xa1\xcf\x2f\x4e\x86\x37\x3d\x9a\x5f\x57\x0b\x9e\
+\x24\x6d\x51\xcc\xde\xe8\xc2\x1f\x23\xa7\x0e\x52\x43\x5f\x8a\x43\
+\x2f\x2b\x6a\xa8\x12\xd6\x39\x50\xb0\x42\x1e\x74\x97\x92\x82\x62\
+\xe1\x4c\x1b\x8d\xb7\xa5\x09\x00\xe3\x57\xeb\xe1\xcd\x8f\xf5\xb7\
+\xd5\x82\xed\xc1\xeb\xe2\xa9\x11\xc7\xb0\xf0\x68\xbf\x61\xc5\x2c\
+\xa6\x43\x2f\x2b\x6a\xb8\x5d\x01\xb8\xb8\x82\x15\x18\x34\x91\x66\
+\x18\xb4\x29\x59\x68\x0e\x80\xfb\xaf\x9a\x61\xa8\x16\xbc\xc4\x82\
+\x93\x67\x12\x3a\x03\xb6\x28\x5b\xa2\x16\xe3\xd0\xcd\x8f\x2b\x04\
+\x6f\x45\xc2\x3a\x29\xca\xa0\xa5\xa3\x86\x74\x9b\xc1\x99\x88\xc8\
+\xdb\xe1\x6f\xb5\xe0\x99\x40\x52\x58\x28\x51\xaa\xa6\x43\x4d\x70\
+\x0b\xe5\x72\x39\x16\xea\x58\x97\x2b\x14\xbc\x44\xc2\xfa\xb8\x29\
+\xc7\xa0\x83\x3a\x1a\x67\x54\x97\xb6\xf1\x0d\x1a\x69\x1e\x43\xc2\
+\xa7\x6f\x6b\xbf\xa7\x16\xfc\xbf\xaa\x45\x67\xc1\x67\x92\x74\x68\
+\x6e\xe9\x37\x66\xb1\x7e\x53\x6c\x02\x7c\x57\x65\xac\xe5\x0c\xba\
+\x98\x82\x95\x2a\x09\xbb\x54\xda\x26\x32\x0b\xcd\x64\x33\x3d\x7f\
+\x7b\xfb\x3d\xb5\xe0\xdf\x54\x0b\x36\xf6\xdb\xa6\x5c\xb7\xd1\x3b\
+\x19\x65\x07\x6a\x53\x97\x8f\x97\xe5\x66\x40\x57\x39\xf4\x52\x09\
+\xab\x9c\x82\x95\x34\xe8\x98\xb3\x41\x09\x1d\x20\x95\x04\xfb\xd9\
+\xf7\xf2\x64\x38\xcb\xb1\xfe\xb2\x5a\xb0\x45\xe0\x4e\xc8\x73\x5c\
+\x20\xdb\xa8\x3b\x94\xe3\xd0\x8b\xf2\xb1\x2e\x93\x8c\xb5\x60\x21\
+\xfb\xac\xdc\xf2\xfb\x21\x49\x2f\x73\x62\x29\xda\x6e\x22\xa2\x02\
+\xd6\x95\xe1\x6c\xc7\xfa\x7a\x35\x5c\x9b\x93\x19\x34\xac\x2e\x71\
+\xe7\x96\x7b\x5e\xe2\x7f\xca\xcd\x81\xab\x15\x82\x17\x4a\x58\x27\
+\xe5\x06\xef\x5e\xd2\x9b\x63\xe2\x64\xb2\xe6\x36\x38\xc3\x1e\x3b\
+\xfe\xbd\x3a\xa3\x01\x0f\xc7\x4f\xaa\xdd\x6a\x2e\x47\x1b\x7f\xe8\
+\x0e\x52\x9a\x4c\x6a\x61\x04\xcf\xcb\xcd\x81\xe3\x2a\x63\x2d\x63\
+\xd0\x77\x0b\x8e\x5d\x4a\x27\x68\x63\x70\x63\xf4\xd1\x5a\xbf\xef\
+\x01\x0b\xd0\x67\xb6\xdf\x61\xb8\x51\x49\xb4\x2b\x54\x0a\xbf\x6d\
+\x17\xb7\x08\xef\xc2\xa7\x51\x88\x2e\xb8\x8a\x7f\x51\x39\xf4\x22\
+\x09\xab\xdc\xc8\x35\xb7\xc8\xed\xb8\x67\x76\xdb\xf5\x1a\xf4\x99\
+\x04\xac\x2a\x64\xcd\x59\x30\xc5\xe4\x2b\xde\xc1\x4d\xf6\x36\x7c\
+\x50\x70\x1a\x54\x0e\xbd\x04\x80\x1f\x15\x1c\xb9\xeb\xa6\x09\x34\
+\xf1\xa6\x03\x38\x55\xa0\xaf\x0c\x4b\x8e\xea\x06\x1b\x19\x6b\x4c\
+\xc2\x4a\x3b\x07\x87\x26\xd1\xbc\x45\xfa\xd3\x82\xd3\xe0\x83\x0a\
+\xc1\x3f\xbd\x88\x0a\x56\xb3\x22\x34\xdd\xa0\xda\x91\xcd\x8d\x3a\
+\x69\x97\xed\x4c\x86\xff\x5c\x2d\x32\xe0\xe1\xb8\x5a\xae\x20\x70\
+\x9b\xc0\x77\x64\xcf\x41\x86\x86\x40\xa3\x11\xd7\x05\x27\xc2\xd5\
+\x83\x0f\x05\x9f\x7d\x09\xbb\x52\x72\xe5\xa5\xd8\x68\x3c\x94\xf2\
+\xc7\x4c\xe8\x8e\xfb\xbf\x58\x02\x3d\x2c\x3c\xd6\xdf\x57\x12\x2d\
+\x08\x3c\x82\x6f\x17\xcc\x37\x76\xe3\x4e\x1b\x89\x63\x49\x26\xb6\
+\x20\x25\xfa\xfd\x03\x67\xd0\x9f\x36\x85\x19\xb4\x80\x41\x4b\xbc\
+\x3d\x19\xe2\x36\x09\x74\xb0\xe0\xfb\xd5\x76\xc5\x82\x03\xd1\xe1\
+\x96\xdb\xec\x03\x03\x95\xe4\xd0\x0b\x74\xac\xdb\x07\x0e\xc0\x25\
+\x89\x53\xd3\x87\xce\x39\x41\x57\xa1\x84\xc0\x69\x6f\x3d\x8b\x98\
+\xff\x58\x2d\x36\xe0\xaa\x44\x9b\x50\x52\x07\x9c\x27\x33\x3a\xc1\
+\x10\x15\x43\x82\xbe\xe4\x4c\x58\x1d\xb6\x8c\x75\xf6\x20\x70\x49\
+\xed\xb1\xb9\x49\xc9\x52\x63\x63\x17\x8c\x3e\x70\x42\x08\x39\xbe\
+\x5e\x2f\xb7\xdf\x61\xfd\x65\x35\x5d\x41\xe0\xe4\x03\x63\xf2\x81\
+\x63\x37\x14\xc0\xbf\x95\x9c\x0b\x3f\x3b\x68\x0e\x5d\xed\x7f\x29\
+\x00\x00\x20\x00\x49\x44\x41\x54\x7d\x66\x06\x7d\xa7\xe4\x98\x35\
+\xbf\x4d\x9b\x4f\x63\x62\xd1\xd1\x07\xee\xd0\xb9\xc0\xf8\x97\x61\
+\x2b\xc7\xbf\xaa\xf1\x86\x63\xec\xc9\xe1\x7c\x60\xe2\xc6\xef\xcf\
+\x8a\x4e\x86\xc7\x87\x2c\x63\x5d\xc0\x24\xe8\x58\xc8\x90\x2c\x35\
+\x4a\xa3\x9d\xdb\xab\x97\x8f\x17\xab\xed\x18\xf0\xf7\xd5\x76\x6d\
+\x2c\xd8\xef\x8c\x38\xe6\x67\x95\x2c\x68\x58\x94\x12\x7d\xc0\x00\
+\xfc\x59\xd1\x21\xbb\x11\x37\xeb\x6d\x47\xf3\x35\x3e\x70\xb6\x4f\
+\xe0\x95\xed\xd8\xef\xb0\xbe\x57\x2d\x97\x53\x37\x52\xfa\x79\xd8\
+\x2e\x38\xa6\xb0\x76\x45\x8b\x82\x97\x85\x92\x2e\xbe\x8c\x75\xe6\
+\x20\xf0\x49\xd1\x11\xfb\x70\xa4\x6f\x21\xe3\x8a\x52\xe4\x88\x22\
+\xaf\xb3\x08\xfc\x74\x4b\x00\x3c\x0c\x37\xab\x8e\xc5\x2c\x3a\x0a\
+\x0d\xc4\xd9\x95\x29\x05\xae\x64\x41\xc3\xb8\x9e\x1f\x2e\x87\xbe\
+\x90\x21\xa4\xa6\xb9\x9f\xd2\xe9\x29\x55\x11\x42\xd8\xd0\xcc\xa7\
+\x61\x6d\x0d\x80\x6b\x3e\x96\x3a\xc1\xd0\xa5\x74\xac\xd4\xdb\x3d\
+\x6e\x22\x47\x65\x03\x49\x0b\x42\x49\x07\xcb\xa0\x8b\x86\x90\x9a\
+\x95\x28\x58\xb1\x0a\xa9\x93\xf9\x85\xbb\x00\xe0\x1a\x4a\x32\x4a\
+\x34\x72\x00\x38\xe1\x6f\x28\x68\x80\xbe\xf0\x84\x38\x54\x0e\x7d\
+\x21\x43\x48\x63\x1a\x16\x4a\x76\x5f\x60\xd2\x69\xd7\x5a\x1b\x45\
+\xda\x22\x00\x57\x08\x76\x0c\x9a\x28\xf6\x94\x8d\x3d\x2a\x63\x09\
+\x49\xd1\x64\xac\x25\xa1\xa4\xc3\x0c\x02\x97\x0d\x21\x8d\x69\x58\
+\x0e\x81\x69\x6e\x57\xbd\x6d\x02\x70\xf5\x82\x1d\x02\xa7\xd4\x73\
+\x32\x9b\x23\x17\x0e\x24\x9d\x3d\x94\xf4\x7f\xf6\xae\xdf\xb7\x8d\
+\x23\x0b\x03\x01\xdc\x5c\xad\xb8\x10\x12\x80\x4d\xfe\x10\x01\x7b\
+\x90\x64\x9a\x80\x62\x1c\x64\x80\x76\x0a\x17\xda\x1c\x74\x2e\x7d\
+\x8d\x61\x77\x4e\x63\x5c\xe9\x4a\xd5\x09\x10\xe5\x78\x1e\xdd\x29\
+\xcd\x50\x29\x0c\xc8\xd6\x65\xad\x14\x06\x78\x30\x60\xdc\xfe\x2f\
+\xc7\x9d\x79\xf3\x63\x97\xdc\x95\xb9\xe4\xce\xbc\xd9\xd5\x93\xa8\
+\x11\xe9\x88\x0c\xb9\xef\x9b\xef\x7b\x3f\x66\xa6\xd7\x45\x05\xed\
+\xb9\x84\x94\xed\x27\x8b\x9d\x04\x63\xeb\x08\xdd\x24\xb7\x8e\x61\
+\xad\x04\x3c\xa3\xe0\x23\x06\xb3\x2f\xde\xe1\x6f\x40\x0e\xce\x56\
+\x5e\xcb\xd9\x72\x88\xb5\xa4\xac\x21\x2e\xf1\xec\x12\x3b\x9d\xd4\
+\xd0\xc1\xed\x04\xad\x8a\x48\xf2\x78\x2d\x55\xfa\x1d\x22\x15\x4b\
+\x01\x2d\x5d\xed\x78\xad\x04\x9c\xa6\x3b\x37\xec\xcb\xd4\x1a\x24\
+\x71\xd4\x8a\x5c\x89\x34\x44\x18\xb3\xb1\xef\x49\xfd\x76\x07\x35\
+\xf4\x5f\x02\x25\xe0\xbb\x92\x69\x45\x4e\x34\x31\x4b\xdb\x72\x0c\
+\xfc\x6a\xbd\xf8\x4d\xa7\x37\xed\x58\x62\x62\x4c\xf4\x8a\x06\xfc\
+\xdc\x13\x79\x38\x64\x72\xe1\x7b\x56\xaf\xb9\x2a\xe9\xdf\xdd\x2b\
+\x02\x7b\x2e\x21\x65\x45\x24\xc4\xad\x92\xcf\x23\xd9\x0f\x24\xbc\
+\x4b\x02\xed\xd7\x35\x13\xf0\x4d\x3b\x16\x68\x02\x4e\x98\xdc\x7b\
+\x1b\x73\x0f\x18\xcf\xbc\xf3\xed\x15\xff\xec\x5e\x29\x38\xc8\x1e\
+\x0e\xb9\x96\x1f\x65\x9c\xdc\x28\x51\xf7\xf9\x19\x77\xfb\x3d\x5d\
+\xbb\x65\x73\x43\x97\xbf\xcc\xa7\x9c\xe8\x9c\xb4\x50\xd2\x23\x79\
+\xf2\xca\xd4\xb3\x5b\x6c\x77\x4e\x43\xd7\x4c\x61\xfd\xe4\x7b\xaa\
+\xed\x27\xaa\x1b\x17\xb3\x28\x43\x51\xc9\x18\x29\x04\x67\xbe\xb6\
+\x7e\xfc\xde\x2c\x4a\xe2\x9a\x83\x87\xf2\x98\x33\xa4\x63\x79\x1d\
+\xae\x5e\xf8\xf6\x8b\xff\x76\x2d\x8d\x55\x53\x41\xfb\xbe\x4e\xd1\
+\x33\x64\x02\xd3\xfb\x6c\xb1\xb0\xf4\xb2\xd7\xeb\x07\xf0\x4d\x33\
+\x47\x96\x85\xb7\x57\x7b\xe5\x8a\x77\x09\xbb\xf4\xee\x18\x1d\xd3\
+\xd0\x35\x8b\xc0\x67\xde\xaf\xd3\xb9\x3c\x46\xc5\xaa\x4b\x4a\x37\
+\x92\x21\x19\x64\xdf\x1b\x0d\x00\x58\x54\x92\x6e\x34\xb4\x9c\x2f\
+\x47\xb8\x21\x59\x32\xc2\x63\xe5\x7c\xaf\x48\xca\xec\x4e\xb7\x4a\
+\xc1\xb7\x82\xec\xe1\x10\x45\x24\xc5\xc0\x7a\x4d\xbf\xae\x01\x4b\
+\x37\x7b\x33\x68\x00\xc0\x69\xff\x46\x42\x8b\x9b\xf9\xfc\xc5\xaf\
+\x43\x75\x42\xe4\x86\x77\xd7\xf8\xa5\x53\x1a\x3a\xcc\x12\xd2\x6c\
+\x9e\x65\x78\x52\xad\x24\xde\x61\x51\xd2\xcd\x28\xf8\x2c\x6d\xc4\
+\xa4\x17\x77\x97\x80\x01\xf9\x77\xa4\x6b\x48\x6a\x19\xb6\xd8\x53\
+\xe1\xc4\xff\xdc\xde\xa5\x34\x56\x3d\x05\xfd\xc8\xfb\x45\x8a\xbe\
+\xd3\x39\x50\xdd\xf9\x2c\x4e\x8c\xc7\x1a\x52\x33\x29\x2c\xa1\xa1\
+\x9f\xe9\x5a\x4a\x47\x09\x18\xcc\x07\x90\xa8\x8f\x5f\x35\xd0\x24\
+\xfe\x0b\x49\x75\xbb\x39\x7a\x1d\x52\xd0\x4f\xfc\x5f\xa4\xc4\xaa\
+\x17\x0d\xb1\x9f\x32\x5f\xad\x3c\x1e\x34\x83\xe0\xdd\x2e\x53\xb0\
+\x9d\x85\x1e\xd9\x9f\xff\x48\xfd\x76\xe5\xdf\x37\xea\x75\x73\xec\
+\x75\x47\x41\xdf\x27\x70\x8d\x12\x55\x83\xd4\x2e\x64\x67\x49\x33\
+\x3f\x7b\x95\x36\x64\x9c\xb1\xae\x36\x64\x71\x90\x04\x0c\x2c\xf7\
+\xf1\xe3\xe7\x3f\x24\xd1\x4d\x59\xbb\x9b\xa3\x3b\x0a\x9a\x00\x01\
+\xdf\x65\x58\x83\xb4\x17\x1f\x0d\xd5\x63\x99\x9f\xb1\xa6\xf0\x9b\
+\x3e\x9d\xe1\xd7\xf4\xf6\xd7\x1d\xe5\x17\xe7\xa0\x6c\xe5\x67\x74\
+\x30\xa2\xba\x01\xfb\x33\xcf\x6f\x01\x9a\xb0\x0b\xff\xde\xb1\xdd\
+\x19\x0d\xfd\x43\x90\x3d\x1c\xb2\x8f\xb2\xc8\xbd\xc3\x7c\xbb\xdf\
+\x65\x63\x00\xde\x9a\xef\x2c\x5c\x7e\x84\x6c\x9a\xe1\x93\xac\x97\
+\xec\x6a\x66\xe3\x99\xa2\x80\x19\x98\x57\x78\x46\x27\xa3\x00\xb1\
+\x88\x83\xf3\xc0\x1d\x99\xfb\x04\x82\xe0\x7a\xdd\x1c\xf7\xba\xa2\
+\xa0\xa7\xfe\x2f\xd0\x20\x31\x19\xe7\x11\xcb\x9f\x84\x84\x69\x96\
+\xc6\x14\x74\xb6\xa2\x81\x6b\x1d\xc9\xbf\x76\x44\x02\xe3\x82\xbe\
+\xb3\xef\xab\xf7\xfb\x71\xc1\x0e\x1e\x5e\x31\xc1\xc5\x22\x0f\x67\
+\x9e\x41\xdd\xf7\x3b\xea\x77\xa0\x42\x88\xa1\x89\x7c\x31\x11\x21\
+\xf2\xd0\x14\xfc\xa3\x23\x1a\xba\x56\x0a\xeb\x84\xc0\x0c\xbb\x9b\
+\xd8\x7d\x57\x26\x1c\x1b\x19\xb6\x48\x9b\xb3\x67\x86\x43\xe5\xab\
+\x55\x8e\x18\x95\x73\x3d\xce\x10\x7a\x35\x87\x5d\xcb\x1e\x26\xa0\
+\xfe\x4e\x3d\x03\x2f\xf4\x31\x7a\x19\xb9\xee\x90\xb1\x1b\x3a\x46\
+\x79\x1d\xe4\x7b\x7f\x77\xb4\xbf\x76\x23\x8d\x55\x47\x41\x0f\x09\
+\x5c\x9e\xe8\x7f\xa6\x8d\xde\xe0\x56\xae\x4d\x42\x94\x34\x95\x83\
+\x46\x0d\xcd\x97\xd0\xca\xdc\xa2\xad\x99\x4a\x1e\xbf\x8f\xaf\xb5\
+\x87\x09\x47\xe8\x22\xd3\x2b\x5a\xf6\x36\xe2\x0f\x9d\xc0\xe3\x8b\
+\x76\xda\x91\xf6\x27\x05\x0f\x19\x75\x42\x43\x87\xd9\x44\x39\xb3\
+\x7f\x95\x67\x51\x10\x3d\x2f\x1a\x64\xe0\x14\x65\x3a\x60\x36\xab\
+\x7a\x44\x2a\x45\x38\x7c\x05\x7a\x11\xc3\x33\xb4\x70\xf9\x0c\xa0\
+\x19\xd0\xd7\x08\x06\xb3\x5c\xa7\xb3\x18\x6e\x65\x37\x64\xf9\x80\
+\xf8\x3f\x14\x3c\xa4\xdf\x05\x0d\x5d\x47\x41\xff\x9d\xc2\xd5\xd9\
+\x4e\xaa\x5a\xed\x05\x67\x3d\x6f\x10\xbf\xd3\x4d\x0c\x63\xbf\x46\
+\x7b\x0a\xda\x92\x08\x9e\x8c\x3f\xc4\x4b\xd8\x41\x62\x11\x1e\x26\
+\x8f\xfc\x8c\x1c\x99\x18\x34\xa8\xa1\xa4\x92\x26\xf6\x16\x7c\x42\
+\xc1\x47\x7e\xe9\x80\x86\xae\xa1\xa0\x09\x34\x51\xce\x6c\x27\x29\
+\xd4\x7e\xe7\xac\x49\x05\x9d\xa6\x7d\x41\xbf\xc2\xb3\xb9\x48\x3a\
+\x95\x8f\x86\x81\x27\xe3\xfd\x78\x59\x4b\x26\x32\x89\xc4\xf1\xc5\
+\x3c\x8d\x56\xdd\x48\xcc\x29\x00\x25\xd8\x95\x61\xf0\x0b\x0a\x3e\
+\xb2\xd5\x01\x0d\x1d\x66\x13\xa5\x59\x4a\xb8\x28\x02\xe3\x52\x78\
+\xbe\x6d\x12\xbf\xe9\x67\x26\xc3\xd2\xaf\xe9\x3c\x04\x49\x5b\x30\
+\x8e\x6b\x59\x82\x0c\xac\xb2\x59\x3e\x46\x71\x93\x86\x10\xce\xbf\
+\xf9\x5c\x3f\xc7\xec\x76\x49\xc2\x49\x6e\xb7\x5e\x43\xdf\x0a\x95\
+\x80\x4d\x08\x3c\x64\x0b\x5a\xb1\x32\xdb\x68\x14\xc0\xd3\x23\x86\
+\x8e\xad\xbe\x8b\xbb\x37\xaa\xdf\x50\x70\x42\x0d\xf6\x35\x10\x06\
+\xf5\x2c\x7e\x46\x3b\x24\xc0\x94\x1c\xb0\xaa\x6e\x34\x12\x41\x70\
+\xad\x86\xca\xbd\xb6\x2b\x68\x1a\x04\x3c\xb8\x26\x04\x9e\x7d\x37\
+\xaa\xa0\xd3\xf4\x0b\x9b\xf7\xec\x45\xf7\x05\xca\x01\xf8\x87\x78\
+\x05\x7b\xac\xc3\x4f\xe6\x65\xe4\x2a\xfe\xb5\xd0\x2b\x7f\x15\x49\
+\xac\x62\x0e\x8b\x4a\x10\x5c\x87\x82\x87\x6d\x6f\xa3\xa4\x71\x65\
+\x76\x92\x45\xd5\x0b\x1b\x46\xc7\xcd\xe2\x37\xdd\x12\x3d\x90\x99\
+\xae\x14\x49\x2a\x2e\x5b\x0d\xb9\x7d\x5f\x46\xc1\x42\x3e\xbf\x8f\
+\x57\xb4\x87\x5c\xa7\xc3\x3c\x8c\x36\xd9\x0a\x15\x2d\xde\xd8\xfc\
+\x9a\x2c\x62\x41\x70\xad\x86\xca\x5e\xbb\x15\xf4\x7d\x12\x17\x06\
+\xab\xc0\xa6\x85\xc0\x5a\xd2\x80\xa9\xa3\xb3\x86\x01\x9c\xe6\xaa\
+\x2a\x85\xa0\x57\x73\xaf\xfc\xc9\xf7\xe3\x95\xed\xe0\xa3\x5d\xda\
+\x01\xb7\xa3\x89\x80\x39\x5b\x18\x03\x17\x1b\x69\x68\x54\x82\x6b\
+\xad\x69\xd8\x6b\x77\x0a\x8b\x06\x01\x47\x2f\x2b\x77\x3d\xcd\x1c\
+\xef\xfb\x86\xf1\x3b\xdd\x14\xae\xcd\xb1\x42\x64\xd6\x23\xe8\xfb\
+\xd8\x7a\xc8\x27\xa3\x78\x2d\xf6\x90\xcb\x97\xd3\x35\x29\x77\xa3\
+\xd5\x77\xc5\x0d\x03\x43\x45\x12\x8f\x46\x10\x5c\x8b\x82\x5b\xad\
+\xa0\x7f\xa2\x71\x5d\x06\xc9\x5c\xd4\x65\x10\x2c\xbc\x0e\x06\x4d\
+\x33\xf0\x17\x64\x22\x4c\xd3\x9a\xf9\x43\xdd\x57\x85\xd3\xfd\x78\
+\x4d\x76\x00\x3a\xab\x0d\x2e\x47\xb9\x10\xb8\x8a\x81\x47\x73\x4c\
+\x4c\xa1\x1d\xba\xe6\x9a\x86\x5e\x9b\x15\x34\x91\xcb\xb2\x53\x9a\
+\xc3\x92\xc5\x59\xc6\x9b\x0e\x81\x67\x41\x30\x92\x90\xee\x73\x90\
+\x0c\xcc\x40\x95\x4a\x65\xba\x67\x1c\xaf\xd1\x12\x5c\xad\x04\xcc\
+\xe5\x08\xf6\x0e\x1c\xf2\x4d\x4a\x28\x23\x9e\x2d\x08\x8f\x88\x05\
+\xc1\x75\xd6\x34\xec\xb5\x58\x41\xff\x8d\xc6\x55\x51\x21\xf0\xc2\
+\x3e\x5c\xa1\x32\xd9\x49\xe3\x00\x4e\x15\x09\x49\x20\x9b\x57\xd7\
+\xea\x32\xfb\x7d\x14\xaf\xd5\x0e\xb9\x63\xf0\xe2\xda\x05\x60\x3a\
+\x46\xd0\xc9\x2b\xce\xcb\x1a\x59\x09\x05\xc1\x75\xd6\x34\xb4\x57\
+\x41\x0f\x89\x5c\x14\xbb\x11\xba\xd8\x36\x81\x29\xd3\x8d\xc6\xf1\
+\x3b\x7d\xa9\x19\x18\x59\x58\x29\x4c\x84\x73\xf6\xfb\x87\x78\xcd\
+\x76\xa0\x45\x2d\x77\x37\xda\x41\xb0\x78\xc7\x4a\x6c\x14\x82\xe0\
+\xa1\x35\x97\xfe\x41\xc5\x57\xda\xab\xa1\x97\x57\xd0\x27\x44\xae\
+\x89\x55\x05\x1e\x2e\x80\x70\xe6\x6d\xcd\x13\x70\xfa\x54\x01\x95\
+\x1b\x06\x06\xcb\xb5\x01\xce\xe3\x06\x0c\x98\x53\xf0\x16\x83\x60\
+\x53\xe9\x2e\xa0\xb7\x20\xa2\xa9\x04\xc1\x35\x36\x89\xde\x6b\xab\
+\x82\x7e\x40\x65\x52\xdd\xad\x08\x81\x65\x0c\x7c\x3c\x68\x1e\xc0\
+\x7d\x50\x55\x51\xae\x63\x60\x4b\x07\x00\x6b\x04\xbf\xb3\x40\x18\
+\x7c\x32\x30\x26\xc2\xe7\x82\xe0\xa2\x51\xd8\x18\xab\xee\xb2\xc2\
+\xb6\x2a\xe8\x33\x2a\x97\xe4\x6e\xe5\xb9\x1f\x19\xf7\x5d\x3a\x60\
+\xe0\x4f\xcc\xe8\x67\x15\x10\x72\xcb\xb5\xc7\x71\x43\x26\x3b\x2b\
+\x41\x76\x48\x35\x3b\xe2\xe6\x21\xa0\xeb\x64\xb9\x96\x33\xce\x2a\
+\xf6\xd7\xbd\xa0\xe2\x2d\xfd\x96\x6a\xe8\x5b\xc1\x12\xb0\xde\x11\
+\x7a\x51\x08\x2c\xab\x97\x67\x0e\x00\x3c\xc5\x5a\x91\x0e\x84\x0d\
+\x03\x67\x93\x48\x63\xf8\x8d\xe3\xa1\xaa\x06\xab\x4e\xb0\xa6\x46\
+\xa6\x9a\xcd\xcc\xf6\x04\x3a\x04\x96\x63\xf9\x44\xfa\x8e\x8c\xbb\
+\xfc\xd6\x4e\x0d\xbd\xf4\x2a\x86\x17\x64\xae\x08\xbb\x86\x81\x39\
+\xff\xde\x05\x80\x8f\x98\x91\x91\xba\x42\x8a\x14\x3c\x39\x8d\x1b\
+\xb4\x43\xce\x75\x75\xa7\xc9\x51\x6f\xca\x01\x56\x1d\x98\x9b\xe2\
+\xb0\x5e\xd7\xbf\xc8\xc8\xb8\xcb\x4e\x2b\x35\xf4\xd2\x0a\xfa\x11\
+\x99\x0b\x52\x7e\x3c\xa0\x74\x31\xce\x5c\xe4\xb0\xd2\xf4\x29\xe8\
+\x8e\x24\x8b\x81\x65\xcd\xa5\x51\xfc\x0a\x04\x63\xa7\x72\x83\x23\
+\xc6\xbe\x5c\xf5\x45\x83\x6a\x53\x11\x3b\xe1\x32\xb5\xc8\x81\x7c\
+\x10\xbc\xfc\xca\xfe\x5e\x1b\x15\x34\x9d\xeb\x71\xa7\xf2\xf8\xf8\
+\x0c\x3e\x6f\x06\x2e\x00\xdc\x57\x22\x53\xe6\x7a\x54\x6b\x65\xf6\
+\x3f\x30\x8a\xe3\xa6\x11\xac\x3a\xbe\x00\x03\xe2\xb5\x8f\xf6\x9e\
+\x41\x1c\x23\x63\xc4\x34\x30\xb3\xb3\x75\xa9\x9d\xd0\x99\xf1\xdb\
+\xa8\xa1\xc3\x25\xe0\xca\x10\x58\xa6\x5e\x5e\x3b\x61\xe0\x2d\xdc\
+\xf4\x4a\xf6\x6e\x28\x5a\xca\x1e\x6c\x1c\xbf\xa6\xa5\x43\x42\x8a\
+\x37\x30\xea\x7d\x45\xec\xed\x65\x31\x2a\xc6\x07\xd5\x56\x21\xc4\
+\x83\xe0\xe8\xdb\xf6\x69\xe8\x65\x15\xf4\x3e\x1d\x02\x8e\xaa\x8f\
+\x9e\xce\x40\x74\xe2\x04\xc0\x69\x22\xe9\x49\x2b\x4b\xdc\xfb\x86\
+\x3b\xc0\x2f\x72\xb0\xda\x3b\x00\x53\xc5\x6b\x1d\xed\xe3\x23\x00\
+\x37\x08\x02\xb5\xc7\x1e\xee\x6b\x57\x15\x03\xd3\x09\x82\x97\xa7\
+\xe0\x5e\xeb\x14\xf4\x8f\x74\xae\xc6\x76\x55\x23\xb4\x84\xd0\x86\
+\x13\xfc\x4e\x35\x09\x01\x30\xbd\x09\x87\x13\xfe\x95\xb9\x68\xf5\
+\x86\x31\x6b\xac\x52\xc6\x6b\x1a\x2d\x92\x55\x24\x6c\x3d\xa4\x77\
+\x1d\x29\x85\x30\x91\x45\xfd\xc2\x6e\xb7\x4e\x43\x07\x4c\xc0\xfd\
+\x8a\x83\xb7\x90\x36\x9e\xbb\x01\xf0\x66\xe1\xf0\x20\xe9\xde\xe7\
+\xb1\x23\x7b\x80\x87\x26\xa8\x89\x43\x23\x6a\x3d\x37\x8d\x57\x56\
+\xd8\x24\x28\xf7\x9e\x2b\x0e\x79\x7b\x41\x88\x82\x0f\x5a\xa6\xa1\
+\xbf\x09\x37\x02\x5e\xb8\x92\x41\xef\xd6\x24\x3d\x6e\xe0\x46\x42\
+\x7f\xb1\x28\x49\x7b\xb8\x33\xfc\xc6\xf1\xc7\xfc\x1e\x5c\xa0\x15\
+\xfd\x5a\x6e\x66\x5a\xe2\x86\xe8\x81\x15\xde\x73\x45\x10\xfc\x67\
+\x14\x2e\x05\xf7\xda\xa5\xa0\xf7\x09\xa9\xa1\xe8\xe8\x5a\x06\x7e\
+\xe3\x08\xc0\xfd\x02\x03\x0b\x77\x8e\x1d\x9a\xfd\xc2\x46\xed\xae\
+\xeb\x66\xa6\xa5\x3c\x68\xcd\xab\x41\x65\x10\xfc\x47\x14\x2e\x05\
+\xef\xb5\x4b\x41\x13\x8a\x80\xc5\xc1\xde\xd7\x30\xf0\xb1\x1b\xfc\
+\xa6\x5b\x08\x5d\x9b\x8e\xf6\x5d\x02\xf8\x60\xd1\x56\x98\x6b\x97\
+\xd0\xc0\xe6\x25\xb4\xb5\x23\x67\x79\x10\x1c\x05\x4c\xc1\xad\x52\
+\xd0\xa4\x08\xb8\xa2\x8d\x03\x8f\xd8\x65\x6f\x1d\x01\xf8\xb3\xe2\
+\x20\xed\xec\x93\x0f\xb1\x53\x7b\x3c\xc9\xa7\x95\x74\x6a\x78\x0d\
+\x37\x4b\x38\x5b\x21\xbe\x7a\x25\x7e\x2d\x7e\x29\xb5\x72\x2c\x4f\
+\xc1\xbd\x36\x29\xe8\x9f\x29\x4d\xa5\x77\xaa\x09\x38\xf3\xad\x33\
+\x47\x00\x9e\x62\xda\xca\x38\xf3\x69\xec\xd8\x0e\x65\xa7\x94\xd9\
+\x04\xb3\x11\x06\xe6\x36\x03\xab\x2e\x0e\x23\xdd\xe9\xb7\x72\x44\
+\x4b\xef\x6f\xb7\xd7\x26\x05\x4d\x89\x80\x17\x9e\xc9\x60\x76\xc3\
+\x10\xc9\xd8\x0d\x57\x00\x7e\xc9\xf5\xac\x01\x8e\x1a\x38\x8a\xf6\
+\x0f\xae\x5b\x95\xf5\xc6\xb6\xb0\x9e\x11\x37\xe9\xc3\xa7\xd7\x2f\
+\xa2\xba\xa2\x41\xfd\x43\xe9\x05\xb9\xa4\xe4\x37\xdb\x2d\xd2\xd0\
+\xdf\x04\x4c\xc0\x11\xaf\x68\xc3\x42\x17\x7b\xee\x0a\xc0\x9b\xc8\
+\x7a\xe8\xd4\xe7\xb1\x07\xfb\x68\x92\xc5\x56\x87\xd4\xea\xa3\xe9\
+\xc3\xe2\xaa\x4a\xc5\x01\x77\x2a\x60\xb9\x7f\x2e\x45\x30\x44\x01\
+\x53\x70\xaf\x3d\x0a\x9a\x14\x01\x6f\x57\x84\xc0\xca\x95\x53\x57\
+\xf6\xd4\xc4\x83\xd9\x57\xec\xc5\xe6\xf2\xc6\x6b\x81\x71\x8e\x81\
+\xad\x07\x99\x5e\xd0\x0f\x00\xd7\xd4\x91\xc6\x4f\x02\xa6\xe0\xbd\
+\xd6\x28\xe8\xfb\xa4\xe6\xd1\xdd\x8a\x10\x58\xf5\x07\x0d\x5c\x01\
+\xf8\x8e\x6a\xc0\xca\xcc\x75\x02\x4b\x27\xb2\x94\x88\x06\xbb\xdb\
+\x71\xd5\x51\x37\x5e\x61\x74\x00\xa6\x13\x1a\x57\x19\x7e\x45\x25\
+\xf8\x55\xc8\x14\xdc\x1a\x05\x4d\x6a\x1a\x2d\xdf\x8d\x03\x55\xdf\
+\xcc\xbd\x8e\x9d\x01\xb8\x6f\x57\x56\x4e\x63\x4f\x76\xa8\x69\x53\
+\x71\xe4\x04\xc3\xd3\x55\x46\x9c\x0d\x40\x27\xe8\xd4\xc6\xf5\x6a\
+\xae\xd0\x0f\x96\x77\x63\x5d\x44\x01\x53\x70\xaf\x25\x0a\x9a\x16\
+\x01\x97\x2f\x45\xe2\x3a\xc7\x72\xec\x4c\x42\x6f\x31\xd0\x19\xa4\
+\xf3\xd8\x9b\x7d\xe4\x26\xdb\x64\x8b\xe9\x55\x46\xf3\x84\x1a\xa5\
+\xd6\x83\xdc\x7e\xbd\xf2\x4a\xd2\xbb\x28\x60\x0a\xde\x6b\x89\x82\
+\xa6\x45\xc0\x51\x75\x0e\x5a\x40\xe9\xb5\x33\x00\x7f\x32\xa9\xd9\
+\xc9\xbe\x3f\x00\xc7\x13\x9d\x26\xb6\xa8\x91\x4d\x56\x19\xd5\xf9\
+\xe4\x60\x11\x70\xee\x55\x4c\xd2\xb0\xa2\x14\x1c\x85\x4c\xc1\xed\
+\x50\xd0\xc4\x08\x58\xe7\xb0\x20\xff\xcd\x8c\xc4\xe3\x27\xce\x00\
+\xfc\xd9\xec\xf7\x76\xea\x11\xbf\xf1\xe1\xc4\x54\x77\x4c\x91\x87\
+\xad\x32\xda\x65\xa5\xdc\xb3\x5a\x19\x2e\x73\x20\x14\x86\xcc\x60\
+\x0d\xd9\x83\xe3\x27\x21\x53\x70\xaf\x15\x0a\x9a\xd8\x25\xd8\x61\
+\x8c\xe5\x0e\xdb\x52\x70\x06\x5d\x46\x71\xd6\xc7\x91\xa6\x53\x3d\
+\x6b\x9c\xc7\x5e\xed\x81\x7e\xf3\x56\x64\xba\x5a\x29\x58\x81\x57\
+\x87\xc3\x8a\x8e\xf3\x5c\xac\x6a\x4e\xe4\x17\x24\x2d\x4f\xc1\x54\
+\x35\xf4\x28\x60\x02\xae\xca\x61\x69\xe7\x7a\xe5\x0e\xc0\xba\xaf\
+\x21\xf6\x6c\x50\x8c\x50\xf3\x59\xa6\xe5\x46\xc4\x67\x51\x42\x33\
+\xc3\xcb\xf9\x0e\x8f\x72\x0d\x7d\x11\x85\x4c\xc1\x6d\x50\xd0\xc4\
+\x08\x38\xda\xb4\xb3\x56\xe6\x9b\x69\xe6\x98\x0d\x1b\xee\x00\x7c\
+\x84\x5e\xff\xc1\x37\x80\x1f\x4f\x20\xdf\x23\xb5\x0a\x05\xeb\x16\
+\xab\x39\x15\x6d\x3d\x71\x4e\xaa\x97\xa4\x15\xd9\x71\x14\x32\x05\
+\xf7\xc2\x57\xd0\xd4\x08\xf8\xba\x1c\x96\xf0\xaf\xe7\xee\x00\xbc\
+\x29\x3d\xfc\xb7\xd8\xbb\x3d\xb0\x1a\x2b\x0a\x19\xad\xa5\x47\x4b\
+\x2b\x83\x9d\xda\xd6\x0f\x5b\x4d\x1f\x1a\xc1\xb2\x74\xac\x37\xaf\
+\xc4\x20\x27\x0a\x99\x82\x69\x6a\xe8\x1f\x42\x26\xe0\xed\x04\x8f\
+\xac\xcd\x07\xc1\x9c\x59\xf4\xe3\x10\xc0\xe9\xa6\xf4\xf0\x98\x80\
+\x15\x90\x68\x35\x2e\x5b\x91\xab\x0e\x5e\xab\xef\xe7\x6a\xbe\x7c\
+\x41\x50\x6c\xa3\xbd\x4a\x42\x8f\xc9\x39\xd0\x32\x8b\x92\xee\x05\
+\x5f\x44\x22\x47\xc0\x7d\x93\x83\xb6\x45\xb4\x4e\x42\x0b\x67\x1a\
+\xb8\x03\xf0\x53\xe1\xbf\xa7\x14\x00\x7c\x38\x61\x05\xa9\x3b\xaf\
+\x77\xab\xad\xe4\x6f\xf2\xf9\xe6\xc5\x36\x59\xd8\xcc\xc1\xc9\x65\
+\xb1\x96\x5c\x17\x1c\xbc\x82\xa6\x36\x7f\x96\xe7\xb0\x74\x53\xb2\
+\x5b\x00\x7f\xc9\xbc\xfa\x3c\x26\x61\x0f\xb8\xcd\x89\xf3\x30\xcc\
+\x65\x95\x6d\x89\x7c\x0d\x68\x17\xc4\xbc\xf9\x5c\x17\x6e\xcb\x01\
+\xd6\xc1\x85\x64\xb3\x58\xcb\x51\xf0\x5e\xe0\x0a\x9a\x1c\x01\xcb\
+\x1c\x16\x2f\x54\x82\x19\xb7\x09\x18\x7e\x75\x08\xe0\x3b\x19\xfb\
+\xc4\x44\x0c\x96\xe5\xcd\xc5\x78\x2d\x07\x34\x2b\xff\x2b\x0b\xb8\
+\x5c\x97\x85\x19\xbd\x2c\xd6\x72\x14\x7c\x2f\x6c\x05\xbd\x4f\x8e\
+\x80\x23\x6c\xda\x60\xc5\x33\x01\x6c\xaf\x7b\xe3\x10\xc0\x7d\xc6\
+\x27\xa7\x54\x00\x7c\x38\x61\x15\xd4\x59\x82\xd4\xdc\x9f\xb0\xfc\
+\x7f\xc2\xf2\xf1\x70\x95\x99\x72\x40\x41\x43\x93\x73\xa1\xa5\xb6\
+\xe6\x08\x5b\x41\xd3\x23\x60\xdd\x87\xc5\xad\x18\x18\x70\x37\x1d\
+\x65\xc7\x0e\x01\xbc\x33\xe3\x9e\x98\x8c\xc1\xe4\x1a\x22\x6d\xd0\
+\x42\xc9\x62\x2d\x47\xc1\x7b\x21\x2b\x68\x82\x04\xbc\xcb\x4a\x4e\
+\xa4\xb5\x5d\xc9\x29\x80\x99\xaf\x45\x84\x65\xc5\x60\x5f\xa6\xb5\
+\x91\x3a\xb8\x01\x2f\xd4\xab\xa0\x29\xf8\x5e\xc8\x0a\xfa\x67\x72\
+\x1f\xbd\xca\x61\x71\xf5\x03\x7d\x86\x83\x1d\x04\xbb\x5b\x8c\x94\
+\xa6\xbb\x54\x32\x58\x56\x47\xa5\x1f\xb3\x24\x91\xfa\x45\x20\xf9\
+\x22\x0a\x9a\x82\x03\x6e\xc3\x22\x48\xc0\xd1\x77\x7a\x72\x57\x67\
+\x4e\xe3\x7e\x2e\xb6\x2b\xbd\x76\x08\xe0\x2d\xd8\xa7\x04\xe0\xd8\
+\x1f\x05\x9b\x23\xc0\xf3\xda\x88\x5e\x16\x6b\x29\x0a\xee\x85\x1b\
+\x02\x3f\xa2\xf7\xc9\x47\x56\x07\x87\x95\x30\xc9\x27\xa1\xc1\x29\
+\x80\x4f\x49\xe1\x57\x9c\x1b\xec\xc7\x26\xd8\x4f\x83\x93\x2a\xe8\
+\x45\x26\x51\xd0\x14\x7c\x2f\x58\x05\x4d\xe9\x34\x24\x65\x83\xc4\
+\x9a\xe3\x41\xf5\x64\x15\x08\xd8\x29\x03\x7f\x8a\x89\x19\xf8\xd3\
+\xd0\x50\x48\x2f\xca\x9d\x3a\xc6\xd3\xb0\x29\x38\x58\x05\xfd\x23\
+\xc1\x99\x73\x8b\x59\x07\xd5\xe6\x77\x83\xf6\xc5\xc0\xd4\x00\x7c\
+\x38\xf1\x97\xc5\x32\x79\x2c\xeb\xbc\x75\xb6\x11\x36\x05\xf7\x02\
+\x55\xd0\x14\x09\x38\xb7\xa7\x3b\xb7\x5b\xe6\xbd\x31\x30\x39\x00\
+\x7b\xa6\x60\xc0\x29\x55\x77\x56\x72\x76\x12\x05\x4d\xc1\x7b\x81\
+\x2a\x68\x8a\x11\xb0\xdc\xd3\x5d\xf5\xf8\x70\x3d\xd7\x17\x5a\x0c\
+\xde\x76\x59\x42\xc7\x8f\xb9\x5f\x11\x0d\x66\x75\x89\xd4\xd0\x97\
+\x14\x3d\xe9\xdb\x30\x35\xf4\x12\x0a\x9a\x22\x01\x47\x47\x4a\x3b\
+\x83\xee\xb9\x95\xf9\xe8\x1c\xed\xbc\xed\x34\x03\xc7\x1f\x7d\x17\
+\x92\x98\xb5\x4d\xe5\xec\x72\xbd\xa1\xe8\x49\x5b\x61\x6a\xe8\x5b\
+\x61\x13\x70\xc4\x2c\xf4\xfe\x9f\xbd\xeb\x77\x8d\x2b\xbb\xc2\x60\
+\x70\x93\xda\x76\x61\x08\x6c\xa3\x3f\x44\x30\xb2\xb4\x56\x04\x59\
+\xb3\x78\xc3\x1a\x17\x5b\x78\x02\xb6\x4b\x5b\x85\xc9\x76\x72\x0a\
+\xd7\xae\xd2\x09\xe4\x58\x79\xc7\xdb\x69\xb7\x38\x27\x4d\x20\x10\
+\xf0\xb2\x9d\xec\x40\xc8\x1f\x93\x79\xf7\xfc\xbc\x6f\x46\xd1\x73\
+\x31\xcf\xe7\x6a\x67\x98\xd5\xcc\x9b\x27\x99\xe5\xce\xf9\xee\xf7\
+\x9d\x9f\xd7\x3a\x4f\x3b\xe8\x3e\x1f\x03\x27\x04\xf0\x67\xab\xe6\
+\x10\x8f\x46\x7a\x0b\x51\xc3\x15\xdd\xac\x6d\x0a\xce\xa4\xa1\xb7\
+\xda\x26\xe0\xdd\xf7\x2a\xcb\x20\xe4\x2c\x16\x57\x65\x92\xb1\x3c\
+\xa7\x65\xe0\x7c\x12\xba\xa7\x60\x5b\x8c\x29\x9f\x65\xee\x7b\x68\
+\x67\xd0\xaf\x28\x61\x31\xe5\xe2\xb1\xd7\x64\x22\x69\xf4\xff\xf4\
+\x83\x94\xbb\xe6\x9e\x0f\xb0\x8b\x6d\xfd\xb8\x61\xe0\x01\x05\x7f\
+\xa6\x44\x30\x58\xe4\x59\x5c\xe0\x2e\x69\x31\x65\xff\x78\xd9\xa0\
+\x13\x3c\x5e\x41\x9f\xa5\x5c\xf3\xbb\x36\x77\x5c\x9a\xf8\x25\xa0\
+\x05\x18\x54\xe3\xaf\x3d\x0a\xdd\x17\x54\x7e\x1e\x09\xad\xb9\x5f\
+\x0b\x65\x49\x1c\xeb\x24\xa5\x31\xed\x37\xa8\xa1\xb7\xda\x26\xe0\
+\xea\x50\x06\xdf\xe1\xf5\x64\x22\x40\x39\x13\xe4\x57\x0f\xe0\xa7\
+\x65\x31\xa6\xfe\x0f\xd1\x6a\xd4\x11\x62\x24\xeb\x1f\x39\xad\xe9\
+\xc7\xf6\x34\xf4\xe8\x3d\x27\xe7\x9e\x39\x7b\xd5\xd9\x91\xd2\x21\
+\x50\xb2\x78\x21\x00\xc7\xf0\x86\x81\x4b\x20\x9a\x00\x6c\x4b\x9b\
+\xe8\x35\xa6\x80\xd1\x8f\x8b\x3c\xcd\x69\x4d\x77\x9b\xd3\xd0\xe3\
+\x93\x48\x39\x57\x7c\xf6\x1e\x62\x33\x12\xf8\x2b\xba\x86\x5e\xbc\
+\xdb\x00\xf8\xf3\x78\xc1\x14\x9a\xc3\x30\x54\x64\xbd\x4b\x6a\x4e\
+\x6f\x5a\x4b\x24\x8d\x76\x81\xbf\xce\xb9\xe0\xdb\x26\x9c\x55\x9e\
+\xa1\x66\x81\x7b\x0a\x26\x15\x73\x53\x02\x78\x6f\x9e\x93\x82\x35\
+\x36\x3c\xe9\x2b\x7f\x31\xda\x1e\x66\x47\xa5\xa5\x2c\xa6\x5c\x3c\
+\x76\x5a\x73\x82\x5b\x27\xe0\xfd\xce\x84\x73\xe7\xc7\xd2\x2e\xde\
+\x30\x70\x01\x84\x89\xa7\xec\x07\xde\xcf\x09\xe0\xa7\x96\x53\x9b\
+\xf0\xb5\x40\x58\x9a\x3d\xd1\x67\xdc\x41\x77\x96\xd4\xa0\x1a\xd3\
+\xd0\xd7\x1a\x27\xe0\xbe\x9b\x5f\x0e\xd2\x02\x2f\x81\x96\x79\x58\
+\x82\xe0\xc2\xc4\x53\x4e\xe4\xd8\x99\xcf\xd3\x7a\xc1\xd1\xb1\xc0\
+\x95\xd7\xf6\xc1\x05\xf7\x3f\xed\x9a\xb8\x88\x03\xb4\xa5\x50\x0e\
+\x2c\x4e\xd9\xd3\x5f\x1e\x1f\xda\xd2\xd0\xa3\x15\xf4\x79\xd2\xf5\
+\xbe\xad\x89\x46\xe8\x0c\xca\x7c\x04\x35\x29\x84\xcb\x8f\x0d\x80\
+\xfb\xbe\x60\x59\x0d\x7e\xca\xde\x36\xbc\xe6\xff\x2e\xbe\xff\x69\
+\xd7\xa5\x25\x18\xa0\xae\xa5\xec\x2f\x8e\x93\x1a\xd4\x41\x5b\x1a\
+\x7a\x6c\x12\xe9\x61\xd2\xe5\x9e\xbd\x2a\xf1\x11\xe8\xac\x5a\x4f\
+\x2a\x7e\xc4\x86\x48\x31\x3c\xe5\x54\xca\x3b\x49\x01\x3c\x97\xdc\
+\x38\xaa\xca\xb5\x1d\xae\xba\x16\x12\xbd\xf0\xfe\xa7\x5d\x8b\x20\
+\xe2\x2f\xc5\x4f\x1a\xef\x4e\x67\x8d\x53\xf0\xbd\xa6\x5c\xe0\x67\
+\x59\x97\xfb\xbd\xc7\x9f\xd5\x07\x46\x76\x81\xc1\xcc\xb5\x07\xf2\
+\xe9\x06\xc0\x65\x34\x07\x19\xcd\x06\x79\xb2\x04\x3e\xe3\xd2\x15\
+\xf7\xc7\x5f\xb3\x1f\xcc\xb8\xed\xc2\x69\x67\x05\xcb\x59\xc3\xd0\
+\xe3\x8f\x3a\x6b\x49\x41\x7f\x93\x75\xb5\xb7\x4b\x86\x02\x97\x25\
+\x1a\x58\x21\x07\x5b\x25\x4d\x08\xe0\x8f\x59\x01\x3c\xa7\x20\x93\
+\xfd\x87\xef\x73\x01\xe0\x17\xde\x1f\x7d\x6d\x89\x60\x9f\x97\xa2\
+\xe7\x7e\x67\xed\xe9\x2f\x8f\xe7\x0d\x69\xe8\xad\xd6\x09\x78\x0f\
+\xf4\x20\x51\x30\x03\x29\xb3\xca\x91\x33\x48\x6e\xa9\x13\x02\xf8\
+\x30\x2d\x80\x9f\x84\x12\x8b\xc5\x7f\x0e\x39\xbf\x36\x09\x0d\xab\
+\xef\x8f\xb8\xee\x2f\xb1\xa4\x91\xca\xfb\x72\x82\x0b\x1f\x73\xa3\
+\xc9\xa4\x1e\xc2\x47\xad\x53\xf0\xbd\x76\x14\xf4\x1f\xb3\xae\xf5\
+\xec\x77\xcc\xc0\x8e\x61\xcd\x2a\xa9\xa6\xa3\xde\xac\x16\x3f\xba\
+\xe9\xf0\x7b\x7e\x6b\x9e\x98\x82\x39\x32\xa0\x09\xb6\x7e\x75\x82\
+\xea\x25\xf4\x1e\x2e\x5c\x79\x7f\xc4\x35\x3f\x08\x9c\x82\x7d\xae\
+\x1d\x87\x2b\x8a\x9f\xf3\xcf\xb4\x46\x75\xd8\x8c\x86\x1e\x99\x44\
+\xba\x9f\x56\xed\xcc\x6e\x57\x0c\xcc\xf6\x51\x02\x25\x85\x14\x28\
+\x74\x33\x7c\xbf\x01\xb0\x16\x73\xb0\x6f\xea\xcb\x43\xe5\x4a\xb0\
+\x17\x9c\xe4\x95\xf7\xff\xcf\xb5\xe5\x91\xa8\x7c\x04\x42\xc1\x32\
+\xe8\x08\xad\xe5\x93\x4f\x49\xfa\x57\x5a\xa3\x1a\x3b\x5b\xe7\x8b\
+\x56\x5c\xe0\xef\xd2\x2e\x75\x5f\x09\x0d\x91\x81\xfb\x2e\xc2\xde\
+\x4a\x9c\x61\xd8\xb0\xa8\xfb\xed\x74\x00\xfe\x29\x2f\x80\x9f\x12\
+\xeb\x63\x51\xbb\x2c\x76\x0d\x8a\xc8\xd2\xd7\x96\x6d\xc5\xfd\x0a\
+\xda\x4b\xd7\xba\x3d\xc8\xbf\xce\x70\x96\x6f\x85\x31\xcc\x6f\xfa\
+\xe7\x69\x5e\xab\xba\xd5\x8a\x13\xdc\x3c\x01\xcf\x6c\xd4\x30\xf8\
+\x48\x2c\xee\x25\x0c\x25\x7d\xbd\xb9\xe2\x8d\xe9\x00\x7c\x3f\x2f\
+\x80\xe7\xb2\xaf\x05\xd9\x0b\x24\xb2\x99\x18\x88\x1e\x51\x5e\x71\
+\x5f\x8b\xac\x56\x5d\x0f\x0a\xb0\x18\xd8\x05\xca\x46\xbc\x4a\xc5\
+\x45\x43\xe7\xb5\xaa\xed\x46\x34\xf4\x48\x05\xfd\x55\xde\x95\xde\
+\xd5\x23\x08\x65\x08\x25\x57\xf9\x28\x19\x58\x3c\xb5\x7f\x77\x34\
+\x1d\x80\x13\xe3\xb7\x9f\x30\xab\xb1\x2a\x97\x27\x10\xea\x37\x90\
+\x5c\x12\x0f\xef\x87\x22\x8d\x95\xd7\x8a\x5c\xc1\x31\x47\xb2\x0a\
+\x5e\xb9\x1a\x4b\x8f\x6a\x28\x0c\xfc\xf7\x67\x79\xed\xea\x66\x1b\
+\x1a\x7a\xa4\x82\x3e\xca\xbb\xd0\x5f\x5a\x72\x51\x6a\xa0\x8b\x6d\
+\x2c\x20\x2c\xc5\xf4\xf2\xda\x5b\xd7\xc9\x64\x00\xfe\x77\x66\x00\
+\xcf\xa9\x4a\xaf\xc9\x12\x05\x26\x65\xc9\x82\x2b\xef\xfb\xb0\x9c\
+\xd5\xd7\xfc\xd1\xe0\x8d\x30\xb0\x4e\xc5\x72\x06\x7e\x9d\xd7\xae\
+\xf6\xda\xd0\xd0\xe3\x92\x48\x0f\xf2\xae\x73\x99\x09\xad\xd3\x0f\
+\x9d\x81\x3b\xb3\x51\xcf\x6b\x4e\x38\x14\x6b\x3b\x35\x80\x9f\x14\
+\x0a\x66\x8a\x75\x27\x43\xe9\xb7\x40\x51\x62\x5c\xcb\xf7\x43\x99\
+\x25\x0e\xaf\xa9\x26\xe5\xc8\xdb\xe2\x03\x03\x58\xd5\x7a\x01\xf2\
+\x49\x62\xc3\x7a\xd9\x44\x22\xa9\xe5\x49\x3a\xfc\xf8\x13\x80\x39\
+\xc1\x91\x81\x23\x39\x88\x1d\x4d\xd7\x4f\xb8\x97\x1a\xc0\x4f\x09\
+\xc3\xc0\x0c\x8a\x89\x5c\x76\x82\x65\xdb\x1b\xdc\xaf\x24\x8d\xca\
+\x9a\x78\xed\xfa\x9b\x7f\xd5\x3d\x64\x02\xf7\x81\xe5\x9b\x2a\xa0\
+\xfe\x25\xb1\x61\xed\xb7\xe0\x04\xff\xa6\xe9\x3e\x42\x69\x65\x70\
+\x27\x58\x67\x98\x16\x08\x47\xfe\x28\x66\x35\x61\x3b\xd2\x4e\x6a\
+\x00\xcf\x21\x34\xec\x32\x15\x93\x3b\xc0\xcc\xc0\x17\xdd\x8f\x41\
+\xea\xe1\x35\x0d\x5b\x21\xc8\xc9\x18\x2c\x0a\x8d\x1a\x89\x5e\x7c\
+\x51\xc7\x99\x2d\xeb\x4d\x03\x4e\xf0\x38\x17\xf8\xeb\xcc\xcb\x8c\
+\x35\x03\x73\x90\xa4\x67\x60\x5c\x62\xe0\xe9\x8a\xa1\xef\xe4\x06\
+\xf0\xe3\x38\x6d\x77\x89\x81\x57\x01\x32\x38\xb8\x50\xad\x6c\x64\
+\xd9\xfa\x0f\xcd\x7b\x2e\x39\x61\x19\x12\xda\x85\x4a\xac\xfe\x93\
+\xcc\x96\xb5\xd3\x80\x13\xdc\x3e\x01\xf7\xad\x0c\xd1\x07\x96\xe9\
+\xb2\x5d\x10\x75\x6a\x55\xd4\x4d\x06\xe0\xc3\xdc\x00\x9e\x13\x0e\
+\x43\x4f\x91\x81\x2b\x49\xbc\x84\x60\xac\xa7\x3e\x3b\xcb\x5e\x18\
+\xdf\xea\x13\xc1\x32\xda\x2e\x24\x0c\x7a\x04\xbf\xcb\x6c\x59\x07\
+\xf9\x35\xf4\xb8\x24\xd2\xc3\xcc\xab\xbc\xdd\xd5\x51\x68\x65\x60\
+\xd6\x7e\xd5\x13\x26\x2b\xc5\xca\x5c\x88\xc5\x03\x66\x69\xc8\x97\
+\xea\xe3\xea\xb3\x7e\x47\x81\x76\xeb\xc0\x73\x08\x3e\x2f\x4d\x74\
+\x8f\x73\x75\xe4\xa4\xaa\x9a\x81\x21\x6f\x3b\x43\xff\xf8\x90\x5e\
+\x43\x5f\x6f\xbb\x8d\xa1\x44\xfb\x3b\x1c\x44\xa1\x41\x62\x24\x4b\
+\x87\x04\xe0\x64\x95\x1c\xe7\x7f\x4d\x0e\xe0\xa7\xc3\xd5\xa1\x1a\
+\x99\x91\x4f\xeb\x58\x33\x2e\x31\x70\x78\x37\xf8\x37\x23\xd4\xa1\
+\x3a\xb0\xb9\xd3\x74\xf0\x51\x66\xdb\xda\x4d\xaf\xa1\x47\x25\x91\
+\xbe\x49\xad\xa0\xef\x42\x37\x88\x42\x73\x18\x9a\x68\x85\x35\x1d\
+\x6d\xea\x38\x3c\x8c\x35\xf0\x64\x2b\x06\x8e\x53\xe9\xd8\x87\x5d\
+\xc9\xc0\x4b\xbf\x57\xc9\xe8\xea\xa2\x0b\x07\x9d\xd9\x80\x2c\x4c\
+\x9d\x47\x1a\xd9\x55\x78\x2f\xb9\x0b\x7c\x3f\xb5\xca\x99\xbd\xe8\
+\x60\x10\x85\xe6\x30\x34\x9a\x41\x92\x5b\xd8\xc9\xa6\x8e\xc3\x52\
+\xc1\x2b\x18\xb8\xc2\x1c\x55\x94\x5b\x79\xcb\x83\x48\xd5\x8a\x5a\
+\xca\x81\x1b\xcd\x63\xed\xcc\x05\x2e\xb5\xeb\xcc\xc0\x6f\x53\x1b\
+\xd7\xee\xa3\xdc\x4e\xf0\xb5\xc6\xdb\x18\x4a\x16\x49\x1b\x19\x24\
+\x84\xa5\xad\xa7\x5c\x2c\x48\x5a\xae\xcb\x16\xf6\x76\x93\x06\xb6\
+\x54\xb0\x6d\x6d\xa4\x11\x2c\xdf\xf0\xb4\xb5\x97\x2c\x2e\x2d\x2f\
+\x84\xfe\x11\xb9\x87\x3c\xc8\xfe\x4a\x86\x38\x5c\x5b\x9b\x92\x9f\
+\xc2\xce\x6e\xce\x71\x6e\xeb\xba\x95\xdb\x09\x1e\xe5\x02\xe7\x26\
+\xe0\x99\x9c\x5c\x09\x3e\x13\x8b\x63\x58\x28\x2d\xe5\x28\x11\x98\
+\x62\x51\x53\x25\x82\x77\xe6\x4d\x68\x68\x0c\xfb\x9b\x38\xb1\xa4\
+\x0d\x4a\x5c\xa1\xd1\x63\x51\x5b\x92\x86\x1f\x21\x79\xe7\x91\x21\
+\x58\xd6\x5b\x11\x4c\xd6\x51\x88\x91\x81\xb5\x92\xa3\xcb\x9d\x47\
+\x1a\xd9\xd2\xf0\xfb\xd4\x0a\xfa\x0f\xb9\x57\x78\xf6\x1e\x85\x79\
+\xa5\x8e\x92\x19\x58\x1b\xcb\x49\xdb\x52\xc5\x9e\x26\x02\xf0\xc7\
+\x79\x13\x1a\x5a\x97\x48\x1d\x5d\x79\xab\x1e\x87\x82\x16\x48\x85\
+\xb4\x90\x32\x96\x08\x03\xa1\xfd\xb1\xb5\xff\x4a\xf1\x86\x16\x71\
+\xf0\x16\x81\x15\x03\x5b\xb7\x49\x41\xf3\xbb\xe4\xe6\xf5\x32\xb3\
+\x86\xbe\xd6\x7a\x15\x65\xc9\x22\xa9\xef\x8b\xe1\x78\x51\xe8\x6a\
+\xbe\x50\x1c\x77\xdf\x6f\xb2\x48\x3e\x98\xc3\x5a\x15\xd0\x7a\x8e\
+\xa4\xf7\x57\x61\x0a\x0e\x6b\x61\x53\x06\xaf\x74\x1b\x2a\x7d\x4b\
+\x03\xbf\xfc\xd0\x88\x98\x7e\xc4\xae\x8c\x9c\xbb\xce\x33\xa1\xa5\
+\x10\xab\x7f\x26\x17\x78\x7b\x99\x35\xf4\xf5\xc6\xdb\x18\xfa\xc7\
+\x97\x36\xdf\xa1\x24\x26\x98\x7f\x39\x86\xa5\x1c\xc0\x3d\xa9\x0c\
+\xe2\x69\xf2\x48\xa9\xbb\x81\x7d\x30\x07\x2a\x09\x03\x7b\xb1\x24\
+\x60\x23\x89\x1f\x28\x8e\x6d\xf6\x06\xff\x12\x0a\xd2\x09\x8d\x63\
+\x49\xa7\x6f\xa0\x79\x2c\x3a\xf4\x03\x34\x0e\xa1\xb5\x1c\xf2\x05\
+\x95\x9f\x8b\x1f\xaf\x93\x1b\xd8\x9b\xc4\x1a\x7a\xab\xf5\x2a\xca\
+\x59\x39\x1a\xd8\x2b\x6b\x51\xcf\x90\x66\x93\x64\xdb\xe1\x84\x92\
+\xd8\xd7\xd9\x34\x12\xba\x01\xfc\xf6\x5d\xc1\xea\xd7\x0a\x6b\x32\
+\xb7\xa2\x31\x31\x09\xdd\xea\x6c\x6d\x1d\xbd\x21\x9f\x80\x40\xdc\
+\xff\xc2\x05\xb9\x31\xb0\x32\x3c\x41\x27\xa0\x0d\x0c\xdc\xff\x38\
+\x49\x6e\x60\x3b\x89\x13\x49\xcd\x57\x51\x2e\x1e\xff\xe5\xd0\x15\
+\xf3\xaf\x48\x34\xf6\xb2\x74\x1e\x84\x2a\xba\x62\x7f\xd3\x84\xa1\
+\xb7\x5b\x00\xf0\x5c\xe7\x46\x92\x06\x9c\x65\x1e\x16\x33\x31\xa3\
+\x50\x46\xe2\x90\x11\x32\x91\x8e\xe3\x21\x5d\xde\xf2\xa1\xb5\x40\
+\x80\x05\xae\x44\x02\x91\xfc\x0e\x7b\xbe\x76\xae\x8a\x32\xf0\x2f\
+\xd9\x2d\x2c\xaf\x13\x7c\xed\x0a\x10\xf0\xec\x36\x08\x74\x65\xe4\
+\xbf\x9c\xbd\x43\xc2\xc0\x16\x77\x11\x1a\x99\x26\x0c\xbd\xd3\x04\
+\x80\x7f\xd6\x28\xb1\x8f\x9f\x53\x1f\x98\x48\x3c\x64\x66\x60\x41\
+\xb2\xcc\xdb\xf1\x0b\xd6\xd1\xa2\xa9\x25\x98\x1d\xe6\x58\xa2\xc6\
+\x1e\x84\xa5\x3b\xcd\xff\x46\x06\x3e\xce\x6e\x61\x1f\xd2\x3a\xc1\
+\x63\x5c\xe0\xf3\xec\xcb\xfb\x4a\xce\x62\x00\x3e\x7e\xd6\x0f\x66\
+\x70\xa3\xd3\xc9\x2e\xc5\x40\x27\x01\xf0\x61\x13\x00\x7e\x6c\x1e\
+\xac\xa6\x75\xd1\xae\x41\xf3\xc0\x7e\x56\x99\xfb\x23\xc2\xc0\x72\
+\x83\x44\x66\x0b\x07\x83\xe6\x8a\x55\x46\x2b\x0f\x0b\x03\x77\x2c\
+\x97\x50\x19\xf8\x34\xbb\x85\x1d\xa4\x75\x82\x9b\xaf\xa2\xec\x1f\
+\x4c\xbc\xd1\x2a\x94\x81\xcd\xe8\x58\xe0\xb1\x3d\x4d\xd2\xce\x70\
+\xfe\xe7\x79\x2b\x1a\x5a\x18\xd2\xd4\xae\xa6\x8d\x42\x78\x4b\x18\
+\xd8\x13\x43\x64\xe9\x26\xff\x0b\xd0\x2b\x05\x2d\x68\x06\x89\xb7\
+\x81\xb2\x11\x08\x64\xf9\x60\x24\x94\x1f\x5d\x7a\x13\x1b\x51\x4f\
+\xf9\x6d\x52\x00\xdf\x7f\x96\x7d\x71\x77\xe5\xb4\x68\x0c\xf8\xd5\
+\x18\x34\x59\xf0\x14\x49\x52\x49\x84\xaf\x37\x95\xd0\xa1\x96\x43\
+\x1c\x5d\x2f\xb2\x02\x59\x37\x4b\xa3\xab\x0f\xbc\x82\x81\xe5\x1c\
+\x06\x12\x90\xeb\xe4\x59\xf3\x95\x45\x43\xdb\xde\x10\xf7\x58\x7d\
+\x2e\xae\xf2\xdb\xd8\xa3\x9c\x4e\xf0\xf5\xe6\xab\x28\x4b\x1a\x58\
+\x0e\xbb\x0b\x0a\xba\xdf\xd8\x43\xfd\xb3\xaa\x3d\x36\xa6\x1f\x36\
+\x31\x2c\xaf\xe5\xa8\x18\xd8\xf8\x54\x7d\xe0\x15\x0c\x4c\xc6\xc0\
+\x5a\x6e\xb5\x82\x81\x51\x87\x5e\x56\x0c\x4c\xa0\xac\x0b\x9d\x1f\
+\x50\xb8\xf8\xe4\x46\x7a\x23\xbb\x95\x53\x43\x6f\x35\x5f\x45\xb9\
+\x78\xec\xb3\x66\x56\x6d\xa6\x14\xac\x36\xa8\xb5\x58\xc6\xc0\x93\
+\x9c\x11\xbc\xd3\x08\x80\x1f\x39\x03\xa3\xd1\x25\xd8\x28\x58\x8d\
+\x28\xa3\x45\xab\xd9\x15\xd1\x8a\x2b\x2d\x50\x8d\x0c\x8c\x12\xaf\
+\xd6\x88\xd6\x0a\x06\x96\xa7\xf1\xf1\x59\x7e\x96\xc8\x99\x48\x6a\
+\xbf\x8a\x92\xd3\xc0\x5e\xbd\x61\x8e\x95\xcc\x44\xb5\x14\x27\xa1\
+\x97\x0d\x1e\x6c\x62\x58\xae\xa1\xb5\x78\x99\xa8\xa2\x4b\x0d\xe1\
+\x0b\xeb\x5a\x4d\xb3\xfc\x0e\x85\x96\x05\x6f\xdb\xd4\x3d\xd2\x29\
+\xdd\xdc\x6a\x79\x5f\x09\x68\xd4\x8c\xd2\x49\x7e\x2b\x7b\x99\x51\
+\x43\x8f\x48\x22\x35\xb0\xb4\x2f\xe4\xac\x2c\x39\x7a\xc7\x9d\x60\
+\xd5\x79\x40\x11\xbf\x0b\xaa\x59\xff\xf1\x2a\x99\x8f\x55\x59\xaa\
+\x87\x46\x2d\x91\x34\x1f\x58\x13\x49\xce\xba\x8e\x5b\xd2\x26\xaf\
+\x80\x5f\xfb\x5b\x54\x67\x45\xd6\x7b\xc8\xc0\x9a\xad\x47\x93\x49\
+\xe5\x83\xb7\x0d\xd0\x44\xc6\x44\xd2\xf5\xf6\x8b\x38\xfa\x34\x30\
+\xab\x31\xab\x9f\x04\xc9\x4e\x58\x2b\x9b\x55\x1f\x68\x50\xe6\x6c\
+\x53\x87\x15\x7b\x0a\x0d\x96\x1e\x85\x96\xd8\x95\xb3\xae\x96\xa4\
+\x1a\x12\xd1\x5b\x8e\xb4\x8e\xd2\x10\xac\x7c\x3d\x20\xf5\x22\xc5\
+\xf5\x84\x51\x94\x64\x41\xd9\x6f\x8f\x1b\x30\xb3\x8c\x4e\xf0\x56\
+\xfb\x45\x1c\xb3\x7e\x24\xa5\x65\x14\xb9\xa2\x43\xe2\x24\xe8\x4a\
+\x50\xaa\x0f\x50\xfa\x52\xd7\x5f\x8b\xb5\xd7\x0c\x80\xe7\xda\x66\
+\xa4\x78\x93\xf2\x48\x40\x0b\x5d\x79\x4e\xd7\x73\x71\x54\x33\xb0\
+\x7e\x4e\x61\xa6\xb4\x15\x4a\x6b\x25\x65\x7f\x9b\x83\x14\x9d\x7d\
+\x67\x9c\xfe\x3b\x6d\xc0\xcc\x76\x12\x3a\xc1\x57\xa0\x88\x43\xd2\
+\xc0\x12\xce\xec\x3c\xb4\x09\x14\x6a\x82\x6a\x06\xa6\xf5\x8f\x96\
+\xbd\xd3\x0e\x80\x9f\x84\x92\x0b\xab\xe9\x20\x0a\x43\x9d\x0d\xc1\
+\xda\xc0\xa0\x31\xaf\x80\x60\x32\x04\x5b\x06\x09\xb1\x66\x60\x49\
+\x31\x49\xc1\x3a\xfb\xbf\x12\xb7\xe8\x1a\x30\xb3\x83\x7c\x4e\xf0\
+\xb5\x2b\x50\xc4\x31\x9b\xed\x6a\x09\x65\x29\x1d\xe2\x53\x46\x85\
+\x81\xdd\x84\x74\xa8\x93\x64\x37\xd6\x5d\xca\xd1\x44\x2f\xa1\x37\
+\x34\x78\xf0\xc9\xfa\x3f\x62\xf2\x08\x0d\x80\x1a\x8a\x22\x65\x60\
+\x4d\x2f\x91\x4f\x4d\xf0\xc2\xd5\x38\xa9\x03\xb4\x54\x44\x4a\xd5\
+\x51\x3b\xb7\x79\xef\x7d\xd6\x80\xa1\x3d\x4f\xe7\x04\x5f\xea\x02\
+\x27\x1f\x85\x65\x69\x60\x81\xad\x55\x61\x15\xc3\x20\xb5\x31\x4b\
+\x5b\x1a\x03\xaf\x7d\xb0\xdd\xf9\x7c\xde\x92\x86\x76\x96\x65\xfd\
+\xac\x2d\x49\x9a\x48\x32\x7d\xed\xba\xda\x27\x65\x19\x71\x47\x06\
+\x06\xf7\x81\x41\xbf\x06\xf9\xd7\x3c\x0c\xed\x09\x3f\x6c\xc2\xd0\
+\x1e\x65\x73\x82\x2f\x6d\x73\xfc\xaa\x81\x65\x9d\xed\x81\x0f\x77\
+\x30\x83\x58\xbc\xd8\xe9\xb4\x56\x58\x60\x51\xe8\xb5\x3b\xc1\xdb\
+\x2d\x01\xf8\xe7\x90\x22\x57\x01\x8d\x34\x64\xe0\xaa\x4b\xb8\x2a\
+\xee\x70\x95\x13\xbb\x91\xb4\x83\x53\xfb\x9a\x54\x0c\x41\x2c\xe0\
+\xd0\xfd\x36\xf7\x64\x59\x7d\xdc\xcc\x56\x4d\x79\x05\x8a\x38\x38\
+\x0d\x8c\x60\x45\x1c\xc6\xc1\xc2\xc0\x42\xbd\xe4\x71\x18\x9a\xc0\
+\x09\xfe\xd8\x12\x80\x9f\xa8\xee\xd5\xd0\xb1\x0c\xda\x08\xc7\x59\
+\xa8\x9c\x71\x3e\xb5\xe9\x59\x96\x11\xd6\x8a\x10\x6b\x5d\x52\x45\
+\x8e\xe4\xda\xdc\x83\x8d\xfe\xe8\xbf\xb7\x93\x16\x2c\x6d\x3b\x99\
+\x13\x7c\xa9\x82\x7e\xd0\xc2\xaa\xce\x5e\x68\x5c\x24\x04\xb0\xe4\
+\x1c\x4c\x9b\x88\xa8\xaa\x50\x8f\xfc\x59\xb3\x13\xdc\x4a\x27\x83\
+\x26\x92\x28\x16\x52\x3a\x04\xc3\x16\x48\x18\x48\x39\xee\x8d\x46\
+\xc3\x82\x73\x1f\x07\xed\x78\x77\x18\x03\x91\xf6\x7b\x62\x4c\x06\
+\xe3\x0f\x4d\x98\xda\x8f\xb9\x34\xf4\xf5\x2b\x50\xc4\x31\xd3\x99\
+\xb2\x0a\x5f\x63\x61\xf1\xc6\xea\xba\x22\xd0\x5a\x84\xb3\x4d\x16\
+\xb8\xea\x48\xb2\xa1\x61\x3c\x51\xc7\x8f\xfa\x96\xe8\xd3\xa0\xdc\
+\xaa\x3a\x71\x25\xc8\xed\x90\x7b\xd2\x38\x97\x53\x30\x07\xb2\xe3\
+\x3e\xeb\xcf\xe3\x26\x4c\xed\x6e\x2e\x00\x5f\x85\x22\x8e\xc5\xe3\
+\x2f\xd6\x56\x5a\x5b\x87\x9a\x9c\xc5\x46\x1d\xc7\xb8\xe6\x43\x46\
+\x77\xda\x02\xf0\x03\x0f\x5c\x51\x2c\xa9\x1c\xb0\xb1\x7e\x04\x58\
+\xdd\x80\x1a\xa6\x86\xf8\x5a\x3d\x6b\x45\x8d\x74\x14\xc6\x47\xff\
+\x65\xfd\xad\x0d\x5b\x4b\xa5\xa1\x2f\x4d\x22\x3d\x6c\x63\x51\xbb\
+\x1a\xbe\x2a\xa1\xd5\x23\x43\xa7\x02\x1d\xd0\xd1\xbf\x5b\xab\x82\
+\x3e\x6c\x0b\xc0\x8f\xad\xd5\xc8\x1c\xde\xea\x58\x38\xaa\x5f\x2a\
+\x44\x62\x00\x34\x04\x1f\x39\xba\xc0\x10\x37\x80\x58\x87\x65\xee\
+\x4e\xf6\xd1\xd0\xa3\x8b\x39\xbe\xc8\xa4\xa0\xcf\xdb\x58\xd4\xf7\
+\x38\xa0\x5f\xd9\xd7\x43\xfc\x2a\x14\x73\xa8\xdc\x5b\xe7\x68\xca\
+\x26\x06\x52\xd6\x1d\x49\x06\x5b\x1b\x40\x54\xbb\xc0\x54\x11\x32\
+\x2e\xdf\x80\xe0\xee\xd2\xd0\x05\x26\x9b\x31\xcd\x83\x3d\x86\x31\
+\xac\x8e\xde\xb5\x61\x6b\x07\x99\x34\xf4\xd6\x15\x28\xe2\x98\x95\
+\x76\x7e\x88\x1a\xda\x5d\x60\x58\x61\x80\x56\x4a\xf4\x76\x93\x44\
+\x8a\x5d\xfd\x18\x68\x13\xa9\x6a\x34\x02\x8a\xc7\x2c\x18\x05\xfb\
+\x51\x66\x83\x8a\xf3\x21\xf8\x21\x48\x70\x2c\xb5\x94\x03\x27\xb8\
+\x64\xf0\x9f\xb5\x61\x6d\xcf\x13\x55\x53\x5e\x89\x1c\x92\xb5\xf3\
+\xd7\x2e\x95\x0c\xd4\xb1\x78\xa8\x1f\x51\x6b\x01\xd7\x83\x8d\x82\
+\x76\x27\xd8\xc3\x4e\x80\x03\xdf\x17\x82\x24\xc6\x40\xc1\x30\x20\
+\x68\x3f\x33\xc9\xa2\x0e\x3e\x95\x83\xac\xa9\x90\x24\xe4\x58\x73\
+\x30\x75\xad\x58\x5b\x1e\x27\xf8\x32\x17\xf8\xbb\x36\x56\x74\xb6\
+\xa7\x94\xeb\x1b\x7a\x31\x89\x5a\xdf\x05\xa3\xe4\x8b\xee\xc6\x46\
+\x41\x07\x27\x58\x29\xd5\xf0\x06\x01\xb9\x40\x61\xf8\x55\x74\x69\
+\x4d\x37\xc3\x50\x4d\x03\x85\x04\x40\xd0\xdd\xa5\x33\x11\x60\x10\
+\x85\x5e\x30\xf0\x51\x23\xe6\x76\x33\x8d\x13\x7c\x99\x0b\xdc\xca\
+\x8a\xde\xed\xb4\xf8\xca\xe5\xb3\x30\x30\xd5\xe3\x22\x62\xbd\xef\
+\x3a\x35\x74\x73\x0a\xba\xaf\xa6\x24\xaf\x76\x89\xfb\x1e\x60\xd8\
+\xf8\x30\xa4\x88\x30\xfe\x05\x04\x25\x3f\xa1\x33\x00\x00\x20\x00\
+\x49\x44\x41\x54\x3f\x17\x22\x62\xd1\x67\xeb\xdb\x47\xfe\x1d\x45\
+\x12\x3e\x69\x85\x2f\xd2\x38\xc1\x97\xb8\xc0\xdf\x36\xb2\xa0\xb3\
+\xff\xe8\x96\x8e\x9e\xa1\x90\x2c\x92\x5b\xa3\x97\x52\x5a\xc9\xc1\
+\xfa\x8a\xb1\x3e\xb6\x07\x60\xef\xcf\xb7\x3d\x0f\x02\x62\xa1\x4a\
+\x24\xfd\x8f\xbd\xeb\x79\x8d\x23\xb9\xc2\x20\x98\x4b\x6e\x06\x7b\
+\x65\xb2\xe4\xa8\x3f\x44\x30\x62\x6c\x8b\x01\x07\x16\x67\x09\xe4\
+\x90\x83\x15\x63\xfb\x22\x90\x32\x60\xf0\x21\xb0\xde\x2c\xae\xcd\
+\x21\x60\x48\x08\x04\x22\x70\x2c\x7b\x8a\x3d\x18\x6c\x6f\x51\xb5\
+\xbe\x2d\x66\xc1\x27\xc3\x18\x87\x35\xfb\xbf\xa4\xbb\xaa\x5e\xfd\
+\xe8\xa9\x9e\x5f\xdd\x5d\xad\xf7\xac\xd2\x48\xd3\x92\x06\x89\xa9\
+\xae\xaf\xbf\xf7\x7d\xef\xbd\x6a\x19\xfc\xce\x75\x8b\x84\x7f\x80\
+\x87\x96\x96\xc7\x38\x6c\xbb\x03\x8a\xc7\xb7\x9d\x14\xe3\x3b\x2c\
+\xeb\xed\xe5\x59\x11\xc1\x04\x1a\x81\x6d\x1d\x87\x8f\xc8\x3c\x05\
+\x4f\x43\x16\x49\x15\x17\x75\xe7\x43\xe3\x8b\xa0\xcd\xb6\x1c\xaa\
+\x66\xc8\x28\x3b\xec\xcb\x25\x95\xac\xcc\x2a\x9f\x33\xa6\xab\xe5\
+\x5c\x06\xda\xc1\x59\xf2\x20\x3e\xc1\xb2\xde\xf6\xce\x88\x08\xde\
+\xa2\x91\x43\xf2\x85\x58\x25\x68\x7d\x69\x9e\x0c\x63\x3d\x19\x94\
+\xfd\x79\x6d\x77\x7a\x1e\x41\x87\x22\xd8\xed\x76\x20\x9d\xbc\x0d\
+\x72\xbc\xd5\x6c\x6e\x18\x44\x83\x59\xe8\x7f\xcf\x43\x07\x8b\x47\
+\xad\x12\xd1\xe6\xd0\x50\x3a\x37\x95\x78\x00\x3c\x3c\x23\x22\x78\
+\x40\x22\x87\x54\x0c\xdf\x02\xcc\x01\xca\x3a\xb3\xa8\x62\x01\x57\
+\x29\x34\x2a\x0f\xcf\x3d\xe8\x20\x13\x1c\x16\x5f\x71\x25\xe7\xc8\
+\x34\x7a\x0a\x72\x49\xa1\x5b\x18\x08\x95\x90\x90\x3d\x6d\x6b\x58\
+\x4f\xfd\x15\x17\xf2\x06\xe5\x40\xb3\xe0\x8e\xcf\x86\x08\xde\x41\
+\xbe\x9b\x7b\x50\x88\x05\xbb\xb3\xb8\x24\xb0\x0c\xee\xc7\x30\x5f\
+\x87\xe0\x60\xdc\xd1\xfe\xee\x07\x18\x07\xaf\x89\x9e\xe3\xcb\x60\
+\xd8\xc8\xc0\x13\x2f\x4d\x34\x41\xcc\xbf\x82\xfb\x13\x26\x83\xea\
+\x39\x34\x0b\x6e\x74\x36\x44\x30\x8d\x1c\xd2\x70\x38\x76\x0b\x21\
+\xe8\x12\x87\x4d\xa1\xa3\x45\xe4\x6f\x3f\x6d\x17\x53\x37\xf5\xd0\
+\xd7\x50\x02\xf8\xad\xb7\xa7\x64\x54\x6d\x25\x83\x2d\xdc\xd3\xd0\
+\xe5\xce\xbc\x0a\x71\x2e\x55\xe0\x6b\xc5\x65\x5c\x61\xc2\xde\xc7\
+\xd2\x68\x34\xdb\xb2\x4c\xd2\x99\x90\xc0\x17\xd1\xcc\xe6\xae\xdb\
+\xd1\x6e\x1a\x3a\x9b\xbc\x92\x9e\x94\x09\x72\xe9\xa4\xa7\x10\xd3\
+\x66\x3a\x95\x9e\xe0\xea\x64\xc9\xa4\xb3\xe5\x37\x17\xab\xd4\x73\
+\xa4\x5e\x2d\xa3\xfc\x1d\x87\x4a\x8e\x20\x91\xe4\xfa\xc7\xf0\xc4\
+\x7c\x57\xce\x82\x08\x1e\x10\x68\x04\x86\x42\xac\xa8\x8a\x12\x96\
+\x46\x5c\x37\x14\x25\x35\x5c\x50\xf8\xba\x03\x00\x8f\x50\xe2\xd7\
+\xf6\x04\xd7\x68\x5e\xe5\x2b\xaa\x92\xa1\x36\x0f\xd3\xc8\x3c\x6e\
+\x27\xac\x36\xf8\x2b\xe5\x9d\x2b\x1f\x4a\x17\x4f\x78\x38\x63\x49\
+\x26\xe9\xfa\x19\x90\xc0\x5f\xe0\x99\xcc\x2b\xa1\x9e\xf2\x24\xcc\
+\xab\x3d\x70\x8a\x87\x06\x8b\xe1\x84\xa7\xe7\x16\x56\xb4\x31\xd6\
+\x9c\xdf\x14\x54\xc2\xc4\xad\xfe\x61\x6b\x75\x50\xb4\x11\x72\x74\
+\x54\xc2\xa1\x82\x32\x69\xaf\x7c\x7d\x28\x5d\x7c\x7e\x85\x67\xcd\
+\xed\x9d\x01\x11\x4c\xa1\x11\xd8\x14\x62\x85\xbd\x48\x96\x7e\x6d\
+\x3b\xbf\x5a\x90\xdc\xec\xcc\xc6\x42\x8a\x5f\x23\x82\x79\xda\xf5\
+\xab\xb2\xb2\xac\x57\xc3\x89\xe0\x5b\x46\x99\x63\xaf\x81\x83\x50\
+\xba\x44\xf3\x63\x44\x8b\xae\x7f\x11\xbc\x45\xa1\x11\xd8\x14\x62\
+\xc5\x52\xca\xa5\x81\x53\x4b\x4e\x56\xcb\x0b\xda\xb7\xb1\xf6\xb0\
+\x02\xf8\xce\x5c\x07\xc3\xbc\x2a\xae\x3a\x55\x89\x6a\x8d\xca\x35\
+\x73\x8e\x95\x15\x6c\xca\xe1\x4f\x96\x4d\x20\xfc\x88\x68\xd1\xbd\
+\xef\x5d\x04\x2f\x96\xc0\x47\x88\xe6\xf2\x5e\xa5\x15\xc9\x6b\x60\
+\x59\x89\xf8\x78\x18\xc8\xd9\x52\xc0\xb6\xab\xb1\xf0\xdc\x12\x29\
+\xdd\xcf\x90\xce\x0b\xc9\xc5\x79\xa1\xa0\x67\x50\xce\x27\x8f\xe7\
+\xe9\x3c\x8c\x9f\x3d\x8e\x4f\x11\x2d\xba\x51\xef\x22\x78\x87\x46\
+\x0e\xc9\x56\x52\x4e\xe7\xda\xd3\x16\x87\xce\x7e\x9c\xb6\x4c\xc1\
+\x57\x0e\xd0\x8e\x18\x93\x0b\x26\x50\x2a\x55\x6f\xee\x27\x8a\x2b\
+\x43\xa9\x0c\x89\x60\x1e\x93\x70\x79\x78\x82\x69\xd5\x7d\xd6\xb7\
+\x08\x46\xbf\x9b\xbb\x1b\x0f\x65\x72\xac\x08\x60\x79\x74\x9e\x43\
+\x0a\x01\xbc\x60\x70\xb5\xce\x58\xf4\xea\x69\xf2\x8c\x3d\xc5\xb4\
+\xea\x76\x7b\x16\xc1\x5b\x44\x72\x48\x65\x25\x25\x4f\x8e\x55\x17\
+\xda\xe9\x27\x5f\x06\x1d\x97\x72\x34\x1a\x72\xb5\x97\xd4\x5c\x72\
+\x51\x2d\xbb\x97\xfd\x8a\xe0\x01\xfe\xcd\x64\x5d\x25\x65\x23\x06\
+\x56\xea\xfe\x39\x01\x57\x5c\xac\xce\x47\xfa\x92\x3b\x45\xb5\xec\
+\xae\xf5\x2b\x82\x77\x88\xe4\x90\xca\x3b\x9b\x45\x1b\xfc\x57\x19\
+\x78\x29\x13\xcb\xef\xcf\x09\xd8\x37\x24\x55\x78\x54\xae\x1b\x38\
+\xaf\x16\x4e\xa7\x2f\xb9\x72\x86\x6a\xe1\xf5\x2b\x82\xa9\xe4\x90\
+\x6c\x21\x56\x65\xac\x13\x42\x2b\x75\x74\x4e\xc0\x7e\x6b\xca\x24\
+\xe4\xd2\x45\xd0\x7c\x59\xe4\xcc\xd7\xa3\x60\x44\xb5\x94\x4b\x33\
+\x49\xbd\x4a\x60\x5c\xf3\xb8\x9b\x5c\x0b\x72\x91\x46\xab\x14\xd7\
+\x7f\x3f\x3e\x27\xe0\x84\x0d\xbd\xc8\x57\xe6\xc9\x4d\xdf\xe5\x12\
+\x14\x7b\x87\x9b\x27\x75\xcf\x45\x5c\xa1\x5f\x9f\x22\x78\x40\x25\
+\x87\xa4\x2b\x29\x65\xbc\xd9\x3f\xaf\x94\x42\xf3\x25\xa1\x5d\x6b\
+\x46\x34\xae\x1b\x22\x25\x5d\x2c\xbe\x02\x83\x2e\x89\xb0\x65\xa2\
+\xb6\x63\x8e\xbc\x53\xa2\x67\xfa\x08\xd7\xca\xfb\xac\x47\x11\xbc\
+\x43\xa2\x0f\x49\x8f\x7d\xbe\x82\x0b\xcd\x17\xc4\x7f\xed\x95\x63\
+\xed\xe3\xc6\xef\x12\x17\x8b\xb7\xe1\x4a\x4b\xaf\x81\x7d\x37\x3f\
+\x1c\xbc\xc0\xb5\xf2\x76\x7b\x14\xc1\x64\x72\x48\xe6\xde\xa2\x4d\
+\x4c\xe8\xf6\xca\xb1\x30\x6e\x85\x95\x76\xb1\x3a\x1f\x69\x13\xeb\
+\x31\xb2\xa5\xf7\xb2\x37\x11\xbc\x45\xa3\x0f\x49\x8f\x9f\x65\x63\
+\x00\xab\x67\xad\xe0\xf7\x3d\x72\xfc\x46\x2e\x56\xb7\xf8\x4d\x07\
+\x4d\xdf\x21\x5b\x7a\x7b\xbd\x89\xe0\x01\x85\xbd\xec\xa0\x92\xb2\
+\x05\x00\xab\xbf\xb5\x10\x44\x8f\x0e\xd0\x8f\x9e\x19\xf8\x14\xd9\
+\xd2\x1b\xf7\x26\x82\x77\x28\xec\x65\x07\x00\x6e\x56\x88\x65\xf5\
+\xdd\xd1\x27\x9e\x42\x5a\xb4\x2f\x56\xb6\x4a\x8e\x13\x6c\x6b\xef\
+\xb8\x2f\x11\x4c\xc7\xc2\x2a\x6f\x0e\xdc\x02\x03\x37\xf7\xb1\x66\
+\xfb\xf8\xf1\xab\x6f\x13\xdc\x23\x80\x9f\x61\x5b\x7b\xbb\x3d\x89\
+\xe0\x2d\x32\x39\xa4\x62\x48\xd5\x02\x03\x2b\xf9\xef\xa6\x01\xf4\
+\x0d\x02\x00\xbe\xd3\x6f\x08\xcd\xd1\x2d\xbe\x4b\xfd\x88\xe0\x05\
+\x12\xf8\x05\xba\x39\x9c\xb6\x41\xc0\x8d\xeb\xb1\x28\x04\xd0\x19\
+\x6d\x68\x9e\xbc\xea\x4a\x74\x8b\x6f\xbf\x1f\x11\xbc\x43\xa4\x0c\
+\x5a\x0f\xde\x12\x80\x4f\x3e\x6d\x07\x3a\xb3\x0d\x9d\x1c\x53\x7c\
+\xab\xaf\x1f\x11\x4c\x27\x87\x14\xf5\x32\x34\x09\xa1\x8b\xf1\xd7\
+\xf1\x27\x5b\x43\x99\xdd\x86\x4e\xeb\x1e\x2c\xf7\xf8\x5e\x2d\x93\
+\xd4\x8b\x04\xc6\x37\x83\xbb\xdc\xdc\xba\xbb\xf2\xd8\x00\xc0\xf2\
+\x37\x1b\xe3\x77\xfc\x8a\x08\x80\x79\x46\x04\x57\x1f\xe8\x8a\xa1\
+\x35\x7f\xf4\x21\x82\xeb\x25\xf0\x9f\x86\x18\x01\xdc\x4e\x08\xdd\
+\x40\x06\xd3\x10\xc0\x39\x6d\xe8\xe4\x29\x43\xb5\x33\x34\x8c\x3f\
+\xf7\x20\x82\x77\xe8\xe4\x90\x86\xc3\xab\xad\x85\xd0\x85\x0c\x9e\
+\x6d\x86\xdf\x63\x2a\xf8\xcd\x67\x43\x27\xcf\x99\x7c\x84\x90\x40\
+\x7a\x10\xc1\x64\xca\xa0\xb5\x0f\xc8\x79\xea\x62\xbe\xd9\xb2\x7a\
+\xbe\x89\x0c\x9e\xfd\x8f\x0c\x7e\x33\xda\xd0\xc9\xb8\xe9\x05\xc2\
+\x05\xf8\x20\xbb\x08\xde\x22\x64\x61\x0d\x87\xd7\xb8\x4c\x28\xe0\
+\x4d\xb5\xdc\x06\xad\xc1\xb3\x5d\x3a\xf8\xad\xde\x5f\xa5\xcb\x18\
+\x3a\x71\xd2\xf8\x63\x8c\x0b\x30\xbb\x08\x1e\x10\xca\x21\x99\xfb\
+\x32\xb4\xa5\x81\x8b\x75\xb5\xb6\x15\x4d\x0a\xbf\x19\x6d\xe8\x44\
+\xd4\x84\xaf\x1d\x69\x71\x26\xe9\x7a\x6e\x00\xff\x01\xe3\xf4\xdd\
+\x4b\xc9\xa9\x8d\x01\xbc\x36\x82\x89\xe1\xf7\xa0\x5f\x0d\x7c\x8a\
+\x71\x05\xbe\xcf\x0d\x60\x02\xb7\xf4\x0e\x01\x2c\xa5\x6a\x25\x8b\
+\x04\x08\xfe\xc7\xf8\x13\xc6\x6f\xb6\x3c\x12\x9f\xcf\x22\x15\x3f\
+\x43\x09\xe0\x51\x6e\x11\x5c\xf7\xef\x7e\x8b\x71\xf6\x86\xbf\x4e\
+\xca\x29\xd9\x20\xb8\x7b\x3e\x5c\x1d\xbf\xef\x88\xe1\x37\x6b\x3b\
+\xc3\xdc\x49\x93\x27\x28\x97\xe0\xa5\xbc\x00\xfe\x15\x9d\x32\x68\
+\x03\xe0\x16\x5d\x68\xeb\x45\xaf\x9a\x4d\x9a\x1d\xbe\xa2\x06\xe0\
+\x5b\x19\x4d\xac\x79\xdd\x83\x13\xc0\xb5\xb7\xfb\xfe\x4f\x5e\x09\
+\x8c\x72\xf2\xf4\x8d\x55\xec\xe5\xdc\x7f\x95\xcd\x56\xd7\xb3\x8b\
+\x2b\x85\xd1\xe3\xcb\xfc\x09\x35\x00\xe7\xcb\x23\x41\xf5\x95\xff\
+\xaa\xf0\xf5\x13\x2e\xb6\xb1\xae\x67\x2d\xe3\xf8\x02\xe7\xe4\x49\
+\xe5\xe0\x6b\x6e\x3c\xab\x9a\xa4\x91\x60\x6c\x2f\x0f\xa3\x67\xa3\
+\xcf\x95\x7a\x43\x0d\xc0\x77\x33\x33\xb0\x86\xaf\x6f\x4e\xc2\xb9\
+\x06\xf7\xb2\x96\x72\xd0\x29\x83\xd6\x83\x4b\x4f\xbb\x01\x11\x37\
+\x5d\x5f\xcf\x8f\x96\x90\xf0\xf0\xb0\xf8\x27\xe2\x80\xdc\x60\x79\
+\x35\xb0\x89\x9f\xa4\xf5\x31\xa6\x38\xd7\xe0\x28\xa7\x08\xde\x22\
+\x65\x61\x15\x00\xe6\x61\x35\xbc\x8b\xa3\x9b\x2f\xb0\xed\x45\x4a\
+\x78\xf8\xe1\x73\xfd\x2f\xce\x01\xbc\x79\x29\x96\x8b\x9d\xbd\xf8\
+\x91\x48\x17\xe1\xa5\x8c\xa5\x1c\x03\x3a\x65\xd0\xe5\x18\x73\x69\
+\xe8\x57\x3a\xff\xb9\x0d\x06\x2e\x49\xf8\xd9\xf6\x70\x5c\x07\xdf\
+\xcb\x76\x4b\x78\x7a\x00\xe6\xb9\x42\x68\xaf\x7f\x03\x19\x3c\xc3\
+\xb9\x0a\x77\x33\x8a\xe0\x1d\x3a\x65\xd0\x3a\x7a\xe1\x8a\xfb\xd8\
+\x19\xcc\x90\x76\x56\xa1\x7c\xba\x3d\x9b\xd7\xc2\xb3\xe1\xe1\xe5\
+\xa9\x7d\xc5\xb7\xf4\x00\xfc\x36\x23\x03\xfb\xfc\x91\x3d\x6f\xc8\
+\xee\x8e\xe4\xc7\xcb\x7c\x22\x98\x96\x85\x55\xde\x19\x09\x2e\xe1\
+\x0a\x64\x70\x6b\x08\x2e\x96\xd9\x5f\x0a\x0c\x3b\x10\xcf\x66\xc3\
+\xf1\xe4\xc2\x43\xff\xc7\x1f\xd0\x03\xf0\x97\x19\x1b\x82\xbd\xfd\
+\x0c\xa9\x04\xac\x00\xde\xcb\x26\x82\xb7\x88\xec\x06\xed\x01\xec\
+\x62\x67\xb8\xa4\xb7\x88\xdf\x72\x4c\xc5\xdf\x2f\x4c\x26\xf7\x7f\
+\xf9\x65\x32\x39\xbc\xf0\x4f\x19\xfd\xe9\xaf\xe9\x01\xf8\x56\x3e\
+\x13\xcb\x05\x4f\x70\xfa\x30\x76\xf4\x5b\x25\x97\x4d\x04\x0f\x88\
+\xec\x06\xed\x01\x6c\x43\x30\x1b\x8a\xc1\x62\x50\x62\xe3\x8f\x14\
+\x5d\x4c\xcb\x31\xaf\xac\x5f\xd1\x03\xf0\x1d\xa5\x98\xe8\xf8\x51\
+\x7c\x28\x17\x35\x99\xf3\x65\xae\xbe\x53\xac\x00\xae\xdb\x21\xfa\
+\x7a\x2e\x00\xa3\x9d\xb8\xab\x11\x03\x9b\x8c\x62\xd3\x7b\x52\xb3\
+\x5a\x20\x57\xc7\x13\x7a\x00\xbe\x9d\x4d\x03\x4b\x19\xf2\xaf\x49\
+\xe2\x3f\x42\x4b\x24\xb9\x00\x9c\xf6\xb0\xbe\xc4\x3a\x6f\xc3\xfd\
+\x28\x0b\xec\x16\x42\x1b\x4b\x6c\x41\x42\xc5\x92\xb5\xb8\x41\x0f\
+\xc0\x37\x59\x36\x0d\x6c\xf3\x7f\x4e\x01\x17\x07\x5f\xa1\x5d\x88\
+\x0f\x32\xb9\x58\xe9\x0b\xc5\x63\xc4\x00\xb6\x01\x98\xfe\xea\xfc\
+\x90\x06\x11\xb4\x88\x71\xba\x08\xda\x04\xeb\x38\xb2\x24\x82\x85\
+\x52\xce\x76\xd4\xb7\x73\x56\xa6\x8a\x4e\xf1\x17\x68\x17\xe2\xb5\
+\x3c\x2e\xd6\x16\xa5\x32\x68\x3d\x6f\x6e\x87\x52\x63\x5e\x81\x97\
+\xd5\x94\x7c\x85\x3f\x64\xca\x03\x5b\x6b\x38\x3f\x28\x02\xd8\xbc\
+\xe5\x6e\x3f\x8a\x87\xbb\xd4\xfa\x44\x52\xf1\x84\x97\x49\x86\x79\
+\x5c\xac\x01\x9d\x4e\x7e\x0b\x60\xeb\x84\xf8\x54\x04\x97\xaa\xa1\
+\x08\x16\x95\x67\x60\x5c\xe1\xa3\x6a\xa1\x7f\x28\x29\x02\x98\xe7\
+\xd3\xc0\x81\x8f\x65\xe3\x28\xc4\x00\x3e\xce\x22\x82\x77\x68\x59\
+\x58\xc3\xe1\xcf\x2a\xe8\x28\x55\x90\x99\x90\x0d\x02\x68\x06\x14\
+\xcc\x22\x19\x2c\x2a\x81\x75\xf9\x8a\x6f\x29\x02\xf8\x2d\x5c\xb2\
+\xba\xfa\x04\x0d\x0c\xa7\x0c\x2e\xc0\xe5\x11\x62\x00\x8f\xb2\x88\
+\x60\x62\x16\x96\xde\x90\xa3\x92\x90\xd0\xcf\xac\x11\x01\x87\x60\
+\xd5\x69\x0f\x61\xe2\x68\x88\xa8\x09\xd7\x71\x1c\x1c\xfc\x64\x54\
+\x42\x47\x9f\x2e\x95\xe4\xea\x37\x9c\xea\x41\xbb\x25\x87\x1d\x97\
+\x72\x88\xe0\xe4\xff\xc0\x3c\x6b\xf7\x8c\x8a\xf2\x5b\xb4\x18\x08\
+\xab\xa6\x0e\x16\x4b\xd9\xd0\x56\xff\x1a\x40\x0b\x92\x75\x1c\x50\
+\xc9\xd1\x2d\xfd\xda\x86\x60\x68\x05\x85\x1a\x1c\x85\x1a\xc0\xfb\
+\x19\x00\x9c\x96\xc0\x93\x19\xde\x59\xb3\x3b\xea\xc0\x85\xbc\x5c\
+\x05\xda\x1a\xd9\x98\x82\x43\xfa\x01\xc3\x4a\x78\xf0\x46\x2b\x91\
+\x2c\x80\xbb\xa2\xe0\x20\xb6\xd1\xb0\xb5\x10\xe6\x4a\x5a\x40\x9f\
+\x20\x06\xf0\x30\x83\x08\x4e\x02\xf8\x77\xb8\x01\xec\xdb\x08\x55\
+\x54\x49\xb9\x39\x01\xb3\x60\xa5\x31\x1f\x3d\xdb\x03\xe1\x8d\xea\
+\x57\x14\x01\x7c\x07\xb4\x42\x07\x9f\xc2\x95\x79\x29\xed\x57\x70\
+\xd8\x86\x01\x4a\x61\x51\x03\xf8\x7d\xf7\x00\x4e\x7a\x58\xdb\x93\
+\x23\xd4\x0c\xac\xec\xb6\x0e\xd2\x6d\x6f\x58\xba\xd0\xa2\x41\xf5\
+\x86\x30\x2e\x33\x0b\x7e\x28\x7c\x08\x6d\x94\x5c\xf9\xc3\x27\x14\
+\x01\x7c\x1b\x3c\xf6\x6e\x43\x68\x10\xbe\xfa\x7a\x6b\xbf\x2a\xdc\
+\x0c\x3c\xea\xde\xc5\x4a\x76\xf2\x7f\xc0\x0c\xe0\x7f\x59\xd2\x55\
+\xc1\xbe\x0e\x25\x03\x33\xb5\x21\x01\x87\x79\x5e\xe6\x7c\x69\x06\
+\xf6\xb4\x08\x72\xc4\xdf\xbc\xa1\x08\xe0\xbb\xf6\x72\xd5\x0d\x84\
+\x99\x9e\x3f\x43\xc1\xc6\x7e\xf6\xf5\x94\xc5\x78\x86\x19\xc0\x69\
+\x1b\xab\xf3\x32\x8e\xd7\x13\xcc\x00\x7e\xa8\x7c\x26\xb1\xd4\xbf\
+\xd6\xd1\x52\x1b\x52\x30\x53\x40\xaf\xc2\x0b\x37\x15\xe5\x7f\x81\
+\xa1\x8b\x2f\x37\x28\x02\xf8\x26\x0b\x1c\x80\xb6\x3f\xfd\x1c\xfa\
+\x8b\xad\xf6\x9f\xf5\x57\xa9\x9e\xa2\x06\xf0\x7e\xd7\xa5\x1c\x49\
+\x09\x3c\x41\x0d\x60\x5f\x52\x2b\x95\xef\x6b\x00\x0e\x59\xbb\x42\
+\x28\xf8\x2a\xfc\x1f\xf1\xd9\x8f\xa0\x32\x8b\x68\x25\xa5\xae\xa5\
+\xec\xaa\x9c\x52\x78\x7d\xed\x08\xd8\x17\x62\x15\x9f\xb8\x01\xfc\
+\xa1\x6b\x11\x3c\x48\x5a\x58\xb8\x01\x1c\x6e\xe6\xee\xb6\xc7\xb2\
+\x51\xda\xba\x1f\x42\xf8\x60\xd9\x39\x56\x2c\x08\xab\x99\xfd\xde\
+\x42\x9a\x2a\x80\xf5\x5b\x16\x1d\x7c\xea\x0e\x90\x72\xaa\x19\x53\
+\xee\x16\x1a\xdc\x2a\x20\x1d\x3c\xa1\x06\xf0\xe4\xb8\x63\x00\xa7\
+\x2d\xac\xc9\xe4\x3e\xde\x39\xf3\x98\xf5\x0c\xbc\xe9\xbe\xee\xde\
+\x65\x16\x20\x80\x35\x82\x99\x2b\xe8\x80\xef\x0d\xa2\x19\x4d\x00\
+\x2b\xf3\x96\xb3\xec\x6a\xa7\x9c\x6f\x61\xd3\x81\xb8\x01\x7c\x98\
+\x00\xd8\xef\xbb\x05\xf0\x1f\x3f\x20\x07\x70\x9a\x81\xed\x05\x7f\
+\x2d\x7e\x30\xb8\x04\xc1\x66\x2c\xab\xc8\xd8\xb2\x1c\xe2\x6a\xb4\
+\x24\x4d\x00\x73\x11\x68\x86\x96\x1f\xee\x48\x04\xf5\xaf\x00\xe1\
+\x32\x92\xc6\x8c\xdf\xf1\xe4\xfe\xa5\x4e\x5d\xac\xad\xb4\x85\x55\
+\x0c\xe4\x0c\x6c\x35\x70\x70\xa3\x9d\x65\x0d\xbd\x8b\xfa\x18\xc0\
+\x85\x15\xc2\x7b\x2e\x42\x04\x1e\x0c\xb3\x6c\xfc\x90\x28\x80\x57\
+\xdd\xce\xa0\x59\xbf\xc8\xfc\x1d\xad\x8a\xd3\x36\xc5\x0c\xe0\xd1\
+\x64\xf2\xb1\x53\x17\x2b\x25\x81\x3f\x60\x07\x70\xc4\xc0\x70\x4d\
+\xb7\x05\x18\x6b\x71\x70\x5c\xf5\x2c\x7c\x19\x87\xc7\x2e\x8b\x61\
+\xfc\x03\x4d\x00\xff\x14\x17\x2d\xb7\xc9\xbf\xc5\x4c\xeb\xe9\x2e\
+\xfe\xfe\xc3\x04\x7e\xf1\x6e\x0c\x0d\x00\x9e\x74\x2a\x82\x77\xd2\
+\x16\x16\x66\x00\x8f\x63\x0d\x0c\x95\x1c\x4f\x9b\xec\xc2\xc1\x98\
+\x09\x9d\x99\x08\x78\x1c\xf8\x38\x90\xc3\x34\x7b\x19\xca\x7d\x29\
+\x99\x37\x8b\x85\x6a\xed\xb8\x32\xd1\x29\x06\x46\xbb\x31\xb4\x31\
+\xa1\x0b\x24\x1d\x77\x59\xca\x51\x63\x61\x61\x06\xf0\x88\x07\xb7\
+\x97\x75\xfc\xcb\x5d\xa0\xbb\x1e\xff\x96\xc2\x97\xb1\x60\xb5\x59\
+\x65\x6c\xfd\x2b\x20\x0f\x60\xe3\xaf\x69\x02\xf8\x96\x71\xda\xed\
+\x3b\x37\x86\x7e\xf3\x63\x30\x19\xcc\x6c\xa6\xf1\x8b\x78\x5f\x59\
+\xed\x61\x15\xe3\x5d\x97\x22\x38\x59\x85\xa5\xc7\x0c\x2f\x80\x2b\
+\x5e\x88\x65\x60\xb1\x89\xf8\x0d\xc8\x82\x79\x9e\x8d\x1a\x91\x2c\
+\x03\x9b\x5f\xd1\x05\x70\xf0\xce\x59\xcd\x2e\x61\xeb\x1e\x47\xdf\
+\x97\x14\x9f\x66\x60\xec\x00\x4e\xd9\x58\x1d\x7a\x58\xc6\xc2\x42\
+\x0d\x60\x53\xf9\x1c\xe2\xd7\xae\x91\x92\x2d\x05\x08\xaf\xe5\xcf\
+\xe6\x1b\xcd\xdb\x9a\x85\x99\xcd\x57\xda\x17\xe9\x9f\x96\x43\xb8\
+\x64\x30\x23\x0b\x60\x16\xbc\x73\xf3\xb6\x9b\x1f\x33\x1b\xdf\x98\
+\x03\x61\x7b\xfa\xe3\x47\xf1\x81\x18\xc0\x63\x0d\xa5\x8f\xdd\xb9\
+\x58\x83\x3a\x0b\x0b\x71\x25\xc7\x2e\x57\xb6\x29\x4d\xe7\x7e\xa5\
+\xe9\x4b\xe3\x06\x82\x2a\xd0\x61\x2b\x3c\xdb\x3d\x73\x74\xec\xc7\
+\x58\xd8\x91\x23\xc2\xf6\x24\x97\x0c\x16\xaf\x68\x02\xf8\x4e\xf4\
+\xce\x59\x54\x62\xba\xf9\xb1\x0a\xd3\xcb\x25\x82\x4d\xea\x37\x7a\
+\x28\x8e\x77\x63\x68\xe3\x61\x15\x14\xfc\xdf\xce\x5c\xac\x9d\x3a\
+\x0b\x0b\x35\x80\x75\xe1\xa4\xbb\xc5\xac\x41\xb3\x02\x2b\x4a\x58\
+\x3b\x75\xa5\x67\x2d\x6f\x19\x73\xd9\x24\xcd\xb6\x4c\xd9\x5f\x7a\
+\xf2\xd0\x74\x5d\xbe\xe6\x09\x4d\x00\xdf\x56\xd1\x3b\x57\xee\x5d\
+\x37\x39\x76\x0e\x83\x25\x65\xd3\xd2\x6f\xa3\x27\xf3\xd0\x4e\x24\
+\x62\x00\x5b\x36\x3c\xee\xcc\xc5\xaa\xb5\xb0\x70\x33\xb0\x69\x20\
+\xb4\xd5\x57\x06\xcd\xd2\x77\xaf\x31\xcb\xc5\xcb\x9e\xf5\x92\xb2\
+\x38\x36\x01\xb5\xdf\xbb\xce\xbc\x28\x66\xe0\xf2\x35\x54\x01\xcc\
+\xc2\x77\x1e\x74\x07\x37\x38\x16\x76\xce\x02\xcf\x41\x42\x21\x34\
+\x3c\xb4\xfe\x41\x0c\x60\x8b\xa5\xc3\xce\x44\xf0\xbc\x85\x35\x21\
+\xc1\xc0\xb0\x09\x07\xec\x48\xc9\x01\xb8\x46\x76\xb9\x70\x7a\xe1\
+\xb3\xc5\x72\x5c\xbc\x61\xba\x82\x19\x5c\x09\x02\x45\xa7\x97\xe3\
+\x1b\x9a\x00\xbe\xcb\xc2\x77\x2e\xdc\x5c\x6e\x74\x0c\x57\x43\x01\
+\xdf\xd9\x61\x28\xd7\x6f\xcc\x01\x7d\xc1\xf8\x01\x9c\xb0\xb1\xba\
+\xf2\xb0\x5e\x3b\x00\xdf\x47\xcc\xc0\x15\x0d\xac\xaf\xeb\x22\x96\
+\x5d\x7a\x41\x2d\x7e\xb6\x07\x01\x03\x8b\xa0\x7b\x86\x55\x8b\x83\
+\x75\x62\x84\x2c\x80\xa3\xd8\xc3\xcd\xe5\x26\xc7\x7e\x3f\x1d\x2b\
+\x3c\xdc\x04\x32\x73\xc9\x55\x60\x42\x9a\x03\xc4\x00\x1e\x03\x98\
+\x3e\x76\xe4\x62\x0d\x6a\x2d\x2c\xd4\x00\xb6\xbe\x95\x65\x60\x7b\
+\x5d\xb7\xec\xc9\x9c\x10\x66\x8e\x50\x6b\x9e\x99\xb2\xb2\x2f\x66\
+\x60\xa1\xaa\x0c\x6c\x95\x70\xf9\xfb\x1b\x34\x01\x7c\x93\x81\xf1\
+\x0e\x05\xe1\x7e\x16\xd6\x3d\x36\x57\x3a\xc7\xc0\x2a\x98\x40\xad\
+\x7c\xe0\xcc\xd9\x3b\xab\x60\x66\xe0\x91\x03\x53\x47\x2e\xd6\xa0\
+\xd6\xc2\x42\x5c\xc9\x71\xd5\x6c\x2c\xac\xc0\xbc\xb2\x40\xb6\xe5\
+\xcb\x41\x03\x3e\x10\x6a\xcd\xb3\xbd\x19\x03\x00\xde\x2c\x61\x13\
+\x46\x2a\xa0\xe3\x30\x6b\xac\x07\x51\x00\xbb\x9b\xab\x08\x17\x7b\
+\x78\x73\x60\xed\x63\x56\xc3\xc0\x9a\x6f\x6d\xec\xac\x4f\x9e\x39\
+\x78\x84\xdd\xc3\x4a\xd9\x58\xd7\xbb\x31\xa1\xb7\x49\x00\xd8\xc6\
+\xd0\xc6\xbc\x92\x60\x66\x39\xf7\x13\x92\xb7\x3e\xbc\xab\x3e\xbb\
+\x64\xb0\x72\xf9\x23\xe8\xdc\x67\xc2\x59\x2f\x22\x1a\x74\xef\x8c\
+\xa4\x01\x0c\xef\x52\x88\x60\x2e\x21\xf4\x5d\xeb\xd8\x88\x14\x2d\
+\x8a\x35\x96\xfd\x0c\x32\x4d\xbc\x36\x70\x56\xf6\xfa\x2b\x49\x00\
+\xf8\x5d\x37\x36\x74\x5d\x15\x16\xea\x4a\x8e\x2b\x70\xfe\x4d\xe4\
+\xac\xec\x16\xff\x8e\x81\x99\x93\xac\x42\xd4\x3c\xbb\xfe\x23\xa6\
+\x5c\xee\x84\x09\xdf\x0c\xcc\x14\x9b\xd3\xc0\xfa\x27\xdf\x1c\x10\
+\x66\x60\x06\x5d\x95\x8e\x81\x21\xf4\x5d\xeb\x18\xcc\x67\x13\x93\
+\x47\x2e\xb4\xed\xe2\xb7\x7b\x7a\xc3\xf6\xb2\x78\x01\xec\xc1\x34\
+\x6f\x63\x75\x02\xe0\xd7\x01\x7e\xd1\xda\xd0\x57\x94\x63\x60\xf9\
+\x7f\xf6\xae\xe7\x45\x8e\xe3\x0a\x2f\x12\x22\xa7\xdc\x62\x02\x31\
+\x06\x5f\x7c\xd7\x2d\x67\x9d\xd6\xde\x65\xc1\xbe\x24\x86\xe0\x43\
+\x0e\x06\x23\xe9\xe0\x60\x89\x85\x98\xbd\xc9\xa1\x70\xe5\xe8\x5b\
+\x4e\x01\x93\x18\x1a\x1d\x02\x72\x5c\x99\xba\x07\x1d\x13\x58\x58\
+\x50\xfe\x99\xec\x74\xbd\x1f\xdf\xab\xee\x9a\x99\x45\x3d\x23\xea\
+\xad\x46\xab\x99\x9e\xde\x9e\x85\xa9\xae\xaf\xbe\xf7\x7d\xef\x55\
+\xd5\x2c\x03\xf3\x78\x9f\x89\x90\x27\xaf\x32\x47\x26\xb2\x18\x1e\
+\x39\x23\x0b\x27\xf3\xfa\x39\x96\x81\x93\x67\x06\x8e\x44\x9c\x62\
+\x02\x44\x11\x24\x37\x39\xe6\x4c\x30\x59\x0c\xd6\x85\x8e\x14\x38\
+\x67\x92\xc2\x43\x59\x27\xeb\x59\xf7\x1e\xd6\x9c\x8d\xb5\x17\x13\
+\xfa\xdc\x07\x80\x33\xed\x66\x56\x16\xe1\x18\x4a\x67\xa0\xb5\x5b\
+\x18\x8b\x65\x7d\x9d\x42\x2a\x89\x57\xdb\x90\x39\xbf\xb2\xec\xa4\
+\x30\x30\xef\x7e\x44\xec\x9b\x24\xa3\xc4\xff\xca\xc8\xe0\x97\x81\
+\xa9\xbd\x22\x69\x57\x61\x54\x96\x14\xbb\x1d\x93\x48\xa1\x60\x3c\
+\x51\x24\x2d\xeb\x8f\x0d\x59\xb4\x4f\x66\x0c\xf7\xbb\x41\xf0\x31\
+\xc2\x69\x1f\x36\xf4\x9d\x0d\x16\x56\xbf\x36\xf4\x69\x09\x97\xd9\
+\x84\x56\x07\xcb\x44\xc3\xe4\xa8\xca\x8b\x16\x1a\xd1\x3b\x61\x60\
+\x22\x65\x56\xc5\xb4\x3e\xf4\xfc\xdc\x25\xc7\x1a\x98\x86\x28\x0a\
+\x43\x64\x82\x25\xe5\x86\x77\x39\xa6\xa2\x71\x59\x03\x8b\x96\x33\
+\x81\x46\xcc\xc4\xc0\x83\x61\xe0\x17\x2e\x00\xfc\x74\x0f\x00\xbe\
+\xb7\xc1\xc2\xea\xd7\xc5\x3a\xcd\x9c\x3d\x42\x06\x5e\x31\x28\x69\
+\x16\x42\x59\xcd\x99\xd6\x7e\x4e\xda\x97\x78\x9e\x1b\xf5\x35\x8e\
+\x1b\xe1\x2d\xe1\x55\x66\x27\xc1\x71\xca\x5e\x01\x4c\x5f\x55\x9c\
+\x79\x02\x1e\xc0\x39\x46\x69\xbe\xd6\x79\xb3\x84\x4e\xe6\x36\xd5\
+\x35\x66\xd9\x79\xe6\x7c\x12\x31\x70\xb7\x00\x46\x47\x69\x52\x8d\
+\xf5\xf1\xf2\x00\xfe\xfd\x95\x05\xf0\x65\xf7\x0c\x4c\x7b\xaa\x94\
+\x13\x1a\xe9\x4a\xa7\x12\x06\xa6\xae\x45\x3c\x20\x2b\x77\x08\xeb\
+\xe0\x5b\x7a\x17\xe1\xb4\xc2\xdd\x2b\x80\xf9\xeb\xb3\xf1\xc4\xba\
+\x81\xad\xad\xa4\x71\x49\xf3\x7c\x35\xda\x45\x01\x3a\x30\x30\x71\
+\x6f\x76\xc1\xc0\x36\xa0\xfd\x66\x79\x00\x57\x59\xa4\xe7\x16\xbf\
+\xbd\x8a\xe0\x53\xd4\xc0\x54\x47\xb9\xd6\xc0\x32\x71\x3c\x02\xef\
+\x66\xe4\x02\xa0\x10\x5d\x50\x47\xd6\x53\xe5\xd9\x84\x72\x5e\x4f\
+\x2b\x96\xdd\x32\xb0\x86\x1b\x56\x37\x70\x74\x32\xc3\xc0\xe6\xbc\
+\x52\x6f\x84\x78\x47\x36\xac\x89\x34\xa3\x5f\x6a\x39\x86\xa1\x7b\
+\x06\x3e\xb3\x70\xfa\xdf\xf2\x79\xa4\x0f\x36\x58\x58\x1d\x03\x98\
+\x8b\xf1\x06\x2a\xa8\xe4\x25\x65\x13\x32\x30\x17\x5a\x01\x17\xc8\
+\x0e\x1f\xc0\xad\x5c\xbf\x11\x05\xaa\x7a\x1e\x4e\xf2\xd1\xb7\xae\
+\x19\x18\x00\x28\x0b\x83\xd9\x80\x84\xed\xc1\xe9\x79\x81\x2d\x30\
+\x70\xaa\xcd\x84\x4c\xd3\x4f\x48\xfb\x74\xce\xc0\xc7\x15\x9e\x96\
+\x07\xf0\x26\x0b\xab\x5f\x17\xeb\x94\xf2\xc0\x83\x56\xd3\x16\x0d\
+\x1c\x85\x12\x78\xbe\x60\x54\xb9\xcb\xf5\x56\x66\xa1\x53\xb3\x12\
+\xad\x59\x03\x35\x19\x06\xe6\x3f\x16\xdd\x02\xf8\x07\x15\x1e\xb8\
+\x32\x91\x69\x10\x59\x8b\xd7\x34\x9a\x2a\x0f\xf1\x01\xa3\xac\x8c\
+\xc0\x17\xb2\x06\x66\xee\x1d\x06\xcd\x24\xad\xbc\x00\xf8\xe9\xe2\
+\x6b\x43\x6f\xb4\xb0\xba\x75\xb1\x4e\x08\xb2\xc0\xc0\x6b\x20\x27\
+\x54\xb1\x4a\xa2\xdc\xad\xc8\xdb\x9a\xfa\xca\x2a\x84\xab\x65\x8c\
+\xc1\xed\x12\x0a\x5e\xb9\x05\xb0\xae\xd0\x19\x55\xba\xc2\x8f\x36\
+\x4f\xd5\x4c\xd9\xa0\x55\x43\x68\x5e\x72\x4c\x5a\x57\x19\x98\xee\
+\x59\xef\x0c\x5c\x59\x4a\xb5\x8d\xb5\x34\x80\x3f\xbd\x9a\x00\xf8\
+\xb2\x53\x00\x67\x76\xb1\x06\x28\xab\x8d\xb0\x90\xa9\xd8\x4e\x48\
+\xc8\x59\x65\x1b\x78\xac\xb2\xa6\x3b\x88\x60\x59\xee\x2e\xc6\x0a\
+\xde\x8e\x19\x38\xc2\x5e\x28\x11\x1a\x44\xc7\x30\x42\xb8\xf5\x0a\
+\xa2\x70\x2c\xbf\x43\x03\x90\x76\x6d\x65\x77\x6c\xcc\xf9\xd1\xa8\
+\xab\x0c\xfc\xbd\x07\x0f\x6b\x6a\x63\x2d\x9d\x06\x7e\x3e\xc1\x6f\
+\xa7\x22\xf8\x44\x67\x21\x95\x62\xca\x92\x9b\x40\xc7\x49\x72\xc1\
+\x59\x4c\x69\x91\x68\xd4\x99\xf4\xb2\xa4\xa9\x23\x71\x60\xab\x44\
+\x52\xe4\x21\xe0\x5b\xe7\x0c\x1c\xb1\x48\xbc\x56\x1a\xe8\x2a\x4b\
+\xeb\x54\x49\x25\x85\xb4\x04\xdc\x51\x91\xcf\xe2\xc7\x32\x70\xa7\
+\x00\x3e\x9b\xe0\xe9\xd5\x5e\x01\x7c\xee\x07\xc0\xc2\xc0\x2b\x9e\
+\xcd\x60\x18\x38\x41\xa5\x06\x23\x33\x63\x68\xa8\x9a\x16\x9c\x57\
+\xa1\xdf\x94\x20\xfc\x93\x3e\x5d\xfe\xa0\x73\x06\x96\x02\xac\x4a\
+\x66\xe4\x54\x85\xd6\x2a\x70\x55\x37\x83\xf1\x1c\x65\x18\x8c\x00\
+\xfb\x6b\x05\x22\xd1\xb3\x03\x06\x3e\x9e\x02\x6a\xe1\x4a\x8e\x3b\
+\x1b\x2d\xac\x6e\x45\xf0\x09\xad\x47\x29\xd3\x19\xca\x3a\x2d\xc6\
+\x8f\x2a\x11\x30\xf8\xc7\xcc\x19\x34\x55\x35\x66\x75\x64\x64\x05\
+\x4a\x28\x9e\x84\x68\x90\x62\xf0\x12\x52\xbb\x67\xe0\x18\x21\xb5\
+\x8b\x8b\x67\xeb\x28\x57\x85\xcc\x73\xba\x57\x91\xae\xaa\x65\x7d\
+\x6e\xa0\x4d\x81\x65\x5e\x70\xcf\x0c\x3c\x95\xa4\xd6\xc6\x7a\x7f\
+\xd9\x3a\x8e\x5f\x3a\x02\x70\x31\xa0\x79\x9f\x68\x66\x60\x9e\x73\
+\xa0\x7d\x28\xca\xc6\x1e\x5c\xe2\xcc\x53\xdd\xd4\x8f\x86\x40\x4f\
+\x16\x56\x4d\xb2\x24\x9b\x1a\x3b\xe5\x6a\xb7\x26\xd6\xcb\x8c\x2b\
+\xed\xb2\xb0\x88\x09\x43\x95\xa8\x07\x31\xaa\xb3\x67\x5a\x39\x41\
+\x26\x39\x6a\x00\xcd\x6d\xcd\x08\x36\x05\x59\x7e\x00\xfc\x87\x65\
+\x2b\x39\xee\x6d\xb6\xb0\x7a\x75\xb1\x4e\xa8\x78\x32\x53\x30\x56\
+\xca\x03\xb8\x6c\x1e\xe0\x87\xfb\xf3\x28\x41\x8b\x3a\x4b\xba\x35\
+\x30\x50\x33\x4d\x4b\xd2\x74\xa8\xf4\xc1\xf5\xd3\x9f\xfd\x02\x18\
+\x6a\xd7\x0c\x6d\x66\xfc\xfe\xdc\x74\x32\x07\xc4\x38\x84\x82\x7f\
+\x99\x0e\x22\x79\xe1\x12\x54\x0b\x7e\x07\x29\x89\xbe\x7e\xee\x14\
+\xc0\x33\x78\x32\x36\xd6\xb2\x00\xfe\x6c\x0e\xbf\x7d\x8a\xe0\x13\
+\x0a\xbe\x68\x3d\x59\x5a\xe6\x7d\x25\x53\xd2\xa3\x92\x87\x72\xa7\
+\xae\x6d\xaa\x6f\x53\x0e\x29\xc1\xaf\x90\x95\xa3\xba\x5b\x38\x0e\
+\xf8\x05\x70\x82\x65\xf1\xe9\xb8\x4a\xfe\xb2\x31\xbf\x3e\x0a\x09\
+\xa0\x1a\x4d\x15\x96\x24\x00\xe8\x93\x81\x63\x9a\x18\x43\x16\xfb\
+\x42\xe6\x72\x77\xcb\xc0\x67\x73\x80\x7a\xb5\x37\x00\xcf\xe2\xb7\
+\xcf\x52\x8e\x13\x5e\x4b\x56\xf7\x8d\x5e\xf7\x04\x63\x39\x49\x81\
+\x81\x25\x5d\xdd\x92\x81\x7d\xd2\x98\xab\xb8\x30\x01\xf0\xe5\x83\
+\x72\xd2\xb1\x06\x96\xef\x2c\xcd\x91\xed\xe0\xa6\xad\x60\x4c\x3e\
+\x6c\x2b\x44\xb5\x8e\x98\xc2\xe0\x69\x28\x03\xae\x44\x4d\xe3\x02\
+\xc1\x9d\x02\xf8\x78\x16\x51\xfb\x02\xf0\x27\xf3\x00\x3e\xef\x13\
+\xc0\x43\x19\xbc\x07\x5a\x5d\xa9\xcc\x31\x85\xed\x3c\x2a\x10\x1a\
+\x6e\x88\x48\xaf\xe6\x4a\xc1\x7b\xc6\x77\xb6\x14\xc4\xb3\x0b\x2d\
+\x9e\x1e\x8f\x5b\xb1\x4a\x06\xc5\x09\x38\x71\xbd\x83\x58\xdb\x0a\
+\x8c\x79\xac\xd9\x62\xe2\x5d\x29\x15\xf7\xea\x42\xcf\x6a\xd2\xf3\
+\x77\xf6\x04\xe0\xf7\x1a\x00\xbe\xec\x93\x81\x87\x15\x83\x38\xf3\
+\xea\x2c\x39\x03\xe3\x4e\x09\x02\x69\x22\x03\xa9\x40\xa6\x09\xf0\
+\x9f\xeb\x2e\xca\x84\xed\xda\x85\xc6\xe1\xce\xa6\xe4\xa0\x55\x67\
+\x4a\x2a\xb3\x75\x0c\xab\x17\xd9\x8d\x6a\x1d\xee\xe8\x6c\xe0\x2c\
+\x42\xb8\x53\x06\x9e\x07\xd4\x7f\xf7\x03\xe0\xdf\x5d\x35\x00\xfc\
+\xa4\x4f\x00\xd3\xed\x17\x29\xb5\xee\x07\xb0\xb4\xa4\x85\xe1\x84\
+\x26\xa2\xd9\xe7\xcc\x04\x7f\x36\xb9\x04\xe1\x24\xfd\x35\xe7\x0c\
+\x3c\xa1\xda\x94\x6b\x25\x81\xc8\x84\xab\xac\x48\xb1\x17\xc1\x1d\
+\x91\x5a\x4a\x8a\x9c\xc6\xe3\x2e\x01\x7c\xd6\x10\xa5\x3f\xee\x05\
+\xc0\x9f\x9d\x7b\x02\xf0\x4a\x18\x98\xd7\x87\x5e\x65\xdd\xca\xa8\
+\x0a\x83\xb3\xf1\x50\x81\x0e\x2a\x5a\xa9\xb8\x17\x70\x0b\xa1\x60\
+\xf6\xac\x81\xab\x39\x84\xd8\x2c\x50\x53\x95\x60\xc6\x42\x1d\x28\
+\xa7\x9a\x81\x2b\xf8\x67\x56\xbd\x82\xe2\xf1\x7f\x97\x00\x3e\x6e\
+\x20\xea\xe9\x5e\x00\xdc\xc2\x6f\x97\x2e\xd6\x89\x90\xee\x4a\x32\
+\x49\xeb\xff\xa0\x6c\x21\x07\x89\x10\x06\x87\xb5\x76\x5b\xd4\xd5\
+\x4a\x98\xdc\xc4\x7a\xac\xf5\xc3\xef\x64\x86\x6c\xcd\x28\xf0\xac\
+\xaa\xf0\x65\x22\x85\x2b\x83\xdf\x78\x0c\x26\x05\x35\xae\x17\x3a\
+\xc0\xcd\x23\xfb\xf1\x85\x27\x00\x9f\xef\x03\xc0\x9f\x34\x01\xdc\
+\xa3\x8b\x75\x4a\xfb\x02\xab\x19\x32\xee\x92\x04\x52\xad\xf6\xb1\
+\x20\xde\x33\xa1\xf2\x74\xde\xba\x0d\xb6\xa7\xf9\x27\xd7\x21\x74\
+\x9d\x0e\x8a\xb0\x48\x07\x46\x2c\xd5\x1c\x4c\x93\x9a\x8b\x96\x86\
+\x75\x5c\x2c\x95\x32\x64\x3e\x73\x0e\xa9\x68\xa0\x2e\x01\xdc\xa4\
+\xc4\x77\xf6\x00\xe0\xf7\xda\x00\xbe\xec\x11\xc0\x7a\xfb\x75\x6d\
+\xca\x8c\x52\xb5\x9a\xab\x8a\x99\x10\xd5\xb8\x46\x31\xc7\x58\x4d\
+\x32\x04\x78\xa3\x53\xed\x76\x42\x7f\x35\x7c\xd9\xa8\xa5\xb6\x09\
+\x62\xac\xd2\x6c\xf5\xcc\xea\x29\x05\x13\x01\xab\x67\xb1\xe2\x7a\
+\xac\xc1\x15\x80\xd5\xc6\xfa\x78\xb1\x5a\xe8\xa6\x85\xd5\xa7\x08\
+\x3e\x1d\x44\x46\x0d\xe2\x67\xad\x6c\x9e\xb2\x7a\xcc\xc6\x7c\xb1\
+\x36\xa6\xdb\x17\xe9\xaf\x1d\xaf\xc8\xb1\xed\xb1\x73\x9b\xce\x7d\
+\x62\xbc\x3a\xe4\x21\x83\x06\xe6\xfb\xd7\x23\x80\xcf\xda\xaa\xf4\
+\xc7\xc5\x27\x33\xfc\xb6\x8d\xdf\x1e\x45\xf0\xa9\xdc\x7d\x5d\x98\
+\xe3\x7a\x2c\xdf\xda\xa5\x52\xe3\x91\x6f\x70\xb5\x63\x06\xde\xed\
+\x91\x77\x6a\xd2\x56\xdb\xc2\x98\xcb\x5b\xd2\xad\xfa\x5c\x91\xe3\
+\xb8\x0d\xa9\xa7\xcb\xad\x2b\xbb\xcd\xc2\xea\x53\x04\x9f\x0e\x2b\
+\x8d\xc5\xd4\x8d\x8e\x07\x79\xf8\x65\xe0\xdd\x42\x95\xdd\xf9\x77\
+\x0e\xce\x99\x6c\x47\x29\xa3\x1b\x6f\x65\x8f\x00\xde\x10\xd4\x9e\
+\x2f\xb7\x22\xc7\x07\x5b\x09\xb8\x47\x11\x7c\xaa\xf6\x87\xce\x0b\
+\xce\x73\x08\x4e\xcb\x3f\xbc\x02\x38\x80\xf7\x94\x6e\x10\xab\xdc\
+\x8c\x83\x8d\x77\x45\xa1\xd3\xd0\x25\x03\x6f\x82\xd4\xd3\xc5\x16\
+\xb5\xbb\xb7\x9d\x80\x3b\x14\xc1\x1f\x66\x5d\x57\x49\x4a\xa2\x57\
+\xb9\xdd\x6f\x6e\x26\xdc\x36\x3e\xfc\x6e\x6e\x36\xab\xf8\x17\xe3\
+\x5f\xfa\xc0\x8a\xc9\x77\xc8\x50\x4a\xf7\xcc\x93\x04\x16\x0a\x5e\
+\x62\x5d\xe8\x51\x04\xff\xb4\x19\xc0\x17\x1d\x02\x18\x27\x32\xf0\
+\x1e\x85\xb9\xee\x55\x8d\x1e\x37\x49\x6f\x6e\x23\x10\x7b\xe4\x16\
+\xc0\x33\x5f\x3b\xc7\xcd\xa8\x4d\x9b\xdb\x72\x7a\x3f\x54\x02\xeb\
+\x9d\x1b\xba\xdc\x1b\xe9\x78\x23\xa6\xbe\x5e\x6a\x6b\x95\x75\x0c\
+\xfd\xd3\xd5\x66\x00\xf7\x27\x82\x3f\xa2\x30\x6c\x55\x55\x05\xec\
+\xcc\xbf\xd5\xab\x81\x77\x8e\x1b\x8f\x6f\x03\x03\x4f\x1d\xf8\xdd\
+\xf8\x77\x3a\x4a\x4e\x3e\x00\x65\x94\x4a\xc0\xf9\x3b\x5f\x12\xf8\
+\x9a\x14\xbf\x5e\x6a\x7f\xe0\xa3\x3b\x47\xbf\x3e\x77\x08\x60\x32\
+\x42\x86\x2c\x31\x59\x1e\xcc\x3a\x1c\xdb\x92\x44\x5b\x98\xb6\xcd\
+\xcf\xb7\x84\x81\xb7\x2b\xda\x66\xbc\x92\x63\x93\x83\xcd\x8e\x92\
+\x4c\xc0\x43\x8f\xfb\x03\x6f\xc1\xd4\xc5\xf9\xfb\x47\x4b\x3d\x7e\
+\xb6\x0d\xc0\x4f\x7a\x64\x60\x33\x17\xd8\xec\xc0\x6d\x3a\x14\x2b\
+\xd7\x5d\xfa\x66\x34\x17\xb7\x34\xf0\x6f\x7c\xe2\xf7\xf3\x5d\x3d\
+\x80\x49\x73\xcd\xfc\x7a\xe6\x6a\x3a\x9f\xe7\x1e\xab\x5f\xb8\x03\
+\xf0\xf9\x57\x47\x6f\x01\xdc\x7c\x3c\x00\xde\x05\x31\xb5\x21\x4f\
+\xb9\x93\x75\x65\x69\xa3\x05\xf3\x7f\xfb\x04\xf0\xe3\xb0\x10\x03\
+\x57\x93\x30\x6b\x06\xe6\xaa\x1b\xcd\xfe\x75\x09\xe0\xe3\x6d\xa0\
+\xfa\x72\x39\x00\x1f\x9d\x7b\x8b\xa1\x1f\x28\x70\x61\x42\xe1\x81\
+\x18\xd8\x2b\x80\x0f\xc5\xc0\x43\x86\x32\x9c\x32\x0b\xc5\x23\x80\
+\xef\x2f\x08\xe0\x2b\x77\x00\x1e\x34\x0d\x01\x91\x74\x3a\xc8\xe3\
+\x96\x33\xf0\xeb\x3d\xb2\x97\x10\x7a\x2b\x29\x2e\x88\xdf\xed\x2e\
+\xd6\x65\x87\x00\x16\x0a\x56\x37\xfa\x30\x00\xfe\x9b\x4f\x00\x3f\
+\x3c\x4c\x1d\x5b\xe6\x5a\xac\x01\xee\xa0\x43\x00\x5f\x2c\x09\xe0\
+\x9f\x7b\x13\xc1\x0f\x06\xe9\x07\xf8\xd8\x1d\x84\xaf\x53\xc8\xe1\
+\x15\xc0\x07\x62\xe0\x95\xad\x86\x2e\x06\x46\x77\x00\x3e\x3e\xa0\
+\x87\x75\x74\x74\x77\xeb\x70\xd1\x1f\x80\x57\xc6\x84\xa6\x11\xfd\
+\x46\x32\x6e\xfd\x02\x87\x0c\xed\x00\x27\xac\x84\xa3\x77\xff\xf4\
+\x09\xe0\x47\xcd\xc6\x2a\xff\x77\x6a\x57\x7d\xde\xc0\xc0\x19\x47\
+\xdf\xa1\xcf\x10\x7a\x2b\x80\xff\xb3\x24\x80\xdd\xb9\x58\xc7\x92\
+\x4a\x94\xff\xa5\x94\x72\xdd\x7b\x02\xbf\x34\x8e\x6a\x2b\x46\xb0\
+\x6a\x1d\x18\xb9\x10\x3e\x35\xbe\xfe\xc9\x27\x80\xbf\xd0\xaf\x1a\
+\xaa\xc6\xc2\x76\x98\x6f\xd2\x20\x63\x9d\x6d\xb4\xea\xa2\xeb\x77\
+\x53\x01\xbc\x76\x21\xbb\xcb\x83\x5c\x1d\xd2\xc3\xda\x01\xc0\x97\
+\xfd\x01\x78\x95\xf3\x24\x86\xbe\x69\x34\x7c\x93\x08\x5b\x2e\xf6\
+\x0a\xe0\xbd\x8b\x8f\x75\x1b\x6a\xe0\x3c\xc0\xed\xeb\x0f\xc0\x07\
+\xf5\xb0\xfc\x65\x82\x8f\x87\x59\x33\xd3\x72\xaa\xe9\x6d\xc1\x86\
+\xc2\x86\x6c\x81\x5e\x91\x69\x21\xc4\x36\xd1\xb5\x5b\x06\xde\x29\
+\x80\x6e\x67\x91\x6a\x2e\x9e\x5e\x15\x84\x81\xab\xfb\xd7\x1d\x80\
+\xcf\x0e\x2a\x81\x77\x70\xb1\x3a\x13\xc1\x67\x43\xbd\x29\x43\xe9\
+\x12\x0c\xc1\xb9\xb8\xb9\xea\x5f\x11\xae\x64\x50\x6b\x3f\x64\x89\
+\x5c\x7f\x6c\xfd\xfc\x8d\x4f\x00\x7f\xda\x8a\xa0\x4d\xd8\x3c\x1f\
+\x4c\xd7\xb0\x9d\x8f\xc6\x43\x95\x46\xd2\x18\x6a\xd5\x5b\x1a\xe4\
+\xa0\x65\x1c\xbb\xb8\x58\xbd\x89\xe0\x61\x66\x18\x9f\xba\xd0\xad\
+\x70\x39\x0a\x38\x93\x51\xc4\x04\xd2\x88\x68\x9e\xfe\x39\xa7\x9b\
+\x23\xbd\x6c\x84\xcc\xa1\xe2\xda\x30\x89\x73\x76\x8f\xae\xc3\x9c\
+\x06\x5e\xa7\x01\xdd\x49\xe0\x65\x3d\xac\x1d\x4a\x39\x2e\x3b\x04\
+\x30\x6f\x15\xad\x85\x1c\x12\xf1\x49\x90\xcc\x4c\x6c\xa3\x41\x89\
+\x9f\x83\x46\xd4\xf2\xc6\x44\xda\x11\x88\x87\xfe\x98\xd3\x65\x29\
+\x7f\x98\x90\xaf\x2a\x0d\xe3\x5c\xcd\xf8\x7b\xd0\x7a\x53\x56\x36\
+\x6f\x21\x85\x04\x1e\x46\x77\x00\x3e\xb0\x04\xde\xa1\x94\xe3\x49\
+\x6f\x00\x5e\x55\xa1\x98\x50\x30\xe3\xd3\x88\xdb\x24\x74\xcb\xd1\
+\x9f\xd2\x6f\xac\xb9\x18\x7b\x6e\xfd\x7a\x7d\xe4\x16\xc0\x33\xa6\
+\x1d\x6a\x8a\x64\x5b\x37\xa4\xfa\x24\x7c\xc6\x26\x96\x5a\x6b\x62\
+\xe9\x1d\xf4\x26\x81\x2f\x96\x06\xb0\x37\x11\x3c\x97\x8b\xc8\x39\
+\xd5\xc9\x8c\x46\xc4\x6c\xba\x5b\xc0\x1a\x68\x5b\xcd\x1b\xd2\x8c\
+\xa1\x93\x9c\x2e\x8a\xd5\x30\x9c\x6b\x08\x86\x49\x58\x2d\x23\x63\
+\x9a\x15\x1d\xc1\x84\xe3\x79\xc2\xbf\xe3\xe1\xdb\x32\x8e\x5b\x26\
+\x82\x67\x27\x13\x96\x34\x52\xa8\x78\x76\x4a\x28\x4a\x23\x12\x1b\
+\x4f\x13\x99\x86\x7c\xc5\x90\x76\x3c\xa3\x3f\xd4\xc1\x2f\x62\xd2\
+\x84\xc4\xd3\x54\xaf\x29\x8e\xb1\x51\x78\x65\x80\xcd\xd7\x42\x0f\
+\x6f\x25\xf0\x2d\xcb\x04\xcf\x4f\x2b\xcd\x0c\x34\x20\x0a\x38\x63\
+\x7a\x95\x01\xaf\xe9\x79\x29\x05\x8d\xbf\xc3\x44\x10\xba\x05\xf0\
+\x44\x01\x4b\xa3\x4d\xd5\x2e\x22\x13\x46\xb7\x5a\x07\xa7\x09\xfa\
+\xe7\xef\x5b\xf2\x26\x81\xef\x1f\x1e\xc0\x7d\x89\xe0\xbf\x4c\x8b\
+\x38\x4a\x1a\x69\xc4\x5f\xe9\x35\xd4\x69\xd6\xaf\x41\x73\xba\xe3\
+\xd9\x30\x82\x74\xec\x7c\x74\xed\xfa\xa8\x7c\x20\x8c\xb8\x2d\x1d\
+\x33\x48\x04\x48\x1d\x74\xbc\xde\xe5\x8c\xfe\xcf\x6d\x82\xb7\x34\
+\x80\x29\x2b\xa5\xb3\x41\x9b\x56\x14\x0a\x9d\x0c\x10\xa6\x48\xaa\
+\x0e\x5d\xc1\x16\x03\x77\x06\xe0\xb3\x83\x7b\x58\x3b\x94\x72\x5c\
+\x74\x07\xe0\xf9\x4a\xac\x00\x84\x8a\xe1\x1d\x3d\x05\x1b\x23\x33\
+\xd2\x47\x84\x06\xea\x6c\x0c\xdc\x88\xa8\xa5\xab\xd7\xaf\x2e\xe7\
+\x13\x3e\x0e\x91\xff\xf1\x37\x2d\x6d\x14\xa5\x05\x82\x22\x92\x87\
+\xc8\xf1\x17\x21\x19\xbb\x9a\xaf\xe4\x81\x53\x2f\x54\x0d\x5c\x3d\
+\xfe\xf5\x56\x02\xbf\xb6\x8b\xd5\x97\x08\x7e\x77\xbe\x23\x04\x0a\
+\xdb\x84\x3c\xa9\x7f\x11\x9d\xd2\xd1\xf5\xa1\xf1\xa2\x4b\x37\x2d\
+\x7d\x56\x53\x24\x4a\x2b\x20\xe1\xc6\xeb\x5c\x4e\x47\x7a\x08\xa2\
+\xa3\x68\x07\x1e\x0d\x79\xac\x83\x51\x4f\x07\x33\x36\x14\x82\xc2\
+\x54\x82\x1c\x68\xc6\xb4\x59\x03\xff\xd5\x99\x04\xfe\x72\x79\x00\
+\xdf\xf5\x25\x82\xdf\xdd\xa0\x81\xc5\x16\x95\x5e\xa4\x41\xf4\x88\
+\x69\x31\x61\xe8\x39\xa0\x00\x1e\x7b\x63\xc0\xa9\x4a\x6a\x8a\x51\
+\x7c\xee\x72\x3a\xd2\x23\x6e\x86\x42\xc0\xe3\xb7\xe5\x38\x38\xa8\
+\x71\xaf\xf6\x40\xd0\xb8\x24\x86\x38\x51\xc2\x11\x25\xb0\xc2\x7c\
+\xfe\xbe\xfd\xc3\x99\x04\x5e\xde\xc3\xda\xa1\x94\xa3\x2b\x11\xfc\
+\xab\x06\x80\x59\x89\x31\x45\x50\x80\xac\xfd\x4b\x8c\x29\xeb\xc0\
+\x44\x20\x8a\xeb\xde\xa8\x87\x41\x49\x38\xb0\x85\xe3\xb2\x18\xfa\
+\x0b\x56\x13\x00\xd1\x44\x28\x95\xa1\x8b\x8e\xf5\xf7\xe2\xed\x49\
+\xd3\xd2\xcf\x18\xe7\x08\x65\x97\xdb\x11\x9c\x30\xf0\x9b\x90\xc0\
+\x3b\x94\x72\x74\x25\x82\xff\xd8\x08\xa1\x03\xa4\x24\xa5\x2f\x26\
+\xea\x52\xe2\x69\x25\xa1\xe4\xa2\xf9\x22\xf8\xd5\x62\x43\x07\x2c\
+\x5a\x80\xe2\xdf\x18\x7c\x02\x18\x4d\x65\x6d\x83\x12\xb6\x44\x19\
+\x07\x35\xb4\x0e\xa6\x15\x47\xc0\x16\xde\x4e\x22\x97\xc1\xee\x22\
+\x47\xac\x91\x3d\xf8\xbb\x2f\x09\x7c\xb1\x0f\x00\xfb\x12\xc1\x0d\
+\x00\x53\xc4\x4c\x7d\x30\xf2\xc0\x1f\x24\x2c\x16\x1c\x13\x77\x10\
+\xa5\x04\xbe\x96\x84\xb3\xf8\xad\x6c\x47\x27\x11\xc8\xd7\x3f\x2e\
+\x8b\xa1\x5f\x42\xe5\x68\xd4\x80\x04\xf2\x40\x63\x6b\x54\x2d\x59\
+\x30\x1c\xcc\x34\x60\x1b\x3c\x8b\x15\x51\x1a\xd0\x03\x80\xdf\x84\
+\x04\xf6\x26\x82\x5f\x35\x35\x70\x91\xb9\xdc\x07\x19\xa3\x82\x5c\
+\xa1\x18\xca\x12\x49\x3c\x1d\x34\x00\x4c\x22\x8f\x93\x8d\xb1\xa9\
+\x27\xfb\x04\xb0\xc0\x11\xbe\xf3\xba\x39\xd5\x52\xe0\x78\x84\x1b\
+\xd3\x78\x04\xd2\xb4\x89\x05\x89\x98\xf8\x64\x3f\xc0\x6c\xc2\xfa\
+\xf1\xfc\xad\x04\xbe\x65\x22\xf8\xa4\xc1\xc0\x1a\x0b\x93\x84\x2b\
+\x1e\x0c\xaa\xde\x40\x6a\x56\x59\x97\x8e\xab\x04\x71\x02\x27\x3a\
+\x99\x18\xdb\x65\x2d\xa5\x8e\x6e\x2c\x5f\x55\x89\x04\xa2\xde\xc4\
+\xb2\x98\x2b\x33\x42\x81\x65\x80\x0f\x06\x6c\xe7\x30\x69\xd1\xf9\
+\xfb\xf6\xbd\x2f\x09\x7c\xff\xe8\x8d\x88\xe0\xf3\xfe\x01\x8c\xb5\
+\x57\x01\xeb\x89\x14\x8d\x86\x81\x93\xd6\x26\x70\x50\xad\x4c\xad\
+\x69\x4f\x1e\x0b\xf8\x5a\x97\x85\x58\xd2\x24\xa6\x6e\x4d\x6b\x33\
+\x02\xcc\x03\xb6\x93\x8d\xa2\xa1\x6e\xc6\x39\x1a\xd7\x3a\x7c\x3a\
+\x00\xf0\x9b\x91\xc0\xce\x44\xf0\x69\x93\x81\xd9\xf4\xb4\x5c\x82\
+\x11\xb0\x10\x84\x32\x30\xf4\x57\xcb\xc0\xea\xa1\x46\x38\xeb\xb5\
+\x92\xd2\x7e\x6f\xf8\x81\x86\x52\x03\x4b\x51\xac\x06\xbe\x8a\x8f\
+\x7a\x29\x05\x3a\x9e\xbf\x6f\x2f\x5c\x49\xe0\xaf\xf6\x03\xe0\xbb\
+\x9e\xaa\x29\x3f\x6c\x31\x70\x14\x5c\x0a\x0b\x08\x8d\xda\x3e\xa9\
+\x59\x22\xd3\xd9\xa8\xb7\x55\x34\x4c\xe7\xe8\x3a\x87\xb5\x94\x8f\
+\x03\xb4\x51\xa8\x06\x35\x29\x3a\x8d\x1a\x48\x03\xb8\x61\x8c\x9c\
+\x5e\x60\x9a\x32\x34\x00\xfc\xec\xad\x04\xbe\x65\xe5\xd0\x1f\xb5\
+\x35\x30\xd1\x25\x30\x70\x34\xec\x12\x91\x81\x63\x83\x81\xb5\xc7\
+\x85\x92\x1f\x89\x10\x61\x7a\x5c\x19\xfa\x21\xbb\x52\xa6\xda\x19\
+\xe3\x90\x42\xb1\x85\x2f\x46\x4f\x00\x00\x20\x00\x49\x44\x41\x54\
+\x53\x82\x45\xcf\x1a\x4a\xa2\x0d\xc4\xe5\x4f\x36\x00\xfc\x9d\xa7\
+\x08\x7a\x4f\x12\xd8\x97\x08\x7e\x90\x1b\x89\x60\x82\x9e\xf8\xa7\
+\x52\x69\xcf\x66\x8c\x96\x27\x50\x81\x46\xa9\xac\xa4\x1f\xca\x68\
+\x46\x0c\x0f\xe5\x6f\xc8\xb3\xc3\x52\xac\x47\x41\x0a\x50\x39\x66\
+\xa6\x8a\xd3\xff\xb3\x77\xf5\xbc\x51\x25\x59\x34\x98\x78\x33\x32\
+\xff\x09\x67\xc4\x8e\x1a\xd6\x72\x3a\x82\x1f\x80\xe4\x01\x02\x24\
+\x90\x2c\x0d\x72\xb6\x5a\x55\xeb\x4e\xc8\xa2\xd6\x7a\xe3\x15\x88\
+\x08\x09\x89\x8b\x9e\x26\x5d\xcd\x66\x04\x2b\x59\x9a\x5f\xb3\x7e\
+\x55\xf7\xab\xde\x47\xf3\xd8\x1d\xd7\xab\x5b\xee\xb6\x69\xdb\x4d\
+\x37\xc2\xd5\x75\xea\x9e\x73\xef\xb9\xf7\x49\x3a\x8f\xcc\x31\x0c\
+\x52\xfa\x34\x38\x0f\x9a\xac\xcf\xff\x01\x2d\xc1\x37\x70\x71\xc2\
+\xb5\x24\xf0\x82\x7e\x06\x47\x85\xa4\x93\xf9\x08\xac\x16\x0c\xa9\
+\x51\xd2\x56\x02\x93\xdb\xa2\x70\xa3\xd6\x21\xfe\x0c\x64\x22\x64\
+\x82\x6d\xec\xd0\x4c\xd0\xe1\x6d\x93\x46\x2c\xa9\x8c\x0b\x67\x86\
+\x90\x25\xe1\x35\x1f\xa0\xeb\xc6\x0f\x04\xee\x56\x42\x59\x59\x34\
+\x14\x47\x62\xf7\xf4\xfb\x76\xaf\x25\x06\xfd\xf2\xb6\x00\xdc\x92\
+\x08\x3e\x99\x99\x2b\xab\x16\x21\x14\x67\x86\x4a\x61\x29\x20\x19\
+\x6f\x24\x0e\x3e\xc9\x53\x04\x60\x6c\x94\xb4\x4d\xe5\xbe\xc1\xb9\
+\x94\x8f\xb8\x44\x24\x0c\x98\xbc\x8f\xca\x82\x4d\x2e\x40\xd7\xcd\
+\x48\x8b\xb4\xa0\x1c\xbd\x45\x1d\x4b\x5c\xc6\x59\x0a\xed\x69\xaa\
+\xec\xd9\x6a\x12\x78\x81\x08\xf6\xe3\xa6\x9c\x1f\x0c\x9d\x23\x38\
+\xa1\x11\xb3\x24\x15\x51\x6c\x22\x79\x83\xf0\xcb\x88\x45\x29\x48\
+\x65\x1a\x38\x1d\x06\x0d\x3a\x39\x7e\x33\x11\x58\x98\x86\xa8\x06\
+\x72\x49\x6a\xf1\x9c\x57\xcc\x54\xcb\xe5\xec\xb3\xfd\x20\xa8\x9d\
+\x4a\x49\x1c\xbb\x07\xf0\x7a\x12\x78\x01\x80\xfd\x88\xe0\xb3\x0f\
+\x73\x66\x68\xd6\xb4\x18\x04\xaf\x41\x4d\x07\x52\xf3\x40\xea\xb1\
+\x81\x60\x3f\x99\x64\x87\x10\x74\x10\x00\xb2\x1b\x44\xd4\x5f\x83\
+\x4e\x0e\xd4\xf5\x31\x8b\xc2\x2d\x0c\xb4\x8a\x1c\x68\x05\x90\x74\
+\x16\xf2\x5a\x25\xf5\x91\x16\x92\x8d\x1c\xbc\x6c\x69\x69\x67\xae\
+\x2e\xea\xc8\x04\x78\xbd\x4a\x27\x43\x7b\x22\x78\x26\x02\x73\x47\
+\x4c\x30\xe1\x20\x5a\x78\x65\x33\xa6\x8d\x45\x4f\x08\x03\x0e\x1d\
+\x82\x34\xd3\x48\x17\x22\xe1\x39\xe1\x9a\xa4\x75\x93\x3e\x0e\x5a\
+\x1f\x2b\x70\x43\x30\x4d\x58\xbc\x02\xd9\x32\xa5\xd5\x45\x3a\xf1\
+\x82\xf4\x3a\x98\xd3\x80\xac\x70\x61\x7e\x20\x87\xa7\xa1\x94\xeb\
+\x49\xe0\x25\x56\x0e\x3f\x54\xa6\x9b\x8f\xc0\x1c\x19\x90\x13\x51\
+\xa9\x03\x38\x04\xd3\xe7\x90\x02\x0e\x80\xcd\x40\x07\x6e\x22\x96\
+\x7c\xb5\x04\x65\x44\xde\xb0\x29\x9c\x37\x08\x60\x59\x1f\x22\x19\
+\xa6\x91\xd0\xa2\x56\x7b\x95\x08\xb6\x14\x99\xd9\xf5\x0c\x81\xb1\
+\xab\x0f\xc8\x99\x30\x9b\xc4\x6a\x49\x02\xbf\xb8\x3d\x00\xb7\x24\
+\x82\xe7\xa6\xda\x81\x44\x06\x11\xaf\x14\x81\x81\x63\x6f\x20\xf0\
+\x8e\x23\x30\x23\x36\x28\x60\xd3\x6b\x19\xd6\xb4\x63\xdb\x1b\xaa\
+\xf3\x3c\xc8\xa8\x12\x4a\xf4\xf1\xaa\x09\xfb\x48\xb2\x23\x30\x23\
+\x61\x20\x8b\xe6\x50\x8c\x03\x87\x65\x90\xf5\x64\x43\xb5\xfb\x91\
+\x58\x6b\x4a\xe0\xa6\x44\xf0\xd5\x7e\x0d\x0c\x1a\x81\xd3\xae\x44\
+\xca\xc1\x50\x34\x05\x65\xd1\x1a\x81\x99\xfd\x31\x84\x13\xc0\x65\
+\x84\x16\xff\x2b\xd0\x60\x21\xf8\x59\x10\x54\xa6\x23\x8a\x27\x97\
+\x04\x62\x1f\xe9\xf8\x02\xae\x15\x49\x04\x06\x09\xd5\x1a\x99\x15\
+\xf5\xd6\x09\x13\x5f\xe7\x7e\x24\xd6\x9a\x12\xb8\x29\x11\x3c\x37\
+\x14\xcb\xb2\x3e\xd2\xc0\x14\x5b\x39\xc3\x22\x11\x38\x04\xdb\xf9\
+\x9b\x45\x60\x10\xf1\xc7\x81\x37\x8f\xc0\xcd\xb5\xf4\x9f\x73\x63\
+\x34\x89\x0f\xfb\x7b\x4b\x57\x11\xad\x23\x85\x57\x1a\x7d\xc0\xa1\
+\x5a\x94\xb0\xa4\x1d\xd8\xd9\xc1\x95\x80\xf9\x08\xec\x68\xa2\xce\
+\x9a\x12\x78\x09\x80\x5f\x79\x07\xf0\x30\x02\x07\x1d\x61\x27\x43\
+\x5e\x24\x02\x13\x1b\xe4\x44\xd5\x28\xff\x62\xb5\x31\x77\xa5\xc7\
+\x9d\xdc\x5c\x21\xf8\x91\x59\x29\x4e\xf2\x65\x03\xeb\x90\x33\x7f\
+\x14\x72\x03\x1a\x61\x02\x42\x71\x24\xed\x20\x0c\x9b\x23\x70\x3a\
+\x1a\xbd\x03\x78\xcd\x2a\x70\x5b\x1c\xfa\xe7\xd9\xa1\x58\x44\x02\
+\xf9\xe0\x37\xf9\x16\x86\x2c\x6a\x3a\x59\x1d\x96\x04\x6a\x55\xbe\
+\x52\x17\x61\x01\xa7\x2f\x0e\xcd\x5d\x1e\xe9\x9d\x38\xc1\x03\x68\
+\x86\x5e\x7e\xf1\x44\xaa\x81\x97\x2e\x90\x2b\x1a\xe4\x09\x42\x4e\
+\x4c\xda\x41\x98\xb8\xa9\x3c\x79\x1f\xc8\xb1\xae\x04\xbe\x03\x00\
+\x0e\x3a\xf4\x45\xf7\x95\x8e\x97\xe5\x0c\x35\x9a\xdc\x54\xd0\x4a\
+\x93\x84\x15\xa9\x6b\x8a\x3c\x56\xfc\x42\x8b\x0d\x85\x4a\x97\x4d\
+\x04\x36\xf0\x04\x4b\x66\x00\x74\xa9\x6c\xfb\xbf\x9c\x8d\xf4\x02\
+\x9d\x05\x20\x79\x7d\xef\x00\xbe\x58\x55\x02\xb7\xc4\xa1\xf7\x8c\
+\xe4\xe0\x02\x90\xf8\xf9\x78\x53\x05\x4d\xae\x06\x9d\xb9\x16\x14\
+\xb3\x64\xd8\x95\xe7\x8a\xc3\x03\x4c\x22\x26\xfe\x65\x7b\x55\x24\
+\xe0\x9c\x9e\xf4\x78\xc8\x2f\x8c\x6a\x5d\x03\x23\x77\xe9\x1c\x04\
+\x5d\x5d\x71\x9e\x63\x30\x1a\x98\xbf\xe9\x5f\xee\xbd\x9f\x7f\x5d\
+\x09\xbc\x04\xc0\x97\xce\x01\x4c\x5b\x10\x78\x1b\x81\xf6\xb9\xf2\
+\x06\x94\xad\xca\xd0\xd5\xad\x89\x1c\x3d\xd4\xf5\x01\xc1\xd0\x6e\
+\x89\x36\x8d\xd5\x91\x9e\x07\x6b\x6f\x11\x89\xa1\x34\x86\x8e\x35\
+\x35\x44\x5b\x0d\x0c\x92\x64\x90\x38\x2d\x43\xf5\x95\x5c\xc7\x23\
+\xd0\x79\x3f\xff\x66\xd5\x2a\x70\x53\x1c\xfa\xc1\x5c\x04\x56\x98\
+\x06\xb3\x83\xb4\x52\x29\x2c\x59\x66\xc7\x88\x3a\x96\xe4\x8d\x46\
+\x6b\x83\x60\x14\x4a\x7d\x73\x6b\xac\x8e\xf4\x8c\xfb\x0f\x8c\xc4\
+\x65\xfa\xcc\x0b\x22\x75\x60\x46\xa4\xc9\x42\xa3\x7d\x50\xcf\x41\
+\x9d\x95\xc5\x0f\x39\xef\xe7\xbf\x5e\x59\x02\x2f\x01\xb0\x93\x42\
+\xd2\xc3\xfd\x11\x58\x74\x30\x64\x0d\xea\x52\xbb\xd4\x1a\x49\x96\
+\xdd\x52\x10\x6b\x66\x5a\xa3\x39\xd7\x49\xdb\x1b\x0d\x7d\x1e\x44\
+\x6a\xa0\x78\x47\xcd\x81\xc5\x59\x68\x1d\xd5\x2e\x69\x04\x4e\x0f\
+\xa6\xd5\x16\xf4\x1b\x7d\x22\xa6\xb6\xd9\xa1\x94\x6f\x0e\x12\xf8\
+\xce\x89\xe0\x7d\x0d\xc1\xca\x79\x21\xe4\x37\x44\xd1\x77\xb6\x67\
+\x1f\x6c\x04\x26\xdc\x9b\x44\x4d\x16\xcd\xd3\x4e\x6e\xac\x8e\xf4\
+\x48\x2a\x6c\x6a\xc5\x92\xde\x0f\x1d\x3f\x99\x33\x1a\x30\x9d\x4a\
+\x90\x83\x5f\x4b\xc3\xc8\x56\x4a\xdc\x13\x81\xef\x35\x53\x44\x7a\
+\xb9\x3e\x80\x2f\x7d\x03\x58\x37\x98\xcc\x22\x36\x57\xe8\xb1\x0c\
+\xd0\xaa\xe0\x60\x5a\x15\x64\x03\x12\x23\xd4\x78\xa3\x6c\x10\x1b\
+\xab\x23\xbd\x43\xc9\x1d\x33\x08\x35\x1f\x1d\x32\x4c\x9a\xd1\x61\
+\x9c\xe3\x57\x7b\x07\x77\x71\x8a\x44\x09\xa6\x18\xe0\xbf\x9f\x7f\
+\x7d\x09\xdc\x0e\x87\xde\x7c\x98\xb7\x62\x69\xba\x14\x33\x9e\x2c\
+\xdb\x0a\xf5\x12\x2c\x04\xf3\x00\xb9\x06\x86\x11\x4d\xd4\xa8\xd4\
+\x60\x1a\xda\xfc\xfe\x3a\x76\xc8\x8e\x87\x56\xf6\x9c\x71\x12\xa5\
+\xcb\x68\x78\xb6\x4e\x2a\x32\x93\x7c\xe3\x5f\x74\xbe\xdb\x81\xd7\
+\x97\xc0\x4b\x00\xec\x64\x35\xf7\x37\x04\x43\x30\x13\xda\x64\xac\
+\x33\x84\x3c\xa7\xa5\x3f\xe5\x75\x60\x4d\xc2\xc8\xb5\x83\xd5\x3c\
+\x9d\xb6\xe3\x8f\x2d\xe1\xf7\x89\x06\x5d\x14\x2f\xa9\xad\x1a\x59\
+\x35\x41\x70\x14\x79\x22\xa8\x15\xff\x96\x14\x8e\x4d\xd6\x8b\x0e\
+\x02\xdf\xdd\x84\xeb\x4b\xe0\x86\x38\xf4\x87\x59\x0a\x0d\xd6\x1d\
+\x34\x14\xc1\xa6\xf0\x6b\x2c\x0a\x28\x83\x3a\x06\xc9\x19\x0c\x83\
+\x18\xce\xb7\x7f\xb6\x04\xe0\xa7\xa3\xdf\x35\x23\xbe\x4a\x67\xf2\
+\x13\x90\x87\x5d\xc9\xb0\xbf\x90\x1f\x90\x5a\xff\xe5\x7f\xcd\x77\
+\x3b\xf0\x66\x7d\x09\xbc\x64\x30\x96\x93\x42\x12\xcc\x51\x68\x18\
+\xe6\x97\x29\x27\x05\xb9\x1a\x1b\xc7\x08\x35\x28\xd8\x4d\x27\xbd\
+\xea\x68\x3a\x8d\x1b\x6b\x67\x38\xb7\x4d\x0b\xa0\xe4\x43\x49\x35\
+\xda\x9e\x7d\x53\x1f\xce\xf8\x8c\xa6\xf9\x33\x96\x83\xba\x80\xbe\
+\xbb\x09\xaf\x57\x36\x42\xb7\x25\x82\xaf\xf6\x76\xf4\xcb\x30\x68\
+\x13\x74\x21\x0f\x22\x56\x18\x6b\x8d\x09\x4d\x78\x56\x77\xa0\xec\
+\x59\xa1\x8b\x4d\xa5\xa1\x1f\x69\x19\x4d\xcf\x28\x0c\x79\x54\x45\
+\x35\x42\xab\xd5\x4d\xc3\xb3\x89\xd2\x72\x30\x66\x39\x84\x79\x27\
+\xe5\x97\x66\x18\xf4\x71\x01\x00\xdf\x6f\x44\x04\xef\x6b\x47\xca\
+\x5b\xe1\x82\x94\x85\x32\xbd\x3b\xd2\xc3\x60\xc2\x6d\xc8\x5b\xe4\
+\x20\x7b\x36\xb6\xd6\xce\xf0\xce\xfc\x8e\x30\xa1\x3a\x82\x69\xc4\
+\xb4\xcd\xfb\x36\x2a\x4b\xa3\x7f\xbe\x9a\x5a\x0b\x0e\xde\xbb\x09\
+\xbf\x5d\x44\xba\x2c\x80\xdf\x05\x73\x75\x7c\x88\xe0\xd7\x5d\x07\
+\xa3\x0f\xa5\xd0\x23\x16\x97\xb5\xd7\x98\xab\x33\x4c\x66\xab\x25\
+\x83\xa3\xf8\x65\xbd\xc7\xcf\x6d\xb0\x95\x01\xb3\xf6\x5f\x3b\x10\
+\xcc\xc6\xd1\x6c\x6d\xd1\x12\x19\xe3\x37\x35\x16\x0f\x9b\x74\xb8\
+\xa1\xcb\xa3\x8f\xae\xfb\x7c\x90\xc0\x77\x50\x04\xff\x3c\x5b\x08\
+\xe6\x39\xe2\xa6\x72\x34\x93\xd6\x02\xc3\x09\xd5\x7d\x05\xd9\x9e\
+\x83\xac\x9b\x5f\xb9\x75\x43\x69\xe8\x27\x99\x9a\xc8\x28\x87\x36\
+\x2f\x58\x60\xc2\x54\x7d\x2e\x83\x36\x66\x07\xa8\x88\x19\xd7\x57\
+\x07\xae\x43\x02\x2f\xb8\x4e\xb0\x0f\x0e\xfd\xe7\x7d\x14\xda\x36\
+\xb5\x0d\xe6\x4a\x8c\x91\x8c\xc3\x1c\x96\x8d\xb4\x90\xed\x62\xc3\
+\x22\x1b\x72\x43\x3f\xb5\xe7\x96\x99\x1c\x86\xb9\x2f\x7a\x70\xb6\
+\xc1\xa0\xe3\xd0\xd2\x15\xcc\x8e\x3c\xf9\xc9\x77\x33\x52\x1d\x12\
+\x78\x89\x08\x76\xc1\xa1\xe7\x2e\x30\x6a\xeb\x3f\x98\x57\x31\x31\
+\x64\x76\x22\x13\x4a\xc6\xa4\x10\xf2\xbd\x87\xa3\x7c\xf5\xdb\x76\
+\x00\xfc\x53\xa6\x6e\xc1\xcc\x2a\x31\xd9\x65\xdb\x5b\x34\xc8\x1f\
+\x80\xcd\x2e\xa0\xcd\x4a\x0f\x32\x86\xae\x2f\x2e\xba\xa9\x43\x02\
+\x2f\x11\xc1\x2e\x38\xf4\x54\x37\x03\xa6\x42\x30\xe6\xbb\x6b\x64\
+\x88\x1e\xfe\x08\x61\xae\x6c\x3c\x7c\x09\x6a\x7f\x7f\x43\x57\x67\
+\xf8\x2d\x4c\x1b\x5c\x26\x1e\x81\x4c\xd6\x86\xa1\xc4\x98\x5a\x64\
+\xb3\xba\x93\x00\x06\x27\xbd\x0c\xd7\x15\xf8\x28\x97\x8a\x60\x0f\
+\x85\xa4\x13\xb3\x03\xf4\xbe\xc3\x7d\xfb\x68\x72\x8b\x66\x14\x1b\
+\x86\x79\xe9\xf9\x17\x34\x96\xc3\x1a\xaf\x0f\x4e\x14\xdc\x86\x55\
+\xa5\xb0\xe7\x70\x1c\x97\xd8\x21\x1d\xb2\x83\x7b\x27\x56\xe8\x8b\
+\x4a\x24\x70\x2b\x22\xf8\xa4\x93\x2c\xa6\x85\xb0\x90\x3f\x9c\x0c\
+\xa0\x03\xe3\xc1\x04\x3e\x61\x14\x59\x20\xe3\xe1\x52\x87\x6a\x07\
+\xc0\xbb\x7c\x6c\x89\x96\x7a\x87\xd1\x76\x60\x3d\x05\xcb\xb7\xc1\
+\xf6\x5c\x9b\xc7\xd0\xac\x61\x82\xec\x08\xc2\x2e\x72\x2e\x67\x35\
+\xf8\x28\x97\xba\x29\x3d\x70\xe8\xfc\xea\x48\x30\xba\x36\x83\xb9\
+\xc0\x8f\x01\x22\x0e\x7d\xf8\xc1\xf6\x31\xe4\x25\x4e\xc8\x0c\x5d\
+\x79\xbd\x09\x1a\x32\x53\x3e\x1b\x55\x91\xd0\x78\x2f\x4c\x1e\x1f\
+\xe7\x23\x2f\x0c\xa1\x3f\xf9\x1c\x50\xa9\xa3\xf1\xd7\xc9\x95\x91\
+\x36\xf5\x00\xf8\x4f\x6d\x70\xe8\x0f\xdf\x48\x43\xef\x51\x72\xe1\
+\x1b\xe4\x6f\xd1\xeb\x9a\xc9\x62\x9d\x0f\x0a\xba\x7b\xd6\x67\x22\
+\x9d\x80\xdf\x5e\x5a\x91\xc1\x9e\xad\xd0\x17\xb5\x48\xe0\x66\x3a\
+\x92\xba\xef\x00\xf0\xd2\x1b\x2e\xd9\x8f\xf4\x94\x5f\xda\xcb\x61\
+\x2d\x3a\xe9\x32\x4f\xc7\xb7\x60\x9b\x3f\xaf\x73\x7c\x65\xa4\x5a\
+\x8a\x48\xcb\x00\xec\xa1\x90\x74\x95\xf1\x31\xf9\x6e\xe4\xbf\xda\
+\x93\xc4\x9a\x49\x52\x8d\x9e\x33\xb0\x52\x36\x36\x99\x12\xbf\x9f\
+\x99\x4c\x2d\x17\x8e\x32\xfb\xa3\xc5\x75\x6c\x85\xae\xa6\x88\xd4\
+\x8e\x08\x3e\x1a\x95\x23\x4c\x1a\x1a\xb3\xe1\xb0\x38\xe0\x81\xb0\
+\x64\xab\x66\x9d\x0d\x13\xf1\x79\xdb\x4e\x0e\x6b\xba\x90\x06\xfb\
+\x16\x09\x26\x16\x66\xaf\xfe\x15\x00\x5b\x01\x0c\xfd\x57\x17\x56\
+\xe8\xeb\x3a\x7c\x94\x8b\x0b\x49\x0e\x38\xf4\xeb\x9b\x37\x1f\xb0\
+\xc7\x2d\x20\x87\x61\xf8\x3f\x29\xf4\x77\xdd\x1a\xc9\x62\x3d\x2d\
+\xb6\x60\x3d\x5c\xa1\xeb\xc8\xb5\x0e\x7c\xe4\x7e\x6e\x83\x41\x7f\
+\x2d\x07\xe0\x36\x38\xf4\xef\x13\x96\x80\xbe\xae\x54\x6c\x3f\x36\
+\x92\xc5\xfa\xa9\xdc\x91\x37\xe5\xe2\xf0\xe1\xa4\xdc\xd4\x24\x81\
+\x97\xb8\x29\x1d\x70\xe8\xd3\xc9\x9a\x44\x41\x00\x37\xd2\x51\xf8\
+\xae\x60\x04\x1e\xda\x6e\xe2\x77\x9f\x9a\x60\xd0\x05\x25\x70\x23\
+\x85\xa4\x07\xb9\x87\xb2\xff\x03\x45\x01\xdc\x48\x16\x2b\x94\x05\
+\x30\x73\x67\x71\xe1\xb8\x70\x52\x5e\xd4\x24\x81\x1b\x11\xc1\x27\
+\xaa\x81\x87\x66\xe8\x42\xb7\x7f\xb5\x80\xdf\xe7\x25\x19\x34\xe0\
+\x30\xe5\xe8\xc3\x49\x79\x56\x97\x04\x5e\xe2\xa6\xac\x9f\x43\x6f\
+\x6c\x00\xd6\xf3\xbc\x60\x16\xab\x89\xb9\x58\xe7\xa5\x23\x30\x64\
+\xa5\x3f\x1f\x43\x65\x2b\xb2\x61\x2d\x16\xc1\xd5\x73\x68\xf6\x52\
+\x82\x4d\x89\x60\x49\x00\xff\xad\x05\x00\x3f\x2e\x9e\xc3\xe2\xa4\
+\x45\xa4\x4f\xe8\xc2\x49\x79\x51\x97\x04\x5e\x24\x82\xeb\x3f\x17\
+\x69\x13\x24\x5e\x86\x7f\x8c\x15\xeb\xfb\x22\x4a\xfb\x36\x8e\x3f\
+\x9e\x42\x83\xa6\x2b\xdc\x18\xb1\xce\x6a\xf2\x51\xb6\x53\x48\x82\
+\xbc\x1a\x11\xb1\x7c\xb3\x37\xca\x6d\xc8\x16\xac\x1c\x4f\x76\xa5\
+\x23\x30\x1a\xfc\xf6\x39\x0b\x6c\x82\x41\x1f\x57\x07\xe0\xfa\x45\
+\xf0\x11\xea\x30\x3b\x76\x08\x14\xa5\xd0\x2d\x8c\xd5\x79\x56\x70\
+\xb9\xba\xc4\x99\x19\xbb\xd0\x1f\xb9\xe8\xc1\x88\x75\x5d\x9b\x04\
+\x5e\xe4\xa6\xac\x9e\x43\x1f\x65\xc1\x57\x5a\x4d\x0b\x72\xc2\x06\
+\xac\x1c\x05\x6d\x1c\x5c\x06\x06\x66\xd2\xe9\x47\x07\x00\xae\xac\
+\x88\xb4\xb0\x90\x54\x3d\x87\xfe\x3d\x93\xbf\xe2\xd3\xc3\x83\x08\
+\xae\x53\x02\x03\xa9\x1c\x9a\xbc\x90\xa2\x31\x38\x98\x49\xb9\xa9\
+\xad\x88\xd4\x48\x21\xe9\xd4\x48\x5f\x3e\xd0\xcb\x16\x82\x1b\x10\
+\xc1\xbb\xc2\x11\xb8\x53\xc1\x43\x77\x9f\x5a\x60\xd0\xc7\xc5\x01\
+\xdc\x40\x21\xe9\xa1\xec\x04\x62\x65\x29\x1c\xe3\x41\x04\xd7\x29\
+\x81\x81\xdf\x23\xe8\x44\xf6\xa0\x07\x23\x56\x75\x45\xa4\x85\x85\
+\xa4\xda\x39\xf4\x89\xd6\x13\xb3\x76\x86\x70\x10\xc1\x35\x4a\xe0\
+\xa0\xef\x51\xd2\xc0\x74\xfa\xde\x6b\x80\x41\xbf\x28\x0f\xe0\x06\
+\xf2\xd0\x9b\x9c\x3b\x8b\xad\x32\x1c\x44\x70\x8d\x12\x38\xa8\x77\
+\x43\xb3\x8f\x37\x1f\xaf\x0e\x00\xbe\x2d\x11\x5c\x3b\x87\xfe\x40\
+\xa9\x2b\xc9\x69\xc6\xbd\x01\x05\xf7\xe4\xf6\xc7\x43\x15\xf8\x7f\
+\x30\x62\xa5\xda\x1f\x3a\x99\x88\x75\x51\x5f\x11\xa9\x91\x42\x52\
+\x36\x4d\x07\xa5\x4f\x3c\x1c\x44\x70\x8d\x12\x38\xa0\x5c\x81\x8e\
+\xbf\x44\x4f\x47\x03\x36\xac\x97\x6b\x00\xf8\x07\xff\x1c\xfa\x8a\
+\xa9\x33\x52\xec\x4d\x72\xb8\xe4\xa6\x74\x6e\x87\x7e\x5c\x52\x6e\
+\x10\x70\x51\xca\x48\xb1\x03\xe5\x63\x03\x0c\xfa\xeb\x1a\x00\x6e\
+\x80\x43\x1f\x11\x75\x46\x16\x54\x5d\xf1\x34\xb4\x73\x11\x5c\xf2\
+\xac\x53\x1f\x74\x96\x78\xfc\xd8\x00\x83\x3e\x5e\x05\xc0\xf7\xdd\
+\x73\xe8\xfe\x12\xc1\xe4\xc7\x4b\xe5\x60\x40\xbc\xc1\x6f\x49\x00\
+\x6f\x5d\xf7\x04\x3f\xdf\x95\x8e\xc0\x7d\xd4\xa5\x6e\x24\x4a\x5e\
+\xfc\xea\x9f\x41\x5f\xae\x82\xdf\x25\x85\xa4\xca\x39\xf4\xa9\x56\
+\x14\xc1\xf4\x15\x96\x04\xb0\xef\x9e\xe0\xf3\x15\x22\x70\x7a\xc7\
+\x90\x2c\x74\xd8\x7d\xf2\xcf\xa0\x5f\xac\x03\xe0\x25\x85\xa4\xba\
+\x39\xf4\xc3\xb8\x15\x38\xfa\x42\xfc\xa1\x0f\xc9\x25\xb7\xe5\xdf\
+\x3d\x03\xf8\x7d\x51\x00\x77\x31\xfa\x02\x9d\xb7\x5c\x50\x7a\x73\
+\x60\xd0\xb7\x08\xe0\xba\x39\xf4\x89\x3a\xf2\xc0\x0e\xb6\x2b\xb9\
+\x2d\x5d\xbb\x29\x4b\x32\xe8\xc0\x7d\x84\x16\xbf\x37\x80\xbe\x77\
+\x60\xd0\xb7\x58\x48\xaa\xdb\x8c\xb5\xe9\xe8\x3c\xa7\xe8\xdb\x61\
+\x12\x56\x45\x01\xec\xb8\x90\x54\xb4\x88\x14\x64\xf0\x60\x7c\xc7\
+\xb8\xf9\xb3\x76\x1f\xc7\xa6\xd2\x22\x52\x1b\x85\x24\x39\xcf\x53\
+\x17\x03\x52\x18\x2e\xba\x2f\x1d\x17\x92\x1e\x17\x5d\xa8\xf4\x06\
+\xf1\x3b\xd6\x1f\xba\xf1\x3b\xff\x0c\x7a\x2d\x09\xbc\xa8\x90\x54\
+\xf7\xf9\x48\x7e\x1e\xea\x62\x80\x3e\x02\x63\x41\x33\xf4\x36\xde\
+\x1f\x7c\x94\x0b\x01\xcc\x90\x45\xee\x69\xe8\xef\xbf\xb8\x67\xd0\
+\x17\xab\xe1\xd7\x3f\x87\x3e\x02\x1a\xec\x10\xb9\xb3\x98\x6c\x31\
+\x82\xeb\xf6\x3f\x9c\x17\x92\x52\x11\x69\x57\xe8\x03\x40\x19\x34\
+\x19\xe7\xfa\xf7\xea\xa3\x7b\x06\x5d\x37\x80\xeb\xe6\xd0\xaf\xd5\
+\xc9\xd1\xf1\xd9\xde\x9f\xf3\x0c\xae\x43\x21\xa9\x9a\x22\x52\xdf\
+\xce\x4f\x6f\x50\xcc\x56\xc4\x93\xf7\xe6\x91\xca\x2f\x8c\x74\x5d\
+\x33\x83\xf6\x9f\x87\x3e\x8d\x79\x2b\xa4\xdd\x20\xd7\x66\x28\x47\
+\x0d\xb7\x9e\x0b\x49\x5f\x62\xfc\x2d\xd7\x0d\xac\x65\x02\x44\x99\
+\x2d\xfb\xc9\x3d\x83\x3e\x5e\x11\xc0\xf7\x9d\x73\xe8\x07\x6a\x9f\
+\xec\x24\x23\x5d\x3a\x8b\xe5\xb5\x23\xa9\x68\x27\x52\x9c\x29\x9b\
+\x92\x14\xc8\x15\xa4\xc8\xa2\xff\xe2\x9d\x41\x5f\xae\x88\x5f\xf7\
+\x66\xac\x93\xe4\xa5\x44\xa3\xa9\x62\x18\x2e\xba\x33\xbd\x72\xe8\
+\xb2\x0c\x3a\x24\x85\x23\xe3\xcb\x90\xbe\xde\x3b\x30\xe8\x3b\xcc\
+\xa1\x37\xc9\x12\x40\x17\x56\x89\x9a\x2a\x6e\x93\x98\x62\xda\x15\
+\xf8\xf4\xcc\xa1\xdf\x47\x05\xb0\x2b\xb4\x50\x3b\x2e\x1e\x01\x74\
+\xec\xe1\xe8\x63\xf2\x2b\xef\x0c\x7a\x5d\x00\x5f\x3b\xe7\xd0\x49\
+\x4e\x65\x11\x18\xa0\xb0\x15\xcb\xab\x19\xab\x2c\x83\x0e\x31\x7f\
+\x95\x02\x70\x7c\x93\x28\x20\x1f\x72\xd0\x77\x3a\x0f\x2d\x73\x4a\
+\x81\x22\x30\x69\xe1\x52\xbb\x32\x82\x60\xfb\x57\xa7\x0c\x7a\x57\
+\x30\x5b\x9f\x2e\xbe\x1e\x15\x30\x19\x3a\xfa\x47\xf0\x8b\x77\x06\
+\xfd\x72\x5d\x00\xff\xe0\x9c\x43\x1f\xf1\x71\x8e\xdc\x6c\x9a\x76\
+\x48\x4f\xdb\xca\x54\x82\xfb\x3f\xff\xf0\x08\xe0\x7f\x0b\x81\x28\
+\xf2\x01\x9a\x79\x4e\x10\x86\x58\x38\xf8\xe8\x9d\x41\x7f\x5d\x17\
+\xc0\xde\x39\xf4\x6b\x92\xc0\xc9\x4e\x09\xe4\x12\x28\x58\x47\xda\
+\xb9\x6d\x68\xd8\x15\x2d\x22\x6d\x53\xd0\x4d\x1a\x18\xf4\x5a\x38\
+\xbf\x1e\x18\xf4\x9d\xe6\xd0\xa7\x48\x2d\x6a\x1d\x73\xb3\x94\x25\
+\x29\x2c\x82\x1d\x36\x34\x3c\x0b\x42\x20\x4a\x55\x91\xf4\x72\x2a\
+\x28\x11\xf8\x93\x73\x06\xed\x02\xc0\x15\x73\xe8\x87\xd4\x9a\x86\
+\x49\xfb\xd2\xc0\x96\x98\x86\x2e\x93\x5e\x4d\x08\x70\x98\x87\x7e\
+\xcf\x46\x94\x42\xeb\x14\x0d\xd0\xe4\xba\x61\xeb\xfa\xcd\xdd\x9b\
+\x03\x83\xbe\xd3\x1c\xfa\x24\x0d\x77\x20\xf8\xa6\xdd\x51\xbe\x10\
+\xec\x91\x43\xef\x4a\x86\xdf\x18\x81\xd9\x87\x45\x6d\x9f\x49\x0c\
+\xdf\x73\xce\xa0\x8f\x57\x07\xf0\x7d\xd7\x1c\xfa\x8c\x93\xd0\x40\
+\x55\x89\xa4\x85\x4b\xf6\x23\xc5\x6a\xb0\xbb\x3c\xf4\xf9\xae\xa0\
+\x00\xee\x17\x89\x0e\x57\xe4\x6a\x12\x15\xed\x9d\x33\xe8\xcb\xd5\
+\xf1\xeb\x9d\x43\x47\xf0\x0a\x81\x8e\x53\xed\x62\x7f\x61\x29\x23\
+\x07\xc1\xe0\xca\x23\x83\xde\x16\x13\x1a\x3b\x9a\x68\x47\xc7\x2d\
+\xd9\xd7\x7b\xf6\x74\x70\x71\x94\x30\x63\x55\xcc\xa1\x8f\x78\xc2\
+\x03\x11\xe8\x8e\x10\x5d\x36\x8b\xe5\xae\xa7\xb0\xe8\x38\xca\xd4\
+\xca\x40\xef\x50\x3a\x6e\x21\x39\x6e\xaa\x6e\x26\xf4\xc1\xa0\xbd\
+\x73\xe8\xd7\x68\x23\x30\x92\xc5\xa7\x2f\x04\x97\xa9\x22\x6d\xc9\
+\x0e\xf1\xd6\x9f\x8b\x63\x5b\x52\x03\x03\xf2\x3b\x94\xbe\x21\x18\
+\x7f\x3e\x30\xe8\x22\x0d\x0d\xf5\x72\xe8\x53\x0e\xba\x1c\x81\x53\
+\x81\xe2\x46\x04\xef\x0a\xdc\x38\x11\xb4\xf5\xc6\xa1\xbf\x50\xfd\
+\xab\xd4\x2d\x44\xc4\x72\xe3\x27\xfb\x38\xaa\x6e\x26\x5c\xc2\xa0\
+\x5f\xd6\x00\xe0\x1f\x5c\x73\xe8\x87\xc8\x13\x5a\x92\x06\xa6\x4b\
+\x77\xc0\xb6\x10\x79\xee\xc3\x6f\x0f\x64\x5f\x1c\xfa\x69\xfc\x6f\
+\x17\x6e\xe7\xd7\x4b\x7b\x03\x5d\x23\x09\x6a\xae\x22\x6d\x5c\x14\
+\x91\x16\x16\x92\xea\x9d\x0f\x7d\x92\x9c\x58\x40\xe5\x45\x9a\x3b\
+\x1c\x23\x70\x19\x1b\xd6\x8e\x98\xb4\xab\xd9\x76\x8f\x23\x71\xd8\
+\x95\xa3\xd0\x57\x94\x9a\x40\x9a\xe9\x0e\xe9\x2b\x54\x5c\x45\xba\
+\x70\xc2\xa0\xbd\xe7\xa1\xc9\x06\xad\xa9\xac\xd4\x99\xd4\x67\xb1\
+\x6e\x9f\x41\x27\x09\x9c\x30\xec\x09\xc0\xe2\xc1\xda\x15\xba\x01\
+\x5b\xa1\x01\xe5\xaa\x2a\x3d\x8c\xff\x73\x60\xd0\x65\x38\x74\xbd\
+\x69\xac\xc4\xc6\x80\xca\x8b\xd4\x59\x98\xac\x58\x85\x32\xd0\x09\
+\xc7\x9e\x4a\xc1\xe7\xd4\xca\xfc\x5f\xf6\xae\xa5\xc7\x8d\xe3\x08\
+\xff\x09\xdf\xf8\x27\x7c\xf3\x59\x40\x00\x66\xb1\xd8\xab\x11\x27\
+\x67\x01\xf6\x6a\x0f\x02\x24\x60\x0f\x82\x6e\x49\xd0\x9d\xc9\x71\
+\x03\x74\x7b\x75\x8d\x91\x3d\x0a\x90\xe3\xd9\x30\xbe\x5b\xc8\xc5\
+\x87\x00\x7b\xd0\x9f\x31\xa7\xbb\xaa\xbb\xba\x67\x86\x6c\x92\xf3\
+\xa8\x1a\x91\x22\xd9\xe4\x68\x39\xe4\x3c\xaa\xbf\xaf\xbe\x7a\x8c\
+\x99\x58\xc3\x22\x08\x0c\x3d\x90\xce\x0c\x7a\xa2\x40\x12\x5f\x0e\
+\xbd\xaa\x01\x83\x03\x02\x3b\x0e\x3d\x4d\x63\xca\xa0\xe4\x6a\x2d\
+\x29\x9d\xf2\x01\xdb\x79\x99\x89\x8a\xb6\x34\x14\x6d\x57\xfe\x7a\
+\x66\xfe\x08\xf1\x6e\x49\x79\x2b\x20\x0f\x7a\x11\x1c\xfa\x0d\x9c\
+\x17\xd8\x5e\x16\x55\xac\x29\x0a\x0a\x51\xc8\xd2\xb2\xda\xcb\xde\
+\x00\x67\x50\x66\xb2\x72\x42\xd0\xad\x00\x7b\xc1\xcb\xa9\x19\x5f\
+\x99\x50\x10\x83\x16\xce\xa1\x2f\xf1\xba\xef\x10\xa1\xa8\x3c\x4d\
+\x9b\x24\x99\x52\xa3\xf1\xba\xc9\x42\x4c\x28\xf8\x3b\xf8\xed\x13\
+\xea\x58\xa0\x34\xfa\x49\x16\x74\xc6\xed\xb2\x0f\x67\x06\xfd\xd9\
+\xeb\xd0\x17\x30\x99\xfb\x53\xa3\x0e\xe6\xfc\xd8\x18\xd7\xc8\x8f\
+\x60\xc5\x1e\xc8\xe4\x48\x58\x46\xab\x80\xc0\x13\xec\x27\x87\xc0\
+\x9e\x36\x07\x1b\x76\x87\xec\x8b\x33\x83\xfe\xec\x39\xf4\x9a\x90\
+\x32\x2a\x68\xd5\xd3\x84\x81\xb5\x0e\xfd\xa1\xa5\x54\x05\xbf\x30\
+\xc1\x7a\xcd\x44\x08\x0c\x59\x72\xf5\x26\xf2\x67\x57\x95\xf4\x5a\
+\x32\x83\x66\x64\xc0\xa2\x39\xf4\x26\x52\xb3\x1a\x64\x12\xf7\xb2\
+\x49\xb0\x18\x17\x56\x4c\x48\xa7\x34\x8e\x91\x7e\x2f\x45\xc2\x02\
+\xeb\xd5\xf0\xf3\x47\xc7\x5f\x03\x35\x9f\x55\x24\x4b\x3e\xac\x24\
+\x39\x8d\x92\x11\x83\x96\xcd\xa1\xef\xab\x3a\xe2\x2f\x38\x5a\xcd\
+\xa2\x69\x52\xa1\xc1\x8c\x7d\x5e\x84\x08\x19\xeb\xda\x60\x0e\x99\
+\x17\xd2\xa7\x71\x81\x83\xfd\x6e\x50\x65\xdc\x1e\xa6\x47\xd1\x0c\
+\xfa\x4b\x46\x06\xfc\x95\xe0\x74\xca\x15\x84\x26\x42\x16\x96\x17\
+\x4c\x2a\x5f\xc9\x36\xe2\x03\xe9\xa7\x7f\xd1\xd8\x83\x88\xe6\x76\
+\xdf\xa0\x6e\x0e\x31\xb0\xd1\x4b\x09\xb7\xfb\x07\x42\x47\xe8\xdf\
+\x80\x0f\xcc\xb7\x94\x61\x2d\x8b\x41\x97\x15\x34\x70\xe5\xd0\x97\
+\x91\x9a\xd5\x84\xa5\x41\x57\x9d\xf1\x1e\x2e\x09\xda\xe5\x63\xb9\
+\x17\x0d\x89\x16\x71\x91\x15\x68\x71\xe3\x43\xc0\x6e\x18\xbb\x64\
+\x5a\xab\xf4\x10\x79\x41\x6b\x3b\x7e\x90\xcc\xa0\x5f\x72\x32\xe0\
+\x22\x0e\xcd\x54\x71\xb8\x40\xd6\x8c\x79\x02\x50\xef\xf2\x18\xc4\
+\xa5\x71\x1e\x26\x6d\x4c\xe9\x8c\x41\x40\x24\xe9\xbb\xe8\xfe\x6a\
+\x88\x25\x8d\x1d\x6a\x53\x28\x42\x43\x0d\x21\x56\x05\x57\x77\x67\
+\x06\x7d\xe6\xd0\xbf\x7b\x86\x8a\x08\x64\xea\xe1\x2c\x5f\xbb\x32\
+\xb6\xf1\x1e\xa1\x16\xcf\xbd\x50\xae\x26\x49\x40\x42\xb4\xa7\x0b\
+\xfe\x37\x6b\x35\x7e\x41\x61\xf3\x15\x60\xbe\xd0\x3c\x05\x3a\x79\
+\x57\x7c\xaf\x8b\x24\x8e\x41\x97\x05\x92\xb8\x72\x68\x28\x26\xc4\
+\x4b\x13\x42\x69\xa1\x6f\xca\x61\xc6\x7b\x68\x7a\x89\x51\x05\x1c\
+\x9a\x7d\x24\xc9\xc7\x90\x20\x8b\xc3\x4d\x3a\x63\xeb\x7c\xa6\xa9\
+\x25\xc4\x04\x39\x04\x5f\x5f\xda\x70\x66\xd0\xd3\xe6\x43\x33\xe5\
+\xd0\xf7\x70\xc5\x4a\x4f\xd0\x42\xe3\xb4\xca\xd7\x0b\x8d\xf7\x08\
+\x18\xe3\x4b\xfb\xb5\x88\xba\xfe\xc7\x60\xbd\xc6\x95\x51\x8d\x5f\
+\xb1\xb5\xfd\xbe\x0d\x20\x70\x05\x9e\x0e\x3c\x71\x15\xa1\xaf\xe4\
+\x31\x68\xd1\x1c\x7a\x05\xbc\x19\xbb\xba\x63\x75\xff\xb8\x2e\x70\
+\x74\x82\x35\x60\x9a\xbb\x33\x87\xe0\x6b\xaf\x3f\xc3\x8c\x33\x95\
+\x0b\x0c\xad\x28\xb1\xe4\x04\x83\x7d\xef\x05\x33\xe8\xb7\xcc\xec\
+\xb7\x8c\x43\xf3\x0c\x05\x5f\xa2\x70\x55\x41\xd7\x70\xef\x0c\x57\
+\x63\xba\xc0\x88\x2d\xc1\xcf\x56\xd0\x1b\x8b\x79\x32\xc7\x03\x90\
+\x5a\x67\x59\x53\xb9\xc0\x8a\xc4\xf8\x00\x86\x59\xf7\xd3\xb9\x15\
+\xc8\xa0\x25\x73\xe8\xdf\xc7\x1a\x35\xaf\x46\xd7\x50\x7c\x3a\x9e\
+\x0b\x1c\xab\x01\x70\xa1\x67\xa4\xc6\xd8\x1f\x98\x03\x30\xaa\x6f\
+\x53\xba\xc0\x55\x8d\xfa\x44\x88\x13\x34\x2f\xff\x7c\x66\xd0\x13\
+\x73\x68\x9e\x32\xd6\xb3\x10\x5a\xac\x7d\x0e\x07\xea\xd1\x23\xbb\
+\xbe\xe8\x40\x7a\x59\x17\x5b\x73\xb0\x4e\xe6\xf8\x18\x44\x37\x35\
+\x95\x0b\xdc\x7c\x51\x74\x70\x42\x9c\xa0\xb1\x68\xa6\x22\xf4\x93\
+\x44\x06\x2d\x9a\x43\x43\x26\x25\x3a\xc1\x35\xce\xf4\xe3\xb8\xbe\
+\x11\x5b\x0c\x75\x81\x9d\x47\xb9\x5d\x66\x19\xe7\x53\xde\x18\x12\
+\xf6\x9a\xcc\x05\xd6\xe8\xe1\xa4\xa1\x3e\xb6\x99\xd0\x32\x19\xb4\
+\x64\x0e\x7d\x5f\x61\x2d\x3f\x3a\xc1\xde\x88\xc7\x71\x7d\x69\x4b\
+\x59\xea\x02\x63\x6e\xc7\x3b\xe6\x00\xac\xb0\x8a\x70\x32\x17\xd8\
+\xd7\x21\xe1\x61\xd9\x60\xd0\x80\xa9\x08\xbd\x96\xc9\xa0\x25\x73\
+\xe8\xd5\x26\x80\xae\x4f\x17\x80\xd2\x06\xa5\x47\x70\x7d\x23\xb6\
+\x00\x80\x11\x17\xd8\x8d\x7c\x21\xf8\xb9\x41\xef\xd7\x51\xdb\xa9\
+\x5c\x60\x03\xe5\x62\x21\xd6\x07\x3e\xce\x4f\x67\x06\x3d\x7d\x3e\
+\x34\x4b\x08\xbe\x04\xe9\xaa\xae\xb1\x1b\x07\x5c\x48\xcb\x00\x6a\
+\xea\x81\xc6\xbc\xa9\xbb\x1b\xd1\x92\x0d\x22\x31\x5b\x08\xfe\x68\
+\x62\xf1\x85\x2b\xb5\x9c\xa0\xa1\xbb\x76\x79\x58\xe8\xfd\xc6\x1b\
+\xdf\x4c\x68\xa9\x0c\xba\x8c\x43\xb3\x0c\x05\x5f\xc4\x2a\x53\x10\
+\xa1\xc1\xd5\xd2\x50\x72\x63\x7c\xe7\x48\xad\x70\xc1\xf1\x23\x69\
+\x68\xe7\xca\x18\x60\xe5\xc6\x5b\x85\x3b\x67\xb9\x42\xf0\x8d\x55\
+\x26\xa8\xe5\xda\x23\xf0\x14\xff\x62\x15\x30\x56\x14\xfa\xfb\xdd\
+\x99\x41\x9f\x39\xb4\xdf\xe7\xd0\x68\xb8\x22\x91\x0a\xf7\x12\xeb\
+\xc9\x61\x38\xf1\x91\x2d\x01\xd5\x2a\x34\xa7\x74\x90\xe6\x66\x8a\
+\x77\x5c\x01\x18\x5b\x69\x86\xa6\x7c\x66\x8a\x86\x3a\x28\x2f\xd6\
+\x75\x68\xac\xe3\x12\x6e\x5e\x9f\x19\xf4\x0c\x3a\x34\xcb\xbd\x1e\
+\xc5\x4d\x24\xd3\x7e\x49\x2c\x69\x0b\x8d\x90\x0d\x42\xf2\x11\xa3\
+\x51\xe4\xa1\x3d\x80\xe9\xbc\x20\xaf\x79\xfc\xc0\x15\x80\x75\xc0\
+\x5e\xec\x57\x32\x6e\xc9\xa5\x13\xf6\xd2\x08\x12\x12\x6a\xa6\x22\
+\xf4\x95\x5c\x06\x5d\x56\x53\xc8\x12\x82\x57\x55\x00\xdd\xe0\x07\
+\x37\xa7\x09\x42\x23\xad\xed\xc7\xd7\x47\x8d\x9d\x08\x9c\x95\xbf\
+\x6e\x97\xb3\x4c\xc7\x7a\x30\x84\x2a\xc0\xcf\x1f\x84\x99\xec\x7b\
+\x54\xe8\xde\xc4\x63\xd3\x3c\xde\x9f\x19\xf4\x2c\x1c\x9a\x63\x28\
+\xf8\x0d\x15\x47\x70\x96\xdf\x8e\x8f\x2a\x9e\xb4\x08\x36\x80\xc6\
+\x87\x8f\x3a\x59\x59\xe8\x16\x10\x68\x7a\x68\x40\xb1\xf5\x82\x19\
+\x42\xf0\xb5\xa1\xbf\x1b\x08\x44\xd8\xa2\x93\x98\xc9\x8e\x11\xfb\
+\x61\x85\xf8\x7c\x15\x08\x35\x4f\x11\xba\xc4\x04\x6e\x99\xda\xaf\
+\x5c\x0e\x7d\x19\x0a\xf9\xeb\x34\x57\x00\x61\x80\x20\xb0\x3e\x76\
+\x24\x06\x6a\x5a\xae\x75\xb6\x8c\x21\x04\x3f\x90\x89\x46\xeb\x14\
+\x81\x61\xfb\x46\x18\xb7\xeb\x27\xec\x39\x8e\xdb\xe7\x0f\x62\x01\
+\x98\x2b\x83\x96\xcb\xa1\x9f\x05\xfe\x1c\x93\x2a\xdd\x49\x42\x25\
+\xa6\x60\x5f\x70\xd2\xaa\x03\xc7\x56\xb7\x98\x0e\x48\x46\x54\xb6\
+\xec\x8a\x92\x5e\x18\x45\xdb\x69\x26\x08\xac\xf2\x2d\x19\x74\x8c\
+\xf4\x39\x40\xb0\x3b\x52\x2c\x13\x29\x9f\x24\x33\xe8\x42\x0e\xcd\
+\x10\x82\xaf\x36\x91\x9d\x11\x06\xdd\xe4\x62\x19\x93\x82\x24\x9e\
+\xc3\x80\xac\xc5\xa3\x6e\x77\x7f\x53\x89\x43\x4c\xcc\xba\x19\xf9\
+\xd5\x01\x1b\x50\xf1\x82\x19\xeb\xd0\x9d\x6f\x34\x07\xb8\x79\xda\
+\xd4\x74\x5e\x0d\x52\x23\xcf\x0b\x13\x8a\x66\xd0\x85\xb9\x1c\x1c\
+\x43\xc1\x51\x7c\xde\xc4\x40\x45\xdd\x5c\x20\x49\x11\x6f\x2c\x45\
+\x60\x7d\xd8\xa8\x5b\x00\x1c\xe5\xe8\x8c\x5e\x37\x10\xfc\x57\x5e\
+\xf6\xfb\x2d\x52\x65\xfc\x91\xfe\xb2\xe4\x26\x8a\x73\x23\xa0\xaf\
+\xdf\xf7\xb1\x59\x68\xcc\xb7\x69\x96\x9c\x19\xf4\x99\x43\x67\xc9\
+\x94\x24\x8c\x04\x81\xc7\x5a\x6b\x4d\x23\x3d\x1a\x9f\x28\x58\x16\
+\x8d\x2d\xa0\x0d\x22\x34\xed\x9f\x1a\x6c\x5e\x59\x56\x0d\x2a\x9f\
+\xdb\x20\x56\x81\xc9\x2a\x63\x74\xe4\xd4\xc7\xec\x91\x7d\x23\xec\
+\x23\x92\x25\x17\x2d\x99\xab\x08\x7d\x2b\x9b\x41\xcb\xe5\xd0\x97\
+\x44\x1e\x09\x0a\x96\xbb\xc2\x99\x49\xdc\x55\x84\x60\x95\xa8\x38\
+\x25\x63\xa7\xab\xab\x75\x4e\xa9\x91\x59\x33\xcb\xe6\xf8\x86\x12\
+\x7c\x13\x55\x39\x4a\x75\x83\x6f\x3c\xd0\x08\xdf\x52\x05\xc3\x8d\
+\x0e\x4e\x33\x72\xd4\xb0\xae\x84\x33\xe8\x42\x1d\x9a\x21\x04\x5f\
+\x60\x82\x00\x69\xae\xe3\x0c\xd9\x2a\x6a\x5b\x3a\x38\xc1\x10\x47\
+\xc1\x84\x8c\x7d\x63\x07\x02\x7b\x56\xad\x52\x4a\x8d\x24\x55\xf1\
+\x0a\x25\x91\x1c\x0e\x8c\x21\x91\x6c\x4a\xad\xc2\xf2\xd4\x5d\x38\
+\x61\x8c\x19\x23\x34\xf4\x5b\x91\xb6\x1c\x1c\x13\x29\x8b\x08\xe8\
+\xaf\x9c\x0d\xb8\x8c\x43\xf3\x93\x1f\xd6\x1b\xaa\x5f\x55\x91\x49\
+\xc7\x7a\x03\xe8\x3f\x17\xec\x4c\x19\xb2\x68\xdf\xa8\xc8\x3a\xe2\
+\xe2\xa6\x01\x87\xa6\xad\xed\xc2\xc9\xdb\x18\x0c\xa3\xfe\x76\x0f\
+\x71\x7b\x95\xd5\xb8\x4f\x62\x77\x02\xb2\x84\x6c\xec\x29\x63\xdc\
+\x7b\x35\x15\x16\x23\x97\x66\x99\x48\x29\x9e\x41\x17\x42\x30\x43\
+\x19\x2b\xc9\x14\x88\x19\x7b\xd5\x23\x9e\x9e\x01\x26\x83\x48\x7a\
+\x48\x21\x92\x6e\x5f\xc1\xc0\x98\x54\x9b\x8e\x11\x50\xb0\x0d\x3e\
+\xa1\xa4\x17\x56\xb7\x03\x61\x26\xe1\xd3\x21\xac\x34\x98\x07\x0c\
+\x2f\x13\x51\xa2\xe2\x9d\x48\x59\x24\x61\xbd\x62\x6d\xbf\x65\xd7\
+\x29\x64\xc8\xa1\x57\x31\xcd\x27\x76\x96\xf5\x10\x9c\x11\x5f\xcc\
+\xe8\x38\x48\x7b\xd5\x5a\x77\x5c\x36\xa4\xb9\x65\x16\x6d\x82\x5f\
+\xac\xb4\x65\xd4\xcb\x3d\x16\x17\x84\x6d\xd1\x64\x03\x0d\x01\xe1\
+\x41\x38\xb4\x6a\xe5\x61\x25\xfd\x74\xea\xfa\xfd\x99\x41\xcf\xc8\
+\xa1\xf9\xd1\x9f\x4f\x9b\x94\x3a\x07\x73\x36\x48\x6d\x0d\xa2\x02\
+\x76\xb7\x22\x84\x7a\xf7\xe8\xcf\xf8\xbc\x1e\x38\x7a\x79\x74\x01\
+\xcc\x10\x7e\x7a\x60\xa2\x63\x7d\x8c\xb6\x45\xa3\x68\xb4\xc2\x39\
+\xb6\x04\x3a\x99\x3c\x53\xea\xd2\x14\x03\xd3\xd9\x94\x50\xe8\x9f\
+\xcf\x12\xd6\x39\x14\x4c\x55\xac\xa4\x6b\x29\xa9\xef\x8f\xde\x69\
+\x44\x52\x5a\xa1\xbf\x3f\xb0\x64\x3a\xc3\xc0\x84\x2d\xa7\xca\x56\
+\x0c\x20\x33\x21\xd1\xd7\x96\x88\x6e\x91\x21\xb4\x53\xcb\x4c\x94\
+\x9e\x34\x51\xdf\x69\xe6\x47\xf9\x7b\xe4\x21\x35\x29\xd2\xa6\x0c\
+\xfa\xee\xcc\xa0\xe7\xe4\xd0\xec\x64\xac\x35\x01\x5e\x92\xb1\xe7\
+\x72\xb1\x48\xbc\x36\xd3\x90\x13\xce\xdb\x9d\x4a\x84\x8c\xb0\x8b\
+\x43\xa7\xd4\x9a\x48\x63\xe8\x21\xb3\xc8\xc7\xd2\xd8\x4f\x53\x53\
+\xd7\x3f\x73\x05\x48\x48\x29\x1a\xb7\x26\xec\xe5\xd0\xf7\xb8\xf2\
+\xc4\x74\xe3\x75\xab\x38\x6a\x58\xb7\x4b\x60\xd0\x65\x7d\x39\x18\
+\x72\xe8\x4d\x2c\x1b\x0f\x95\xfd\xee\x8d\x21\x12\xb2\x22\x3a\x56\
+\xee\x18\x76\x52\xe8\x14\x4e\x5a\x0c\x9a\x2e\xee\x90\xba\x8c\xfe\
+\x07\x8b\x10\x70\xc6\x23\xe8\x2c\x13\xfd\x0a\x43\xfa\xf6\x61\xeb\
+\x68\xe4\xd6\xca\x1c\xf5\xde\xb5\xd3\x49\xf2\x6a\x82\x35\x6f\x84\
+\x02\x30\x7b\x06\x5d\xc8\xa1\xf9\xc9\x58\xab\x4d\x96\xf2\x03\x37\
+\x45\x02\x1b\x29\x56\x90\x80\x52\xff\xa5\xc0\x49\xc8\x48\xb7\x51\
+\x8b\x26\x73\xd0\x5c\xc5\x80\xcd\xf3\x77\xd7\xb9\xb6\x2a\x61\x06\
+\xc1\xca\x4c\x42\x1e\x28\x15\x49\x21\x98\x26\x7c\x1f\xfa\x9e\x56\
+\xf3\x27\x15\x9f\x1c\x35\xac\xa7\x45\x30\xe8\x52\x0e\xcd\x0e\x82\
+\x3f\xb5\x6c\x17\x32\x07\x32\x75\x34\x71\x5e\xf7\xd7\xb3\xa7\x04\
+\xb9\x4b\x86\x56\x19\x4c\xd3\x15\x33\x08\x06\x3f\x1a\xea\x42\x04\
+\x80\x24\x95\x92\x69\x50\x89\x56\x38\x10\x82\x91\x6c\x55\xe9\xfb\
+\xed\x3d\x6f\xd7\x8d\x87\xe7\x67\xa1\x0c\xfa\x25\x7f\x03\x2e\x4b\
+\xa7\x64\x27\x63\x5d\x90\xd3\x24\xb1\x63\x82\x3a\xc4\xbc\x4c\xb2\
+\xb4\x33\xfc\x1b\xcf\x6f\xfa\xd1\xe4\x92\x84\x24\xe8\x99\x3a\x93\
+\x31\x44\xf3\x8e\x81\x02\x4d\xaf\xe7\x64\x74\x9a\x10\x6e\xba\xd0\
+\xb6\x15\xce\x8d\x84\x65\xdf\xfb\x44\xce\x33\x26\xe3\x44\xe1\xdd\
+\x9d\x4c\x06\xfd\x56\x80\xfd\x16\x72\x68\x6e\x32\xd6\x7a\x93\xf4\
+\x96\xa5\xb9\x58\x54\x80\x25\x54\xb8\xcd\x9d\x53\xff\x37\xf1\x77\
+\x33\xa1\x27\xfd\xbb\xd4\xaa\xd3\xdb\xbc\x4a\xf4\xb5\xcd\x83\x45\
+\xc4\x66\x5b\xbf\x3d\x2d\x04\xcc\x6a\x40\x28\xae\xf6\xbf\xd7\xc9\
+\x5e\x51\xf7\x55\x2b\x37\xce\x1f\x9c\xd7\x32\x01\xf8\x95\x04\x03\
+\x16\x2a\x63\xd1\x34\xca\xe4\xb4\xc9\x40\x93\x9c\xaf\xba\x23\xb6\
+\x1b\x3d\xd9\x54\xec\x21\xc9\x81\x14\x74\x5a\x15\x0d\x29\x83\x6e\
+\x32\x3d\xe6\x57\xa0\x13\x17\x55\xb7\xd4\x00\xc2\x33\x5a\xf9\xa2\
+\x34\x4e\x4c\x76\x58\xfb\x3d\x95\xf0\xe2\x9a\xd3\xe8\x2f\x71\x83\
+\x85\x06\x81\xbf\x14\x61\xc0\x5f\x89\x94\xb1\x56\x3d\xe7\x4a\x7e\
+\xde\x75\x98\xed\x8e\x33\x97\xfe\xa7\x69\x7f\x6e\xe7\xc5\xc1\xfc\
+\xff\xdb\x19\xdb\xeb\x7c\xb4\x87\xf4\x60\xcf\x34\xf6\xdd\x7b\xa9\
+\xec\xb2\x68\x3d\xc7\x84\xa1\x86\xf5\xb4\x10\x0d\xba\xbc\x24\x89\
+\x1b\x04\x5f\xf6\x4d\xf6\x87\x9c\x70\x66\x8f\x41\x1e\x73\x6d\x82\
+\xf9\x48\xf4\xb7\xf6\xa4\x8b\x2a\x0c\x70\x6d\xc2\x3e\x5a\xf4\xe1\
+\x1c\x04\x9e\x3d\x9d\x92\x9b\x8c\x75\xd1\x77\xb2\x14\x9d\x89\x63\
+\x9e\xd4\x73\x15\x16\xde\x58\x33\xf7\xad\x6f\x52\x65\xa7\x61\xad\
+\x17\xc4\xa0\x4b\x39\x34\x33\x19\x6b\xdd\x47\xd7\x6a\x73\xa0\x49\
+\x0e\x7e\x81\x20\x33\x97\x03\xac\x67\xbe\xf5\xba\xc0\xaf\x45\x02\
+\xb0\x10\x06\x2d\x35\x14\xdc\x03\xc0\x95\x3a\x9d\x20\x9f\xc8\x26\
+\xe7\x71\x83\x1f\xec\xe8\x0c\x79\xdf\xad\xef\x90\xb0\xeb\x87\x75\
+\xb5\x28\x06\x5d\xc8\xa1\xb9\xc9\x58\x6f\xaa\x53\x38\xf4\x28\xd0\
+\x1b\xdc\xe0\xbf\x4c\x6f\xbf\x7f\xb0\x6a\xda\xad\xec\xd8\xee\x3e\
+\x4e\xc4\xae\xa7\xfb\xd3\xa2\x00\xb8\x34\x14\xcc\x0c\x82\xfb\x54\
+\xac\x7a\x3e\x0d\x67\xc6\x68\xf0\xb5\x2d\x33\xd8\x51\x81\x58\x8c\
+\x86\xb5\xa0\x20\xf0\x01\x1c\x9a\x99\x8c\xf5\xac\x37\x12\x3c\xbe\
+\xd4\xbc\xf7\x36\x75\x52\xf4\x8d\x35\x25\xf6\x39\x93\x0b\xfc\x85\
+\x48\x09\xeb\xa5\x1c\x03\x2e\xcb\xe5\xe0\x26\x63\x6d\x7a\x9d\xe0\
+\x59\xd1\xd7\x5b\x8a\xf9\x9a\xab\x80\xa5\x26\x77\x81\x2b\x91\x00\
+\xfc\x56\x90\xfd\xca\xe4\xd0\xab\xe3\x9d\xe0\x31\x1d\x41\x20\xd1\
+\x93\x96\x35\x3c\xda\x39\x7d\x7e\xdc\xf2\xbe\x19\xf5\xbd\x48\x00\
+\x7e\x25\xc9\x80\x0b\x21\x98\x69\x41\xd2\x69\x4e\xf0\x48\x88\x34\
+\xa5\x14\xfd\x31\x15\xb0\xca\xb7\x78\xd8\x8d\xef\x3b\x1e\xdc\x4a\
+\x91\x9e\x16\x15\x04\x3e\x24\x14\xcc\x0b\x82\x2f\xfa\x23\xc1\x33\
+\x7b\xc0\x5e\x8a\x7e\x37\x93\xfd\x1e\xb8\xa9\xb9\xc7\x91\xbd\xdf\
+\xf3\xdf\xd4\x05\xee\xbb\x31\x4b\xe3\xb8\x5a\x1e\x83\x2e\x4d\xa7\
+\xe4\x25\x63\xad\x87\x73\x82\xf7\x24\x39\xab\x5d\x6f\x7b\x61\x6c\
+\xaa\x60\x52\x47\x00\x69\x9f\xad\xa9\xb2\x2d\x2d\x9e\x07\xdd\xc7\
+\xa4\xa4\x71\xac\x17\x16\x04\x3e\x24\x14\xcc\x4b\xc6\xea\x9d\xf2\
+\xf5\xe1\x84\x77\x67\x66\x95\xdd\xf5\x56\xf7\x7e\xd8\xfe\x38\x4d\
+\x17\xe8\xf6\x0f\xc0\x8d\x3a\x74\x73\xcd\x71\xd9\xd4\xbb\x19\x34\
+\xb7\x34\x8e\xdb\x05\x32\x68\x99\x10\xbc\x1a\x36\x12\x3c\x42\x30\
+\xe9\xc7\x49\xec\x77\x40\xf1\xfc\x33\xd0\xb0\x96\x28\x61\x15\x87\
+\x82\x79\xc9\x58\xbd\xa9\x1c\xb5\xe5\x62\xc1\xff\x16\x65\xbf\xe6\
+\x94\xfd\xd6\xcb\x87\x3e\x48\x04\x60\x69\x0c\xba\x54\x87\x66\xe5\
+\xce\x3c\xab\x4f\x4b\x87\x1e\xff\x66\xc7\xb6\x60\xb0\xdf\x21\x27\
+\xac\x63\x37\xb5\x52\x22\xd2\x38\x16\x29\x61\x95\x87\x82\x79\x41\
+\xf0\xa6\xd7\x09\xde\x73\x46\xc3\x19\xdf\x0c\x8d\xa7\x38\xe8\xf9\
+\x6f\xe3\x63\x74\x0c\xfe\x93\xb5\x68\x73\x8d\xc3\xeb\x9c\xde\x6e\
+\xcf\xd7\x6d\x25\xf9\x2b\xba\x94\x7e\xc2\x66\x9e\x70\xbe\x7b\xba\
+\x76\x97\x5f\x65\x2d\xa3\x1b\xc7\xd3\x32\x19\xb4\xcc\x6c\xac\x95\
+\xea\x77\x82\xe3\xc9\xd9\xbe\xe3\xa9\x1b\xf1\xc6\xea\xe3\xef\xf9\
+\xaa\x53\x42\x6a\xff\x3e\xa6\xfd\x1a\xd8\x02\x9b\xe0\x27\xfe\x9a\
+\xce\xdf\x65\xa3\x1d\x9a\x96\x25\xa7\x76\xda\x67\xe7\xe9\x0e\xc0\
+\x4a\x06\x19\x2e\xf0\x32\x25\xac\xf2\x50\x30\x2b\x19\x8b\xa9\x13\
+\x9c\x72\xda\xf1\x2c\xf8\x97\xed\xb7\x58\x42\x7a\x6d\xc6\x80\xed\
+\xc9\xf4\xd8\x96\xad\xc0\xca\x71\x81\xd7\x4b\x65\xd0\xc5\x1c\x9a\
+\x13\x04\x0f\xe6\x04\xdb\x31\x9d\xc6\xb1\x72\xb2\x1e\xec\xf0\xa9\
+\x28\xad\x5d\x51\xb0\xab\x20\x11\x5a\x86\x0b\xbc\x54\x09\xab\x3c\
+\x14\xcc\x49\xc6\xba\x3a\xd2\x09\xc6\xb3\x10\x3d\xbe\x21\x85\x5b\
+\xb2\xee\xc0\x63\xbf\x1f\xc7\x7e\x29\x65\x4e\x09\x6e\x8f\x17\xdc\
+\xf6\x92\x53\x72\x1c\x94\x81\xec\xed\xae\x19\x0b\xfe\xc8\xf4\xcd\
+\xa5\xd5\xff\xe5\x01\xb0\x48\x06\x2d\x52\xc6\xba\x3f\xc6\x09\xa6\
+\x2e\xf0\xc9\x3e\x70\xfe\xe1\x4e\x0b\xb2\x66\xf0\xea\xc2\x1b\x24\
+\xcf\x36\x9f\x3c\x12\x0f\xbf\xe5\xaa\x76\xfa\xb8\x3d\x9a\x00\x49\
+\x08\xc9\x0d\x3d\x59\x6b\xb3\x44\xf5\x1d\x89\xc7\xb3\x84\xc5\x2c\
+\x14\xcc\x09\x82\x3f\x1d\xe5\x04\x0f\xc1\x9b\x0f\xe4\xa5\x43\xa7\
+\x74\xb8\xfa\x7d\xdb\x81\x88\x76\x67\x5a\xd5\x11\xdb\xdd\x26\x1c\
+\x9d\x00\xdc\xeb\x02\xb3\xaa\x64\x28\x8b\x21\x89\xaa\x04\x3e\x5c\
+\x87\xe6\x04\xc1\x17\xbd\xc4\x6d\xb2\x48\x6f\x1f\x5f\xcd\xa6\x89\
+\x61\xa5\xac\x5f\x6c\x42\x20\x6c\x16\xfa\xd9\x49\xf8\x77\x99\x63\
+\xf7\xa2\x92\x9b\x12\x51\xc9\xf0\xb4\x5c\x09\x4b\xa6\x8c\x75\xb5\
+\xa9\x2b\xd5\x75\x6f\x9c\xe0\x1d\xcc\x37\x8e\xf0\xef\x14\x0e\x9d\
+\xaf\xda\x82\x4f\x0a\xeb\x6e\x5e\x37\xcb\xef\x07\x2b\xf1\x7f\xfe\
+\x68\x43\xf4\xca\x7d\x05\x78\xc1\x79\xf8\x28\xff\x5d\x3a\x8f\x79\
+\xf9\x1f\x87\xff\x15\xff\x42\xd3\x4f\xec\xbb\xfb\xb1\x61\x3d\x5d\
+\x87\x82\x57\x25\xc3\xed\x92\x19\x74\xb1\x8c\xc5\x29\x92\x74\xdf\
+\x27\x43\xd7\xb6\xc4\xea\x8c\x19\x26\x0e\xdc\x15\x63\x8e\x88\xe6\
+\xa5\x32\x6b\xff\x3b\x8c\xfd\xfe\xd1\xda\x4c\xb8\xf2\x01\xe7\x4c\
+\x39\xeb\x0c\x50\xdb\x54\x60\x4b\xa9\x02\x45\x60\x5b\xac\x0e\xb8\
+\x3f\xa9\xfa\xc2\xc0\xac\x5c\xe0\x45\x4b\x58\xe5\xa1\x60\x4e\x10\
+\xfc\xe6\xc8\x9a\x60\xdb\xab\xe6\x1c\xa1\x42\x67\x6e\x65\xae\xef\
+\x06\x65\x69\x10\x10\x7e\xfe\x10\xb2\xaf\xa2\xc9\x6a\x9c\x39\x92\
+\x60\x90\xed\xd0\xad\x74\x9e\x59\x95\x64\xa3\x11\xb3\x6f\x4f\x72\
+\xbb\xf6\xa5\x8c\x86\x94\x85\x3e\xa2\x58\xfb\x15\x28\x63\x5d\xf4\
+\x51\xe8\x3d\x1c\x3a\xd0\xbf\x0e\xac\x3a\x0d\x81\xad\x5f\x99\xa5\
+\x13\xcc\x5e\xf2\x00\x00\x20\x00\x49\x44\x41\x54\x79\x87\x81\xee\
+\xda\x7f\x0e\x02\xbf\xee\x87\xdb\x2c\x0c\x96\xf0\xdd\x0e\x04\xce\
+\xec\xd2\x6f\x3f\xce\x3f\x6d\x61\x19\x57\x57\x44\xa1\x9b\x20\x52\
+\xf7\x71\xb8\x93\x07\xc0\xbf\xca\x35\x60\x79\x32\xd6\x7a\xd3\x33\
+\xf7\x57\x05\xe6\x6b\xbc\xdf\xa8\xf7\x24\x5e\xee\x9e\x09\x74\x66\
+\x01\xb0\x32\xed\x4c\xd9\xe0\x57\xa0\x1d\xdb\xfb\x93\x02\x4a\x37\
+\x8f\x16\x93\x95\xd3\xbc\xe5\x30\x55\xa4\x91\xac\xc4\xce\xb2\xd8\
+\x77\x73\x57\x60\xf8\x89\x38\x4f\x7e\x71\xd1\xae\xd9\xfe\x89\xaa\
+\x7a\xf2\x38\x58\xb9\xc0\x0b\x97\xb0\x0e\x90\xb1\x18\x1d\x95\x7b\
+\xe7\xf0\x56\xad\xe7\x5d\x1c\xda\xa6\x39\x8f\xa7\x50\x68\x07\x3f\
+\x79\xb2\xbf\xb3\x02\x4a\x4d\xa3\xd1\x6d\x3d\xe1\xbf\x1d\xcf\xa3\
+\xff\xe5\xe1\x17\x36\xc1\x26\x04\x38\xf1\x70\xbb\x12\x54\x28\xe5\
+\x08\x69\x9e\x3a\xe3\xe1\x94\xf2\x1f\x40\xa1\x89\xf6\x90\x3e\x73\
+\x72\x81\xaf\x96\x2e\x61\x89\x84\xe0\x37\xb5\x9f\xfb\xdb\xcf\xba\
+\xa0\xfc\x80\x26\x27\x0d\xa3\x43\x93\x35\x06\x5b\x21\x9e\xb2\x39\
+\x41\xcc\xfa\x9f\xb5\xc4\xda\x52\x9e\x9c\xbb\x02\xba\xcd\x8d\x23\
+\xe5\xc8\x96\x11\x82\x40\x38\x45\x57\x45\x44\x2f\xa1\xd9\xee\x70\
+\xe0\xd0\xd9\x41\xf8\x49\x1c\x00\x0b\x96\xb0\x44\xca\x58\x3d\x91\
+\x60\xb5\x9b\x43\x67\xa4\xd7\xea\xd3\x12\xb1\xda\x66\x12\x24\x62\
+\x9b\x9a\xaf\xf7\x84\xed\x7f\xbe\x3e\xca\x7c\xe9\x4a\x83\x5a\x9c\
+\xe7\x6d\x6a\x62\xcd\x39\xdb\xef\x28\x46\xc2\xf5\xc4\xac\xb1\x34\
+\x29\xcb\xee\x67\xd1\x4d\x29\x61\xe4\xd0\x5c\xa3\xc0\x85\x00\x2c\
+\x9a\x41\x17\xcb\x58\x7c\x22\x49\xeb\x4d\x37\xfe\xee\xd1\xa1\x6d\
+\xc6\x79\x8f\xce\xca\x0a\xa4\x33\xa1\xe5\x94\xd9\x82\x1a\xf4\x1b\
+\x7b\x57\xaf\x23\x37\x72\x84\x95\xf9\x05\x94\xe9\x25\x9c\x29\x56\
+\xb4\x16\x04\xbd\x80\x73\x65\x0e\x04\xe8\x80\x0d\x04\x65\x17\x74\
+\x79\x52\x07\x55\xd0\x1b\xe8\x2e\x39\xc0\xc0\x51\x5e\xf8\x05\x8c\
+\x0b\x14\x1c\x70\x81\x5e\xc6\x22\xbb\x7e\xbe\x6a\x36\x67\x48\xe9\
+\x02\x72\x46\xab\xd5\x2e\x87\x33\x24\x9b\x5c\x56\x7f\x55\x5f\x7d\
+\x55\x84\xa5\xd1\x84\xff\xb9\x29\x16\x7e\xf5\x93\x48\x44\xbf\xe2\
+\xf4\x31\xe2\xbe\x9b\x61\xe0\xa8\xcc\x5c\x68\x84\xd9\x6c\xe7\xcd\
+\xbe\x60\x92\xbb\x78\x71\x24\xcd\x9c\x83\xff\x11\xf6\x95\x05\xbe\
+\x01\x0a\x6b\x7d\x2a\x78\x47\x10\xfc\xbe\xe8\xcd\x52\x7d\xb8\xf8\
+\x59\x16\x65\x08\xfe\x86\x18\xbe\xd4\xfb\x74\x3b\x04\xd7\x9b\x1f\
+\xb6\x96\xe9\x15\x67\x17\x94\x2b\xdf\xeb\xe2\xe5\xc9\x8f\x96\xd3\
+\x6a\x46\xfa\xef\xc3\x84\xbe\xd5\x3e\x25\x46\x8e\x85\xfa\xe1\x4c\
+\xf8\xd0\x38\x89\x34\xaa\xc1\xfb\xcc\x62\x23\xae\xa3\xc7\x79\x67\
+\x5c\x23\x40\x65\x73\xef\xe2\xa4\x35\x34\xfe\x05\xc6\x2b\x1e\xf4\
+\xb3\x9a\xf0\x9e\x42\xe0\xab\xcf\x21\x6d\xa2\xb1\xf6\x03\xc1\x9f\
+\xd5\x7d\xab\x93\x7f\x40\x40\xed\x4d\xb9\x5c\xcf\x6f\xf4\x4d\x42\
+\xe0\xcd\x1c\xb4\x61\x9e\x6d\x5d\xdc\x6a\x7c\x77\x28\x8a\x00\x91\
+\xc7\x5a\x1b\xfe\xc7\x04\xbe\x4e\x3e\xe9\xc0\x4b\xb5\x33\x93\x90\
+\x35\x54\x56\x84\xb4\x6d\x3f\x8e\xdc\x52\x03\xdc\x7a\x82\x68\xc2\
+\xb6\x08\xcc\xa6\x6e\x65\x84\x5b\x73\xbd\xde\xe5\x21\xc8\xab\x6a\
+\xd1\x7b\x12\x42\xdf\xdd\x02\x85\x75\x44\x1a\xeb\xf9\xa0\xac\x67\
+\x19\xec\xa7\x9a\xf3\xc7\xc5\xd8\x36\x0a\xe1\x43\xe9\x48\x5f\x03\
+\xc1\xa6\xb3\x0a\x44\x8a\x98\x52\xec\xce\x77\x34\x0b\x8d\xe2\xb4\
+\xd5\x64\x98\xa7\x9f\xcf\x84\xc3\xaf\xfe\x37\x98\xf5\x92\xcd\x16\
+\x7a\x38\xa1\xa6\x98\x90\x52\xba\xc8\x86\x97\x04\x91\x02\x12\x0f\
+\x1d\x9f\x80\x16\x6b\x7a\x35\xad\x86\xa0\x40\x14\xb8\x3b\x10\xec\
+\xaf\x4a\x5c\xfb\x26\x0e\x7e\x7c\x38\x00\x7e\x7d\x78\x03\x7e\x7a\
+\xb0\x4c\xd2\xcb\xf0\xd8\x6c\xf2\x37\x44\xe6\x25\x93\x9c\xee\x3e\
+\xf7\x14\xa5\xcf\xf9\xac\xf9\xae\xf7\x71\xca\x19\xd5\xe9\x40\x2c\
+\xaa\x14\x01\x34\xf3\xc3\x8b\x85\xab\xd5\x88\x3f\xfc\x36\xb3\xe2\
+\x57\xbf\x7d\xa8\xc6\x2b\x3e\xbc\x4a\x80\xb9\x21\x9a\x09\xda\x01\
+\x62\xe7\xb6\x8a\x84\x33\x35\x5d\x0d\x57\x24\x14\xcf\xd3\x6e\x43\
+\x0f\x3e\xee\x9f\x62\xe4\x7a\x70\xa1\x1e\x1b\x1d\x02\xf2\x7a\xc5\
+\xf5\xda\x97\x52\xbd\xe9\x49\x08\xbd\x9f\x48\xeb\x36\x28\xac\xf1\
+\xeb\x2f\x47\x83\xe0\x27\x16\x74\x19\xfa\x0e\x76\x2f\xc9\x1a\x04\
+\x66\xf3\x43\xf9\x1b\x10\xd8\xed\x47\xd0\x39\x57\xef\xbc\x93\x8c\
+\x61\x51\xb7\x55\x71\x78\xfc\x2a\x0f\x0f\xff\xf9\xf0\xe5\xeb\xa7\
+\x87\x87\xe2\x2b\x2d\x9c\x16\x40\x60\x66\x28\x97\x88\x03\x74\x11\
+\x38\x57\x6e\xa0\xd2\x59\x15\x5d\xc6\x6b\x79\x3c\x60\x08\x0c\x04\
+\x74\x1d\xc1\x6c\xee\xf2\xc5\xe9\x8a\x0f\x39\xfa\x9d\x00\x79\x47\
+\xed\xb0\xfe\xb8\x0d\x0a\x6b\x03\x8d\xb5\x1b\x08\x7e\x31\x4d\xf6\
+\xe3\xac\x7f\x9a\x6a\xda\x2a\xa9\x35\x55\x24\x9d\x45\x60\x6a\xd4\
+\x82\x5f\x59\x92\xe4\x3c\xad\x23\x30\x42\x94\xef\x7e\x3e\x04\x83\
+\x62\x07\xe2\xd9\x97\x3a\xbb\x44\xc0\x36\xe5\x63\x23\xe1\x8d\x7c\
+\xd6\xd2\x6c\x23\x10\x2e\x3b\xa5\xa5\x3e\x03\xc1\xdc\x96\x3c\x66\
+\x5e\x42\x60\x5b\x9e\xae\x7b\x51\x1f\xba\xf8\x54\xba\xa7\x76\x58\
+\x2b\x01\xf8\xe0\x49\xe0\x4d\x34\xd6\x6e\x20\xf8\x99\xc5\x5f\xa3\
+\xaa\xb2\x0c\xee\x4f\x97\xb1\xaa\x7f\xc9\xe8\x24\x0b\x84\x43\xc3\
+\xfc\x35\x3c\x16\x25\x72\x96\x10\xa2\x28\xb2\x48\x33\x27\xa0\x06\
+\xb2\x12\x52\x46\x05\x5d\x4c\xc9\xb2\x63\x1f\x5a\x8c\x24\xe9\x64\
+\xde\xf9\x72\x20\x20\xce\x87\x53\x73\xc2\x98\x60\x92\x2c\x23\xe3\
+\xc5\x6a\x4b\xdf\xdc\xae\x76\xb1\x5c\xc0\x60\x51\xcc\xe3\xa3\x01\
+\xf0\x9b\x47\xd7\xf0\x75\x7f\x30\x08\x7e\xb0\x9b\x07\xdd\xe8\x09\
+\x13\x96\x92\x3f\x11\xab\x52\xc0\x1a\x7d\xbd\x1a\x0b\x10\x10\xa1\
+\x90\x00\x81\x17\x31\x51\x59\x34\x4b\x3f\x99\xd4\x03\x06\x75\x46\
+\x10\xe5\x19\x30\x3c\xb7\x73\x94\x79\x4e\xef\xe6\x45\x49\x9e\xc8\
+\x62\xe3\xdc\x59\x0c\xec\xda\x49\xc8\x00\x4c\x26\xfc\x70\x38\x00\
+\x7e\x7d\x15\x06\xfc\xf4\x60\x99\xa4\x27\xd3\xdd\x02\xe4\xd5\x30\
+\x39\xd4\xa3\x9a\xf2\x62\x41\x03\xf7\x62\xba\xaf\xb4\x60\x8c\x81\
+\x11\x78\x7b\x85\xf4\x18\x95\xb6\x24\x91\x40\x71\x91\xab\x3f\x52\
+\x28\x3b\x33\xae\xb3\x5d\x0b\x72\xd2\x9a\x3a\xef\xf5\x2e\x49\x3a\
+\xab\x2e\x7f\x67\x43\xac\xd7\xba\x58\x26\x38\x72\xc1\xfb\x09\x81\
+\xef\x6e\x86\xc2\xda\xa0\xc6\xda\x8d\x98\xe3\xc5\x50\x6c\xde\x3f\
+\xa9\xe5\x2a\x08\x94\x33\xb6\xd6\x04\x72\x5f\x89\xc0\x3d\x13\x41\
+\x50\x76\xd0\x5b\x46\x60\xa3\xa1\x12\x59\xcc\xd2\xc0\xdc\x22\x1c\
+\x9e\x91\xab\xf4\x10\x78\xf6\x5e\x72\x1e\xba\x9e\xc8\x05\x31\x6a\
+\xc5\x5e\x28\x23\xb1\xa5\x1d\x85\xc0\xf7\xb7\x43\x61\x6d\xa0\xb1\
+\xf6\x02\xc1\x5f\x82\xe0\xca\xa0\x94\x19\x1b\x7a\xc9\xe6\x84\x2f\
+\xdd\xf5\xdb\x2c\x78\xc1\x28\x2e\x20\x70\xfb\x6e\xcf\x2d\x48\x01\
+\xfc\x99\x27\x43\x9c\x39\x9d\xac\xef\x9c\x7d\x4c\xce\x7a\x22\xcb\
+\x16\x5c\x73\x46\x36\x65\x9a\x2f\x5d\xf6\xd4\x11\xfa\xee\x46\x54\
+\x58\x5b\x69\xac\xbd\x40\xb0\xf1\x26\x16\x87\xd5\xdf\xa5\x57\x91\
+\xd4\x49\x27\x7d\x83\xfd\x9e\x5b\x8d\x41\xea\x05\x04\x9e\x79\xb4\
+\x32\xa7\x7a\x7b\xd6\x7d\x71\xd0\x33\xa0\xe6\x33\xee\xf8\xb6\x4b\
+\x22\x18\x02\xab\xc9\x5a\x0e\xcf\xb0\xf8\x68\x00\xfc\xe6\x5a\x0c\
+\xf8\x68\x10\xfc\xb6\x2a\xb1\x4c\x3f\x70\x32\x4c\x28\x5d\x1f\xba\
+\x97\x4e\xba\xe8\x30\x6e\x07\xe1\x06\x63\xbb\x3a\xaf\xba\x7e\x19\
+\x81\xd3\x62\x6f\xfe\xb9\x3c\xf3\xf4\x80\xba\x0f\xde\xb8\x93\x35\
+\xa7\xa9\x6b\x8a\x5b\xac\x92\x0f\xfa\xb7\x28\xfb\x29\x25\xbc\xbb\
+\xa1\x1c\xd2\x26\x1a\x6b\x2f\x99\xa4\xe7\xee\x3c\x5b\x3c\xe6\x8c\
+\xa8\x9c\xc5\xcf\x80\x9b\x3f\x83\xc0\xea\x76\xb0\x09\x72\x77\x11\
+\xa9\x3b\xae\xee\x0c\x81\xfb\x1e\xf1\x7a\x7b\x4b\xe4\x55\x37\x7c\
+\xde\xe0\x8b\x13\x2a\x3b\xac\x7a\xd3\xc8\x07\xcf\x05\xef\xa7\x94\
+\xf0\xfe\xc6\x3c\xe8\xf5\x34\xd6\x4e\x32\x49\x2f\x23\x02\x33\x46\
+\x54\x01\xf8\x44\x97\x10\x58\xfa\xe0\xc6\xdf\xec\x4c\x37\x66\x21\
+\x8b\x64\xee\x59\x93\xe4\x0b\xd1\xee\x65\xcf\x61\xb6\x71\x77\x77\
+\xfd\xe8\xfa\xec\x39\xea\xf8\xca\xe0\xc4\x55\x39\x59\x2d\xd8\x54\
+\xda\xf0\xfb\xc1\x00\xf8\xd3\xf5\x18\xf0\xda\x54\xf0\x5e\x20\xf8\
+\x89\x95\xb2\xd5\xe0\x17\x10\xf8\x3c\x72\xb6\x49\x9f\x3f\xd1\x7e\
+\x25\x57\x03\x2f\xca\x2b\x2e\x40\x2a\x9d\xe7\x9b\xd7\x7b\xd0\xd2\
+\xf1\x35\xce\x36\xc1\xbb\xe0\x68\x98\xff\xff\x3e\xb8\xab\x69\xea\
+\x34\x39\xd6\x8e\x74\x94\x7f\xdc\x54\x0e\x69\x1b\x8d\xb5\x13\x08\
+\x7e\x31\x00\x00\x5b\x0c\x5c\xa6\xa8\xb8\x55\x27\x4e\xdf\x2a\x78\
+\xd2\x2a\xdd\xe9\x05\xe9\x6f\x59\xd2\x35\x76\xb5\x8e\xb5\xb6\x40\
+\x74\x6b\x58\xed\xbb\xb1\xca\x06\xfb\x64\xb3\xb9\xd4\xb7\x6d\x40\
+\xf5\xb7\xed\x8e\xec\x33\x75\x5c\x14\x9f\x4d\xab\x88\x9b\xe3\x8b\
+\x1d\x9f\x62\x9f\xba\x71\x5d\xc3\xaa\xd4\x84\xad\xd4\x1b\x98\x5f\
+\x01\x92\xb4\x27\x81\xfd\x8d\x67\x54\x8a\xa6\x7d\x8b\xd6\x61\x7b\
+\x51\xf6\x5e\x92\x48\x2f\x6f\x8e\xc2\xda\x40\x63\xed\x04\x82\xa7\
+\x44\x92\x29\x09\xc2\x8e\xc7\x7f\x6d\xf3\x08\xa2\x68\x16\x29\xb5\
+\xde\x8e\xb5\x34\x49\x95\xfc\x1b\x9a\x73\x54\xd1\x54\x55\x2c\xe3\
+\x13\x81\xa1\x45\x4d\x2d\x0d\x12\xff\x64\xb3\x39\x91\x15\x26\xe9\
+\x80\xac\x04\xd0\x7a\xe1\x89\x17\x12\x8b\xc4\x67\x61\x95\xe9\xb6\
+\xda\x96\x23\x55\xa6\xc9\x2e\xb6\x26\xd1\x42\x25\x3f\xc7\x10\x71\
+\x6a\x4d\x85\x15\x32\xc8\x6c\x90\x84\x0a\x4f\xdb\xdf\x54\x08\x95\
+\xd2\x76\x27\xbc\xfc\x8f\x8f\x05\xc0\x57\x44\x61\x6d\xa9\x49\xda\
+\x09\x04\x5b\x18\xa6\xe5\x6c\xfa\x7b\x7c\xfd\xf1\x1c\x02\x8b\x23\
+\xb0\x23\xf1\x66\x04\xae\x96\x29\x50\x56\x94\x11\x58\x8b\x07\x25\
+\x55\x1e\x2d\x20\x30\x07\x02\xd3\x0c\x81\x59\x66\x08\xcc\x36\x04\
+\x5e\x40\x60\xb2\x7d\xeb\xc6\x36\x4f\x34\xd7\xc2\x0a\x27\xce\x20\
+\x30\x65\x04\xb6\x41\x72\x9d\x26\x5d\x80\x15\x53\xe8\x70\x30\x00\
+\xbe\xbf\x2a\xfb\x5d\x4d\x63\xed\x04\x82\xdf\xa2\x82\x4f\x15\x7d\
+\xd5\x9b\x2b\xb9\xa5\x53\x60\x95\xf6\x9c\x69\x10\x58\xb6\x21\xb0\
+\xda\xa0\x55\xd3\x22\x02\x5b\xcf\x38\xf5\x9d\x49\x3d\xf5\x66\xf3\
+\x8a\xc0\x51\x98\xeb\xfd\x31\xbc\x38\x57\xf7\x12\x20\x6a\x92\x69\
+\x61\x37\x42\xd6\xc2\xc3\x1e\x02\xab\xd4\x0b\x10\xd8\xce\xd1\x5a\
+\xec\x00\x02\xcb\xfc\x0a\x08\xa7\x3d\x65\x04\x26\x9f\x39\x2d\x12\
+\xf6\x29\xf4\xd7\x83\x01\xf0\xa7\xeb\x32\xe0\xd5\x99\xa4\x7d\x50\
+\x8d\xcf\x41\x83\x6b\xa2\x02\x55\x77\x64\xe8\x88\xb8\x4f\x11\x98\
+\x33\x02\xf3\x36\x04\xa6\xf0\x45\x61\x43\x0a\x68\x77\x25\x87\xa8\
+\x94\xb1\xd9\xdc\xb0\x8d\x74\x40\x8a\x77\xd6\x43\xcb\x11\xd8\x5c\
+\xdb\xf8\x4c\xac\xd2\x3a\xde\x45\x04\x26\xf1\x8d\xad\xda\x28\x10\
+\x98\xa3\x6b\x80\x79\xd0\x2d\x02\xb3\xe4\x23\x07\x02\x4f\x3a\x68\
+\xd3\x70\xc4\x8f\x71\x0a\x7d\xf8\xd7\xb1\x00\xf8\xdd\x95\xd9\xef\
+\x6a\x1f\x7a\x1f\x62\x8e\x97\xf5\x3e\xaa\x76\xeb\x6d\x39\x26\x53\
+\x86\x66\x15\x62\x08\xac\x19\x24\xc3\x24\xd6\x26\x17\x8e\xc0\x6b\
+\x2b\x09\x91\x01\x83\x3a\x60\x8b\x64\x19\xf8\xa5\x4e\x5f\x1a\x35\
+\x5f\xb1\xfc\x8d\x6d\x63\x8d\x33\xcc\x37\x27\x1f\x97\xf8\x67\x60\
+\x95\xce\x0b\xf3\x4e\x03\x86\xee\x56\x8c\x68\x1b\x5b\xb7\x1f\x81\
+\x36\x42\xe0\x3e\xe7\x46\xb2\x64\x6c\x1f\x9c\x91\x23\x30\xf3\x70\
+\x9a\xdb\x6f\xe5\xb0\x7e\xff\x0e\xc0\xc7\xa0\xb1\xf6\x11\x05\x3f\
+\xb1\x4c\x86\x92\x28\xaa\x8c\x9e\x8a\x82\x2d\xee\x23\xbd\xcd\x49\
+\xa3\x5f\x76\xd6\x08\x39\x63\x73\x7a\x9d\x39\x5e\x5a\x70\xa3\xc9\
+\x16\x1c\x18\x45\x5e\x28\x4f\x61\x2d\x69\x73\xb3\x3f\x76\x9e\x57\
+\xf1\xce\xbb\x58\xaa\x15\xb3\xfb\xe1\xd6\xe1\xd2\x57\x39\xa1\x6e\
+\x7c\x34\xd0\xdd\x24\x02\x4e\x7c\x4c\x11\x6e\xfd\x44\x7e\x61\x84\
+\x7d\x9f\x78\x66\xf1\x11\x0e\x9e\xda\x1a\x5e\x52\x09\xca\x61\x88\
+\x58\x78\xbc\xee\x7b\x49\x22\xdd\xdf\x24\x85\xb5\x25\x93\xb4\x0f\
+\x08\x7e\x31\xd4\x4c\x86\xf3\xcf\xc3\x94\x10\xae\x51\xb0\xf1\x43\
+\x56\x34\x6f\xed\x59\x2d\x07\xe4\x8f\x48\x62\xa7\xa5\x9c\x39\x5e\
+\x5e\xb0\x4e\x3a\x16\x61\x7a\x40\xac\x98\x69\x6e\xac\xa3\xb4\xca\
+\x46\x62\x73\xc8\xcf\x00\x40\xba\xd3\xed\xb6\x0b\xb9\x28\x18\xbf\
+\xa6\x85\x2c\x22\x15\xe3\xa3\xc9\xeb\x11\x29\xc2\x6f\x46\xd5\xa6\
+\x7b\xf8\x04\xfc\x5a\x74\xd8\xb2\x8a\xe4\xa0\xbe\x6c\x0e\x30\x9e\
+\xda\x5c\x70\xae\x21\x30\xda\xef\xa0\xf4\xe1\xbf\x8f\x05\xc0\x6f\
+\x1e\x5d\xdf\xd7\xfd\x91\xa2\xe0\x67\x43\x38\xcd\x83\x75\x29\xae\
+\xfc\x8a\x22\x09\xb3\xb3\xc2\xe4\x31\x70\xdc\xcf\x8c\xbc\xec\x2a\
+\x13\x06\xda\x87\x05\x1a\x6c\x44\x56\xc7\x58\x32\x72\xd9\x48\x8c\
+\xc4\xb2\x4a\x30\xbb\x18\xc6\x39\x71\x6c\xb8\xed\xa1\x32\x91\x13\
+\xc9\x33\x8e\xd9\x21\xdd\xcd\x4f\x20\xfc\x56\xcf\xd9\x19\xe7\xf0\
+\xf8\xf5\xc2\x90\x47\xcd\x41\x63\x05\x02\x43\xb7\x6b\xa0\x0e\x88\
+\x0d\x71\x07\x4f\xe2\x15\xfd\x3b\x3c\xfe\x0e\xc0\x47\xa1\xb1\xf6\
+\x01\xc1\x35\xf8\x8d\xfc\x2f\xd4\x96\x8b\x53\xb6\xc0\x37\x73\x44\
+\x99\xcc\xe8\xd9\xd2\x6a\x04\xb6\x64\x6c\x42\x40\x66\x77\xd2\x0d\
+\x5a\x29\x52\x56\xfe\x71\x32\x3b\xe3\x84\xc0\x62\xec\xb8\x81\x1c\
+\x45\x06\xca\x53\xca\xda\xb8\xa7\xe1\x98\xdd\x7a\xfd\x99\xa1\x10\
+\x7e\x8b\xb1\x53\x14\xa7\xe7\xe4\x40\x7c\x5e\xd1\x1b\x78\x32\x49\
+\xf3\x15\x4e\x58\xe3\x6e\xf5\x4a\x9f\xbc\x15\xa5\x4e\xa1\xbb\xa9\
+\x44\xba\xbb\xcd\x1c\xd2\xc6\x4c\xd2\x2e\x20\xf8\xad\x9b\x6e\x19\
+\x22\x1c\x9b\x7e\x51\x50\xb6\xa1\xb9\x52\x04\x76\x1e\xca\xda\xb6\
+\x6e\x40\x60\xb2\xbb\xb9\x41\x40\x36\xa6\xcc\xe7\x04\xf1\x7e\x8f\
+\xc2\x01\xb8\x3d\x04\xce\x09\x64\x33\x71\x7c\x3b\x50\xba\xe5\x98\
+\x25\x44\x1d\xfe\xc3\xb2\x55\x19\x81\x61\x2a\xb1\x50\x57\x5a\x04\
+\xf6\xb8\xd7\x0f\x40\x31\xfc\x7a\xdc\x02\xdd\xb0\x22\x89\x37\xad\
+\xfc\xf5\x58\x00\xfc\xe9\x1a\x0d\x78\xb5\x0f\xbd\x0b\x08\x1e\x2b\
+\x92\x50\xcd\x37\x40\x86\x32\x60\xd2\x8b\x90\x8c\xd1\x11\x02\x04\
+\xb6\x98\x73\x25\x02\xdb\xbd\x9f\x10\xd0\x09\xe8\xc6\x7e\xe7\x08\
+\x2c\x1d\x04\xb6\x04\x2e\xa1\xab\x60\x43\x82\x9d\x7b\xf3\x69\xe0\
+\x98\x63\x4e\x00\xfb\x0d\x31\xa7\xf8\xd3\x56\x08\x1d\x7f\x3d\x21\
+\x9e\x23\x30\x45\xd4\x01\x28\x0e\xf2\x17\x7a\xaf\x7a\xd5\x12\x97\
+\xbc\x4e\x9f\x65\x27\x1e\xf4\xdd\xad\xe6\x90\xb6\x65\x92\xf6\x01\
+\xc1\x83\x05\x63\x35\x0f\x39\x7e\x4f\xff\x95\xc5\x92\xae\x58\x69\
+\xa6\x36\x16\x92\x95\x2c\xb4\x84\xf9\x45\xae\x28\xcc\x8a\x9d\xa7\
+\x16\x60\xb1\xe0\x38\x40\x5a\xdb\x8a\x00\x42\x09\xc7\xdc\x02\xde\
+\x78\x9b\x42\xbe\xcc\xf1\xd1\xf0\x73\x9d\xf1\x96\xa0\xe9\x80\x02\
+\x8b\x59\xa3\x87\xc0\x66\x9f\xee\xaf\xb0\x33\xe3\x91\x66\x52\xe7\
+\xa5\x78\xf9\x97\x32\x86\xd3\xec\x39\xa5\x03\x8e\x05\xc0\xaf\xaf\
+\xd3\x80\x57\x67\x92\x76\x01\xc1\x4f\x14\x81\x87\xa1\x78\x73\x1d\
+\xed\x10\xe1\x11\x64\x53\x7b\x63\xf0\x95\xa1\x85\x43\x0a\x79\x66\
+\xc1\x28\xa0\x30\x39\xca\xf6\x03\xcc\xad\x04\xf3\xcb\xb0\x1f\x2b\
+\x13\x60\x81\x69\x84\xdc\xdc\x40\xef\xc4\xf8\xb6\xa7\x7c\x75\x0d\
+\xcc\x11\x9e\x4e\xb2\xd3\x25\xc1\xe9\x26\x9a\x3f\x4b\x2a\xb0\x30\
+\x71\x47\xd4\x50\x90\x04\x49\xef\x93\x9d\x9b\xb0\x79\xee\x56\x35\
+\x32\x81\xf0\xa9\x4e\x96\xb5\x14\xe9\x97\x43\x01\xf0\x55\x52\x58\
+\x5b\x32\x49\xbb\x80\xe0\xbf\x4d\x56\x3b\x35\x77\x57\xaf\x6e\xfa\
+\x3f\xbe\xfc\xe8\x10\xd4\xd1\x22\xfb\x33\x44\x1c\x24\xd7\x20\xb0\
+\xd3\xcd\x51\x94\x18\x0d\x9c\x51\xb7\x48\x08\x85\x40\x1f\xf9\xb3\
+\xc3\xec\x4d\x23\xc4\x29\xd0\xd7\x1e\x2e\xe8\x0f\x43\x91\x94\x6a\
+\x26\x93\x5f\x59\x97\xf8\xa0\x93\x39\xcd\x08\xd1\x9a\xcb\xf5\xd7\
+\x24\xe0\x19\x84\x37\xee\x2f\x89\x7d\x0e\xf0\x8c\xb0\xf8\x49\xd6\
+\x43\x14\xef\x04\x5a\xb4\x83\xd1\xa0\x57\xfd\xe1\xc7\x43\x01\xf0\
+\x9b\x47\xd7\xfa\x75\x7f\x20\x31\xc7\xdd\x50\x71\xe0\x64\x46\xac\
+\xad\x39\x46\x3c\x16\x54\x27\xb4\xc5\xf4\x66\x5b\x2e\x89\x60\x70\
+\x25\x97\x16\xdc\xbb\x44\x04\x46\xad\xb1\x3d\x56\x48\x24\x62\x58\
+\x72\xe4\x45\xb6\x0a\xab\x04\x19\x13\xbf\x68\xa8\x09\x81\x39\x99\
+\x3e\x45\xfd\x01\x68\x2d\xac\x39\x5d\x46\x60\x7f\xbc\x43\x3c\xf3\
+\xc8\x21\x97\x80\x37\xf7\x1a\x42\x01\xda\x0b\x84\x95\xd3\xab\xea\
+\x37\x57\xd8\x35\x04\xd6\xa6\x64\x3f\x1c\x0a\x80\x5f\x5f\xad\x01\
+\x3f\x3d\x12\x04\x3f\xa9\x38\x50\xd3\xbf\x35\x04\xd6\x1f\x43\xb8\
+\xbb\x73\xbd\xb0\x10\xa8\xb4\x9a\x1a\xde\x33\x0b\x14\x0f\x1e\x8b\
+\x48\x31\xf8\x22\x77\x9f\x0d\x26\xc9\x4b\x0f\x28\xb5\xa4\x09\x1d\
+\x25\xf8\xee\xe1\x70\xfb\x98\xc8\xc5\x58\x9c\x4a\x78\x51\x42\x46\
+\x58\xd4\x84\x26\x6f\x1d\xa1\xdb\xa2\x5e\x9b\x5c\xfc\x59\x15\x02\
+\x53\x05\x06\x1d\x02\x9c\x1c\x1b\x7d\x67\x86\x5b\x2f\x7b\xd1\x56\
+\x58\xa3\x15\xff\x72\x28\x00\xbe\xbf\x5a\xfb\x5d\x9f\x49\x7a\xb7\
+\x0b\x1f\x7a\x50\xfe\xaa\x68\x67\xca\x1a\x91\x4d\xfd\xa1\xed\x86\
+\xcf\x8d\x55\x4d\x7b\x18\x95\x05\xf1\x7c\x3f\x01\x6e\x27\x2f\xa8\
+\x46\xd9\x14\x4b\xee\xc8\x4a\xa4\x7b\x40\xeb\x18\x0b\x9c\x6b\xe8\
+\xa9\xe1\xa4\x04\xe9\x26\xc2\x64\x6c\x58\x6a\x84\xdf\x49\xf3\xc8\
+\x11\x86\x03\x71\xcc\x41\x61\x65\x8b\x0d\xb3\x74\x7d\x55\x43\x64\
+\x71\x83\xc0\xd0\xf0\xc0\x87\xab\x17\xb8\x14\x6f\xc3\xa1\x08\x7c\
+\x2a\x3f\x1e\x0a\x80\x3f\x5d\xaf\x01\x1f\x0a\x82\xef\x86\x78\xbe\
+\x99\x13\xd0\x9a\x55\x92\x4e\xc5\x2c\xda\x50\xd6\x10\x33\x44\xa9\
+\xf3\x85\x86\xdc\x81\xc0\x14\xa6\x03\x74\x76\x73\x30\x2c\xa9\xa1\
+\x8d\x60\xa9\x05\xa3\xa5\x31\xfa\xce\x92\x9e\x66\xd6\x82\x6e\x56\
+\x46\x13\x67\x9f\x3c\xc8\x64\xc9\x8e\x08\x33\x0e\x14\xe3\x09\x46\
+\x04\xf6\x8d\x88\xc1\x2f\x20\xb6\x8b\x1b\x34\x56\x45\xe0\xa1\x3c\
+\xfc\x70\x24\x00\x7e\x77\xc5\xf6\xbb\x3e\x93\xb4\x07\x08\x7e\x5f\
+\xaa\xae\xaf\x68\x73\x26\x6b\x53\xfc\x65\x4d\xe6\x78\x9b\xa7\xfb\
+\x71\x02\x40\xbc\xc5\xa9\xb7\x00\x4d\x6a\x38\xcd\x03\x34\x9b\x19\
+\x68\xe6\xea\x76\x5c\xf9\xa6\x55\x0d\xcf\x18\x37\x6e\x30\x34\xf7\
+\xd0\xc9\xef\x62\x58\xee\xc7\xa5\x74\x16\x8c\x2c\x76\x6b\xf1\xd4\
+\x3f\xed\xe0\xab\x63\x54\xd6\x02\xab\xd8\x33\x31\x8a\x3d\x17\xf2\
+\xe3\x77\x00\x3e\x5c\x26\x69\x0f\x10\xfc\x39\xac\xb7\x38\x0a\x97\
+\x6a\xca\x0e\x92\x3d\xd3\x49\xb7\x34\x3c\xb3\xd3\x35\x49\x79\x01\
+\xf6\x95\xc8\x30\x89\xc7\xa4\x41\x1a\x96\x32\x7f\xd6\x72\x69\x69\
+\x4e\x69\x9c\x69\x6a\x10\x1c\xd1\x9f\x30\x3e\x4d\xdb\x33\x66\xbd\
+\xad\x07\x16\xc1\xe4\x95\xdc\x07\x10\x67\x05\xe5\x45\xb8\x41\x04\
+\xe7\x69\xfa\xb3\x2b\x3c\xfd\xae\x0a\x8e\x41\x19\xc4\xff\x7e\x8f\
+\x80\x8f\x97\x49\xda\x01\x04\x3f\x53\x26\xc5\x5c\xbb\xc1\x1e\x17\
+\xfc\xe5\x45\xe8\xfb\x73\x53\xca\xdc\x0f\x8e\x5b\x62\x28\xa7\x5a\
+\x84\xb3\xf2\xa3\xf1\xca\xa9\x69\x01\xd7\x84\xc0\xe8\x73\xb7\xf5\
+\xf2\x02\x8d\xf6\x38\x2b\x34\x64\xe6\xfe\x37\xb6\x9e\xf0\x9d\x52\
+\xa3\xbe\x14\x9d\x0b\x4b\xcb\xc6\xcf\x21\x1c\xbb\x01\x21\x28\x37\
+\xef\x4c\x14\x96\x35\xa2\xb4\x87\x41\x2a\xa1\xb5\x8f\x42\x86\xbb\
+\xef\x39\xa4\xe3\x41\x70\x75\xa0\x9d\x5c\xa9\xd8\x50\x6f\x32\x5a\
+\x88\x82\x81\x1a\x46\xcf\x91\x12\x45\x8d\x0b\x40\x37\xe3\x53\xb1\
+\x3d\xd1\xd2\x12\xbd\x00\x8b\x2c\x51\xfa\x64\xff\xfc\x78\xd4\x76\
+\x96\xb4\x43\x50\xfa\x0c\x63\xc2\x89\x50\xd7\xdd\x98\x35\x25\xf6\
+\x89\xec\x9c\x32\x69\x46\x09\xb6\x91\xd0\xe2\xc4\x6c\xb1\x60\xda\
+\xb8\x06\xee\x83\xb1\x0c\xc3\x10\x50\x5c\x45\x34\x87\x02\xe0\xbf\
+\x5e\xb9\x01\x1f\x29\x0a\xfe\x6c\x0e\xb4\xdd\x4f\xfa\xbc\x8f\x71\
+\x6d\x92\x1f\x12\x3c\xed\x04\x80\x14\xe4\x48\x84\xf5\x0a\xb1\xc0\
+\xfd\x06\x79\x2d\xb3\x6c\x00\xec\xf9\x97\x5e\x5c\x3d\x43\x57\x42\
+\x7b\x83\x90\xd3\xec\x14\x87\xc9\x79\x8e\x68\x5e\x12\xca\x29\xa9\
+\x69\xb3\x03\xd7\xc0\x4b\x8e\x19\x59\x76\x84\x60\xc6\x09\xe4\xff\
+\xec\x9d\xcd\x8e\xdb\x38\x16\x85\xb3\xeb\xd5\xec\xb2\xe8\x81\x5f\
+\x62\x76\xb3\xca\xa2\x56\x4e\x2d\xfc\x2e\x01\x52\x80\x32\x28\xd4\
+\x62\x80\x00\x43\x82\xe8\x5d\x80\xa6\x61\xcc\x43\x64\x15\x16\x82\
+\xbc\x43\x80\x09\xe0\x0a\xf2\x32\xd3\x2e\xfd\xf0\x47\xb2\x8b\x94\
+\x64\x5e\x5e\xe9\xa8\x1b\x49\x25\xdd\x5d\xb1\xdd\x3a\xfa\xce\x3d\
+\xf7\x92\xb4\x9e\xe2\x34\xc5\xd1\x76\xda\x45\x3b\xf3\x26\x9a\x43\
+\xce\xbe\x71\x02\xf0\xc2\x1d\x74\x42\x27\xa9\x00\x04\xdf\x98\xba\
+\x1e\x6b\x92\xab\x67\x29\x37\x04\x56\x72\xef\x0f\x5e\x48\x7f\x03\
+\x2b\xcf\xb4\xea\xb0\x4b\x6c\xf7\x80\xd6\x1e\x4b\xed\xae\x96\x36\
+\x82\xf6\x1a\x3e\x56\x78\xd2\xd1\x61\x40\x5c\xa9\x1d\x09\xed\xf7\
+\x7b\x6f\xa7\x1e\xe9\x38\x76\xed\x29\xca\x7f\xd1\xd2\x4e\x6a\x86\
+\x33\xd3\xf6\x10\x26\xb7\x3c\xb0\xef\xcd\x4d\xb3\xb4\xfb\x6a\xf7\
+\xde\xf3\xc3\x3a\x90\xfd\x33\x80\xeb\xbe\x51\x33\xef\xd6\x76\xdc\
+\x45\x21\x0b\x19\x2a\x0c\x71\x24\x77\x92\x1e\x4a\xf0\xd0\x4d\x13\
+\xa9\x9d\x0e\xaa\x7f\xf5\xfc\x6b\xdd\x0b\x7d\x5d\x6b\xb8\xf7\x56\
+\xf5\x9f\x4f\xa1\x87\x00\x7c\x76\x44\x44\xfb\x4f\x84\x21\x00\x9f\
+\x0f\xa4\x2f\xfd\x7b\x03\x6f\xc2\x7f\x2d\xd2\x89\xa5\xcf\x8c\x8f\
+\xfa\x39\xf7\xe0\x37\xd7\xe7\x5f\x82\x68\xa6\x54\xbb\x79\x37\xd5\
+\x4d\xd1\x18\x4e\x00\x7e\x58\xbc\x7e\x59\x21\xf8\x57\x8d\x00\x3b\
+\x0d\x5d\xf3\xf8\x39\x1e\x0d\x8c\xeb\x05\x65\x7a\x15\x61\xe8\x2a\
+\xcf\x34\x81\xf4\x3e\xd8\x43\xe7\xdc\xb7\x0e\x04\xa1\xf7\xbd\x0e\
+\xd1\x3e\x8c\xcb\x75\x4f\xb3\xf2\xd2\x4b\x39\xab\x7c\x1d\xfc\x89\
+\x41\xb2\x35\xf4\x85\xf4\x8b\x04\x6b\x21\xda\x13\x5c\xdb\xac\xbf\
+\x19\xc1\x3a\xfd\xf8\x85\x13\x80\xbf\x2f\x5f\xc0\xd1\x03\xd1\x05\
+\x20\xf8\xa6\x59\x7f\x54\x4f\x43\x9b\x5a\xbb\x0d\x2a\xbc\x9d\xa0\
+\x42\x4a\xf9\x4b\x8b\xe4\x30\x89\xba\x1c\xc8\x4e\x17\x7a\xdf\xcb\
+\x83\xad\x1b\x55\xcb\xa1\x36\x92\x37\xa4\xec\xcf\x5e\xb8\xeb\x09\
+\xa5\xbb\xe5\x87\x17\x62\x79\x2f\x5a\xba\x0f\x10\xed\x99\x60\xc7\
+\x8a\x4b\xcf\x43\x3b\x0b\x96\x9d\x65\x82\xbd\x76\xb8\x1d\xe4\xf0\
+\x32\xe8\xda\x38\xb7\x47\x42\x36\x4f\xcd\xd3\x97\xaf\x01\x60\xa6\
+\x31\x56\x01\x08\x56\x0d\x74\x6b\x2c\xd4\xda\x6d\x51\xe1\x83\x4d\
+\xf6\x58\x64\x17\x34\xf8\x80\xd2\x83\x18\x74\x4f\x2f\x72\x16\xed\
+\xc9\x90\x57\xbd\xd3\x18\xf4\x8b\xfe\x78\xef\xad\x1c\xf2\xcd\x78\
+\xff\xbf\x91\x43\xe6\x59\x5e\xfa\xee\x03\x2f\x42\xee\x2f\x5b\x12\
+\xe7\xc1\xa4\x9b\x31\xca\x2e\x20\x14\x5d\x0d\x5c\xff\x08\x00\xb3\
+\xed\x24\xd1\x23\xf8\xbe\x5d\x80\xa4\xda\xcb\xa2\x42\x3a\xd3\xc7\
+\x32\x5c\xd5\x3f\x70\x9f\xda\xe5\xaf\xfe\xe2\xa0\x0b\xf7\xba\xde\
+\x7b\x07\x1c\x5c\xae\x6d\x75\x60\x68\x7d\x08\x9e\xff\x8f\xc3\xd2\
+\xdd\x25\x74\xaf\xe2\x1e\x7a\x5c\xc8\xb3\x2f\x2b\xe8\x83\x49\xed\
+\x5b\x7c\xdb\x69\x12\x9d\x70\x9b\xab\x3b\xd4\xb5\x84\x63\xbd\xb7\
+\xe8\x21\x8d\x1b\xe6\xa0\x47\xf0\x4d\x57\x90\xf9\x77\x98\xe8\xc6\
+\x29\xc3\x33\x7f\x7a\xa7\x04\xc9\xd0\x06\x7b\x96\x5a\xbb\x22\xd3\
+\xfb\xfe\xfa\xda\x81\xbc\x49\x86\xa2\xb6\x8d\x1b\xe9\x9d\x47\xa8\
+\xfd\x84\xd8\x2b\xa7\xb5\x17\x96\xcb\x17\x9e\x0b\xde\x52\x62\xdd\
+\x0f\xbe\xdd\x65\x0c\xda\x5d\x24\x19\x8a\x75\xdf\x3f\x7b\xb1\xcd\
+\xa0\xbb\x02\xc5\x2f\x81\x5f\x33\x02\xf0\xfb\x57\xaf\x80\xe0\xb2\
+\x10\xec\x1c\x0d\xec\xde\x61\xcf\x6c\xd8\x3b\x47\xa0\x68\xf7\x78\
+\xb3\x6e\x40\xb2\x97\xe8\x84\xd6\x75\x60\xa6\xd9\x8f\x81\x3d\xcb\
+\x2d\x5d\x59\x48\x8f\x92\xfb\xcb\xa1\x98\xbb\x97\x4e\xef\x79\xe2\
+\xed\x07\xe4\xf5\x70\x07\x53\x73\x79\x0e\xc2\x7a\xc0\x58\x0f\xfc\
+\x59\x3a\xf8\x20\xfe\xfa\x47\xf6\x09\xd9\xfa\x9c\xba\x04\x2e\x23\
+\x83\x06\x80\x19\x23\xf8\x3e\x20\x70\x7b\x7f\x9d\xbe\x94\x67\x62\
+\x5d\x39\x74\xe2\x6f\x10\x26\x4b\x7f\x09\x7e\x6f\x82\xc3\x97\x79\
+\xe0\x64\x7b\x04\xf3\xb6\xa2\xee\x56\x0e\xf6\xc2\xb5\x61\x2b\x2c\
+\x7b\x15\xab\x53\xb9\x07\x8b\xa5\xce\x19\x82\xde\x73\x4a\xfa\x0b\
+\x1a\x07\xbe\x76\x06\x4c\xb4\x08\x2a\x14\x27\x8d\xfe\x02\x00\x23\
+\x88\x9e\x36\xcb\xd1\x74\x26\xdd\x1b\xac\x69\x53\xda\x18\xab\x77\
+\x10\x59\x88\x23\x3d\xa0\xf5\x70\xd1\x91\x74\x0e\xea\x94\x01\x70\
+\xcf\x75\x7e\xe5\x60\xdb\x76\xef\xef\x41\x17\xac\x31\xf0\x9e\x2d\
+\x7a\x60\x84\x7a\xa8\xd5\x25\x83\x59\x4d\x1d\x2e\x3f\x0c\xc6\xbc\
+\x7a\x2f\xdb\x9f\xf6\xf2\xbe\xb9\xe8\xac\xb3\x2d\x51\x9a\x34\xba\
+\x00\x07\xbd\xc5\x10\xc7\xf8\x61\x0e\x7a\x04\x2b\x9f\xc0\xb6\x04\
+\x16\xcf\x1b\x44\xdb\xc9\x28\x1d\x36\x61\xb5\x3f\x96\x14\x06\xbb\
+\xba\x3f\x27\x31\x94\x13\x49\xed\xc7\xdc\xbe\x84\xce\x00\x7c\xe8\
+\xcf\x73\x5e\x9d\x3c\xd7\x43\x96\x6e\xfa\x2d\xfd\x01\x0d\x7d\xb6\
+\x6b\xac\x87\xcc\x87\x0e\xce\x57\xbc\xb0\x00\x52\x3b\xe1\x95\x11\
+\xbe\xe5\x31\x8c\x00\x5c\xad\x46\xbf\x09\xc3\x1c\xe4\x08\xfe\xd5\
+\xed\x46\xe9\x96\xc0\xb5\x8f\x1e\x1e\xac\xd2\x3d\x6f\x1b\x44\x54\
+\x56\x71\xde\xb6\x93\xf2\xfc\x70\x94\x1f\x67\x79\xcf\x09\xd9\x8f\
+\xd1\x06\x86\xb3\x64\xa0\x43\xdd\xfb\x2d\x79\xa9\x84\xd6\x17\xa6\
+\x48\xa4\xdb\x47\x1e\x18\xbe\xd2\xbe\xac\xdd\x87\x4a\xb3\x6e\x43\
+\x58\xeb\xdc\xb6\xe9\x3a\xc7\xf3\x0d\x00\x06\x82\xa7\xe7\xd0\x26\
+\x28\x81\xdb\x3a\x6d\xa0\xe5\x39\x30\xf9\xe4\x2d\x3f\x08\x96\xe4\
+\x05\x3d\x27\x77\xf1\x42\x6f\x7b\x9c\x4b\x1a\x0a\x7b\x41\x72\x70\
+\xd3\xae\xa1\xea\x5a\xf7\x1e\x36\xfe\xf4\x96\xdc\xeb\xfe\x3c\x99\
+\xdc\xfb\x5b\x5e\xfa\x4b\x13\xf5\x20\xe8\x83\xdd\x7f\xec\xeb\x6b\
+\x36\xc0\x72\x3e\x5b\xfb\x79\x93\x3b\xe8\x5d\x85\x21\x0e\xde\x08\
+\x3e\xa8\xf6\x84\x60\xd3\x95\xc0\xed\xde\xa7\x71\xfa\xc2\x75\x39\
+\x27\xaf\xb7\xcf\xef\x34\x5b\xef\xc1\x5d\xa7\xff\x8f\x8c\x00\xfc\
+\x7d\x4d\x02\x8e\x8f\xb1\xaa\xbb\x12\xd6\x14\x3a\x77\x57\x37\x2e\
+\x74\xfa\x09\xf2\x9b\x7e\x39\x1f\xac\x72\xe3\xac\xd3\xef\x7e\x03\
+\x80\xd9\xcf\x53\x56\x05\xcc\x43\xb7\x3b\x8e\x2b\x4f\xc6\xf5\x39\
+\x67\xb8\x26\x02\xb8\x3e\x40\xd4\xc6\x56\xdd\xf9\xde\x7f\x7d\x45\
+\xfd\xf4\x8e\x3e\x0f\x78\x6d\x00\x4e\x18\xe6\x20\x47\xf0\xa1\x4d\
+\x45\x9b\x9d\x12\x4d\xb7\x3d\x96\x80\x87\x9e\x41\xc0\xca\x56\x25\
+\xc6\xd8\x7c\xe1\x74\x3d\xf2\x01\xf0\x6a\x86\x38\xd2\x87\x39\xa8\
+\x11\xfc\xb6\x3e\xe0\xcc\xd8\x15\x85\xaa\x63\x32\x3c\xf4\xe4\xab\
+\x39\xbf\xd5\x89\xa1\x45\xb7\x2f\xd6\x47\x3e\x00\x7e\xff\xea\x15\
+\x10\x5c\x26\x82\xb7\xa6\x25\x70\xbb\xe5\x69\xbd\x37\xe5\xf3\xef\
+\x00\xc1\x93\x1d\x74\xb7\xd3\x98\x13\x30\x34\xab\x36\xef\x00\x60\
+\x20\x78\xfa\xb5\x69\x4f\xdd\xea\x16\x9b\x1b\xd3\x9c\x25\x0f\x04\
+\x4f\x06\xb0\xf2\x6b\xe0\x4e\xc5\x7f\xfd\xf8\x19\x00\x06\x82\x67\
+\xb8\x6e\x8d\x9d\xd0\x6d\xdd\x5e\x03\x0a\xc4\x58\xd3\x23\xac\x96\
+\xc0\xed\xa6\xb2\x6d\x92\x25\xd4\x27\x00\x18\x08\x9e\xe3\xff\xa3\
+\x69\x6e\xaf\xc6\xd9\x19\xa5\x84\x6d\x79\x40\x84\xd3\x7a\x48\x75\
+\x9c\xe0\x84\xd0\x8d\x8c\x95\xf8\x4a\x3d\xc4\x53\x01\xc0\xcb\x40\
+\xf0\xbd\x37\x66\xe0\x0c\xeb\x9e\xa4\x0c\x04\x4f\x02\x70\xb3\xd9\
+\x89\xaa\x9f\x91\xca\xca\x98\x7e\x21\xd2\x16\x00\x9e\xad\x17\x4c\
+\xfb\x2c\xbe\x31\x5d\x67\xb2\xb9\xd7\x9a\xd0\xe5\x74\x41\xc0\xd3\
+\x1c\xb4\x70\x52\x68\x25\xec\x07\x6b\xc8\xc7\x28\xe3\x6f\xcf\x6a\
+\x95\xfa\x4d\x98\xa7\xa4\x1e\xa8\x54\x21\x81\x8d\x13\xb8\x40\x86\
+\x53\x7a\x48\x6d\xf0\x5c\xff\xec\xf4\xe9\xc8\x17\x22\x25\x00\xf8\
+\xdd\x3a\x05\x9c\xb0\xa4\x81\x18\xc1\xbf\x1a\xad\xd6\x33\x1c\xcd\
+\xad\xd6\x62\x03\x08\x9e\x08\xe0\xee\xb1\x28\xea\xc3\x97\x1b\x02\
+\x7f\x03\x80\x81\xe0\x39\x97\x24\xb9\x33\x42\xca\x26\x2e\x40\xf0\
+\x84\x08\xcb\xb8\x5d\x23\x3b\x29\x73\xfa\x9a\xda\x41\x1f\x01\xe0\
+\x59\x11\x4c\x9b\x63\x6d\xea\xd1\xe7\xe6\x56\xab\x4b\xb5\x6e\x89\
+\x03\x10\x3c\x11\xc0\xf6\x81\xe8\x7c\xb0\xc4\x4d\xe0\x84\x16\xd2\
+\xc3\x6a\xf5\x9b\x82\x60\xda\x56\xd2\xdb\x36\x7b\x36\xca\xbb\xdf\
+\x6a\x59\x43\x8a\x23\x01\xac\xba\xcf\x50\x89\xe0\x83\xa5\x1e\xa3\
+\x4c\x00\xf0\xf7\xf5\x0a\x98\x0d\x82\x77\xce\x9a\x55\x63\x39\x0c\
+\x04\x4f\x05\xb0\xbb\x7a\xb0\xf6\xd0\xad\x94\x7f\x00\xc0\x40\xf0\
+\xdc\xad\x60\x13\x56\xc2\xaa\xdd\x1b\x0b\xd7\xe8\x1e\x52\x6d\x9c\
+\x5d\x00\x9f\x7e\xf9\x05\x00\x06\x82\x67\x8e\xb1\x94\xe8\xd6\x01\
+\x77\xa3\xd0\x35\x98\x21\xc6\x31\x97\x75\x35\xce\x70\x4c\x1b\x34\
+\xd0\x46\x58\x5b\x00\xf8\x0a\x08\x26\x35\x55\x07\xef\x7c\x86\x00\
+\xc4\x8f\x50\xe3\x48\x00\xab\x46\xb1\xaa\x1d\xe3\xa8\x67\x2b\x95\
+\x64\xd3\x42\x5a\x37\x80\x93\x10\x4c\xda\x4a\x7a\xdb\x6d\x6e\xe7\
+\x55\xc0\xcd\x4f\x90\xe3\x98\x31\xe8\x8e\xb9\xad\x84\x4d\xf7\x94\
+\xfc\x03\x00\x06\x82\xe7\x5e\x15\xdc\x8d\x08\x29\x67\xdd\x5b\xed\
+\xa4\x51\x05\xa7\x03\x58\x09\xe7\xd4\x65\xeb\x6f\x9e\x01\x4c\xbc\
+\x12\x18\x00\x5e\x20\x82\x37\xed\x84\x50\x10\x41\xd7\x75\x30\x04\
+\x39\x0e\xc0\x4a\x74\xad\x5f\xe5\x00\x98\xb6\x09\x7c\x04\x80\xaf\
+\x84\x60\xca\xe7\xf2\xad\x09\xba\x1e\x76\xf4\x00\x08\x1e\x1b\x41\
+\x2b\xff\xe8\xc7\xa6\x2f\xac\x68\x57\x02\xef\x00\xe0\xa4\xab\x62\
+\xd2\x4a\x52\x9d\xc3\x33\xcd\x2c\x96\x3b\x7f\x0f\x49\xa6\x4f\x51\
+\xba\x6d\x39\x77\x49\xb0\x10\x00\xf0\x32\x57\x15\x92\x22\xf8\x97\
+\x07\x60\xf7\x24\xdb\x13\x35\x80\xe0\x71\x53\x94\xca\xd6\x23\xa6\
+\x8c\xed\xa0\x01\xe0\x85\x22\x78\x6b\xfc\x93\x2f\x83\x0b\xa2\x4c\
+\xab\x80\xc5\x40\x5f\xce\x34\xd5\x30\x69\x84\x55\x01\xc0\x57\x44\
+\x30\x65\x8e\xb5\xe9\x15\x6c\x42\x59\x72\x00\xc1\xe9\x00\xee\x4e\
+\xb9\xf0\x1e\x89\x8a\x34\xc2\xda\x02\xc0\x57\x45\x30\x61\x2b\xa9\
+\x5d\x54\xa8\xba\x81\x68\xe3\x8e\x47\x43\x96\x69\x00\x36\x4e\xdb\
+\xc8\x4d\xf6\x8d\xf8\xc4\xc4\x40\x03\xc0\x23\x10\x4c\x69\xa2\xed\
+\x52\x06\x7f\x02\x1f\x4b\x1a\xd2\x01\x3c\x58\x89\xd4\x22\x26\xdd\
+\x8a\xe3\x08\x00\x5f\x19\xc1\x84\xf5\xd1\xaf\x20\xc2\x32\xa8\x82\
+\xc7\x03\x78\x78\x8b\x04\xea\x29\x2c\x00\x78\xc9\x08\xde\x1a\x3b\
+\x4c\xe9\x78\xe8\xd6\x04\x02\xc1\xa9\x11\x56\xb7\xc3\x98\x33\x1d\
+\x63\xbe\xde\x01\xc0\x4b\x1e\xc7\xa2\xcc\xb1\xee\xfb\xdc\x35\x40\
+\xf0\x18\xfd\x76\x09\xa0\xdf\x42\x52\xc4\x53\x58\x5b\x00\xf8\xfa\
+\xe3\x58\x84\x39\x96\x1b\x63\x05\xeb\xdf\x4e\x3f\x00\xc1\xb1\x02\
+\x36\x41\x9a\xef\x36\xd6\x29\x17\x12\x56\x00\xf0\xb2\x11\x7c\x68\
+\x87\xff\x82\x15\xe8\xcd\xed\x07\x6d\xc6\x57\xc0\xca\x4b\xf1\xed\
+\x5c\xea\x23\x00\xbc\x78\x04\xd3\x15\x49\xb7\xe7\xfd\x33\x82\xe8\
+\xd4\x21\x2c\x31\x18\x44\x13\xf6\x90\x76\x00\x70\x1e\x04\x13\xe6\
+\x58\x03\xab\xfa\x9d\xdb\x10\x02\x8e\x02\xb0\xea\x7f\x76\xa6\xfb\
+\x10\x99\x24\x58\x00\x30\x4f\x04\xff\x1a\x9a\xfe\xb3\x66\x1a\x0a\
+\x8e\x04\xb0\x09\xc6\xc9\xbb\x3e\xf0\x37\x00\x78\x0d\x08\x26\xcb\
+\xb1\xb6\x46\x5c\xbc\x20\xd0\xa4\x1e\x70\xef\xa2\x1c\x83\xae\x00\
+\xe0\x6c\x08\xa6\xcb\xb1\x36\x97\x6f\x40\x20\x38\xa5\x02\xee\x5f\
+\x84\x3d\xa4\x2d\x00\xbc\x06\x04\xdf\x00\xc1\xd7\x04\xf0\x6b\x1e\
+\x06\x1a\x00\x9e\x8a\x60\xba\x1c\xeb\x00\x04\x5f\x0f\xc0\x84\x3d\
+\xa4\x94\x04\xab\x7a\x07\xb9\x4e\x45\x30\x59\xad\x74\x2b\x80\xe0\
+\xab\x01\xf8\x13\x0f\x03\x5d\x41\xac\xd3\x11\x4c\x66\xa2\x15\x10\
+\x7c\x2d\x00\x13\xae\x43\xaa\x00\xe0\xe9\xd7\x1b\x16\x39\xd6\x13\
+\xaa\xe0\x2b\x01\x98\x70\x1d\x52\x92\x81\x7e\x0f\xa9\x9e\xb9\x8e\
+\x1c\x4c\xf4\x4e\x00\xc1\xd7\x01\xf0\x57\x32\x57\x95\x94\x60\x55\
+\xff\x80\x52\xcf\x5c\x7f\x63\x91\x63\xdd\xa3\x0a\xbe\x0e\x80\xbf\
+\xf0\x30\xd0\x00\xf0\x4c\x08\xa6\x32\xd1\x2f\x0d\x73\x40\xc1\x23\
+\x01\x4c\x16\x4c\x6e\x01\x60\x12\x04\x53\x39\xae\x0d\x04\x7c\x05\
+\xfd\x12\x0e\x71\x00\xc0\x34\x08\xa6\x32\xd1\x37\x40\xf0\x35\x00\
+\x4c\x36\xc4\x71\x04\x80\x67\xbb\x92\x36\xd7\x21\xcb\xb1\x80\xe0\
+\x25\x01\x38\x2d\xc1\xc2\x10\xe5\xe5\xab\xe2\x60\xa2\x81\xe0\xf9\
+\x13\x2c\xba\x29\xca\x0a\x43\x94\x64\x08\xa6\xca\xb1\x0e\x68\x25\
+\xcd\x0d\xe0\x47\x1e\x06\x1a\x00\x9e\x75\xa0\x92\xca\x44\xdf\x02\
+\xc1\x73\x03\xf8\x13\x0b\x03\x0d\x00\xcf\x3c\x50\x49\x95\x63\x69\
+\x20\x78\x21\x00\xae\x00\x60\x52\x04\x13\x99\xe8\xb7\x06\x0a\x9e\
+\x15\xc0\x1f\x59\xb4\x80\x01\xe0\xf9\x11\x4c\x64\xa2\x15\x04\x3c\
+\xa3\x7e\xc9\x96\x31\xec\x00\x60\xea\x69\x8e\x0a\x08\xe6\x6f\xa0\
+\x15\xd5\x32\x86\x23\x66\x38\xc8\xa7\x39\x68\x4c\xf4\xee\x25\x04\
+\x23\xc7\x4a\x00\xb0\xf8\xc1\xc1\x40\x63\x86\xe3\x3a\x08\xa6\x31\
+\xd1\x4f\x02\x08\xe6\x0e\xe0\x44\x03\x0d\x00\x5f\x07\xc1\x15\x10\
+\x0c\x00\x67\x30\xd0\x0f\x00\xf0\x75\xa6\x39\x88\x4c\xf4\x8b\x08\
+\x86\x82\x0b\x07\xf0\x16\x09\x56\x19\xad\x24\x9a\x89\x4a\x20\x78\
+\x26\xfd\x92\x01\xb8\x42\x0b\xa9\x90\x56\x52\x05\x04\x33\x36\xd0\
+\x54\x00\x3e\x02\xc0\xc5\x20\xf8\xa1\x4c\x04\x23\xc7\x2a\x18\xc0\
+\x89\x06\x1a\x3b\x51\xa6\x21\xf8\xc8\xc0\x44\xbf\x8c\x60\x28\xb8\
+\x5c\x00\x27\xea\xf7\x1d\x44\x79\xcd\x56\x52\x05\x04\x73\x4d\xa0\
+\x89\x00\x7c\x44\x0b\xa9\xa8\x56\xd2\x03\x10\xcc\xd3\x40\x13\x01\
+\x38\xd5\x40\xa3\x85\x74\x6d\x04\xff\x28\x12\xc1\x02\x00\x2e\x12\
+\xc0\x89\x23\x1c\x00\xf0\x88\xab\x62\x60\xa2\xdf\x0a\x28\x78\x9a\
+\x7e\x89\x00\x7c\x44\x0b\xa9\xb8\x56\x12\x89\x89\x56\x30\xd1\xd3\
+\x12\x68\x1a\x00\xa7\x1a\x68\xb4\x90\x32\xb4\x92\x48\x66\xa2\x81\
+\xe0\x89\x00\xfe\xc8\xc1\x40\x03\xc0\x59\x5a\x49\x24\x65\xf0\x01\
+\x08\x9e\x52\x00\x3f\x72\x30\xd0\x68\x21\x65\xca\xb1\x28\x4c\xf4\
+\x8b\xbb\x63\xad\x58\xc1\x2f\x1b\x68\x9a\x9d\xb0\xb6\x48\xb0\xca\
+\x6c\x25\x91\x98\xe8\x03\x4c\x34\x33\x00\xa7\x1a\x68\xb4\x90\x46\
+\x5f\xbf\x55\xe5\x9b\xe8\x1b\x03\x05\x8f\x06\xf0\x6b\x06\x23\x58\
+\x48\xb0\x32\xe6\x58\x14\x26\x7a\x23\x60\xa2\x47\x26\xd0\x9f\x39\
+\x14\xc0\x48\xb0\x32\xb6\x92\x28\x4c\x74\x0c\x82\x25\x0c\x74\x29\
+\x00\xde\x01\xc0\x39\xaf\x37\x0c\x4c\x34\x10\x3c\x4e\xbf\x34\x00\
+\xae\x90\x60\x15\x9d\x63\x11\x0c\x64\x6d\x81\xe0\x51\x06\x9a\xe4\
+\x3c\xe0\x23\x12\xac\xb2\x5b\x49\x14\x65\xf0\x07\xe4\x58\x23\xf4\
+\x2b\xfe\xc3\xa0\x83\x04\x00\x67\x1f\x89\x26\x28\x83\x77\x11\x77\
+\xab\x80\x81\x0e\xf7\x72\xff\xc1\xa0\x00\x46\x82\x95\x3f\xc7\x22\
+\x28\x83\x9f\x0c\x14\x9c\xaa\x5f\xf1\x07\x83\x02\x18\x09\x16\x45\
+\x8e\x45\x60\xa2\x63\x1c\xa3\x84\x81\xa6\x9e\xe1\x48\x2e\x80\xb1\
+\x8f\x0e\x49\x8e\x95\x5f\xc1\xb7\x40\x70\x22\x80\x29\x86\x28\x93\
+\x0b\x60\x24\x58\x34\xf3\x58\x04\x26\x7a\x83\x32\x38\xcd\x40\x7f\
+\x66\x50\x00\x23\xc1\x22\x9a\xc7\x22\xe8\x25\xc5\x4c\x73\xac\xc5\
+\x44\xc7\xe8\x97\x62\x86\xe3\x88\x04\x8b\x4d\x8e\x95\xdf\x44\x7f\
+\x10\x50\x70\x7c\x01\x2c\xbe\x70\x30\xd0\x48\xb0\xc8\x9a\xc1\xf9\
+\x7b\x49\x11\xdb\x63\xad\xc3\x44\x47\xe9\x97\xa0\x85\x04\x03\xcd\
+\x2a\xc7\xca\x5f\x06\xdf\x0a\x28\x38\xd6\x40\x0b\x82\x04\xab\x42\
+\x82\xc5\x2a\xc7\xca\x5f\x06\x1f\x60\xa2\x63\x01\xfc\xc8\xa0\x00\
+\x86\x81\x26\xce\xb1\xb2\x97\xc1\x51\x39\xd6\xd2\x15\xac\x0b\x4d\
+\xb0\xd2\x0b\x60\x24\x58\xf3\xe6\x58\xc7\xf2\xcb\xe0\x7b\xb1\x7a\
+\x05\x47\xe9\x97\xa0\x85\x94\x5e\x00\x57\xef\x20\x3a\xe2\x1c\x2b\
+\x7b\x19\xbc\x15\xab\x2f\x83\xe3\x3e\x81\x3b\x06\x05\x30\x12\xac\
+\xb9\xaf\xaa\xfc\x32\xf8\xe7\xda\x15\x1c\xf5\xf6\x09\xb6\x72\x4f\
+\xb7\x6f\x0f\x48\xb0\xe8\x9b\xc1\xf9\xcb\xe0\xc3\xba\x15\x1c\x67\
+\xa0\x1f\x19\xe8\x17\x09\xd6\x15\xae\x37\xe5\x2b\x38\x2e\xc7\x5a\
+\x6a\x19\x1c\xa7\xdf\xfc\x09\xd6\x88\x02\x18\x8b\x18\xca\x68\x06\
+\x67\x0f\xb2\x3e\x88\xf5\x2a\x38\x4e\xbf\xf9\x97\xf1\x8f\xd1\x2f\
+\x0c\x74\x21\xcd\xe0\xdc\x41\xd6\x4e\xaf\xd6\x44\x47\xbe\xf3\xfc\
+\x33\x58\x15\x0c\x34\xdf\x66\x70\xf6\x20\xeb\xd6\xac\x55\xc1\x71\
+\xef\x3b\xff\x2a\xc2\x23\x0c\x34\x6b\x13\x9d\xbb\x0c\xde\x88\x75\
+\x2a\x38\xf2\x6d\x67\x6f\x01\x6f\x61\xa0\x99\x9b\xe8\xcc\x65\x70\
+\x64\x33\x78\x69\x0a\x8e\x7c\xd3\xea\x8e\x41\x01\xfc\x3f\x08\xad\
+\x28\x13\x9d\xb9\xe8\xfa\x69\x56\x18\x64\xc5\xea\xf7\xbf\x0c\xf4\
+\x8b\x19\xca\xb2\x9a\xc1\xd9\xcb\xe0\x58\x13\xbd\x20\x05\xeb\x52\
+\x0d\xf4\x98\xdb\x05\x33\x94\x85\x4d\x54\xe6\x56\x70\xb4\x89\x96\
+\x6b\xd3\x6f\x76\x03\x3d\x26\xc0\xc2\x0c\x65\x71\x13\x95\xb9\x83\
+\xac\x27\xb3\x2e\x05\x47\xeb\x37\xf7\x0c\xe5\x16\x06\x7a\x21\x26\
+\xfa\xae\x4c\x13\xbd\x0c\x05\xc7\xea\x37\xfb\x0c\xe5\x0e\x06\x7a\
+\x31\x26\x3a\x6f\x90\x75\x63\x56\xa4\xe0\x68\xfd\xe6\x9e\xa1\x1c\
+\xa5\x5f\x18\xe8\x32\x4d\x74\x66\x05\x3f\xad\x47\xc1\xf1\xfa\xcd\
+\x6d\xa0\x2b\x18\xe8\x05\x99\xe8\xaa\x50\x13\xcd\xbe\x1d\x1c\xfd\
+\x46\x73\x27\xd0\x47\x18\xe8\x45\x99\xe8\xbc\x41\x56\x74\x12\xcd\
+\x5d\xc1\xf1\xef\xf3\x8e\x81\x7e\x61\xa0\x0b\x36\xd1\x79\x15\xfc\
+\xd3\xac\x42\xc1\xd1\x6f\x32\xf7\x08\xc7\x16\x06\x7a\x71\x26\xfa\
+\xae\x50\x13\x2d\xd6\xc0\xdf\xcc\x06\x7a\x54\x80\x05\x03\x5d\xb6\
+\x89\xce\x1b\x64\x25\x98\x68\xb1\x7c\xfd\x66\x36\xd0\xe3\xf4\x0b\
+\x03\x5d\xb8\x89\xce\xab\xe0\x5b\xb3\x74\x05\xc7\xbf\xbf\xdc\x8b\
+\x08\x2b\x18\xe8\xd2\x4d\xf4\xb1\xfc\x28\xfa\x43\x02\xa0\xe4\xb2\
+\xf9\xfb\x6f\x06\x01\x16\x0c\x34\x03\x13\x9d\x35\xc8\xda\x1d\x96\
+\xac\x60\x9d\xf0\xe6\x1e\x7f\x30\xd0\x2f\x0c\x74\xde\xeb\x9f\xe5\
+\x2b\xf8\xc6\x2c\x57\xc1\x29\xfa\xcd\x3c\x82\xb5\x85\x81\x5e\xb0\
+\x89\xce\xaa\xe0\x27\xb1\x54\x05\xa7\xe8\x57\xe4\x1d\xc1\x1a\x17\
+\x60\xc1\x40\x33\x31\xd1\x79\x9b\x49\x9b\x85\x2a\x38\x49\xbf\x9f\
+\x39\xe8\x17\xbb\x70\x70\x31\xd1\x59\xa3\xe8\x94\x5e\x12\x23\x05\
+\x27\xe9\x37\x6f\x07\x69\xa4\x7e\x61\xa0\x29\xae\x63\xf9\x0a\x4e\
+\x2a\x83\xb9\xb4\x93\x92\xde\x52\xe6\x02\x78\xdc\xf3\x8a\xc7\x9f\
+\x00\x00\x10\xf7\x49\x44\x41\x54\x2d\x81\x6d\xec\x48\xae\xdf\xaa\
+\xf2\x15\xfc\x41\x2c\x4e\xc1\x69\xef\x28\xef\x3e\xee\x23\x9f\xe9\
+\xdf\x21\x26\x92\xeb\xcd\x48\x05\x17\x5b\x06\x73\x50\x70\xda\xfb\
+\xf9\xcc\x41\xbf\xd8\x07\x9a\x99\x89\x7e\x28\xb6\x0c\x2e\xbf\x10\
+\x4e\x7c\x3b\x77\x0c\xf4\x8b\x93\x08\xe9\x7a\x49\x55\xf9\x0a\x4e\
+\x2c\x83\xcb\x56\x70\x5a\x7c\x95\xb9\x00\x1e\xcb\x5f\x18\x68\x76\
+\xbd\xa4\xac\x0a\xfe\x99\xa8\x60\xb1\x18\xfd\x8a\xac\x6b\x08\xb7\
+\x23\xef\x05\x8c\x60\x31\xec\x25\x65\x55\xf0\xef\x4b\x71\xd1\x89\
+\xef\x23\xef\x08\xf4\xae\x42\x07\x69\x3d\x03\x59\x59\x07\x3a\x92\
+\x86\xa2\x03\x09\xff\xbd\x80\xbf\xc7\xea\x37\xeb\x08\xf4\x58\xfd\
+\x62\x04\x8b\x69\x2f\x29\xa7\x82\x53\x83\xac\x22\x21\xac\x93\xdf\
+\xc4\x1d\x07\xfd\x62\x04\x8b\x6b\x2f\x29\x67\x3b\x38\x35\xc8\x2a\
+\xb0\x10\x4e\xd6\x6f\xd6\x00\x6b\xb4\x7e\xd1\x41\x62\xdb\x4b\xca\
+\xaa\xe0\x7f\x31\x57\x70\x3a\x7e\xb3\x4e\x70\x8c\xd6\x2f\x3a\x48\
+\x8c\x7b\x49\x59\x15\xfc\x7b\xba\x02\x04\x6b\xfd\x66\x0d\xb0\x46\
+\xdf\x01\xe8\x20\x71\xee\x25\x65\x55\xf0\x86\xb1\x82\x47\xbc\xf4\
+\x47\x16\xfa\x45\x01\xcc\xbb\x97\x94\x53\xc1\xdb\x83\x60\x2a\xe1\
+\x11\xf8\x15\x32\x67\x80\x35\xba\x86\x42\x07\x89\x7d\x19\x9c\x71\
+\x2c\xfa\x46\xf0\x54\xf0\xa8\x97\xfd\x9a\x85\x7e\x51\x00\xf3\x2f\
+\x83\x33\x32\xf8\x39\x8a\xd6\x11\x7f\xc9\x82\x24\xec\xe3\x57\xc6\
+\xbd\x01\xc5\x42\xbf\x28\x80\x17\x51\x06\x67\x64\x70\xfc\x4c\xe5\
+\x49\x05\x45\x28\x38\x50\x6e\xe4\xf5\x27\x0b\xfd\x62\x84\x72\x19\
+\x65\x70\x46\x06\x27\x45\xd1\xf2\xf9\x2f\x52\x09\xeb\x51\xf6\x39\
+\x6b\x03\x69\xbc\x7e\x51\x00\x2f\xa5\x0c\xce\xc8\xe0\x4d\x9c\x72\
+\xfb\x44\xa6\x94\xaf\x87\x5e\x5d\x56\x03\x69\xc2\xff\x75\x14\xc0\
+\x8b\x29\x83\x33\x32\x78\xf3\x62\x1d\x29\x87\xe5\x2c\x89\xc3\x2b\
+\xe9\xc8\xf7\xc2\x4b\xd7\x79\x97\xf0\x4f\xd0\x2f\x0a\xe0\x05\x95\
+\xc1\xf9\x18\x1c\xb9\xae\xa1\x83\x9e\xfc\x3f\x7b\xe7\xb3\xdb\xb6\
+\xb5\xc4\xe1\x65\x56\x5d\x08\x28\x90\x1a\x45\xde\xe1\x02\xbe\x40\
+\x56\x59\x04\x10\xe0\x95\xde\x25\x41\x0b\x68\xa5\x45\x77\x1c\x68\
+\xe5\xdd\x18\x41\xdf\x43\x81\x9f\x22\xb8\x02\xb4\xe2\xbb\x5c\xeb\
+\x0f\xcf\x99\x21\x29\xdb\x89\xc9\x43\x1e\xf2\xfb\x5a\x18\xa9\xed\
+\xb8\xb2\xa4\x1f\x67\xe6\x37\x33\x87\x43\x95\xc2\x3e\xe2\x8a\x79\
+\x28\x2f\xc4\x60\xd9\x67\xa1\x5f\x0a\xe0\x49\x95\xc1\xe9\x14\x7c\
+\xf7\x0b\x25\xb0\x26\x97\xb0\x16\x6d\x49\xb3\x8c\x6c\x83\xe1\x0d\
+\xfa\xa5\x00\x9e\x58\x19\x9c\x4e\xc1\x9f\x5f\x2c\x80\xf5\x6a\x59\
+\x2c\xa9\xad\x67\xa9\xc7\x5c\x19\x51\x03\xf8\x2d\x2f\x37\x05\xf0\
+\xd4\xca\xe0\xa4\x0a\x3e\xa9\xf4\xca\x87\x46\x96\x2a\x4e\x39\x83\
+\x59\xcf\x3e\x28\x5f\x7b\xf0\x99\xe8\x97\x02\x78\x7a\x65\x70\x42\
+\x05\xef\x5e\x53\x04\xb7\x38\xc0\x29\xa2\x70\x7b\x2b\x3a\x3e\x9c\
+\x67\xdb\xc1\xdb\x4c\xf4\xcb\x08\xf4\x58\xf9\xb4\xce\xc1\x8b\x7e\
+\xdd\x76\xb0\x49\xa6\x6b\x99\xac\x24\x72\x9e\x6d\x1a\xfd\x9a\x16\
+\xd2\xf6\x43\x1e\xfa\xa5\x00\x9e\x66\x19\x9c\x4e\xc1\x3f\x76\x51\
+\x10\x8d\x0f\xda\x50\x8b\xa6\x99\x90\xd6\xc6\xa5\x43\xe2\xf5\xc3\
+\xf7\xb7\xa4\xe5\x43\xb1\xfd\x37\x13\xfd\x52\x00\x8f\xb8\x0c\xce\
+\x43\xc1\xc7\xa1\x4a\xbd\xa6\xe1\x36\xab\x48\x5c\x27\xa7\x8f\x30\
+\xac\xc5\xcf\x0d\x99\xd4\xe4\xab\xc5\x36\xe1\x00\xe5\x5b\x5e\xe4\
+\xf5\x17\x64\x32\x55\x23\x2b\x9d\x82\x9f\x3b\xa1\x43\xdc\x1f\xe5\
+\xaa\x95\x24\xbd\xa4\xce\x62\x8d\xaa\x96\xe0\x2f\x57\x9c\xe8\x6c\
+\xf4\x8b\x81\x35\x61\x23\x2b\xb1\x82\x5b\x33\xd1\xa8\x54\x69\x73\
+\xb6\xb4\xf3\x11\xcb\x7a\x6e\xac\x2d\x17\x0d\x97\x52\x87\x1c\xdb\
+\x3c\xa0\x84\xfa\x5d\xbd\xe9\x15\x66\x82\x63\xca\xf3\x1c\x03\xc5\
+\xe0\x56\x0d\x57\x63\x8b\xf5\x98\x27\x9d\x8e\x49\x5f\x89\xef\xe2\
+\xfe\xa0\x2d\xb2\xf6\xd7\x93\x6c\xf4\x8b\x81\x35\x71\x23\x6b\xfd\
+\x77\x5a\x05\x4b\x6b\x07\x49\x9e\x9f\xef\x90\x8e\x92\xe9\x5f\x59\
+\xab\x68\xed\x79\xe5\xa3\x5f\x0c\xac\xa9\x1b\x59\x69\x15\xac\x2d\
+\xf1\x57\x7c\xb5\xa9\x8d\x11\x69\xbd\x04\x66\xa7\x35\xf9\xf5\xbc\
+\xf9\xb2\x9e\x20\xee\xda\x20\x2d\x76\xf8\xb9\x26\x97\x5a\x0e\x9d\
+\x51\xfc\xa5\x00\x9e\x41\x19\x9c\xee\xae\x2b\xe7\x18\xdc\x62\x44\
+\x6b\x48\x9b\xc5\xac\x12\x48\x23\x2a\xca\x2f\xad\x1d\xaa\x2f\xa3\
+\xa5\x96\xb7\xfb\xab\x86\x56\x53\xd9\x6a\x46\x38\xd4\xb7\xa7\x13\
+\xf6\x8f\xde\xa8\x5f\x26\x38\x66\x30\xcf\x91\x50\xc1\x97\x7e\x70\
+\xbb\x8d\x75\xdd\xb9\x32\x91\x52\x25\x86\xca\xf8\x0d\x7a\x45\xb8\
+\xfa\x42\x42\xac\x5e\xc6\xcf\x0d\x5d\x5d\x4a\xe2\x63\xd8\x4e\xa8\
+\xdf\xbb\x35\x06\x16\x46\xd6\x88\x14\xfc\xb9\x6e\x62\x5d\xd2\x63\
+\xad\x65\xcc\x31\x0e\x4b\x5b\xe8\x95\xab\xf2\x7f\x61\xdd\xa9\x88\
+\x79\xb2\x46\xd7\xec\x99\x3a\x58\x5b\x54\x9d\x6e\xfe\xea\xb0\xc6\
+\xc0\xc2\xc8\x1a\xd5\x60\xf4\xe7\xa2\x5e\x07\xb7\x0f\x41\xab\xad\
+\x7a\xc5\xd5\xa8\xaf\x3f\x2a\x23\x66\xe1\xe2\x0c\x67\x69\x84\x7b\
+\xb1\xa1\x5f\xc2\x3f\x26\xed\x8e\xb6\xda\xef\xd9\xe8\x17\x03\x6b\
+\x36\x46\x56\xba\x76\xd2\xe7\xed\x95\xe4\xb4\x52\x57\xc3\x94\x16\
+\x37\xe4\x68\x74\x65\xca\xd5\x57\x58\xcb\x52\x34\x96\xf4\xa5\xf9\
+\xc3\x5f\xf0\xa0\x35\x23\xfd\xae\xbf\x20\x8b\x9c\x14\xbc\xce\x44\
+\xc1\xa7\x03\xdf\xb5\xb6\x50\x28\x2e\x31\x8e\x76\xb0\x4a\xfd\x9c\
+\x8c\xd6\xf9\x69\x09\x8d\x27\x0d\x3f\xfa\xf2\x97\xf5\xfa\x95\xa0\
+\x6d\x7b\xd1\x65\x02\x62\xae\x18\x97\xcf\x7e\x4f\xb7\xbf\xff\xd6\
+\x17\x14\x03\x7a\x56\x56\x74\x3a\x05\xaf\xfe\x7c\x79\x01\xd7\x8b\
+\xb3\xa5\xe0\x6d\x44\x4b\xad\xd7\xd6\x62\x1b\x50\xe2\x32\x66\x6d\
+\x1b\xe3\x90\x46\xe5\xdb\x52\x1d\xa7\xd3\xef\xea\xad\x2f\x27\x06\
+\xf4\xcc\xac\xe8\x84\x0d\xe1\x3f\x2e\x41\xf2\xd2\x62\x3d\x57\x98\
+\x6a\x6a\x55\x95\xd3\x37\x68\x9c\xe8\xb8\x14\xa1\x72\xfe\x52\x68\
+\xdc\x5e\xfe\xdb\x28\xb0\xc5\xc4\x3e\x7f\xf1\x1c\x8f\xc5\xb9\xce\
+\x12\x5c\x6d\x2d\x8a\xf0\xb3\x5b\x42\xf0\xf9\x3b\x13\x9e\x3f\xf9\
+\x66\xfd\x72\x1b\xd1\xd9\x59\xd1\x69\x1b\xc2\xd2\x9c\xe5\x08\xa1\
+\x53\xbd\xf8\x5a\x36\x0d\xc4\x0d\x70\x69\x6c\x1c\x6b\x48\xa5\x83\
+\xda\xdd\x98\x66\xf5\x1d\x72\x35\xe2\x7b\x17\xcb\xc6\xe5\x6d\x46\
+\xfa\xc5\x80\x9e\xa3\x15\x9d\x76\xa4\x43\x83\xd7\x2c\x75\xdb\xd9\
+\xce\x5e\xc5\xb0\x1c\x26\x3e\x8c\x6d\x1c\x46\xa4\x62\x41\x2d\xb5\
+\x41\x4c\xb1\xd3\x56\xee\x9c\x80\xe2\x3c\x8f\x25\x21\xdf\x56\xb3\
+\xc6\x28\xf5\x2a\x38\xe1\xf8\xd5\xdb\x5f\x48\x0c\xe8\x59\x5a\xd1\
+\xc9\x1b\xc2\x7e\x10\x4a\x2f\x03\x50\x17\x41\x8b\x15\xa2\xd6\xa7\
+\xb3\xaa\x14\x5c\xaf\x9c\x42\xa7\x12\xbe\xc5\x18\x62\x56\xaa\xb5\
+\xbf\xa7\xe1\x07\xab\x59\xaa\x88\xd5\xf3\x87\x7c\xf4\x8b\x01\x3d\
+\x57\x2b\x3a\xa9\x19\x2d\x66\x14\xd9\x56\x9e\xbe\x03\x2c\x41\xd7\
+\x6a\xdd\x2a\x3f\x0e\x19\x0e\x5b\x0f\x85\xb2\x31\xc0\x42\x08\x16\
+\x23\x55\x0d\xd6\xb5\xb8\xe3\x03\xb4\x68\xef\x50\x67\x64\x3f\x63\
+\x40\xcf\xd8\x8a\x4e\x68\x46\xff\x11\xa2\xa7\x4a\x08\x99\x62\xd3\
+\x57\x69\xee\xfa\x69\x2c\x92\x25\x4a\xf6\x8a\xa7\xad\xb5\x5c\x38\
+\x0e\x42\x8b\x5b\x72\x12\xfb\xe3\xe3\x63\x30\x06\x57\xf1\xcf\x3e\
+\x9b\xf2\x17\x03\x7a\xd6\x56\x74\x72\x2b\xab\xd9\x24\xb2\x76\x71\
+\x10\x6b\xad\x1f\xab\x6d\xcb\x45\x52\x98\xac\x3b\x1a\xce\xa1\xdb\
+\xac\xa6\x28\x16\xf7\x69\xb5\x85\xb6\x75\xcf\xce\x8f\x26\x9f\xed\
+\x23\x26\xa0\x51\x70\xc2\xdd\x86\xad\x89\x85\x2e\x0b\xb6\xfd\x5a\
+\xdb\x28\x8a\xf9\xb3\x86\xfe\x4e\xed\x2c\xcb\xaa\xb9\x64\x4d\xab\
+\xaa\x4f\xa5\xf6\x3a\xa0\x76\xef\x38\xee\x32\x68\x6c\x53\x85\x24\
+\x20\xa7\xf2\x17\x03\x7a\xee\xcd\xa4\x94\x85\xf0\x9f\x6e\x50\x59\
+\x8b\xe6\x5a\x83\x5a\x5b\xba\x08\x6b\xbc\xae\xf9\xa4\x31\xdc\x5a\
+\xf3\xb9\x72\xc1\xcc\xfc\xa4\xfa\x69\xac\xaa\x1d\xad\x51\xec\x26\
+\x62\x4b\xf2\xe9\x8d\x4e\xf4\x8b\x01\x3d\xf7\x66\xd2\x20\x07\xed\
+\xd8\x63\x28\xc5\x77\x7f\xd4\x36\x81\xae\x4e\x4a\xc5\xa4\x5b\xec\
+\xce\xaf\x46\x7b\xdb\xfc\x8f\xb4\x36\x67\x69\x37\x95\xc4\xec\x2f\
+\x1c\x97\x07\xef\x73\x4a\x9f\xd1\x2f\xcd\xa4\xf4\x69\xb4\xba\x82\
+\x55\xea\x07\x34\x5f\xc6\xa4\x82\x6d\x65\x4f\xcf\x32\xce\x57\x63\
+\xbc\x52\x7c\x5c\x97\x96\xb3\x9e\xc5\x2c\xf8\x4b\x4c\x9f\xed\xf5\
+\xe2\x43\x56\xfa\xe5\x26\x48\x28\x38\xb1\x82\xef\xfe\x70\xed\x1a\
+\x35\x8d\xa3\x30\x92\x21\x6d\xb3\x52\xad\xeb\x88\xe6\xc6\xbd\x12\
+\x07\x28\x6d\xf7\x29\xde\xde\xd7\x0e\x78\x48\xed\x60\xf9\xea\x2a\
+\x21\x59\xa5\xcf\x34\x90\x68\x07\x0f\x94\x46\x6b\x08\x92\xf5\x33\
+\xa9\x0a\x33\x25\xed\xa7\x3b\xaa\x4f\x34\xb6\x13\xb4\xae\x7b\x97\
+\x70\xab\xdf\x63\x14\x77\x32\xb4\x98\x40\x9d\xf6\xec\xf6\x4e\xf4\
+\x4b\x03\x89\x76\xf0\x10\x41\xf8\x9b\x59\x23\x0c\x72\xd5\xca\x6d\
+\x76\xc7\x68\x58\xc3\xda\x95\xb8\x61\xb7\x41\xfc\xa8\xa4\xd9\x42\
+\xd4\xcb\x57\xcd\x94\xb4\x44\x7f\x5b\xed\xb6\xf1\xe9\xcb\xdf\x7f\
+\xcf\x2b\x7d\x46\xbf\x28\x78\x18\x05\xaf\x6e\x76\x66\x47\xa1\x65\
+\x73\x41\x9c\x33\x5c\x0d\x43\x4a\xe1\xe7\x1d\x83\x2b\x1d\x05\xaa\
+\x55\x5d\x2d\xf5\x6e\x53\xf4\xa9\x6b\x86\x56\x75\x71\x48\xe8\x5e\
+\x75\x13\x7e\xd1\x2f\xed\xe0\xe1\x6e\x60\xf8\xcd\xe8\xd7\x8c\x57\
+\xc6\xbe\x70\x1c\x76\x14\xb7\x8f\x20\x56\x75\xfe\x74\x0e\x15\x33\
+\x5f\x55\x98\x2e\x94\xcd\xbb\x4d\xdc\xd7\xea\x3c\x80\xd3\xec\xe4\
+\x87\xdc\xf4\x4b\x03\x98\x76\x70\x83\x32\xd9\x9b\xf8\x12\x84\xab\
+\x96\x8f\xef\x14\xa9\xf8\x38\x1a\xbc\x2a\x13\x40\x35\x98\xcd\x12\
+\xe7\xa1\xc5\x4c\x5c\xab\xf8\x56\x73\x95\x31\xab\xf8\x23\x6e\x4f\
+\xab\x47\xf7\xfb\xcc\xd2\x67\xf4\x4b\x3b\x78\xd0\x34\xfa\x54\x09\
+\x4b\xe3\xa8\x48\x23\x45\x93\xf8\x16\x6e\xf3\xd7\xda\xd4\xd2\x3c\
+\x03\x5a\xdc\xad\x1d\xc4\x4e\x44\x8b\x5f\x1b\x0c\x93\x59\x09\xab\
+\xdf\x65\x57\x2f\x14\x0d\x24\x14\x3c\x6c\x1a\xbd\xfc\xba\xf5\xd1\
+\x56\x7c\xc9\x6b\x1c\x2a\xb5\xb9\xb3\x04\x6f\x4b\xdc\x5f\xad\x8d\
+\x3e\x17\x66\xc1\x5f\xac\x67\xa6\xf5\xdd\xc1\xe2\xfd\x12\xfd\xc2\
+\x64\x14\x9c\x2e\x8d\xbe\x7b\xca\xa3\xb5\x70\x35\xaf\x5b\x50\xb0\
+\xc3\x16\xbe\x1a\x76\xf7\xe8\x96\xc2\xec\x1e\x49\xfd\xcc\x2b\x15\
+\xd7\x62\x92\xfa\xd9\x01\xdb\x7f\xd2\xf5\x7e\xbb\x4a\x9f\xd1\xef\
+\x24\xdb\xc1\x5d\x29\x78\x93\x2e\x08\xff\xf8\x16\x1b\x46\xee\xa6\
+\x2b\xe2\x16\x82\xe3\xca\x6f\x08\xc1\xe1\x5b\xd4\x4d\x5f\xb9\xa5\
+\x62\x5b\x44\x5b\x27\xcb\xf6\x83\x53\x9a\x57\x5d\x85\x5f\x06\xb0\
+\x50\xf0\x58\xd2\xe8\x63\x1e\x2d\x45\xad\x14\x8e\x3b\xf8\x2a\xb6\
+\x50\x76\x1a\xf4\x6b\x0f\xea\x5a\x48\x45\xad\x56\xb6\x73\x1d\x62\
+\xcf\xaf\xdd\xa5\xcc\x9e\xbb\x0a\xbf\xeb\xf5\x17\xde\xec\x28\x78\
+\x24\x5e\xd6\xa5\x14\x96\x70\xba\x46\xcb\x41\x93\xde\xa3\xae\xe2\
+\xaa\x4a\x98\xbe\xac\x5d\x02\xc4\x1e\xcc\xa1\x61\xe6\xda\xcd\x60\
+\x1f\x3f\xec\x12\x7a\xcf\x1d\x86\x5f\x06\x28\x51\xf0\xa8\x82\xb0\
+\x99\xeb\x88\x5b\x80\x22\xc7\x7f\x8f\xb2\x53\x31\xa3\x97\xd5\x88\
+\x87\x4a\x6d\x40\xd2\x1c\x4e\x6b\x87\xa3\xed\x31\x1d\x61\x1f\xe2\
+\x7c\x05\xd8\xde\xff\x9d\x32\xfc\xa2\x5f\x78\x85\x82\x3b\x7b\x97\
+\x24\x0d\xc2\x77\x37\x8f\x36\x65\xae\x1f\xbd\x2e\xb5\x9b\x29\x48\
+\x61\x4c\x66\x2d\xc4\x9f\xb0\x61\x73\x6b\x31\x5f\xf7\x77\x30\x4d\
+\x2b\xdf\x0e\xd3\x67\x06\xb0\x26\xcd\xbb\xee\xde\x28\x29\x83\xf0\
+\x59\xc2\x26\x43\x16\x37\xa5\x71\x2e\x6d\xc5\x8c\x4c\xaa\x38\x3b\
+\xda\x1e\xfd\x7e\x8a\xde\x1a\x57\x8c\xc4\xdf\x1c\xe9\xf4\x37\x13\
+\xcb\xb7\xc3\xf4\x19\xfd\x4e\x9c\xdf\x3a\x54\x70\xd2\x37\xf9\x39\
+\x0a\xdb\xa5\x5e\x89\x41\xd7\xad\x2c\x49\x2d\x9f\x0e\xd5\xf3\x45\
+\xac\x66\x51\xbf\x0a\xd2\xe1\xae\x0c\x27\x1e\x13\xcb\xb7\xc3\xf0\
+\x8b\x7e\x51\xf0\x58\x83\xf0\xf2\x6e\xb1\xbd\xe8\x56\xed\x4d\x57\
+\xc4\x99\x50\xfe\xfe\x67\x8d\x49\xac\xd0\x22\x72\xf6\xb5\x5b\x2e\
+\xdc\x2d\x12\xcb\xf7\x80\x7e\xe1\x27\xf8\xd4\xa5\x82\x37\x49\xdf\
+\xeb\xcb\xaf\xba\x6b\x74\x6a\xdd\xea\x61\xa5\xea\x28\x66\xbd\x18\
+\x5d\x71\xe2\xd2\x0c\x83\x5c\x22\x70\xbc\xab\xd2\xf6\xfb\xfb\x7d\
+\xda\x5f\xa9\x5c\xa3\x5f\x18\x4e\xc1\xeb\xc4\xef\xf7\x1f\xc7\x4c\
+\x5a\xe2\x5c\x73\x94\xa6\xb8\xe9\xc8\xa2\x68\xde\x06\x3c\xde\xe8\
+\xc1\x9e\x87\x67\x0c\xb1\xed\xfd\x87\xb4\xbf\x4d\xb7\xe1\x17\xfd\
+\xa2\xe0\xf1\x07\xe1\xe5\xaa\x0a\xc3\xf5\xc9\x0e\x71\x0b\x0f\x95\
+\xb2\xc3\x7f\xa8\xb8\xa1\xab\xb8\x09\x71\x09\xcd\xdb\xef\x89\x73\
+\xe7\xae\xc3\x2f\x27\x40\xa3\xe0\x2c\x82\xf0\x72\x79\xb8\xd9\xee\
+\x8a\x58\xf4\x6a\xe5\x3b\x37\x22\xb0\x3d\x75\xd6\xdf\xe4\x3b\xae\
+\x35\xc9\x65\x68\x23\xf5\x85\xa8\x5b\xf3\xea\x08\x6f\x6c\x14\x9c\
+\x47\x10\xae\x34\x5c\x5f\xd5\x37\x1b\x86\x66\xef\x30\x46\xe4\x6a\
+\x4f\x5f\x7c\x86\xbd\xdd\xdd\xbf\x5f\x0e\xf0\x2b\xa0\x5f\x18\x89\
+\x82\x13\xae\x28\x45\xd6\x37\xdb\x47\x73\xc4\x86\x16\xc6\xac\x72\
+\x1d\xa5\xe6\xd9\xb2\xa6\x65\xfc\xa4\xde\xf5\x00\x0f\xbe\xf3\xf0\
+\x4b\xfe\x8c\x82\xf3\xca\xa3\x4f\x41\xec\xeb\x39\x10\x6b\xe1\xee\
+\xa9\x72\xd2\xb1\xef\x34\x85\x10\x6c\x93\xec\xed\xa3\x2c\x36\xcb\
+\x41\xe4\xdb\x75\xf8\x25\xfe\xa2\xe0\x7c\xb6\x0c\x7d\x24\x5b\x3c\
+\x6c\x77\x2e\x77\xbe\xe6\x42\xbb\x2d\xa4\xed\xee\x61\x31\x48\xe8\
+\xed\x23\x7b\x46\xbf\x28\x38\xcf\x52\xb8\x12\xc4\xe2\x46\x1f\x77\
+\xfe\xdc\x9d\x73\xc0\xf5\x9e\xb4\x54\x81\xf7\x7e\x31\xdc\x83\xed\
+\x3c\x7b\x46\xbf\x28\x38\xe7\x3c\x3a\xe6\xd3\x8b\x07\xdd\x3e\x3e\
+\xb6\xd4\xbc\x21\x65\xde\xc9\xc3\xe2\xfd\x66\xc8\x47\xd9\x43\xf6\
+\x4c\xff\x17\x05\x67\x9e\x47\x7b\x7d\x2c\x16\x8b\x9b\x87\x63\xf4\
+\x7d\x3c\x71\xd4\xf1\xc3\xfd\xd3\x27\x47\xf0\xe8\xfa\xc8\x9e\xd1\
+\x2f\x0a\x9e\x44\x1e\x9d\x03\xe5\x1a\xfd\x42\x77\xfc\xb6\x46\xc2\
+\x79\x17\xbf\xe8\x17\x05\x77\x4f\x89\x56\x53\xc9\x17\xfd\xce\x9c\
+\x77\x6b\x24\x9c\xab\x77\x85\x7e\xa1\xd3\x73\xb2\xc6\x63\x48\xcf\
+\x45\xbe\xe8\x17\x7a\x53\x30\x12\xee\xd5\x7a\x46\xbf\xd0\xb7\x82\
+\x37\x48\xb8\xcf\xe8\xcb\xf9\x93\xd0\xb3\x82\x91\x70\x9f\xf2\xe5\
+\xfe\x29\xd0\xbb\x82\xe7\x9e\x48\xf7\x27\x5f\xf4\x0b\x86\x1e\x15\
+\x3c\x63\x09\xf7\x28\x5f\xf4\x0b\x8e\x4f\x3d\x2a\x78\xa6\x4d\xa5\
+\x3e\xe5\x8b\x7e\x21\xa5\x82\x67\x28\xe1\x55\xaf\xcf\xe7\x81\x37\
+\x2c\x24\x55\xf0\xcc\x24\x5c\xf6\xfb\x64\xd2\x3e\x82\x26\xef\xfa\
+\x7d\xd3\xcd\xc7\x92\xee\x35\x77\x46\xbf\x30\x84\x19\x3d\x9f\x30\
+\xdc\xbb\x7c\xd1\x2f\x0c\xa6\xe0\xc9\x87\xe1\xb2\xff\x67\xf0\x0b\
+\x6f\x54\xb8\xc6\x7a\x8d\x84\xc7\x1c\x7c\xb1\x9f\x61\x50\x2b\x6b\
+\xca\x99\x74\x99\xe2\xa9\x43\xbf\x30\x02\x05\x4f\x4f\xc3\x29\x82\
+\x2f\xed\x23\x18\x8f\x82\x27\x95\x4a\x97\x89\x9e\x33\xec\x2b\x18\
+\x85\x95\x35\xa9\x30\x5c\x26\x7b\xbe\xd0\x2f\x8c\x4b\xc1\xeb\x4d\
+\x89\x7a\x29\x7f\x21\xd7\x34\x3a\xf3\x38\xbc\x3a\x24\x7c\x9a\xd0\
+\x2f\x8c\x54\xc1\x79\x6a\xb8\x3c\x24\x7d\x8a\x48\x9f\x61\xa4\x69\
+\x74\x8e\x1a\x2e\x53\x3f\x3d\xe8\x17\x46\xae\xe0\x27\x0d\xe7\xe1\
+\x4b\xaf\xca\xe4\xcf\x0c\xe9\x33\x8c\x3e\x8d\xce\xc3\xd4\x5a\x1d\
+\x86\x78\x56\xd0\x2f\x64\xa2\xe0\x51\x07\xe2\x72\x98\x27\x84\xf4\
+\x19\xb2\x49\xa3\xab\x40\xbc\x9f\x7d\xd5\x8b\x7e\x21\x5f\x05\x8f\
+\x2a\x12\xaf\xca\x01\x9f\x06\xd2\x67\xc8\x30\x8d\x1e\x4d\x4d\xbc\
+\x2a\x87\x7d\x02\x4a\xf4\x0b\x6f\xe2\xdd\x61\xbd\x1e\x5a\xc4\xfb\
+\xf9\x05\x5e\xd2\x67\x98\x42\x1a\x6d\x42\x51\x39\x33\xed\x92\x3e\
+\xc3\x34\xd2\x68\xa7\xe2\x7d\xef\xd2\x2d\xc7\xf3\xdb\xa2\x5f\x98\
+\x48\x1a\x5d\xd7\x71\x0f\xe1\xb8\x2c\x47\xf6\x5b\x92\x3e\xc3\xc4\
+\xd2\xe8\x5a\x82\xb9\xe9\x22\x20\xef\xcb\xd1\x29\x97\xf4\x19\x26\
+\x9c\x46\xb7\x70\x78\x12\x61\xb9\xdf\xff\x9c\x6a\x47\x94\x2b\xb7\
+\xfd\x4a\xe8\x17\xa6\x1f\x84\xdb\xdf\xfb\x4f\x94\x0d\x8e\x9f\xcd\
+\xe6\x57\xd8\x90\x3e\xc3\xbc\x82\xf0\xa4\x20\x7d\x86\x3e\xf8\x78\
+\x40\x5b\xb8\x57\x90\x71\x1a\x5d\xa2\x2e\xc2\x2f\x90\x46\x03\xe1\
+\x17\xf0\xb2\x26\x18\x7e\xff\xe2\x2d\x06\x04\xe1\x5c\xa1\x79\x04\
+\x04\x61\xc2\x2f\x00\x41\x98\xea\x17\x08\xc2\x40\xf8\x85\x51\x06\
+\x61\x24\x4c\xf8\x85\x9c\x83\x30\x3d\x61\x7a\xbf\x40\x10\x06\xc2\
+\x2f\x0c\xc4\x7f\xd1\x5e\x07\xb0\xb7\x0f\x98\x59\x98\x57\x00\xe4\
+\xd1\x64\xcf\x30\xb7\x20\xbc\x41\x85\x64\xcf\x40\x1e\x4d\xf6\x0c\
+\x30\x0c\x2c\x0a\x93\x3d\x43\xde\xa5\x30\x7a\x24\x7b\x86\x9c\xf3\
+\x68\xe6\x3a\x98\xdc\x00\x4a\x61\x8a\x5f\x80\x81\xb8\x45\xc2\xaf\
+\x92\x2f\xc5\x2f\x8c\xb5\x14\x46\xc2\x2f\x7b\x57\x64\xcf\x80\x84\
+\x73\x85\x33\x37\x00\x43\x1a\xeb\x19\xa0\x3f\x37\x0b\x09\x23\x5f\
+\xc8\x5a\xc2\x8c\x57\x22\x5f\x20\x0a\x23\x5f\x00\x24\x8c\x7c\x01\
+\x90\x30\xf2\x85\xd9\x49\x98\xa6\x12\x8d\x23\xc8\x99\x99\x4b\x78\
+\xf3\x3f\xe4\x0b\x79\x33\xe3\x5d\x43\x86\x26\x61\x12\x99\xf4\x3c\
+\x37\x95\x4a\x56\x16\x00\x3f\x2b\x5b\xf9\xde\xf2\xb2\x03\x7e\x16\
+\xa5\x2f\xc0\x38\xb8\x2d\xc9\x9d\x01\x08\xc3\xe3\x0e\xbe\x77\x04\
+\x5f\x20\x0c\x53\xf9\x02\x10\x86\xd3\x06\x5f\x66\x36\x60\x1e\x1a\
+\xde\x1c\x08\xbe\x00\xa4\xd2\xe3\xf1\xad\x08\xbe\x80\x86\x69\x1a\
+\x01\xe4\x54\x0e\xe7\xaf\xe1\x12\xf5\xc2\x9c\x35\xfc\xb1\x24\xf6\
+\x02\xa0\x61\x62\x2f\xc0\x60\xf5\x70\x6e\xbe\x34\xae\x15\x80\xd7\
+\xf0\xa7\x55\x36\xfd\x5e\x3a\x46\x00\x79\x06\x62\x42\x2f\xc0\x73\
+\x15\xf1\xa7\xf2\x30\xde\xaa\x97\xd0\x0b\xf0\x1a\x5b\x6b\x74\x22\
+\xde\x23\x5e\x80\x9f\xc8\xa6\x3f\xee\xc7\x22\xe2\x0d\x91\x17\xe0\
+\x17\x8d\xad\x81\x55\x5c\xae\x6e\xa9\x79\x01\xde\x20\xe2\xdb\x72\
+\x18\x15\x3f\x69\x97\xc0\x0b\xd0\x49\x55\x7c\xbb\x59\xa6\x1b\xf7\
+\xd8\xec\x4b\xb4\x0b\xd0\x7d\x30\xee\x5b\xc6\x48\x17\xa0\xf7\x68\
+\x7c\xfb\xa4\xb3\xae\xf3\xe5\xe5\xea\x80\x74\x01\x52\xc6\xe3\x27\
+\x21\xbf\x31\x22\x6f\xf6\xab\xf2\x2f\x84\x0b\x30\x6c\x48\xbe\xfd\
+\xb8\x29\xf7\xcb\x57\xa9\xb9\x5c\x2e\x57\xe5\x51\xb5\xb7\xff\xe1\
+\xa9\x03\x18\xa7\xa0\xdb\x40\xb0\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x6f\x0f\x0e\
+\x09\x00\x00\x00\x00\x04\xfd\x7f\xed\x09\x23\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x2c\x02\x7c\x2b\xe8\xc8\x51\
+\xb4\x51\xea\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x39\x1c\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x20\x00\x49\x44\x41\x54\x78\x9c\xed\
+\xdd\x09\x9c\x25\x75\x75\xe8\xf1\xd3\x75\xef\xed\x9e\xee\x9e\xbd\
+\x1d\xc6\xc1\x61\x1c\x04\x46\x10\x44\x51\x13\xcc\x60\xcc\x7b\x82\
+\x06\x54\x04\x8d\x04\x88\x4a\xa2\x71\xc9\x62\xd4\xa0\xf9\xe0\x47\
+\xcc\xeb\xf1\x61\x12\xc4\xa7\x09\x9a\x45\xc2\x8b\x1a\x30\x1a\x81\
+\x44\x70\x21\x66\x79\x1a\x97\x40\x22\x18\x71\xd7\xb8\x04\x59\xdc\
+\x58\xa2\xec\xdb\x4c\xde\xa9\xe9\x6e\xec\xe9\xa9\xee\xae\xba\xb7\
+\xea\xfe\xcf\x39\xf5\x3b\x9f\xcf\xf9\x98\xcc\xed\xfe\x16\xa7\xfe\
+\xcb\xa9\x7b\x6f\xdf\xba\x72\xcc\x31\xff\x63\x54\xb3\xa7\x29\xfd\
+\x44\xfe\x7b\xb3\xbf\x3f\x3a\x2f\xf1\xf0\x16\xf5\x0e\x3e\xf8\xa0\
+\xf1\xc9\xc9\x89\x6d\xa3\xa3\xbd\xa7\x76\xbb\xdd\x17\x67\x59\x76\
+\x96\x3e\x74\xbe\xe6\xdf\x6a\x7e\x42\xf3\x4b\x9a\xd7\x6b\xde\x3a\
+\x9b\xf7\x6a\xfe\xf7\x6c\xce\xfd\xdb\x0f\x34\xff\x43\xf3\x4a\xfd\
+\xfd\x8f\x68\x5e\xd8\xe9\x64\x6f\xed\x74\x3a\xaf\x54\xf3\xc4\x91\
+\x91\x91\x43\xf5\xb1\x49\x0b\xf5\xe2\xe1\xe1\xe1\x99\xf4\x42\x15\
+\x83\x67\xd1\x5b\xad\xf9\x54\xcd\xdf\xd1\xbc\x40\x1b\xf3\x35\x9a\
+\xf7\x6a\xfe\xf7\x5c\xca\x4f\x9a\x7b\xe5\x9c\xef\x2c\xe2\x7d\x5b\
+\xf3\x52\xcd\xfc\x22\xe3\x24\xcd\x87\x37\x5c\x2f\x1e\x1e\x1e\x9e\
+\x0f\x2f\x54\x31\x78\x16\xbc\x8d\x9a\xcf\xd3\xfc\x53\xcd\xcf\x6b\
+\xee\x94\xf2\xcd\xba\xee\xe6\xbf\x58\xde\xa0\xf9\x7e\xcd\x57\x68\
+\x3e\xda\xd8\xf9\xc3\xc3\xc3\xc3\x1b\xaa\x97\xf4\xe0\x78\xae\xbd\
+\x4c\xf3\x28\xcd\x37\x6a\x5e\xad\xb9\x4b\xea\x6d\xd6\x75\x37\xff\
+\xa2\xbc\x3e\xcb\xb2\xbf\xe8\x76\xbb\x27\xef\xb3\xcf\x86\x29\xe7\
+\xe3\x81\x87\x87\x87\xd7\x4c\x58\x2f\x06\x6f\x68\xde\xe3\x35\xcf\
+\xd5\xbc\x51\x86\xdb\xac\x9b\xf6\xee\xd6\x8b\x81\x0f\xeb\xbf\x9f\
+\xa6\xb9\xaa\xc1\xf3\x87\x87\x87\x87\x97\xd4\x4b\x7a\x70\x3c\x77\
+\x5e\xfe\xfe\xf9\x1b\x34\xaf\x13\x1b\xcd\xba\x69\xef\x4e\xcd\x0b\
+\x34\x7f\xb6\xa6\xf3\x57\x29\xf0\xf0\xf0\xf0\x9a\xf4\x92\x1e\x1c\
+\xcf\xbe\xb7\x61\xc3\x54\xfe\x12\xff\x89\x9a\x97\xcb\xbc\xf7\xf3\
+\xcb\xa4\xf3\xe6\xbf\x30\xbf\xa2\x79\xba\xe6\xda\x94\xe3\x81\x87\
+\x87\x87\x57\x97\x97\xf4\xe0\x78\x76\xbd\xcd\x9b\xf7\xcd\x5f\xfe\
+\xce\x5f\x06\xff\xaa\xf8\x6b\xd6\x4d\x7a\xb7\x6b\x9e\xa7\xb9\x6d\
+\x98\xe3\x81\x87\x87\x87\x57\xb7\x97\xf4\xe0\x78\xf6\xbc\xa9\xa9\
+\xf5\x1b\xb2\x2c\xcb\xff\xa0\xef\x16\xf1\xdf\xac\x9b\xf4\x1e\xd0\
+\xfc\xeb\xfc\x7e\x03\x9e\xc6\x17\x0f\x0f\x0f\x6f\xce\x4a\x7a\x70\
+\x3c\x3b\xde\xa6\x4d\x1b\xd7\x75\x3a\x9d\xd7\x69\x43\xcb\x6f\xb2\
+\x93\xba\xb9\x7a\xf2\x76\xea\x05\xd3\x25\xe3\xe3\xe3\x87\x59\x1e\
+\x5f\x3c\x3c\x3c\xbc\x85\x5e\xa8\x62\xf0\xaa\x7b\xdb\xb6\x1d\x38\
+\xa9\x8d\xff\x55\xda\xc8\x6e\x32\xd8\x5c\x3d\x79\xf7\xe7\x1f\x25\
+\xd4\x7c\xe8\x20\xe3\x61\x7d\xbe\xe0\xe1\xe1\xc5\xf1\x42\x15\x83\
+\x57\xcd\xd3\x38\x36\xcb\x46\xbe\xe4\xa0\xb9\x7a\xf2\xee\xd0\xdc\
+\xa1\xb9\xa2\xea\x78\x58\x9f\x2f\x78\x78\x78\xc1\xbd\x50\xc5\xe0\
+\x15\x7a\x13\x13\x13\x07\xe6\xf7\xcf\x77\xd8\x5c\x3d\x79\xdf\xd4\
+\xfc\xf9\x32\xe3\x61\x7d\xbe\xe0\xe1\xe1\xb5\xc0\x0b\x55\x0c\xde\
+\x5e\xb1\x75\xeb\x96\x91\x4e\xa7\xf3\xeb\xda\xb0\x6e\x73\xde\x5c\
+\x3d\x79\x17\x69\x6e\x28\x1a\x0f\xeb\xf3\x05\x0f\x0f\xaf\x25\x5e\
+\xa8\x62\xf0\xf6\x0a\x6d\x54\x07\x6b\x5e\x19\xac\xb9\x7a\xf1\x7e\
+\xa8\xf9\x8b\xf3\xc7\xc3\xfa\x7c\xc1\xc3\xc3\x6b\x89\x17\xaa\x18\
+\xbc\xa2\x38\x4d\x9b\xd5\x1d\x46\x9a\x61\x9b\xbd\xfc\xd5\x80\xb5\
+\xd6\xe7\x0b\x1e\x1e\x5e\x4b\xbc\x50\xc5\xe0\x2d\x8c\xfc\xa5\xe7\
+\x4b\x8d\x36\xc3\xb6\x7a\xdf\x1a\x1d\x1d\x7d\x92\xd1\xf9\x82\x87\
+\x87\xd7\x26\x2f\x54\x31\x78\xf3\xe3\x71\x9a\xd7\x1a\x6f\x86\x6d\
+\xf5\xee\xcf\xef\xb9\x60\x6c\xbe\xe0\xe1\xe1\xb5\xcd\x0b\x55\x0c\
+\xde\x5c\xe4\xb7\xf0\xbd\xcb\x49\x33\x6c\xad\x97\x65\xd9\x5f\xf7\
+\x7a\xdd\xc9\x7e\x06\xd8\xf8\xfc\xc3\xc3\xc3\xf3\xe0\x85\x2a\x06\
+\x2f\xbf\xb1\xc3\xf9\xe2\xb0\x19\xb6\xd8\xfb\xbc\xe6\xd6\x2a\x83\
+\x6c\x78\xfe\xe1\xe1\xe1\x79\xf2\x42\x15\xd3\x6e\x2f\xff\xf2\x9e\
+\xbf\x13\xdf\xcd\xb0\xad\xde\x4d\x9a\x47\x95\x19\x64\xc3\xf3\x0f\
+\x0f\x0f\xcf\x9b\x17\xaa\x98\xf6\x7a\x0f\xd3\xbc\x46\x62\x34\xc3\
+\xb6\x7a\x77\x6b\x9e\xbc\xd4\x20\x1b\x9e\x7f\x78\x78\x78\x1e\xbd\
+\x50\xc5\xb4\xd3\x3b\x54\xf3\xbb\x12\xab\x19\xb6\xd5\xcb\xbf\x61\
+\xf0\xa5\x45\x83\x6c\x78\xfe\xe1\xe1\xe1\x39\xf7\x92\x1e\x1c\xaf\
+\x6f\xef\x08\x99\xb9\xc9\x8c\x85\xe6\x85\x57\x8f\xb7\x4b\xf3\xd5\
+\xf3\x07\xd9\xf0\xfc\xc3\xc3\xc3\x73\xee\x25\x3d\x38\x5e\xdf\xde\
+\x4f\x69\xde\x22\xb6\x9a\x17\x5e\x7d\xde\xd9\xf9\x20\x1b\x9e\x7f\
+\x78\x78\x78\xce\xbd\xa4\x07\xc7\xeb\xdb\x3b\x52\xf3\x36\xb1\xdb\
+\xbc\xf0\xea\xf1\x5e\x6f\x74\xfe\xe1\xe1\xe1\x05\xf0\x92\x1e\x1c\
+\xaf\x2f\xef\x70\xe1\x99\x7f\x6b\xbc\x4e\xa7\xf3\x5a\x63\xf3\x0f\
+\x0f\x0f\x2f\x88\x97\xf4\xe0\x78\x95\xbd\x43\x84\xf7\xfc\xdb\xe6\
+\xed\xea\x76\x3b\xbf\x6e\x64\xfe\xe1\xe1\xe1\x05\xf2\x92\x1e\x1c\
+\xaf\x52\x6c\xd2\xfc\x8e\xf8\x6a\x5e\x78\xf5\x78\x3b\xf5\xdf\x9f\
+\x5d\x6a\x96\x2c\x08\xc3\xf3\x19\x0f\x0f\x2f\xb1\x97\xf4\xe0\x78\
+\xa5\x63\x42\xf3\xdf\xc4\x67\xf3\xc2\xab\xc7\xbb\x4b\xf3\x89\x25\
+\xe6\xca\x83\x61\x78\x3e\xe3\xe1\xe1\x19\xf0\x42\x15\x13\xd4\xeb\
+\x68\x5e\x2a\xbe\x9b\x17\x5e\x3d\x5e\xfe\xf6\xcf\x81\xcb\xce\x18\
+\x31\x3d\x9f\xf1\xf0\xf0\x8c\x78\xa1\x8a\x09\xea\xbd\x59\x62\x34\
+\x2f\xbc\x7a\xbc\x2f\x68\x2e\xf9\x05\x42\xc6\xe7\x33\x1e\x1e\x9e\
+\x55\x2f\x54\x31\xfe\xbd\xfc\x7d\xdf\x5d\x81\x9a\x17\x5e\x3d\xde\
+\xfb\x16\x9b\x30\xc6\xe7\x33\x1e\x1e\x9e\x55\x2f\x54\x31\xfe\xbd\
+\x47\x6a\xfe\xd8\x40\xb3\xc1\xb3\xe9\xbd\x6a\xe1\x84\x31\x3e\x9f\
+\xf1\xf0\xf0\xac\x7a\xa1\x8a\xf1\xef\xe5\x2f\xf1\x7e\xd5\x50\xb3\
+\xc1\xb3\xe7\xdd\x27\xf3\xfe\x28\xd0\xf8\x7c\xc6\xc3\xc3\xb3\xea\
+\x85\x2a\x26\x80\xa7\x71\x9e\xb1\x66\x83\x67\xd3\xfb\x96\xe6\x6a\
+\xeb\xf3\x19\x0f\x0f\xcf\xa8\x17\xaa\x98\x00\x9e\xc6\x09\x46\x9b\
+\x0d\x9e\x4d\xef\xdd\x96\xe7\x33\x1e\x1e\x9e\x61\x2f\x54\x31\xce\
+\xbd\x2c\xcb\x1e\xaa\xcd\xe0\x26\xc3\xcd\x06\xcf\xa0\xd7\xed\x76\
+\x7f\xc9\xe2\x7c\xc6\xc3\xc3\x33\xee\x85\x2a\xc6\xb9\xa7\x17\x00\
+\x7f\x63\xbd\xd9\xe0\x99\xf4\x6e\x5a\xbb\x76\xcd\xbe\xd6\xe6\x33\
+\x1e\x1e\x9e\x71\x2f\x54\x31\x8e\x3d\x7d\x16\x77\xa2\x93\x66\x83\
+\x67\xd0\xd3\x8b\xc7\x0b\x2c\xcd\x67\x3c\x3c\x3c\x07\x5e\xa8\x62\
+\x9c\x7a\x53\x53\xeb\xa7\x74\x13\xbf\xde\x4b\xb3\xc1\x33\xeb\x3d\
+\x6d\x91\x69\xb6\x68\x78\x58\x1f\x78\x78\x78\x0d\x79\xa1\x8a\x71\
+\xea\xe9\xb3\xb7\xb7\x3b\x6c\x36\x78\xf6\xbc\x6f\x68\x8e\x16\x4e\
+\xb6\x82\xf0\xb2\x3e\xf0\xf0\xf0\x1a\xf2\x42\x15\xe3\xd0\x1b\x1f\
+\x5f\x71\xb8\x6e\xe2\xf7\x39\x6c\x36\x78\x36\xbd\xdf\x29\x9a\x6f\
+\x0b\xc3\xcb\xfa\xc0\xc3\xc3\x6b\xde\x4b\x7a\xf0\x36\x7b\xfa\xec\
+\xff\xa3\x8e\x9b\x0d\x9e\x3d\xef\x36\x99\xf9\xea\xe8\x45\xc3\xd3\
+\xfa\xc0\xc3\xc3\x6b\xd6\x4b\x7a\xf0\x36\x7b\xbd\x5e\xef\x78\xe7\
+\xcd\x06\xcf\xa6\xf7\xe7\x7b\x4d\xbc\xd9\xf0\xb4\x3e\xf0\xf0\xf0\
+\x9a\xf5\x92\x1e\xbc\xcd\xde\xf6\xed\x47\x8e\x65\xd9\xc8\xe7\x02\
+\x34\x1b\x3c\x7b\xde\x03\x32\xf3\x5d\x12\x7b\x84\xa7\xf5\x81\x87\
+\x87\xd7\xbc\x97\xf4\xe0\x6d\xf6\xba\xdd\xee\xc9\x41\x9a\x0d\x9e\
+\x4d\xef\xc2\xa5\xe6\x9f\xf5\xf5\x81\x87\x87\xd7\xbc\x97\xf4\xe0\
+\x6d\xf5\x9e\xf0\x84\x23\x56\xe8\x66\x9e\x7f\xaf\x7b\x94\x66\x83\
+\x67\xcf\xcb\x5f\x05\x38\xa4\x68\xfe\x59\x5f\x1f\x78\x78\x78\xc3\
+\xf1\x92\x1e\xbc\xad\x9e\x3e\xfb\x3f\x55\x62\x35\x1b\x3c\x9b\xde\
+\x7b\x3d\xae\x0f\x3c\x3c\xbc\xe1\x78\x49\x0f\xde\x56\x4f\x1f\xfa\
+\x57\x49\xdf\x1c\xf0\xe2\x7b\x0f\x8c\x8f\x8f\x6f\xf3\xb6\x3e\xf0\
+\xf0\xf0\x86\xe3\x85\x2a\xc6\x83\xa7\x0f\x3d\x59\x6c\x34\x07\xbc\
+\x16\x78\x59\x96\xfd\x91\xa7\xf5\x81\x87\x87\x37\xd4\x7e\x14\xa7\
+\x18\x27\xde\x65\x62\xa4\x39\xe0\xb5\xc2\xbb\x6d\x6a\x6a\xfd\x06\
+\x47\xeb\x03\x0f\x0f\x2f\x95\x17\xaa\x18\x7b\xde\x56\xcd\x9d\x62\
+\xa7\x39\xe0\xb5\xc0\xeb\x74\x3a\xaf\x71\xb2\x3e\xf0\xf0\xf0\x68\
+\xfe\x61\xbd\x37\x8a\xb1\xe6\x80\xd7\x0a\xef\xab\x9a\x23\x52\x31\
+\x02\xac\x37\x3c\x3c\x3c\x9a\xbf\x09\xaf\xab\x79\x83\xd8\x6b\x0e\
+\x78\xed\xf0\xb6\x4b\x85\x08\xb0\xde\xf0\xf0\xf0\x68\xfe\x66\xbc\
+\x13\xc4\x6e\x73\xc0\x8b\xef\xbd\x53\x4a\x46\x90\xf5\x86\x87\x87\
+\x47\xf3\x37\xe3\xfd\x8d\xd8\x6d\x0e\x78\xf1\xbd\x3b\x34\x27\x65\
+\x99\x08\xb4\xde\xf0\xf0\xf0\x96\xf3\x42\x15\x63\xd7\x5b\xa5\x79\
+\x97\xd8\x6d\x0e\x78\xed\xf0\x7e\x41\x96\x88\x40\xeb\x0d\x0f\x0f\
+\xaf\x8c\x17\xaa\x18\xbb\xde\xf3\xc4\x7e\x73\xc0\x8b\xef\x5d\x24\
+\x8b\x44\xb0\xf5\x86\x87\x87\x57\xc6\x0b\x55\x8c\x5d\xef\x03\x62\
+\xbf\x39\xe0\xc5\xf7\xee\x94\x82\xb7\x01\x0c\xac\x0f\x3c\x3c\xbc\
+\x14\x5e\xa8\x62\x6c\x7a\x2b\x64\x66\xe3\xb5\xde\x1c\xf0\xda\xe1\
+\x9d\x20\xf3\xc2\xc0\xfa\xc0\xc3\xc3\x4b\xe5\x85\x2a\xc6\xa6\x77\
+\xac\xf8\x69\x0e\x78\xf1\xbd\x3f\x93\xd9\x30\xb2\x3e\xf0\xf0\xf0\
+\x52\x79\xa1\x8a\xb1\xe9\xfd\x91\xf8\x69\x0e\x78\xf1\xbd\xeb\xf2\
+\x49\x69\x68\x7d\xe0\xe1\xe1\x25\xf6\x92\x1e\x3c\xb8\xf7\x75\xf1\
+\xd3\x1c\xf0\x5a\xe0\xe9\xef\x1e\x62\x68\x7d\xe0\xe1\xe1\x25\xf4\
+\x92\x1e\x3c\xb8\xb7\xaf\x38\x6b\x0e\x78\xf1\xbd\x4e\xa7\xf3\x4a\
+\x23\xeb\x03\x0f\x0f\x2f\xa1\x97\xf4\xe0\x2d\xf0\x7e\x51\x9c\x35\
+\x07\xbc\xf8\x5e\x96\x65\xef\x37\xb2\x3e\xf0\xf0\xf0\x12\x7a\x49\
+\x0f\xde\x02\xef\x5c\x71\xd6\x1c\xf0\x5a\xe1\xdd\x60\x64\x7d\xe0\
+\xe1\xe1\x25\xf4\x92\x1e\xbc\x05\xde\x55\xe2\xaf\x39\xe0\xb5\xc0\
+\x9b\x9c\x9c\x78\x84\x81\xf5\x81\x87\x87\x97\xd0\x4b\x7a\xf0\xe0\
+\x5e\x7e\x72\xef\x13\x87\xcd\x01\xaf\x15\xde\x92\xb7\x05\x5e\x2c\
+\x0c\xaf\x37\x3c\x3c\xbc\x8a\x5e\xd2\x83\x07\xf7\x1e\x2b\x7e\x9b\
+\x03\x5e\x7c\xef\x0d\x52\x31\x8c\xaf\x37\x3c\x3c\xbc\x8a\x5e\xa8\
+\x62\x2c\x79\x1a\xa7\x39\x6e\x0e\x78\xf1\xbd\x0f\x48\x85\xb0\xbe\
+\xde\xf0\xf0\xf0\xaa\x7b\xa1\x8a\xb1\xe4\x65\x59\xf6\x16\xc7\xcd\
+\x01\x2f\xbe\xf7\x4d\x29\x19\x1e\xd6\x1b\x1e\x1e\x5e\x0d\x5e\xa8\
+\x62\x12\x7a\x7a\x01\x70\xb9\xe3\xe6\x80\x17\xdf\xdb\xa5\x39\x21\
+\xcb\x84\x97\xf5\x86\x87\x87\x37\xa0\x17\xaa\x98\xc4\x5e\x96\x8d\
+\x7c\xcd\x71\x73\xc0\x6b\x87\x77\xb0\x2c\x11\x9e\xd6\x1b\x1e\x1e\
+\xde\x00\x5e\xa8\x62\x12\x7b\xdb\xb7\x1f\x39\xa6\x1b\xef\x9d\xce\
+\x9b\x03\x5e\x7c\xef\x38\x59\x24\x3c\xad\x37\x3c\x3c\xbc\x01\xbc\
+\x50\xc5\x18\xf0\x56\xaf\x5e\xb5\x5f\x80\xe6\x80\x17\xdf\xfb\x0d\
+\x29\x08\x6f\xeb\x0d\x0f\x0f\xaf\x4f\x2f\x54\x31\x46\x3c\x8d\xa3\
+\xc4\x7f\x73\xc0\x8b\xef\xbd\x49\x16\x84\xc7\xf5\x86\x87\x87\xd7\
+\xa7\x17\xaa\x18\x23\x9e\x3e\x74\xbc\xf8\x6f\x0e\x78\xf1\xbd\x77\
+\xc9\xbc\xf0\xba\xde\xf0\xf0\xf0\xfa\xf4\x42\x15\x63\xc7\x7b\xa1\
+\xf8\x6f\x0e\x78\xf1\xbd\x0f\xca\x6c\x38\x5f\x6f\x78\x78\x78\xfd\
+\x78\xa1\x8a\xb1\xe3\xbd\x46\xfc\x37\x07\xbc\xf8\xde\x15\x9a\x11\
+\xd6\x1b\x1e\x1e\x5e\x3f\x5e\xa8\x62\xec\x78\xbf\x2f\xfe\x9b\x03\
+\x5e\x7c\xef\xeb\x41\xd6\x1b\x1e\x1e\x5e\x3f\x5e\xa8\x62\xec\x78\
+\x6f\x13\xff\xcd\x01\x2f\xbe\x77\x63\x90\xf5\x86\x87\x87\xd7\x8f\
+\x17\xaa\x18\x3b\xde\x79\xe2\xbf\x39\xe0\xc5\xf7\x6e\x0e\xb2\xde\
+\xf0\xf0\xf0\x06\xf0\x92\x1e\x3c\xa0\xf7\x2e\xf1\xdf\x1c\xf0\xe2\
+\x7b\xb7\x05\x59\x6f\x78\x78\x78\x34\x7f\x33\xde\x5f\x89\xff\xe6\
+\x80\x17\xdf\xbb\x37\xc8\x7a\xc3\xc3\xc3\x6b\x3a\xac\x17\x63\xc8\
+\x7b\xbf\xf8\x6f\x0e\x78\xf1\xbd\x9d\x41\xd6\x1b\x1e\x1e\x5e\x1f\
+\x5e\xd2\x83\x07\xf6\x2e\x14\xff\xcd\x01\x2f\xbe\x77\x77\x90\xf5\
+\x86\x87\x87\xd7\x87\x97\xf4\xe0\x81\xbd\xbf\x10\xff\xcd\x01\x2f\
+\xbe\xf7\x23\xe9\x23\x0c\xae\x37\x3c\x3c\xbc\x3e\xbc\xa4\x07\x0f\
+\xec\xfd\xa9\xf8\x6f\x0e\x78\xf1\xbd\x1f\x48\xc5\x30\xba\xde\xf0\
+\xf0\xf0\xfa\xf0\x92\x1e\x3c\xb0\xf7\x87\xe2\xbf\x39\xe0\xc5\xf7\
+\xae\x93\x0a\x61\x78\xbd\xe1\xe1\xe1\xf5\xe1\x85\x2a\xc6\x90\xb7\
+\x43\xfc\x37\x07\xbc\xf8\xde\xe7\xa5\x64\x18\x5f\x6f\x78\x78\x78\
+\x7d\x78\xa1\x8a\xb1\xe2\x69\xbc\x3c\x40\x73\xc0\x8b\xef\x7d\x4c\
+\x4a\x84\xf5\xf5\x86\x87\x87\x57\x93\x17\xaa\x98\x44\x5e\xb7\xdb\
+\x79\x7e\x80\xe6\x80\x17\xdf\xbb\x48\x96\x09\x0f\xeb\x0d\x0f\x0f\
+\xaf\x06\x2f\x54\x31\x09\x3d\x8d\xe3\x02\x34\x07\xbc\xf8\xde\x9f\
+\xc9\x12\xe1\x65\xbd\xe1\xe1\xe1\x0d\xe8\x85\x2a\x26\xb1\xb7\x62\
+\xc5\x8a\x23\x02\x34\x07\xbc\xf8\xde\xb4\x2c\x12\x9e\xd6\x1b\x1e\
+\x1e\xde\x00\x5e\xa8\x62\x0c\x78\xfb\xec\xb3\x61\x2a\x40\x73\xc0\
+\x8b\xef\x9d\x26\x05\xe1\x6d\xbd\xe1\xe1\xe1\xf5\xe9\x85\x2a\xc6\
+\x90\xa7\x0f\xdd\x2c\xbe\x9b\x03\x5e\x7c\xef\xc9\xb2\x20\xbc\xae\
+\x37\x3c\x3c\xbc\x3e\xbc\x50\xc5\xd8\xf2\xae\x12\xdf\xcd\x01\x2f\
+\xbe\xb7\x9f\xcc\x0b\xe7\xeb\x0d\x0f\x0f\xaf\xaa\x17\xaa\x18\x5b\
+\xde\xfb\xc4\x77\x73\xc0\x8b\xed\xdd\xad\xd9\x91\xd9\x08\xb0\xde\
+\xf0\xf0\xf0\xaa\x7a\xa1\x8a\xb1\xe5\x9d\x29\x7e\x9b\x03\x5e\x7c\
+\x2f\x7f\x85\x6a\x77\x04\x59\x6f\x78\x78\x78\x55\xbd\x50\xc5\xd8\
+\xf2\x8e\x17\xbf\xcd\x01\x2f\xbe\xf7\x4e\xcd\x48\xeb\x0d\x0f\x0f\
+\xaf\xaa\x17\xaa\x18\x5b\xde\xc3\xc5\x6f\x73\xc0\x8b\xef\xfd\x76\
+\xb0\xf5\x86\x87\x87\x57\xd5\x0b\x55\x8c\x2d\x6f\x44\xf3\x56\xf1\
+\xd9\x1c\xf0\xe2\x7b\x4f\x09\xb6\xde\xf0\xf0\xf0\xfa\xf4\x92\x1e\
+\x3c\xb0\x77\xb9\xf8\x6c\x0e\x78\xb1\xbd\xfb\x37\x6c\x98\x5a\x6f\
+\x60\x7d\xe0\xe1\xe1\x25\xf6\x92\x1e\x3c\xb8\x57\xf8\x87\x80\xc6\
+\x9b\x03\x5e\x7c\xef\xb3\x46\xd6\x07\x1e\x1e\x5e\x42\x2f\xe9\xc1\
+\x5b\xe0\xe5\x3f\xe8\xad\x39\xe0\x05\xf7\xb2\x2c\x7b\xbb\x91\xf5\
+\x81\x87\x87\x97\xd0\x4b\x7a\xf0\x16\x78\x13\x9a\xf7\x8a\xa3\xe6\
+\x80\x17\xdf\xeb\x76\xbb\xbf\x64\x64\x7d\xe0\xe1\xe1\x25\xf4\x92\
+\x1e\xbc\x25\xde\xc7\xc5\x51\x73\xc0\x0b\xef\x3d\xb0\x6e\xdd\xda\
+\x87\x1a\x5a\x1f\x78\x78\x78\x89\xbc\xa4\x07\x6f\x83\xa7\x71\x86\
+\xa3\xe6\x80\x17\xdc\xcb\xb2\xec\x4a\x4b\xeb\x03\x0f\x0f\x2f\x9d\
+\x97\xf4\xe0\x6d\xf0\xc6\xc6\xc6\x1e\xe7\xa5\x39\xe0\xc5\xf7\x3a\
+\x9d\x6c\x87\xa5\xf5\x81\x87\x87\x97\xce\x0b\x55\x8c\x45\x6f\xfb\
+\xf6\x23\xc7\x74\xe3\xbd\xde\x43\x73\xc0\x8b\xef\x69\xfe\xb4\xf4\
+\x11\x5e\xd6\x1b\x1e\x1e\x5e\x79\x2f\x54\x31\x56\xbd\xfc\xaf\xae\
+\x3d\x34\x07\xbc\xf0\xde\x75\x32\x73\x83\xaa\x4a\xe1\x6d\xbd\xe1\
+\xe1\xe1\xf5\xe9\x85\x2a\xc6\x88\x37\x3a\xda\xfb\x39\xb1\xdf\x1c\
+\xf0\xe2\x7b\xe7\x48\xc5\xf0\xb8\xde\xf0\xf0\xf0\xfa\xf0\x42\x15\
+\x63\xc8\xdb\xba\x75\x4b\xfe\xac\xeb\x5a\xb1\xdd\x1c\xf0\xe2\x7b\
+\x4f\x90\x0a\xe1\x75\xbd\xe1\xe1\xe1\xd1\xfc\xad\x79\x6f\x11\xdb\
+\xcd\x01\x2f\xb6\xf7\x4d\xa9\xf0\xf2\x7f\x80\xf5\x86\x87\x87\x47\
+\xf3\x37\xe3\x1d\x22\x76\x9b\x03\x5e\x7c\xef\x4c\x29\x19\x41\xd6\
+\x1b\x1e\x1e\x1e\xcd\xdf\x94\x77\x85\xd8\x6c\x0e\x78\xb1\xbd\xfb\
+\x35\x1f\x26\x25\x22\xd8\x7a\xc3\xc3\xc3\x5b\xca\x0b\x55\x8c\x7d\
+\xef\x85\x62\xaf\x39\xe0\xc5\xf7\x3e\x28\x25\xc2\xc0\xfa\xc0\xc3\
+\xc3\x1b\xa6\x17\xaa\x18\xfb\x5e\xfe\xdd\x00\xb7\x8a\xad\xe6\x80\
+\x17\xdf\x7b\xa6\x2c\x13\x46\xd6\x07\x1e\x1e\xde\x30\xbd\x50\xc5\
+\xf8\xf0\xce\x16\x5b\xcd\x01\x2f\xb6\xf7\x35\xcd\x4c\x96\x08\x63\
+\xeb\x03\x0f\x0f\x6f\x58\x5e\xa8\x62\x7c\x78\xfb\xca\xbc\x6f\x08\
+\x94\x58\xcd\x06\xcf\x9e\xf7\x12\x59\x22\x0c\xae\x0f\x3c\x3c\xbc\
+\x61\x79\xa1\x8a\xf1\xe3\xfd\xa5\xd8\x68\x0e\x78\xb1\xbd\x1f\x68\
+\x8e\xcb\x22\x61\x78\x7d\xe0\xe1\xe1\x0d\xc3\x0b\x55\x8c\x1f\xef\
+\x30\xcd\x9d\xc1\x9a\x0d\x9e\x3d\xef\x75\x0b\x27\xde\x5c\x18\x5f\
+\x1f\x78\x78\x78\x43\xf4\x92\x1e\xbc\x8d\x5e\x96\x65\xef\x0f\xd6\
+\x6c\xf0\x6c\x79\x37\x69\xae\x5a\x38\xf7\xf2\xf0\xb0\x3e\xf0\xf0\
+\xf0\x86\xe3\x25\x3d\x78\x5b\xbd\xf1\xf1\xf1\x43\x75\x13\xbf\x3f\
+\x48\xb3\xc1\xb3\xe7\xbd\x66\xe1\xdc\xcb\xc3\xcb\xfa\xc0\xc3\xc3\
+\x6b\xde\x4b\x7a\xf0\xb6\x7b\x59\x96\x5d\x18\xa4\xd9\xe0\xd9\xf2\
+\xbe\x27\x33\x1f\x39\xdd\x23\xbc\xad\x0f\x3c\x3c\xbc\x66\xbd\xa4\
+\x07\x6f\xbb\x37\x39\x39\xf1\x08\x7d\xe8\x4e\xf1\xdd\x6c\xf0\xec\
+\x79\x2f\x5d\x30\xfd\x5c\xae\x0f\x3c\x3c\xbc\x66\xbd\xa4\x07\xc7\
+\xdb\xed\x9d\x25\xbe\x9b\x0d\x9e\x2d\xef\x1a\xcd\x4e\x85\xf9\x57\
+\x39\xf0\xf0\xf0\x62\x78\x49\x0f\x8e\xb7\x3b\xf2\x97\x6a\xbf\x23\
+\x3e\x9b\x0d\x9e\x3d\xef\x18\x99\x17\x01\xd6\x07\x1e\x1e\x5e\x43\
+\x5e\xd2\x83\xe3\x3d\x18\xcf\x17\x9f\xcd\x06\xcf\x96\x77\xf1\xfc\
+\x49\x15\x68\x7d\xe0\xe1\xe1\x35\xe0\x85\x2a\xc6\xb9\xf7\xf7\xe2\
+\xab\xd9\xe0\xd9\xf2\x7e\x2c\xf3\xbe\xf1\xcf\xc0\x7c\xc6\xc3\xc3\
+\x33\xee\x85\x2a\xc6\xb9\xf7\x70\xcd\xdb\xc5\x47\xb3\xc1\xb3\xe7\
+\xbd\x6c\x6e\x22\x19\x99\xcf\x78\x78\x78\xde\xbc\x50\xc5\xf8\xf3\
+\x4e\x17\x1f\xcd\x06\xcf\x96\xf7\x09\xcd\x91\x7c\x02\x19\x9b\xcf\
+\x78\x78\x78\x5e\xbc\x50\xc5\xf8\xf4\xf2\xbf\xde\xfe\xa4\xd8\x6e\
+\x36\x78\xb6\xbc\xdb\x34\x0f\xcc\x27\x8f\xc1\xf9\x8c\x87\x87\xe7\
+\xc1\x0b\x55\x8c\x6f\x6f\xb3\xe6\x2d\x62\xb3\xd9\xe0\xd9\xf3\x7e\
+\x25\x9f\x34\x86\xe7\x33\x1e\x1e\x9e\x65\x2f\x54\x31\x01\x3c\x8d\
+\xe7\x1a\x6d\x36\x78\xb6\xbc\x4b\xf2\xc9\x62\x7d\x3e\xe3\xe1\xe1\
+\x19\xf5\x42\x15\x13\xc8\xcb\xb2\xec\xdd\xc6\x9a\x0d\x9e\x2d\xef\
+\xdb\x9a\xeb\xbc\xcc\x67\x3c\x3c\x3c\x83\x5e\xa8\x62\x02\x79\x5b\
+\xb6\x6c\x5e\x9d\x65\x23\x57\x1b\x69\x36\x78\xb6\xbc\xbb\x35\x1f\
+\xef\x69\x3e\xe3\xe1\xe1\x19\xf4\x42\x15\x13\xcc\x9b\x9c\x9c\x38\
+\x40\x66\xbe\xd6\x35\x52\xf3\xc2\x1b\xdc\x7b\xa1\xc7\xf9\x8c\x87\
+\x87\x67\xcc\x0b\x55\x4c\x4c\xef\x69\x9a\xf7\x4b\x9c\xe6\x85\x37\
+\x98\xf7\xc7\xce\xe7\x33\x1e\x1e\x9e\x15\x2f\x54\x31\x71\xbd\x17\
+\x4b\x8c\xe6\x85\x37\x98\xf7\x77\x2b\x57\x4e\x76\x03\xcc\x67\x3c\
+\x3c\x3c\x0b\x5e\xa8\x62\x62\x7b\x6f\x16\xdf\xcd\x0b\x6f\x30\xef\
+\x8b\x9d\x4e\x67\x4d\xa0\xf9\x8c\x87\x87\x97\xda\x0b\x55\x4c\x6c\
+\x2f\x93\x99\x2f\x7b\xf1\xd8\xbc\xf0\x06\xf3\xae\xcb\xb2\xec\x61\
+\xc1\xe6\x33\x1e\x1e\x9e\x11\x2f\xe9\xc1\xf1\x4a\x7b\xa3\x9a\x1f\
+\x16\x5f\xcd\x0b\x6f\x30\xef\x87\xfa\xbb\x87\x18\x99\x7f\x78\x78\
+\x78\xc1\xbc\xa4\x07\xc7\xab\xec\x8d\x6b\x7e\x5c\x7c\x34\x2f\xbc\
+\xc1\xbc\x1f\xe9\xef\x3e\xce\xd8\xfc\xc3\xc3\xc3\x0b\xe2\x25\x3d\
+\x38\x5e\xdf\xde\x2a\xcd\x2b\xc5\x76\xf3\xc2\x1b\xbc\xf9\x1f\x69\
+\x74\xfe\xe1\xe1\xe1\x05\xf0\x92\x1e\x1c\xaf\x7f\xaf\xd7\xeb\x4e\
+\x66\xd9\xc8\x3f\x19\x6d\x5e\x78\x83\x79\xb7\xd2\xfc\xf1\xf0\xf0\
+\x9a\xf6\x92\x1e\x1c\x6f\x30\x6f\xeb\xd6\x2d\xab\xb2\x2c\xfb\xa0\
+\xb1\xe6\x85\x37\x98\xf7\x7d\xfd\xdd\xc3\x3d\xcc\x3f\x3c\x3c\x3c\
+\xdf\x5e\xd2\x83\xe3\x0d\xee\x1d\x70\xc0\xfe\x2b\xf5\x22\x60\xc9\
+\x4f\x07\x2c\x97\x86\x9b\x61\xdb\xbc\x6f\xe9\xef\x1e\xe4\x69\xfe\
+\xe1\xe1\xe1\xf9\xf5\x92\x1e\x1c\xaf\x1e\x6f\xeb\xd6\x2d\x23\xfa\
+\xf0\x0e\x89\xd5\x0c\xdb\xe6\xfd\xab\x5e\xc8\x6d\xf4\x38\xff\xf0\
+\xf0\xf0\x7c\x7a\xa1\x8a\xc1\x93\x5f\xd5\xbc\x4f\xfc\x37\xc3\xb6\
+\x79\x7f\xdb\xeb\xf5\x26\x02\xcc\x3f\x3c\x3c\x3c\x47\x5e\xa8\x62\
+\xf0\x76\xc7\xd3\x34\x6f\x16\xbf\xcd\xb0\x4d\xde\x2e\xcd\xb3\x36\
+\x6c\x98\xca\x02\xcd\x3f\x3c\x3c\x3c\xaf\x5e\xa8\x62\xda\xeb\xed\
+\xa7\xf9\x6f\xe2\xab\x19\xb6\xcd\xfb\xb1\xe6\x73\x8c\xcc\x17\x3c\
+\x3c\xbc\xb6\x7b\xa1\x8a\xc1\xcb\x6f\x18\xf4\x4e\xf1\xd1\x0c\xdb\
+\xe6\x7d\x5e\xf3\x20\x63\xf3\x05\x0f\x0f\xaf\xad\x5e\xa8\x62\xf0\
+\xe6\xc7\x2f\x68\xde\x22\x76\x9b\x61\x9b\xbc\xfc\x25\xff\xf3\x34\
+\x27\x0c\xcf\x17\x3c\x3c\xbc\x36\x79\xa1\x8a\xc1\xdb\x2b\xb2\x6c\
+\x64\x3f\xcd\x4f\x18\x6b\x86\x6d\xf3\x7e\xa0\xf9\xcc\x26\xc6\x17\
+\x0f\x0f\x0f\xaf\x2f\x2f\x54\x31\x78\x8b\x7a\x87\x1f\x7e\xe8\x78\
+\xa7\xd3\x79\xb5\x36\xae\x3b\x0c\x34\xc3\xb6\x79\xef\xd1\xdc\xd0\
+\xe4\xf8\xe2\xe1\xe1\xe1\x55\xf6\x42\x15\x83\xb7\xac\xb7\x72\xe5\
+\xe4\x56\x7d\xe8\x52\x89\xd3\x5c\x2d\x7b\x37\x68\x9e\xb8\xd4\x78\
+\x58\x9f\x2f\x78\x78\x78\x81\xbd\x50\xc5\xe0\x55\xf1\x4e\xd5\xbc\
+\x5e\xfc\x36\x57\xcb\xde\x3d\x9a\x67\x6b\x4e\x56\x18\x8f\x4a\x81\
+\x87\x87\x87\x37\xb0\x17\xaa\x18\xbc\xaa\xde\x84\xe6\x19\x9a\xb7\
+\x8b\x9f\xe6\x6a\xdd\xfb\x90\xe6\x01\x7d\x8e\x47\xa9\xc0\xc3\xc3\
+\xc3\xab\xc5\x0b\x55\x0c\x5e\xbf\xde\x16\xcd\x77\x69\xde\x2f\xb6\
+\x9b\xab\x65\xef\x5f\x35\x8f\xae\x69\x3c\x16\x0d\x3c\x3c\x3c\xbc\
+\xda\xbc\x50\xc5\xe0\x0d\xea\xed\x2f\x33\x1f\x53\x7b\x40\x6c\x35\
+\x57\xcb\xde\x17\x34\x4f\xd2\x1c\x69\x60\x3c\xf0\xf0\xf0\xf0\x9a\
+\xf3\x42\x15\x83\x57\x97\xf7\x28\xcd\x77\x69\xf3\xbb\x37\x58\xb3\
+\xae\xd3\xfb\x94\xe6\xb3\xa4\xa0\xf1\x37\x30\x1e\x78\x78\x78\x78\
+\x8d\x79\x49\x0f\x8e\x67\xd3\x5b\xbd\x7a\xd5\x96\x4e\x27\x3b\x47\
+\x1b\xe1\xad\xce\x9b\x75\x5d\xde\x4e\xcd\x4b\x34\x9f\x58\xe6\xfc\
+\x59\x1f\x5f\x3c\x3c\x3c\xbc\xa4\x07\xc7\xb3\xef\x6d\xde\xbc\xef\
+\x2a\x99\x79\x99\xfb\x1f\x65\xe6\x6e\x76\x1e\x9a\x75\x9d\x5e\xfe\
+\x71\xbe\xfc\xaf\xfa\xf7\xef\xe7\xfc\x59\x1f\x5f\x3c\x3c\xbc\x76\
+\x7a\x49\x0f\x8e\xe7\xd2\x3b\x44\xf3\x1c\xcd\x6b\xc5\x66\xb3\xae\
+\xcb\xcb\x3f\x19\xf1\x5e\xcd\xe3\x34\xb3\x1a\xcf\x5f\xe9\xc0\xc3\
+\xc3\xc3\x6b\xd2\x4b\x7a\x70\x3c\xd7\x5e\xfe\xde\x77\xfe\x52\xf8\
+\x5b\x35\xbf\x23\x31\x9a\x7f\xde\xf4\x2f\x92\x99\xef\x4f\x18\x6f\
+\xf8\xfc\xe1\xe1\xe1\xe1\x25\xf5\x92\x1e\x1c\x2f\x94\xf7\x08\xcd\
+\x97\xca\xcc\xe7\xe0\xef\x71\xd4\xfc\xbf\x95\x65\xd9\xf9\xdd\x6e\
+\xf7\xc4\x31\x8d\x84\xe7\x0f\x0f\x0f\x0f\x6f\xa8\x5e\xd2\x83\xe3\
+\xc5\xf4\xf6\xdd\x77\xd3\xea\xd1\xd1\xd1\xa7\x74\x3a\x9d\xd7\x6b\
+\x73\xfd\x88\x36\xd9\xdd\xdf\x46\xd8\x6f\xd6\xd8\xfc\xef\xd5\xbc\
+\x52\xff\x9b\xfe\xb0\xd7\xeb\x3e\x77\xcd\x9a\xd5\x0f\xb3\x78\xfe\
+\xf0\xf0\xf0\xf0\x86\xe1\x25\x3d\x38\x5e\xab\xbc\xfc\x66\x43\xcf\
+\xd0\x7c\xad\xcc\xbc\xb7\x9e\xdf\x38\x27\xff\x86\xbc\x26\x9a\xff\
+\x1d\x9a\x5f\xd4\xbc\x4c\xf3\x0f\x64\xe6\xb6\xc7\x87\x4d\x4c\x8c\
+\xf7\x1c\x9f\x3f\x3c\x3c\x3c\xbc\x5a\xbd\x50\xc5\xe0\xb9\xf4\xf2\
+\xdb\x11\x1f\x2a\x33\x77\xd1\x3b\x45\xf3\x37\x35\xff\x97\xe6\x39\
+\xf9\x4b\xf3\xb3\xf9\x5e\xcd\x4b\x34\xf3\xf7\xe7\xcf\x9b\xcd\x3f\
+\xd2\x3c\x4b\xf3\x55\x9a\x2f\xd0\x7c\xba\xe6\x13\x64\xf6\x5b\xf7\
+\x0c\xd7\x8b\x87\x87\x87\x67\xc2\x0b\x55\x0c\x1e\x1e\x1e\x1e\x1e\
+\x1e\x5e\x9f\x5e\xa8\x62\xf0\xf0\xf0\xf0\xf0\xf0\xf0\x68\xfe\x78\
+\x78\x78\x78\x78\x78\x78\x96\x0e\x8e\x87\x87\x87\x87\x87\x87\x47\
+\xf3\xc7\xc3\xc3\xc3\xc3\xc3\xc3\x6b\xd8\x0b\x55\x0c\x1e\x1e\x1e\
+\x1e\x1e\x1e\x5e\x39\x2f\x54\x31\x78\x78\x78\x78\x78\x78\x78\xe5\
+\xbc\x50\xc5\xe0\xe1\xe1\xe1\xe1\xe1\xe1\x95\xf3\x42\x15\x83\x87\
+\x87\x87\x87\x87\x87\x57\xce\x0b\x55\x0c\x1e\x1e\x1e\x1e\x1e\x1e\
+\x5e\x69\x20\x4e\x31\x78\x78\x78\x78\x78\x78\x78\xe5\x91\x64\x07\
+\xc7\xc3\xc3\xc3\xc3\xc3\xc3\x4b\xea\x25\x3d\x38\x1e\x1e\x1e\x1e\
+\x1e\x1e\xde\xf0\xbd\xa4\x07\xc7\xc3\xc3\xc3\xc3\xc3\xc3\x1b\xbe\
+\x97\xf4\xe0\x78\x78\x78\x78\x78\x78\x78\x69\xbc\xa4\x07\xc7\xc3\
+\xc3\xc3\xc3\xc3\xc3\x4b\xe3\x25\x3d\x38\x1e\x1e\x1e\x1e\x1e\x1e\
+\x5e\x1a\x2f\xe9\xc1\xf1\xf0\xf0\xf0\xf0\xf0\xf0\xd2\x78\x49\x0f\
+\x8e\x87\x87\x87\x87\x87\x87\x97\xc6\x0b\x55\x0c\x1e\x1e\x1e\x1e\
+\x1e\x1e\x5e\x39\x2f\x54\x31\x78\x78\x78\x78\x78\x78\x78\x7d\x7a\
+\xa1\x8a\xc1\xc3\xc3\xc3\xc3\xc3\xc3\xa3\xf9\xe3\xe1\xe1\xe1\xe1\
+\xe1\xe1\x59\x3a\x38\x1e\x1e\x1e\x1e\x1e\x1e\x1e\xcd\x1f\x0f\x0f\
+\x0f\x0f\x0f\x0f\xaf\x61\x2f\x54\x31\x78\x78\x78\x78\x78\x78\x78\
+\xe5\xbc\x50\xc5\xe0\xe1\xe1\xe1\xe1\xe1\xe1\x95\xf3\x42\x15\x83\
+\x87\x87\x87\x87\x87\x87\x57\xce\x0b\x55\x0c\x1e\x1e\x1e\x1e\x1e\
+\x1e\x5e\x39\x2f\x54\x31\x78\x78\x78\x78\x78\x78\x78\xa5\x81\x38\
+\xc5\xe0\xe1\xe1\xe1\xe1\xe1\xe1\x95\x47\x92\x1d\x1c\x0f\x0f\x0f\
+\x0f\x0f\x0f\x2f\xa9\x97\xf4\xe0\x78\x78\x78\x78\x78\x78\x78\xc3\
+\xf7\x92\x1e\x1c\x0f\x0f\x0f\x0f\x0f\x0f\x6f\xf8\x5e\xd2\x83\xe3\
+\xe1\xe1\xe1\xe1\xe1\xe1\xa5\xf1\x92\x1e\x1c\x0f\x0f\x0f\x0f\x0f\
+\x0f\x2f\x8d\x97\xf4\xe0\x78\x78\x78\x78\x78\x78\x78\x69\xbc\xa4\
+\x07\xc7\xc3\xc3\xc3\xc3\xc3\xc3\x4b\xe3\x25\x3d\x38\x1e\x1e\x1e\
+\x1e\x1e\x1e\x5e\x1a\x2f\x54\x31\x78\x78\x78\x78\x78\x78\x78\xe5\
+\xbc\x50\xc5\xe0\xe1\xe1\xe1\xe1\xe1\xe1\xf5\xe9\x85\x2a\x06\x0f\
+\x0f\x0f\x0f\x0f\x0f\x8f\xe6\x5f\x83\xf7\x50\xcd\x23\x35\x9f\xa9\
+\xf9\xcb\x9a\xa7\x6b\xfe\x9e\xe6\x9f\x68\x9e\xa7\xf9\xe7\x59\x96\
+\x5d\xac\x79\xc9\xbc\xbc\x58\xff\xfd\xa2\x7e\x13\x0f\x6f\x08\xde\
+\xbb\x65\x66\xfe\xe6\xf9\x26\xcd\xd7\x69\xbe\x44\xf3\x39\xbd\x5e\
+\xef\xe8\x89\x89\x89\x47\x6e\xdb\x76\xe0\x64\x80\xf5\x8b\x87\x87\
+\x47\xf3\x5f\xdc\x5b\xb1\x62\xc5\xa8\x3e\xfc\x18\xcd\x17\x68\x9e\
+\xa3\xf9\x11\xcd\xaf\x68\xde\xa5\xf9\xdf\x4b\xe5\xc8\xc8\xc8\x5e\
+\xb9\xdc\xef\xe0\xe1\x39\xf1\x1e\xd0\xbc\x56\xff\xfd\x9f\x65\xe6\
+\x42\xe1\x37\x35\x9f\xac\xb9\x56\x4a\x84\xd7\xfd\x00\x0f\x2f\xbc\
+\x17\xaa\x98\x8a\xde\xaa\x55\x2b\x1f\xde\xed\x76\x4f\xd5\x67\x4a\
+\x6f\xd3\x87\x3e\xa3\x79\x9f\xd8\xdb\x7c\xf1\xf0\x2c\x7b\xdf\xd4\
+\xbc\x40\xf3\xd7\x34\x1f\xad\x99\xc9\xbc\xf0\xb4\x1f\xe0\xe1\xb5\
+\xca\x0b\x55\x4c\x89\x18\x1d\x1d\x5d\xd1\xeb\xf5\x8e\xed\x74\xb2\
+\x73\xb2\x6c\xe4\xb3\x01\x36\x5f\x3c\x3c\x6b\xde\xcd\x32\xf3\xd6\
+\xc2\x4b\xf5\xc2\xfa\x61\x96\xf7\x03\x3c\xbc\x56\x7b\xa1\x8a\x59\
+\x3c\x56\x6a\x9e\xaa\xf9\x01\xdd\xcc\xee\x34\xb6\x59\xe2\xe1\x45\
+\xf6\x76\xe9\x45\xc0\x55\x9d\x4e\xe7\x8c\xc9\xc9\xc9\x03\x8d\xec\
+\x07\x78\x78\x78\xb3\xbf\x14\xa7\x98\x3d\xa3\xab\xf9\x2c\xcd\x4b\
+\x64\xf6\xfd\x7b\x07\x9b\x25\x1e\x5e\x64\x6f\x97\xfe\xfb\x95\x9a\
+\xaf\xd0\x5c\x2f\x15\xc2\xe0\xfe\x82\x87\xe7\xdf\x0b\x55\xcc\x4c\
+\x3c\x4c\xf3\x0c\xcd\x6b\xc5\xf7\x66\x89\x87\x17\xd9\xbb\x47\x66\
+\xde\x26\x38\x46\x73\x44\x96\x08\x63\xfb\x0b\x1e\x5e\x1c\x2f\x50\
+\x31\x3f\xab\x79\xa9\xe6\x4e\x49\xbf\xb9\xe1\xe1\xe1\x95\xf7\xbe\
+\xa4\xf9\x22\xcd\x31\x59\x10\x86\xf6\x17\x3c\xbc\x78\x9e\xf3\x62\
+\xf2\xbf\x36\x3e\x49\xf3\xdf\xc4\xee\xe6\x86\x87\x87\x57\x2e\xbf\
+\x27\x33\xf7\x20\xd8\xfd\xd1\x42\x03\xfb\x0b\x1e\x5e\x6c\xcf\x69\
+\x31\xf9\x4b\x86\xc7\x6b\x7e\x4e\xfc\x6c\x6e\x78\x78\x78\xe5\xf2\
+\x36\xcd\xb3\xa7\xa6\xd6\x3d\xc4\xd4\x66\x89\x87\x17\xd4\x4b\x7a\
+\xf0\x8a\xde\xb1\x9a\xff\x2e\x7e\x37\x37\x3c\x3c\xbc\x72\xde\x4d\
+\x9d\x4e\xe7\xb5\x5b\xb6\x6c\x5e\x6d\x69\xb3\xc4\xc3\x8b\xe4\x25\
+\x3d\x78\x05\x6f\x9b\xe6\x87\x24\xce\xe6\x86\x87\x87\x57\xce\xbb\
+\x4e\xff\xfd\x34\x59\xe6\x8f\x05\x8b\xc2\xfa\xe6\x8b\x87\x97\xd2\
+\x4b\x7a\xf0\x92\xde\x1a\xcd\x73\xa5\xe4\x1d\xfa\x1c\x6e\x6e\x78\
+\x78\x78\xe5\xbc\x8f\xcb\xcc\x9d\x06\x4b\x85\xf5\xcd\x17\x0f\x2f\
+\xb5\x97\xf4\xe0\x25\xbc\xfc\x4b\x77\xf2\xab\x7f\x8b\x9b\x11\x1e\
+\x1e\xde\xf0\xbd\xfb\x35\xcf\xd6\x5c\x21\x4b\x84\x87\xcd\x17\x0f\
+\x2f\xb5\x97\xf4\xe0\x4b\x78\xf9\xb7\xee\xe5\xdf\x62\x66\x7d\x33\
+\xc2\xc3\xc3\x4b\xe3\x7d\x55\xf3\x49\x52\x10\x5e\x36\x5f\x3c\xbc\
+\xd4\x5e\xd2\x83\x2f\xe2\xfd\xbc\xcc\x7c\x1c\xc8\xd3\x66\x84\x87\
+\x87\x37\x7c\x2f\xbf\xb3\x60\xfe\xf6\xe0\x83\x1b\x99\xa7\xcd\x17\
+\x0f\x2f\xb5\x97\xf4\xe0\x0b\xbc\x71\x99\x59\xcc\xf9\xa2\xf6\xb8\
+\x19\xe1\xe1\xe1\xa5\xf1\xbe\xa0\x79\x98\xb7\xcd\x17\x0f\x2f\xb5\
+\x67\xa5\x98\x47\xc9\xcc\x4b\x7a\x11\x36\x23\x3c\x3c\xbc\xe1\x7b\
+\x77\x74\xbb\x9d\x5f\xf1\xb4\xf9\xe2\xe1\xa5\xf6\x2c\x14\x73\x82\
+\xe6\x8f\x24\xd6\x66\x84\x87\x87\x97\xc0\xcb\xb2\xec\xfc\x03\x0e\
+\xd8\x7f\xa5\x87\xcd\x17\x0f\xcf\x9c\x37\xac\x83\xaf\x59\xb3\xba\
+\xa3\x0f\xbf\x59\x2a\xbe\xe4\x2f\x8e\x36\x23\x3c\x3c\xbc\x24\xde\
+\xbf\xe8\x85\xc0\x26\xe9\x23\x42\x6d\xe6\x78\x78\x16\x9b\x7f\xaf\
+\xd7\x9d\xd4\x87\x3f\x28\x36\x37\x0f\x3c\x3c\x3c\xff\xde\x8d\x9a\
+\x47\x48\x85\x08\xb5\x99\xe3\xe1\x59\x6c\xfe\xb3\x57\xe6\x57\x8b\
+\xed\xcd\x03\x0f\x0f\xcf\xbf\x77\xbb\xe6\x33\xa4\x44\x84\xda\xcc\
+\xf1\xf0\x2c\x36\x7f\x5d\xa0\x87\xe8\xc3\xdf\x11\x1f\x9b\x07\x1e\
+\x1e\x9e\x7f\x2f\xbf\x71\xd0\x0b\x65\x89\x08\xb5\x99\xe3\xe1\x19\
+\x6d\xfe\x8f\xd5\x87\x7f\x28\xbe\x36\x0f\x3c\x3c\x3c\xff\x5e\xfe\
+\x77\x46\xbf\x2d\x05\x11\x6a\x33\xc7\xc3\xab\xea\x0d\xa9\xf9\x3f\
+\x5e\x1f\xbe\x59\x7c\x6e\x1e\x78\x78\x78\x31\xbc\x69\x99\x17\xc9\
+\x37\x5f\x3c\xbc\xd4\x5e\xf3\xcd\x5f\x7e\x46\x66\xbe\xdf\xdb\xfb\
+\xe6\x81\x87\x87\xe7\xdf\x9b\xd6\xb4\xb1\xf9\xe2\xe1\xa5\xf6\x9a\
+\x6d\xfe\x23\x8f\xd1\x87\x6f\x91\x38\x9b\x07\x1e\x1e\x9e\x7f\xef\
+\x0c\x13\x9b\x2f\x1e\x5e\x6a\xaf\xc1\xe6\xff\x48\x7d\xf8\xfb\x92\
+\x7e\xb1\xe3\xe1\xe1\xe1\xcd\xf7\x76\x75\x3a\x9d\xdf\x4a\xbe\xf9\
+\xe2\xe1\xa5\xf6\x1a\x6a\xfe\x0f\xd7\x87\xbf\x2b\x36\x16\x3b\x1e\
+\x1e\x1e\xde\x42\x6f\x67\xb7\xdb\x7d\x41\xa8\xcd\x1c\x0f\xaf\xaa\
+\x57\xf7\xc1\xbb\xdd\xce\x6a\x99\xf9\x72\x0e\x4b\x8b\x1d\x0f\x0f\
+\x0f\x6f\x61\xde\xab\xff\xfe\x14\xe9\x23\x4c\x6e\xe6\x78\x78\x7d\
+\x7a\xb5\x1c\x7c\x62\x62\x3c\xff\x72\x81\x7f\x10\x9b\x8b\x1d\x0f\
+\x0f\x0f\x6f\xa1\x97\xff\x8d\x52\xfe\x76\x65\xe9\xb0\xbe\x99\xe3\
+\xe1\x35\x16\xcb\x1c\xfc\x7c\xb1\xbd\xd8\xf1\xf0\xf0\xf0\x16\xfe\
+\xcc\x37\x35\xd7\x49\x89\xb0\xbe\x99\xe3\xe1\x35\x16\xcb\x1c\xfc\
+\x65\xe2\x63\xb1\xe3\xe1\xe1\xe1\x2d\xcc\xfc\x95\xcb\xfc\x0b\xca\
+\x16\x0d\xeb\x9b\x39\x1e\x5e\x55\xaf\xae\x83\x1f\xa9\x79\x8f\xf8\
+\x59\xec\x78\x78\x78\x78\x0b\xf3\x0d\xb2\x48\x78\xd8\xcc\xf1\xf0\
+\xaa\x7a\x75\x1c\xfc\x21\x9a\xd7\x8b\xbf\xc5\x8e\x87\x87\x87\x37\
+\x3f\x77\x6a\x3e\x5d\x16\x84\x97\xcd\x1c\x0f\xaf\xaa\x57\xc7\xc1\
+\x2f\x16\x9f\x8b\x1d\x0f\x0f\x0f\x6f\x61\xe6\xdf\x57\x92\x7f\x63\
+\xe9\xee\xf0\xb4\x99\xe3\xe1\x55\xf5\x06\x3d\x78\xe5\xf7\xfd\x8d\
+\x2d\x76\x3c\x3c\x3c\xbc\x85\xf9\xf7\x9a\x23\xde\x36\x73\x3c\xbc\
+\xaa\xde\x20\x07\xcf\x3f\x3a\x73\x87\xf8\x5f\xec\x78\x78\x78\x78\
+\x0b\xf3\x15\xde\x36\x73\x3c\xbc\xaa\x5e\xbf\x07\xcf\x34\x3f\x2d\
+\x71\x16\x3b\x1e\x1e\x1e\xde\x7c\xef\xae\x89\x89\xf1\x43\x3c\x6d\
+\xe6\x78\x78\x03\x7b\x25\x7f\xf8\x15\x12\x6b\xb1\xe3\xe1\xe1\xe1\
+\xed\xe1\x65\x59\xf6\xcf\xdb\xb7\x1f\x39\xe6\x76\x33\xc7\xc3\x6b\
+\xa0\xf9\x6f\x91\x0a\x5f\xef\xeb\x65\xb1\xe3\xe1\xe1\xe1\x2d\xb4\
+\x3a\x9d\xce\x4b\x5c\x6e\xe6\x78\x78\x0d\x34\xff\x3c\x3e\x24\x46\
+\x16\x27\x1e\x1e\x1e\x5e\xc3\xde\xad\x9a\x1b\xa4\x62\x84\x6a\x0e\
+\x78\xb1\xbd\x0a\x3f\x7c\x8c\xd8\x5a\x9c\x78\x78\x78\x78\x4d\x7b\
+\xef\x90\x0a\x11\xaa\x39\xe0\xc5\xf6\x2a\xfc\x70\x57\xf3\x8b\x62\
+\x6f\x71\xe2\xe1\xe1\xe1\x35\xe9\x3d\xa0\xf9\x18\x29\x11\xa1\x9a\
+\x03\x5e\x7c\xaf\xc2\x0f\x97\xfa\xc3\xbf\x00\x8b\x1d\x0f\x0f\x0f\
+\x6f\x61\x7e\x4c\x96\x89\xe4\x9b\x39\x1e\x5e\x55\xaf\xe4\x0f\xaf\
+\xd4\xfc\x81\xd8\x5d\x9c\x78\x78\x78\x78\x4d\x7b\xc7\xca\x22\x61\
+\x62\x33\xc7\xc3\xab\xea\x95\xfc\xe1\xd7\x8b\xfd\xc5\x89\x87\x87\
+\x87\xd7\xa4\x77\xb5\xe6\x88\x2c\x08\x33\x9b\x39\x1e\x5e\x55\xaf\
+\xc4\x0f\xaf\xd1\xbc\x45\xec\x2f\x4e\x3c\x3c\x3c\xbc\xa6\xbd\x67\
+\xc9\xbc\x30\xb5\x99\xe3\xe1\x55\xf5\x4a\xfc\x70\xfe\x15\x99\x5e\
+\x16\x27\x1e\x1e\x1e\x5e\x93\xde\x35\x32\xfb\x2a\x80\xb9\xcd\x1c\
+\x0f\xaf\xaa\xb7\xcc\x0f\x4f\x68\xde\x2c\x7e\x16\x27\x1e\x1e\x1e\
+\x5e\xd3\xde\x71\x26\x37\x73\x3c\xbc\x3e\xbd\xc5\xe2\xe5\xe2\x6f\
+\x71\xe2\xe1\xe1\xe1\x35\xe9\xfd\x93\xe5\xcd\x1c\x0f\xaf\x8e\xc8\
+\xbf\xf0\xe7\x1b\xe2\x6f\x71\xe2\xe1\xe1\xe1\x35\xea\x8d\x8d\x8d\
+\x1d\x69\x71\x33\xc7\xc3\xab\x2b\x4e\x10\xa7\x8b\x13\x0f\x0f\x0f\
+\xaf\x49\x2f\xcb\xb2\xf7\x58\xdb\xcc\xf1\xf0\xaa\x7a\x4b\xc5\xe5\
+\xe2\x74\x71\xe2\xe1\xe1\xe1\x35\xec\xdd\xbd\x76\xed\x9a\x8d\x96\
+\x36\x73\x3c\xbc\xaa\xde\x62\x8f\xef\x27\x33\xb7\xbf\xf4\xba\x38\
+\xf1\xf0\xf0\xf0\x9a\xf6\x7e\x4b\xfa\x08\x2f\xcd\x01\x2f\xbe\xb7\
+\xd8\xcf\xec\xf1\xd1\x3f\xa7\x8b\x13\x0f\x0f\x0f\xaf\x49\xef\x0b\
+\x52\x31\x3c\x35\x07\xbc\xf8\x5e\xd1\xcf\xe4\x9f\x71\xbd\x4e\xfc\
+\x2f\x4e\x3c\x3c\x3c\xbc\xa6\xbd\x27\x48\xc9\xf0\xd6\x1c\xf0\xe2\
+\x7b\x45\x3f\xf7\x24\x89\xb3\x38\xf1\xf0\xf0\xf0\x9a\xf4\xde\x2c\
+\x25\xc2\x63\x73\xc0\x8b\xef\x15\xfd\xec\xdb\x24\xce\xe2\xc4\xc3\
+\xc3\xc3\x6b\xd2\xcb\x5f\x2d\xdd\xeb\xfb\x01\xe6\x87\xd7\xe6\x80\
+\xd7\x3e\x2f\xff\xec\xff\x8d\x81\x16\x27\x1e\x1e\x1e\x5e\xd3\xde\
+\x13\x65\x91\x88\xd4\x1c\xf0\x82\x7b\x23\x23\x72\x94\x81\xc5\x84\
+\x87\x87\x87\xe7\xc9\x2b\x7c\x1b\x20\x54\x73\xc0\x8b\xed\xe5\xff\
+\x98\x65\xd9\xef\x1b\x58\x4c\x78\x78\x78\x78\x9e\xbc\x2f\xc9\x82\
+\x08\xd5\x1c\xf0\x62\x7b\x73\x3f\x9c\x65\x23\x9f\x35\xb0\x98\xf0\
+\xf0\xf0\xf0\xbc\x79\x5b\x64\x36\x42\x35\x07\xbc\xd8\xde\xdc\x0f\
+\xaf\x5d\xbb\x66\x5f\x9d\xf4\x3b\x8d\x2c\x26\x3c\x3c\x3c\x3c\x4f\
+\xde\x4b\x34\x63\x35\x07\xbc\xf8\xde\xdc\x0f\x77\xbb\xdd\x5f\x36\
+\xb4\x98\xf0\xf0\xf0\xf0\x3c\x79\x17\x27\xdf\xcc\xf1\xf0\xaa\x7a\
+\x73\x3f\x98\x65\xd9\x79\x86\x16\x13\x1e\x1e\x1e\x9e\x27\xef\xfb\
+\xc9\x37\x73\x3c\xbc\xaa\xde\xdc\x0f\xeb\xe4\xff\xa2\xd8\x59\x4c\
+\x78\x78\x78\x78\xae\xbc\x89\x89\x89\x83\x43\x35\x07\xbc\xf8\x5e\
+\xfe\xc3\x53\x53\xeb\xa7\x64\xc1\x97\xff\x54\x49\x0f\x8b\x13\x0f\
+\x0f\x0f\xaf\x49\xaf\xdb\xed\xbe\x28\x54\x73\xc0\x8b\xef\xe5\x3f\
+\xac\xff\xf3\x54\x31\xb6\x98\xf0\xf0\xf0\xf0\x3c\x79\xf9\xdb\xa8\
+\xa1\x9a\x03\x5e\x7c\x6f\xf6\x87\x7f\x47\x8c\x2d\x26\x3c\x3c\x3c\
+\x3c\x67\xde\x95\xa1\x9a\x03\x5e\x6b\xbc\x0b\xc4\xde\x62\xc2\xc3\
+\xc3\xc3\xf3\xe4\xdd\x21\x33\xb7\x53\xaf\x14\xd6\x9b\x03\x5e\x6c\
+\x2f\x8f\x6b\xc4\xde\x62\xc2\xc3\xc3\xc3\xf3\xe6\x1d\x20\x15\xc2\
+\x7a\x73\xc0\x8b\xed\xe5\xd1\xd5\xbc\x47\x6c\x2e\x26\x3c\x3c\x3c\
+\x3c\x4f\xde\x09\x52\x32\xac\x37\x07\xbc\xf8\x5e\x1e\xfb\x8b\xdd\
+\xc5\x84\x87\x87\x87\xe7\xc9\x3b\x5d\x4a\x84\x87\xe6\x80\x17\xdf\
+\xcb\xff\xef\xa7\x88\xdd\xc5\x84\x87\x87\x87\xe7\xc9\x7b\x9b\x2c\
+\x13\x5e\x9a\x03\x5e\x7c\x2f\xff\xff\x5f\x24\x76\x17\x13\x1e\x1e\
+\x1e\x9e\x27\xef\x43\xb2\x44\x78\x6a\x0e\x78\xf1\xbd\xfc\xdf\xde\
+\x20\x76\x17\x13\x1e\x1e\x1e\x9e\x27\x6f\xaf\xaf\x06\x9e\x0b\x6f\
+\xcd\x01\x2f\xbe\x97\xff\xfb\xf9\x62\x77\x31\xe1\xe1\xe1\xe1\x79\
+\xf2\x6e\x91\x82\xf0\xd8\x1c\xf0\xe2\x7b\xf9\x63\x1f\x10\xbb\x8b\
+\x09\x0f\x0f\x0f\xcf\x93\xb7\x53\xb3\x23\xf3\xc2\x6b\x73\xc0\x6b\
+\x87\xf7\x49\xb1\xbb\x98\xf0\xf0\xf0\xf0\xbc\x79\x0f\x91\xd9\xf0\
+\xde\x1c\xf0\xe2\x7b\x5f\x16\xdb\x8b\x09\x0f\x0f\x0f\xcf\x93\x77\
+\xb0\x66\x88\xe6\x80\x17\xdf\xbb\x41\x6c\x2f\x26\x3c\x3c\x3c\x3c\
+\x4f\xde\x13\xa3\x34\x07\xbc\xf8\xde\xcd\x62\x7b\x31\xe1\xe1\xe1\
+\xe1\x79\xf2\x9e\x1c\xa5\x39\xe0\xc5\xf7\x6e\x33\xbe\x98\xf0\xf0\
+\xf0\xf0\xdc\x78\xbd\x5e\xf7\xb8\x28\xcd\x01\x2f\xb8\xa7\x93\xfd\
+\x1e\xcb\x8b\x09\x0f\x0f\x0f\xcf\x93\xd7\xeb\xf5\x4e\x0c\xd1\x1c\
+\xf0\xe2\x7b\x3a\x61\x77\x59\x5e\x4c\x78\x78\x78\x78\x9e\xbc\x6e\
+\xb7\x7b\x72\x88\xe6\x80\xb7\xac\x37\x3a\xda\x1b\xd7\x87\x0f\xd2\
+\x7c\xbc\x66\x8e\x3f\x5d\xf3\xa4\xfc\x57\x34\xb7\x6b\x1e\xa1\xb9\
+\x9f\x58\xfd\x68\xa8\xf5\xc5\x84\x87\x87\x87\xe7\xc9\xd3\x0b\x80\
+\x53\x3d\x34\x2f\xbc\x6a\xde\xf8\xf8\xf8\xa1\xdd\x6e\xe7\xa5\x59\
+\x96\x9d\x9f\x65\x23\x1f\xd7\x87\xae\xd3\xdc\x25\xe5\xe6\xc8\xbd\
+\x9a\x5f\xd5\xbc\x4c\xf3\x4d\x3a\x47\x9e\xbd\x7e\xfd\xba\x8d\xc9\
+\xeb\xb5\xbe\x98\xf0\xf0\xf0\xf0\x3c\x79\xba\xb9\x9f\x62\xad\x79\
+\xe1\xf5\xe5\x4d\x68\x9e\xa2\x0d\xff\xfd\x3a\xae\xdf\x6d\x60\xbe\
+\xec\xd4\x0b\x89\x2f\xa8\x7f\xee\xc8\x88\xfc\x8c\x3e\x36\x32\xf4\
+\x7a\xad\x2f\x26\x3c\x3c\x3c\x3c\x67\x5e\xfe\x12\x70\xe5\x30\xde\
+\x0c\xdb\xe2\x65\x9a\xc7\x69\x5e\xa8\x79\xfb\x90\xe7\xdf\xb7\x35\
+\xdf\xa8\xf9\xc8\x21\xd6\x6b\x7e\x31\xe1\xe1\xe1\xe1\x79\xf2\x2a\
+\x5f\x00\x18\x6d\x86\x6d\xf2\x46\x35\x4f\x93\x79\x37\xc6\x4b\x38\
+\xff\xf2\xb7\x15\xf2\x6f\x95\x3c\xaa\xc1\x7a\x1f\x0c\xeb\x8b\x09\
+\x0f\x0f\x0f\xcf\x93\x57\xe9\x02\xc0\x60\x33\x6c\x93\x97\x37\xfe\
+\x57\x6b\x7e\x57\x6c\xce\xbf\x4f\x6b\x1e\xdd\xe4\xf9\xb3\xbe\x98\
+\xf0\xf0\xf0\xf0\x3c\x79\xa5\x2f\x00\x8c\x35\xc3\xb6\x79\x79\x63\
+\xdd\xe3\x56\xf8\x62\x77\xfe\xe5\xaf\x08\x6c\xad\xfb\xfc\x49\xa2\
+\x62\xf0\xf0\xf0\xf0\xa2\x7a\xa5\x2e\x00\x8c\x35\xc3\x36\x79\xf9\
+\xc7\xf2\x2e\x15\x3b\xf3\xa5\x6c\xde\xd9\xe9\x64\xbf\xfb\xa8\x47\
+\x3d\x72\xa2\xae\xf3\x27\x09\x8b\xc1\xc3\xc3\xc3\x8b\xe8\x2d\x7b\
+\x01\x60\xa8\x19\xb6\xcd\x3b\x41\xf3\x16\xb1\x35\x5f\x2a\x79\x59\
+\x96\x5d\x35\x31\x31\x71\x70\x1d\xe7\x4f\x52\x17\x83\x87\x87\x87\
+\x17\xcc\x5b\xf2\x02\xc0\x50\x33\x6c\x93\x37\xa6\x79\xae\x2c\xf2\
+\xb9\x7d\x87\xf3\xef\xc7\xfa\xef\xa7\x0c\x7a\xfe\xc4\x48\x31\x78\
+\x78\x78\x78\x51\xbc\x45\x2f\x00\x8c\x34\xc3\xb6\x79\x1b\x35\xaf\
+\x12\xbb\xf3\x65\x10\xef\x1c\xa9\x70\xff\x80\x85\xe7\xb6\xae\x61\
+\x97\x00\x00\x18\xc2\x49\x44\x41\x54\x4f\x8c\x15\x83\x87\x87\x87\
+\xe7\xdd\x2b\xbc\x00\x30\xd2\x0c\xdb\xe6\xed\xaf\xf9\x75\xb1\x3d\
+\x5f\x06\xf5\xf2\x7b\x16\xf4\xfa\x39\x7f\x62\xb0\x18\x3c\x3c\x3c\
+\x3c\xcf\xde\x5e\x17\x00\x46\x9a\x61\xdb\xbc\xc3\x34\x6f\x10\xfb\
+\xf3\xa5\x0e\xef\x9f\x34\x57\x55\x3d\x7f\x62\xb4\x18\x3c\x3c\x3c\
+\x3c\xaf\xde\x1e\x17\x00\x46\x9a\x61\xdb\xbc\x27\x6a\xfe\x48\x7c\
+\xcc\x97\xba\xbc\x4f\x6a\x8e\x57\x3d\x7f\x56\x8b\xc1\xc3\xc3\xc3\
+\xf3\xe8\x3d\x78\x01\x60\xa4\x19\xb6\xcd\xcb\xbf\x99\xef\x56\xf1\
+\x33\x5f\xea\xf4\xf2\xfb\x05\x74\xab\x9c\x3f\xcb\xc5\xe0\xe1\xe1\
+\xe1\x79\xf3\x76\x5f\x00\x18\x69\x86\x6d\xf3\xda\xdc\xfc\xe7\xf2\
+\x02\xcd\x91\xb2\xe7\xcf\x7a\x31\x78\x78\x78\x78\x9e\xbc\x93\x8c\
+\x34\xc3\xb6\x79\xf9\xcb\xfe\xf9\xc7\xe3\xbc\xcd\x97\x26\xbc\x33\
+\xcb\x9e\x3f\x0f\xc5\xe0\xe1\xe1\xe1\x79\xf1\x4e\x32\xd0\x0c\xdb\
+\xe6\xf1\xcc\x7f\x4f\x6f\xe7\xe8\x68\xef\x69\x65\xce\x9f\x87\x62\
+\xf0\xf0\xf0\xf0\x5c\x78\xdd\x6e\xf7\x94\x60\xcd\xd5\xba\x47\xf3\
+\x2f\xf6\x6e\x58\xbb\x76\xcd\xa6\x25\xcf\x9f\xa3\x62\xf0\xf0\xf0\
+\xf0\xcc\x7b\x7a\x01\x70\x6a\xa0\xe6\x6a\xdd\xe3\x65\xff\x25\xbc\
+\x2c\xcb\x3e\xb4\xe4\xf9\xf3\x54\x0c\x1e\x1e\x1e\x9e\x75\x6f\xde\
+\x05\x80\xf7\xe6\x6a\xdd\xe3\x99\x7f\x39\xef\xe4\x45\xcf\xa0\xc3\
+\x62\xf0\xf0\xf0\xf0\xcc\x7a\xb3\x17\x00\xde\x9b\xab\x75\x8f\xe6\
+\x5f\xde\xbb\x5e\x73\x65\xe1\x59\x74\x58\x0c\x1e\x1e\xde\xf0\xbc\
+\xfc\xe5\xd5\xcf\x6b\x7e\x50\xf3\x6d\x9a\xaf\xd6\x7c\xbe\xe6\xd3\
+\x35\x8f\xd4\x3c\x50\x73\xbd\xe6\x3a\xcd\x35\x73\x9b\x79\xfe\x95\
+\xa5\xeb\xd7\xaf\xdb\x27\xcf\x55\xab\x56\xee\xa7\xe6\xa3\xf4\xf1\
+\x9f\xd5\x3c\x51\xf3\x45\x9a\xd3\x9a\xef\x94\x99\x3b\x98\x7d\x43\
+\xf3\x7e\x23\xf5\x0e\xec\xcd\xfe\x0d\x80\xf4\x13\x46\x9a\xab\x75\
+\x8f\xe6\x5f\xdd\xfb\xbd\xc2\x33\xe9\xb4\x18\x3c\x3c\xbc\xfa\xbd\
+\x6f\x67\x59\xf6\x3e\xfd\xf7\xd7\x6a\x3e\x43\x73\xab\x54\x88\x01\
+\x9b\x43\x7e\x5f\xf2\xc7\x68\x3e\x4f\xf3\x0f\x34\x3f\xaa\xf9\x23\
+\x67\xe7\x6f\xce\x5b\xf6\xeb\x80\x1b\x38\x7f\x6d\xf1\x78\xcf\xbf\
+\x3f\xef\x1e\x59\x64\x3d\x7b\x2c\x06\x0f\x0f\x6f\x30\x6f\x97\xfe\
+\xfe\x35\x9d\x4e\xf6\x96\x5e\xaf\xfb\xdc\xd5\xab\x57\xed\x67\xad\
+\x39\x3c\xee\x71\x8f\x19\x5b\xb1\x62\xc5\x11\xdd\x6e\xe7\x65\x7a\
+\x61\xf2\x1e\xfd\xef\xfd\xfe\x00\xf5\x0e\x73\x3c\x2a\x5f\x00\x18\
+\x69\xae\xd6\x3d\x9e\xf9\x0f\xe6\xbd\xbd\xe8\xa4\x7a\x2d\x06\x0f\
+\x0f\xaf\x5a\xe6\xcf\x9c\xde\xab\x79\x5a\xfe\xb2\xbc\xb7\xe6\xb0\
+\x75\xeb\x96\xfc\x6b\x4f\x1f\xab\x79\x86\xcc\xdc\xf7\x7c\x67\xd9\
+\xda\x87\x3c\x1e\x95\x2e\x00\x8c\x34\x57\xeb\x1e\xcd\x7f\x70\xef\
+\x4e\xcd\x0d\x0b\x4f\xac\xd7\x62\xf0\xf0\xf0\x96\xcf\xff\xd2\xfc\
+\x4b\xcd\xe3\x35\xc7\x8c\x6c\xe6\x75\x79\x9b\x34\x7f\x53\xf3\xe3\
+\x9a\x0f\x88\x9d\xf1\x28\x7d\x01\x10\x6c\x3c\x9a\xf2\x68\xfe\xf5\
+\x79\x6f\x58\x78\x72\x3d\x17\x83\x87\x87\xb7\x77\xe6\xcf\x8c\x3f\
+\xad\xf9\x52\xcd\x09\x99\x0d\x23\x9b\x79\x53\xde\xbe\x32\xf3\xca\
+\x40\xfe\x07\x85\xa9\xc7\xa3\xd4\x05\x80\xb1\xf3\x67\xd5\xe3\x3d\
+\xff\x7a\xbd\x9b\x34\x7b\x73\xe3\x21\xce\x8b\xc1\xc3\xc3\xfb\x49\
+\xe6\x8b\x3b\xff\x6b\xdf\xfd\x65\x41\x18\xd9\xcc\x87\xe1\xe5\x6f\
+\x13\xfc\x4f\xcd\x8b\xf5\x7c\x3d\x90\x68\x3c\x96\xbd\x00\x30\x7c\
+\xfe\x2c\x79\x3c\xf3\x6f\xc6\x7b\xc6\xdc\x78\x48\x80\x62\xf0\xf0\
+\xda\xee\xfd\x87\xe6\x2b\x65\xde\xb3\xfd\xf9\x61\x64\x33\x1f\xba\
+\xb7\x6a\xd5\xca\x87\x77\x3a\x9d\xb3\xf4\xdc\xdd\x3a\xe4\xf1\x58\
+\xf2\x02\xc0\xcb\xf9\xa3\xf9\x87\xf5\xde\x33\x37\x1e\x12\xa0\x18\
+\x3c\xbc\xb6\x7a\x9f\x95\x99\xf7\xf6\xf3\x67\xbd\x85\x61\x64\x33\
+\x4f\xea\x4d\x4d\xad\x9f\xd2\x87\xce\xd4\xbc\x45\x86\x33\xbe\x8b\
+\x5e\x00\x78\x3c\x7f\x34\xff\x70\xde\x1d\x9b\x36\x6d\x5c\x57\xea\
+\x02\xc0\x41\x31\x78\x78\x6d\xf3\xbe\x28\x33\x4d\x66\xd1\xc6\x9f\
+\x87\x91\xcd\xdc\x92\x97\xdf\x0d\x2d\xff\x3b\x81\x45\x9b\xcb\xc2\
+\xec\x73\x7c\x0b\x2f\x00\x02\x9c\xbf\x61\x78\xbc\xe7\x3f\x04\xaf\
+\xd7\xeb\x3e\x67\xd9\x0b\x00\x2f\xc5\xe0\xe1\xb5\xc4\xbb\x41\x66\
+\xfe\xb0\x2f\x93\x65\xc2\xc8\x66\x6e\xd5\xcb\xef\x5a\x78\xb6\xcc\
+\xdc\x1c\xa5\x89\xf1\xdd\xeb\x02\x20\xd8\xf9\x6b\xca\xe3\x99\xff\
+\x90\xbc\x4e\x27\x7b\xeb\x31\x4b\xfd\x0d\x80\xa7\x62\xf0\xf0\x82\
+\x7b\xf9\xe7\x77\xf3\x86\xb5\x4a\x4a\x84\x91\xcd\xdc\x83\x77\x90\
+\xe6\x45\x52\xff\xf8\xee\x71\x01\x60\xa8\x5e\xcb\x1e\xcd\x7f\xb8\
+\xde\xd5\x73\xe3\x11\xa1\x18\x3c\xbc\xa8\xde\x87\x34\xf7\x93\x92\
+\x61\x64\x33\xf7\xe6\x1d\xa7\xf9\x9f\x52\xdf\xf8\x3e\x78\x01\x60\
+\xb4\x5e\x6b\x1e\xcd\x7f\xf8\x5e\x7e\xdf\x8c\x35\x12\xa4\x18\x3c\
+\xbc\x68\x5e\x7e\xdb\xdb\xd3\xa4\x42\x18\xd9\xcc\xbd\x7a\xf9\x27\
+\x28\xce\x1e\xa9\xe7\xa3\x83\x27\x39\xa8\xd7\x8a\xc7\x7b\xfe\xe9\
+\xbc\xdd\x03\x13\xa5\x18\x3c\xbc\x28\xde\x5f\xc9\xcc\xfb\xd4\xa5\
+\xc3\xc8\x66\xee\xde\x1b\x1b\x1b\xdb\x9e\x65\x23\x5f\x1b\x70\x7c\
+\x4f\xf2\x52\x2f\xcf\xfc\x5b\xed\xbd\x44\x02\x15\x83\x87\xe7\xdd\
+\xcb\x9f\x09\xbd\x40\x2a\x86\x91\xcd\x3c\x8c\xb7\x79\xf3\xbe\x6b\
+\xb2\x2c\xcb\xbf\x38\x65\x97\xf4\x37\xbe\x27\x79\xaa\x97\xe6\xdf\
+\x5a\xef\x1c\x09\x54\x0c\x1e\x9e\x67\xef\x13\x9a\x5b\xa4\x62\x18\
+\xd9\xcc\xa3\x7a\xcf\xd4\xfc\xa1\x54\x1c\xdf\x6e\xb7\x7b\x8a\xd3\
+\x7a\x87\xe5\xd1\xfc\x6d\x78\x1f\x90\x40\xc5\xe0\xe1\x79\xf5\xce\
+\x93\xd9\xfb\x73\x57\x09\x23\x9b\x79\x74\x6f\xb3\xe6\x95\x52\x61\
+\x7c\xf5\x02\xe0\x54\xc7\xf5\x36\xed\xf1\x9e\xbf\x1d\xef\xb3\x7b\
+\x5d\x00\x38\x2e\x06\x0f\xcf\x9b\x77\xbb\xfe\xfb\xc9\xd2\x47\x18\
+\xd9\xcc\xdb\xe2\x8d\x69\x9e\x2b\x25\xc7\x77\xde\x05\x80\xd7\x7a\
+\x9b\xf2\x78\xe6\x6f\xcb\xfb\xba\x04\x2a\x06\x0f\xcf\x93\xf7\x9f\
+\x9a\x87\x49\x1f\x61\x64\x33\x6f\xa3\xf7\x62\xcd\xfb\x64\x99\xf1\
+\x9d\xbd\x00\x88\x50\x6f\x9d\x1e\xcd\xdf\x9e\xf7\x5d\x09\x54\x0c\
+\x1e\x9e\x17\xef\xaa\x2c\xcb\x36\x4a\x1f\x61\x64\x33\x6f\xb3\x77\
+\xb4\xe6\x7f\xc9\x12\xe3\x3b\xfb\x37\x00\xa9\xfe\xfb\x2c\x7a\x34\
+\x7f\x9b\xde\x6d\x12\xa8\x18\x3c\x3c\xf3\x9e\x36\xfe\x4b\x7b\xbd\
+\x5e\xe1\xb7\xf6\x2d\x17\x46\x36\x73\x3c\x91\x43\x35\xaf\x95\xc5\
+\xe7\xcb\xb2\x5f\x07\xdc\xf0\x7f\x9f\x25\x8f\xf7\xfc\xed\x7a\xf9\
+\xab\x59\x61\x8a\xc1\xc3\x33\xed\x69\xf3\xff\x8b\x0d\x1b\xa6\x96\
+\xbd\x8f\x7f\x51\x18\xd9\xcc\xf1\x66\x43\xc7\x72\x5f\x1d\xd3\xaf\
+\x2c\x32\x5f\x2a\x5f\x00\x58\xaf\x97\x67\xfe\x21\xbd\x7c\x6c\xc2\
+\x14\x83\x87\x67\xd6\xd3\x86\xf1\x0e\x9a\x7f\x2c\x6f\xfd\xfa\x75\
+\x1b\x75\x5c\xaf\x2a\x98\x2f\x95\x2e\x00\xbc\xd4\x4b\xf3\x0f\xe7\
+\x5d\x27\x81\x8a\xc1\xc3\x33\xe9\x69\x93\x38\xc7\xf9\x66\x8e\xb7\
+\x88\x37\x35\xb5\x7e\x83\x8e\xf1\x15\xb2\xe7\x1c\x28\x7d\x01\xe0\
+\xad\x5e\x9a\x7f\x28\xef\xcb\x12\xa8\x18\x3c\x3c\x73\x9e\x36\xff\
+\x73\x9d\x6f\xe6\x78\xcb\x78\xbd\x5e\x77\x52\x1f\xfe\x67\xf9\xc9\
+\x3c\x28\x75\x01\xe0\xb5\xde\x65\x3c\xde\xf3\xf7\xe3\xfd\x8b\x04\
+\x2a\x06\x0f\xcf\x94\xa7\xcd\xff\xdd\x5b\xb7\x6e\x19\x91\x3e\xc2\
+\xc8\x66\x8e\x57\xde\xcb\x2f\x02\xf2\xbb\x39\xe6\x73\x61\xd9\x0b\
+\x80\x00\xf5\x16\x05\xcf\xfc\x1d\x79\xba\x3f\xbd\x47\xa2\x14\x83\
+\x87\x67\xc9\xd3\xc5\xf5\x37\x6b\xd6\xac\xee\x48\x1f\x61\x64\x33\
+\xc7\xab\xee\xcd\x5d\x04\x2c\x79\x01\x10\xa8\xde\xf9\x41\xf3\x77\
+\xe6\x75\x3a\x9d\x1d\x12\xa5\x18\x3c\x3c\x2b\x9e\x36\xff\x8f\x4c\
+\x4c\x8c\x57\xbe\xb5\x6f\x1e\x46\x36\x73\xbc\xfe\xbd\xfc\x3b\xd6\
+\x0f\x35\xfc\xdf\xd7\x84\x47\xf3\x77\xe8\x75\xbb\xdd\xe7\x4b\x94\
+\x62\xf0\xf0\x8c\x78\x9f\x19\x1d\xed\x8d\x4b\x1f\x61\x64\x33\xc7\
+\xc3\xe3\x3d\xff\x16\x78\x2b\x56\x8c\xfd\x94\x44\x29\x06\x0f\xcf\
+\x80\xf7\xbd\x2c\x1b\xc9\xbf\x3c\xa6\x72\x18\xd9\xcc\xf1\xf0\x78\
+\xe6\xdf\x0e\xef\xc7\x87\x1d\xf6\xa8\x15\x12\xa4\x18\x3c\xbc\xd4\
+\xde\xdd\x9a\xf9\xb3\xa1\xca\x61\x64\x33\xc7\xc3\xa3\xf9\xb7\xc4\
+\xd3\x27\x2a\x97\xcf\x8d\xaf\xfb\x62\xf0\xf0\x0c\x78\xbf\x2a\x7d\
+\x84\x91\xcd\x1c\x0f\x8f\xe6\xdf\x2e\xef\x8c\xb9\xc1\x8c\x50\x0c\
+\x1e\x5e\x4a\x2f\xff\xaa\xd8\xca\x61\x64\x33\xc7\xc3\xe3\x3d\xff\
+\xf6\x79\x3f\x35\x37\xa0\x11\x8a\xc1\xc3\x4b\xe5\xfd\xbb\xe6\xa8\
+\x54\x0c\x23\x9b\x39\x1e\x1e\xcf\xfc\xdb\xe7\x7d\x4b\xf3\xc1\xfb\
+\x93\x78\x2f\x06\x0f\x2f\x95\x77\xb7\xe6\xa3\xa5\x62\x18\xd9\xcc\
+\xf1\xf0\x68\xfe\xed\xf4\xde\x38\x7f\x60\xbd\x17\x83\x87\x97\xca\
+\xfb\x0d\xa9\x18\x46\x36\x73\x3c\x3c\x9a\x7f\x7b\xbd\xc3\x1e\x1c\
+\xd9\x00\xc5\xe0\xe1\xa5\xf0\x3e\x2a\xf3\x5e\x46\x2b\x13\x46\x36\
+\x73\x3c\x3c\xde\xf3\x6f\xaf\xf7\xd9\x3d\x46\xd7\x79\x31\x78\x78\
+\x29\xbc\xfc\xd9\xd0\x46\xa9\x10\x46\x36\x73\x3c\x3c\x9e\xf9\xb7\
+\xdb\x3b\x79\x8f\x11\x76\x5e\x0c\x1e\x5e\x0a\xef\xd7\xa4\x42\x18\
+\xd9\xcc\xf1\xf0\x68\xfe\xed\xf6\xbe\xad\xd9\xdd\x63\x94\x1d\x17\
+\x83\x87\x97\xc2\xbb\x5a\xb3\xf4\x97\xfc\x18\xd9\xcc\xf1\xf0\x68\
+\xfe\x78\xbf\xbe\xd7\x48\x3b\x2e\x06\x0f\x6f\xd8\xde\x4e\xcd\x23\
+\xa5\x64\x18\xd9\xcc\xf1\xf0\x78\xcf\x1f\x2f\x7f\xf6\x5f\xf8\x1d\
+\x25\x1e\x8b\xc1\xc3\x4b\xe1\xfd\xb1\x94\x0c\x23\x9b\xf9\x30\xbc\
+\x7c\x53\x39\x48\xcf\xd5\xe3\x7b\xbd\xde\x31\x9a\xcf\xea\x76\xbb\
+\xa7\xea\xff\x1e\x3b\x3a\xda\x7b\xb2\xfe\xfb\x11\xfa\xf8\x7e\x52\
+\xe1\x55\x93\x9a\xff\xfb\xf0\x68\xfe\x78\x22\xcf\x5e\x6c\xd0\x3d\
+\x16\x83\x87\x37\x6c\xef\x47\x9a\xeb\xa5\x44\x18\xd9\xcc\x9b\xf0\
+\xb6\xc9\xcc\x2d\x8f\xcf\xd3\xfc\x98\xe6\x75\x9a\xbb\xa4\xdc\xf9\
+\xbb\x57\xf3\xab\x9a\x97\x69\xbe\x49\xf3\x59\xb2\xc8\xf9\x34\x54\
+\x6f\x9b\x3c\x9a\x7f\x5c\xef\x1f\x96\x1a\x78\x6f\xc5\xe0\xe1\xa5\
+\xf0\x5e\x2f\x25\xc2\xc8\x66\x5e\x97\x37\xa1\x79\x8a\xe6\x5f\x6b\
+\x7e\x57\xea\x1f\x8f\xfc\x2d\x95\xcf\x6b\xfe\xa1\xe6\xcf\x68\x8e\
+\x04\x3b\x7f\x5e\x3c\x9a\x7f\x5c\x2f\xbf\xf0\x3e\x64\xa9\xc1\xf7\
+\x54\x0c\x1e\x5e\x0a\xef\x26\xcd\x55\xb2\x4c\x18\xd9\xcc\x07\xf5\
+\x32\xcd\xe3\x34\x2f\xd4\xbc\x5d\x86\x3b\x1e\xdf\xce\xb2\xec\xf7\
+\xc7\xc7\xc7\x0f\x73\x7c\xfe\xbc\x79\x34\xff\xd8\xde\xe9\x8b\x0d\
+\xfc\xdc\xbc\xf0\x54\x0c\x1e\x5e\x0a\xef\x55\xb2\x4c\x18\xd9\xcc\
+\x07\xf1\x46\x35\x4f\xd3\xfc\xb2\xa4\x1f\x8f\x5d\x7a\x21\xf0\xe1\
+\xd1\xd1\xde\xcf\x39\x3a\x7f\x1e\x3d\xfe\xda\x3f\xb6\x77\xb9\x2c\
+\x72\xb3\xb2\xb9\xf9\x22\x8e\x8a\xc1\xc3\x4b\xe1\xdd\x28\x8b\xfc\
+\xf5\xec\x5c\x18\xd9\xcc\xfb\xf5\xf2\xc6\xff\x6a\x59\xe2\x25\xfe\
+\xa2\x1c\xe2\x78\x7c\x5a\xf3\x68\xc3\xe7\xcf\xab\xc7\x33\xff\xd8\
+\x5e\xbe\x6f\x6d\x28\x1a\xf8\xf9\xf3\x45\x9c\x14\x83\x87\x97\xca\
+\x7b\xa5\x2c\x11\x46\x36\xf3\x7e\xbd\x63\x35\xbf\x2e\x3e\xc6\xe3\
+\x62\xcd\x2d\xc6\xce\x9f\x57\x8f\xe6\x1f\xdb\xbb\x4b\xf3\xa8\xa2\
+\x81\x5f\x38\x5f\xc4\x41\x31\x78\x78\xa9\xbc\xdb\x34\x57\xcb\x22\
+\x61\x64\x33\xaf\xec\x65\xd9\x48\xfe\xb1\xbc\x4b\xc5\xdf\x78\xdc\
+\xa9\x79\xa6\x2c\xbc\x9b\xd9\x90\xcf\x9f\x73\x8f\xe6\x1f\xdb\x7b\
+\x40\xf3\xc4\xa2\x81\x2f\x9a\x2f\x62\xbc\x18\x3c\xbc\x94\xde\x5b\
+\x64\x91\x30\xb2\x99\x57\xf6\xf4\xa1\x13\x34\x6f\x11\x9f\xe3\x31\
+\x97\x9f\xd1\x3c\x20\xc5\xf9\x73\xee\xf1\x9e\x7f\x7c\xef\xe5\x45\
+\x03\xbf\xc4\x7e\x60\xba\x18\x3c\xbc\x54\x5e\x7e\x25\xfd\x08\x29\
+\x08\x23\x9b\x79\x25\x6f\xf3\xe6\x7d\xf3\x4f\x31\xbc\x5d\x66\x3f\
+\xb7\x5f\x35\x0d\x8c\xc7\xc2\xfc\x2f\xcd\x5f\x18\xd6\xf9\x0b\xe0\
+\xf1\xcc\x3f\xbe\xf7\xbb\x45\x03\xbf\xdc\x7c\xb1\x5a\x0c\x1e\x5e\
+\x4a\xef\x12\x29\x08\x23\x9b\x79\x25\x6f\xd5\xaa\x95\x9b\xf5\xa1\
+\xab\x0a\x6a\xf4\x34\x1e\x8b\xe5\x39\xdb\xb7\xff\xf4\xa8\xa7\xf1\
+\xa0\xf9\xe3\x35\xe0\xed\x28\x1a\xf8\x32\xf3\xc5\x62\x31\x78\x78\
+\xa9\xbd\xa7\xca\x82\x30\xb2\x99\x57\xf2\x26\x26\xc6\x0f\x92\x3e\
+\xfe\xd0\x4f\x06\x3f\x7f\x43\xf3\xb2\x2c\xfb\xab\x6d\xdb\x0e\x9c\
+\xf4\x30\x1e\x09\x3c\x5e\xf6\x8f\xef\x4d\x17\x0d\x7c\xd9\xf9\x62\
+\xad\x18\x3c\xbc\xd4\x5e\xfe\x11\x9a\x3d\xee\x5d\x6f\x64\x33\xaf\
+\xe4\x8d\x8d\x8d\x3d\x56\x1f\xba\xa1\x64\xcd\x96\xc7\x63\x59\x4f\
+\x2f\x02\xfe\xdf\x86\x0d\x53\xeb\x2d\x8f\x07\xcd\x1f\xaf\x01\x6f\
+\xba\x68\xe0\xab\xcc\x17\x4b\xc5\xe0\xe1\x59\xf0\xce\x91\x79\x61\
+\x64\x33\xaf\xe4\x8d\x8d\x8d\x3e\x41\x66\xbe\xbf\x20\xc2\x78\x94\
+\xf5\xae\x90\x25\x3e\xb5\x51\xe5\xfc\x59\x1f\xdf\x12\x1e\x2f\xfb\
+\xc7\xf7\x76\x14\x0d\x7c\xd5\xf9\x62\xa5\x18\x3c\x3c\x2b\xde\xe1\
+\x32\x1b\x46\x36\xf3\x4a\xde\xf8\xf8\xf8\x36\x7d\xe8\x7b\x15\x6b\
+\xb6\x3c\x1e\x55\xbc\xab\x35\xd7\x0d\x72\xfe\xac\x8f\x2f\xcf\xfc\
+\xf1\xa4\x86\x67\xfe\xbb\xc3\x48\x31\x78\x78\x56\xbc\xcf\xc9\x6c\
+\x18\xd9\xcc\x2b\x79\xab\x57\xaf\xda\x57\x82\xbf\xe7\x5f\xc2\x2b\
+\x75\x11\xe0\x71\x7c\x69\xfe\x78\x52\x57\xf3\xcf\xc3\x40\x31\x78\
+\x78\x96\xbc\xd7\x6a\x5a\xd9\xcc\x2b\x79\xb3\x1f\xf5\x8b\xfa\xd7\
+\xfe\x55\xbd\x25\xdf\x0e\xf0\x38\xbe\x25\x3c\x5e\xf6\x8f\xef\xed\
+\x28\x1a\xf8\xbe\xe7\x5f\xb0\x93\x83\x87\x37\xa8\xf7\x68\x23\x9b\
+\x79\x65\x4f\x66\x3e\xe7\x9f\xfa\xfc\x59\xf2\x0a\x5f\x09\xf0\x3a\
+\xbe\x3c\xf3\x6f\xbd\x37\x5d\x34\xf0\x03\xcd\xbf\x40\x27\x07\x0f\
+\x6f\x50\xef\xfa\xad\x5b\xb7\x8c\x18\xd8\xcc\x2b\x7b\xfa\xd0\x33\
+\x24\xce\x4d\x7e\xea\xf4\xf6\xb8\x08\x30\xd2\xac\xeb\xf6\x68\xfe\
+\xf1\xbd\xe9\xa2\x81\x1f\x78\xfe\x05\x39\x39\x78\x78\x75\x78\xef\
+\x30\xb0\x99\x57\xf6\x66\xef\xed\xef\xfd\xf6\xbe\x4d\x7a\xbb\xdf\
+\x0e\x30\xd2\xac\xeb\xf6\x78\xd9\x3f\xbe\xb7\xa3\x68\xe0\xeb\x9a\
+\x7f\xde\x4f\x0e\x1e\x5e\x2d\x5e\xb7\xdb\x7d\xb6\xd3\xe6\xf0\x81\
+\x7e\xea\xb5\x3e\x1e\x35\x7b\x57\x4c\x4d\xad\x9f\x72\x3a\xbe\x8b\
+\x05\xcf\xfc\xe3\x7b\xd3\x45\x03\x5f\xe7\xfc\xf3\x7c\x72\xf0\xf0\
+\xea\xf2\xee\xdb\xb8\x71\x9f\xf5\x0e\x9b\xc3\x53\xfb\xac\xd7\xfa\
+\x78\xd4\xee\x65\x59\x76\xe5\x86\x0d\x0f\x79\x88\xb3\xf1\x5d\x2c\
+\x68\xfe\xf1\xbd\xe9\xa2\x81\xaf\x7b\xfe\x79\x3d\x39\x78\x78\x75\
+\x36\x87\xcf\x38\x6c\xfe\xa3\x9a\x5f\xeb\xa7\x5e\xeb\xe3\xd1\x94\
+\x97\x5f\x04\xcc\xbe\x12\xd0\xc4\x78\x0c\xcb\xa3\xf9\xc7\xf7\xa6\
+\x8b\x06\xbe\xee\xf9\x27\x4e\x4f\x0e\x1e\x5e\xad\x9e\x36\x86\xb7\
+\x39\x6b\xfe\x79\x9c\xde\x6f\xbd\xd6\xc7\xa3\x61\x6f\xc9\x8f\x08\
+\x0e\x30\x1e\xc3\xf0\x78\xcf\x3f\xbe\xb7\xa3\x68\xe0\x9b\x98\x7f\
+\xe2\xf0\xe4\xe0\xe1\xd5\xee\x75\xbb\xdd\xe7\x39\x6b\xfe\x63\x32\
+\xf3\x9d\x05\x26\xce\x9f\x43\xaf\xd2\x45\x80\x91\xe6\xcf\x33\xff\
+\xf8\xde\x74\xd1\xc0\x37\x35\xff\xc4\xd9\xc9\xc1\xc3\x6b\xc4\x9b\
+\x9c\x9c\x38\xc0\x51\xf3\xcf\xe3\xc5\x83\xd4\x6b\x7d\x3c\x86\xe4\
+\x95\xba\x08\xa0\xf9\xe3\x0d\xc9\x9b\x2e\x1a\xf8\x26\xe7\x9f\x38\
+\x3a\x39\x78\x78\x4d\x79\x37\x3a\x6b\xfe\x23\x9a\x5f\x1e\xa0\x5e\
+\xeb\xe3\x31\x4c\x6f\xc9\x8b\x00\x9a\x3f\xde\x90\xbc\xe9\xa2\x81\
+\x6f\x7a\xfe\x89\x93\x93\x83\x87\xd7\xa4\x77\xb9\xf4\x11\x09\x9b\
+\xc3\xb1\x03\xd6\x6b\x7d\x3c\x86\xed\x15\x5e\x04\x18\x69\xfe\xbc\
+\xe7\x1f\xdf\xdb\x51\x34\xf0\xc3\x98\x7f\xe2\xe0\xe4\xe0\xe1\x35\
+\xed\xbd\x55\x2a\x46\xe2\xe6\x70\xe1\x80\xf5\x5a\x1f\x8f\x14\xde\
+\x1e\x17\x01\x46\x9a\x3f\xcf\xfc\xe3\x7b\xd3\x45\x03\x3f\xac\xf9\
+\x27\xc6\x4f\x0e\x1e\xde\x30\xbc\x97\x49\x85\x48\xdc\x1c\x26\x34\
+\x6f\x1f\xb0\x5e\xeb\xe3\x91\xca\xdb\x7d\x11\x40\xf3\xc7\x1b\x92\
+\x37\x5d\x34\xf0\xc3\x9e\x7f\x56\x4f\x0e\x1e\xde\xb0\xbc\x9f\x93\
+\x92\x61\xa0\x39\x9c\x52\x43\xbd\xd6\xc7\x23\xa5\x67\xe1\x8e\x81\
+\x34\xff\xf8\xde\x74\xd1\xc0\xa7\xd8\x5f\x2c\x9e\x1c\x3c\xbc\x61\
+\x7a\x1b\xa5\x44\x18\x68\xfe\x79\xbc\xaf\x86\x7a\xad\x8f\x47\x52\
+\x2f\xf1\x1d\x03\x79\xcf\x3f\xbe\xb7\xa3\x68\xe0\x53\xed\x2f\xd6\
+\x4e\x0e\x1e\xde\x30\xbd\x3b\xa4\x44\x18\x69\xfe\x79\x2c\xfa\xd9\
+\xff\x20\xe3\x61\xc2\x4b\x74\xc7\x40\x9e\xf9\xc7\xf7\xa6\x8b\x06\
+\x3e\xe5\xfe\x62\xe9\xe4\xe0\xe1\x0d\xdb\xfb\x86\x2c\x13\x86\x9a\
+\xff\x41\x35\xd4\x6b\x7d\x3c\x2c\x79\xc3\xbc\x63\x20\xcd\x3f\xbe\
+\x37\x5d\x34\xf0\xa9\xf7\x17\x2b\x27\x07\x0f\x2f\x85\xf7\x29\x59\
+\x22\x52\x2f\xce\x05\xf1\xab\x35\xd4\x6b\x7d\x3c\xac\x79\xc3\xb8\
+\x63\x20\xcd\x3f\xbe\x37\x5d\x34\xf0\xc9\xf7\x17\x23\x27\x07\x0f\
+\x2f\x95\x77\x89\x2c\x12\xc9\x17\xe7\xde\xf1\x8e\x1a\xea\xb5\x3e\
+\x1e\x16\xbd\x26\xef\x18\xc8\x7b\xfe\xf1\xbd\x1d\x45\x03\x6f\x62\
+\x7f\x31\x70\x72\xf0\xf0\x52\x7a\x7f\x2c\x05\x61\x62\x71\xee\x1d\
+\x1f\xab\xa1\x5e\xeb\xe3\x61\xd5\x6b\xe2\x8e\x81\x3c\xf3\x8f\xef\
+\x4d\x17\x0d\xbc\x99\xfd\x25\xd8\xc9\xc6\xc3\xab\xea\x4d\xcb\x82\
+\x30\xb3\x38\xf7\x8e\xeb\x6b\xa8\xd7\xfa\x78\x58\xf6\xea\xbc\x63\
+\x20\xcd\x3f\xbe\x37\x5d\x34\xf0\xa6\xf6\x97\x40\x27\x1b\x0f\xaf\
+\x1f\xef\x35\x32\x2f\x4c\x2d\xce\x3d\x63\x5c\x73\x67\x0d\xf5\x5a\
+\x1f\x0f\xeb\x5e\x1d\x77\x0c\xa4\xf9\xc7\xf7\xa6\x8b\x06\xde\xdc\
+\xfe\x12\xe4\x64\xe3\xe1\xf5\xeb\xfd\x96\xcc\x86\xb9\xc5\xb9\x67\
+\x1c\x54\x53\xbd\xd6\xc7\xc3\x83\x37\xc8\x1d\x03\x79\xcf\x3f\xbe\
+\xb7\xa3\x68\xe0\xad\xee\x2f\xde\x4f\x36\x1e\xde\x20\xde\x4b\x34\
+\xcd\x2e\xce\xb9\xd0\xda\x1e\x6f\xf4\xfc\xb5\xd5\xeb\xe7\x8e\x81\
+\x3c\xf3\x8f\xef\x4d\x17\x0d\xbc\xe5\xfd\xc5\xf3\xc9\xc6\xc3\x1b\
+\xd4\x3b\xcd\xf2\xe2\x9c\xf3\x7a\xbd\xde\xd1\x46\xcf\x5f\x6b\xbd\
+\x8a\x77\x0c\xa4\xf9\xc7\xf7\xa6\x8b\x06\xde\xfa\xfe\xe2\xf5\x64\
+\xe3\xe1\xd5\xe1\xfd\xa2\xe5\xc5\x39\xe7\x69\x9c\x60\xf4\xfc\xb5\
+\xda\x2b\x79\xc7\x40\x9a\x7f\x7c\x6f\xba\x68\xe0\xad\x37\x7f\x91\
+\xe1\x9c\x1c\x3c\x3c\x93\x5e\xb7\xdb\x3d\xd5\xea\xe2\x9c\xef\xf5\
+\x7a\xdd\xe7\x5a\x3c\x7f\x78\xbb\xbd\xa5\x3e\x22\xc8\x7b\xfe\xf1\
+\xbd\x1d\x45\x03\x6f\xbd\xf9\xcf\xfd\x9e\xb7\x93\x8d\x87\x57\x9b\
+\xa7\x17\x00\x2f\xb2\xba\x38\xe7\x7b\xbd\x5e\xef\xe9\x16\xcf\x1f\
+\xde\x83\x8f\x17\x5d\x04\xf0\xcc\x3f\xbe\x37\x2d\x05\xe1\xa1\xf9\
+\xe7\xbf\x2f\x05\x05\x59\x3e\xd9\x78\x78\xb5\x7a\xdd\x6e\xe7\x37\
+\xac\x2e\xce\xf9\xde\xe8\x68\xef\xc9\x75\xd4\x6b\x7d\x3c\x9c\x7b\
+\xf3\x2f\x02\x68\xfe\xf1\xbd\x69\x29\x08\x2f\xcd\x3f\x77\xa4\xa0\
+\x28\xab\x27\x1b\x0f\xaf\x76\xaf\xd3\xe9\x9c\x6e\x75\x71\xce\xf7\
+\xf4\xbf\xf5\xf0\x3a\xea\xb5\x3e\x1e\x01\xbc\xfc\x22\xe0\x69\xc2\
+\xcb\xfe\xd1\xbd\x1d\x52\x10\x9e\x9a\x7f\xa9\x0b\x00\x23\x27\x1b\
+\x0f\xaf\x11\xaf\xd3\xc9\xce\xb4\xba\x38\x17\x78\x5b\xea\xa8\xd7\
+\xfa\x78\xe0\xe1\x39\xf0\x76\x48\x41\x78\x6b\xfe\xcb\x5e\x00\x18\
+\x39\xd9\x78\x78\x4d\x7a\xff\x5b\xfa\x88\x04\x8b\x3d\xd3\xbc\xbb\
+\x86\x7a\xad\x8f\x07\x1e\x9e\x65\x6f\x5a\x0a\xc2\x63\xf3\x3f\x66\
+\xa9\xbf\x01\x30\x72\xb2\xf1\xf0\x9a\xf6\xce\x93\x8a\x91\x70\xb1\
+\x7f\xa5\x86\x7a\xad\x8f\x07\x1e\x9e\x55\x6f\x5a\x0a\xc2\x6b\xf3\
+\x9f\xf3\xac\x9e\x6c\x3c\xbc\x61\x78\x97\x49\x85\x48\xbc\xd8\x2f\
+\xab\xa1\x5e\xeb\xe3\x81\x87\x67\xd1\x9b\x96\x82\xf0\xde\xfc\xf3\
+\xb0\x78\xb2\xf1\xf0\x86\xe5\x7d\x46\x4a\x86\x81\xc5\x7e\x76\x0d\
+\xf5\x5a\x1f\x0f\x3c\x3c\x6b\xde\x0e\x29\x08\x03\xfb\x41\x2d\x9e\
+\xb5\x93\x8d\x87\x37\x4c\x2f\xff\x8a\xdd\x65\xc3\xc8\x62\x3f\xbe\
+\x86\x7a\xad\x8f\x07\x1e\x9e\x25\x6f\x5a\x0a\xc2\xc8\x7e\x50\x8b\
+\x67\xe9\x64\xe3\xe1\x0d\xdb\xbb\x4f\x73\x44\x96\x08\x43\x8b\x7d\
+\x9d\xcc\x7e\x25\xf0\x00\xf5\x5a\x1f\x0f\x3c\x3c\x2b\xde\xb4\x14\
+\x84\xa1\xfd\xa0\x16\xcf\xca\xc9\xc6\xc3\x4b\xe5\xed\x27\x8b\x44\
+\xea\xc5\x59\x10\xd7\xd4\x50\xaf\xf5\xf1\xc0\xc3\x4b\xed\x4d\x4b\
+\x41\x18\xdc\x0f\x06\xf3\x8c\x9c\x6c\x3c\xbc\x94\x5e\x7e\xe3\x96\
+\xbd\x22\xf9\xe2\x2c\x8e\xb7\xd6\x50\xaf\xf5\xf1\xc0\xc3\x4b\xe9\
+\xed\x90\x82\x30\xba\x1f\x0c\xe6\x19\x38\xd9\x78\x78\xa9\xbd\x57\
+\xca\x82\x30\xb1\x38\x8b\xe3\x89\x35\xd4\x6b\x7d\x3c\xf0\xf0\x52\
+\x79\xd3\x52\x10\x86\xf7\x83\xc1\xbc\x60\x83\x87\x87\xd7\x8f\xf7\
+\x0e\x99\x17\x66\x16\xe7\xe2\xf1\x1f\xc6\xce\x1f\x1e\x5e\x04\x6f\
+\x5a\x0a\xc2\xfa\x7e\x30\x90\x17\x68\xf0\xf0\xf0\xfa\xf5\x3e\x21\
+\xb3\x61\x6a\x71\x2e\xe2\x65\x59\xf6\x7b\xc6\xce\x1f\x1e\x9e\x77\
+\x6f\x5a\x0a\xc2\xc3\x7e\x30\x90\x17\x64\xf0\xf0\xf0\x06\xf1\x6e\
+\xd1\x1c\x31\xb7\x38\x17\xf1\xc6\xc7\xc7\x0f\xd5\x3a\x77\x1a\x3a\
+\x7f\x78\x78\x9e\xbd\x1d\x52\x10\x5e\xf6\x83\x41\x3d\xef\x83\x87\
+\x87\x37\xb0\xa7\xbf\xfb\x48\x8b\x8b\x73\x31\x2f\xcb\xb2\xcb\x2c\
+\x9d\x3f\x3c\x3c\xa7\xde\xb4\x14\x84\xd5\x66\xdd\x84\xe7\x79\xf0\
+\xf0\xf0\x6a\xf1\x3a\x9d\xce\x8b\x2d\x2e\xce\xc5\x3c\x8d\xed\x83\
+\xd4\x6b\x7d\x3c\xf0\xf0\x86\xe0\x4d\x4b\x41\x58\x6e\xd6\x4d\x78\
+\x5e\x07\x0f\x0f\xaf\x36\x4f\x9f\x51\xff\x5f\x8b\x8b\x73\x19\xef\
+\x53\xfd\xd6\x6b\x7d\x3c\xf0\xf0\x1a\xf6\xa6\xa5\x20\xac\x37\xeb\
+\xba\xbd\x3c\x3c\x0e\x1e\x1e\x5e\xad\x5e\x96\x8d\x7c\xd9\xda\xe2\
+\x2c\xe1\x3d\xa5\xdf\x7a\xad\x8f\x07\x1e\x5e\x83\xde\x0e\x29\x08\
+\xeb\xcd\xba\x09\x2f\x8f\x8b\xca\xa6\x3e\x4b\xba\x58\xf3\x92\x79\
+\x79\x71\x95\xdf\xc7\xc3\x33\xec\x5d\x74\xe0\x81\x8f\x98\xb0\xb4\
+\x38\x4b\x7a\x79\x2d\x9e\x36\x5f\x3c\xbc\x94\xde\xb4\x14\x84\x87\
+\x66\xdd\x84\x97\xf4\xe0\x78\x78\x78\x03\x7b\x9b\x35\xef\x10\x1f\
+\x9b\x2f\x1e\x1e\xcd\xdf\x90\x97\xf4\xe0\x78\x78\x78\xb5\x78\xaf\
+\x13\xfb\x9b\x2f\x1e\x5e\x4a\x6f\x87\x14\x84\x91\xf5\x9b\xcc\x4b\
+\x7a\x70\x3c\x3c\xbc\x5a\xbc\xae\xe6\xa7\xc5\xee\xe6\x8b\x87\xc7\
+\x33\x7f\x83\x5e\xa8\x62\xf0\xf0\x5a\xec\xe5\xdf\x68\x98\xdf\xd0\
+\xc8\xda\xe6\x8b\x87\x47\xf3\x37\xea\x85\x2a\x06\x0f\xaf\xe5\xde\
+\x73\xc4\xd6\xe6\x8b\x87\x47\xf3\xf7\xe4\x85\x2a\x06\x0f\xaf\x65\
+\x9e\xc6\x39\x46\x36\x5f\x3c\xbc\x94\xde\x0e\x29\x08\xeb\xeb\x97\
+\xe6\x8f\x87\x87\xd7\xb7\xb7\x7d\xfb\x4f\xe7\xb7\x09\x7e\x77\xb0\
+\xcd\x1c\x0f\x8f\x67\xfe\x4d\x7a\xa1\x8a\xc1\xc3\x6b\xb1\xb7\x6d\
+\xdb\x81\x93\x7a\x11\xf0\x77\x41\x36\x73\x3c\x3c\x9a\x7f\x93\x5e\
+\xa8\x62\xf0\xf0\xf0\x46\x37\x6e\xdc\x67\xad\x3e\x74\x85\xf8\xde\
+\xcc\xf1\xf0\xaa\x78\x3b\xa4\x20\x3c\xae\x5f\x9a\x3f\x1e\x1e\xde\
+\xa0\xde\xa4\xe6\x27\xc4\xe7\x66\x8e\x87\xc7\x33\xff\xa6\xbd\x50\
+\xc5\xe0\xe1\xe1\x2d\xf4\x2a\x5d\x04\x18\xd9\xcc\xf1\xf0\x68\xfe\
+\xc3\xf0\x42\x15\x83\x87\x87\x57\xf4\xe3\xa5\x2e\x02\x8c\x6c\xe6\
+\x78\x78\x34\xff\x61\x79\xa1\x8a\xc1\xc3\xc3\x5b\x2c\x96\xbc\x08\
+\x30\xb2\x99\xe3\xe1\xd1\xfc\x87\xe9\x85\x2a\x06\x0f\x0f\x6f\xa9\
+\x28\xbc\x08\x30\xb2\x99\xe3\xe1\xd1\xfc\x87\xed\x85\x2a\x06\x0f\
+\x0f\x6f\xb9\xd8\xe3\x22\xc0\xc8\x66\x8e\x87\x47\xf3\x4f\xe1\x85\
+\x2a\x06\x0f\x0f\xaf\x4c\xec\xbe\x08\x30\xb2\x99\xe3\xe1\xd1\xfc\
+\x13\x7b\x49\x0f\x8e\x87\x87\x37\x5c\x2f\xbf\x4f\x40\x96\x65\x9f\
+\x0c\xd6\x1c\xf0\x62\x7b\xd3\x52\x10\x1e\xd6\x9b\x65\x2f\xe9\xc1\
+\xf1\xf0\xf0\xd2\x78\x9b\x36\x6d\x5c\x37\x77\x11\x20\xfe\x9b\x03\
+\x5e\x6c\x6f\x5a\x0a\xc2\xd3\x7a\xb3\xe8\x25\x3d\x38\x1e\x1e\x5e\
+\x5a\x6f\xf6\x8e\x81\x95\x6f\x16\x24\x83\x6d\xe6\x78\x78\x34\x7f\
+\x03\x5e\xd2\x83\xe3\xe1\xe1\x99\xf0\xb8\x63\x20\x9e\x55\x8f\xe6\
+\xdf\xa0\x97\xf4\xe0\x78\x78\x78\x66\x3c\xee\x18\x88\x67\xcd\xa3\
+\xf9\x37\xec\x25\x3d\x38\x1e\x1e\x9e\x29\x8f\x3b\x06\xe2\x59\xf1\
+\x68\xfe\x43\xf0\x92\x1e\x1c\x0f\x0f\xcf\x9c\xc7\x1d\x03\xf1\x52\
+\x7b\x34\xff\x21\x79\xa1\x8a\xc1\xc3\xc3\xab\xc5\xe3\x8e\x81\x78\
+\x34\xff\x16\x78\xa1\x8a\xc1\xc3\xc3\xab\xcd\xe3\x8e\x81\x78\x34\
+\xff\xb6\x79\xa1\x8a\xc1\xc3\xc3\x1b\xc4\xe3\x8e\x81\x78\x34\xff\
+\xb6\x78\xa1\x8a\xc1\xc3\xc3\x1b\xd8\xe3\x8e\x81\x78\x43\xf0\x68\
+\xfe\xa9\xbd\x50\xc5\xe0\xe1\xe1\xd5\xe6\x71\xc7\x40\xbc\x06\x3d\
+\x9a\x7f\x6a\x2f\x54\x31\x78\x78\x78\xb5\x7b\xdc\x31\x10\xaf\x01\
+\x8f\xe6\x9f\xda\x0b\x55\x0c\x1e\x1e\x5e\x93\x1e\x77\x0c\xc4\xa3\
+\xf9\x47\xf2\x42\x15\x83\x87\x87\xd7\xb4\xc7\x1d\x03\xf1\x68\xfe\
+\x51\xbc\x50\xc5\xe0\xe1\xe1\x0d\xc3\xe3\x8e\x81\x78\x34\xff\x08\
+\x5e\xa8\x62\xf0\xf0\xf0\x86\xe5\x71\xc7\x40\x3c\x9a\xbf\x77\x2f\
+\x54\x31\x78\x78\x78\xc3\xf4\xb8\x63\x20\x1e\xcd\xdf\xb3\x17\xaa\
+\x18\x3c\x3c\xbc\x61\x7b\xdc\x31\x10\x8f\xe6\xef\xd5\x0b\x55\x0c\
+\x1e\x1e\x5e\x0a\x8f\x3b\x06\xe2\xd1\xfc\x1d\x7b\x49\x0f\x8e\x87\
+\x87\xe7\xdb\xe3\x8e\x81\x78\x05\x49\xf3\x77\xe0\x25\x3d\x38\x1e\
+\x1e\x5e\x0c\x8f\x3b\x06\xe2\xcd\x4b\x9a\xbf\x03\x2f\xe9\xc1\xf1\
+\xf0\xf0\x62\x79\xdc\x31\x10\x4f\x68\xfe\x6e\xbc\xa4\x07\xc7\xc3\
+\xc3\x0b\xe9\x71\xc7\xc0\xf6\x7a\x34\x7f\x47\x5e\xd2\x83\xe3\xe1\
+\xe1\x85\xf5\xb8\x63\x60\xfb\x3c\x9a\xbf\x33\x2f\xe9\xc1\xf1\xf0\
+\xf0\x42\x7b\xdc\x31\xb0\x3d\x1e\xcd\xdf\xa1\x97\xf4\xe0\x78\x78\
+\x78\xe1\x3d\xee\x18\x18\xdf\xa3\xf9\x3b\xf5\x42\x15\x83\x87\x87\
+\x67\xd2\xe3\x8e\x81\x71\x3d\x9a\xbf\x63\x2f\x54\x31\x78\x78\x78\
+\x66\x3d\xee\x18\x18\xcf\xa3\xf9\x47\xf3\x42\x15\x83\x87\x87\x67\
+\xc9\xe3\x8e\x81\x71\x3c\x9a\x7f\x34\x2f\x54\x31\x78\x78\x78\xe6\
+\x3c\xee\x18\x18\xc2\xa3\xf9\x47\xf3\x42\x15\x83\x87\x87\x67\xd6\
+\xe3\x8e\x81\xae\x3d\x9a\x7f\x34\x2f\x54\x31\x78\x78\x78\xe6\x3d\
+\xee\x18\xe8\xd2\xa3\xf9\x47\xf3\x42\x15\x83\x87\x87\xe7\xc9\xe3\
+\x8e\x81\x7e\x3c\x9a\x7f\x44\x2f\x54\x31\x78\x78\x78\xde\x3c\xee\
+\x18\x68\xdf\xa3\xf9\x47\xf5\x42\x15\x83\x87\x87\xe7\xd1\xe3\x8e\
+\x81\x76\x3d\x9a\x7f\x64\x2f\x54\x31\x78\x78\x78\x5e\x3d\xee\x18\
+\x68\xcf\xa3\xf9\x47\xf7\x42\x15\x83\x87\x87\xe7\xd9\xe3\x8e\x81\
+\x76\x3c\x9a\x7f\x1b\xbc\x50\xc5\xe0\xe1\xe1\x79\xf7\xb8\x63\x60\
+\x7a\x8f\xe6\xdf\x16\x2f\x54\x31\x78\x78\x78\x11\x3c\xee\x18\x48\
+\xf3\xc7\x1b\xa2\x97\xf4\xe0\x78\x78\x78\x78\xf3\x3d\xee\x18\x48\
+\xf3\xc7\x1b\x8e\x97\xf4\xe0\x78\x78\x78\x78\x45\x1e\x77\x0c\xa4\
+\xf9\xe3\x35\xeb\x25\x3d\x38\x1e\x1e\x1e\xde\x52\x1e\x77\x0c\xa4\
+\xf9\xe3\x35\xe7\x25\x3d\x38\x1e\x1e\x1e\x5e\x09\x8f\x3b\x06\xd2\
+\xfc\xf1\x1a\xf0\x92\x1e\x1c\x0f\x0f\x0f\xaf\xa4\xc7\x1d\x03\x69\
+\xfe\x78\x35\x7b\x49\x0f\x8e\x87\x87\x87\x57\xc1\xe3\x8e\x81\x34\
+\x7f\xbc\x1a\xbd\xa4\x07\xc7\xc3\xc3\xc3\xab\xe8\x71\xc7\x40\x9a\
+\x3f\x5e\x4d\x5e\xa8\x62\xf0\xf0\xf0\x5a\xe1\x71\xc7\x40\x9a\x3f\
+\x5e\x0d\x5e\xa8\x62\xf0\xf0\xf0\x5a\xe3\x71\xc7\x40\x9a\x3f\x5e\
+\xdd\x5e\xa8\x62\xf0\xf0\xf0\x22\x7b\xdc\x31\x90\xe6\x8f\x57\x97\
+\x17\xaa\x18\x3c\x3c\xbc\xf0\x1e\x77\x0c\xa4\xf9\xe3\xd5\xe0\x85\
+\x2a\x06\x0f\x0f\xaf\x35\x1e\x77\x0c\xa4\xf9\xe3\x0d\xe0\x85\x2a\
+\x06\x0f\x0f\xaf\x75\x1e\x77\x0c\xa4\xf9\xe3\xf5\xe1\x85\x2a\x06\
+\x0f\x0f\xaf\xcd\x1e\x77\x0c\xa4\xf9\xe3\x55\xf1\x42\x15\x83\x87\
+\x87\xd7\x76\x8f\x3b\x06\xd2\xfc\xf1\xca\x7a\xa1\x8a\xc1\xc3\xc3\
+\xc3\x6b\xf7\x1d\x03\x69\xfe\x78\xe5\xbd\x50\xc5\xe0\xe1\xe1\xe1\
+\xcd\xc4\x6a\xcd\x4f\x89\xed\x66\x5d\xb7\xf7\xfa\x1a\xcf\xdf\xa2\
+\x81\x17\xc8\x0b\x55\x0c\x1e\x1e\x1e\xde\x4f\x62\x4c\xf3\x62\xb1\
+\xd9\xac\xeb\xf4\x1e\xd0\xfc\xb5\x06\xce\x1f\x5e\x74\x2f\x54\x31\
+\x78\x78\x78\x78\x7b\x46\x47\xf3\x1d\x62\xa7\x59\xd7\xed\xdd\xa3\
+\x79\x52\x83\xe7\x0f\x2f\xb2\x17\xaa\x18\x3c\x3c\x3c\xbc\xbd\x63\
+\x44\xf3\x4c\x6d\xa6\x0f\x04\x6b\xfe\x37\x6a\x1e\x35\x84\xf3\x87\
+\x17\xdc\x4b\x7a\x70\x3c\x3c\x3c\xbc\xa6\xbd\xd1\xd1\xd1\xa7\x68\
+\x53\xbd\x21\x48\xf3\xff\x47\xcd\x87\x0e\xf3\xfc\xe1\xc5\xf4\x92\
+\x1e\x1c\x0f\x0f\x0f\x6f\x58\xde\xda\xb5\x6b\x36\x65\x59\xf6\x61\
+\xf1\xdb\xfc\xef\xd7\xdc\xa1\x99\xa5\x38\x7f\x78\xb1\xbc\xa4\x07\
+\xc7\xc3\xc3\xc3\x4b\xe4\x1d\xaf\x79\xad\xf8\x6a\xfe\x1f\xd3\x3c\
+\xcc\xc8\xf9\xc3\x0b\xe0\x25\x3d\x38\x1e\x1e\x1e\x5e\x42\x6f\x42\
+\x66\x9e\x4d\xe7\x7f\x48\x67\xb9\xf9\xdf\xa0\x79\x9a\xc1\xf3\x87\
+\xe7\xdc\x4b\x7a\x70\x3c\x3c\x3c\x3c\x03\xde\xfe\x9a\x7f\xa2\x79\
+\x97\xd8\x6a\xfe\xff\xa9\xf9\x72\xcd\xf1\x9a\xeb\x5d\x32\xf0\xda\
+\xe3\x25\x3d\x38\x1e\x1e\x1e\x9e\x21\x6f\x1f\xcd\xb3\x34\x6f\x96\
+\xb4\xcd\xff\x73\x9a\xbf\xa4\xd9\x6d\xb8\x5e\xbc\x96\x7b\x49\x0f\
+\x8e\x87\x87\x87\x67\xd0\xcb\xef\x1d\x70\x8c\xe6\x05\xda\x9c\x6f\
+\x1b\x52\xf3\xbf\x4e\xf3\x5c\xcd\x27\x25\xa8\x17\xaf\xa5\x5e\xa8\
+\x62\xf0\xf0\xf0\xf0\xea\xf4\x36\x6d\xda\xb8\xae\xd7\xeb\x3e\x37\
+\xcb\xb2\x73\xb5\x59\xff\xbb\xcc\xdc\x75\xaf\x8e\xe6\x7f\x5b\x96\
+\x8d\x7c\x54\xff\xfd\x75\x9a\x47\xca\xcc\xbd\x0a\x92\xd7\x8b\xd7\
+\x2e\x2f\x54\x31\x78\x78\x78\x78\x0d\x7b\x6b\x34\x8f\xd6\x7c\x99\
+\xe6\xff\xd1\xbc\x4c\x33\xbf\x30\xf8\x96\xe6\x0f\x34\xef\x90\x99\
+\x86\x7f\xab\x66\xfe\xc7\x7b\x5f\xd7\xbc\x42\x2f\x20\xde\xd7\xe9\
+\x74\xce\xea\x76\xbb\xa7\x8d\x8d\x8d\x1d\x79\xf0\xc1\x07\x8d\x3b\
+\xa9\x17\x2f\xb0\xf7\xff\x01\x6a\x4c\xb0\x39\xe1\xea\xb1\x76\x00\
+\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00\x6f\xa6\x53\
+\x00\x69\
+\x00\x63\x00\x6f\x00\x6e\x00\x73\
+\x00\x06\
+\x07\xac\x02\xc3\
+\x00\x73\
+\x00\x74\x00\x79\x00\x6c\x00\x65\x00\x73\
+\x00\x0e\
+\x00\x30\x83\x03\
+\x00\x6d\
+\x00\x61\x00\x69\x00\x6e\x00\x5f\x00\x73\x00\x74\x00\x79\x00\x6c\x00\x65\x00\x2e\x00\x63\x00\x73\x00\x73\
+\x00\x09\
+\x06\x98\x83\x27\
+\x00\x63\
+\x00\x6c\x00\x6f\x00\x73\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0c\
+\x07\xfe\x50\xa7\
+\x00\x65\
+\x00\x79\x00\x65\x00\x2d\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x0f\xec\x42\x67\
+\x00\x61\
+\x00\x73\x00\x73\x00\x69\x00\x67\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x04\
+\x00\x00\x00\x10\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
+\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x44\x00\x00\x00\x00\x00\x01\x00\x00\x05\x95\
+\x00\x00\x00\x5c\x00\x00\x00\x00\x00\x01\x00\x00\x79\x9d\
+\x00\x00\x00\x7a\x00\x00\x00\x00\x00\x01\x00\x01\x4b\x91\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x04\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x8c\x9f\x44\xa0\x20\
+\x00\x00\x00\x44\x00\x00\x00\x00\x00\x01\x00\x00\x05\x95\
+\x00\x00\x01\x8c\x9f\x44\xa0\x20\
+\x00\x00\x00\x5c\x00\x00\x00\x00\x00\x01\x00\x00\x79\x9d\
+\x00\x00\x01\x8c\x9f\x44\xa0\x20\
+\x00\x00\x00\x7a\x00\x00\x00\x00\x00\x01\x00\x01\x4b\x91\
+\x00\x00\x01\x8c\x9f\x44\xa0\x20\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -0,0 +1,41 @@
+# settings.py
+
+import json
+import os
+
+SETTINGS_PATH = "settings.json"
+
+DEFAULTS = {
+    "db_profile": "balanced",
+    "sql_trace": False,
+    "slow_query_ms": 50,
+    "stall_threshold_ms": 250,
+}
+
+_settings = None
+
+
+def load():
+    global _settings
+    _settings = dict(DEFAULTS)
+    if os.path.exists(SETTINGS_PATH):
+        try:
+            with open(SETTINGS_PATH, "r", encoding="utf-8") as f:
+                _settings.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+    return _settings
+
+
+def get(key):
+    if _settings is None:
+        load()
+    return _settings.get(key, DEFAULTS.get(key))
+
+
+def save(key, value):
+    if _settings is None:
+        load()
+    _settings[key] = value
+    with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
+        json.dump(_settings, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,44 @@
+# tests_cache.py
+
+import threading
+from collections import OrderedDict
+
+MAX_ENTRIES = 64
+
+# test_id -> (version, details); the most recently used entry is last.
+_entries = OrderedDict()
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def get(test_id, version):
+    with _lock:
+        entry = _entries.get(test_id)
+        if entry is None or entry[0] != version:
+            _stats["misses"] += 1
+            return None
+        _entries.move_to_end(test_id)
+        _stats["hits"] += 1
+        return entry[1]
+
+
+def put(test_id, version, details):
+    with _lock:
+        _entries[test_id] = (version, details)
+        _entries.move_to_end(test_id)
+        while len(_entries) > MAX_ENTRIES:
+            _entries.popitem(last=False)
+            _stats["evictions"] += 1
+
+
+def invalidate(test_id=None):
+    with _lock:
+        if test_id is None:
+            _entries.clear()
+        else:
+            _entries.pop(test_id, None)
+
+
+def stats():
+    with _lock:
+        return dict(_stats, size=len(_entries), max_size=MAX_ENTRIES)